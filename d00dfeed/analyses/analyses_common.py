@@ -2,6 +2,7 @@ import os, argparse, json, operator, logging
 import matplotlib.pyplot as plt
 import numpy as np
 import statistics as stats
+from df_common import GEN_FILE_FMT, GEN_FILE_VER
 
 ########################################################################################################################
 # FILE INPUT (JSON)
@@ -93,9 +94,10 @@ def write_dict_to_py_file(file_name, var_name, var_dict, indent_lvl = 1):
         f.write("\n\n")
         f.write("%s = {\n" % var_name)
 
-        for key, val in var_dict.items():
+        last_idx = (len(var_dict) - 1)
+        for idx, (key, val) in enumerate(var_dict.items()):
 
-            last_entry = (key == list(var_dict.keys())[-1])
+            last_entry = (idx == last_idx)
             f.write(("\t" * indent_lvl))
 
             if isinstance(key, str):
@@ -115,6 +117,40 @@ def write_dict_to_py_file(file_name, var_name, var_dict, indent_lvl = 1):
 
         f.write("\n\n}")
 
+########################################################################################################################
+# FILE OUTPUT (GENERATED DATA)
+########################################################################################################################
+
+def write_dict_to_gen_file(file_name, var_name, var_dict, hdr_str, meta = None):
+
+    '''
+    Write a dict to a generated data file (JSON lines, read with df_common.GenFile), overwrites existing.
+    Keys are str or tuple of str, values are JSON-serializable (sets are written sorted).
+    Optional meta dict is added to the header, for data that isn't per-entry.
+    '''
+
+    items = list(var_dict.items())
+    key_type = "tuple" if any(isinstance(key, tuple) for key, _ in items) else "str"
+
+    with open(file_name, "w") as f:
+
+        hdr = {
+            "format": GEN_FILE_FMT,
+            "version": GEN_FILE_VER,
+            "var": var_name,
+            "key_type": key_type,
+            "entry_cnt": len(items),
+            "comment": hdr_str,
+        }
+        if meta:
+            hdr.update(meta)
+        f.write(json.dumps(hdr) + "\n")
+
+        for key, val in items:
+            if isinstance(val, set):
+                val = sorted(val)
+            f.write(json.dumps([key, val], separators=(",", ":")) + "\n")
+
 ########################################################################################################################
 # COLLECTION HELPERS
 ########################################################################################################################
@@ -222,6 +258,26 @@ def build_dict_one_lvl_list(json_files, lvl_1_key, val_key):
 
     return one_lvl_dict
 
+def build_label_val_list(json_files, label_key, val_key):
+
+    '''
+    Build a list from all JSON: [(file_1_label, file_1_val), (file_2_label, file_2_val), ... ], skips empty labels
+    '''
+
+    label_val_list = []
+
+    for json_path in json_files:
+        with open(json_path) as json_file:
+            data = json.load(json_file)
+
+        try:
+            if data[label_key]:
+                label_val_list.append((data[label_key], data[val_key]))
+        except:
+            logging.warn("Skipping non-DTB file: %s" % json_path)
+
+    return label_val_list
+
 def build_tuple_key_dict(json_files, tup_key_str, tup_val_str):
 
     tup_key_dict = {}
@@ -0,0 +1,68 @@
+#! /usr/bin/python3
+
+# External deps
+import sys, os, json, time
+
+# Internal deps
+os.chdir(sys.path[0])
+sys.path.append("..")
+import df_common as dfc
+import analyses_common as ac
+
+def get_arch_first_hit(cmp_strs, unique_devs_by_arch):
+
+    '''
+    Previous get_arch() inference, for comparison: first arch whose signature intersects the DTB's compatible strings
+    '''
+
+    for arch in unique_devs_by_arch:
+        intersecting_devs = set(cmp_strs).intersection(set(unique_devs_by_arch[arch]))
+        if len(intersecting_devs):
+            return arch
+
+    return None
+
+if __name__ == "__main__":
+
+    json_files = ac.argparse_and_get_files("Benchmark architecture inference over all DTB stats JSONs")
+    unique_devs_by_arch = dfc.get_unique_devs_by_arch()
+    if unique_devs_by_arch is None:
+        print("Error: no signature file! Run \'./analyses/gen_arch_sigs_file.py\'")
+        sys.exit(1)
+
+    # Collection, labels are from Linux source paths if JSONs were generated with '--linux-src-dir'
+    corpus = []
+    for json_path in json_files:
+        with open(json_path) as json_file:
+            data = json.load(json_file)
+        if (dfc.JSON_CMP_STR in data) and (dfc.JSON_ARC in data):
+            corpus.append((data[dfc.JSON_ARC], data[dfc.JSON_CMP_STR]))
+
+    # Don't count one-time loading/index build
+    dict(unique_devs_by_arch)
+    dfc.get_arch_sig_idx()
+
+    start = time.perf_counter()
+    old_archs = [get_arch_first_hit(cmp_strs, unique_devs_by_arch) for _, cmp_strs in corpus]
+    old_time = (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    new_results = [dfc.get_arch_from_cmp_strs(cmp_strs) for _, cmp_strs in corpus]
+    new_time = (time.perf_counter() - start)
+
+    dtb_cnt = len(corpus)
+    old_correct = sum(1 for (label, _), arch in zip(corpus, old_archs) if (arch == label))
+    new_correct = sum(1 for (label, _), (arch, _) in zip(corpus, new_results) if (arch == label))
+    agree_cnt = sum(1 for old_arch, (new_arch, _) in zip(old_archs, new_results) if (old_arch == new_arch))
+    confidences = [conf for arch, conf in new_results if arch]
+
+    print("\nArchitecture inference over {} DTBs:".format(dtb_cnt))
+    print("first-hit (old): {:.3f}s total, {:.1f} us/DTB, {}/{} match label".format(
+        old_time, (1e6 * old_time / dtb_cnt), old_correct, dtb_cnt))
+    print("vote index (new): {:.3f}s total, {:.1f} us/DTB, {}/{} match label".format(
+        new_time, (1e6 * new_time / dtb_cnt), new_correct, dtb_cnt))
+    print("speedup: {:.1f}x, agreement: {}/{}, unidentified: {}".format(
+        (old_time / new_time) if new_time else 0.0, agree_cnt, dtb_cnt, (dtb_cnt - len(confidences))))
+    if (len(confidences) >= 2):
+        mean, median, std_dev = ac.get_mean_median_std_dev(confidences)
+        print("confidence (identified DTBs): mean {:.3f}, median {:.3f}, std_dev {:.3f}".format(mean, median, std_dev))
@@ -0,0 +1,104 @@
+#! /usr/bin/python3
+
+# External deps
+import sys, os, argparse, random, time, tracemalloc
+
+# Internal deps
+os.chdir(sys.path[0])
+sys.path.append("..")
+import df_common as dfc
+import analyses_common as ac
+from gen_arch_classifier_file import train_arch_classifier
+from gen_arch_sigs_file import get_archs_by_cmp_str, get_unique_and_shared_devs
+
+def train_arch_sigs(labeled):
+
+    '''
+    Signature approach on the same training data (see gen_arch_sigs_file.py)
+    '''
+
+    unique_devs_by_arch, _ = get_unique_and_shared_devs(get_archs_by_cmp_str(labeled))
+    return unique_devs_by_arch
+
+def eval_method(name, classify_func, test_set, model_bytes):
+
+    '''
+    Print accuracy, coverage, latency for a classify_func(cmp_strs) -> (arch, confidence)
+    '''
+
+    start = time.perf_counter()
+    results = [classify_func(cmp_strs) for _, cmp_strs in test_set]
+    total_time = (time.perf_counter() - start)
+
+    correct_cnt = sum(1 for (label, _), (arch, _) in zip(test_set, results) if (arch == label))
+    unknown_cnt = sum(1 for arch, _ in results if (arch is None))
+
+    print("{:<22} accuracy {:6.2f}% ({}/{}), unidentified {:4d}, {:7.1f} us/DTB, model {:8.1f} KiB".format(
+        name, (100.0 * correct_cnt / len(test_set)), correct_cnt, len(test_set), unknown_cnt,
+        (1e6 * total_time / len(test_set)), (model_bytes / 1024)))
+
+def traced_build(build_func):
+
+    '''
+    Call build_func(), return its result and the bytes it left allocated
+    '''
+
+    tracemalloc.start()
+    result = build_func()
+    model_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    return result, model_bytes
+
+if __name__ == "__main__":
+
+    arg_parser = argparse.ArgumentParser(description="Evaluate architecture classifier against signatures (held-out DTBs)")
+    arg_parser.add_argument(
+            'json_dir',
+            type=str,
+            help="Directory containing multiple JSON files (output from \'df_analyze.py\').")
+    arg_parser.add_argument(
+            '--test-frac',
+            type=float,
+            default=0.2,
+            help="Fraction of DTBs held out for testing (Default == 0.2)")
+    arg_parser.add_argument(
+            '--seed',
+            type=int,
+            default=0,
+            help="Train/test split seed (Default == 0)")
+    args = arg_parser.parse_args()
+
+    assert(os.path.isdir(args.json_dir))
+    json_files = [os.path.join(args.json_dir, file) for file in sorted(os.listdir(args.json_dir)) if file.endswith(".json")]
+    labeled = ac.build_label_val_list(json_files, dfc.JSON_ARC, dfc.JSON_CMP_STR)
+    assert(len(labeled) > 1)
+
+    random.Random(args.seed).shuffle(labeled)
+    test_cnt = max(1, int(len(labeled) * args.test_frac))
+    test_set, train_set = labeled[:test_cnt], labeled[test_cnt:]
+    print("Train: {} DTBs, test: {} DTBs\n".format(len(train_set), len(test_set)))
+
+    # Build both models from the same training split
+    arch_sig_idx, sig_bytes = traced_build(lambda: dfc.build_arch_sig_idx(train_arch_sigs(train_set)))
+
+    def build_classifier():
+        classifier = dfc.ArchClassifier(*train_arch_classifier(train_set))
+        classifier.classify([]) # Init priors/denominators
+        return classifier
+
+    classifier, classifier_bytes = traced_build(build_classifier)
+
+    def sig_then_classifier(cmp_strs):
+        arch, confidence = dfc.get_arch_from_cmp_strs(cmp_strs, arch_sig_idx)
+        if arch is None:
+            arch, confidence = classifier.classify(cmp_strs)
+        return arch, confidence
+
+    # Warm classifier's per-feature memo the way a long-running process would (ex. df_analyze.py worker)
+    for _, cmp_strs in train_set:
+        classifier.classify(cmp_strs)
+
+    eval_method("signatures", lambda cmp_strs: dfc.get_arch_from_cmp_strs(cmp_strs, arch_sig_idx), test_set, sig_bytes)
+    eval_method("naive bayes", classifier.classify, test_set, classifier_bytes)
+    eval_method("signatures + bayes", sig_then_classifier, test_set, (sig_bytes + classifier_bytes))
@@ -0,0 +1,52 @@
+#! /usr/bin/python3
+
+# External deps
+import sys, os
+
+# Internal deps
+os.chdir(sys.path[0])
+sys.path.append("..")
+from df_common import JSON_ARC, JSON_CMP_STR, GEN_FILE_DIR, GEN_FILE_EXT, get_dtb_features
+import analyses_common as ac
+
+def train_arch_classifier(labeled):
+
+    '''
+    Count training data for df_common.ArchClassifier.
+    Returns (archs, arch_dtb_cnts, {feature: [count of arch DTBs with feature, per arch]}), archs sorted.
+    '''
+
+    archs = sorted({arch for arch, _ in labeled})
+    arch_to_idx = {arch: idx for idx, arch in enumerate(archs)}
+    arch_dtb_cnts = [0] * len(archs)
+    feature_cnts = {}
+
+    for arch, cmp_strs in labeled:
+        arch_idx = arch_to_idx[arch]
+        arch_dtb_cnts[arch_idx] += 1
+        for feature in get_dtb_features(cmp_strs):
+            if feature not in feature_cnts:
+                feature_cnts[feature] = [0] * len(archs)
+            feature_cnts[feature][arch_idx] += 1
+
+    return archs, arch_dtb_cnts, dict(sorted(feature_cnts.items()))
+
+if __name__ == "__main__":
+
+    if not os.path.exists(GEN_FILE_DIR):
+        os.mkdir(GEN_FILE_DIR)
+
+    ARCH_CLASSIFIER_FILE = os.path.join(GEN_FILE_DIR, "arch_classifier" + GEN_FILE_EXT)
+
+    # Collection
+    json_files = ac.argparse_and_get_files("Generate architecture classifier file from compatible strings")
+    labeled = ac.build_label_val_list(json_files, JSON_ARC, JSON_CMP_STR)
+    archs, arch_dtb_cnts, feature_cnts = train_arch_classifier(labeled)
+
+    print("Trained on {} DTBs, {} features".format(len(labeled), len(feature_cnts)))
+    for arch, dtb_cnt in zip(archs, arch_dtb_cnts):
+        print("{}: {} DTBs".format(arch, dtb_cnt))
+
+    ac.write_dict_to_gen_file(ARCH_CLASSIFIER_FILE, "ARCH_FEATURE_CNTS", feature_cnts,
+        "THIS FILE WAS AUTO GENERATED BY ./analyses/gen_arch_classifier_file.py",
+        {"archs": archs, "arch_dtb_cnts": arch_dtb_cnts})
@@ -2,43 +2,71 @@
 
 # External deps
 import sys, os
-import matplotlib.pyplot as plt
+from itertools import combinations
 
 # Internal deps
 os.chdir(sys.path[0])
 sys.path.append("..")
-from df_common import JSON_ARC, JSON_CMP_STR, GEN_FILE_DIR
+from df_common import JSON_ARC, JSON_CMP_STR, GEN_FILE_DIR, GEN_FILE_EXT
 import analyses_common as ac
 
+def get_archs_by_cmp_str(labeled):
+
+    '''
+    Single pass over [(arch, cmp_strs), ...]: {cmp_str: {arch, ...}}
+    '''
+
+    archs_by_cmp_str = {}
+
+    for arch, cmp_strs in labeled:
+        for cmp_str in cmp_strs:
+            if cmp_str not in archs_by_cmp_str:
+                archs_by_cmp_str[cmp_str] = {arch}
+            else:
+                archs_by_cmp_str[cmp_str].add(arch)
+
+    return archs_by_cmp_str
+
+def get_unique_and_shared_devs(archs_by_cmp_str):
+
+    '''
+    Split compatible strings by how many archs they appear in. Sorted, so output doesn't depend on input order.
+    Returns ({arch: [cmp_str unique to arch, ...]}, {(arch_a, arch_b): [cmp_str shared by both, ...]})
+    '''
+
+    unique_devs_by_arch = {arch: [] for arch in sorted(set().union(*archs_by_cmp_str.values()))}
+    shared_devs_by_arch_pair = {}
+
+    for cmp_str, archs in sorted(archs_by_cmp_str.items()):
+        if (len(archs) == 1):
+            unique_devs_by_arch[next(iter(archs))].append(cmp_str)
+        else:
+            for arch_pair in combinations(sorted(archs), 2):
+                if arch_pair not in shared_devs_by_arch_pair:
+                    shared_devs_by_arch_pair[arch_pair] = [cmp_str]
+                else:
+                    shared_devs_by_arch_pair[arch_pair].append(cmp_str)
+
+    return unique_devs_by_arch, dict(sorted(shared_devs_by_arch_pair.items()))
+
 if __name__ == "__main__":
 
     if not os.path.exists(GEN_FILE_DIR):
         os.mkdir(GEN_FILE_DIR)
 
-    ARCH_SIGS_FILE = os.path.join(GEN_FILE_DIR, "arch_signatures.py")
+    ARCH_SIGS_FILE = os.path.join(GEN_FILE_DIR, "arch_signatures" + GEN_FILE_EXT)
 
     # Collection
     json_files = ac.argparse_and_get_files("Gernate fingerprint file for compatible/model strings unique to each architecture")
-    cmp_by_arch = ac.build_dict_two_lvl_cnt(json_files, JSON_ARC, JSON_CMP_STR)
-
-    # Convert dict {cmp_str: cmp_str_cnt} to set of [cmp_str]
-    for arch in cmp_by_arch:
-        cmp_str_set = set()
-        for cmp_str in cmp_by_arch[arch]:
-            cmp_str_set.add(cmp_str)
-        cmp_by_arch[arch] = cmp_str_set
-
-    # Print intersections, do differences
-    for this_arch in cmp_by_arch:
-        for other_arch in cmp_by_arch:
-            if this_arch != other_arch:
-                common_devs = cmp_by_arch[this_arch].intersection(cmp_by_arch[other_arch])
-                if common_devs:
-                    print("\nDevices present in both \'%s\' and \'%s\'" % (this_arch, other_arch))
-                    print("*" * 100 + "\n")
-                    print(common_devs)
-                cmp_by_arch[this_arch].difference_update(cmp_by_arch[other_arch])
+    labeled = ac.build_label_val_list(json_files, JSON_ARC, JSON_CMP_STR)
+    unique_devs_by_arch, shared_devs_by_arch_pair = get_unique_and_shared_devs(get_archs_by_cmp_str(labeled))
+
+    # Print intersections
+    for (this_arch, other_arch), common_devs in shared_devs_by_arch_pair.items():
+        print("\nDevices present in both \'%s\' and \'%s\'" % (this_arch, other_arch))
+        print("*" * 100 + "\n")
+        print(common_devs)
 
     # Write unique devs to a signature file
-    ac.write_hdr_for_py_file(ARCH_SIGS_FILE, "THIS FILE WAS AUTO GENERATED BY ./analyses/gen_arch_sigs_file.py")
-    ac.write_dict_to_py_file(ARCH_SIGS_FILE, "UNIQUE_DEVS_BY_ARCH", cmp_by_arch)
+    ac.write_dict_to_gen_file(ARCH_SIGS_FILE, "UNIQUE_DEVS_BY_ARCH", unique_devs_by_arch,
+        "THIS FILE WAS AUTO GENERATED BY ./analyses/gen_arch_sigs_file.py")
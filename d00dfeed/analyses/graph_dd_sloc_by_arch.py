@@ -7,13 +7,11 @@ import matplotlib.pyplot as plt
 # Internal deps
 os.chdir(sys.path[0])
 sys.path.append("..")
-from df_common import JSON_ARC, JSON_CMP_STR, JSON_CMP_CNT, JSON_PRI_CMP_CNT, JSON_LNE_CNT, GEN_FILE_DIR
+from df_common import JSON_ARC, JSON_CMP_STR, JSON_CMP_CNT, JSON_PRI_CMP_CNT, JSON_LNE_CNT, get_driver_name_to_sloc
 import analyses_common as ac
 
-if os.path.exists(os.path.join(GEN_FILE_DIR, "sloc_cnt.py")):
-    sys.path.append(GEN_FILE_DIR)
-    from sloc_cnt import DRIVER_NAME_TO_SLOC
-else:
+DRIVER_NAME_TO_SLOC = get_driver_name_to_sloc()
+if DRIVER_NAME_TO_SLOC is None:
     print("Error: no SLOC file! Run \'df_analyze.py\' with \'--linux-src-dir\'")
     sys.exit(1)
 
@@ -41,7 +39,7 @@ def get_sloc_list_by_arch(cmp_by_arch, sloc_cnts, verbose = False):
         # For every compatible sting, check if we have SLOC count from the parsing the source code
         # If multiple drivers are defined for this cmp str, log SLOC for each so we can compute average later
         for cmp_str_dtb in cmps_strs_for_arch:
-            for tup in sloc_cnts.keys():
+            for tup in sloc_cnts.get_keys_by_member(cmp_str_dtb):
                 for cmp_str_src in tup:
                     if (cmp_str_src == cmp_str_dtb):
                         if cmp_str_dtb not in cmp_str_to_slocs:
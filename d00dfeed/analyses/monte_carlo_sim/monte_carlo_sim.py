@@ -1,7 +1,7 @@
 #! /usr/bin/python3
 
 # External deps
-import sys, os, logging, argparse, random, statistics, copy, json
+import sys, os, logging, argparse, random, statistics, copy, json, math
 import matplotlib
 
 # Allow graph creation without X11 (ex. detached from screen/ssh)
@@ -74,7 +74,8 @@ def rehost(artifact_path: str, P_q: List[str], P_m: List[str], avg_sloc_by_arch:
     # Start of by assuming we have to implement all primary compatible strings
     # Note strip of vendor prefix, and removal of duplicates
     if artifact_path.endswith(".json"):
-        data = json.load(open(artifact_path))
+        with open(artifact_path) as f:
+            data = json.load(f)
         P_u = set(data[dfc.JSON_PRI_CMP_STR])
     else:
         P_u = set([dfc.strip_vendor_prefix(x) for x in dfa.get_cmp_strs(Dtb(artifact_path), primary_only=True)])
@@ -111,6 +112,66 @@ def rehost(artifact_path: str, P_q: List[str], P_m: List[str], avg_sloc_by_arch:
     # Report how many had to be implemented, return new manually impelmented list
     return len(P_u), P_m, P_u_sloc
 
+def get_unsupported_peripherals(artifact_path: str, P_q: List[str]) -> Set[str]:
+
+    '''
+    Peripherals that rehosting the SoC represented by a given DTB (or representative stats JSON) would implement,
+    if nothing was manually implemented yet
+    '''
+
+    _, P_m, _ = rehost(artifact_path, P_q, [], {'Empty': 0.0})
+    return set(P_m)
+
+def get_exact_rehost_curve(soc_cnt_by_periph: Dict[str, int], artifact_cnt: int, rehost_cnt: int) -> Tuple[List[float], List[float], List[float], List[float]]:
+
+    '''
+    Closed form of the expectations the simulation estimates, for rehosting rehost_cnt of artifact_cnt SoCs picked
+    uniformly without replacement. soc_cnt_by_periph is the number of SoCs that need each peripheral implemented.
+
+    A peripheral needed by c of N SoCs is missed by the first k picks with (hypergeometric) probability
+    miss(k) = C(N - c, k) / C(N, k) = miss(k - 1) * (N - c - k + 1) / (N - k + 1), and newly implemented at rehost k
+    with probability miss(k - 1) - miss(k). Peripherals are grouped by c, O(distinct c x rehost_cnt).
+
+    The std dev bounds are the sum of the per-peripheral (indicator) std devs, which holds whatever the correlation
+    (peripherals needed by the same SoCs are positively correlated).
+
+    Returns, for rehost attempts {1, 2, 3 .. rehost_cnt}: expected newly implemented, its std dev bound, expected
+    total implemented, its std dev bound
+    '''
+
+    assert(rehost_cnt <= artifact_cnt)
+
+    periph_cnt_by_soc_cnt: Dict[int, int] = {}
+    for soc_cnt in soc_cnt_by_periph.values():
+        periph_cnt_by_soc_cnt[soc_cnt] = periph_cnt_by_soc_cnt.get(soc_cnt, 0) + 1
+
+    miss_by_soc_cnt = {soc_cnt: 1.0 for soc_cnt in periph_cnt_by_soc_cnt}
+    unimp_exp: List[float] = []
+    unimp_std: List[float] = []
+    total_exp: List[float] = []
+    total_std: List[float] = []
+
+    for k in range(rehost_cnt):
+        unimp_exp_k, unimp_std_k, total_exp_k, total_std_k = 0.0, 0.0, 0.0, 0.0
+
+        for soc_cnt, periph_cnt in periph_cnt_by_soc_cnt.items():
+            prev_miss = miss_by_soc_cnt[soc_cnt]
+            miss = prev_miss * max(0, (artifact_cnt - soc_cnt - k)) / (artifact_cnt - k)
+            miss_by_soc_cnt[soc_cnt] = miss
+
+            new_prob = (prev_miss - miss)
+            unimp_exp_k += periph_cnt * new_prob
+            unimp_std_k += periph_cnt * math.sqrt(new_prob * (1.0 - new_prob))
+            total_exp_k += periph_cnt * (1.0 - miss)
+            total_std_k += periph_cnt * math.sqrt(miss * (1.0 - miss))
+
+        unimp_exp.append(unimp_exp_k)
+        unimp_std.append(unimp_std_k)
+        total_exp.append(total_exp_k)
+        total_std.append(total_std_k)
+
+    return unimp_exp, unimp_std, total_exp, total_std
+
 def write_list_data_file(file_name: str, data_list: Union[List[int], List[float]]) -> None:
 
     '''
@@ -240,6 +301,11 @@ if __name__ == "__main__":
         default=False,
         action='store_true',
         help="Do NOT consider existing QEMU device implementations in simulation")
+    arg_parser.add_argument(
+        '--exact',
+        default=False,
+        action='store_true',
+        help="Compute the expected per-rehost and total counts in closed form instead of simulating (no SLOC, median or graphs)")
 
     logging.basicConfig(stream=sys.stdout, level=logging.INFO, format="[%(processName)s]:%(levelname)s:%(message)s")
     args = arg_parser.parse_args()
@@ -262,15 +328,14 @@ if __name__ == "__main__":
     # Run simulations with stats summary JSONS
     if all(fn.endswith(".json") for fn in input_files):
 
+        artifact_path_list = input_files
+
         # If SLOC data is available, we'll track it as part of the simulation
-        if (os.path.exists(os.path.join(dfc.GEN_FILE_DIR, "sloc_cnt.py"))):
+        if (dfc.get_driver_name_to_sloc() is not None):
 
-            artifact_path_list = input_files
             logging.info("Gathering SLOC data...")
 
-            sys.path.append(dfc.GEN_FILE_DIR)
             sys.path.append("..")
-            from sloc_cnt import DRIVER_NAME_TO_SLOC
             from graph_dd_sloc_by_arch import get_sloc_avg_and_list_by_arch
 
             cmp_by_arch = ac.build_dict_two_lvl_cnt(artifact_path_list, dfc.JSON_ARC, dfc.JSON_CMP_STR)
@@ -286,6 +351,34 @@ if __name__ == "__main__":
         logging.info("Finding DTB files...")
         artifact_path_list = dfa.get_dtb_files(input_files)
 
+    # Closed form: only needs the peripherals each SoC would implement, not --iter-cnt rehost sequences
+    if args.exact:
+        logging.info("Gathering unsupported peripherals per SoC...")
+        with Pool(args.max_workers) as unsupported_pool:
+            unsupported_by_artifact = unsupported_pool.starmap(get_unsupported_peripherals,
+                [(artifact_path, P_q) for artifact_path in artifact_path_list])
+
+        soc_cnt_by_periph: Dict[str, int] = {}
+        for unsupported in unsupported_by_artifact:
+            for periph in unsupported:
+                soc_cnt_by_periph[periph] = soc_cnt_by_periph.get(periph, 0) + 1
+
+        rehost_cnt = min(args.rehost_cnt, len(artifact_path_list))
+        unimp_exp, unimp_std, total_exp, total_std = get_exact_rehost_curve(
+            soc_cnt_by_periph, len(artifact_path_list), rehost_cnt)
+
+        # Same layout as the simulation's per-rehost files: { rehost elem_1 elem_2 }, here expected value and std dev bound
+        write_dict_of_list_data_file(os.path.join(args.output_dir, "monte_exact_unimp_per_rehost.dat"),
+            {j: [unimp_exp[j], unimp_std[j]] for j in range(rehost_cnt)})
+        write_dict_of_list_data_file(os.path.join(args.output_dir, "monte_exact_totals_per_rehost.dat"),
+            {j: [total_exp[j], total_std[j]] for j in range(rehost_cnt)})
+
+        logging.info("Exact result: {:.2f} expected manually implemented peripherals per DTB, {:.2f} total (std dev <= {:.2f})".format(
+            (total_exp[-1] / rehost_cnt),
+            total_exp[-1],
+            total_std[-1]))
+        sys.exit(0)
+
     logging.info("Setuping up worker pool...")
     sim_proc_pool = Pool(args.max_workers)
     manager = Manager()
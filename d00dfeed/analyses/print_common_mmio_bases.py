@@ -0,0 +1,75 @@
+#! /usr/bin/python3
+
+# External deps
+import sys, os, json, argparse
+from collections import Counter, defaultdict
+
+# Internal deps
+os.chdir(sys.path[0])
+sys.path.append("..")
+import df_common as dfc
+
+def get_mmio_bases_by_arch(json_files, node_names):
+
+    '''
+    Count DTBs per (arch, base address) for regions whose node name (before the '@') is in node_names.
+    Reads the packed memory maps from stats JSONs (output from "df_analyze.py --mem-maps"), no DTB parsing.
+    Returns ({arch: Counter(base_addr)}, {arch: DTBs with a memory map})
+    '''
+
+    bases_by_arch = defaultdict(Counter)
+    map_cnt_by_arch = Counter()
+
+    for json_path in json_files:
+        with open(json_path) as json_file:
+            data = json.load(json_file)
+
+        if dfc.JSON_MEM_ADDR not in data:
+            continue
+
+        arch = data.get(dfc.JSON_ARC)
+        map_cnt_by_arch[arch] += 1
+
+        bases = set()
+        for addr, node_name in zip(dfc.unpack_u64s(data[dfc.JSON_MEM_ADDR]), data[dfc.JSON_MEM_NODE]):
+            if node_name.split("@")[0] in node_names:
+                bases.add(addr)
+
+        bases_by_arch[arch].update(bases) # Once per DTB
+
+    return bases_by_arch, map_cnt_by_arch
+
+if __name__ == "__main__":
+
+    arg_parser = argparse.ArgumentParser(description="Print most common MMIO base addresses per architecture")
+    arg_parser.add_argument(
+            'json_dir',
+            type=str,
+            help="Directory containing multiple JSON files (output from \'df_analyze.py --mem-maps\').")
+    arg_parser.add_argument(
+            '--node-names',
+            type=str,
+            nargs="+",
+            default=["serial", "uart"],
+            help="Generic node names to match, without the unit address (Default == serial uart)")
+    arg_parser.add_argument(
+            '--top',
+            type=int,
+            default=5,
+            help="Base addresses to list per architecture (Default == 5)")
+    args = arg_parser.parse_args()
+
+    assert(os.path.isdir(args.json_dir))
+    json_files = [os.path.join(args.json_dir, file) for file in os.listdir(args.json_dir) if file.endswith(".json")]
+    assert(len(json_files) > 0)
+
+    bases_by_arch, map_cnt_by_arch = get_mmio_bases_by_arch(json_files, set(args.node_names))
+    if not map_cnt_by_arch:
+        print("Error: no memory maps found! Run \'df_analyze.py\' with \'--mem-maps\'")
+        sys.exit(1)
+
+    print("\nMost common {} base addresses:".format("/".join(args.node_names)))
+    for arch, map_cnt in map_cnt_by_arch.most_common():
+        print("\n{} ({} DTBs):".format(arch, map_cnt))
+        for base_addr, dtb_cnt in bases_by_arch[arch].most_common(args.top):
+            print("\t0x{:08x}: {} DTBs ({:.1f}%)".format(base_addr, dtb_cnt, (100.0 * dtb_cnt / map_cnt)))
@@ -7,13 +7,11 @@ import matplotlib.pyplot as plt
 # Internal deps
 os.chdir(sys.path[0])
 sys.path.append("..")
-from df_common import JSON_ARC, JSON_CMP_STR, JSON_CMP_CNT, JSON_PRI_CMP_CNT, JSON_LNE_CNT, GEN_FILE_DIR
+from df_common import JSON_ARC, JSON_CMP_STR, JSON_CMP_CNT, JSON_PRI_CMP_CNT, JSON_LNE_CNT, get_driver_name_to_type
 import analyses_common as ac
 
-if os.path.exists(os.path.join(GEN_FILE_DIR, "driver_types.py")):
-    sys.path.append(GEN_FILE_DIR)
-    from driver_types import DRIVER_NAME_TO_TYPE
-else:
+DRIVER_NAME_TO_TYPE = get_driver_name_to_type()
+if DRIVER_NAME_TO_TYPE is None:
     print("Error: no driver types file! Run \'df_analyze.py\' with \'--linux-src-dir\'")
     sys.exit(1)
 
@@ -23,10 +21,8 @@ def get_type(cmp_str_in):
     Lookup type for a given compatible string
     '''
 
-    for cmp_strs, type_str in DRIVER_NAME_TO_TYPE.items():
-        for cmp_str in cmp_strs:
-            if cmp_str == cmp_str_in:
-                return type_str
+    for cmp_strs in DRIVER_NAME_TO_TYPE.get_keys_by_member(cmp_str_in):
+        return DRIVER_NAME_TO_TYPE[cmp_strs]
 
     return None
 
@@ -1,6 +1,5 @@
 # External deps
 import os, sys, json
-from pathlib import Path
 from typing import Dict, List
 
 # Internal deps
@@ -9,13 +8,7 @@ sys.path.append("..")
 import df_common as dfc
 import analyses_common as ac
 
-# Generated files directory
-GEN_FILE_DIR = str(Path(__file__).resolve().parent.parent) + os.sep + "generated_files" # TODO: ugly parent.parent pathing
-if os.path.exists(GEN_FILE_DIR):
-    sys.path.append(GEN_FILE_DIR)
-    if os.path.exists(os.path.join(GEN_FILE_DIR, "sloc_cnt.py")):
-        from sloc_cnt import DRIVER_NAME_TO_SLOC
-else:
+if dfc.get_driver_name_to_sloc() is None:
     print("Error: no SLOC file! Run \'df_analyze.py\' with \'--linux-src-dir\'")
     sys.exit(1)
 
@@ -1,8 +1,27 @@
 #! /usr/bin/python3
 
-import fdt, coloredlogs, logging, os, io, sys, argparse, copy
+import fdt, logging, os, io, sys, argparse, json
+from struct import pack, pack_into, unpack_from
+from bisect import insort
 from df_common import *
 
+########################################################################################################################
+# HELPERS
+########################################################################################################################
+
+def new_prop_obj(prop_str, new_prop):
+
+    '''
+    fdt property for a value: str -> strings, int or list of ints -> words
+    '''
+
+    if isinstance(new_prop, str):
+        return fdt.PropStrings(prop_str, new_prop)
+    elif isinstance(new_prop, int):
+        return fdt.PropWords(prop_str, new_prop)
+    else:
+        return fdt.PropWords(prop_str, *new_prop)
+
 ########################################################################################################################
 # DTB CLASS - Wrapper for fdt lib, higher-level actions
 ########################################################################################################################
@@ -27,6 +46,14 @@ class Dtb:
 
         self.dtb_obj = fdt.parse_dtb(dtb_data)
         self._update_name_path_map()
+        self._invalidate_addr_translation()
+
+        # Original blob and modified node paths, for incremental serialization (see get_dtb_chunks)
+        self._dtb_data = bytes(dtb_data)
+        self._struct_idx = None
+        self._dirty_paths = set()
+        self._props_dirty_paths = set()
+        self._new_paths = set()
 
     # ------------------------------------------------------------------------------------------------------------------
     # DTB CLASS - Internal functions
@@ -35,14 +62,112 @@ class Dtb:
     def _update_name_path_map(self):
 
         '''
-        Call after node additions/deletions to maintain consistent view of the DTB.
+        Full (re)build of the node indexes, modification functions keep them up to date incrementally.
+        path_node_map: {full_path: node}, primary index
+        name_paths_map: {name: [full_path, ...]}, sorted, nodes under different parents can share a name (ex. "cpu@0")
+        name_path_map: {name: (containing_path, full_path)}, first of each name's full paths
         '''
 
+        self.path_node_map = dict()
+        self.name_paths_map = dict()
         self.name_path_map = dict()
-        for path, nodes, props in self.dtb_obj.walk():
-            name = self.dtb_obj.get_node(path).name
-            containing_path = path.replace("/" + name, '')
-            self.name_path_map[name] = Containing_full_path_tuple(containing_path, path)
+        self._index_subtree(self.dtb_obj.get_node("/"))
+
+    def _index_subtree(self, node):
+
+        '''
+        Add a node and its subnodes to the indexes, visits only that subtree.
+        '''
+
+        stack = [(node, self._get_node_path(node))]
+        while stack:
+            node, path = stack.pop()
+            self.path_node_map[path] = node
+            insort(self.name_paths_map.setdefault(node.name, []), path)
+            self._update_name_path(node.name)
+            stack.extend((subnode, (path.rstrip("/") + "/" + subnode.name)) for subnode in node.nodes)
+
+    def _unindex_subtree(self, path):
+
+        '''
+        Remove a node and its subnodes from the indexes, visits only that subtree.
+        '''
+
+        stack = [path]
+        while stack:
+            path = stack.pop()
+            node = self.path_node_map.pop(path)
+            paths = self.name_paths_map[node.name]
+            paths.remove(path)
+            if not paths:
+                del self.name_paths_map[node.name]
+            self._update_name_path(node.name)
+            stack.extend((path + "/" + subnode.name) for subnode in node.nodes)
+
+    def _update_name_path(self, name):
+
+        '''
+        Point name_path_map at the first remaining full path for a name
+        '''
+
+        paths = self.name_paths_map.get(name)
+        if not paths:
+            self.name_path_map.pop(name, None)
+        elif (paths[0] == "/"):
+            self.name_path_map[name] = Containing_full_path_tuple("/", "/")
+        else:
+            self.name_path_map[name] = Containing_full_path_tuple(paths[0][:-(len(name) + 1)], paths[0])
+
+    def _get_node_path(self, node):
+
+        '''
+        Full path of a node in the tree
+        '''
+
+        if node.parent is None:
+            return "/"
+
+        return (node.path.rstrip("/") + "/" + node.name)
+
+    def _get_dev_path(self, dev_name):
+
+        '''
+        Full path for a device name or full path (to pick one of several nodes with the same name), None if not found
+        '''
+
+        if dev_name in self.path_node_map:
+            return dev_name
+        elif dev_name in self.name_path_map:
+            return self.name_path_map[dev_name].full_path
+        else:
+            return None
+
+    def _mark_modified(self, path, props=False, new=False):
+
+        '''
+        Call after any modification. path is the node changed (props=True), added (new=True), or the removed node's parent.
+        The node and its ancestors can't reuse their original bytes whole when serializing (see get_dtb_chunks).
+        '''
+
+        if props:
+            self._props_dirty_paths.add(path)
+        if new:
+            self._new_paths.add(path)
+
+        while (path not in self._dirty_paths): # Ancestors of a dirty path are already dirty
+            self._dirty_paths.add(path)
+            if (path == "/"):
+                break
+            path = (path.rsplit("/", 1)[0] or "/")
+
+    def _invalidate_addr_translation(self):
+
+        '''
+        Call after any modification, drops memoized bus "ranges" and translations (keyed by node id).
+        '''
+
+        self._bus_ranges_cache = dict()
+        self._bus_xlat_cache = dict()
 
     # ------------------------------------------------------------------------------------------------------------------
     # DTB CLASS - Query functions
@@ -91,15 +216,23 @@ class Dtb:
     def get_node_by_name(self, dev_name):
 
         '''
-        Return node corresponding to DTB device name
+        Return node corresponding to DTB device name (or full path, see get_nodes_by_name for duplicate names)
         '''
 
-        if (dev_name in self.name_path_map):
-            dev_path = self.name_path_map[dev_name].containing_path
-            return self.dtb_obj.get_node(dev_path + "/" + dev_name)
+        dev_path = self._get_dev_path(dev_name)
+        if dev_path:
+            return self.path_node_map[dev_path]
         else:
             return None
 
+    def get_nodes_by_name(self, dev_name):
+
+        '''
+        Return all nodes with a DTB device name, sorted by full path
+        '''
+
+        return [self.path_node_map[path] for path in self.name_paths_map.get(dev_name, [])]
+
     # ------------------------------------------------------------------------------------------------------------------
     # DTB CLASS - Physical address translation
     # ------------------------------------------------------------------------------------------------------------------
@@ -114,124 +247,176 @@ class Dtb:
         '''
 
         mem_map_pairs = []
-
-        # Validate existence of register property
-        if not (child.exist_property(REG_STR)):
+        if not child.parent:
             return mem_map_pairs
 
-        # Validate structure of register property
-        child_reg_prop = child.get_property(REG_STR)
-        if not (isinstance(child_reg_prop, fdt.PropWords) and (len(child_reg_prop) % 2 == 0)):
-            return mem_map_pairs
+        bus_xlat = self.get_bus_addr_translation(child.parent)
+        for addr, size in self.get_reg_tuples(child):
+            phys_addr, ok = self.translate_addr(bus_xlat, addr)
+            if not ok:
+                logging.error("Could not translate child ({}) reg 0x{:x} to root address space!".format(child.name, addr))
+            mem_map_pairs.append(Dev_mem_map(phys_addr, size))
+
+        return mem_map_pairs
 
-        # Create a running copy, will update it's reg tuples as we traverse the tree upward and apply translations
-        running_child = copy.deepcopy(child)
-        assert(running_child.get_property(REG_STR).data == child_reg_prop.data)
+    def get_phys_mem_map(self):
 
-        # Walk up to root and apply findings
-        while (child.parent and child.parent.name != '/'):
+        '''
+        Get the device's physical memory map, sorted by address: [(addr, size, node_name), ...]
+        Linear in the number of nodes, bus translations are shared by all devices on a bus.
+        '''
 
-            parent = child.parent
+        mmio_maps = []
+        for node in self.get_nodes_by_prop(REG_STR):
+            for mem_map in self.get_dev_mem_maps(node):
+                mmio_maps.append(Node_mem_map(mem_map.addr, mem_map.size, node.name))
 
-            # Apply bus translation
-            running_addr = self.do_bus_addr_translanslation(running_child, parent)
-            running_child.props[:] = [x for x in running_child.props if x != running_child.get_property(REG_STR)]   # Delete
-            running_child.append(fdt.PropWords(REG_STR, *list(chain(*running_addr))))                               # Replace
+        mmio_maps.sort(key=lambda dev: dev.addr)
+        return mmio_maps
 
-            # Move up one level for next iteration
-            child = parent
+    def get_memory_map(self):
 
-        for base, size in tupler(running_child.get_property(REG_STR), 2):
-            mem_map_pairs.append(Dev_mem_map(base, size))
+        '''
+        Get the physical memory map as a MemoryMap (point, range, overlap and free gap queries)
+        '''
 
-        return mem_map_pairs
+        num_addr_cells, _ = self.get_addr_size_cells(self.dtb_obj.get_node("/"))
+        return MemoryMap(self.get_phys_mem_map(), addr_limit=(1 << (NUM_WIDTH * num_addr_cells)))
 
-    def do_bus_addr_translanslation(self, child, parent):
+    def get_bus_addr_translation(self, bus):
 
         '''
-        Translate child regs addrs into parent's addr space
+        Get the composed translation from a bus's child address space to the root address space, memoized per bus.
+        Returns [(child_addr_lo, child_addr_hi, delta, ok), ...], first match wins, no match means 1:1.
+        Buses without "ranges" (or with an empty "ranges") translate 1:1.
+        Addresses outside a bus's ranges pass through it 1:1, matching entries are marked not ok.
         '''
 
-        translated_regs = []
-        child_reg_tuples = self.combine_addr_size_cells(child, REG_STR)
+        if (not bus.parent) or (bus.name == '/'):
+            return []
 
-        # 1:1 translation, return early
-        if ((not parent.exist_property(RNG_STR)) or
-            ("empty" in parent.get_property(RNG_STR).data)):
-            return child_reg_tuples
+        if id(bus) in self._bus_xlat_cache:
+            return self._bus_xlat_cache[id(bus)][1]
 
-        parent_range_tuples = self.combine_addr_size_cells(parent, RNG_STR)
+        parent_xlat = self.get_bus_addr_translation(bus.parent)
+        bus_ranges = self.get_range_tuples(bus)
 
-        # Translate to parent address space
-        for child_base, child_size in child_reg_tuples:
-            translated_base = -1
-            for child_bus_addr, parent_bus_addr, length in parent_range_tuples:
-                if ((child_bus_addr <= child_base) and (child_base <= (child_bus_addr + length))):
-                    translated_base = (child_base - child_bus_addr) + parent_bus_addr
-                    translated_regs.append((translated_base, child_size))
-                    break
+        if not bus_ranges:
+            bus_xlat = parent_xlat
+        else:
+            bus_xlat = []
+            for child_base, parent_base, length in bus_ranges:
+
+                # Split this range's window into parent address space by the parent's (already composed) translation
+                delta = (parent_base - child_base)
+                unmatched = [(parent_base, (parent_base + length))] # Inclusive end, like "__of_translate_address"
+                for lo, hi, parent_delta, parent_ok in parent_xlat:
+                    remaining = []
+                    for start, end in unmatched:
+                        if (end < lo) or (start > hi):
+                            remaining.append((start, end))
+                            continue
+                        overlap_start, overlap_end = max(start, lo), min(end, hi)
+                        bus_xlat.append(((overlap_start - delta), (overlap_end - delta), (delta + parent_delta), parent_ok))
+                        if (start < overlap_start):
+                            remaining.append((start, (overlap_start - 1)))
+                        if (overlap_end < end):
+                            remaining.append(((overlap_end + 1), end))
+                    unmatched = remaining
+
+                # Nothing above this bus translates these, 1:1 from here up (fine if nothing above has ranges)
+                for start, end in unmatched:
+                    bus_xlat.append(((start - delta), (end - delta), delta, (not parent_xlat)))
+
+            # Outside this bus's ranges: untranslated at this level, but still translated by the buses above
+            bus_xlat.extend((lo, hi, parent_delta, False) for lo, hi, parent_delta, _ in parent_xlat)
+
+        self._bus_xlat_cache[id(bus)] = (bus, bus_xlat) # Keep node alive so id() can't be reused
+        return bus_xlat
+
+    def translate_addr(self, bus_xlat, addr):
 
-        if (translated_base == -1):
-            logging.error("Could not translate child ({}) regs to parent ({}) range!".format(child.name, parent.name))
-            return child_reg_tuples
+        '''
+        Translate a child address with a get_bus_addr_translation() table. Returns (root_addr, ok).
+        '''
+
+        for lo, hi, delta, ok in bus_xlat:
+            if (lo <= addr <= hi):
+                return (addr + delta), ok
 
-        return translated_regs
+        return addr, (not bus_xlat)
 
-    def combine_addr_size_cells(self, node, prop_str):
+    def get_addr_size_cells(self, node):
 
         '''
-        For "ranges" and "regs" properties, apply #address-cells and #size-cells compressions so that
-        multi-cell values are represented buy a single value in the returned tuples
+        Get (#address-cells, #size-cells) a node specifies for its children, root's values are the defaults
         '''
 
-        # Get reasonable defaults for board
         root = self.dtb_obj.get_node("/")
-        assert(root.exist_property(NAC_STR) and node.parent.exist_property(NSC_STR))
-        default_num_addr_cells = root.get_property(NAC_STR).data[0]
-        default_num_size_cells = root.get_property(NSC_STR).data[0]
+        default_num_addr_cells = self.get_safe_single_value_prop(root, NAC_STR, 2, [])
+        default_num_size_cells = self.get_safe_single_value_prop(root, NSC_STR, 1, [])
 
-        # Safe fetch values from nodes
-        combined_result = []
-        num_addr_cells = self.get_safe_single_value_prop(node, NAC_STR, default_num_addr_cells, [0])
-        num_size_cells = self.get_safe_single_value_prop(node, NSC_STR, default_num_size_cells, [0])
+        return (self.get_safe_single_value_prop(node, NAC_STR, default_num_addr_cells, []),
+                self.get_safe_single_value_prop(node, NSC_STR, default_num_size_cells, []))
 
-        if (prop_str == RNG_STR):
+    def get_reg_tuples(self, node):
 
-            assert(node.exist_property(RNG_STR) and node.parent.exist_property(NAC_STR))
-            parent_num_addr_cells = node.parent.get_property(NAC_STR).data[0]
-            tuple_len = num_addr_cells + parent_num_addr_cells + num_size_cells
-            range_tuples = tupler(node.get_property(RNG_STR).data, tuple_len)
+        '''
+        Get a node's "reg" as [(addr, size), ...] in its parent bus's address space, cell counts are from the parent.
+        Empty if the node has no valid "reg", if the parent bus has no sizes (ex. CPUs, I2C/SPI devices),
+        or if the parent is a PCI bus ("reg" is config space, not MMIO).
+        '''
 
-            # Combine addresses made up of multiple 32-bit numbers
-            for range_entry in range_tuples:
+        if not (node.parent and node.exist_property(REG_STR)):
+            return []
 
-                idx, child_addr = self.combine_cells(range_entry, 0, num_addr_cells)
-                idx, parent_addr = self.combine_cells(range_entry, idx, (num_addr_cells + parent_num_addr_cells))
-                idx, size = self.combine_cells(range_entry, idx, (num_addr_cells + parent_num_addr_cells + num_size_cells))
+        if (node.parent.exist_property(DEV_STR) and ("pci" in node.parent.get_property(DEV_STR).data)):
+            return []
 
-                combined_result.append((child_addr, parent_addr, size))
+        reg_prop = node.get_property(REG_STR)
+        num_addr_cells, num_size_cells = self.get_addr_size_cells(node.parent)
+        tuple_len = (num_addr_cells + num_size_cells)
+        if not (isinstance(reg_prop, fdt.PropWords) and num_addr_cells and num_size_cells and
+                len(reg_prop) and ((len(reg_prop) % tuple_len) == 0)):
+            return []
 
-            return combined_result
+        reg_tuples = []
+        for reg_entry in tupler(reg_prop.data, tuple_len):
+            idx, addr = self.combine_cells(reg_entry, 0, num_addr_cells)
+            idx, size = self.combine_cells(reg_entry, idx, tuple_len)
+            reg_tuples.append((addr, size))
 
-        elif (prop_str == REG_STR):
+        return reg_tuples
 
-            assert(node.exist_property(REG_STR))
-            tuple_len = num_addr_cells + num_size_cells
-            reg_tuples = tupler(node.get_property(REG_STR), tuple_len)
+    def get_range_tuples(self, bus):
 
-            # Combine addresses made up of multiple 32-bit numbers
-            for reg_entry in reg_tuples:
+        '''
+        Get a bus node's "ranges" as [(child_addr, parent_addr, length), ...], parsed once per bus.
+        Empty for a missing or empty "ranges" (1:1 translation).
+        '''
 
-                idx, addr = self.combine_cells(reg_entry, 0, num_addr_cells)
-                idx, size = self.combine_cells(reg_entry, idx, (num_addr_cells + num_size_cells))
+        if id(bus) in self._bus_ranges_cache:
+            return self._bus_ranges_cache[id(bus)][1]
 
-                combined_result.append((addr, size))
+        range_tuples = []
+        range_prop = bus.get_property(RNG_STR) if bus.exist_property(RNG_STR) else None
 
-            return combined_result
+        if isinstance(range_prop, fdt.PropWords) and len(range_prop):
+            num_addr_cells, num_size_cells = self.get_addr_size_cells(bus)
+            parent_num_addr_cells, _ = self.get_addr_size_cells(bus.parent)
+            tuple_len = (num_addr_cells + parent_num_addr_cells + num_size_cells)
 
-        else:
-            logging.error("Invalid property for address/size combination.")
-            return None
+            if ((len(range_prop) % tuple_len) == 0):
+                for range_entry in tupler(range_prop.data, tuple_len):
+                    idx, child_addr = self.combine_cells(range_entry, 0, num_addr_cells)
+                    idx, parent_addr = self.combine_cells(range_entry, idx, (num_addr_cells + parent_num_addr_cells))
+                    idx, size = self.combine_cells(range_entry, idx, tuple_len)
+                    range_tuples.append((child_addr, parent_addr, size))
+            else:
+                logging.error("Malformed ranges for bus ({}), translating 1:1!".format(bus.name))
+
+        self._bus_ranges_cache[id(bus)] = (bus, range_tuples)
+        return range_tuples
 
     def get_safe_single_value_prop(self, node, prop_str, good_default, bad_default_list):
 
@@ -254,16 +439,12 @@ class Dtb:
     def combine_cells(self, cell_list, idx, end_idx):
 
         '''
-        Combine multiple adjacent 32-bit cells in a list
+        Combine multiple adjacent 32-bit cells in a list, most significant cell first
         '''
 
-        output = cell_list[idx]
-        num_cells_to_left_shift = 0
-        idx += 1
-
+        output = 0
         while (idx < end_idx):
-            num_cells_to_left_shift += 1
-            output = (output | (cell_list[idx] << (NUM_WIDTH * num_cells_to_left_shift)))
+            output = ((output << NUM_WIDTH) | cell_list[idx])
             idx += 1
 
         return idx, output
@@ -274,25 +455,15 @@ class Dtb:
         Reconstruct and print the device's memory map
         '''
 
-        mmio_maps = []
-        mmio_map_to_name = {}
-        mmio_nodes = self.get_nodes_by_prop(REG_STR)
-
-        # Collect
-        for node in mmio_nodes:
-            node_mem_maps = self.get_dev_mem_maps(node)
-            if node_mem_maps:
-                mmio_maps.extend(node_mem_maps)
-                for mem_map in node_mem_maps:
-                    mmio_map_to_name[mem_map] = node.name
-
-        # Sort
-        mmio_maps.sort(key=lambda dev: dev[0])
-
-        # Print
-        for mmio_map in mmio_maps:
+        mem_map = self.get_memory_map()
+        for mmio_map in mem_map:
             logging.info("\t[0x{:08x} - 0x{:08x}] {}".format(
-                mmio_map.addr, (mmio_map.addr + mmio_map.size), mmio_map_to_name[mmio_map]))
+                mmio_map.addr, (mmio_map.addr + mmio_map.size), mmio_map.node_name))
+
+        for region_a, region_b in mem_map.get_overlaps():
+            logging.info("\tOverlap: {} [0x{:08x} - 0x{:08x}], {} [0x{:08x} - 0x{:08x}]".format(
+                region_a.node_name, region_a.addr, (region_a.addr + region_a.size),
+                region_b.node_name, region_b.addr, (region_b.addr + region_b.size)))
 
     # ------------------------------------------------------------------------------------------------------------------
     # DTB CLASS - DTB modification (must call write_dtb() after making the changes!)
@@ -304,19 +475,17 @@ class Dtb:
         Set an existing property to a new value (overwrite).
         '''
 
-        node = self.get_node_by_name(dev_name)
+        dev_path = self._get_dev_path(dev_name)
+        node = self.path_node_map[dev_path]
 
         if node.exist_property(prop_str):
             logging.info("DTB - Dev: {}, Prop: {} - had old value of {}".format(dev_name, prop_str, node.get_property(prop_str)))
             node.props[:] = [x for x in node.props if x != node.get_property(prop_str)] # Delete
 
-        if isinstance(new_prop, str):
-            node.append(fdt.PropStrings(prop_str, new_prop))
-        elif isinstance(new_prop, int):
-            node.append(fdt.PropWords(prop_str, new_prop))
-        else:
-            node.append(fdt.PropWords(prop_str, *new_prop))
+        node.append(new_prop_obj(prop_str, new_prop))
 
+        self._mark_modified(dev_path, props=True)
+        self._invalidate_addr_translation()
         logging.info("DTB - Dev: {}, Prop: {} - set to {}!".format(dev_name, prop_str, new_prop))
 
     def replace_dev(self, old_dev_name, new_dev_name, props={}):
@@ -325,23 +494,26 @@ class Dtb:
         Replace an entry in the DTB with a new sibling entry with specified properties
         '''
 
-        # Save path of old device
-        assert(old_dev_name in self.name_path_map)
-        dev_path = self.name_path_map[old_dev_name].containing_path
-        self.name_path_map[new_dev_name] = self.name_path_map[old_dev_name]
+        # Save parent of old device
+        old_dev_path = self._get_dev_path(old_dev_name)
+        assert(old_dev_path)
+        parent = self.path_node_map[old_dev_path].parent
 
         # Remove old device
-        self.remove_dev(old_dev_name)
+        self.remove_dev(old_dev_path)
 
         # Create new device, with no properties yet and add to dtb
         new_node = fdt.Node(new_dev_name)
-        self.dtb_obj.add_item(new_node, dev_path, create=True)
+        parent.append(new_node)
+        self._index_subtree(new_node)
 
         # Set each property
+        new_dev_path = self._get_node_path(new_node)
+        self._mark_modified(new_dev_path, new=True)
         for prop_name, prop_val in props.items():
-            self.set_property(new_dev_name, prop_name, prop_val)
+            self.set_property(new_dev_path, prop_name, prop_val)
 
-        self._update_name_path_map()
+        self._invalidate_addr_translation()
 
     def remove_dev(self, dev_name):
 
@@ -349,35 +521,319 @@ class Dtb:
         Specify a device to completely remove from the DTB
         '''
 
-        assert(dev_name in self.name_path_map)
+        dev_path = self._get_dev_path(dev_name)
+        assert(dev_path)
+
+        node = self.path_node_map[dev_path]
+        self._unindex_subtree(dev_path)
+        node.parent.remove_subnode(node.name)
+        self._mark_modified(self._get_node_path(node.parent))
+        self._invalidate_addr_translation()
+        logging.info("DTB - Removed {} [{}]".format(node.name, node.path))
+
+    def add_node(self, node, parent_name="/"):
+
+        '''
+        Add a new node (with any subnodes) under a parent device name or path
+        '''
+
+        parent_path = self._get_dev_path(parent_name)
+        assert(parent_path)
 
-        dev_path = self.name_path_map[dev_name].containing_path
-        self.dtb_obj.remove_node(dev_name, path=dev_path)
-        del self.name_path_map[dev_name]
-        logging.info("DTB - Removed {} [{}]".format(dev_name, dev_path))
+        self.path_node_map[parent_path].append(node)
+        self._index_subtree(node)
+        self._mark_modified(self._get_node_path(node), new=True)
+        self._invalidate_addr_translation()
+        logging.info("DTB - Added {} [{}]".format(node.name, parent_path))
 
     def add_virt_mmio_node(self, base_addr, size, int_list, int_parent):
 
         '''
         Add virtio mmio region for QEMU's use.
         See: https://github.com/qemu/qemu/blob/a2e002ff7913ce93aa0f7dbedd2123dce5f1a9cd/hw/arm/virt.c#L844
+        If base_addr is None, the region is placed in the lowest page-aligned unmapped gap.
         '''
 
+        if base_addr is None:
+            base_addr = self.get_memory_map().find_free(size)
+            assert (base_addr is not None), "No unmapped gap of size 0x{:x}".format(size)
+
         # Build node
         dev_name = "virt_mmio@{:08x}".format(base_addr)
         node = fdt.Node(dev_name)
         node.append(fdt.PropStrings('compatible', 'virtio,mmio'))
-        node.append(fdt.PropWords('reg', base_addr, size, wsize=32))
-        node.append(fdt.PropWords('interrupt-parent', int_parent, wsize=32))
-        node.append(fdt.PropWords('interrupts', *int_list, wsize=32))
+        node.append(fdt.PropWords('reg', base_addr, size))
+        node.append(fdt.PropWords('interrupt-parent', int_parent))
+        node.append(fdt.PropWords('interrupts', *int_list))
         node.append(fdt.Property('dma-coherent'))
 
         # Add node to DTB
-        self.dtb_obj.add_item(node)
-        self._update_name_path_map()
+        self.add_node(node)
+
+    def apply_patch_spec(self, patch_spec):
+
+        '''
+        Apply a declarative patch spec (see load_patch_spec), edits for devices not in this DTB are skipped.
+        Returns the number of edits applied.
+        '''
+
+        applied_cnt = 0
+
+        for dev_name in patch_spec.get(PATCH_DISABLE, []):
+            if self._get_dev_path(dev_name):
+                self.remove_dev(dev_name)
+                applied_cnt += 1
+
+        for replace in patch_spec.get(PATCH_REPLACE_DEV, []):
+            if self._get_dev_path(replace["dev"]):
+                self.replace_dev(replace["dev"], replace["new_dev"], replace.get("props", {}))
+                applied_cnt += 1
+
+        for prop in patch_spec.get(PATCH_SET_PROPERTY, []):
+            if self._get_dev_path(prop["dev"]):
+                self.set_property(prop["dev"], prop["prop"], prop["value"])
+                applied_cnt += 1
+
+        for virt_mmio in patch_spec.get(PATCH_ADD_VIRT_MMIO, []):
+            self.add_virt_mmio_node(virt_mmio.get("base_addr"), virt_mmio["size"], virt_mmio["interrupts"],
+                virt_mmio["interrupt_parent"])
+            applied_cnt += 1
+
+        return applied_cnt
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # DTB CLASS - Serialization (incremental, same output as fdt's to_dtb())
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def _build_struct_idx(self):
+
+        '''
+        Index the original blob's structure block by node path:
+            (start, props_end, end, prop names, subtree prop names, first prop, props_end prop, end prop)
+        byte offsets are into the blob, prop indexes are into the (string offset position, name) lists.
+        Returns (index, prop string offset positions, prop names, {prop name: original string offset}), or None if fdt's
+        to_dtb() wouldn't reproduce the original bytes for unmodified nodes (version < 16 alignment, NOPs, non-zero
+        padding, props after subnodes, names not at their first match in the string table).
+        '''
+
+        data = self._dtb_data
+        header = fdt.Header.parse(data)
+        if (header.version < 16):
+            return None
+
+        strings_start = header.off_dt_strings
+        strings_end = (strings_start + header.size_dt_strings)
+        name_by_offset = dict()
+        struct_idx = dict()
+        prop_name_positions = []
+        prop_names = []
+        stack = [] # [path, start, props_end, prop names, subnode prop names, first prop, props_end prop]
+        pos = header.off_dt_struct
+
+        while True:
+            tag = unpack_from(">I", data, pos)[0]
+
+            if (tag == fdt.DTB_BEGIN_NODE):
+                name_end = data.index(b"\0", (pos + 4))
+                name = data[(pos + 4):name_end].decode("ascii")
+                next_pos = ((name_end + 4) & ~3)
+                if data[name_end:next_pos].strip(b"\0"):
+                    return None
+                if stack:
+                    if (not name):
+                        return None
+                    if stack[-1][2] is None:
+                        stack[-1][2] = pos
+                        stack[-1][6] = len(prop_names)
+                    path = (stack[-1][0].rstrip("/") + "/" + name)
+                elif name:
+                    return None
+                else:
+                    path = "/"
+                stack.append([path, pos, None, dict(), dict(), len(prop_names), None]) # Names as ordered sets
+                pos = next_pos
+
+            elif (tag == fdt.DTB_PROP):
+                if (not stack) or (stack[-1][2] is not None):
+                    return None
+                size, name_offset = unpack_from(">II", data, (pos + 4))
+                name = name_by_offset.get(name_offset)
+                if name is None:
+                    name_start = (strings_start + name_offset)
+                    name_raw = data[name_start:(data.index(b"\0", name_start) + 1)]
+                    if (data.find(name_raw, strings_start, strings_end) != name_start):
+                        return None # to_dtb() uses the first match
+                    name = name_raw[:-1].decode("ascii")
+                    name_by_offset[name_offset] = name
+                stack[-1][3][name] = None
+                prop_name_positions.append(pos + 8)
+                prop_names.append(name)
+                data_end = (pos + 12 + size)
+                next_pos = ((data_end + 3) & ~3)
+                if data[data_end:next_pos].strip(b"\0"):
+                    return None
+                pos = next_pos
+
+            elif (tag == fdt.DTB_END_NODE):
+                if not stack:
+                    return None
+                path, start, props_end, node_prop_names, subnode_prop_names, prop_lo, prop_mid = stack.pop()
+                subtree_prop_names = dict(node_prop_names)
+                subtree_prop_names.update(subnode_prop_names)
+                if props_end is None:
+                    props_end, prop_mid = pos, len(prop_names)
+                struct_idx[path] = (start, props_end, (pos + 4), tuple(node_prop_names), tuple(subtree_prop_names),
+                    prop_lo, prop_mid, len(prop_names))
+                if stack:
+                    stack[-1][4].update(subtree_prop_names)
+                pos += 4
+
+            elif (tag == fdt.DTB_END) and (not stack):
+                break
+
+            else:
+                return None
+
+        return struct_idx, prop_name_positions, prop_names, {name: offset for offset, name in name_by_offset.items()}
+
+    def _get_props(self, node, path):
+        return node.props
+
+    def _get_subnodes(self, node, path):
+        return [(subnode, (path.rstrip("/") + "/" + subnode.name)) for subnode in node.nodes]
+
+    def _serialize(self, tree):
+
+        '''
+        Serialize tree (this Dtb, or a DtbVariant of it) to DTB chunks, same bytes as fdt's to_dtb() of the edited tree.
+        tree provides modified paths (see _mark_modified) and the _get_props()/_get_subnodes() of each node.
+        '''
+
+        header = self.dtb_obj.header
+        if self._struct_idx is None:
+            self._struct_idx = (self._build_struct_idx() or False)
+        if self._struct_idx and (header.version == fdt.Header.parse(self._dtb_data).version):
+            struct_idx, prop_name_positions, prop_names, orig_name_offsets = self._struct_idx
+        else:
+            struct_idx = dict() # Nothing reusable, all nodes re-emitted
+
+        if (tree is self):
+            dirty_paths, props_dirty_paths, new_paths = self._dirty_paths, self._props_dirty_paths, self._new_paths
+        else:
+            dirty_paths = (self._dirty_paths | tree._dirty_paths)
+            props_dirty_paths = (self._props_dirty_paths | tree._props_dirty_paths)
+            new_paths = (self._new_paths | tree._new_paths)
+
+        # Same header/reserved memory entries as to_dtb()
+        blob_entries = b"".join(pack(">QQ", entry['address'], entry['size']) for entry in self.dtb_obj.entries)
+        blob_entries += pack(">QQ", 0, 0)
+        blob_data_start = (header.size + len(blob_entries))
+
+        data = memoryview(self._dtb_data)
+        chunks = []
+        pos = blob_data_start # Only matters for version < 16 alignment
+        name_offsets = dict()
+        strings = ""
+
+        def add_chunk(chunk):
+            nonlocal pos
+            chunks.append(chunk)
+            pos += len(chunk)
+
+        def add_names(names):
+
+            '''
+            Same string table as to_dtb(): first match, else append
+            '''
+
+            nonlocal strings
+            for name in names:
+                if name not in name_offsets:
+                    offset = strings.find(name + "\0")
+                    if (offset < 0):
+                        offset = len(strings)
+                        strings += (name + "\0")
+                    name_offsets[name] = offset
+
+        def add_orig_bytes(start, end, names, prop_lo, prop_hi):
+
+            '''
+            Reuse original bytes, patching string offsets that moved (ex. the first user of a name was removed)
+            '''
+
+            add_names(names)
+            moved_names = {name for name in names if (name_offsets[name] != orig_name_offsets[name])}
+            if not moved_names:
+                add_chunk(data[start:end])
+                return
+
+            chunk = bytearray(data[start:end])
+            for prop_idx in range(prop_lo, prop_hi):
+                if prop_names[prop_idx] in moved_names:
+                    pack_into(">I", chunk, (prop_name_positions[prop_idx] - start), name_offsets[prop_names[prop_idx]])
+            add_chunk(chunk)
+
+        def add_subtree(node, path, is_new):
+
+            nonlocal strings
+            is_new = (is_new or (path in new_paths))
+            entry = None if is_new else struct_idx.get(path)
+
+            # Unmodified subtree
+            if entry and (path not in dirty_paths):
+                add_orig_bytes(entry[0], entry[2], entry[4], entry[5], entry[7])
+                return
+
+            # Own header and props, same bytes as fdt.Node.to_dtb()
+            if entry and (path not in props_dirty_paths):
+                add_orig_bytes(entry[0], entry[1], entry[3], entry[5], entry[6])
+            else:
+                if (node.name == "/"):
+                    blob = pack(">II", fdt.DTB_BEGIN_NODE, 0)
+                else:
+                    blob = (pack(">I", fdt.DTB_BEGIN_NODE) + node.name.encode("ascii") + b"\0")
+                add_chunk(blob + (b"\0" * (-len(blob) % 4)))
+                for prop in tree._get_props(node, path):
+                    add_names([prop.name])
+                    blob, strings, _ = prop.to_dtb(strings, pos, header.version)
+                    add_chunk(blob)
+
+            for subnode, subnode_path in tree._get_subnodes(node, path):
+                add_subtree(subnode, subnode_path, is_new)
+
+            add_chunk(pack(">I", fdt.DTB_END_NODE))
+
+        add_subtree(self.dtb_obj.root, "/", False)
+        add_chunk(pack(">I", fdt.DTB_END))
+
+        struct_size = (pos - blob_data_start)
+        header.size_dt_strings = len(strings)
+        header.size_dt_struct = struct_size
+        header.off_mem_rsvmap = header.size
+        header.off_dt_struct = blob_data_start
+        header.off_dt_strings = (blob_data_start + struct_size)
+        header.total_size = (blob_data_start + struct_size + len(strings))
+
+        return [header.export(), blob_entries] + chunks + [strings.encode("ascii")]
+
+    def get_dtb_chunks(self):
 
-        dev_path = self.name_path_map[dev_name].containing_path
-        logging.info("DTB - Added {} [{}]".format(dev_name, dev_path))
+        '''
+        Serialize to DTB as a list of byte chunks, joined they equal self.dtb_obj.to_dtb() (header updated the same way).
+        Unmodified subtrees are slices of the original blob, only nodes changed through this class's modification
+        functions (and their ancestors' own headers) are re-emitted. Nothing is reused if to_dtb() wouldn't reproduce
+        the original bytes (see _build_struct_idx).
+        '''
+
+        return self._serialize(self)
+
+    def to_dtb(self):
+
+        '''
+        Serialize to DTB bytes (see get_dtb_chunks)
+        '''
+
+        return b"".join(self.get_dtb_chunks())
 
     # ------------------------------------------------------------------------------------------------------------------
     # DTB CLASS - File I/O
@@ -389,8 +845,7 @@ class Dtb:
         Write object to DTS file
         '''
 
-        with open(dts_file, "w") as f:
-            f.write(self.dtb_obj.to_dts())
+        write_file_atomic(dts_file, self.dtb_obj.to_dts())
 
     def write_dtb(self, dtb_file):
 
@@ -398,8 +853,256 @@ class Dtb:
         Write object to DTB file
         '''
 
-        with open(dtb_file, "wb") as f:
-            f.write(self.dtb_obj.to_dtb())
+        write_file_atomic(dtb_file, self.get_dtb_chunks())
+
+########################################################################################################################
+# DTB VARIANT - Copy-on-write overlay of a base Dtb
+########################################################################################################################
+
+class DtbVariant:
+
+    '''
+    Edits on top of a shared base Dtb, the base tree isn't copied or modified. Only the diffs are stored:
+    removed node paths, per-node property lists (copied on first set_property), and added nodes.
+    Serializes to the same bytes as making the same edits on a fresh Dtb, reusing the base blob (see Dtb._serialize).
+    '''
+
+    def __init__(self, base):
+
+        self.base = base
+        self._removed_paths = set()
+        self._props = dict()            # {base node path: props}
+        self._added_nodes = dict()      # {base node path: [added subnode, ...]}
+        self._added_path_node_map = dict()
+        self._dirty_paths = set()
+        self._props_dirty_paths = set()
+        self._new_paths = set()
+
+    _mark_modified = Dtb._mark_modified # Same tracking as a Dtb, paths serialized from objects
+
+    def _get_props(self, node, path):
+        return self._props.get(path, node.props)
+
+    def _get_subnodes(self, node, path):
+
+        if path in self._added_path_node_map:
+            return self.base._get_subnodes(node, path) # Added node, owned by this variant
+
+        subnodes = [(subnode, subnode_path) for subnode, subnode_path in self.base._get_subnodes(node, path)
+            if (subnode_path not in self._removed_paths)]
+        subnodes.extend((subnode, (path.rstrip("/") + "/" + subnode.name)) for subnode in self._added_nodes.get(path, []))
+        return subnodes
+
+    def _is_removed(self, path):
+
+        '''
+        Is a base node path removed (itself or an ancestor)?
+        '''
+
+        while (path != "/"):
+            if path in self._removed_paths:
+                return True
+            path = (path.rsplit("/", 1)[0] or "/")
+        return False
+
+    def _get_dev_path(self, dev_name):
+
+        '''
+        Full path for a device name or full path, None if not found. Same choice among duplicate names as Dtb.
+        '''
+
+        if dev_name in self._added_path_node_map:
+            return dev_name
+        if (dev_name in self.base.path_node_map) and (not self._is_removed(dev_name)):
+            return dev_name
+
+        paths = [path for path in self.base.name_paths_map.get(dev_name, []) if not self._is_removed(path)]
+        paths.extend(path for path, node in self._added_path_node_map.items() if (node.name == dev_name))
+        return min(paths) if paths else None
+
+    def get_node_by_name(self, dev_name):
+
+        '''
+        Return node corresponding to DTB device name (or full path). Base nodes are shared, don't modify them directly.
+        '''
+
+        dev_path = self._get_dev_path(dev_name)
+        if dev_path is None:
+            return None
+        return self._added_path_node_map.get(dev_path) or self.base.path_node_map[dev_path]
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # DTB VARIANT - Modification (same API as Dtb)
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def set_property(self, dev_name, prop_str, new_prop):
+
+        '''
+        Set a property to a new value (overwrite), base node props are copied on first write
+        '''
+
+        dev_path = self._get_dev_path(dev_name)
+        assert(dev_path)
+
+        if dev_path in self._added_path_node_map:
+            node = self._added_path_node_map[dev_path]
+            node.props[:] = [prop for prop in node.props if (prop.name != prop_str)]
+            node.append(new_prop_obj(prop_str, new_prop))
+        else:
+            props = self._props.get(dev_path, self.base.path_node_map[dev_path].props)
+            self._props[dev_path] = ([prop for prop in props if (prop.name != prop_str)] + [new_prop_obj(prop_str, new_prop)])
+
+        self._mark_modified(dev_path, props=True)
+
+    def remove_dev(self, dev_name):
+
+        '''
+        Remove a device (and its subnodes)
+        '''
+
+        dev_path = self._get_dev_path(dev_name)
+        assert(dev_path)
+        parent_path = (dev_path.rsplit("/", 1)[0] or "/")
+
+        if dev_path in self._added_path_node_map:
+            node = self._added_path_node_map[dev_path]
+            if node in self._added_nodes.get(parent_path, []):
+                self._added_nodes[parent_path].remove(node)
+            else:
+                node.parent.remove_subnode(node.name)
+            for path in [path for path in self._added_path_node_map if (path + "/").startswith(dev_path + "/")]:
+                del self._added_path_node_map[path]
+        else:
+            self._removed_paths.add(dev_path)
+            for path in [path for path in self._props if (path + "/").startswith(dev_path + "/")]:
+                del self._props[path]
+            for path in [path for path in self._added_path_node_map if path.startswith(dev_path + "/")]:
+                del self._added_path_node_map[path] # Nodes this variant added under the removed base node
+            for path in [path for path in self._added_nodes if (path + "/").startswith(dev_path + "/")]:
+                del self._added_nodes[path]
+
+        self._mark_modified(parent_path)
+
+    def add_node(self, node, parent_name="/"):
+
+        '''
+        Add a new node (with any subnodes) under a parent device name or path, node is owned by the variant afterwards
+        '''
+
+        parent_path = self._get_dev_path(parent_name)
+        assert(parent_path)
+        node_path = (parent_path.rstrip("/") + "/" + node.name)
+        assert(self._get_dev_path(node_path) is None), "{} already exists".format(node_path)
+
+        if parent_path in self._added_path_node_map:
+            self._added_path_node_map[parent_path].append(node)
+        else:
+            self._added_nodes.setdefault(parent_path, []).append(node)
+
+        stack = [(node, node_path)]
+        while stack:
+            subnode, path = stack.pop()
+            self._added_path_node_map[path] = subnode
+            stack.extend((child, (path + "/" + child.name)) for child in subnode.nodes)
+
+        self._mark_modified(node_path, new=True)
+
+    def replace_dev(self, old_dev_name, new_dev_name, props={}):
+
+        '''
+        Replace an entry with a new sibling entry with specified properties
+        '''
+
+        old_dev_path = self._get_dev_path(old_dev_name)
+        assert(old_dev_path)
+        parent_path = (old_dev_path.rsplit("/", 1)[0] or "/")
+
+        self.remove_dev(old_dev_path)
+        new_node = fdt.Node(new_dev_name)
+        self.add_node(new_node, parent_path)
+
+        new_dev_path = (parent_path.rstrip("/") + "/" + new_dev_name)
+        for prop_name, prop_val in props.items():
+            self.set_property(new_dev_path, prop_name, prop_val)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # DTB VARIANT - Serialization
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def get_dtb_chunks(self):
+
+        '''
+        Serialize to DTB as a list of byte chunks, mostly slices of the base's original blob
+        '''
+
+        return self.base._serialize(self)
+
+    def to_dtb(self):
+        return b"".join(self.get_dtb_chunks())
+
+    def write_dtb(self, dtb_file):
+
+        '''
+        Write variant to DTB file
+        '''
+
+        write_file_atomic(dtb_file, self.get_dtb_chunks())
+
+########################################################################################################################
+# BATCH PATCHING - Same patch spec applied to many DTBs
+########################################################################################################################
+
+def load_patch_spec(spec_path):
+
+    '''
+    Load a patch spec, JSON or YAML (".yml"/".yaml", needs PyYAML). Keys, each optional, applied in this order:
+        disable: [dev_name, ...]
+        replace_dev: [{dev, new_dev, props: {prop_name: value}}, ...]
+        set_property: [{dev, prop, value}, ...]
+        add_virt_mmio_node: [{base_addr (null for first free gap), size, interrupts: [...], interrupt_parent}, ...]
+    '''
+
+    with open(spec_path) as f:
+        if spec_path.endswith((".yml", ".yaml")):
+            import yaml # Optional, only needed for YAML specs
+            patch_spec = yaml.safe_load(f)
+        else:
+            patch_spec = json.load(f)
+
+    unknown_keys = set(patch_spec) - set(PATCH_KEYS)
+    if unknown_keys:
+        raise ValueError("Unknown patch spec keys: {}".format(", ".join(sorted(unknown_keys))))
+
+    return patch_spec
+
+def worker_patch_dtb_file(dtb_path, patch_spec, output_dir_path):
+
+    '''
+    Worker func to patch a single DTB, output has the same file name. Returns (dtb_path, edits applied or None on error).
+    '''
+
+    try:
+        dtb = Dtb(dtb_path)
+        applied_cnt = dtb.apply_patch_spec(patch_spec)
+        dtb.write_dtb(os.path.join(output_dir_path, os.path.basename(dtb_path)))
+        return dtb_path, applied_cnt
+
+    except Exception as e:
+        logging.error("{}: {}".format(dtb_path, e))
+        return dtb_path, None
+
+def patch_dtb_files(dtb_paths, patch_spec, output_dir_path, max_workers=os.cpu_count()):
+
+    '''
+    Apply a patch spec to many DTBs in parallel. Returns {dtb_path: edits applied or None on error}.
+    '''
+
+    from multiprocessing import Pool
+
+    os.makedirs(output_dir_path, exist_ok=True)
+    with Pool(max_workers) as proc_pool:
+        return dict(proc_pool.starmap(worker_patch_dtb_file,
+            [(dtb_path, patch_spec, output_dir_path) for dtb_path in dtb_paths], chunksize=8))
 
 ########################################################################################################################
 # MAIN - Use as standalone util
@@ -407,13 +1110,14 @@ class Dtb:
 
 if __name__ == "__main__":
 
+    import coloredlogs # CLI only, keep out of library imports (ex. df_analyze.py worker processes)
     coloredlogs.install(level=logging.DEBUG, fmt='%(levelname)s %(name)s %(message)s') # Colored logs w/o timestamp
 
     parser = argparse.ArgumentParser(description="Parse or modify a Device Tree Blob (DTB)")
     parser.add_argument(
             'dtb',
-            type=lambda x: file_exists(parser, x),
-            help="Device Tree Blob to parse")
+            type=lambda x: x if os.path.isdir(x) else file_exists(parser, x),
+            help="Device Tree Blob to parse (or directory of DTBs, with --patch-spec)")
     parser.add_argument(
             '--disable',
             required=False,
@@ -437,6 +1141,11 @@ if __name__ == "__main__":
             required=False,
             action='store_true',
             help="Show physical memory map")
+    parser.add_argument(
+            '--mem-map-json',
+            required=False,
+            type=str,
+            help="Filename for output physical memory map (JSON)")
     parser.add_argument(
             '--id-arch',
             required=False,
@@ -452,28 +1161,62 @@ if __name__ == "__main__":
             required=False,
             type=str,
             help="Filename for output DTS")
+    parser.add_argument(
+            '--patch-spec',
+            required=False,
+            type=lambda x: file_exists(parser, x),
+            help="JSON/YAML patch spec (see load_patch_spec()) to apply, to every DTB if dtb is a directory")
+    parser.add_argument(
+            '--patch-out-dir',
+            required=False,
+            type=str,
+            help="Output directory for patched DTBs, when dtb is a directory")
+    parser.add_argument(
+            '--max-workers',
+            required=False,
+            type=int,
+            default=os.cpu_count(),
+            help="Maximum number parallel worker processes for directory patching (Default == CPU count)")
 
     args = parser.parse_args()
 
-    if args.disable and (args.patched_dtb_out is None):
-        parser.error("--disable requires --patched-dtb-out")
+    if (args.disable or args.patch_spec) and os.path.isfile(args.dtb) and (args.patched_dtb_out is None):
+        parser.error("--disable and --patch-spec require --patched-dtb-out")
         sys.exit(1)
 
+    # Batch mode, same patch spec for every DTB in a directory
+    if os.path.isdir(args.dtb):
+        if (args.patch_spec is None) or (args.patch_out_dir is None):
+            parser.error("a directory of DTBs requires --patch-spec and --patch-out-dir")
+            sys.exit(1)
+
+        dtb_paths = [os.path.join(args.dtb, f) for f in sorted(os.listdir(args.dtb)) if f.endswith(".dtb")]
+        results = patch_dtb_files(dtb_paths, load_patch_spec(args.patch_spec), args.patch_out_dir, args.max_workers)
+        failed_cnt = sum(1 for applied_cnt in results.values() if applied_cnt is None)
+        logging.info("DTB - patched {} DTB(s) into \'{}\', {} failed".format(
+            (len(results) - failed_cnt), args.patch_out_dir, failed_cnt))
+        sys.exit(1 if failed_cnt else 0)
+
     dtb = Dtb(args.dtb)
 
     if args.list_all:
         logging.info("DTB - listing all devices:")
-        for key, val in dtb.name_path_map.items():
-            logging.info("\t{} [{}]".format(key, val.full_path))
+        for path, node in dtb.path_node_map.items(): # Every node, including those sharing a name
+            logging.info("\t{} [{}]".format(node.name, path))
 
     if args.id_arch:
         logging.info("DTB - identifying architecture:")
-        logging.info("\t{}".format(get_arch(dtb)))
+        arch, confidence = get_arch_and_confidence(dtb)
+        logging.info("\t{} (confidence: {:.2f})".format(arch, confidence))
 
     if args.phys_mem_map:
         logging.info("DTB - reconstructing physical memory map:")
         dtb.print_phys_mem_map()
 
+    if args.mem_map_json:
+        with open(args.mem_map_json, "w") as f:
+            f.write(dtb.get_memory_map().to_json())
+
     if args.disable:
         for dev_name in args.disable:
             dtb.remove_dev(dev_name)
@@ -493,6 +1236,10 @@ if __name__ == "__main__":
                 new_prop[:] = [int(x, 0) for x in new_prop]
             dtb.set_property(dev_name, prop_name, new_prop)
 
+    if args.patch_spec:
+        applied_cnt = dtb.apply_patch_spec(load_patch_spec(args.patch_spec))
+        logging.info("DTB - applied {} patch spec edit(s)".format(applied_cnt))
+
     if args.dts_out:
         dtb.write_dts(args.dts_out)
     if args.patched_dtb_out:
@@ -1,7 +1,7 @@
 #! /usr/bin/python3
 
 # External deps
-import os, sys, argparse, logging, errno, struct, time, json, re, pygount
+import os, sys, argparse, logging, errno, struct, time, json, re, mmap, random, hashlib, sqlite3
 from multiprocessing import Pool, Manager
 from typing import List, Set, Tuple, Dict, Optional, Union, BinaryIO
 
@@ -9,7 +9,6 @@ from typing import List, Set, Tuple, Dict, Optional, Union, BinaryIO
 sys.path.append("." + os.sep + "analyses")
 from df_common import *
 from df import Dtb
-import analyses_common as ac
 
 ########################################################################################################################
 # GLOBAL CONSTS
@@ -17,6 +16,26 @@ import analyses_common as ac
 
 MAGIC_LIST = [(0xd00dfeed, 4)]
 
+# Built-in C SLOC counter (see get_c_sloc_cnt), bump version if counting rules change
+C_SLOC_CNT_VER = 1
+C_SLOC_WHITE_BYTES = b" \t\r\f\v(),:;[]{}"
+C_SLOC_GEN_LINE_CNT = 15
+C_SLOC_GEN_RE = re.compile(
+    rb"automatically generated|do not edit|generated with the .+ utility|this is a generated file|generated automatically",
+    re.IGNORECASE)
+C_SLOC_TOKEN_RE = re.compile(rb"/\*|//|(?:(?<![\w$])(?:[LuU]|u8))?[\"']|^[ \t]*#", re.MULTILINE)
+C_SLOC_LINE_COMMENT_RE = re.compile(rb"//(?:[^\n\\]|\\.|\\\n)*")
+C_SLOC_STRING_RE = re.compile(rb'(?:[LuU]|u8)?"(?:[^"\\\n]|\\.|\\\n)*"?')
+C_SLOC_CHAR_RE = re.compile(rb"(?:[LuU]|u8)?'(?:\\.|\\[0-7]{1,3}|\\x[a-fA-F0-9]{1,2}|[^\\'\n])'")
+C_SLOC_DIRECTIVE_RE = re.compile(rb"[ \t]*#(?:/\*.*?\*/|[^\n\\/]|\\.|/(?![*/]))*", re.DOTALL)
+C_SLOC_BLOCK_COMMENT_RE = re.compile(rb"/\*.*?\*/", re.DOTALL)
+C_SLOC_IF0_RE = re.compile(rb"[ \t]*#if\s+0")
+C_SLOC_IF0_DIRECTIVE_RE = re.compile(rb"\s*#(if|el(?:se|if)|endif)")
+
+# Same match as the driver source grep (see get_linux_driver_src_files), first quoted string is the compatible
+CMP_STR_RE = re.compile(rb'.compatible = ".*"', re.IGNORECASE)
+CMP_STR_QUOTED_RE = re.compile(rb'"(.*?)"')
+
 ########################################################################################################################
 # FILE PROCESSING
 ########################################################################################################################
@@ -136,13 +155,12 @@ def linux_source_path_to_driver_type(src_path: str) -> str:
 
         return 'OTHER'
 
-def get_all_linux_driver_sloc_cnts(linux_top_level_dir: str, max_workers: int) -> Tuple[Dict[str, float], Dict[Tuple[str, ...], str]]:
+def get_linux_driver_src_files(linux_top_level_dir: str) -> Dict[str, List[str]]:
 
     '''
-    Parsing of grep output to get compatible strings and corresponding SLOC counts
+    Parsing of grep output to get C source files and the compatible strings they mention
     '''
 
-    cmp_str_to_type: Dict[Tuple[str, ...], str] = {}
     src_to_cmp_strs: Dict[str, List[str]] = {} # TODO: use default dict to avoid key check
 
     # Change into linux dir, recursive grep for C source files mentioning compatible strings
@@ -159,14 +177,59 @@ def get_all_linux_driver_sloc_cnts(linux_top_level_dir: str, max_workers: int) -
         src_to_cmp_strs[src_path].append(cmp_str)
 
     assert(len(src_to_cmp_strs) > 0)
+    return src_to_cmp_strs
+
+def get_linux_c_src_files(linux_top_level_dir: str) -> List[str]:
+
+    '''
+    Recursive listing of C source files, skips symlinks like "grep -r"
+    '''
+
+    src_paths = []
+    for root, dirs, files in os.walk(linux_top_level_dir):
+        dirs.sort()
+        for file_name in sorted(files):
+            src_path = os.path.join(root, file_name)
+            if file_name.endswith(".c") and (not os.path.islink(src_path)):
+                src_paths.append(src_path)
+
+    return src_paths
+
+def get_src_cmp_strs(src: bytes) -> List[str]:
+
+    '''
+    Get compatible strings mentioned in C source, equivalent to the grep in get_linux_driver_src_files()
+    '''
+
+    cmp_strs = []
+    for match in CMP_STR_RE.finditer(src):
+        quoted = CMP_STR_QUOTED_RE.search(match.group())
+        if quoted:
+            cmp_strs.append(quoted.group(1).decode(STR_ENCODING, errors="replace"))
+
+    return cmp_strs
+
+def get_all_linux_driver_sloc_cnts(linux_top_level_dir: str, max_workers: int, fast_sloc: bool = False,
+    cache_path: Optional[str] = None) -> Tuple[Dict[Tuple[str, ...], float], Dict[Tuple[str, ...], str]]:
+
+    '''
+    Get compatible strings and corresponding SLOC counts for Linux driver sources
+    '''
+
+    if cache_path:
+        return get_cached_linux_driver_sloc_cnts(linux_top_level_dir, max_workers, fast_sloc, cache_path)
+
+    cmp_str_to_type: Dict[Tuple[str, ...], str] = {}
+    src_to_cmp_strs = get_linux_driver_src_files(linux_top_level_dir)
+
     proc_pool_driver_src = Pool(max_workers)
     manager = Manager()
-    cmp_str_to_sloc: Dict[str, float] = manager.dict()
+    cmp_str_to_sloc: Dict[Tuple[str, ...], float] = manager.dict()
 
     for src_path in src_to_cmp_strs:
         cmp_str_tuple: Tuple[str, ...] = tuple(src_to_cmp_strs[src_path])
         cmp_str_to_type[cmp_str_tuple] = linux_source_path_to_driver_type(src_path)
-        proc_pool_driver_src.apply_async(worker_get_single_linux_driver_sloc_cnt, (src_path, cmp_str_tuple, cmp_str_to_sloc,))
+        proc_pool_driver_src.apply_async(worker_get_single_linux_driver_sloc_cnt, (src_path, cmp_str_tuple, cmp_str_to_sloc, fast_sloc,))
 
     proc_pool_driver_src.close()
     proc_pool_driver_src.join()
@@ -174,15 +237,306 @@ def get_all_linux_driver_sloc_cnts(linux_top_level_dir: str, max_workers: int) -
     assert(len(cmp_str_to_sloc) > 0)
     return cmp_str_to_sloc, cmp_str_to_type
 
+########################################################################################################################
+# SLOC COUNTING
+########################################################################################################################
+
+def mask_c_src(src: Union[bytes, mmap.mmap]) -> bytes:
+
+    '''
+    Strip comments and string/char literals from C source, preserving line structure.
+    Mirrors the Pygments C lexer rules pygount relies on, including "#if 0" blocks being treated as comments.
+    '''
+
+    masked = []
+    pos = 0
+    src_len = len(src)
+
+    while True:
+
+        match = C_SLOC_TOKEN_RE.search(src, pos)
+        if not match:
+            masked.append(src[pos:])
+            break
+
+        start = match.start()
+        masked.append(src[pos:start])
+        tok = match.group()
+
+        # Block comment, open until EOF if unterminated
+        if tok == b"/*":
+            end = src.find(b"*/", start + 2)
+            end = src_len if (end == -1) else (end + 2)
+            masked.append(b"\n" * src[start:end].count(b"\n"))
+
+        # Line comment, may be continued with a trailing backslash
+        elif tok == b"//":
+            line_comment_match = C_SLOC_LINE_COMMENT_RE.match(src, start)
+            assert(line_comment_match) # Matches at least the "//"
+            end = line_comment_match.end()
+            masked.append(b"\n" * src[start:end].count(b"\n"))
+
+        # String literal
+        elif tok.endswith(b"\""):
+            string_match = C_SLOC_STRING_RE.match(src, start)
+            assert(string_match) # Matches at least the opening quote
+            end = string_match.end()
+            masked.append(b"\n" * src[start:end].count(b"\n"))
+
+        # Char literal, a lone quote is just code
+        elif tok.endswith(b"'"):
+            char_match = C_SLOC_CHAR_RE.match(src, start)
+            if char_match:
+                end = char_match.end()
+            else:
+                end = match.end()
+                masked.append(tok)
+
+        # "#if 0" block, contents are comments except for nested directives
+        elif C_SLOC_IF0_RE.match(src, start):
+            depth = 0
+            end = start
+            while end < src_len:
+                line_end = src.find(b"\n", end)
+                line_end = src_len if (line_end == -1) else (line_end + 1)
+                directive = C_SLOC_IF0_DIRECTIVE_RE.match(src, end, line_end)
+                if directive:
+                    masked.append(b"#")
+                    depth += (1 if (directive.group(1) == b"if") else -1)
+                masked.append(b"\n" if src[line_end - 1:line_end] == b"\n" else b"")
+                end = line_end
+                if (depth == 0):
+                    break
+
+        # Other preprocessor directive, possibly spanning multiple lines. Strings aren't special here, comments are
+        else:
+            directive_match = C_SLOC_DIRECTIVE_RE.match(src, start)
+            assert(directive_match) # Matches at least the "#"
+            end = directive_match.end()
+            masked.append(C_SLOC_BLOCK_COMMENT_RE.sub(lambda m: (b"\n" * m.group().count(b"\n")), src[start:end]))
+
+        pos = end
+
+    return b"".join(masked)
+
+def get_c_sloc_cnt(file_path: str) -> int:
+
+    '''
+    Count C source lines of code, a fast alternative to pygount's "code" count for driver sources.
+    A line counts as code if anything other than whitespace, bracket/separator chars, comments, or strings remains.
+    '''
+
+    with open(file_path, "rb") as f:
+        if (os.fstat(f.fileno()).st_size == 0):
+            return 0
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as src:
+
+            # Match pygount: files that declare themselves generated don't count
+            hdr_end = 0
+            for _ in range(C_SLOC_GEN_LINE_CNT):
+                hdr_end = src.find(b"\n", hdr_end) + 1
+                if (hdr_end == 0):
+                    hdr_end = len(src)
+                    break
+            if C_SLOC_GEN_RE.search(src, 0, hdr_end):
+                return 0
+
+            masked = mask_c_src(src)
+
+    return sum(1 for line in masked.split(b"\n") if line.translate(None, C_SLOC_WHITE_BYTES))
+
+def get_pygount_sloc_cnt(file_path: str) -> int:
+
+    '''
+    Count SLOC with pygount (reference implementation, slower)
+    '''
+
+    import pygount # Slow import, not needed with --fast-sloc
+
+    return pygount.SourceAnalysis.from_file(file_path, 'driver_sloc').code
+
+def validate_c_sloc_cnt(src_paths: List[str], sample_cnt: int) -> None:
+
+    '''
+    Compare the built-in C SLOC counter against pygount for a random sample of source files, report drift and speedup
+    '''
+
+    sample = random.sample(src_paths, min(sample_cnt, len(src_paths)))
+    fast_total = ref_total = 0
+    fast_time = ref_time = 0.0
+    drift_cnt = 0
+
+    for src_path in sample:
+
+        start = time.perf_counter()
+        fast_cnt = get_c_sloc_cnt(src_path)
+        fast_time += (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        ref_cnt = get_pygount_sloc_cnt(src_path)
+        ref_time += (time.perf_counter() - start)
+
+        fast_total += fast_cnt
+        ref_total += ref_cnt
+        if (fast_cnt != ref_cnt):
+            drift_cnt += 1
+            logging.warning("SLOC drift: \'{}\' built-in: {}, pygount: {}".format(src_path, fast_cnt, ref_cnt))
+
+    logging.info("SLOC validation: {}/{} files match exactly".format((len(sample) - drift_cnt), len(sample)))
+    logging.info("SLOC validation: built-in total {}, pygount total {} ({:+.3f}% drift)".format(
+        fast_total, ref_total, (100.0 * (fast_total - ref_total) / ref_total) if ref_total else 0.0))
+    logging.info("SLOC validation: built-in {:.3f}s, pygount {:.3f}s ({:.1f}x speedup)".format(
+        fast_time, ref_time, (ref_time / fast_time) if fast_time else 0.0))
+
+########################################################################################################################
+# SLOC CACHE
+########################################################################################################################
+
+class SlocCache:
+
+    '''
+    On-disk SQLite cache of per-file driver analysis, keyed by source file content hash.
+    Compatible strings only depend on file content, SLOC also depends on the counter (name and version).
+    '''
+
+    def __init__(self, db_path: str, counter: str) -> None:
+
+        self.counter = counter
+        self.hits = 0
+        self.misses = 0
+        self.conn = sqlite3.connect(db_path)
+        self.conn.executescript('''
+            CREATE TABLE IF NOT EXISTS src_file (
+                digest TEXT PRIMARY KEY,
+                cmp_strs TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS sloc (
+                digest TEXT NOT NULL,
+                counter TEXT NOT NULL,
+                sloc INTEGER NOT NULL,
+                PRIMARY KEY (digest, counter)
+            );
+        ''')
+
+        # Single query up front, lookups during a scan are then just dict accesses
+        self.entries: Dict[str, Tuple[List[str], Optional[int]]] = {}
+        rows = self.conn.execute('''
+            SELECT src_file.digest, src_file.cmp_strs, sloc.sloc FROM src_file
+            LEFT JOIN sloc ON (sloc.digest = src_file.digest AND sloc.counter = ?)
+        ''', (counter,))
+        for digest, cmp_strs, sloc_cnt in rows:
+            self.entries[digest] = (json.loads(cmp_strs), sloc_cnt)
+
+    def get(self, digest: str) -> Optional[Tuple[List[str], Optional[int]]]:
+
+        '''
+        Get (compatible strings, SLOC) for a file hash, None on miss.
+        Files without compatible strings never get a SLOC count, so they hit without one.
+        '''
+
+        entry = self.entries.get(digest)
+        if entry and ((not entry[0]) or (entry[1] is not None)):
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        return None
+
+    def put_all(self, results: List[Tuple[str, List[str], Optional[int]]]) -> None:
+
+        '''
+        Store (hash, compatible strings, SLOC) results in a single transaction
+        '''
+
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO src_file (digest, cmp_strs) VALUES (?, ?)",
+                [(digest, json.dumps(cmp_strs)) for digest, cmp_strs, _ in results])
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO sloc (digest, counter, sloc) VALUES (?, ?, ?)",
+                [(digest, self.counter, sloc_cnt) for digest, _, sloc_cnt in results if (sloc_cnt is not None)])
+
+        for digest, cmp_strs, sloc_cnt in results:
+            self.entries[digest] = (cmp_strs, sloc_cnt)
+
+    def close(self) -> None:
+
+        self.conn.close()
+
+def get_sloc_counter_name(fast_sloc: bool) -> str:
+
+    '''
+    Cache key for the SLOC counter in use, changes whenever counts could change
+    '''
+
+    if fast_sloc:
+        return "c_sloc-{}".format(C_SLOC_CNT_VER)
+    else:
+        import pygount
+        return "pygount-{}".format(pygount.__version__)
+
+def get_cached_linux_driver_sloc_cnts(linux_top_level_dir: str, max_workers: int, fast_sloc: bool,
+    cache_path: str) -> Tuple[Dict[Tuple[str, ...], float], Dict[Tuple[str, ...], str]]:
+
+    '''
+    Get compatible strings and corresponding SLOC counts for Linux driver sources.
+    Only files whose content hash isn't in the cache are analyzed.
+    '''
+
+    cmp_str_to_sloc: Dict[Tuple[str, ...], float] = {}
+    cmp_str_to_type: Dict[Tuple[str, ...], str] = {}
+    cache = SlocCache(cache_path, get_sloc_counter_name(fast_sloc))
+
+    src_paths = get_linux_c_src_files(linux_top_level_dir)
+    assert(len(src_paths) > 0)
+
+    with Pool(max_workers) as proc_pool_driver_src:
+
+        # Hash everything, cheap relative to SLOC counting
+        src_to_digest = dict(proc_pool_driver_src.imap(worker_hash_file, src_paths, chunksize=64))
+        src_to_entry = {src_path: cache.get(digest) for src_path, digest in src_to_digest.items()}
+
+        # Analyze cache misses only
+        miss_paths = [src_path for src_path, entry in src_to_entry.items() if (entry is None)]
+        miss_args = [(src_path, fast_sloc) for src_path in miss_paths]
+        miss_results = proc_pool_driver_src.starmap(worker_analyze_linux_driver_src, miss_args, chunksize=16)
+
+    cache.put_all([(src_to_digest[src_path], cmp_strs, sloc_cnt)
+        for src_path, (cmp_strs, sloc_cnt) in zip(miss_paths, miss_results)])
+    src_to_entry.update(zip(miss_paths, miss_results))
+
+    # Driver sources only, every miss filled in. Files with compatible strings always get a SLOC count
+    src_to_driver_entry: Dict[str, Tuple[List[str], int]] = {}
+    for src_path, entry in src_to_entry.items():
+        assert(entry is not None)
+        cmp_strs, opt_sloc_cnt = entry
+        if cmp_strs:
+            assert(opt_sloc_cnt is not None)
+            src_to_driver_entry[src_path] = (cmp_strs, opt_sloc_cnt)
+
+    for src_path, (cmp_strs, sloc_cnt) in src_to_driver_entry.items():
+        cmp_str_tuple: Tuple[str, ...] = tuple(cmp_strs)
+        cmp_str_to_type[cmp_str_tuple] = linux_source_path_to_driver_type(src_path)
+        cmp_str_to_sloc[cmp_str_tuple] = sloc_cnt
+
+    total = cache.hits + cache.misses
+    logging.info("SLOC cache \'{}\': {} hits, {} misses ({:.1f}% hit rate)".format(
+        cache_path, cache.hits, cache.misses, (100.0 * cache.hits / total) if total else 0.0))
+    cache.close()
+
+    assert(len(cmp_str_to_sloc) > 0)
+    return cmp_str_to_sloc, cmp_str_to_type
+
 ########################################################################################################################
 # WORKER THREAD CALLBACKS
 ########################################################################################################################
 
 # No typing b/c stats: Dict[str, Optional[Union[int, str, List[str]]]] can't guarantee .extend()
-def worker_process_dtb_file(input_file_path, is_linux, output_dir_path):
+def worker_process_dtb_file(input_file_path, is_linux, output_dir_path, get_mem_maps=False):
 
     '''
     Worker func to write the stats JSON for a single DTB.
+    Optionally includes the translated physical memory map (packed, see get_mem_map_stats).
     '''
 
     stats = {}
@@ -220,6 +574,8 @@ def worker_process_dtb_file(input_file_path, is_linux, output_dir_path):
             stats[JSON_INT].extend(int_strs)
             stats[JSON_CMP_STR].extend(cmp_strs)
             stats[JSON_PRI_CMP_STR].extend(primary_cmp_strs)
+            if get_mem_maps:
+                stats.update(get_mem_map_stats(dtb.get_phys_mem_map()))
 
             # Write JSON
             write_dtb_stats_json(stats, stats_json_path)
@@ -228,15 +584,43 @@ def worker_process_dtb_file(input_file_path, is_linux, output_dir_path):
         logging.error("{}".format(e))
         return
 
-def worker_get_single_linux_driver_sloc_cnt(file_path: str, cmp_str_tuple: Tuple[str], shared_dict: Dict[Tuple[str], float]) -> None:
+def worker_get_single_linux_driver_sloc_cnt(file_path: str, cmp_str_tuple: Tuple[str], shared_dict: Dict[Tuple[str], float], fast_sloc: bool = False) -> None:
 
     '''
     Worker func to collect SLOC and add to shared manager.dict()
     '''
 
-    sloc_cnt = pygount.SourceAnalysis.from_file(file_path, 'driver_sloc').code
+    if fast_sloc:
+        sloc_cnt = get_c_sloc_cnt(file_path)
+    else:
+        sloc_cnt = get_pygount_sloc_cnt(file_path)
     shared_dict[cmp_str_tuple] = sloc_cnt
 
+def worker_hash_file(file_path: str) -> Tuple[str, str]:
+
+    '''
+    Worker func to get content hash of a file, key for the SLOC cache
+    '''
+
+    with open(file_path, "rb") as f:
+        return file_path, hashlib.sha256(f.read()).hexdigest()
+
+def worker_analyze_linux_driver_src(file_path: str, fast_sloc: bool) -> Tuple[List[str], Optional[int]]:
+
+    '''
+    Worker func to get compatible strings and, if any, SLOC for a C source file
+    '''
+
+    with open(file_path, "rb") as f:
+        cmp_strs = get_src_cmp_strs(f.read())
+
+    if not cmp_strs:
+        return cmp_strs, None
+    elif fast_sloc:
+        return cmp_strs, get_c_sloc_cnt(file_path)
+    else:
+        return cmp_strs, get_pygount_sloc_cnt(file_path)
+
 ########################################################################################################################
 # DRIVER
 ########################################################################################################################
@@ -264,6 +648,31 @@ if __name__ == "__main__":
             default=False,
             help="The input directory is Linux source code. \
                 If flag present, will get driver SLOC and infer DTB architecture from path")
+    arg_parser.add_argument(
+            '--fast-sloc',
+            action="store_true",
+            default=False,
+            help="Use the built-in C SLOC counter instead of pygount for driver SLOC (requires --linux-src-dir)")
+    arg_parser.add_argument(
+            '--validate-sloc',
+            type=int,
+            default=0,
+            metavar="N",
+            help="Compare built-in C SLOC counter against pygount for N random driver sources, then exit \
+                (requires --linux-src-dir)")
+    arg_parser.add_argument(
+            '--sloc-cache',
+            type=str,
+            default=None,
+            metavar="DB_PATH",
+            help="SQLite cache of driver SLOC keyed by file content hash, created if missing. \
+                Only changed files are re-analyzed on repeat scans (requires --linux-src-dir)")
+    arg_parser.add_argument(
+            '--mem-maps',
+            action="store_true",
+            default=False,
+            help="Include each DTB's translated physical memory map in its stats JSON \
+                (see ./analyses/print_common_mmio_bases.py)")
 
     # Setup
     logging.basicConfig(stream=sys.stdout, level=logging.DEBUG, format="[%(processName)s]:%(levelname)s:%(message)s")
@@ -271,28 +680,40 @@ if __name__ == "__main__":
     if not os.path.isdir(args.output_dir):
         os.makedirs(args.output_dir)
 
+    if (args.fast_sloc or args.validate_sloc or args.sloc_cache) and (not args.linux_src_dir):
+        arg_parser.error("--fast-sloc, --validate-sloc, and --sloc-cache require --linux-src-dir")
+
+    # Spot-check built-in SLOC counter accuracy
+    if args.validate_sloc:
+        validate_c_sloc_cnt(list(get_linux_driver_src_files(args.input_file_or_dir)), args.validate_sloc)
+        sys.exit(0)
+
     # Peripheral Driver SLOC
     if args.linux_src_dir:
 
+        # Pulls in matplotlib, so only import when generating files (not in every worker process)
+        import analyses_common as ac
+
         # Compute SLOC, get device types
-        sloc_data_tuple_key, type_data_tuple_key = get_all_linux_driver_sloc_cnts(args.input_file_or_dir, args.max_workers)
+        sloc_data_tuple_key, type_data_tuple_key = get_all_linux_driver_sloc_cnts(
+            args.input_file_or_dir, args.max_workers, args.fast_sloc, args.sloc_cache)
 
         # Generate file for use by other analyses
-        SLOC_FILE = os.path.join(GEN_FILE_DIR, "sloc_cnt.py")
-        ac.write_hdr_for_py_file(SLOC_FILE, "THIS FILE WAS AUTO GENERATED BY ./df_analyze.py")
-        ac.write_dict_to_py_file(SLOC_FILE, "DRIVER_NAME_TO_SLOC", sloc_data_tuple_key)
+        SLOC_FILE = os.path.join(GEN_FILE_DIR, "sloc_cnt" + GEN_FILE_EXT)
+        ac.write_dict_to_gen_file(SLOC_FILE, "DRIVER_NAME_TO_SLOC", sloc_data_tuple_key,
+            "THIS FILE WAS AUTO GENERATED BY ./df_analyze.py")
 
         # Generate file for use by other analyses
-        TYPE_FILE = os.path.join(GEN_FILE_DIR, "driver_types.py")
-        ac.write_hdr_for_py_file(TYPE_FILE, "THIS FILE WAS AUTO GENERATED BY ./df_analyze.py")
-        ac.write_dict_to_py_file(TYPE_FILE, "DRIVER_NAME_TO_TYPE", type_data_tuple_key)
+        TYPE_FILE = os.path.join(GEN_FILE_DIR, "driver_types" + GEN_FILE_EXT)
+        ac.write_dict_to_gen_file(TYPE_FILE, "DRIVER_NAME_TO_TYPE", type_data_tuple_key,
+            "THIS FILE WAS AUTO GENERATED BY ./df_analyze.py")
 
     # DTB Parallel processing
     proc_pool_dtb = Pool(args.max_workers)
     logging.info("Processing file(s)...")
     files_to_search = get_file_list(arg_parser, args.input_file_or_dir)
     for file_path in files_to_search:
-        proc_pool_dtb.apply_async(worker_process_dtb_file, (file_path, args.linux_src_dir, args.output_dir,))
+        proc_pool_dtb.apply_async(worker_process_dtb_file, (file_path, args.linux_src_dir, args.output_dir, args.mem_maps,))
     proc_pool_dtb.close()
     proc_pool_dtb.join()
     logging.info("Done. See \'{}\' for results.".format(args.output_dir))
\ No newline at end of file
@@ -1,20 +1,16 @@
 #! /usr/bin/python3
 
-import os, subprocess, logging, sys
-from collections import namedtuple
+import os, subprocess, logging, sys, json, mmap, math, re, struct, base64
+from collections import namedtuple, Counter
+from collections.abc import Mapping
 from itertools import zip_longest, chain
-from fuzzywuzzy import process as fzy_proc
+from functools import lru_cache
+from bisect import bisect_right
 import statistics as stats
 from pathlib import Path
 
 # Generated files directory
 GEN_FILE_DIR = str(Path(__file__).resolve().parent) + os.sep + "generated_files"
-if os.path.exists(GEN_FILE_DIR):
-    sys.path.append(GEN_FILE_DIR)
-if os.path.exists(os.path.join(GEN_FILE_DIR, "arch_signatures.py")):
-    from arch_signatures import UNIQUE_DEVS_BY_ARCH
-if os.path.exists(os.path.join(GEN_FILE_DIR, "sloc_cnt.py")):
-    from sloc_cnt import DRIVER_NAME_TO_SLOC
 
 ########################################################################################################################
 # GLOBALS
@@ -89,9 +85,20 @@ JSON_PRI_CMP_CNT = 'primary_cmp_str_cnt'
 JSON_PRI_CMP_STR = 'primary_cmp_strs'
 JSON_MIO_CNT = 'mmio_node_cnt'
 JSON_LNE_CNT = 'line_cnt'
+JSON_MEM_ADDR = 'mem_map_addrs' # Packed, see pack_u64s()
+JSON_MEM_SIZE = 'mem_map_sizes' # Packed, see pack_u64s()
+JSON_MEM_NODE = 'mem_map_nodes'
+
+# Patch spec keys (see df.load_patch_spec)
+PATCH_DISABLE = 'disable'
+PATCH_REPLACE_DEV = 'replace_dev'
+PATCH_SET_PROPERTY = 'set_property'
+PATCH_ADD_VIRT_MMIO = 'add_virt_mmio_node'
+PATCH_KEYS = [PATCH_DISABLE, PATCH_REPLACE_DEV, PATCH_SET_PROPERTY, PATCH_ADD_VIRT_MMIO]
 
 # Named tuples
 Dev_mem_map = namedtuple('Dev_mem_map', 'addr size')
+Node_mem_map = namedtuple('Node_mem_map', 'addr size node_name')
 Dev_prop_vals = namedtuple('Dev_prop_vals', 'node val')
 Containing_full_path_tuple = namedtuple('Containing_full_path_tuple', 'containing_path full_path')
 
@@ -118,6 +125,535 @@ else:
         "ppc" : str(Path.home().joinpath("Downloads", "qemu-5.2.0","build", "ppc-softmmu", "qemu-system-ppc"))
     }
 
+# Generated data file format (see GenFile)
+GEN_FILE_FMT = "d00dfeed_gen"
+GEN_FILE_VER = 1
+GEN_FILE_EXT = ".jsonl"
+
+########################################################################################################################
+# GENERATED FILES
+########################################################################################################################
+
+class GenFile(Mapping):
+
+    '''
+    Read-only dict view of a generated data file.
+    Format is JSON lines: a header object (format, version, var, key_type, ...) then one [key, value] list per line.
+    The file is memory-mapped and only the header is parsed on open, entries and lookup indexes are built on first use.
+    Legacy generated Python modules (*.py) are also accepted, for backwards compatibility.
+    '''
+
+    def __init__(self, file_path, var_name):
+
+        self.file_path = file_path
+        self.var_name = var_name
+        self._mm = None
+        self._dict = None
+        self._member_idx = None
+
+        if file_path.endswith(".py"):
+            self.hdr = {"format": GEN_FILE_FMT, "version": 0, "var": var_name, "key_type": None}
+            return
+
+        with open(file_path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.hdr = json.loads(self._mm.readline())
+
+        if (self.hdr.get("format") != GEN_FILE_FMT) or (self.hdr.get("version") != GEN_FILE_VER):
+            raise ValueError("Unsupported generated file \'{}\' (format: {}, version: {})".format(
+                file_path, self.hdr.get("format"), self.hdr.get("version")))
+        if (self.hdr.get("var") != var_name):
+            raise ValueError("Generated file \'{}\' holds \'{}\', not \'{}\'".format(
+                file_path, self.hdr.get("var"), var_name))
+
+    def _load(self):
+
+        '''
+        Parse all entries, once
+        '''
+
+        if self._dict is not None:
+            return self._dict
+
+        if self._mm is None:
+            import importlib.util
+            spec = importlib.util.spec_from_file_location(self.var_name, self.file_path)
+            legacy_mod = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(legacy_mod)
+            self._dict = getattr(legacy_mod, self.var_name)
+        else:
+            tuple_keys = (self.hdr["key_type"] == "tuple")
+            self._dict = {}
+            for line in iter(self._mm.readline, b""):
+                key, val = json.loads(line)
+                self._dict[tuple(key) if tuple_keys else key] = val
+            self._mm.close()
+
+        return self._dict
+
+    def __getitem__(self, key):
+        return self._load()[key]
+
+    def __iter__(self):
+        return iter(self._load())
+
+    def __len__(self):
+        return len(self._load())
+
+    def get_keys_by_member(self, member):
+
+        '''
+        For tuple-keyed files, get all keys containing member (in file order).
+        Ex. all driver compatible string tuples that include "arm,pl011"
+        '''
+
+        if self._member_idx is None:
+            self._member_idx = {}
+            for key in self._load():
+                for key_member in dict.fromkeys(key):
+                    if key_member not in self._member_idx:
+                        self._member_idx[key_member] = [key]
+                    else:
+                        self._member_idx[key_member].append(key)
+
+        return self._member_idx.get(member, [])
+
+def load_gen_file(file_name, var_name):
+
+    '''
+    Open a generated file by base name (ex. "sloc_cnt"), preferring the JSON lines format over a legacy Python module.
+    Returns None if neither exists.
+    '''
+
+    for file_ext in [GEN_FILE_EXT, ".py"]:
+        file_path = os.path.join(GEN_FILE_DIR, file_name + file_ext)
+        if os.path.exists(file_path):
+            return GenFile(file_path, var_name)
+
+    return None
+
+# Accessors, nothing is read until first use (and then only once per process)
+
+@lru_cache(maxsize=None)
+def get_unique_devs_by_arch():
+
+    '''
+    Compatible strings unique to each architecture, None if signature file not generated
+    '''
+
+    return load_gen_file("arch_signatures", "UNIQUE_DEVS_BY_ARCH")
+
+@lru_cache(maxsize=None)
+def get_arch_sig_idx():
+
+    '''
+    Inverted index of the generated signature file, None if not generated. See build_arch_sig_idx().
+    '''
+
+    unique_devs_by_arch = get_unique_devs_by_arch()
+    if unique_devs_by_arch is None:
+        return None
+
+    return build_arch_sig_idx(unique_devs_by_arch)
+
+def build_arch_sig_idx(unique_devs_by_arch):
+
+    '''
+    Invert architecture signatures: {cmp_str: ((arch_rank, arch), ...)}.
+    Rank is the arch's position in unique_devs_by_arch, for deterministic tie breaks.
+    '''
+
+    arch_sig_idx = {}
+    for arch_rank, (arch, cmp_strs) in enumerate(unique_devs_by_arch.items()):
+        for cmp_str in cmp_strs:
+            if cmp_str not in arch_sig_idx:
+                arch_sig_idx[cmp_str] = ((arch_rank, arch),)
+            elif (arch_rank, arch) not in arch_sig_idx[cmp_str]:
+                arch_sig_idx[cmp_str] += ((arch_rank, arch),)
+
+    return arch_sig_idx
+
+@lru_cache(maxsize=None)
+def get_driver_name_to_sloc():
+
+    '''
+    Driver SLOC by driver compatible strings, None if SLOC file not generated
+    '''
+
+    return load_gen_file("sloc_cnt", "DRIVER_NAME_TO_SLOC")
+
+@lru_cache(maxsize=None)
+def get_driver_name_to_type():
+
+    '''
+    Driver type by driver compatible strings, None if type file not generated
+    '''
+
+    return load_gen_file("driver_types", "DRIVER_NAME_TO_TYPE")
+
+@lru_cache(maxsize=None)
+def get_arch_classifier():
+
+    '''
+    Trained architecture classifier, None if classifier file not generated
+    '''
+
+    gen_file = load_gen_file("arch_classifier", "ARCH_FEATURE_CNTS")
+    if gen_file is None:
+        return None
+
+    return ArchClassifier(gen_file.hdr["archs"], gen_file.hdr["arch_dtb_cnts"], gen_file)
+
+########################################################################################################################
+# ARCHITECTURE CLASSIFIER
+########################################################################################################################
+
+CMP_STR_TOKEN_RE = re.compile(r"[-_.,/+ ]+")
+
+def get_cmp_str_features(cmp_str):
+
+    '''
+    Classifier features for a compatible string: the full string, its vendor prefix, and its name tokens.
+    Ex. "fsl,imx8mq-fec" -> ["c:fsl,imx8mq-fec", "v:fsl", "t:imx8mq", "t:fec"]
+    '''
+
+    features = ["c:" + cmp_str]
+
+    if "," in cmp_str:
+        vendor, name = cmp_str.split(",", 1)
+        features.append("v:" + vendor)
+    else:
+        name = cmp_str
+
+    features.extend("t:" + token for token in CMP_STR_TOKEN_RE.split(name.lower()) if token)
+    return features
+
+def get_dtb_features(cmp_strs):
+
+    '''
+    Set of classifier features for all of a DTB's compatible strings
+    '''
+
+    features = set()
+    for cmp_str in cmp_strs:
+        features.update(get_cmp_str_features(cmp_str))
+
+    return features
+
+class ArchClassifier:
+
+    '''
+    Multinomial naive Bayes over compatible string features (see get_dtb_features), Laplace smoothed.
+    Trained from per-arch counts of DTBs containing each feature (see ./analyses/gen_arch_classifier_file.py).
+    Unlike signatures, strings shared between archs still contribute, weighted by how often each arch uses them.
+    '''
+
+    def __init__(self, archs, arch_dtb_cnts, feature_cnts):
+
+        '''
+        archs: list of arch names
+        arch_dtb_cnts: training DTB count per arch (same order as archs)
+        feature_cnts: {feature: [count per arch]}, dict or GenFile (parsed on first classify())
+        '''
+
+        self.archs = archs
+        self.arch_dtb_cnts = arch_dtb_cnts
+        self.feature_cnts = feature_cnts
+        self._log_priors = None
+        self._log_denoms = None
+        self._log_probs = {}
+
+    def _init_model(self):
+
+        '''
+        Per-arch priors and smoothing denominators, needs a pass over all features
+        '''
+
+        total_dtbs = sum(self.arch_dtb_cnts)
+        self._log_priors = [math.log(cnt / total_dtbs) if cnt else -math.inf for cnt in self.arch_dtb_cnts]
+
+        feature_totals = [0] * len(self.archs)
+        for cnts in self.feature_cnts.values():
+            for idx, cnt in enumerate(cnts):
+                feature_totals[idx] += cnt
+
+        vocab_size = len(self.feature_cnts)
+        self._log_denoms = [math.log(total + vocab_size) for total in feature_totals]
+
+    def _get_log_probs(self, feature):
+
+        '''
+        Smoothed per-arch log likelihood of a feature, memoized. None for features not seen in training.
+        '''
+
+        if feature in self._log_probs:
+            return self._log_probs[feature]
+
+        cnts = self.feature_cnts.get(feature)
+        if cnts is None:
+            log_probs = None
+        else:
+            log_probs = [(math.log(cnt + 1) - denom) for cnt, denom in zip(cnts, self._log_denoms)]
+
+        self._log_probs[feature] = log_probs
+        return log_probs
+
+    def classify(self, cmp_strs):
+
+        '''
+        Returns (arch, confidence), confidence is the winner's posterior probability.
+        (None, 0.0) if none of the DTB's features were seen in training.
+        '''
+
+        if self._log_priors is None:
+            self._init_model()
+
+        scores = list(self._log_priors)
+        seen = False
+        for feature in get_dtb_features(cmp_strs):
+            log_probs = self._get_log_probs(feature)
+            if log_probs:
+                seen = True
+                for idx, log_prob in enumerate(log_probs):
+                    scores[idx] += log_prob
+
+        if not seen:
+            return None, 0.0
+
+        best_idx = max(range(len(scores)), key=lambda idx: scores[idx])
+        norm = sum(math.exp(score - scores[best_idx]) for score in scores)
+        return self.archs[best_idx], (1.0 / norm)
+
+########################################################################################################################
+# MEMORY MAP
+########################################################################################################################
+
+class MemoryMap:
+
+    '''
+    Physical memory map (see Dtb.get_phys_mem_map) indexed for point, range, overlap and free gap queries.
+    Regions are half-open [addr, addr + size), sorted by address. The sorted array is an implicit balanced tree
+    (root at the middle of each slice), each subtree augmented with its max end address, so range queries are
+    O(log n + matches). Free gaps are searched over a merged copy of the occupied ranges, O(log n + gaps scanned).
+    '''
+
+    def __init__(self, mem_maps, addr_limit=(1 << 64)):
+
+        '''
+        mem_maps: iterable of (addr, size, node_name)
+        addr_limit: end of the address space, bounds free gap search (ex. 1 << 32 for 1 address cell)
+        '''
+
+        self.regions = sorted((Node_mem_map(*mem_map) for mem_map in mem_maps), key=lambda m: (m.addr, m.size))
+        self.addr_limit = addr_limit
+
+        self._starts = [region.addr for region in self.regions]
+        self._ends = [(region.addr + region.size) for region in self.regions]
+        self._max_ends = list(self._ends)
+        self._build(0, len(self.regions))
+
+        # Disjoint occupied ranges, adjacent/overlapping regions merged
+        self._merged_starts = []
+        self._merged_ends = []
+        for start, end in zip(self._starts, self._ends):
+            if (start == end):
+                continue
+            if self._merged_ends and (start <= self._merged_ends[-1]):
+                self._merged_ends[-1] = max(self._merged_ends[-1], end)
+            else:
+                self._merged_starts.append(start)
+                self._merged_ends.append(end)
+
+    def __len__(self):
+        return len(self.regions)
+
+    def __iter__(self):
+        return iter(self.regions)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # MEMORY MAP - Internal functions
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def _build(self, lo, hi):
+
+        '''
+        Store the max end address of the subtree over regions[lo:hi] at its root (middle) index, return it
+        '''
+
+        if (lo >= hi):
+            return 0
+
+        mid = ((lo + hi) // 2)
+        self._max_ends[mid] = max(self._ends[mid], self._build(lo, mid), self._build((mid + 1), hi))
+        return self._max_ends[mid]
+
+    def _search(self, lo, hi, q_start, q_end, matches):
+
+        '''
+        Append indexes of non-empty regions[lo:hi] overlapping [q_start, q_end) to matches, in address order
+        '''
+
+        if (lo >= hi):
+            return
+
+        mid = ((lo + hi) // 2)
+        if (self._max_ends[mid] <= q_start):
+            return # Nothing in this subtree ends after the query starts
+
+        self._search(lo, mid, q_start, q_end, matches)
+        if (self._starts[mid] < q_end):
+            if (self._ends[mid] > max(q_start, self._starts[mid])): # Overlaps and isn't empty
+                matches.append(mid)
+            self._search((mid + 1), hi, q_start, q_end, matches)
+
+    def _search_idxs(self, addr, size):
+        matches = []
+        if (size > 0):
+            self._search(0, len(self.regions), addr, (addr + size), matches)
+        return matches
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # MEMORY MAP - Queries
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def find(self, addr):
+
+        '''
+        Regions containing an address ("which device owns address X"), usually zero or one
+        '''
+
+        return self.find_range(addr, 1)
+
+    def find_range(self, addr, size):
+
+        '''
+        Regions overlapping [addr, addr + size)
+        '''
+
+        return [self.regions[idx] for idx in self._search_idxs(addr, size)]
+
+    def get_overlaps(self):
+
+        '''
+        Pairs of regions that overlap each other, each pair reported once: [(region_a, region_b), ...]
+        '''
+
+        overlaps = []
+        for idx, region in enumerate(self.regions):
+            for other_idx in self._search_idxs(region.addr, region.size):
+                if (other_idx > idx):
+                    overlaps.append((region, self.regions[other_idx]))
+
+        return overlaps
+
+    def get_gaps(self, lo=0, hi=None):
+
+        '''
+        Unmapped ranges within [lo, hi), as [(start, end), ...]. hi defaults to the end of the address space.
+        '''
+
+        if hi is None:
+            hi = self.addr_limit
+
+        gaps = []
+        gap_start = lo
+        for idx in range(bisect_right(self._merged_ends, lo), len(self._merged_starts)):
+            if (self._merged_starts[idx] >= hi):
+                break
+            if (self._merged_starts[idx] > gap_start):
+                gaps.append((gap_start, self._merged_starts[idx]))
+            gap_start = max(gap_start, self._merged_ends[idx])
+
+        if (gap_start < hi):
+            gaps.append((gap_start, hi))
+
+        return gaps
+
+    def find_free(self, size, align=0x1000, lo=0, hi=None):
+
+        '''
+        Lowest aligned base address for an unmapped [base, base + size) within [lo, hi) (ex. to place a virtio-mmio node).
+        Returns None if no gap fits.
+        '''
+
+        if hi is None:
+            hi = self.addr_limit
+
+        gap_start = lo
+        for idx in range(bisect_right(self._merged_ends, lo), (len(self._merged_starts) + 1)):
+            gap_end = self._merged_starts[idx] if (idx < len(self._merged_starts)) else hi
+            base = -(-gap_start // align) * align # Round up
+            if ((base + size) <= min(gap_end, hi)):
+                return base
+            if (gap_end >= hi):
+                break
+            gap_start = max(gap_start, self._merged_ends[idx])
+
+        return None
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # MEMORY MAP - JSON
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def to_json(self):
+
+        '''
+        Serialize to a JSON string, regions as [addr, size, node_name] lists
+        '''
+
+        return json.dumps({"addr_limit": self.addr_limit, "regions": [list(region) for region in self.regions]})
+
+    @classmethod
+    def from_json(cls, json_str):
+
+        '''
+        Load a map exported by to_json() (no DTB parsing, for bulk queries over many DTBs)
+        '''
+
+        data = json.loads(json_str)
+        return cls(data["regions"], addr_limit=data["addr_limit"])
+
+def pack_u64s(vals):
+
+    '''
+    Pack ints as little-endian uint64s, base64 encoded for JSON (8 bytes per value vs. ~13 chars as decimal text)
+    '''
+
+    return base64.b64encode(struct.pack("<{}Q".format(len(vals)), *vals)).decode("ascii")
+
+def unpack_u64s(packed_str):
+
+    '''
+    Inverse of pack_u64s()
+    '''
+
+    raw = base64.b64decode(packed_str)
+    return list(struct.unpack("<{}Q".format(len(raw) // 8), raw))
+
+def get_mem_map_stats(mem_maps):
+
+    '''
+    Stats JSON entries for a physical memory map (see Dtb.get_phys_mem_map), regions not representable as uint64 are dropped
+    '''
+
+    mem_maps = [m for m in mem_maps if ((m.addr + m.size) <= (1 << 64))]
+    return {
+        JSON_MEM_ADDR: pack_u64s([m.addr for m in mem_maps]),
+        JSON_MEM_SIZE: pack_u64s([m.size for m in mem_maps]),
+        JSON_MEM_NODE: [m.node_name for m in mem_maps],
+    }
+
+def get_mem_map_from_stats(stats):
+
+    '''
+    MemoryMap from a stats JSON dict written with "df_analyze.py --mem-maps", None if it has no map (no DTB parsing)
+    '''
+
+    if JSON_MEM_ADDR not in stats:
+        return None
+
+    return MemoryMap(zip(unpack_u64s(stats[JSON_MEM_ADDR]), unpack_u64s(stats[JSON_MEM_SIZE]), stats[JSON_MEM_NODE]))
+
 ########################################################################################################################
 # PERIPHERAL STATISTICS
 ########################################################################################################################
@@ -261,28 +797,63 @@ def get_int(dtb_obj):
 
     return list(ic_strs)
 
-def get_arch(dtb_obj, linux_kernel_path=None):
+def get_arch_from_cmp_strs(cmp_strs, arch_sig_idx=None):
 
     '''
-    Use DTB contents to infer architecture, or Linux kernel path if available
+    Infer architecture from compatible strings using the generated signature file (or a given build_arch_sig_idx()).
+    Each string found in an architecture's signature is a vote, most votes wins (ties go to signature file order).
+    Returns (arch, confidence), where confidence is the winner's share of all votes. (None, 0.0) if no votes.
+    '''
+
+    if arch_sig_idx is None:
+        arch_sig_idx = get_arch_sig_idx()
+        if arch_sig_idx is None:
+            return None, 0.0
+
+    votes = Counter()
+    for cmp_str in set(cmp_strs):
+        for ranked_arch in arch_sig_idx.get(cmp_str, ()):
+            votes[ranked_arch] += 1
+
+    if not votes:
+        return None, 0.0
+
+    # Counter.most_common() keeps first-seen order for ties, which isn't signature file order
+    arch_rank, arch = min(votes, key=lambda ra: (-votes[ra], ra[0]))
+    return arch, (votes[(arch_rank, arch)] / sum(votes.values()))
+
+def get_arch_and_confidence(dtb_obj, linux_kernel_path=None):
+
+    '''
+    Use DTB contents to infer architecture, or Linux kernel path if available.
+    Returns (arch, confidence), see get_arch_from_cmp_strs() and ArchClassifier.classify().
+    Confidence is 1.0 for a Linux kernel path.
     '''
 
     # Linux kernel path provided, grab arch from there
     if linux_kernel_path:
         dir_arr = linux_kernel_path.split(os.sep)
         if "arch" in dir_arr:
-            return dir_arr[dir_arr.index("arch") + 1]
+            return dir_arr[dir_arr.index("arch") + 1], 1.0
         else:
-            return None
+            return None, 0.0
 
-    # Infer arch based on generated signature file
+    # Infer arch based on generated signature file, fallback to classifier if no signature strings are present
     dtb_cmp_strs = get_cmp_strs(dtb_obj)
-    for arch in UNIQUE_DEVS_BY_ARCH:
-        intersecting_devs = set(dtb_cmp_strs).intersection(set(UNIQUE_DEVS_BY_ARCH[arch]))
-        if len(intersecting_devs):
-            return arch
+    arch, confidence = get_arch_from_cmp_strs(dtb_cmp_strs)
+    if (arch is None) and (get_arch_classifier() is not None):
+        arch, confidence = get_arch_classifier().classify(dtb_cmp_strs)
 
-    return None
+    return arch, confidence
+
+def get_arch(dtb_obj, linux_kernel_path=None):
+
+    '''
+    Use DTB contents to infer architecture, or Linux kernel path if available
+    '''
+
+    arch, _ = get_arch_and_confidence(dtb_obj, linux_kernel_path)
+    return arch
 
 ########################################################################################################################
 # QEMU HELPER FUNCS
@@ -417,12 +988,73 @@ def file_exists(parser, fp):
     else:
         return fp
 
+def write_file_atomic(file_path, data):
+
+    '''
+    Write bytes, str, or a list of byte chunks (one writev call) so readers see either the old file or the complete new
+    one (temp file in same dir, then rename)
+    '''
+
+    import tempfile
+
+    fd, tmp_path = tempfile.mkstemp(dir=(os.path.dirname(os.path.abspath(file_path))), prefix=".tmp-")
+    try:
+        if isinstance(data, list):
+            try:
+                writev_all(fd, data)
+            finally:
+                os.close(fd)
+        else:
+            with os.fdopen(fd, ("wb" if isinstance(data, bytes) else "w")) as f:
+                f.write(data)
+        os.chmod(tmp_path, get_new_file_mode(file_path)) # mkstemp() creates 0600
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def get_new_file_mode(file_path):
+
+    '''
+    Permission bits for (re)writing file_path: the existing file's, else what open() would create under the umask
+    '''
+
+    try:
+        return (os.stat(file_path).st_mode & 0o7777)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return (0o666 & ~umask)
+
+def writev_all(fd, chunks):
+
+    '''
+    Write byte chunks with as few os.writev() calls as possible (one, unless over IOV_MAX chunks or a short write)
+    '''
+
+    try:
+        iov_max = os.sysconf("SC_IOV_MAX")
+    except (ValueError, OSError):
+        iov_max = 1024
+
+    chunks = [memoryview(chunk) for chunk in chunks if len(chunk)]
+    idx = 0
+    while (idx < len(chunks)):
+        written = os.writev(fd, chunks[idx:(idx + iov_max)])
+        while (idx < len(chunks)) and (written >= len(chunks[idx])):
+            written -= len(chunks[idx])
+            idx += 1
+        if written:
+            chunks[idx] = chunks[idx][written:]
+
 def get_fuzzy_match(needle, haystack_list, threshold = 90, verbose = False):
 
     '''
     Use fuzzy string matching to find close needle in haystack_list
     '''
 
+    from fuzzywuzzy import process as fzy_proc # Slow import, only needed here
+
     name_score_tuple = fzy_proc.extractOne(needle, haystack_list, score_cutoff=threshold)
     if name_score_tuple:
         if verbose:
@@ -461,16 +1093,13 @@ def cmp_str_to_sloc(cmp_str):
     '''
 
     # Check that we have SLOC data available
-    try:
-        DRIVER_NAME_TO_SLOC
-    except:
+    driver_name_to_sloc = get_driver_name_to_sloc()
+    if driver_name_to_sloc is None:
         return None
 
     # Search for the compatible string, average multiple entries
-    sloc_cnts_for_cmp_str = []
-    for cmp_str_list, sloc_cnt in DRIVER_NAME_TO_SLOC.items():
-        if cmp_str in cmp_str_list:
-            sloc_cnts_for_cmp_str.append(sloc_cnt)
+    sloc_cnts_for_cmp_str = [driver_name_to_sloc[cmp_str_list]
+        for cmp_str_list in driver_name_to_sloc.get_keys_by_member(cmp_str)]
 
     if sloc_cnts_for_cmp_str:
         return stats.mean(sloc_cnts_for_cmp_str)
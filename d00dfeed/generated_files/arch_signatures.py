@@ -1,2606 +0,0 @@
-#! /usr/bin/python3
-
-########################################################################################################################
-# THIS FILE WAS AUTO GENERATED BY ./analyses/gen_arch_sigs_file.py
-########################################################################################################################
-
-
-UNIQUE_DEVS_BY_ARCH = {
-	
-	'arm64' : [
-
-		'qcom,sc7180-smmu-v2','fsl,imx8mq-fec','fsl,ls2080a-esdhc','fsl,lx2160a-ftm-alarm','brcm,ns2',
-		'renesas,m3ulcb','hisilicon,hi3798cv200-combphy','fsl,ls1046a-msi','allwinner,sun50i-a64-ths','qcom,sm8150-smmu-500',
-		'brcm,ns2-pinmux','renesas,r8a774b1-csi2','renesas,r8a7795','socionext,uniphier-ld20-global','mediatek,mt8173-rt5650',
-		'rockchip,rk3328-usb2phy-grf','amlogic,meson-gx-aoclkc','rockchip,rk3368-i2s','renesas,r8a7795-rst','mediatek,mt8173-mdp-rdma',
-		'amlogic,meson-gxbb-saradc','qcom,msm8998','nvidia,tegra132-car','fsl,lx2160a-pcie','maxim,max77843-regulator',
-		'allwinner,sun50i-h6-musb','nvidia,tegra186-vic','usbcf3,e300','nvidia,p2894-0050-a08','renesas,rcar-gen3-sata',
-		'google,smaug-rev8','amlogic,meson-g12a-dw-hdmi','variscite,var-som-mx8mm-symphony','qcom,msm8998-dwc3','mediatek,mt6779-vdecsys',
-		'fsl,imx8mp-src','renesas,rcar_sound-r8a77990','renesas,vin-r8a774a1','socionext,uniphier-ld20-pinctrl','x-powers,axp803-adc',
-		'renesas,intc-ex-r8a7795','hisilicon,hi3670-media1-crg','amlogic,meson-gxl-usb-ctrl','samsung,exynos7-pinctrl','mediatek,mt2712-pwm',
-		'qcom,pmi8994','toradex,colibri-imx8x-eval-v3','fsl,imx8mp-uart','qcom,msm8998-mss-pil','renesas,thermal-r8a77990',
-		'brcm,sr-mhb','qcom,pm8150-gpio','renesas,usb2-phy-r8a77995','renesas,tmu-r8a77970','rockchip,px30-power-controller',
-		'renesas,r8a77980-pcie-phy','mediatek,mt8173-mmsys','mediatek,mt7622-ecc','renesas,r8a77980-thermal','sprd,sc9863a-dpll',
-		'renesas,intc-ex-r8a77965','rockchip,px30-pmu-io-voltage-domain','qcom,scm-msm8994','allwinner,sun50i-a64-de2','qcom,sdm845-aggre2-noc',
-		'renesas,rcar-gen3-usb3-phy','x-powers,axp803-usb-power-supply','zte,zx296718-lsp0crm','renesas,usb2-phy-r8a77965','renesas,r8a77995-cmm',
-		'kontron,sl28','arm,ccn-504','GXL-LIBRETECH-S9XX-PC','google,elm-rev7','apm,xgene1-msi',
-		'mediatek,mt8516-sysirq','khadas,vim2','renesas,sata-r8a774e1','google,scarlet-rev10-sku6','google,kevin-rev10',
-		'qcom,msm8916-tsens','nvidia,tegra234-bpmp','renesas,i2c-r8a77980','renesas,r8a774e1','nvidia,tegra194-p2u',
-		'samsung,exynos5433-spi','qcom,msm8998-pinctrl','mediatek,mt6577-uart-dma','mediatek,mt7622-mmc','brcm,mdio-mux-iproc',
-		'jedec,ufs-2.0','nvidia,tegra210-uart','qcom,msm8916-a53pll','socionext,uniphier-ld20-reset','google,cheza-rev1',
-		'qcom,pm8916-mpp','rockchip,rk3399-mali','G12A-X96-MAX','boe,nv133fhm-n61','fsl,imx8mm-ddrc',
-		'google,bob-rev12','fsl,ls1088a-esdhc','radxa,rockpi4','qcom,qcs404-cdsp-pas','renesas,i2c-r8a774c0',
-		'engicam,px30-core-ctouch2-of10','amlogic,s905w','qcom,pcie-ipq8074','renesas,sdhi-r8a774c0','qcom,sc7180-npu-noc',
-		'arm,vexpress,v2p-p1','rockchip,rk3399-rga','google,lazor-sku0','mediatek,mt8173-smi-larb','mediatek,mt7622-hsdma',
-		'fsl,ls1012a-frdm','nvidia,tegra132','ti,pcm3168a','nvidia,tegra194-misc','rockchip,rk3328-dw-hdmi',
-		'rockchip,rk3399','allwinner,sun50i-h6-r-intc','google,cros-ec-rpmsg','ti,am654','fsl,imx8mn-ccm',
-		'renesas,r8a77970-cmt1','renesas,tmu-r8a774b1','renesas,imr-lx4','iei,wt61p803-puzzle','amlogic,meson-gx-mmc',
-		'brcm,ns2-xmc','qcom,sbc','fsl,lx2160a-rdb','renesas,etheravb-r8a774a1','qcom,apr-v2',
-		'fsl,ls1046a-scfg','mediatek,mt6358','lenovo,yoga-c630','wlf,wm5110','renesas,pcie-r8a7796',
-		'qcom,sdm845-cdsp-pas','xiaomi,libra','fsl,ls1028a-plldig','qcom,ipq8074','mediatek,mt8516-pwm',
-		'mediatek,mt6797-infracfg','qcom,kryo485','qcom,pcie-sdm845','sprd,sc2731-eic','renesas,r8a7795-lvds',
-		'renesas,r8a77961-hdmi','apm,xgene2-xgenet','google,scarlet-rev4-sku7','cavium,thunder','fsl,imx8mq-usb-phy',
-		'mediatek,mt8183-disp-dither','apm,xgene-ahci','renesas,gpio-r8a77970','qcom,sdm845-apss-shared','cznic,moxtet',
-		'amlogic,meson-gxm-mali','vctrl-regulator','elida,kd35t133','renesas,vin-r8a774b1','marvell,ap806-cpu-clock',
-		'apm,xgene-edac-pmd','ti,am654-evm','fsl,ls1088a-rdb','renesas,scif-r8a774e1','renesas,r8a77965-usb3-peri',
-		'hugsun,x99','google,scarlet-rev9-sku7','renesas,hscif-r8a77990','sprd,sc9860-cam-gate','qcom,apss-wdt-sm8150',
-		'qcom,sdm845-mtp','google,scarlet-rev11-sku6','fsl,ls1043a-qspi','qcom,adreno-gmu-650.2','hardkernel,odroid-n2-plus',
-		'renesas,rcar-gen3-gpio','hisilicon,mbigen-v2','fsl,ls1088a-pcie-ep','auo,b080uan01','fsl,sec-v5.4-mon',
-		'fsl,ls1028a-rcpm','hisilicon,hi3798cv200-dw-mshc','nvidia,norrin','rockchip,rk3328-usb','qcom,sm8150-gpucc',
-		'radxa,rockpi4b','mediatek,mt6795-uart','ti,j721e-r5f','sprd,sc9863a-ap-clk','fsl,ls1028ar1-flexcan',
-		'renesas,ipmmu-r8a774b1','nvidia,tegra210-xudc','sprd,sc9860-apahb-gate','mediatek,mt8183-scp','linaro,optee-tz',
-		'allwinner,sun50i-h6-ths','allwinner,sun50i-r18','nvidia,tegra194-eqos','ti,am654-sdhci-5.1','qcom,msm8998-qmp-ufs-phy',
-		'mediatek,efuse','rockchip,rk3368-uart','toradex,colibri-imx8x','fsl,ls1028a-pcie','nvidia,p3450-0000',
-		'fsl,imx8m-ddr-pmu','qcom,wcn3990-wifi','rockchip,rk3328-cru','renesas,r8a77990-sysc','apm,xgene-gpio-sb',
-		'rockchip,r88','qcom,sc7180-llcc','nvidia,tegra210-ehci','ti,sci-intr','renesas,r8a7796-lvds',
-		'qcom,bcm-voter','allwinner,sun50i-h6-ohci','fsl,ls1043ardb-cpld','samsung,exynos5433-dwusb3','zii,imx8mq-ultra-zest',
-		'qcom,pm8998-pon','fsl,imx8mm-ddr4-evk','qcom,sdm845-osm-l3','socionext,uniphier-ld20-adamv-reset','mediatek,mt2712',
-		'qcom,sdm845-smmu-500','qcom,msm8996-venus','renesas,r8a774a1-usb3-peri','mediatek,mt8183-vencsys','amlogic,sm1-clkc',
-		'pine64,pinephone-1.1','marvell,armada-3700-xtal-clock','amlogic,meson-gxbb-gpio-intc','mediatek,mt6397-clk','renesas,r8a774b1-wdt',
-		'nvidia,tegra194-hda','google,scarlet-rev5','qcom,usb-snps-hs-7nm-phy','amlogic,meson-axg-periphs-pinctrl','fsl,imx8mn-ecspi',
-		'mediatek,mt8516-pinctrl','amlogic,meson-axg-hhi-sysctrl','qcom,msm-iommu-v1-ns','qcom,q6core','renesas,intc-ex-r8a774c0',
-		'qcom,wcd9340-gpio','fsl,imx8mm-anatop','google,scarlet-rev9-sku6','rockchip,rk3399-cdn-dp','qcom,apq8016-sbc-sndcard',
-		'libretech,aml-s805x-ac','renesas,hscif-r8a77995','amlogic,meson-gx-pwm','fsl,ls1012a-dcfg','xunlong,orangepi-zero-plus2',
-		'tronsmart,orion-r68-meta','renesas,can-r8a77995','qcom,qcs404-rpmpd','mediatek,mt7622-btif','amlogic,axg-spdifout',
-		'marvell,berlin4ct-dmp','mediatek,mt6779-apmixed','renesas,xhci-r8a774e1','mediatek,mt2712-auxadc','zte,zx296718-hdmi',
-		'socionext,uniphier-ld11-mio-clock','oceanic,5205-5inmfd','google,scarlet-rev15-sku6','mediatek,mt8173-topckgen','rockchip,rk3318',
-		'xlnx,zynqmp-zcu100-revC','mediatek,mt8183-mfgcfg','apm,xgene-pmu-mc','xingbangda,xbd599','mediatek,mt8516-efuse',
-		'socionext,uniphier-pxs3-pinctrl','amlogic,axg-tdmout','rockchip,rk3368-pmu-io-voltage-domain','mediatek,mt7622-pinctrl','google,kevin-rev6',
-		'renesas,r8a774a1-canfd','nvidia,tegra186-hda','allwinner,sun50i-h6-de3-clk','ti,am65-cpts','amlogic,meson-gxm-aoclkc',
-		'marvell,armada-3700-avs','allwinner,sun50i-h6-dma','marvell,armada8k-pcie','mediatek,mt6797-vdecsys','renesas,xhci-r8a77961',
-		'qcom,qcs404-wcss-pas','renesas,hscif-r8a774c0','samsung,exynos5433-mipi-video-phy','apm,xgene-pmu-mcb','sprd,sc9836-openphone',
-		'rockchip,rk3308-cru','qcom,sdm845-config-noc','bananapi,bpi-r64','qcom,msm8996-qmp-pcie-phy','qcom,geni-se-qup',
-		'sprd,sc2731-rtc','marvell,armada-3700-periph-clock-nb','qcom,msm8994-apcs-kpss-global','qcom,sm8250-dwc3','samsung,exynos5433-pinctrl',
-		'qcom,qcs404-evb-1000','fsl,imx8mm-src','google,scarlet-rev6-sku7','fsl,imx8mp-i2c','fsl,imx8mq-gpc',
-		'qcom,msm-iommu-v1-sec','google,scarlet-rev8-sku7','renesas,r8a774c0-lvds','renesas,usb2-phy-r8a774c0','renesas,gpio-r8a77965',
-		'renesas,du-r8a77995','fsl,ls1088a-clockgen','rockchip,rk3328-pwm','renesas,falcon-breakout','amlogic,meson-g12a-usb',
-		'marvell,ap807-clock','nvidia,tegra210-car','GXBB-ODROID-C2','fsl,imx8mq-sdma','rockchip,px30-tsadc',
-		'mediatek,mt8173-disp-pwm','socionext,uniphier-ld20-dwc3-glue','mediatek,mt8173-uart','qcom,sc7180-ipa','rockchip,px30-dw-mshc',
-		'samsung,tm2e','renesas,r8a77995-wdt','arm,mhu','renesas,scif-r8a774a1','renesas,dmac-r8a77995',
-		'hisilicon,hns-roce-v1','renesas,r8a77965','apm,xgene-edac-l3','fsl,sec-v5.4-rtic-memory','renesas,usbhs-r8a77990',
-		'sprd,sc9860-vsp-gate','amlogic,gxbb-clkc','google,lazor-sku2','globalscale,espressobin-v7','nvidia,tegra210-dmic',
-		'nvidia,tegra210-pwm','friendlyarm,nanopi-neo4','amlogic,meson-gxl-dw-hdmi','nvidia,tegra210-mc','synology,ds418j',
-		'renesas,ipmmu-r8a77995','zte,zx296718-vga','fsl,ls1046a-pcie-ep','microchip,sparx5-spi','dlg,da7219',
-		'amlogic,sm1-tohdmitx','qcom,slim-ngd-v1.5.0','renesas,r8a7795-wdt','amlogic,meson-g12a-periphs-pinctrl','mediatek,mt8183-mcucfg',
-		'GXBB-NANOPI-K2','fsl,lx2160a','melfas,mms345l','fsl,ls1028a-lpuart','amlogic,sm1-tdmout',
-		'xlnx,zynqmp-dma-1.0','fsl,imx8mn-i2c','qcom,mtp','nvidia,tegra210-timer','amlogic,g12a-audio-clkc',
-		'hisilicon,hi3670-iomcu','sst,sst25wf080','cdns,sd4hc','amlogic,meson-axg-mmc','goodix,gt917s',
-		'google,scarlet-rev14','qcom,pms405-pon','allwinner,sun50i-a64-video-engine','nvidia,tegra194-xudc','fsl,imx8mn-uart',
-		'renesas,r8a77961-usb-dmac','samsung,exynos5433-cmu-imem','ti,sci-inta','hisilicon,hi6220-usb-phy','ti,am654-navss-main-udmap',
-		'allwinner,sun50i-a64-r-intc','qcom,adreno-gmu-618.0','google,bob-rev7','google,scarlet-rev12-sku6','V2M-Juno',
-		'pine64,pinephone-1.2','qcom,sdm630-smmu-v2','xunlong,orangepi-one-plus','samsung,exynos7-clock-fsys0','samsung,exynos5433-cmu-top',
-		'qcom,apq8096','realtek,rtd1395','qcom,cpr','fsl,ls2085a-pcie','yes-optoelectronics,ytc700tlag-05-201c',
-		'asahi-kasei,ak4613','fsl,ls1028aqds-fpga','qcom,apq8016','renesas,rcar_sound-r8a774a1','fsl,ls1088a-ahci',
-		'samsung,exynos7-espresso','socionext,uniphier-pxs3-dwc3-glue','renesas,r8a774c0','amlogic,meson-gx-spicc','pine64,pine64-plus',
-		'google,bob-rev10','raydium,rm67191','xunlong,orangepi-3','amlogic,meson-gxm','renesas,pfc-r8a7795',
-		'fsl,ls2080a-ahci','qcom,msm8998-tsens','qcom,sc7180-system-noc','qcom,dsi-phy-28nm-lp','amlogic,axg-spdifin',
-		'allwinner,sun50i-h5-mali','phicomm,n1','amazon,al-alpine-v3-evp','nvidia,tegra186-bpmp-thermal','qcom,gcc-msm8996',
-		'rockchip,rk3399-grf','radxa,rockpi4a','hisilicon,hi6220-dsi','apm,xgene-pcppll-clock','bitmain,bm1880-clk',
-		'ethernet-phy-id001c.c915','qcom,sdm845-dispcc','socionext,uniphier-ld20-adamv','allwinner,sun50i-h5-pinctrl','allwinner,sun50i-a64-csi',
-		'fsl,imx8qxp-sc-rtc','azw,beelink-a1','brcm,iproc-flexrm-mbox','iei,wt61p803-puzzle-leds','rohm,br24t01',
-		'qcom,msm8996-adsp-pil','arm,scpi-sensors','cavium,thunder2','toshiba,tmpv7708-rm-mbrc','atmel,at45db041e',
-		'allwinner,sun50i-h5-system-control','mediatek,mt8183-tphy','amlogic,meson-axg-gpio-intc','intel,stratix10-svc','amlogic,axg-ge2d',
-		'hisilicon,hip07-lpc','fsl,imx8mn-ddrc','renesas,r8a77995-cpg-mssr','socionext,uniphier-ld20-sdctrl','renesas,gpio-r8a774e1',
-		'hardkernel,odroid-c4','mediatek,mt2712-jpgdecsys','altr,socfpga-s10-ecc-manager','nvidia,tegra186-xusb-padctl','zte,zx296718-iocfg',
-		'nvidia,tegra210-hda','renesas,scif-r8a774c0','mediatek,mt8183-wdt','nvidia,tegra186-i2c','qcom,pm8150l-gpio',
-		'bitmain,bm1880-sctrl','actions,s900-pinctrl','renesas,r8a774a1-usb-dmac','renesas,r8a774b1','nvidia,tegra194-adma',
-		'renesas,msiof-r8a774a1','rockchip,px30-gmac','renesas,r8a77980-cpg-mssr','brcm,spi-ns2-qspi','brcm,brahma-b53',
-		'emlid,neutis-n5','actions,s900-timer','samsung,tm2-audio','mediatek,mt8173-vcodec-dec','tronsmart,vega-s96',
-		'mediatek,mtu3','allwinner,sun50i-h5-crypto','idt,5p49v5925','fsl,imx8mq-tmu','apm,xgene-device-clock',
-		'qcom,pm6150l','mediatek,mt8183-xhci','hisilicon,hns-mdio','xunlong,orangepi-zero-plus','mediatek,mt8192-pinctrl',
-		'samsung,exynos-ppmu-v2','allwinner,sun50i-a64-lradc','samsung,exynos5433-pmu','renesas,rcar-gen3-usbhs','amlogic,axg-pcie-phy',
-		'rockchip,px30-otp','renesas,r8a7795-usb-dmac','fsl,ls1028a-scfg','marvell,armada-7k-pinctrl','renesas,pwm-r8a77961',
-		'ti,j7-rti-wdt','actions,s700-cmu','qcom,msm8998-apcs-hmss-global','hardkernel,odroid-n2','renesas,du-r8a774c0',
-		'fsl,imx8qxp-mek','qcom,sc7180-osm-l3','google,extcon-usbc-cros-ec','mediatek,mt8173-vcodec-enc','qcom,pmi8998-gpio',
-		'fsl,ls1088a-ftm-alarm','allwinner,sun50i-a64-ohci','renesas,salvator-x','qcom,q6adm-routing','amlogic,meson-axg-audio-arb',
-		'videostrong,kii-pro','qcom,msm8916-apcs-kpss-global','mediatek,mt8167-topckgen','rockchip,rk3399pro','fsl,imx8qxp-lpcg-conn',
-		'xlnx,zynqmp-8.9a','renesas,r8a774a1-cpg-mssr','marvell,armada-ap806-sdhci','libretech,all-h5-cc-h5','samsung,exynos7-clock-peric1',
-		'nvidia,tegra194-xusb','rockchip,rk3399-tsadc','brcm,vulcan-soc','hisilicon,pcie-sas-subctrl','renesas,v3hsk',
-		'amlogic,meson-gxl-aoclkc','qcom,pm8994','qcom,rpm-qcs404','qcom,glink-rpm','marvell,cn9130',
-		'fcs,fusb302','huawei,angler','amlogic,meson-a1-reset','marvell,comphy-a3700','allwinner,sun50i-a100-pinctrl',
-		'amlogic,gxm-vdec','venus-encoder','amlogic,meson-gxm-saradc','qcom,geni-i2c','GXL-LIBRETECH-S805X-AC',
-		'rockchip,rk3308-dw-mshc','qcom,msm8916-venus','maxim,max15303','marvell,armada-ap807-quad','hisilicon,hip07-d05',
-		'renesas,iic-r8a774b1','allwinner,sun50i-a100','sprd,sp9863a-1h10','rockchip,rk3368-dw-mshc','google,kevin-rev7',
-		'rockchip,rk3308-pinctrl','boe,nv140fhmn49','adi,adv7482','rockchip,rk3399-dw-mshc','sprd,sc9860-adi',
-		'marvell,sdhci-xenon','fsl,imx8qxp-lpuart','amlogic,meson-axg-ao-sysctrl','qcom,msm8994','google,lazor-rev2-sku2',
-		'allwinner,sun50i-h5-de2-clk','realtek,rtl8723cs-bt','fsl,imx8mn-usbmisc','renesas,etheravb-r8a77965','renesas,etheravb-r8a774b1',
-		'rockchip,px30-pmucru','renesas,usbhs-r8a7795','rockchip,px30-timer','fsl,imx8mn-ocotp','actions,s700-pinctrl',
-		'fsl,imx8mq-nwl-dsi','renesas,etheravb-r8a7796','renesas,r8a77980-sysc','renesas,usbhs-r8a774e1','ti,phy-am654-serdes',
-		'allwinner,sun50i-h6-operating-points','DB845c','mediatek,mt6797-wdt','shimafuji,kingfisher','marvell,armada-3700-wdt',
-		'zte,zx296718-gpio','fsl,lx2160a-clockgen','qcom,rpm-pm8998-regulators','arrow,apq8096-db820c','fsl,imx8mm-ocotp',
-		'qcom,qcs404-sdhci','renesas,r8a77965-hdmi','socionext,uniphier-pxs3-clock','amlogic,meson-gx-sm','brcm,ns2-lcpll-ports',
-		'sprd,sc9836-uart','qcom,sm8150-mc-virt','qcom,prng-ee','qcom,crypto-v5.4','renesas,vin-r8a77970',
-		'socionext,uniphier-sd4hc','mediatek,mt8516','allwinner,sun50i-h6-mmc','zte,zx296718-pcbox','renesas,r8a77995-lvds',
-		'amlogic,meson-a1-pwrc','allwinner,sun50i-h6-rtc','qcom,sm8250-hdk','qcom,sm8250-gpucc','socionext,uniphier-ld11-mio-reset',
-		'hisilicon,hi3670-hikey970','ti,am654-dwc3','samsung,exynos5433-cmu-isp','sprd,sc9860-vsp-clk','fsl,ls1012a-clockgen',
-		'engicam,px30-core','renesas,falcon-cpu','rockchip,px30-i2c','xlnx,zynqmp-power','marvell,armada-3700-nb-pm',
-		'qcom,sdm845-qmp-usb3-uni-phy','mediatek,mt8516-pwrap','qcom,pm8005-regulators','idt,5p49v5923','qcom,sm8150-aggre1-noc',
-		'xinpeng,xpp055c272','qcom,sm8150','renesas,r8a774e1-usb3-peri','marvell,cp110-clock','smartlabs,sml5442tw',
-		'renesas,r8a77961-cpg-mssr','qcom,rpm-msm8998','synology,ds418','cdns,zynqmp-gem','rockchip,rk3328-gmac',
-		'mediatek,mt8173-sysirq','dmic-codec','qcom,sm8150-compute-noc','qcom,sm8250-usb-hs-phy','fsl,imx8-mu-scu',
-		'rockchip,rk3328-codec','socionext,uniphier-ld11-aidet','innolux,p097pfg','nvidia,tegra234-hsp','google,elm',
-		'sprd,sc9860-gpio','marvell,armada-3700-usb2-host-device-misc','qcom,sc7180-gpucc','radxa,rockpi4c','libretech,all-h3-it-h5',
-		'fsl,imx8mp-tmu','renesas,r8a774b1-pcie-ep','renesas,eagle','renesas,r8a77965-cmt1','fsl,imx8mp-evk',
-		'fsl,lx2160ar1-flexcan','qcom,msm8996-qmp-usb3-phy','fsl,ls1028a-gpio','nvidia,tegra186-i2s','google,kevin-rev11',
-		'qcom,sc7180-aggre2-noc','siliconmitus,sm5502-muic','fsl,ls2088a','renesas,r8a774e1-usb3-phy','zte,zx296702-gpio',
-		'nvidia,tegra186-ahub','xlnx,zynqmp-zc1254','fsl,ls1088a','intel,stratix10-clkmgr','google,smaug-rev2',
-		'fsl,ls1043a-wdt','pine64,pine-h64-model-b','hisilicon,hi3670-pctrl','qcom,apss-wdt-sc7180','brcm,sr-lcpll0',
-		'nvidia,tegra234-vdk','amd,xgbe-seattle-v1a','friendlyarm,nanopi-r2s','amlogic,meson-axg-aobus-pinctrl','mediatek,mt8516-spi',
-		'renesas,etheravb-r8a77990','amlogic,meson-gxbb-dwmac','fsl,imx8mq-iomuxc','renesas,pcie-r8a774b1','renesas,tpu-r8a7796',
-		'mediatek,mt8173-mdp-rsz','renesas,can-r8a77990','mediatek,mt8183-pericfg','google,kevin-rev15','renesas,r8a77980-wdt',
-		'allwinner,sun50i-a64-rtc','nvidia,tegra234-sdhci','nvidia,tegra186-pmc','brcm,ns2-genpll-sw','qcom,rpm-pm8994-regulators',
-		'nvidia,tegra210-dfll','G12B-GTKING-PRO','hisilicon,hi3660-crgctrl','lg,bullhead','arm,cortex-a57-pmu',
-		'maxim,max77843','rockchip,rk3399-dw-hdmi','marvell,armada-ap806-quad','renesas,r8a77995','renesas,iic-r8a7796',
-		'arm,scpi-dvfs-clocks','mediatek,mt8183-smi-larb','qcom,pm8916-vib','renesas,rcar-gen3-cmm','fsl,ls1028a-qds',
-		'renesas,rcar_sound-r8a774b1','xlnx,zynqmp-zcu104-revA','fsl,ls2080a-dcfg','qcom,sc7180-lpasshm','fsl,lx2162a-qds',
-		'mediatek,mt8183-camsys','renesas,usbhs-r8a774c0','xlnx,zynqmp-zc1254-revA','nvidia,tegra210-emc','renesas,r8a77961-thermal',
-		'qcom,sc7180','sdw10217211000','nvidia,tegra194-display','marvell,armada-3700-xor','renesas,r8a7796-rst',
-		'qcom,pm6150-rpmh-regulators','socionext,uniphier-ld20-soc-glue-debug','mediatek,mt8183-disp-pwm','renesas,r8a77965-drif','renesas,sdhi-r8a7796',
-		'fsl,imx8mq-gpio','qcom,msm8916-mtp','ti,j721e-navss-mcu-udmap','marvell,ap806-sei','hisilicon,hip06-lpc',
-		'mediatek,mt8173-disp-rdma','nvidia,tegra186-gpio-aon','amlogic,meson-axg-usb-ctrl','qcom,geni-uart','qcom,sm8150-dwc3',
-		'intel,stratix10-soc-fpga-mgr','renesas,etheravb-r8a77961','qcom,usb-hs-phy-msm8916','sprd,sc9863a-pmu-gate','qcom,rpm-pm8916-regulators',
-		'solidrun,honeycomb','zii,imx8mq-ultra-rmb3','renesas,i2c-r8a77961','fsl,ls1046a-esdhc','mediatek,mt8192-i2c',
-		'qcom,sc7180-mc-virt','nxp,ptn5110','firefly,roc-rk3399-pc','nvidia,tegra210-i2c-vi','qcom,pm8916-gpio',
-		'geekbuying,geekbox','rockchip,px30-saradc','renesas,r8a77965-csi2','nvidia,tegra194-gpio','qcom,soundwire-v1.3.0',
-		'google,scarlet-rev5-sku6','amlogic,meson-gxbb-ir','amlogic,g12a-cpu-thermal','qcom,rpm-mp5496-regulators','qcom,sm8250-aoss-qmp',
-		'rockchip,rk3399-sapphire-excavator','qcom,qcs404-evb-4000','altr,socfpga-s10-usb-ecc','renesas,ipmmu-r8a77990','mediatek,mt6380-regulator',
-		'renesas,pcie-r8a774c0','seirobotics,sei510','inforce,ifc6640','brcm,stingray','renesas,pwm-r8a77995',
-		'marvell,armada-3700-pcie','mediatek,mt6779-imgsys','renesas,r8a77961','nvidia,tegra210-aconnect','arm,cortex-a73-pmu',
-		'solidrun,lx2160a-cex7','actions,s700','ti,am654-navss-ringacc','hisilicon,hi3660-dw-mshc','wlf,wm8524',
-		'renesas,r8a774a1-cmt1','renesas,usbhs-r8a77961','apm,xgene-storm-pcie','zii,imx8mq-ultra','rockchip,rk3399-uart',
-		'renesas,r8a77965-thermal','hisilicon,hip07-sas-v2','mxicy,mx25u6435f','xlnx,zynqmp-zcu102-rev1.0','ti,am654-r5f',
-		'nvidia,tegra132-mc','tsd,rk3399-puma-haikou','renesas,r8a77980-cmt0','hisilicon,hi3660-reset','olimex,a64-teres-i',
-		'fsl,imx8mm-ecspi','qcom,sdm660','hisilicon,hi6220-stub-clk','google,scarlet-rev11-sku7','nxp,pca9450b',
-		'fsl,imx8mq-ddrc','microchip,sparx5-sgpio-bank','fsl,imx-irqsteer','toshiba,tmpv7708','renesas,xhci-r8a774b1',
-		'khadas,vim3','mediatek,mt8173-imgsys','renesas,scif-r8a77995','xunlong,orangepi-prime','samsung,exynos7-ufs-phy',
-		'zte,zx296718-i2s','nvidia,tegra186-aconnect','mediatek,mt8173-mdp','qcom,geni-debug-uart','mediatek,mt8183-mmsys',
-		'allwinner,sun50i-h5-ccu','amlogic,meson-gxl-gpio-intc','rockchip,px30','mediatek,mt2712-scpsys','rockchip,rk3399-pmugrf',
-		'marvell,armada-cp110-sdhci','qcom,sm8150-config-noc','hisilicon,hi3798cv200-sysctrl','arm,coresight-cti-v8-arch','hisilicon,hi3660-mbox',
-		'apm,xgene-edac','qcom,sdm845-qmp-ufs-phy','amlogic,axg-tdm-iface','qcom,adreno-618.0','altr,sys-mgr-s10',
-		'google,lazor-rev2','amlogic,axg-pcie','nvidia,tegra210-vi','fsl,imx8mq-ocotp','samsung,exynos5433-pcie-phy',
-		'samsung,exynos7-dwusb3','nxp,pcf2129','nvidia,tegra186-hsp','samsung,exynos7-i2s','intel,keembay-evm',
-		'samsung,exynos7-ufs','x-powers,axp805','google,cheza','renesas,gpio-r8a77990','marvell,armada-3700-ehci',
-		'qcom,rpmcc-msm8994','brcm,sdhci-iproc','fsl,imx-sc-key','samsung,s2mps13-clk','fsl,ls1046a-clockgen',
-		'fsl,ls1028a-edma','fsl,ls2080a-rstcr','renesas,r8a7796-usb3-peri','nvidia,tegra210-rtc','amlogic,meson-axg-i2c',
-		'ti,lp8557','renesas,r8a7796-cmm','marvell,armada-8k-ahci','xlnx,nwl-pcie-2.11','renesas,r8a77990-csi2',
-		'rockchip,rk3308-core-grf','socionext,uniphier-ld11-sd-reset','xunlong,orangepi-pc2','qcom,rpmcc-qcs404','mediatek,mt6795-evb',
-		'zte,zx296718-pmm','hisilicon,hi3660-usb-phy','ti,am654-ehrpwm','amlogic,p241','arm,mali-t860',
-		'qcom,dsi-phy-10nm','brcm,ns2-pcie-phy','allwinner,sun50i-a64-r-ccu','mediatek,mt7622-bluetooth','fsl,imx8m-ddrc',
-		'arm,scpi-variable-clocks','qcom,msm8996-gic-v3','nvidia,tegra186-admaif','apm,xgene-slimpro-mbox','samsung,a3u-eur',
-		'renesas,r8a7795-cmt0','nvidia,tegra210-xusb','qcom,sm8150-ufshc','qcom,sm8150-mtp','rockchip,px30-dsi-dphy',
-		'qcom,adreno-640.1','marvell,armada-8080','rockchip,px30-usb2phy','google,smaug-rev3','google,krane',
-		'allwinner,sun50i-h6-spdif','mediatek,mt7622-thermal','nvidia,tegra186-uart','samsung,exynos5433-cmu-peris','amlogic,meson-gxbb-vpu',
-		'renesas,r8a77965-cpg-mssr','google,scarlet-rev4-sku6','nvidia,tegra194-cec','google,scarlet-rev10','methode,udpu',
-		'renesas,rcar-gen3-iic','altr,socfpga-s10-sdmmc-ecc','arm,mali-t720','semtech,sx9310','fsl,ls1043a',
-		'renesas,r8a774b1-sysc','boundary,imx8mq-nitrogen8m','samsung,exynos5433-cmu-gscl','amlogic,meson-g12a-saradc','google,scarlet-rev9',
-		'avnet,ultra96','pine64,rockpro64','renesas,rcar_sound-r8a77961','ti,am654-mailbox','arm,cortex-a35-pmu',
-		'qcom,gcc-sdm660','qcom,qca6174-bt','nvidia,tegra234-rtc','arasan,sdhci-4.9a','mediatek,mt6779-topckgen',
-		'renesas,xhci-r8a7796','google,hana-rev4','nvidia,tegra194-sor','qcom,apq8016-sbc','microsoft,cityman',
-		'qcom,sc7180-sdhci','sprd,sc9860-eic-debounce','arm,juno-scp-shmem','fsl,ls1046a-qdma','renesas,vin-r8a77995',
-		'fsl,imx8mm-usdhc','qcom,pil-reloc-info','altr,socfpga-stratix10','ovti,ov2685','rockchip,rk3368-cru',
-		'amlogic,meson-gxl-aobus-pinctrl','samsung,exynos5433','mele,v9','renesas,r8a77965-usb3-phy','rockchip,rk3328',
-		'arm,gic-v3-its','qcom,qcs404-pinctrl','mediatek,mt6755-uart','amlogic,aiu-gxbb','arasan,sdhci-5.1',
-		'rockchip,rk3328-usb2phy','realtek,rtd1293','brcm,bdc-v0.16','amlogic,meson-g12a-ao-pwm-ab','qcom,pm8150l',
-		'mediatek,mt8183-mmc','apm,xgene-edac-soc-v1','mediatek,mt2712-topckgen','sprd,sp9860g-1h10','renesas,iic-r8a77990',
-		'nvidia,tegra210-sdhci','hisilicon,hi3660-stub-clk','socionext,uniphier-pxs3-usb3-ssphy','rockchip,rk3328-spdif','socionext,uniphier-ld11',
-		'nvidia,tegra186-dspk','en25s64','samsung,exynos5433-mfc','qcom,pm8994-regulators','amlogic,meson-gxbb-efuse',
-		'renesas,r8a77990-cmt0','ebs-systart,oxalis','cypress,hyperflash','maxim,max98504','samsung,s6e88a0-ams452ef01',
-		'qcom,hfpll','qcom,pm8916-pon','google,smaug-rev5','ipmi-bt','qcom,pmi8994-regulators',
-		'renesas,i2c-r8a77965','qcom,sdm845-system-noc','rockchip,rk3399-dwc3','amlogic,meson-gx-ao-cec','qcom,sdm845-camcc',
-		'marvell,armada3710-nb-pinctrl','renesas,usb2-phy-r8a7795','renesas,vin-r8a7795','fsl,imx-sc-thermal','advantech,idk-2121wr',
-		'bitmain,sophon-edge','fsl,imx8mp-mu','qcom,sdm845-gpucc','samsung,exynos5433-cmu-fsys','mediatek,mt7622-ssusbsys',
-		'amlogic,g12a-usb2-phy','rockchip,px30-usb','socionext,uniphier-ld20-thermal','renesas,msiof-r8a77980','qcom,pm6150-gpio',
-		'qcom,sm8250-ipa-virt','marvell,berlin4ct-soc-pinctrl','amlogic,meson-a1-periphs-pinctrl','rockchip,px30-pmugrf','qcom,msm8916-rpmpd',
-		'renesas,dmac-r8a774e1','renesas,r8a779a0-rst','qcom,sm8150-system-noc','probox2,ava','amlogic,meson-g12a-aoclkc',
-		'renesas,can-r8a774b1','amlogic,axg-mipi-dphy','renesas,scif-r8a77980','amlogic,meson-axg','amlogic,meson-gxbb-scpi',
-		'renesas,pcie-r8a77990','nvidia,tegra132-xusb','qcom,q6asm-dais','maxim,max77621','nvidia,tegra186-efuse',
-		'maxim,max9611','nvidia,tegra186-pcie','hisilicon,hisi-localbus','fsl,imx8mm-usb','altr,socfpga-s10-ocram-ecc',
-		'arm,mali-bifrost','renesas,gpio-r8a774b1','actions,owl-mmc','renesas,usb2-phy-r8a774a1','renesas,sdhi-r8a774b1',
-		'mediatek,mt8173-dsi','mediatek,mt7622-rfb1','qcom,sm8150-rpmh-clk','qcom,sm8250-cpufreq-epss','inside-secure,safexcel-eip97ies',
-		'nvidia,p2571','qcom,sc7180-dc-noc','qcom,sdm845-pdc','mediatek,mt8173-disp-ufoe','renesas,r8a774e1-csi2',
-		'maxim,max98357a','rockchip,px30-mali','amlogic,meson-axg-reset','allwinner,sun50i-h6-emmc','samsung,exynos5433-slim-sss',
-		'renesas,r8a774e1-cmt0','bananapi,bpi-m4','fsl,ls1046a-rcpm','google,scarlet-rev3','socionext,uniphier-pxs3-sysctrl',
-		'renesas,scif-r8a779a0','fsl,imx8mn-wdt','allwinner,sun50i-h6-spi','mediatek,mt7531','renesas,r8a77980-rpc-if',
-		'fsl,imx8mq-lcdif','mediatek,mt8173-dpi','mediatek,mt8516-uart','mediatek,mt8183-imgsys','socionext,uniphier-ld11-soc-glue',
-		'fsl,ls1012a-dspi','nvidia,tegra186-agic','qcom,rpmcc-msm8916','renesas,r8a7796-usb-dmac','altr,stratix10-rst-mgr',
-		'mediatek,mt2712-pericfg','allwinner,sun50i-h6-mali','mediatek,mt2712-smi-common','fsl,imx8mp-iomuxc-gpr','microchip,sparx5-pcb135',
-		'nvidia,tegra210-ahub','reg-mux','rockchip,rk3328-tsadc','arm,ccn-502','brcm,ns2-amac',
-		'renesas,msiof-r8a7795','mediatek,mt8192','arm,arch-cache','mediatek,mt7622-topckgen','fsl,imx8mn-usb',
-		'renesas,pfc-r8a7796','solidrun,clearfog-cx','marvell,armada3710-sb-pinctrl','pine64,pinetab','amlogic,s805x',
-		'hisilicon,hi6220-usb','ti,am65x-dss','google,scarlet','amlogic,meson-gx-clk-measure','google,scarlet-rev5-sku7',
-		'qcom,sdm845','fsl,dpaa2-ptp','renesas,r8a774b1-lvds','cavium,thunderx2-cn9900','mediatek,mt8167',
-		'khadas,edge-v','apm,xgene-pmu-l3c','qcom,wcn3660b','qcom,sc7180-aggre1-noc','renesas,etheravb-r8a774e1',
-		'mediatek,mt7622-pwrap','amlogic,meson-sm1-ao-cec','qcom,ipq6018-cp01','apm,xgene-ahci-v2','mediatek,mt6779-pinctrl',
-		'silabs,si3226x','ti,am654-secure-proxy','google,lazor-rev1-sku0','fsl,ls1028a-rdb','qcom,gcc-ipq8074',
-		'ti,am654-cpsw-nuss','google,scarlet-rev14-sku7','rockchip,rk3328-uart','arm,smmu-v1','khadas,edge-captain',
-		'rockchip,px30-i2s','amlogic,g12a-spdifin','azw,beelink-gs1','amlogic,meson-gx-ao-pwm','renesas,can-r8a774c0',
-		'renesas,scif-r8a77965','rockchip,rk3399-emmc-phy','nvidia,tegra186-display','renesas,r8a77980-csi2','allwinner,sun50i-a64',
-		'marvell,xor-v2','renesas,du-r8a774e1','renesas,intc-ex-r8a77995','hisilicon,hi3670-media2-crg','fsl,ls1043a-gpio',
-		'nvidia,tegra186-sor','sprd,sc9863a-aon-clk','marvell,armada-8k-rtc','fsl,imx8qxp-usdhc','mdio-mux-multiplexer',
-		'nvidia,gv11b','renesas,v3msk','google,scarlet-rev13','amlogic,a311d','qcom,sc7180-ipa-virt',
-		'nvidia,tegra194-ccplex','allwinner,sun50i-a64-mali','renesas,sdhi-r8a77970','bitmain,bm1880','renesas,r8a77990-cpg-mssr',
-		'variscite,var-som-mx8mn-symphony','qcom,geni-spi','renesas,usbhs-r8a774a1','fsl,imx8mm-iomuxc','socionext,uniphier-ld20-ref',
-		'qcom,qcs404-evb','renesas,ipmmu-r8a7796','hisilicon,hi3798cv200-perictrl','renesas,pwm-r8a77990','renesas,sdhi-r8a77965',
-		'allwinner,sun50i-h6-usb-phy','qcom,sm8250-ipcc','mediatek,mt8173-pctl-a-syscfg','mediatek,mt7622-sgmiisys','apm,xgene-pcie',
-		'renesas,msiof-r8a77990','hardkernel,rk3326-odroid-go2','SM1-ODROID-C4','mediatek,mt8183-i2c','olimex,a64-olinuxino-emmc',
-		'rockchip,rk3399-cif-isp','renesas,msiof-r8a774c0','qcom,sc7180-smmu-500','allwinner,sun50i-a100-i2c','fsl,imx8mm-iomuxc-gpr',
-		'mediatek,mt8183-disp-aal','nvidia,tegra194-host1x','renesas,rcar_sound-r8a7795','allwinner,sun50i-a64-mipi-dphy','richtek,rt1711h',
-		'nvidia,tegra132-soctherm','qcom,qcs404-pcnoc','maxim,max77843-haptic','qcom,gcc-qcs404','rockchip,rk3328-vop',
-		'qcom,scm-sdm845','amlogic,meson-g12a-ao-cec','brcm,iproc-pcie-paxc','zkmagic,a95x-z2','mediatek,mt8516-mmc',
-		'allwinner,sun50i-h6-hdmi-phy','allwinner,sun50i-h6-display-engine','renesas,ipmmu-r8a77961','ti,am654-uart','nvidia,tegra210-csi',
-		'fsl,ls1043a-ftm-alarm','rockchip,rk3368-wdt','kontron,sl28cpld-wdt','domain-idle-state','hisilicon,hi3670-dw-mshc',
-		'rockchip,rk3328-vpu','apm,xgene-phy','qcom,pcie2-phy','google,cros-ec-typec','brcm,sr-genpll5',
-		'mediatek,mt8173-apmixedsys','amlogic,s400','qcom,sc7180-qmp-usb3-phy','google,scarlet-rev10-sku7','fsl,ls1088a-rcpm',
-		'amlogic,meson-axg-ee-pwm','renesas,pfc-r8a774a1','renesas,rcar-gen3-scif','samsung,exynos5433-lpass','socionext,uniphier-pxs3-usb3-hsphy',
-		'amlogic,gxl-crypto','hisilicon,hi6220-acpu-sctrl','socionext,uniphier-ld11-aio','rockchip,rk3399-spdif','x-powers,axp803-ac-power-supply',
-		'google,bob-rev6','amlogic,axg-frddr','marvell,armada-7k-xor','qcom,msm8916-camss','nvidia,tegra210',
-		'qcom,sm8150-dc-noc','mediatek,mt7622-apmixedsys','allwinner,sun50i-a64-system-control','sprd,sdhci-r11','qcom,sm8250-aggre1-noc',
-		'renesas,tmu-r8a774e1','mediatek,mt6797-imgsys','hwacom,amazetv','microchip,sparx5-pcb125','zte,zx296718-pwm',
-		'fsl,ls1012a-msi','amlogic,meson-gxm-vpu','goodix,gt1151','amlogic,meson-g12a-vpu','hisilicon,hi3670-sctrl',
-		'renesas,usbhs-r8a7796','renesas,dmac-r8a77980','qcom,msm-iommu-v1','nvidia,tegra194-pcie','marvell,armada-3700-i2c',
-		'hisilicon,dsa-subctrl','brcm,sr-usb-combo-phy','amlogic,meson-axg-saradc','qcom,sm8150-apss-shared','mediatek,mt7622-nor',
-		'mediatek,mt8173-pwrap','ti,tps65086','qcom,sc7180-apss-shared','qcom,msm8916-mss-pil','amlogic,meson-axg-ao-pwm',
-		'tronsmart,vega-s95','ti,j7200-sdhci-8bit','snps,dwmac-3.74a','renesas,tpu-r8a77980','qcom,pm8150',
-		'sprd,sc9863a-rpll','google,kevin-rev9','socionext,uniphier-ld11-peri-clock','fsl,ls2080a-rdb','mediatek,mt8173-mdp-wdma',
-		'venus-decoder','google,scarlet-rev12','google,krane-sku176','renesas,r8a774a1-sysc','amlogic,meson-gxm-dw-hdmi',
-		'kontron,imx8mm-n801x-s','renesas,r8a774a1','rockchip,rk3368-io-voltage-domain','iei,wt61p803-puzzle-hwmon','fsl,ls208xa-ftm-alarm',
-		'amlogic,sm1-pdm','marvell,armada7040','rockchip,px30-evb','einfochips,imx8mq-thor96','pine64,sopine-baseboard',
-		'mediatek,mt8183-disp-ovl-2l','rockchip,px30-mipi-dsi','rockchip,rk3308-grf','qcom,q6adm','amlogic,meson-gxbb-pwm',
-		'allwinner,sun50i-a64-tcon-lcd','mediatek,mt8183-ipu_conn','rockchip,rk3399-sdhci-5.1','marvell,armada8040','nvidia,tegra210-dsi',
-		'marvell,armada8040-mcbin-doubleshot','amlogic,meson-gxbb-dw-hdmi','nvidia,tegra210-isp','renesas,pwm-r8a774e1','mediatek,mt8183-vdecsys',
-		'apm,merlin','amlogic,g12b','cavium,thunder-pmu','marvell,berlin4ct-system-pinctrl','allwinner,sun50i-h6-crypto',
-		'inside-secure,safexcel-eip76','libretech,aml-s905x-cc-v2','renesas,vin-r8a774c0','si-linux,cat875','amlogic,meson-gxl-vpu',
-		'renesas,r8a779a0-sysc','renesas,pwm-r8a77980','renesas,r8a779a0-cpg-mssr','nvidia,tegra186-denver','renesas,r8a77970-cpg-mssr',
-		'google,scarlet-rev15','fsl,ls2080a-dspi','mediatek,mt2712-pinctrl','sprd,sc2731','azw,gtking',
-		'samsung,s6e3hf2','hisilicon,hi3670-reset','renesas,r8a774e1-canfd','renesas,tpu-r8a77970','nvidia,tegra186-dc',
-		'allwinner,sun50i-h6-tcon-tv','mediatek,mt8183-spi','samsung,exynos5433-jpeg','nvidia,tegra210-i2s','allwinner,sun50i-a64-msgbox',
-		'renesas,vin-r8a7796','sony,discovery-row','fsl,ls1043a-rcpm','sony,kirin-row','mediatek,mt8183-pwrap',
-		'mediatek,mt8183-mipi-tx','murata,ncp03wf104','samsung,s2mps13-pmic','brcm,iproc-pcie-paxc-v2','hisilicon,hi3670',
-		'qcom,pm8009-1-rpmh-regulators','nvidia,tegra194-rtc','qcom,qca9377-bt','brcm,sr-usb-hs-phy','samsung,exynos5433-cmu-cam1',
-		'zte,zx296718-vou','mediatek,mt8173-pericfg','renesas,hscif-r8a77970','google,elm-rev8','nvidia,tegra186-ahci',
-		'amlogic,aiu-gxl','ti,tps6598x','sdw10217201000','sensortek,stk3311','qcom,msm8998-ufshc',
-		'ti,am654-sa2ul','imx-hdmi-arc','gpio-mux-clock','marvell,armada-3700-ahci','fsl,ls1043a-msi',
-		'zinitix,bt541','renesas,r8a774a1-rst','allwinner,sun50i-h6-sram-c','bitmain,bm1880-pinctrl','amlogic,sm1-toddr',
-		'socionext,uniphier-pxs3-pcie-phy','samsung,exynos7-wakeup-eint','qcom,sc7180-pinctrl','wetek,play2','qcom,sc7180-pdc-global',
-		'mediatek,mt8183-evb','fsl,ls1028a-ftm-alarm','amlogic,p231','qcom,apcc-msm8996','zte,zx296702-spdif',
-		'adi,adv7533','fsl,ls2080aqds-fpga','mediatek,mt7622-nfc','nvidia,tegra186-sysram','renesas,i2c-r8a77995',
-		'qcom,pm8150b','qcom,scm-sm8150','mediatek,mt7622-wmac','allwinner,sun50i-h6-de3-mixer-0','xlnx,zynqmp-clk',
-		'allwinner,sun50i-a64-ehci','marvell,armada-3700-tbg-clock','fsl,ls1012a-qds','actions,s700-sps','renesas,thermal-r8a77970',
-		'qcom,pm8150l-rpmh-regulators','apm,xgene-rng','mediatek,mt8167-pinctrl','renesas,r8a774e1-lvds','brcm,ns2-lcpll-ddr',
-		'ti,am654-ehrpwm-tbclk','xlnx,zynqmp-ipi-mailbox','libretech,all-h3-cc-h5','mediatek,mt2712-pctl-a-syscfg','ti,j721e-navss-main-udmap',
-		'brcm,sr-genpll4','rockchip,rk3328-pinctrl','j721e-cpb','rockchip,rk3368-spi','qcom,qcs404-cpr',
-		'nvidia,tegra210-vic','nvidia,tegra210-xusb-padctl','ti,am654-mcspi','rockchip,rk3399-typec-phy','brcm,iproc-ns2-sata-phy',
-		'mediatek,mt8173-afe-pcm','seirobotics,sei610','actions,s900-cmu','allwinner,sun50i-a64-i2c','marvell,armada-3700-spi',
-		'rockchip,rk3328-hdmi-phy','mediatek,mt8183-ipu_core1','sony,voyager-row','rockchip,rk3399-pcie','realtek,rtd1296',
-		'microchip,sparx5-dpll','renesas,r8a77961-usb3-phy','renesas,pcie-r8a774e1','rockchip,rk3399-pcie-phy','renesas,i2c-r8a7796',
-		'mediatek,mt2712-mfgcfg','socionext,uniphier-pxs3-ave4','fsl,imx8mq-wdt','marvell,armada-3700-neta','nvidia,tegra210-dpaux',
-		'rockchip,rk3308-i2c','renesas,ipmmu-r8a774e1','zte,zx296718','apm,xgene-pmu-iob','GXL-KHADAS-VIM1',
-		'fsl,imx8qxp-gpio','mediatek,mt8167-apmixedsys','nvidia,tegra210-efuse','mediatek,mt2712-imgsys','zte,zx-aud96p22',
-		'marvell,cn9131','slim217,1a0','renesas,hscif-r8a77965','qcom,ipq6018-apcs-apps-global','google,lazor-rev1-sku2',
-		'amlogic,sm1-vdec','mediatek,mt8173-vpu','socionext,uniphier-pxs3-usb3-regulator','G12B-GTKING','socionext,uniphier-pxs3-ref',
-		'renesas,m3nulcb','fsl,dpaa2-console','qcom,pm8150-rpmh-regulators','qcom,sdm845-mss-pil','fsl,ls2080a-gpio',
-		'micron,m25p80','apm,potenza','mediatek,mt8173-mmc','pine64,rockpro64-v2.1','marvell,armada-ap806',
-		'zte,zx296718-irdec','fsl,imx8qxp-fec','nvidia,tegra186-misc','nvidia,tegra210-sor1','qcom,q6v5-pil',
-		'marvell,ap806-gicp','qcom,ath10k','qcom,apq8096-sbc','sprd,sc9860-aon-prediv','tronsmart,vega-s95-pro',
-		'renesas,i2c-r8a77990','GXM-KHADAS-VIM2','mediatek,mt6795-sysirq','nxp,sysctr-timer','amlogic,a113d',
-		'socionext,uniphier-ld20-usb3-regulator','amlogic,meson-gxbb-spifc','hisilicon,hi6220-sramctrl','st,n25q128a13','qcom,msm8916',
-		'fsl,ls1043a-ahci','G12A-SEI510','qcom,sm8250-gem-noc','google,smaug-rev4','radxa,rockpi-n10',
-		'ti,bq25895','nvidia,tegra186-emc','qcom,q6asm','ti,tca6408','ti,j7200-sdhci-4bit',
-		'fsl,ls2088a-pcie','mediatek,mt8173-disp-wdma','amlogic,meson-g12a-ee-pwm','amediatech,x96-max','fsl,imx8mq-mu',
-		'fsl,sec-v5.4-rtic','renesas,r8a774a1-lvds','mediatek,mt8516-infracfg','renesas,r8a77995-canfd','amlogic,t9015',
-		'mediatek,mt6797','socionext,uniphier-ld20-aio','ti,j721e-c66-dsp','nvidia,tegra210-gpio','arm,mmu-500',
-		'amlogic,g12a-tdmout','marvell,armada-3700-cpu-misc','rockchip,rk3328-saradc','qcom,pm660l','google,cheza-rev2',
-		'fsl,ls1088a-dcfg','renesas,dmac-r8a77990','renesas,hscif-r8a774b1','renesas,sdhi-r8a7795','ti,am654-pcie-rc',
-		'nvidia,tegra132-host1x','everest,es7241','renesas,iic-r8a774c0','qcom,usb-ss-28nm-phy','qcom,sm8250-mtp',
-		'renesas,r8a7795-thermal','socionext,uniphier-ld20-peri-reset','renesas,r8a774e1-cpg-mssr','qcom,rpm-pms405-regulators','usb-a-connector',
-		'renesas,r8a774a1-wdt','qcom,qcs404-apcs-apps-global','allwinner,sun50i-h5-ths','mediatek,mt2712-uart-dma','fsl,ls1043a-scfg',
-		'mediatek,mt6779-infracfg_ao','allwinner,sun50i-a64-tcon-tv','samsung,exynos5433-decon','sprd,sc9860-dma','qcom,sdm845-mdss',
-		'amlogic,g12a-pcie','amlogic,g12a-usb3-pcie-phy','fsl,imx8qxp-scu-pd','marvell,xmdio','hisilicon,hi655x-pmic',
-		'marvell,armada7040-db','amlogic,simple-framebuffer','renesas,rcar_sound-r8a774e1','samsung,exynos5433-cmu-aud','hisilicon,hip06-d03',
-		'fsl,imx8mq-dwc3','hisilicon,hi3798cv200-gmac','qcom,msm8998-smmu-v2','qcom,qrb5165-rb5','marvell,armada3710',
-		'fsl,ls1012a-rcpm','friendlyarm,nanopi-a64','arm,mmu-401','hoperun,hihope-rzg2-ex','allwinner,sun50i-h6',
-		'amlogic,sm1-audio-clkc','allwinner,sun50i-h6-tcon-top','mediatek,mt7622-pericfg','kontron,sl28cpld-fan','slim217,250',
-		'qcom,pm8994-mpp','allwinner,sun50i-a64-de2-rotate','mediatek,mt7622-wdt','fsl,imx8mm-tmu','hisilicon,hns-dsaf-v2',
-		'renesas,scif-r8a7796','amlogic,meson-g12a-gpio-intc','fsl,imx-scu','arm,coresight-cpu-debug','renesas,r8a77965-wdt',
-		'onnn,pca9654','sgmicro,sgm3140','kontron,sl28cpld-gpo','tsd,rk3368-lion-haikou','friendlyarm,nanopc-t4',
-		'qcom,msm8996-tsens','si-linux,cat874','mediatek,mt8173-auxadc','qcom,sc7180-pdc','kontron,sl28cpld-pwm',
-		'firefly,firefly-rk3399','renesas,r8a77990-rst','renesas,rcar_sound-r8a7796','nvidia,tegra194-ahub','renesas,etheravb-rcar-gen3',
-		'allwinner,sun50i-h5','firefly,roc-rk3399-pc-mezzanine','rockchip,rk3328-io-voltage-domain','hisilicon,hi3798cv200-poplar','nvidia,denver-pmu',
-		'thundercomm,db845c','amlogic,meson-gxbb-ao-pwm','mediatek,mt6779-evb','apm,xgene-storm','qcom,kryo385',
-		'einfochips,imx8qxp-ai_ml','wacom,w9013','rockchip,rk3328-i2c','maxim,max17055','mediatek,mt2712-rtc',
-		'brcm,ns2-genpll-scr','fsl,ls1012a-ahci','nvidia,tegra186-host1x','allwinner,a100-perf1','sil,sii8620',
-		'mediatek,mt8173-vencltsys','xlnx,zynqmp-gpio-1.0','renesas,r8a774e1-rst','mediatek,mt7622-eth','fsl,imx8mq-anatop',
-		'qcom,tsens-v1','socionext,uniphier-ld11-adamv','fsl,imx8mn-iomuxc-gpr','nvidia,tegra194-carmel','amlogic,meson-axg-pwrc',
-		'xlnx,zynqmp-zcu111','fsl,imx8mn-sdma','sprd,sc9863a-pll','pine64,pinebook','sprd,sc9860-eic-latch',
-		'amlogic,meson-gxbb-wdt','fsl,ls2085a-dspi','fsl,imx8mn-evk','arm,cortex-a55','allwinner,sun50i-h5-mmc',
-		'rockchip,rk3368-timer','mediatek,mt8192-timer','renesas,pfc-r8a77965','nvidia,tegra186-pwm','qcom,sm8250-epss-l3',
-		'snps,dwc-qos-ethernet-4.10','renesas,msiof-r8a774b1','samsung,exynos7-clock-top0','marvell,a3700-utmi-otg-phy','sony,mermaid-row',
-		'arm,juno','cellwise,cw2015','micron,mt25qu02g','qcom,sdm845-dc-noc','purism,librem5-devkit',
-		'qcom,qspi-v1','qcom,qcs404-pcie2-phy','renesas,r8a779a0','mediatek,mt2712-smi-larb','google,kevin-rev13',
-		'hisilicon,hi3660-hikey960','nxp,lx2160a-fspi','fsl,imx8mp-ocotp','apm,xgene-enet','qcom,msm8916-bimc',
-		'renesas,du-r8a774a1','mediatek,mt8516-topckgen','marvell,armada8040-mcbin','samsung,exynos7-clock-topc','friendlyarm,nanopi-neo2',
-		'mediatek,mt2712-pcie','mediatek,soc-rtc','zte,zx296718-dw-mshc','rockchip,rk3399-mipi-dphy-rx0','marvell,armada-ap806-thermal',
-		'qcom,sm8250-sdhci','mediatek,mt2712-xhci','sprd,sc9860-pll','fsl,ls1043-qe-siram','qcom,kryo',
-		'qcom,ipq8074-hk01','samsung,exynos5433-mic','renesas,etheravb-r8a77995','fsl,ls1046a-qds','renesas,rcar-gen3-usb3-peri',
-		'rockchip,rk3308-i2s','rockchip,rk3399-pmucru','ti,j721e-ufs','mediatek,mt2712-bdpsys','qcom,sdm845-mem-noc',
-		'renesas,du-r8a77961','renesas,usb2-phy-r8a774b1','qcom,rpm-pmi8998-regulators','numa-distance-map-v1','qcom,wcn3990-bt',
-		'qcom,msm8998-qmp-pcie-phy','brcm,sr-thermal','google,cros-ec-pwm','qcom,apss-wdt-sdm845','qcom,pmi8994-gpio',
-		'mediatek,mt7622-ethsys','mediatek,mt6797-uart','fsl,s32v234','ti,am654-usb2','variscite,var-som-mx8mn',
-		'marvell,armada-ap810','qcom,msm8998-mtp','rockchip,px30-vop-big','socionext,uniphier-ld11-usb2-phy','fsl,imx8mn',
-		'mediatek,mt6779-mfgcfg','fsl,imx8mm-uart','arm,cortex-a76-pmu','rockchip,rk3399-io-voltage-domain','renesas,intc-ex-r8a77980',
-		'hisilicon,hip06-pcie-ecam','allwinner,sun50i-a100-sid','nvidia,tegra194-pinmux','mediatek,mt6595-disp-pwm','mediatek,mt7622-audio',
-		'nvidia,tegra210-soctherm','mediatek,mt2712-ecc','marvell,armada-cp110-thermal','qcom,ipcc','sprd,sc2731-efuse',
-		'fsl,ls208xa-rcpm','fsl,ls1028a-dcfg','renesas,r8a774a1-thermal','samsung,exynos5433-tmu','qcom,qcs404-turingcc',
-		'qcom,sm8250-slpi-pas','fsl,imx8mp-usdhc','amlogic,meson-sm1-clk-measure','samsung,exynos5433-cmu-g3d','fsl,imx8qxp-scu-ocotp',
-		'hisilicon,hi3660','idt,5p49v6965','fsl,ls1012a-pcie','renesas,intc-ex-r8a77970','fsl,imx8mq-src',
-		'qcom,sm8250-pinctrl','fsl,ls2088a-qds','sprd,sc2731-vibrator','mediatek,mt8173-i2c','qcom,sm8150-osm-l3',
-		'nvidia,darcy','samsung,exynos7','ti,am654-ospi','winbond,w25q64dw','solidrun,hummingboard-pulse',
-		'nvidia,tegra194-dspk','arm,juno-sram-ns','fsl,imx8mm-ccm','renesas,r8a7795-usb3-peri','renesas,pfc-r8a774c0',
-		'renesas,r8a774c0-usb-dmac','qcom,sdm636','pine64,pine64','qcom,sm8250-system-noc','mediatek,mt6358-sound',
-		'rockchip,rk3399-i2s','nvidia,tegra194-sdhci','nvidia,tegra234-efuse','allwinner,sun50i-a64-mbus','rockchip,rk3308-uart',
-		'renesas,r8a774e1-wdt','arm,cortex-a76','qcom,sm8150-pinctrl','renesas,fcpf','mediatek,mt2712-vdecsys',
-		'renesas,draak','qcom,sc7180-dpu','fsl,imx8mp-wdt','renesas,r8a774c0-rst','google,scarlet-rev7-sku6',
-		'renesas,du-r8a77980','brcm,bcm4908','fsl,imx8mn-anatop','hisilicon,hi3798cv200-usb2-phy','amlogic,meson-gxbb-scp-shmem',
-		'qcom,sdm845-rpmh-clk','fsl,imx8qxp','sprd,sc9860-gpu-clk','fsl,ls1012a-frwy','qcom,msm8916-pinctrl',
-		'fsl,imx8mm','sprd,sc9863a-mm-clk','mediatek,mt6797-apmixedsys','ti,tas5707','renesas,r8a77965-cmm',
-		'amazon,al-alpine-v3','renesas,salvator-xs','qcom,sc7180-mss-pil','apm,xgene-csw','qcom,sc7180-camnoc-virt',
-		'qcom,sc7180-dispcc','nvidia,tegra194-i2c','fsl,ls1088aqds-fpga','fsl,ls1046a-ahci','renesas,sdhi-r8a77980',
-		'brcm,bcm6345-gpio','nvidia,gm20b','fsl,imx8qxp-sc-key','renesas,usbhs-r8a77995','ti,tca9539',
-		'nvidia,tegra194-tcu','fsl,vf610-sai-clock','fsl,imx8mq-i2c','allwinner,sun50i-h6-iommu','nvidia,tegra210-flowctrl',
-		'renesas,sata-r8a77965','qcom,qcs404','mediatek,mt2712-infracfg','fsl,imx8-ddr-pmu','allwinner,sun50i-h6-i2c',
-		'nvidia,tegra210-usb-phy','renesas,rcar-gen3-sdhi','allwinner,sun50i-h6-wdt','mediatek,mt8173-power-controller','marvell,armada-8k-pic',
-		'renesas,vin-r8a77990','qcom,sc7180-mdss','sprd,sc9860-eic-sync','renesas,ipmmu-r8a77965','allwinner,sun50i-a64-pinctrl',
-		'nvidia,tegra194-pwm','mediatek,mt8183-infracfg','socionext,uniphier-ld11-mioctrl','rockchip,rk817','nvidia,tegra186-bpmp-i2c',
-		'qcom,gcc-sm8250','apm,xgene-socpll-v2-clock','renesas,sdhi-r8a774e1','qcom,sc7180-qusb2-phy','fsl,imx8mn-easrc',
-		'amlogic,axg-pdm','amlogic,meson-gxbb-mali','samsung,exynos5433-cmu-disp','arm,sbsa-gwdt','renesas,r8a77970-rpc-if',
-		'renesas,iic-r8a774e1','socionext,uniphier-ld20-peri-clock','nvidia,tegra210-qspi','rockchip,rk3399-pmu-io-voltage-domain','google,scarlet-rev4',
-		'renesas,r8a77995-rst','marvell,armada-8k-rng','thine,thc63lvd1024','rockchip,rk3328-spi','renesas,r8a774b1-cmt1',
-		'fsl,ls1028a-ahci','qcom,sdm845-gladiator-noc','rockchip,px30-pwm','variscite,var-som-mx8mm','arm,juno-r1-pcie',
-		'sprd,sc9863a-mpll','google,scarlet-rev13-sku6','qcom,sm8250-dc-noc','qcom,sc7180-dwc3','marvell,berlin4ct-stb',
-		'marvell,armada-8k-cpm-pinctrl','fsl,imx8mp-ecspi','amlogic,axg-mipi-pcie-analog-phy','xlnx,zynqmp-firmware','fsl,imx8mn-usdhc',
-		'cznic,moxtet-gpio','qcom,ipq8074-nand','renesas,dmac-r8a774c0','nvidia,tegra186-cec','asus,novago-tp370ql',
-		'renesas,rcar_sound-gen3','ethernet-phy-id001c.c916','qcom,sdm845-tsens','rockchip,cru','fsl,lx2160a-dcfg',
-		'renesas,r8a77990-usb3-peri','hisilicon,hi3660-iomcu','friendlyarm,nanopi-m4','amlogic,axg-tdmin','renesas,rcar-gen3-hscif',
-		'sprd,sc9860-ap-clk','google,hana-rev5','fsl,imx8mp-flexcan','qcom,spmi-adc5','fsl,ls1046a-rdb',
-		'hisilicon,hi6220-hikey','renesas,pwm-r8a77965','technexion,pico-pi-imx8m','mediatek,mt2712-gmac','marvell,cp110-icu-sei',
-		'renesas,r8a774c0-wdt','google,kevin','brcm,sr-genpll2','kontron,sl28-var4','renesas,r8a7795-drif',
-		'amarula,a64-relic','fsl,lx2160a-rcpm','renesas,r8a77980','fsl,ls1088a-pcie','qcom,sdm845-qusb2-phy',
-		'renesas,r8a7795-cmt1','nvidia,tegra210-dc','qcom,ufshc','renesas,pfc-r8a774e1','arm,coresight-cti',
-		'fsl,ls2080a-pcie','nvidia,tegra186-gpio','fsl,ls1043a-qdma','fsl,ls1043a-pcie','wm5110',
-		'allwinner,sun50i-h6-msgbox','renesas,r8a774c0-cmt0','mediatek,mt6779-vencsys','samsung,exynos5433-cmu-mscl','fsl,imx8mn-tmu',
-		'maxim,max77843-muic','qcom,sm8150-usb-hs-phy','qcom,wcn3620','marvell,ap806-pinctrl','ti,j7200',
-		'socionext,uniphier-ld20-ave4','renesas,tmu-r8a774a1','qcom,pmi8998-rpmh-regulators','nvidia,tegra194','auo,b116xa01',
-		'amlogic,q201','rockchip,rk3399-edp','renesas,tpu-r8a7795','allwinner,sun50i-h5-emmc','sony,pioneer-row',
-		'qcom,sdm845-qhp-pcie-phy','qcom,msm8996-qmp-ufs-phy','rockchip,rk3368-efuse','tronsmart,vega-s95-meta','qcom,sm8250',
-		'qcom,ufs_variant','samsung,exynos5433-mipi-dsi','google,kevin-rev12','samsung,exynos5433-cmu-cam0','apm,xgene-mdio-xfi',
-		'xlnx,zynqmp-zc1232','apm,xgene-efuse','virtio,mmio','marvell,armada-8k-cps-pinctrl','asahi-kasei,ak09911',
-		'qcom,sm8250-qmp-ufs-phy','hisilicon,hi6220-dw-mshc','samsung,exynos5433-sysreg','renesas,dmac-r8a774b1','friendlyarm,nanopi-k2',
-		'samsung,exynos5433-mali','renesas,ipmmu-r8a774c0','amlogic,g12a-toacodec','google,smaug-rev6','qcom,kryo280',
-		'qcom,sdm845-pinctrl','microchip,sparx5-pinctrl','fsl,imx8qxp-clk','google,scarlet-rev3-sku7','qcom,gcc-msm8916',
-		'qcom,sdm845-aoss-cc','zte,zx296718-audiocrm','GXBB-NEXBOX-A95X','arm,sp805-wdt','mediatek,mt8516-eth',
-		'amlogic,meson-axg-clk-measure','renesas,rcar-gen3-cmt0','nvidia,tegra234-uart','wetek,hub','renesas,pwm-r8a774c0',
-		'qcom,spmi-adc-tm5','allwinner,sun50i-a64-codec-analog','brcm,bcm4345c5','usb5e3,610','amlogic,meson-gxbb-aobus-pinctrl',
-		'GX-P230-Q200','renesas,sata-r8a7795','goodix,gt9271','hisilicon,hisi-pcm-asp-dma-1.0','qcom,msm8996-camss',
-		'xlnx,zynqmp-zc1275','amlogic,meson-axg-spicc','qcom,pm660-gpio','kontron,sl28cpld-gpi','rockchip,rk3368-i2c',
-		'amlogic,meson-gx-efuse','mediatek,mt8173-disp-gamma','mediatek,mt7622-uart','rockchip,rk3368-spdif','broadmobi,bm818',
-		'hisilicon,kirin960-pcie','amlogic,g12a-tdmin','brcm,ns2-drd-phy','qcom,adreno-gmu-630.2','marvell,armada-ap807',
-		'zte,zx296718-aon-sysctrl','nvidia,tegra234-sysram','google,cros-ec-pd-update','sprd,sc9860-pinctrl','dlg,da9211',
-		'renesas,r8a7795-csi2','nvidia,tegra210-host1x','amlogic,q200','mediatek,mt8183-apmixedsys','renesas,r8a774e1-hdmi',
-		'arm,scpi','qcom,msm8916-snoc','renesas,r8a7795-hdmi','google,trogdor-sku0','nxp,ptn5150',
-		'purism,librem5r3','nvidia,tegra132-xusb-padctl','socionext,uniphier-ld20-usb3-reset','ti,j721e-gpio','renesas,usb2-phy-r8a774e1',
-		'mediatek,mt2712-vencsys','nvidia,tegra194-pmc','renesas,r8a7796-cpg-mssr','qcom,sm8250-rpmhpd','rockchip,rk3399-spi',
-		'arm,juno-mali','marvell,armada-8080-db','allwinner,sun50i-h6-system-control','parade,ps8640','rockchip,rk3399-gmac',
-		'renesas,hscif-r8a774a1','mediatek,mt8183-topckgen','friendlyarm,nanopi-neo-plus2','mediatek,mt6797-scpsys','renesas,r8a774b1-cpg-mssr',
-		'fsl,ls2080a-simu','nvidia,tegra210-nvjpg','qcom,msm8994-pinctrl','mediatek,mt6755-sysirq','fsl,qoriq-mc-dpmac',
-		'renesas,r8a77990-wdt','rockchip,rk3399-evb','qcom,ipq6018','renesas,rcar-gen3-pcie-ep','maxim,max20751',
-		'qcom,sm8250-mc-virt','marvell,armada-3700-periph-clock-sb','nvidia,tegra186-dsi-padctl','fsl,imx8mp-fec','socionext,uniphier-pxs3-soc-glue',
-		'qcom,pdc','qcom,db845c-sndcard','GXBB-WETEK-PLAY2','apm,xgene2-pcie','mediatek,mt8173-jpgdec',
-		'amlogic,meson-gxl-usb2-phy','rohm,bd9571mwv','fsl,ls1046aqds-fpga','google,elm-rev5','intel,agilex-clkmgr',
-		'qcom,sc7180-compute-noc','qcom,mmcc-msm8996','mediatek,mt7622-audsys','rockchip,rk3399-cru','renesas,r8a774c0-cpg-mssr',
-		'rockchip,rk3399-timer','sprd,sc9860-cam-clk','mediatek,mt8183-power-controller','google,scarlet-rev15-sku7','amlogic,meson-axg-aoclkc',
-		'sst25wf040b','apm,xgene-pcppll-v2-clock','fsl,ls1043a-dspi','qcom,sdm630','qcom,sdm845-smmu-v2',
-		'mediatek,mt8173-hdmi-phy','fsl,imx8mm-evk','arm,fvp-base-revc','renesas,hscif-r8a77980','mediatek,mt8183-auxadc',
-		'renesas,r8a77980-rst','apm,xgene-rb','xlnx,zynqmp-zcu106','rockchip,px30-lvds','fsl,ls1012a-scfg',
-		'amlogic,meson-g12a-clk-measure','renesas,scif-r8a77970','samsung,exynos5433-cmu-g2d','fsl,lx2160aqds-fpga','amlogic,axg-clkc',
-		'qcom,qcs404-ethqos','mediatek,mt8192-evb','hisilicon,hi3660-sctrl','kontron,imx8mm-n801x-som','tronsmart,vega-s95-telos',
-		'google,bob-rev9','mediatek,mt7622-infracfg','qcom,sm8150-camnoc-virt','renesas,vin-r8a77980','qcom,rpmcc-msm8996',
-		'nvidia,tegra194-i2s','allwinner,sun50i-a64-pwm','google,kevin-rev8','allwinner,sun50i-h6-r-ccu','qcom,rpm-pmi8994-regulators',
-		'renesas,vsp2','mediatek,mt6797-mmsys','xlnx,zynqmp-zcu102-revA','abracon,ab1805','marvell,armada-3700-uart-ext',
-		'renesas,xhci-r8a7795','qcom,msm8916-iommu','renesas,r8a77961-wdt','samsung,exynos7-tmu','google,scarlet-rev8-sku6',
-		'arm,cortex-a35','mediatek,mt8173-vdecsys','amlogic,g12a-frddr','renesas,ipmmu-r8a77980','nvidia,tegra186-ccplex-cluster',
-		'fsl,ls1028a-qdma','fsl,imx8qxp-sc-wdt','renesas,i2c-r8a77970','renesas,r8a77965-sysc','engicam,px30-core-ctouch2',
-		'operating-points-v2-kryo-cpu','renesas,dmac-r8a7795','qcom,sdm845-llcc','samsung,tm2','amlogic,meson-gxbb-usb2-phy',
-		'renesas,hscif-r8a774e1','brcm,iproc-sba-v2','al,alpine-v2','operating-points-v2-qcom-level','qcom,sm8150-qmp-ufs-phy',
-		'renesas,pwm-r8a774b1','rockchip,rk3308-evb','hisilicon,hi3660-pmuctrl','mediatek,mt7622-xhci','qcom,adreno-306.0',
-		'renesas,r8a774a1-usb3-phy','mediatek,mt6358-rtc','renesas,sdhi-r8a77990','mediatek,mt8173-mipi-tx','renesas,r8a774b1-cmt0',
-		'marvell,ap806-clock','fsl,imx8qxp-lpcg-lsio','qcom,sdm845-aggre1-noc','qcom,qcs404-adsp-pas','renesas,msiof-r8a77970',
-		'socionext,uniphier-ld11-adamv-reset','fsl,imx8qxp-iomuxc','google,scarlet-rev6-sku6','fsl,ls1043-qe-si','allwinner,sun50i-h6-de3',
-		'qcom,msm8996-smmu-v2','socionext,uniphier-ld20-sd-reset','mediatek,mt6797-topckgen','renesas,can-r8a774a1','nvidia,tegra194-dc',
-		'sprd,sc9863a-mm-gate','fsl,ls1046a','amlogic,gxl-clkc','renesas,gpio-r8a774a1','kobol,helios64',
-		'renesas,r8a774a1-hdmi','hisilicon,hi3660-tsensor','brcm,bcm958802a802x','xnano,x5','renesas,pfc-r8a77961',
-		'sprd,sc9860-agcp-gate','mediatek,mt7622-auxadc','renesas,pwm-r8a77970','qcom,adreno-650.2','amlogic,meson-axg-scp-shmem',
-		'arm,statistical-profiling-extension-v1','samsung,exynos5433-cmu-bus2','renesas,r8a77970','mediatek,mt8183-dsi','renesas,pfc-r8a774b1',
-		'renesas,gpio-r8a774c0','x-powers,axp803-gpio','google,bob-rev5','mediatek,mt8183-disp-color','mediatek,mt8183-uart',
-		'renesas,rcar-gen3-drif','amlogic,meson-gxbb-sm','allwinner,sun50i-h6-dw-hdmi','microchip,sparx5-sgpio','amlogic,meson-g12a-pwrc',
-		'qcom,ipq8074-qmp-pcie-phy','invensense,mpu6500','arm,foundation-aarch64','qcom,sdm845-videocc','marvell,armada-8k-xhci',
-		'qcom,sdm845-rpmhpd','qcom,adreno','nvidia,tegra194-vic','renesas,vin-r8a774e1','rockchip,rk3368-evb-act8846',
-		'avnet,ultra96-rev1','rockchip,rk3368-usb','amlogic,meson-gx-uart','mediatek,mt8173-disp-aal','nxp,imx8mq-vpu',
-		'nvidia,tegra186-xudc','fsl,ls2080a','qcom,msm8998-adsp-pas','ti,j721e-pcie-ep','samsung,exynos5433-uart',
-		'qcom,sc7180-qup-virt','mediatek,mt6797-vencsys','renesas,r8a77980-lvds','hisilicon,hi6220-mediactrl','samsung,exynos7-pmu',
-		'rockchip,px30-cru','fsl,imx8mp-gpio','mediatek,mt8183-mtu3','mediatek,mt7622-cir','amlogic,g12a-ddr-thermal',
-		'qcom,sm8250-pdc','brcm,iproc-pdc-mbox','ti,am654-hbmc','arm,cci-400-pmu','sprd,sc9860-suspend-timer',
-		'rockchip,rk3328-i2s','qcom,sdm660-pinctrl','apm,xgene-mdio-rgmii','hisilicon,hi6210-i2s','qcom,pmi8998',
-		'mediatek,mt6779-audio','realtek,rt5650','qcom,sdm845-qspi','G12B-KHADAS-VIM3','qcom,qcs404-bimc',
-		'google,bob-rev13','mediatek,mt6795','qcom,ipq8074-pinctrl','xlnx,zynqmp-zcu106-revA','rockchip,rk3399-mipi-dsi',
-		'amlogic,g12a-thermal','google,bob-rev8','rockchip,rk3399-usb2phy','qcom,dwc3','amlogic,g12a-vdec',
-		'renesas,tmu-r8a77980','actions,s700-timer','xlnx,zynqmp-zcu102','rockchip,rk3326','mediatek,mt8183-disp-rdma',
-		'hisilicon,hi3660-pctrl','renesas,usb2-phy-r8a77961','google,scarlet-rev7','apm,xgene-pmu-v2','rockchip,rk3399-pwm',
-		'GXBB-WETEK-HUB','ti,lm36922','renesas,r8a77970-sysc','google,bob-rev4','arm,cortex-a57',
-		'amlogic,meson-vrtc','allwinner,sun50i-a64-dw-hdmi','rockchip,px30-uart','renesas,gpio-r8a7795','socionext,uniphier-ld11-clock',
-		'allwinner,sun50i-h6-emac','qcom,sc7180-rpmh-clk','amlogic,g12a-toddr','analogix,anx6345','amlogic,meson-gxl-saradc',
-		'renesas,r8a774b1-usb3-phy','renesas,r8a774b1-usb3-peri','socionext,uniphier-ld11-reset','qcom,scm-msm8998','qcom,pmi8998-lab-ibb',
-		'mediatek,mt8173-spi','rockchip,rk3399-i2c','arm,armv8','renesas,etheravb-r8a77980','renesas,msiof-r8a77995',
-		'nvidia,tegra210-sor','mediatek,mt8173-disp-color','fsl,imx8qxp-mu','nvidia,tegra186-sdhci','renesas,xhci-r8a774a1',
-		'allwinner,sun50i-a64-codec-i2s','qcom,sm8250-rpmh-clk','qcom,sc7180-qfprom','nvidia,tegra194-hsp','lge,lg1312-ref',
-		'ti,am654-phy-gmii-sel','amd,ccp-seattle-v1a','brcm,sr-genpll3','nvidia,tegra194-efuse','renesas,usbhs-r8a774b1',
-		'qcom,sdhci-msm-v5','sprd,sc2731-regulator','samsung,exynos5433-cmu-apollo','mediatek,mt2712-spi-slave','qcom,sc7180-lpass-cpu',
-		'mediatek,mt8183-disp-ccorr','renesas,r8a77970-cmt0','qcom,fastrpc-compute-cb','rockchip,rk3308','arm,smmu-v3',
-		'ovti,ov5695','xlnx,zynqmp-zc1275-revA','allwinner,sun50i-a64-crypto','hisilicon,hi3798cv200','sprd,sc9863a-apahb-gate',
-		'mediatek,mt2712-mtu3','archermind,mt6797-x20-dev','rockchip,px5-evb','qcom,msm8998-qmp-usb3-phy','sprd,sc9863a-uart',
-		'rockchip,rk3328-efuse','qcom,pcie-qcs404','renesas,ipmmu-r8a774a1','mediatek,mt8183','hisilicon,hisi-gmac-v2',
-		'google,hana','mediatek,mt8167-vdecsys','socionext,uniphier-pxs3-reset','ti,am654-i2c','x-powers,axp803',
-		'renesas,r8a774c0-usb3-peri','qcom,sm8150-ipa-virt','qcom,adreno-smmu','qcom,qcs404-tsens','amlogic,g12b-clkc',
-		'fsl,s32v234-evb','pine64,pinebook-pro','renesas,r8a77965-lvds','qcom,pm6150l-gpio','khadas,vim',
-		'renesas,r8a7796-canfd','inside-secure,safexcel-eip197b','renesas,du-r8a77965','renesas,r8a7796','fsl,imx8mq-iomuxc-gpr',
-		'actions,s900-dma','renesas,hscif-r8a7795','nvidia,tegra194-pcie-ep','zte,zx296702-dma','qcom,sm8150-mmss-noc',
-		'google,scarlet-rev14-sku6','renesas,r8a7796-imr-lx4','qcom,sm8150-aoss-qmp','renesas,r8a77965-canfd','mediatek,mt7622',
-		'qcom,sm8250-mmss-noc','pine64,rock64','qcom,rpm-msm8916','qcom,pm8994-gpio','mediatek,mt8173-hdmi',
-		'apm,xgene1-xgenet','fsl,ls1046a-ftm-alarm','amlogic,g12a-pdm','mediatek,mt6358-regulator','renesas,r8a77965-cmt0',
-		'intel,keembay','rockchip,rk3368-mailbox','samsung,exynos7-usbdrd-phy','xlnx,zynqmp-psgtr-v1.1','marvell,ap806-smmu-500',
-		'amlogic,meson-gxl-periphs-pinctrl','samsung,exynos5433-cmu-mif','mediatek,mt8516-pericfg','arm,dcc','renesas,can-r8a7796',
-		'pine64,pinephone-1.0','maxim,max15301','samsung,exynos5433-cmu-atlas','mediatek,mt8173-disp-od','nvidia,tegra186-xusb',
-		'allwinner,sun50i-a100-nmi','amlogic,meson-gxbb','renesas,r8a7795-canfd','fsl,ls1043a-rdb','renesas,scif-r8a7795',
-		'mediatek,mt8183-pinctrl','fsl,lx2160a-qds','st,stlm75','samsung,exynos5433-pd','hardkernel,odroid-c2',
-		'amlogic,sm1-frddr','truly,nt35597-2K-display','mediatek,mt6797-pinctrl','fsl,imx8mq-sai','apm,potenza-pmu',
-		'google,smaug','arm,gic-v3','rockchip,rk3399-vdec','actions,s900','kontron,sl28cpld-intc',
-		'fsl,imx8mq-ddr-pmu','brcm,ocotp-v2','renesas,r8a77970-canfd','awinic,aw2013','zte,zx296718-i2c',
-		'samsung,exynos5433-hdmi','mediatek,mt8173-wdt','G12B-ODROID-N2','qcom,scm-qcs404','brcm,iproc-nic-i2c',
-		'renesas,gpio-r8a77980','firefly,roc-rk3328-cc','mediatek,mt8173-disp-mutex','qcom,msm8998-gpucc','qcom,sdm845-qmp-pcie-phy',
-		'rockchip,px30-spi','qcom,msm8998-slpi-pas','samsung,exynos5433-cmu-peric','qcom,sm8250-qmp-usb3-phy','socionext,uniphier-pxs3-aidet',
-		'qcom,pcie-msm8996','qcom,cpufreq-epss','amlogic,meson-gxm-usb-ctrl','plda,xpressrich3-axi','allwinner,sun50i-a100-r-ccu',
-		'asus,gt-ac5300','mediatek,mt8183-sysirq','marvell,cp110-icu','renesas,r8a7796-cmt1','sprd,sc9836',
-		'renesas,r8a77995-sysc','vamrs,rock960','qcom,ipq8074-qusb2-phy','hisilicon,hi6220-sysctrl','mediatek,mtk-ahci',
-		'mediatek,mt8173-mdp-wrot','st,lis3mdl-magn','fsl,enetc-mdio','realtek,rt5682i','mediatek,mt8183-audiosys',
-		'marvell,a3700-utmi-host-phy','marvell,armada-8k-gpio','mediatek,mt7622-i2c','fsl,imx8qxp-lpi2c','nvidia,tegra194-xusb-padctl',
-		'nvidia,tegra186','nvidia,tegra186-dpaux','qcom,sdm845-qmp-usb3-phy','qcom,q6afe','sprd,sp9860-wdt',
-		'qcom,rpmcc-sdm660','usb4ca,301a','nvidia,tegra210-pmc','nvidia,p2371-0000','qcom,gcc-msm8994',
-		'sprd,sc9860','allwinner,sun50i-h5-rtc','hisilicon,hi6220-mbox','everest,es8316','samsung,exynos5433-pcie',
-		'xlnx,zynqmp','mediatek,mt7622-rng','fsl,imx8mn-ddr-pmu','renesas,r8a774b1-thermal','ovti,ov8856',
-		'hisilicon,hi6220-pmctrl','fsl,enetc','renesas,r8a774c0-cmt1','xlnx,zynqmp-zc1232-revA','renesas,r8a77990-drif',
-		'fsl,imx8mm-fec','renesas,du-r8a7795','oranth,tanix-tx6','apm,strega','mediatek,mt6779-mmsys',
-		'qcom,sdm630-sdhci','mediatek,mt6797-i2c','qcom,sdm845-ipa','renesas,r8a774c0-pcie-ep','allwinner,sun50i-a100-r-pinctrl',
-		'qcom,tsens-v0_1','qcom,pm8916-wcd-analog-codec','google,smaug-rev1','fsl,ls1046a-frwy','beacon,beacon-rzg2m',
-		'renesas,usb2-phy-r8a7796','allwinner,sun50i-a64-de2-mixer-0','renesas,can-r8a77965','google,lazor-rev1','mediatek,mt6765-spi',
-		'rockchip,rk3399-pmu','qcom,sdm845-ufshc','nvidia,tegra186-dsi','mediatek,mt6397-rtc','socionext,uniphier-ld20-usb3-ssphy',
-		'microchip,sparx5-temp','apm,xgene-scu','renesas,dmac-r8a774a1','qcom,adreno-530.2','renesas,r8a7796-hdmi',
-		'qcom,pm8005-gpio','google,scarlet-rev6','arm,cryptocell-630p-ree','qcom,rpm-msm8996','nvidia,tegra194-dmic',
-		'maxim,max3421-udc','qcom,ipq6018-pinctrl','samsung,a5u-eur','arm,vexpress,v2f-1xv7,ca53x2','sprd,sc9860-disp-gate',
-		'nvidia,tegra210-ahci','st,lsm6ds3','ipmi-kcs','socionext,uniphier-ld11-soc-glue-debug','socionext,uniphier-pxs3-soc-glue-debug',
-		'purism,librem5','renesas,msiof-r8a77961','qcom,sm8250-aggre2-noc','allwinner,sun50i-a64-sram-c','nvidia,tegra132-hda',
-		'nuvoton,nau8825','renesas,pfc-r8a77970','mediatek,mt8173-m4u','renesas,rcar-gen3-hdmi','qcom,sdm630-pinctrl',
-		'qcom,hdmi-tx-8996','amlogic,a1','ceva,ahci-1v84','nvidia,tegra194-dpaux','samsung,s6e3ha2',
-		'qcom,cmd-db','kingdisplay,kd097d04','rockchip,rk3328-power-controller','google,lazor-rev0','mediatek,mt8516-apmixedsys',
-		'ti,hd3ss3220','mediatek,mt2712-m4u','renesas,pcie-r8a77965','qcom,sc7180-rpmhpd','fsl,ls1088ardb-fpga',
-		'khadas,mcu','fsl,imx8mq-qspi','nvidia,tegra210-apbdma','mediatek,mt7622-pcie','nxp,pca9847',
-		'amlogic,gxl-vdec','realtek,rtd1619','allwinner,sun50i-a64-mipi-dsi','arm,mmu-400','brcm,ns2-svk',
-		'socionext,uniphier-ld11-peri-reset','allwinner,sun50i-a64-usb-phy','renesas,sdhi-r8a77995','nvidia,tegra210-apbmisc','sprd,sc2731-bltc',
-		'qcom,msm8996-pinctrl','apm,xgene-socpll-clock','google,scarlet-rev11','renesas,r8a77995-usb-dmac','amlogic,g12a-spdifout',
-		'st,stmfts','pine64,sopine','qcom,rpmh-rsc','renesas,intc-ex-r8a77990','renesas,r8a7796-thermal',
-		'samsung,exynos5433-cmu-cpif','mediatek,mt2712-tphy','qcom,pm660','fsl,s32v234-linflexuart','qcom,sc7180-mmss-noc',
-		'zte,zx296718-dpc','renesas,h3ulcb','mediatek,mt7622-sysirq','cubietech,cubieboard7','lltc,ltc3882',
-		'qcom,pm660l-gpio','renesas,tmu-r8a774c0','qcom,sm8250-cdsp-pas','nvidia,tegra194-emc','google,trogdor',
-		'renesas,r8a7795-pcie-ep','marvell,berlin4ct','altr,socfpga-s10-eth-mac-ecc','amlogic,ad401','ucrobotics,bubblegum-96',
-		'fsl,ls2080a-clockgen','renesas,vin-r8a77965','amlogic,meson-g12a-ao-pwm-cd','qcom,pms405-gpio','qcom,msm8998-rpmpd',
-		'pine64,pine-h64','nvidia,tegra194-sysram','ethernet-phy-id0180.3301','socionext,uniphier-pxs3-peri-clock','renesas,pfc-r8a77990',
-		'mediatek,mt8173-gce','hisilicon,hi3798cv200-crg','GXL-LIBRETECH-S905X-CC','qcom,sm8150-tsens','fsl,imx8mn-src',
-		'zte,zx296718-topcrm','SM1-SEI610','sprd,sc9860-uart','renesas,r8a7796-cmt0','mediatek,mt7622-efuse',
-		'mediatek,mt8173-u3phy','renesas,sdhi-r8a77961','amlogic,meson-gxbb-mhu','rockchip,rk3399-orangepi','renesas,dmac-r8a7796',
-		'renesas,r8a77961-sysc','fsl,imx8mq-evk','renesas,hscif-r8a77961','samsung,exynos7-dw-mshc-smu','kingnovel,r-box-pro',
-		'mediatek,mt8183-gce','qcom,fastrpc','renesas,iic-r8a774a1','nxp,pca9450a','renesas,r8a77980-cmt1',
-		'GXL-LIBRETECH-S905X-CC-V2','capella,cm32181','feixin,k101-im2ba02','renesas,rcar-gen3-canfd','jedec,ufs-2.1',
-		'boe,nv101wxmn51','qcom,gcc-ipq6018','fsl,imx8mn-gpmi-nand','fsl,imx8mp-sdma','rockchip,rk3308-spdif',
-		'marvell,armada-3700-rwtm-mailbox','ti,j721e-sdhci-4bit','kontron,sl28-var2','socionext,uniphier-pxs3-sd-reset','renesas,i2c-r8a774a1',
-		'fsl,ls1088a-qds','arm,scpi-clocks','libretech,aml-s912-pc','renesas,rcar_sound-r8a77965','google,scarlet-rev7-sku7',
-		'qcom,qusb2-v2-phy','qcom,sc7180-camcc','renesas,du-r8a77970','marvell,armada-3700-usb2-host-misc','renesas,i2c-r8a774e1',
-		'renesas,r8a77965-rst','mediatek,mt6779-uart','qcom,rpm-sdm660','qcom,sm8250-tsens','maxim,max77620',
-		'fsl,imx8mm-sdma','arm,smmu-v2','renesas,dmac-r8a77961','amlogic,meson-gxbb-aoclkc','realtek,rt5677',
-		'qcom,sm8150-aggre2-noc','marvell,cp110-icu-nsr','qcom,tcsr-msm8916','renesas,rcar-gen3-can','qcom,usb-hs-28nm-femtophy',
-		'renesas,pwm-r8a7795','allwinner,sun50i-h6-ir','renesas,dmac-r8a77965','amlogic,g12a','arm,mali-dp500',
-		'google,hana-rev3','fsl,ls1046ardb-cpld','fsl,lx2160a-dspi','fsl,imx8mq-pwm','ugoos,am6',
-		'allwinner,sun50i-a64-sid','nvidia,tegra132-emc','ti,ina3221','allwinner,sun50i-a64-r-pinctrl','G12B-UGOOS-AM6',
-		'samsung,usb-connector-11pin','fsl,imx8mm-i2c','qcom,apq8096-sndcard','brcm,sr-lcpll1','qcom,sdm845-lpasscc',
-		'nvidia,tegra186-rtc','arm,scpi-power-domains','renesas,intc-ex-r8a774a1','socionext,uniphier-ld20-clock','khadas,edge',
-		'allwinner,sun50i-h6-pwm','mediatek,mt8173-smi-common','amlogic,gx-vdec','nvidia,tegra210-admaif','intel,socfpga-agilex',
-		'allwinner,sun50i-a64-codec','google,imx8mq-phanbell','amlogic,meson-gx-dw-hdmi','qcom,adreno-630.2','apm,xgene-rtc',
-		'qcom,sm8250-config-noc','brcm,iproc-ahci','fsl,ls1046a-pcie','renesas,ipmmu-r8a7795','renesas,du-r8a77990',
-		'renesas,r8a77990-cmm','renesas,fcpv','rockchip,rk809','amlogic,g12a-tohdmitx','lontium,lt9611',
-		'idt,5p49v6901','socionext,uniphier-ld20-soc-glue','nvidia,tegra210-agic','fsl,imx8mm-micfil','apm,xgene-storm-dma',
-		'apm,xgene-edac-l3-v2','sprd,sc9860-timer','marvell,armada8040-mcbin-singleshot','socionext,uniphier-evea','qcom,sc7180-venus',
-		'marvell,armada-3700-sdhci','renesas,r8a77970-rst','fsl,ls-pcie-ep','qcom,pm8005-rpmh-regulators','amlogic,meson-gx-hhi-sysctrl',
-		'qcom,wcn3991-bt','renesas,r8a7796-sysc','brcm,vulcan','rockchip,rk3399-pinctrl','nvidia,p3509-0000+p3668-0000',
-		'qcom,scm-msm8996','allwinner,sun50i-a64-ccu','microchip,usb2513b','renesas,r8a77961-usb3-peri','ti,j721e-cpb-audio',
-		'socionext,uniphier-ld20-akebi96','qcom,kryo260','AXG-S400','hisilicon,hip05-d02','fsl,ls1028a-clockgen',
-		'rockchip,pdm','amlogic,axg-sound-card','samsung,exynos7-clock-peris','ti,bq27742','sprd,hwspinlock-r3p0',
-		'allwinner,sun50i-a100-ths','mediatek,mt8516-rng','firefly,roc-rk3308-cc','qcom,pm8150b-gpio','allwinner,sun50i-a64-emac',
-		'renesas,rcar-gen3-rpc-if','qcom,gcc-sdm630','allwinner,sun50i-a64-de2-clk','amlogic,meson-gx-ao-secure','vishay,vcnl4040',
-		'marvell,berlin4ct-avio-pinctrl','samsung,exynos7-wdt','brcm,iproc-sr-sata-phy','socionext,uniphier-pxs3-perictrl','renesas,rcar-gen3-cmt1',
-		'nvidia,tegra194-aconnect','qcom,sm8150-llcc','qcom,qcs404-snoc','qcom,rpmcc-msm8992','sprd,sc9863a',
-		'mediatek,mt8183-efuse','longcheer,l8150','amlogic,p200','zte,zx296718-evb','kontron,sl28-var3-ads2',
-		'mediatek,mt8173-disp-ovl','google,kevin-rev14','allwinner,sun50i-a64-i2s','qcom,sm8250-smmu-500','socionext,uniphier-ld11-ref',
-		'hisilicon,hi6220-ade','altr,sdram-edac-s10','rockchip,rk3328-grf','renesas,r8a77990','cznic,turris-mox-rwtm',
-		'google,smaug-rev7','rockchip,rk3399-power-controller','brcm,vulcan-pmu','arm,sbsa-uart','renesas,etheravb-r8a774c0',
-		'fsl,imx8mp-anatop','renesas,sata-r8a774b1','qcom,msm8996-rpmpd','apm,xgene-slimpro-i2c','amlogic,meson-gx-ir',
-		'ti,am654-hwspinlock','amlogic,gxbb-vdec','renesas,scif-r8a77990','allwinner,sun50i-h6-ehci','qcom,spmi-adc-rev2',
-		'mediatek,mt6797-evb','mediatek,mt8173-thermal','amlogic,p281','apm,xgene-gpio','oranth,tx3-mini',
-		'qcom,ipq6018-nand','actions,s900-i2c','renesas,r8a774e1-thermal','xlnx,zynqmp-zcu102-revB','jedec,ufs-1.1',
-		'ti,am654-pcie-ep','nexbox,a1','cavium,thunder-88xx','hisilicon,hi3660-ufs','actions,s700-i2c',
-		'zte,zx296718-sysctrl','marvell,armada-8k-nand-controller','socionext,uniphier-ld20-sd-clock','leez,p710','nxp,pca9646',
-		'generic-adc-thermal','mediatek,mt8192-uart','amlogic,meson-gxbb-i2c','amlogic,meson-g12a-spicc','rockchip,rk3308-pwm',
-		'amlogic,s912','marvell,armada8040-db','google,lazor-rev2-sku0','qcom,msm8996-cci','brcm,bcm4335a0',
-		'xlnx,zynqmp-zcu104','renesas,r8a77990-cmt1','qcom,sdm845-venus-v2','brcm,sr-genpll0','ti,j721e-sdhci-8bit',
-		'renesas,msiof-r8a77965','renesas,pcie-r8a774a1','winbond,w25q16','mediatek,mt8173-pinctrl','nvidia,tegra210-spi',
-		'google,hana-rev7','samsung,s2mps15-pmic','fsl,lx2160a-ahci','qcom,sdm845-dpu','renesas,etheravb-r8a7795',
-		'xunlong,orangepi-win','renesas,r8a774b1-usb-dmac','renesas,dmac-r8a77970','ir-spi-led','amlogic,meson-gxbb-mmc',
-		'socionext,uniphier-ld20-sysctrl','nvidia,tegra210-adma','google,elm-rev4','rockchip,rk3399-efuse','google,lazor',
-		'sony,imx219','maxim,max20024','renesas,intc-ex-r8a774b1','socionext,uniphier-ld11-pinctrl','amlogic,gx-sound-card',
-		'samsung,exynos7-clock-top1','fsl,imx8mq-uart','nvidia,tegra234-pmc','socionext,uniphier-pxs3','fsl,ls1043a-esdhc',
-		'renesas,can-r8a774e1','fsl,ls1043a-dcfg','hisilicon,hi6220-aoctrl','arm,cortex-a73','amd,seattle',
-		'qcom,pm8009','amlogic,meson-gx-vpu','qcom,kryo468','ti,bq25890','qcom,pms405-adc',
-		'emlid,neutis-n5-devboard','qcom,sm8150-rpmhpd','renesas,r8a77990-canfd','qcom,pm8916-wdt','renesas,xhci-r8a774c0',
-		'qcom,sdm845-aoss-qmp','qcom,sc7180-idp','sprd,sc2731-fgu','sprd,sc9860-pmu-gate','amlogic,p230',
-		'nvidia,p2771-0000','qcom,sm8250-adsp-pas','realtek,rt5514','qcom,sdm845-sdhci','renesas,rcar-gen3-i2c',
-		'microchip,at25160bn','brcm,bcm958742t','fsl,imx8mp-ccm','allwinner,sun50i-h6-i2s','boe,nv133fhm-n62',
-		'hoperun,hihope-rzg2n','sprd,sc9860-aon-gate','renesas,msiof-r8a774e1','mediatek,mt6755-evb','renesas,r8a774a1-csi2',
-		'qcom,pm8941-resin','rockchip,rk3368-pwm','rockchip,rk3399-vop-big','qcom,hdmi-phy-8996','renesas,etheravb-r8a77970',
-		'nvidia,tegra194-gpio-aon','qcom,sm8150-hdk','google,gru','ti,am654-adc','mediatek,mt2712-mmc',
-		'hoperun,hihope-rzg2h','sony,sumire-row','microchip,dw-sparx5-sdhci','qcom,gcc-sm8150','nvidia,tegra234',
-		'beacon,imx8mm-beacon-kit','mediatek,mt2712-apmixedsys','qcom,sc7180-gem-noc','qcom,pm8998','amlogic,s905x',
-		'renesas,r8a7796-wdt','nvidia,tegra186-bpmp','renesas,r8a774a1-cmt0','fsl,imx8mm-usbmisc','amlogic,g12a-clkc',
-		'renesas,iic-r8a77961','fsl,ls1012a-esdhc','renesas,msiof-r8a7796','renesas,r8a7796-usb3-phy','amlogic,meson-sm1-pwrc',
-		'qcom,sc7180-config-noc','lge,lg1312','google,cr50','nxp,sc18is603','hisilicon,hip07-pcie-ecam',
-		'hisilicon,hi6421v530-pmic','hisilicon,hip05-cpld','ti,am654-tscadc','rockchip,rk3368-pinctrl','hoperun,hihope-rzg2m',
-		'xlnx,zynqmp-aes','qcom,sm8250-compute-noc','qcom,sm8150-mpss-pas','brcm,sr-pcie-phy','qcom,ipq8074-qmp-usb3-phy',
-		'mediatek,mt6779-ipesys','ti,j721e-r5fss','renesas,usbhs-r8a77965','rockchip,rk3328-grf-gpio','neweast,wjfh116008a',
-		'renesas,pwm-r8a774a1','renesas,r8a7796-drif','sprd,sc2731-adc','renesas,r8a774a1-pcie-ep','fsl,imx8mn-gpio',
-		'ti,j721e-i2c','qcom,smmu-v2','mediatek,mt8173-disp-merge','amlogic,meson-g12a-mali','microsoft,talkman',
-		'ethernet-phy-id0243.0d90','fsl,ls1046a-dcfg','x-powers,axp803-battery-power-supply','xlnx,zynqmp-zcu111-revA','apm,xgene-slimpro-hwmon',
-		'marvell,armada-ap810-octa','qcom,tsens-v2','everest,es7154','ti,tas5711','qcom,sm8150-qmp-usb3-phy',
-		'qcom,apss-wdt-qcs404','qcom,sc7180-lpasscorecc','ti,am654-chipid','renesas,xhci-r8a77965','socionext,uniphier-ld11-ave4',
-		'libretech,aml-s905x-cc','mediatek,mt8167-pumpkin','ti,am654-ecap','qcom,cpufreq-hw','fsl,imx8mq',
-		'renesas,r8a7796-csi2','hisilicon,tsensor','brcm,spum-crypto','rockchip,rt5651','xlnx,zynqmp-rtc',
-		'fsl,ls1012a-wdt','rockchip,rk3308-saradc','qcom,adreno-gmu','amlogic,aiu','qcom,sc7180-aoss-qmp',
-		'globalscale,espressobin-v7-emmc','amlogic,axg-toddr','renesas,can-r8a7795','google,bob-rev11','renesas,r8a77961-rst',
-		'nvidia,tegra210-nvenc','qcom,sm8150-qmp-usb3-uni-phy','globalscale,espressobin-ultra','vamrs,ficus','fsl,imx8qxp-lpcg-adma',
-		'renesas,du-r8a774b1','renesas,r8a7795-cmm','socionext,uniphier-ld11-sysctrl','arm,cortex-a55-pmu','mediatek,mt7622-pwm',
-		'mediatek,mt8167-infracfg','mediatek,mt7622-ahci','renesas,i2c-r8a7795','fsl,imx8mm-gpio','sprd,sc9860-eic-async',
-		'amlogic,meson-gxbb-periphs-pinctrl','rockchip,rk3399-vop-lit','qcom,sdm845-pdc-global','globaltop,pa6h','renesas,r8a77980-canfd',
-		'fsl,imx8mq-usdhc','melfas,mip4_ts','xunlong,orangepi-lite2','qcom,pm8916','DB820c',
-		'qcom,gcc-sc7180','renesas,rcar-gen3-msiof','ti,j721e-wiz-16g','mediatek,mt2712-sysirq','renesas,r8a774b1-canfd',
-		'renesas,r8a774b1-hdmi','arm,mali-t624','marvell,armada-7k-pp22','marvell,armada-3700-uart','mediatek,mt8183-ipu_core0',
-		'amlogic,p212','sinovoip,bananapi-m64','qcom,scm-msm8916','samsung,exynos5433-usbdrd-phy','numonyx,js28f00a',
-		'cdns,spi-r1p6','fsl,ls1012a-rdb','arm,mali-t820','fsl,imx8mn-fec','advantech,idk-1110wr',
-		'rockchip,rk3368','fsl,imx8mp-ddr-pmu','renesas,pcie-rcar-gen3','ethernet-phy-id0181.4400','amlogic,sm1-tdmin',
-		'hp,envy-x2','hisilicon,hi3670-crgctrl','renesas,r8a7795-sysc','qcom,gcc-sdm845','xlnx,zynqmp-zcu100',
-		'mediatek,mt2712-mmsys','renesas,thermal-r8a774c0','sprd,sc9860-disp-clk','mediatek,mt7622-u3phy','sharp,lq123p1jx31',
-		'qcom,sm8150-gem-noc','google,hana-rev6','zidoo,x9s','apm,xgene-edac-soc','renesas,r8a77990-usb-dmac',
-		'samsung,s3fwrn5-i2c','fsl,imx8mn-pwm','ovti,ov7251','renesas,scif-r8a774b1','samsung,exynos7-adc',
-		'mediatek,mt6397-pinctrl','mediatek,mt8173','qcom,rpm-msm8994','mediatek,mt8183-disp-ovl','ti,sierra-phy-t0',
-		'nvidia,tegra210-ictlr','mxicy,mx25r1635f','allwinner,sun50i-a64-spdif','intel,agilex-svc','arm,juno-r1',
-		'fsl,imx8mq-ecspi','samsung,exynos5433-cmu-bus0','fsl,enetc-ptp','mediatek,mt2712-mcucfg','olimex,a64-olinuxino',
-		'ti,j721e-uart','hisilicon,hns-nic-v2','fsl,imx8mq-ccm','microchip,sparx5-pcb134','renesas,intc-ex-r8a7796',
-		'fsl,ls1088a-gpio','qcom,pm8998-rpmh-regulators','sprd,sc9860-aonsecure-clk','lg,lp120up1','allwinner,sun50i-a100-ccu',
-		'apm,xgene-pmd-clock','marvell,cn9132','qcom,rpm-ipq6018','marvell,odmi-controller','xlnx,zynqmp-nvmem-fw',
-		'marvell,comphy-cp110','rockchip,rk3399-gru-sound','renesas,pwm-r8a7796','socionext,uniphier-ld11-sdctrl','samsung,exynos7-hsi2c',
-		'mediatek,mt8183-m4u','rockchip,rk3368-pmugrf','qcom,msm8916-v1-qrd/9-v1','allwinner,sun50i-h6-usb3-phy','qcom,sc7180-videocc',
-		'spi-mux','pci1b4b,2b42','globalscale,espressobin','realtek,mjolnir','globalscale,espressobin-emmc',
-		'realtek,lion-skin','amlogic,s922x','amlogic,s905d','renesas,iic-r8a7795','hisilicon,hip07-sec',
-		'fsl,ls1028a','rockchip,rk3368-tsadc','allwinner,sun50i-h6-ccu','apm,xgene2-sgenet','renesas,rcar-gen3-xhci',
-		'mediatek,mt8183-smi-common','google,bob','fsl,imx8mm-pwm','intel,agilex-soc-fpga-mgr','ti,j721e-c71-dsp',
-		'kontron,sl28cpld-gpio','renesas,pcie-r8a7795','qcom,pm8005','samsung,exynos5433-scaler','arm,cortex-a75',
-		'mediatek,mt8173-vencsys','qcom,sm8250-npu-noc','allwinner,sun50i-a64-display-engine','zte,zx296702-i2s','mediatek,mt8173-infracfg',
-		'mediatek,mt6779','qcom,pm8009-rpmh-regulators','solidrun,clearfog-gt-8k','fsl,ls1028a-dspi','fsl,imx8qxp-sc-thermal',
-		'qcom,ipq8074-wcss-pil','sprd,sc9863a-aonapb-gate','renesas,r8a774c0-canfd','rockchip,rk3308-spi','renesas,r8a7795-cpg-mssr',
-		'renesas,gpio-r8a77995','fsl,imx8mm-ddr-pmu','nvidia,tegra194-agic','cdns,i2c-r1p14','kontron,sl28-var3',
-		'nvidia,tegra194-mc','microchip,mcp2518fd','pwm-ir-tx','brcm,bcm958742k','samsung,exynos7-clock-fsys1',
-		'samsung,exynos7-dw-mshc','rockchip,rk3368-grf','sprd,sc9860-apapb-gate','amlogic,sm1','marvell,armada3720',
-		'renesas,r8a77990-lvds','allwinner,sun50i-h6-video-engine','apm,xgene1-sgenet','amd,seattle-overdrive','qcom,msm8916-pcnoc',
-		'renesas,r8a77970-csi2','fsl,imx8mq-mipi-dphy','arm,vexpress,v2f-1xv7','socionext,uniphier-pxs3-thermal','allwinner,sun50i-h6-r-pinctrl',
-		'qcom,slim-ngd-v2.1.0','fsl,ls2088a-rdb','nvidia,tegra186-mc','fsl,imx8mp','pine64,pine64-lts',
-		'engicam,px30-core-edimm2.2','lenovo,miix-630','renesas,r8a774b1-rst','mediatek,mt8516-wdt','nvidia,tegra132-flowctrl',
-		'renesas,r8a774e1-sysc','rockchip,px30-pinctrl','socionext,uniphier-wdt','socionext,uniphier-ld20-perictrl','fsl,imx8mn-mu',
-		'qcom,sm8150-slpi-pas','allwinner,sun50i-h5-video-engine','qcom,msm8916-mtp/1','rockchip,rk3328-mali','khadas,vim3l',
-		'ti,j721e-cpsw-nuss','amlogic,meson-gxbb-reset','nvidia,gp10b','ti,am654-gpio','amlogic,g12a-mdio-mux',
-		'rockchip,rk3308-detect-grf','qcom,sm8150-cdsp-pas','renesas,r8a7795-imr-lx4','qcom,rpmcc-msm8998','nvidia,tegra210-nvdec',
-		'samsung,exynos7-clock-peric0','lge,lg1313-ref','fsl,sec-v5.4','mediatek,mt2712-spi','arm,rtsm_ve,aemv8a',
-		'fsl,imx8mn-ddr4-evk','nvidia,tegra210-mipi','fsl,ls1043aqds-fpga','innolux,p120zdg-bf1','renesas,r8a774e1-cmt1',
-		'qcom,msm8916-cci','mediatek,mt8183-disp-mutex','marvell,armada3700-xhci','wetek,core2','mediatek,mt8516-timer',
-		'rockchip,rk3328-dw-mshc','kontron,kbox-a-230-ls','nvidia,tegra186-eqos','renesas,r8a774c0-csi2','usb424,4041',
-		'xiaomi,lavender','qcom,sc7180-aoss-cc','fsl,ls1028a-dwc3','qcom,gcc-msm8998','allwinner,sun50i-a64-deinterlace',
-		'libretech,aml-s905d-pc','microchip,sparx5-cpu-syscon','socionext,uniphier-pcie','allwinner,sun50i-h5-sid','cdns,usb3',
-		'amlogic,meson-g12a-aobus-pinctrl','apm,mustang','hisilicon,hi6220-mali','hisilicon,hi3670-pmuctrl','mediatek,mt8173-evb',
-		'renesas,r8a774e1-pcie-ep','brcm,sr-cdru','mps,mp8859','samsung,exynos7-clock-ccore','samsung,exynos5433-decon-tv',
-		'renesas,pfc-r8a77995','renesas,pcie-r8a77961','mediatek,mt7622-pciesys','fsl,imx8mm-gpmi-nand','allwinner,sun50i-a64-hdmi-phy',
-		'sprd,sc9863a-glbregs','amlogic,meson-gxbb-pwrc','qcom,sdm845-adsp-pas','nvidia,p2972-0000','fsl,imx8mp-pwm',
-		'qcom,msm8992','renesas,scif-r8a77961','ti,am654-sci','allwinner,sun50i-h6-sid','marvell,cp115-standalone-pinctrl',
-		'socionext,uniphier-pxs3-usb3-reset','renesas,usb2-phy-r8a77990','nexbox,a95x','allwinner,sun50i-a64-sram-c1','lge,lg1313',
-		'qcom,pm6150l-rpmh-regulators','qcom,sdm845-cci','adc-joystick','fsl,imx8mn-iomuxc','nvidia,tegra210-pcie',
-		'socionext,uniphier-pxs3-sd-clock','allwinner,sun50i-a64-wdt','mediatek,mt6397-pctl-pmic-syscfg','hisilicon,hi3798cv200-pcie','goodix,gt5663',
-		'fsl,imx8qxp-dsp','actions,s900-uart','socionext,uniphier-pxs3-peri-reset','google,scarlet-rev8','allwinner,sun50i-a64-ir',
-		'qcom,scm-sc7180','socionext,uniphier-ld20-usb3-hsphy','google,scarlet-rev13-sku7','ti,j721e-sa2ul','apm,xgene-mdio',
-		'amlogic,meson-axg-dwmac','renesas,r8a774c0-sysc','nvidia,tegra194-uart','sprd,sc9863a-apapb-gate','socionext,uniphier-pxs3-sdctrl',
-		'allwinner,sun50i-h5-sram-c1','renesas,r8a77970-lvds','mediatek,mt8516-i2c','xlnx,zynqmp-zc1751','qcom,sc7180-tsens',
-		'renesas,gpio-r8a7796','qcom,tcsr-msm8996','nvidia,tegra210-pinmux','ti,j721e-usb','qcom,sdm845-mmss-noc',
-		'nvidia,tegra194-admaif','pine64,rockpro64-v2.0','arm,juno-r2','renesas,i2c-r8a774b1','microchip,sparx5',
-		'spansion,s25fs512s','qcom,sm8250-qmp-usb3-uni-phy','mediatek,mt8516-auxadc','rocktech,jh057n00900','xlnx,zynqmp-pcap-fpga',
-		'rockchip,px30-usb2phy-grf','qcom,sdm660-apcs-hmss-global','fsl,ls1012a-ftm-alarm','ti,am654-vtm','renesas,xhci-r8a77990',
-		'renesas,gether-r8a77980','nvidia,tegra234-misc','hisilicon,hip06-sas-v2','mediatek,mt2712-uart','rockchip,rk3368-gmac',
-		'fsl,ls1088a-dspi','renesas,condor','mediatek,mt8173-disp-split','amlogic,u200','qcom,ipq6018-a53pll',
-		'nxp,imx8mm-fspi','renesas,tpu-r8a77965','ethernet-phy-id03a1.b4b0','qcom,apss-wdt-sm8250','rockchip,rk3328-evb',
-		'fsl,qoriq-mc','rockchip,rk3399-vpu','epson,rx8571','ti,am654-navss-mcu-udmap','microchip,sparx5-chip-reset',
-		'socionext,uniphier-ld11-global','marvell,armada-3720-db','ti,j721e-cpts','allwinner,sun50i-a64-de2-mixer-1','apm,xgene-mcb',
-		'mediatek,mt8183-timer','mediatek,mt6779-camsys','qcom,sm8150-adsp-pas','qcom,msm8916-wcd-digital-codec','toshiba,tmpv7708-pinctrl',
-		'fsl,imx8mm-sai','arm,gic-v2m-frame','zte,zx296718-tvenc','google,elm-rev3','hisilicon,hi3670-ufs',
-		'fsl,ls2080a-qspi','qcom,msm8996-mtp','qcom,msm8996-dwc3','ti,sn65dsi86','rohm,bd71837',
-		'purism,librem5r2','fsl,ls1028a-esdhc','actions,s700-dma','amlogic,meson-g12a-usb-ctrl','fsl,sec-v5.4-job-ring',
-		'amlogic,meson-sm1-audio-arb','renesas,rcar_sound-r8a774c0','fsl,imx8mm-mu','arm,scpi-pre-1.0','apm,xgene-edac-mc',
-		'arm,rtsm-display','zte,zx296718-lsp1crm','Lenovo-YOGA-C630-13Q50','fsl,imx8mp-iomuxc','mediatek,mt6779-sysirq',
-		'fsl,ls1012a','qcom,lpass-cpu-apq8016','socionext,uniphier-ld20-pcie-phy','snps,dw-pcie-ep','nvidia,tegra186-adma',
-		'qcom,msm8996-qusb2-phy','amlogic,axg-audio-clkc','mediatek,mt8167-imgsys','hisilicon,k3-dma-1.0','allwinner,sun50i-h6-sram-c1',
-		'marvell,ap807-cpu-clock','renesas,r8a7795-usb3-phy','qcom,sm8250-ufshc','samsung,exynos5433-cmu-mfc','arm,coresight-stm',
-		'socionext,uniphier-ld11-perictrl','rockchip,px30-pmu','ti,j721e','allwinner,sun50i-h6-pinctrl','renesas,du-r8a7796',
-		'rockchip,px30-io-voltage-domain','fsl,ls2080a-qds','qcom,pm8998-gpio','realtek,rtd1295','mediatek,mt8173-mtu3',
-		'fsl,ls1043a-qds','socionext,uniphier-ld20-aidet','rockchip,px30-vop-lit','samsung,exynos5433-gsc','ti,j721e-system-controller',
-		'renesas,rcar-gen3-wdt','renesas,pfc-r8a77980','google,elm-rev6','renesas,ipmmu-r8a77970','socionext,uniphier-ld20',
-		'renesas,gpio-r8a77961','qcom,adreno-gmu-640.1','amlogic,meson-g12a-dwmac','mediatek,mt8183-disp-gamma','nvidia,tegra210-i2c',
-		'tps65132','renesas,intc-ex-r8a774e1','sprd,sc2731-charger','mediatek,mt2712-evb','fsl,ls1043a-clockgen',
-		'xlnx,zynqmp-ddrc-2.40a','qcom,pm6150','kontron,sl28cpld','fsl,imx8mq-pcie','nvidia,tegra210-tsec',
-		'ti,am654-r5fss','amlogic,meson-sm1-gpio-intc','renesas,r8a77965-usb-dmac','hisilicon,hi6220','renesas,r8a77970-wdt',
-		'apm,xgene-shadowcat','rockchip,px5','qcom,q6afe-dais','amlogic,meson-gx-ao-sysctrl','nxp,sa56004',
-		'xiaomi,beryllium','national,lm96163','ti,j721e-pcie-host','nvidia,denver','cdns,uart-r1p12',
-		'vamrs,rk3399pro-vmarc-som','rockchip,rk3399-sapphire','ti,am654-cal','mediatek,mt6755','mediatek,mt8192-spi',
-		'nxp,pca9534','fsl,imx8m-irqsteer','samsung,exynos5433-cmu-bus1','ti,ina226','amlogic,meson-gxl',
-		'amlogic,meson-gxbb-scpi-sensors','mediatek,mt6797-sysirq','cznic,turris-mox','ti,j721e-dss','qcom,msm8996-apcs-hmss-global',
-		'mediatek,mt2712-nfc','qcom,sdm845-dwc3','amlogic,meson-gxbb-usb','rohm,bd71847','cdns,ufshc-m31-16nm',
-		'renesas,pcie-r8a77980','amlogic,p201','rockchip,px30-grf','renesas,iic-r8a77965','bitmain,bm1880-reset',
-		'qcom,pms405-regulators','google,scarlet-rev12-sku7','nvidia,p2371-2180','renesas,r8a774e1-usb-dmac','mediatek,mt7622-rtc',
-		'renesas,hscif-r8a7796','al,alpine-v2-evp','fsl,imx-sc-wdt','amlogic,meson-gxl-mali','renesas,thermal-r8a77995',
-		'goodix,gt5688','renesas,sdhi-r8a774a1','renesas,ebisu','mediatek,mt8183-ipu_adl','samsung,exynos5433-cmu-hevc',
-		'actions,s900-sps','qcom,msm8998-qusb2-phy','fsl,imx8mm-wdt','mediatek,mt8173-timer'
-
-	],	
-	'arm' : [
-
-		'marvell,pxa-rtc','marvell,dove-audio','arm,vexpress-energy','renesas,rcar_sound-r8a7744','marvell,berlin2cd-system-pinctrl',
-		'nextthing,gr8-evb','aspeed,ast2600-uhci','fsl,ls1021a-qds','zii,rave-sp-watchdog-legacy','mediatek,mt7629-pciesys',
-		'fsl,imx-audio-tlv320','fsl,imx51-usb','ti,am437x-ocp2scp','qcom,spmi-iadc','qcom,tcsr-apq8064',
-		'usb424,4040','brcm,iproc-nsp-sata-phy','lacie,laplug','atmel,at91sam9260-i2c','linksys,shelby',
-		'marvell,mv88f6820-pinctrl','atmel,at86rf233','ti,control-phy-usb2','ti,twl6030-vmmc','invn,mpu3050',
-		'marvell,rd88f6281-a','realtek,alc5632','compulab,omap3-sbc-t3530','st,l3g4200d-gyro','ti,pbias-dra7',
-		'atmel,at91rm9200-spi','amlogic,meson8-gpio-intc','brcm,bcm53012-srab','elan,ekth3500','fsl,imx51-uart',
-		'samsung,s3c6410-sdhci','arm,im-pd1-syscon','mediatek,mt7623a-rfb-emmc','fsl,imx6ul-qspi','teltonika,rut1xx',
-		'brcm,bcm21664-aon-ccu','renesas,qspi-r8a7791','sirf,atlas7-bt-uart','ti,omap2-sham','sirf,nocfw-rtcm',
-		'olimex,a20-olinuxino-lime','fsl,imx6sx-mu','marvell,berlin','allwinner,auxtek-t004','l+g,vinco',
-		'sirf,prima2-uart','fsl,imx28-pinctrl','fsl,imx6q-sabresd-wm8962','allwinner,sun8i-a33-drc','calaosystems,usb-s8815',
-		'renesas,pfc-r8a7778','google,veyron-speedy-rev2','logicpd,type28','orisetech,otm3225a','altr,socfpga-eth-mac-ecc',
-		'fsl,ls1021a-msi','brcm,bcm2711-cprman','mrvl,mmp-rtc','fsl,imx6ul-i2c','udoo,neofull',
-		'fsl,imx53-usb','st,stm32-cec','stericsson,u8500-clks','samsung,exynos4212-mixer','mediatek,mt2701-pinctrl',
-		'hp,t5325','amlogic,meson6-rtc','nvidia,tegra20','fsl,vf610-tcon','wm,wm8505-fb',
-		'hisilicon,hip01','arm,arm1176jzf-s','thingyjp,breadbee','allwinner,sun8i-r40-ir','st,stih407-fdma-mpe31-11',
-		'picochip,pc3x3','gw,gsc-adc','rockchip,rk3228-efuse','allwinner,sun8i-h3-system-control','ti,tca6507',
-		'fsl,imx7d-usb','rockchip,rv1108-timer','fsl,imx25-aips','renesas,sk-rzg1m','arteris, flexnoc',
-		'intel,pxa3xx-gpio','rockchip,gpio-bank','ti,am4372-wkup-m3-ipc','renesas,r7s9210-cpg-mssr','marvell,kirkwood-88f6283',
-		'brcm,bcm947xx-cfe-partitions','amlogic,meson8b-clk-measure','oxsemi,ox820-dwmac','samsung,s3c2440-hdmiphy-i2c','fsl,imx53-audmux',
-		'ti,dra7-l4-per2','dh,stm32mp157a-dhcor-som','mediatek,mt7623-ethsys','fsl,imx6qp-gpc','renesas,r8a7792-wdt',
-		'usb424,9514','ti,da850-ehrpwm','arm,cortex-a5-global-timer','socionext,milbeaut-timer','motorola,cpcap-pwrbutton',
-		'fsl,imx53-voipac-sgtl5000','arm,vexpress-scc','variscite,var-stk-om44','allwinner,sun8i-a33-display-backend','arm,vexpress-muxfpga',
-		'ti,twl4030-madc','brcm,bcm2835-aux-uart','fsl,imx51-nand','cnm,coda960','maxim,max77802',
-		'st,stih410-clk','socionext,uniphier-ld4-mio-clock','renesas,mmcif-sh73a0','st,stm32-dfsdm-adc','arm,vexpress,config-bus',
-		'maxim,max8973','samsung,universal_c210','nuvoton,npcm750-pwm-fan','renesas,r8a7743-sysc','marvell,kirkwood-88f6192',
-		'eukrea,mbimxsd25-baseboard-dvi-svga','allwinner,sun6i-a31s-display-engine','microchip,mcp2515','globalscale,sheevaplug-esata-rev13','syna,rmi4-i2c',
-		'st,spear600-gmac','aspeed,ast2500-wdt','nvidia,tegra20-vi','rockchip,rk3288-usb','actions,s500-timer',
-		'bosch,d_can','mediatek,mt7623-u3phy','mediatek,mt2701-infracfg','fsl,imx6q-usbphy','fsl,imx27-fec',
-		'st,st-ehci-300x','nvidia,tegra20-hdmi','fsl,imx23-clkctrl','renesas,ether-r8a7793','arm,cortex-a15',
-		'ti,sysc-omap3-sham','uniwest,imx6q-evi','nuvoton,npcm750-ehci','technologic,sja1000','boundary,imx6qp-nitrogen6_som2',
-		'renesas,jpu-r8a7792','amlogic,meson8-usb','google,pit-rev8','toradex,vf50-touchscreen','fsl,imx35-iim',
-		'aspeed,ast2600-scu-ic1','ti,am3-dpll-no-gate-j-type-clock','renesas,rskrza1','arm,vexpress-psram','sinovoip,bpi-m2-plus',
-		'gw,imx6q-gw51xx','amlogic,meson8-mali','sirf,atlas7-tick','rockchip,rv1108-pinctrl','google,nyan-big-rev1',
-		'olpc,xo1.75-ec','headacoustics,omap3-ha','atmel,sama5d34','socionext,uniphier-ld6b','renesas,i2c-r8a7744',
-		'renesas,r8a7794-cpg-mssr','marvell,88e1116','allwinner,q8-a23','novtech,chameleon96','mstar,l3bridge',
-		'renesas,scifa-r8a7791','fsl,imx23','amlogic,meson8-cbus-pinctrl','brcm,bcm28155-ap','arm,cortex-a15-gic',
-		'efm32gg,cmu','allwinner,sun6i-a31-ar100-clk','marvell,mv88e6085','facebook,wedge40-bmc','renesas,xhci-r8a7791',
-		'ti,tmp451','fsl,imx50-ssi','brcm,nsp-srab','st,stih407-front-syscfg','allwinner,sun8i-a23-pinctrl',
-		'nxp,lpc3220-hsuart','smsc,lan89218','logicpd,dm3730-torpedo-devkit','allwinner,sun8i-r40-hdmi-phy','fsl,vf610-mscm-cpucfg',
-		'sirf,prima2-i2c','nokia,n900-modem','mediatek,mt7623-topckgen','nvidia,tegra-audio-wm8903-harmony','hardkernel,odroid-xu',
-		'allwinner,sun9i-a80-cpus-clk','fsl,imx6sl-anatop','zte,zx296702','brcm,bcm11351','imx6q-nitrogen6x-sgtl5000',
-		'ti,omap4-dmic','via,vt8500-uart','atmel,sama5d4-aic','atmel,sama5d33','socionext,uniphier-pro4-mioctrl',
-		'qcom,pm8018-gpio','rockchip,rk3066-uart','fsl,qoriq-rcpm-2.1+','bosch,bmg160','mikrotik,crs305-1g-4s',
-		'fsl,imx6sll-sdma','arm,vexpress-reset','allwinner,sun4i-a10-display-engine','fsl,imx51-ipu','infineon,pxe1610',
-		'maxim,max77693-haptic','renesas,qspi-r8a7743','marvell,armada-xp-core-clock','st,spear310-evb','microchip,sam9x60-gpio',
-		'fsl,mma7660','fsl,imx7d-kpp','allwinner,sun4i-a10-i2s','renesas,scifb-r8a7793','brcm,bcm58300',
-		'renesas,pfc-r8a7790','arm,coresight-etm4x','compulab,sbc-imx7','fsl,imx25-fec','allwinner,sun4i-a10-display-frontend',
-		'sirf,nocfw-gpum','nxp,lpc1850-wwdt','fsl,imx1-pwm','ti,twl4030-power-idle','samsung,s5pv210-rotator',
-		'ti,am4-l4-per','samsung,s3c6410','samsung,exynos-sataphy-i2c','renesas,r7s72100-rtc','isee,omap5-igep0050',
-		'qcom,pm8018-pwrkey','renesas,r8a7740-cpg-clocks','fsl,imx6q-iomuxc','aspeed,ast2500-video-engine','boundary,imx6dl-nit6xlite',
-		'auo,b133xtn01','allwinner,sun4i-a10-ehci','renesas,r8a7744-rst','ti,twl4030-rtc','toshiba,tc35892',
-		'sharp,lq150x1lg11','renesas,pfc-sh73a0','aspeed,ast2400-i2c-ic','technexion,omap3-thunder','brcm,iproc-i2c',
-		'ti,dm816-emac','renesas,gose','brcm,bcm2711-pixelvalve2','ti,sysc-dra7-mcasp','brcm,bcm2711-pixelvalve0',
-		'allwinner,sun8i-r40-ehci','samsung,exynos5250-gsc','silabs,si470x','technexion,imx7d-pico-hobbit','allwinner,sun8i-a83t-de2-rotate',
-		'nxp,pcf2127','ti,cpsw-switch','grinn,imx6ul-litesom','H836ASDJ','ti,iva2.2',
-		'nvidia,tegra30-gpio','renesas,r8a7744-wdt','st,nomadik-mtu','lsi,axm5516','fsl,imx6sl-iomuxc',
-		'marvell,armada-380-comphy','fsl,imx6-rex-sgtl5000','arm,mps2','fsl,imx28-saif','fsl,emi-bus',
-		'samsung,exynos5420-fimd','brcm,bcm2711','karo,imx6ul-tx6ul-sgtl5000','atmel,at91sam9260-usart','armadeus,imx6ul-opos6ul',
-		'bosch,am335x-guardian','allwinner,sun9i-a80-drc','fsl,ocotp','amlogic,meson8b-rtc','brcm,spi-nsp-qspi',
-		'st,stm32f7-crc','mundoreader,bq-aquaris5','renesas,r8a7791-apmu','altr,socfpga-arria5','fsl,vf610-anatop',
-		'merrii,a80-optimus','rockchip,rk3288-spi','nvidia,tegra30-slink','mediatek,mt7623-eth','innolux,at070tn92',
-		'boundary,imx6q-nitrogen6x','marvell,armada-370-neta','allwinner,sun4i-a10-pinctrl','bosch,bmp280','buffalo,wxr-1900dhp',
-		'ams,as3722','allwinner,sun4i-a10-i2c','st,spear-spics-gpio','marvell,armada-370-pmsu','nxp,lpc3220-clk',
-		'allwinner,sun8i-r40-de2-mixer-1','socionext,uniphier-pro4-ref','maxim,max8998','mediatek,mt6580-evbp1','rex,imx6dl-rex-basic',
-		'sst,sst25vf032b','digilent,zynq-zybo','ti,am3-dpll-no-gate-clock','qca,qca8334','google,veyron-minnie-rev3',
-		'fsl,mc34708','qcom,mdm9615-pinctrl','renesas,ape6evm','qnap,ts219','overkiz,kizboxmini-rd',
-		'microchip,sam9x60-ddramc','ti,wl1285-st','plathome,openblocks-a6','brcm,bcm11351-smc','allwinner,sun9i-a80-ccu',
-		'motorola,cpcap-led-red','st,stm32h7-adc','arm,versatile-cm-auxosc','fsl,mvf600-fec','altr,socfpga-cyclone5-socdk',
-		'allwinner,sun9i-a80-smp-sram','zii,imx6qp-zii-rdu2','allwinner,sun8i-v3s-crypto','fsl,imx6q-sabrelite-sgtl5000','samsung,exynos5422-dmc',
-		'marvell,feroceon','ti,omap5-prm-inst','rockchip,rk3228-cru','qcom,mmcc-msm8960','qcom,scss-timer',
-		'marvell,rd-axpwifiap','fsl,imx7d-tempmon','marvell,kirkwood-eth-port','renesas,iic-r8a7740','intel,ixp42x-interrupt',
-		'samsung,exynos4412-dw-mshc','qcom,wcn3680','sirf,prima2-vpp','st,spear600','renesas,rza1-usbhs',
-		'st,stm32h7-mdma','st,stw5095','atmel,tcb-pwm','qcom,pm8941-mpp','rockchip,rv1108-pmugrf',
-		'st,stih407-thermal','ti,dra7x-usb2-phy2','renesas,pwm-r8a7743','nvidia,dalmore','st,stih407-lpc',
-		'renesas,mmcif-r8a7778','ti,am3352-gpmc','ti,omap2-onenand','fsl,imx23-lcdif','ti,netcp-1.0',
-		'atmel,sama5d2-shdwc','nvidia,tegra20-emc-table','fsl,imx7ulp-usdhc','atmel,hlcdc-display-controller','ti,da850-async3-clksrc',
-		'ti,tps62361','renesas,sh73a0-cpg-clocks','socionext,uniphier-scssi','nintendo,super-nes-classic','aspeed,ast2500-gpio',
-		'mediatek,mt7623-pcie','socionext,uniphier-pxs2-gentil','allwinner,sun6i-a31-cpuconfig','brcm,bcm47094','fsl,imx28-i2c',
-		'prt,prtrvt','google,nyan-big','arm,vexpress-flash','nvidia,tegra30-rtc','licheepi,licheepi-zero-dock',
-		'renesas,rza2mevb','altr,socfpga-perip-clk','ti,keystone-nand','renesas,rcar-gen2-ether','hp,t410',
-		'samsung,exynos5260-clock-aud','st,stm32mp157-pinctrl','panasonic,an30259a','zii,rave-sp-backlight','nvidia,tegra20-i2c-dvc',
-		'zyxel,nsa320','synology,ds413jv10','allwinner,parrot','samsung,exynos4210-hdmi','mediatek,mt7623-pctl-a-syscfg',
-		'ti,am4-prm-inst','ti,tps53659','amlogic,meson-mx-sdhc','xunlong,orangepi-pc-plus','elgin,rv1108-r1',
-		'iwave,g22d','renesas,thermal-r8a7744','renesas,r8a7744-cmt1','toradex,colibri-imx7s-aster','atmel,at91sam9m10g45ek',
-		'allwinner,sun4i-a10-ic','renesas,smp-sram','koe,tx14d24vm1bpa','fsl,imx7d-anatop','cortina,gemini-flash',
-		'allwinner,suniv-f1c100s-timer','qcom,apq8064-ahci','brcm,cygnus-armpll','allwinner,sun8i-a83t-r-pinctrl','fcs,fan53555',
-		'bosch,bme280','fsl,imx51-m4if','ricoh,rs5c372b','fsl,imx6sx-mmdc','ti,ina230',
-		'samsung,s6d16d0','compulab,sbc-t335','ti,k2g-edma3-tpcc','marvell,armada-370-corediv-clock','socionext,uniphier-denali-nand-v5b',
-		'ti,omap2-scm','renesas,r8a7794-cmt1','renesas,usbhs-r7s72100','fsl,imx50','allwinner,sun4i-a10-csi1',
-		'radxa,rockpi-n8','sirf,prima2-tick','allwinner,mk808c','rockchip,rk3288-pmu','ti,omap2430-interface-clock',
-		'fsl,imx6sll-iomuxc-gpr','fsl,imx6dl-sabresd','cdns,emac','atmel,sama5d2-classd','rockchip,rk3228-pinctrl',
-		'raspberrypi,compute-module','google,nyan-blaze-rev5','nvidia,tegra124-udc','brcm,cygnus-crmu-gpio','fsl,imx35-nand',
-		'marvell,dove-pinctrl','nxp,lpc1850-ccu','renesas,gpio-r8a7778','nvidia,tegra114-dsi','st,stm32h743-pinctrl',
-		'marvell,mv88e6xxx-mdio-external','fsl,vf610-twr','ti,tmp421','ti,omap2430','adi,ad5820',
-		'renesas,qspi-r8a7744','mediatek,mt2701-sysirq','socionext,uniphier-pro4-peri-reset','renesas,ether-r7s9210','atmel,at91sam9x5-clk-slow',
-		'fsl,imx53-fec','focaltech,ft5426','eukrea,mbmx283lc','allwinner,sun8i-a23-nand-controller','st,stih407-b2120',
-		'st,stih410-b2260','cnxt,cx92755-ic','ti,omap5-l4-per','renesas,sh73a0-mstp-clocks','qcom,gcc-ipq8064',
-		'allwinner,sun8i-h3-mdio-mux','nvidia,tegra124-flowctrl','cirrus,ep7209-spi','crystalfontz,cfa10049','lxa,stm32mp157c-mc1',
-		'ti,omap3-dpll-per-clock','mrvl,pwri2c','renesas,sk-rzg1e','brcm,bcm2835-usb','st,stm32mp157c-ed1',
-		'mediatek,mt7629-ethsys','ti,omap4-scrm','technexion,imx7d-pico-dwarf','rockchip,rk2928-pwm','ibm,rainier-bmc',
-		'tyan,palmetto-bmc','mediatek,mt7623-pinctrl','brcm,ns-ax-usb3-phy','mediatek,mt7629-pericfg','rockchip,rk3066a-pinctrl',
-		'fsl,imx6ull-iomuxc-snvs','atmel,sama5d2-flexcom','arm,arm11mp-scu','samsung,s3c6400-uart','fsl,imx31-wdt',
-		'qcom,ipq806x-ahci','mediatek,mt7623-cec','rockchip,rk3188-cru','eukrea,mbmx28lc','st,spear1310',
-		'arm,pl175','mediatek,mt7623-uart','arm,cortex-a9-global-timer','fsl,imx51-vpu','brcm,bcm2835-sdhci',
-		'fsl,imx6dl-nit6xlite-sgtl5000','arm,pl080','fsl,imx6ul-asrc','On-board Codec','ti,tpic2810',
-		'fsl,imx51-wdt','marvell,dove-lcd','brcm,brcmstb-ddr-phy-v240.1','nvidia,tegra-audio-rt5640-jetson-tk1','buffalo,lswsgl',
-		'socionext,uniphier-pxs2-soc-glue','st,lis331dl-accel','ti,netcp-gbe-5','ti,da850-vpif','cirrus,ep7209-syscon1',
-		'st,lps001wp-press','motorola,mapphone-mdm6600','fsl,imx7d-gpc','fsl,vf610-ocotp','fsl,imx23-ocotp',
-		'brcm,bcm7445-ahci','renesas,marzen','nxp,lpc1773-spifi','cypress,cyapa','msi,primo81',
-		'samsung,exynos4210-ohci','digilent,zynq-zybo-z7','marvell,a388-gp','atmel,at91sam9g20ek','rockchip,rk3036-evb',
-		'microchip,sam9x60-pmecc','fsl,imx6q-uart','ti,omap4','nvidia,tegra114-flowctrl','olimex,a20-olinuxino-micro-emmc',
-		'x-powers,axp209','rockchip,rk805','aspeed,ast2500-scu-ic','sirf,prima2-nand','arm,realview-eb-soc',
-		'sirf,nocfw-ddrm','olimex,a20-olinuxino-lime2','mediatek,eip97-crypto','nvidia,tegra114-ahub','renesas,r8a7779-mstp-clocks',
-		'microchip,sam9x60-dbgu','atmel,sama5d3-macb','brcm,bcm2711-rng200','marvell,a370-rd','imx6q-nitrogen6_som2-sgtl5000',
-		'qcom,pshold','altr,sdr-ctl','ti,k2g-dss','atmel,dataflash','renesas,hscif-r8a7778',
-		'google,veyron-pinky','wm,wm8505-pinctrl','phytec,am335x-pcm-953','hisilicon,hi3620-hi4511','nxp,pca9548',
-		'st,spdif-out','google,nyan-big-rev4','st,stih407-sbc-syscfg','ti,omap2-venc','hsg,h702',
-		'fsl,imx21-mmc','arm,psci-0.2','renesas,pcie-r8a7744','inventec,lanyang-bmc','himax,hx8357b',
-		'samsung,s2mps14-pmic','altr,socfpga-stmmac','samsung,s3c2416-irq','nokia,n810','fsl,imx7ulp',
-		'allwinner,sun8i-a33-video-engine','ti,omap4-smartreflex-iva','ti,pbias-omap3','mediatek,mt7629-apmixedsys','st,m25l1605d',
-		'ti,omap3-musb','rockchip,rk3188-gpio-bank0','roseapplepi,roseapplepi','qcom,pm8058-pwrkey','renesas,ether-r7s72100',
-		'renesas,i2c-r8a7745','fsl,imx25-sdma','rockchip,rv1108-dw-mshc','axentia,linea','neonode,zforce',
-		'arm,pl031','imx-sgtl5000','fsl,imx27','digi,ccimx6ulsbcexpress','lg,lh500wx1-sd03',
-		'ti,omap5-dsi','ovti,ov5642','qcom,apq8064-pinctrl','maxim,max8952','raidsonic,ib-nas6210',
-		'fsl,imx27-i2c','rockchip,rk3399-saradc','atmel,sama5d33ek','st,stm32-rng','microchip,sam9x60-qspi',
-		'renesas,rcar-gen1-gpio','allwinner,sun8i-h3-de2-clk','atmel,sama5d4-sfr','renesas,rza-wdt','fsl,imx7ulp-edma',
-		'mediatek,mt2701-u3phy','allwinner,sun7i-a20-pwm','tlm,trusted-foundations','fsl,imx-sgtl5000','fsl,imx1',
-		'allwinner,sun5i-a13-ts','st,spear310-pinmux','aspeed,ast2600-lpc-bmc','ysoft,imx6dl-yapp4-draco','phytec,imx6ull-pcl063',
-		'sigma,smp8758-thermal','gateworks,pld-gpio','google,veyron-mighty-rev5','rockchip,rk3066-vop','friendlyarm,nanopi-m1',
-		'atmel,at25256B','calxeda,hb-combophy','marvell,armadaxp-98dx3236','renesas,dmac-r8a7794','nxp,lpc4350',
-		'ti,omap4-venc','linksys,cobra','qcom,scm-ipq4019','fsl,imx53-vpu','samsung,exynos5420-dw-mshc-smu',
-		'motorola,mapphone-cpcap-regulator','st,lsm9ds1-imu','renesas,iic-r8a7792','rockchip,rk3066-smp-sram','samsung,s5pv210',
-		'socionext,uniphier-pro4-sanji','m25p80','ti,am4372','adi,adt7461a','allwinner,sun5i-a13-crypto',
-		'socionext,uniphier-pxs2-sysctrl','marvell,armada-370-gpio','ti,keystone,pll-mux-clock','qcom,msm8974-saw2-v2.1-cpu','qcom,pm8058-gpio',
-		'fsl,vf610-usbphy','renesas,can-r8a7791','mediatek,mt8173-xhci','eukrea,cpuimx27','google,veyron-tiger-rev5',
-		'fsl,imx21-ssi','fsl,sec-v4.0-pwrkey','allwinner,sun4i-a10-spdif','ti,dra746-pcie-rc','samsung,exynos5250-sata-phy',
-		'mediatek,mt7623-i2c','allwinner,sun5i-r8','renesas,r8a7794-cmt0','ti,tmp102','nvidia,tegra124-sor',
-		'brcm,bcm11351-a2-pl310-cache','microchip,ucs1002','pwm-beeper','samsung,exynos4210-jpeg','atmel,at91rm9200-udc',
-		'arm,cortex-a9-scu','ti,dra7-iodelay','fsl,imx6sll-lcdif','allwinner,sun8i-h3-spi','qcom,tcsr-msm8660',
-		'google,nyan-blaze-rev6','samsung,exynos4212-hdmiphy','renesas,tpu-r8a7744','renesas,irqc-r8a7794','kinetic,ktd253',
-		'Elpida,ECB240ABACN','alphascale,asm9260-icoll','arm,pl390','mediatek,mt2701-jpgenc','samsung,s3c2440-uart',
-		'novatek,nt35510','chipone,icn8318','variscite,var-som-om44','seagate,cumulus-max','bosch,bmc150_accel',
-		'renesas,mmcif-r7s72100','atmel,at45db642d','qcom,msm-uartdm-v1.4','qcom,kpss-wdt-ipq8064','qcom,msm-timer',
-		'fsl,imx-audio-cs42888','fsl,vf610-iomuxc','allwinner,sun8i-v3s-system-control','atmel,at91rm9200-usart','ti,omap4430-sdma',
-		'ti,am4372-counter32k','aspeed,ast2400-cvic','samsung,s3c6410-rtc','nuvoton,npcm750-adc','stericsson,ab8500-charger',
-		'mikrotik,rb3011','rex,imx6q-rex-pro','rockchip,rk3036','Goldelico GTA04A5/Letux 2804 with OneNAND','ti,edma3-tpcc',
-		'brcm,bcm11351-gpio','st,stm32mp1-dwmac','mediatek,mt8135-pericfg','brcm,BCM963138DVT','lacie,netxbig',
-		'nvidia,tegra-audio-wm8903-seaboard','renesas,can-r8a7792','ti,sn75lvds83','mediatek,mtk-musb','st,stm32-timer',
-		'fsl,imx51','toradex,colibri-imx7s-eval-v3','rockchip,rv1108-i2c','allwinner,sun4i-a10-system-control','mediatek,mt7622-spi',
-		'rockchip,rk3228-tsadc','lsi,zevio-usb','altr,rst-mgr','fsl,imx28-flexcan','x-powers,axp813-battery-power-supply',
-		'cirrus,ep7209-gpio','compulab,omap3-cm-t3517','audio-sgtl5000','fsl,mma8453','gw,imx6dl-gw553x',
-		'ti,omap4-aes','socionext,uniphier-ld4-aidet','lacie,d2net_v2','utoo,p66','renesas,i2c-r8a7793',
-		'renesas,scifa-r8a7740','ti,am33xx-ecap','allwinner,sun8i-a33-ths','google,pit-rev12','fsl,imx6ul-iomuxc-gpr',
-		'mele,m9','dh,imx6q-dhcom-som','st,stm32mp157c-ev1','atmel,at91sam9263-can','roofull,beelink-x2',
-		'amlogic,meson6-efuse','altr,socfpga-vt','spi-nand','gw,imx6dl-gw52xx','rockchip,rv1108',
-		'brcm,brcmstb-memc-ddr','altr,socfpga-denali-nand','fsl,imx50-iomuxc','fsl,imx51-tigerp','nvidia,tegra20-gr2d',
-		'maxim,ds3231','ti,twl6030-v1v8','allwinner,sun8i-a83t-tcon-tv','aspeed,ast2600-scu','atmel,at91sam9x5-sckc',
-		'fsl,imx6sx-sdma','st,stm32h743-rcc','sirf,nocfw-mediam','amd,imageon-200.1','qcom,ssbi-mpp',
-		'marvell,pxa-timer','buffalo,lswtgl','ste,dbx500-backupram','marvell,mmp2-audio-clock','nvidia,tegra124-efuse',
-		'intel,ixp4xx-gpio','st,stm32h7-adc-core','hisilicon,hip04-intc','marvell,mv88f6710-pinctrl','allwinner,sun5i-a13-display-frontend',
-		'nvidia,tegra124-soctherm','allwinner,sun4i-a10-can','ti,omap5-dmm','ti,omap3-cm','zte,zx296702-lsp0crpm-clk',
-		'samsung,exynos5250','st,spear1340-misc','fsl,imx7-mipi-csi2','motorola,mapphone-cpcap-usb-phy','allwinner,sun8i-h3-ths',
-		'atmel,sama5d2-xplained','mxicy,mx25l1606e','ti,tps65913-pmic','micrel,ks8851','google,veyron-mickey-rev5',
-		'allwinner,sun8i-h3','toradex,colibri-imx7d-emmc-eval-v3','aspeed,ast2400-p2a-ctrl','sil,sii9022-tpi','motorola,cpcap-battery',
-		'rk3036-codec','ebv,socrates','renesas,dmac-r8a77470','ti,sysc-omap3630-sr','google,veyron-mickey-rev6',
-		'fsl,imx6ul-anatop','lacie,netspace_v2','ti,am4372-hdq','nuvoton,npcm750-i2c','mediatek,mt6592',
-		'allwinner,sun9i-a80-r-pinctrl','samsung,exynos4210-mali','fsl,imx7-csi','melfas,mms114','socionext,uniphier-sld8-perictrl',
-		'rockchip,rk3288-timer','renesas,mmcif-r8a7794','gw,imx6q-gw5913','st,spear310-shirq','siliconfile,noon010pc30',
-		'brcm,bcm7445-hif-continuation','marvell,berlin2q-soc-pinctrl','arm,realview-pb1176-syscon','marvell,armada375-mbus','ti,tlv320aic23',
-		'samsung,exynos4412','technologic,imx6dl-ts7970','st,spear-pwm','fsl,vf610-pit','mediatek,mt7623-bdpsys',
-		'edt,edt-ft5x06','linksys,rango','samsung,exynos5260-clock-isp','dynaimage,al3010','qcom,tcsr-mutex',
-		'nvidia,tegra124-vic','allwinner,sun8i-a83t-ccu','arm,realview-pba8-syscon','marvell,88f5181-pinctrl','fsl,mc1323',
-		'allwinner,suniv-f1c100s-ccu','renesas,mmcif-r8a7745','cortina,gemini-pata','qcom,arch-cache','ti,am335x-timer',
-		'arm,arm926ej-s','phytec,am335x-regor','fsl,imx31-nand','st,stm32-sai-sub-b','marvell,armada-380-wdt',
-		'ti,keystone,pll-divider-clock','atmel,at91sam9g45-dma','aspeed,ast2500-pinctrl','marvell,mmp3-usb-phy','st,6556002',
-		'marvell,armada380','solidrun,hummingboard2/q','renesas,hspi-r8a7779','auo,b116xw03','fsl,imx51-gpt',
-		'ti,omap4430-timer','marvell,xscale','mele,i7','ti,am3352-ehrpwm','nvidia,beaver',
-		'st,vtg','renesas,sh-rtc','ysoft,imx6dl-yapp4-hydra','atmel,at91sam9g15-pmc','renesas,rcar-gen2-cmt1',
-		'renesas,vin-r8a7790','st,nomadik-nhk-15','fsl,imx51-kpp','socionext,uniphier-pxs2-reset','fsl,timrot',
-		'nextthing,gr8','renesas,gr-peach','ti,lp8732','ti,omap4-hwspinlock','ti,keystone-gpio',
-		'marvell,orion-gpio','nuvoton,npcm750-rng','silergy,syr827','enbw,cmc','fsl,imx31-kpp',
-		'mediatek,mt2701-cs42448-machine','renesas,scifb','fsl,imx25-rtc','ti,da830-ohci','zii,rave-sp-pwrbutton',
-		'renesas,can-r8a7742','allwinner,sun8i-a83t-r-lradc','via,vt8500-pwm','olimex,a20-olimex-som-evb-emmc','ti,wl1271-st',
-		'brcm,boot-sram','renesas,shdma-mux','adi,adm1266','mediatek,mt2701-disp-pwm','x-powers,axp221-battery-power-supply',
-		'arm,cortex-a7-pmu','mediatek,mt8127-sysirq','technexion,imx6dl-pico-hobbit','samsung,s5pv210-wakeup-eint','fsl,imx6ul-sdma',
-		'fsl,imx35','qcom,mdp5','st,spear300-pinmux','synology,ds110jv30','sirf,prima2-intc',
-		'ti,lm3630a','st,stm32mp1-adc-core','google,veyron-tiger-rev2','google,veyron-jaq-rev5','mediatek,mt8127',
-		'compulab,omap3-cm-t3530','maxim,max98090','isee,omap3-igep0030-rev-g','allwinner,sun8i-a83t-tcon-lcd','sirf,prima2-gps',
-		'allwinner,sun7i-a20-tcon1','renesas,r8a7793-cpg-mssr','ti,twl4030-vintana2','audio-graph-card','marvell,pxau2o-ehci',
-		'ti,am4372-cpsw-switch','fsl,imx53-wdt','allwinner,sun8i-a83t-mmc','socionext,uniphier-ld6b-ref','raspberrypi,3-model-a-plus',
-		'renesas,dmac-r8a7793','ti,k2g-qspi','ti,composite-no-wait-gate-clock','renesas,du-r8a7742','lemaker,bananapi',
-		'microchip,sam9x60-trng','ti,am33xx-pwmss','atmel,at45db321d','marvell,armada-375-spi','atmel,sama5d2-pmecc',
-		'sinlinx,sina33','ti,omap3-sham','marvell,a385-gp','fsl,imx27-weim','ti,omap2-wdt',
-		'fsl,imx1-gpt','ti,am335x-usb-phy','bosch,bma180','dlg,da9063l','arm,pl030',
-		'ti,dm8148','active-semi,act8945a-charger','ti,am335x-usb-ctrl-module','st,stih418-clkgen-plla9','ti,omap5-l4-cfg',
-		'fsl,imx6sl-ccm','renesas,etheravb-r8a7790','arm,pl022-dummy','ti,wl1835-st','wand,imx6q-wandboard',
-		'atmel,at91sam9g45-ddramc','st,spear320-pinmux','maxim,max77836-regulator','arm,cortex-a7-timer','renesas,r8a7793',
-		'fsl,vf610-usb','fsl,imx6q-pcie','mediatek,mt7623-hsdma','arm,vexpress-temp','ti,twl4030-gpio',
-		'fsl,imx50-gpt','cnxt,cx92755-usart','amlogic,meson8-rng','fsl,imx6sll-uart','samsung,mfc-v5',
-		'atmel,at91sam9rl-matrix','ti,am572x-beagle-x15','marvell,mmp2-ccic','dpot-dac','stericsson,ab8500-gpio',
-		'allwinner,sun6i-a31-wdt','national,lp5521','samsung,exynos5800-clock','renesas,scif-r8a7742','nvidia,tegra30-udc',
-		'wlf,wm8994','netgear,readynas-102','ti,am33xx','ti,omap3-isp','ti,twl6030-v2v1',
-		'ti,dra7-prm','cubietech,cubietruck','mikrotik,crs326-24g-2s','fsl,imx6q-tempmon','fsl,imx6s-csi',
-		'oxsemi,ox810se-rps-irq','ti,omap3-c64','dlink,dir-885l','fsl,imx28-usbphy','mediatek,mt2701-pericfg',
-		'cubietech,cubieboard2','zii,imx7d-rpu2','sinovoip,bpi-m2-ultra','moxa,moxart-sdhci','sst,sst39vf320',
-		'qcom,pm8058-led','solidrun,cubox-es','allwinner,i12-tvbox','zii,rave-sp-rdu2','aspeed,ast2400-vuart',
-		'calxeda,hb-xgmac','atmel,sama5d2-i2c','renesas,can-r8a7794','google,veyron-fievel-rev6','marvell,mpic',
-		'fsl,imx6sl-mmdc','synopsys,dwc3','snps,dwmac-3.72a','aspeed,ast2600-sdram-edac','friendlyarm,mini6410',
-		'nvidia,tegra124-uart','google,veyron-minnie','renesas,r8a7745-cmt1','arm,l220-cache','qcom,spi-qup-v1.1.1',
-		'toshiba,tc3589x-keypad','invensense,itg3200','marvell,armada-380-sdhci','fsl,imx6q-usdhc','megachips,stdp2690-ge-b850v3-fw',
-		'picochip,spacc-srtp','marvell,rd88f6281','ti,am335x-bone','marvell,88pm860x','cnm,coda7541',
-		'stericsson,u300-syscon-mclk','brcm,bcm2835-dsi1','bananapi,bpi-m2-plus-v1.2','nxp,pca9541','rockchip,rk3036-dw-mshc',
-		'ti,bq24150a','rockchip,rv1108-grf','crystalfontz,cfa10037','goodix,gt911','atmel,sama5d3-xplained',
-		'atmel,sama5d3-smc','ti,wait-gate-clock','allwinner,sun9i-a80','mmc-card','samsung,exynos5420-gsc',
-		'energymicro,efm32-gpio','ti,omap3-scm','atmel,at91rm9200-sdramc','nvidia,tegra124','fsl,imx21-fb',
-		'mediatek,mt8127-timer','fsl,imx27-audmux','atmel,sama5d4','st,nomadik-i2c','ti,dm8168-evm',
-		'gpio-restart','gw,imx6dl-gw51xx','brcm,brcmnand','allwinner,sun8i-h3-musb','led-backlight',
-		'ti,omap4-mpu','rockchip,rk3288-i2s','inet-tek,inet-q972','altr,socfpga-ecc-manager','atmel,at91sam9261ek',
-		'samsung,s5pv210-csis','nvidia,cardhu','smsc,lan9220','fsl,imx7d-iomuxc','nvidia,tegra20-pinmux',
-		'samsung,s2mps14-clk','menlo,m53menlo','amlogic,meson-gpio-intc','arm,realview-pb11mp-soc','olimex,a10s-olinuxino-micro',
-		'aspeed,ast2500-xdma','renesas,rcar-gen2-msiof','samsung,exynos5250-mixer','xlnx,zynq-zc770-xm013','semtech,sx1505q',
-		'fsl,imx6dl-vpu','ti,omap3-venc','allwinner,sun8i-r40-dma','allwinner,sun6i-a31','samsung,exynos5410',
-		'320x240x4','st,stm32-dwmac','fsl,imx53-aipstz','ti,da830-cppi41','ti,omap4-scm-wkup',
-		'marvell,orion-intc','raidsonic,ib-nas6220','luxul,xap-1410v1','toradex,apalis_t30-eval','lacie,ns2-leds',
-		'qcom,msm8960','altr,socfpga-fpga2sdram-bridge','ti,tlv320aic3x','aspeed,ast2500-lpc-ctrl','marvell,armada-375-xhci',
-		'ibm,cffps1','ti,am5748-idk','renesas,usbhs-r8a7745','giantec,gt24c32a','nvidia,tegra20-efuse',
-		'google,snow-rev5','winbond,w25q32dw','qcom,gsbi-v1.0.0','ti,abe-twl6040','ti,dra7-apll-clock',
-		'google,veyron-speedy-rev4','samsung,s5p6440-pwm','brcm,bcm953012k','amlogic,meson-mx-usb2-phy','toshiba,tc358767',
-		'toradex,tegra-audio-sgtl5000-apalis_tk1','tianma,tm070jdhg30','aspeed,ast2500-lpc-bmc','arm,integrator-ap-syscon','ste,mcde',
-		'samsung,exynos5260-clock-fsys','maxim,max7322','compulab,sbc-a510','vamrs,rk3288-vmarc-som','google,nyan-blaze-rev8',
-		'allwinner,sun8i-v3s-csi','ti,omap4-cm','fsl,imx6sx-usb','ti,twl6030-pwm','mediatek,mt7629-uart',
-		'micron,n25q256a','aspeed,ast2400-uhci','google,veyron','st,24c64','samsung,exynos5250-hsi2c',
-		'elimo,initium','ti,nspire-keypad','brcm,bcm58623-srab','atmel,at91sam9263ek','sirf,prima2-vip',
-		'samsung,exynos5260-hsi2c','rockchip,rk3228-mali','faraday,ftwdt010','w1-gpio','allwinner,sun4i-a10-ahci',
-		'gumstix,omap3-overo-tobiduo','cubietech,a80-cubieboard4','sensirion,sht15','microchip,sam9x60-isi','rockchip,rk3288-crypto',
-		'renesas,r8a7742-wdt','zii,imx51-scu2-mezz','sony,xperia-castor','st,stm32h7-rtc','pine64,pinecube',
-		'nvidia,tegra30-ictlr','renesas,qspi-r8a7793','brcm,iproc-mdio','google,nyan','sirf,atlas7-qspi-nor',
-		'socionext,uniphier-fi2c','google,veyron-fievel-rev5','renesas,r8a7779','ibm,witherspoon-bmc','renesas,r8a7743-wdt',
-		'ti,am335x-bone-black','moxa,moxart-rtl8201cp','realtek,rt5640','microchip,mcp23008','ti,gate-clock',
-		'picochip,otp-pc3x3','renesas,r8a7790-rst','atmel,at91rm9200-rtc','samsung,exynos4412-isp-clock','qcom,smp2p',
-		'ti,omap4430-bandgap','dlink,dns-325','st,stih407-hqvdp','toradex,colibri_imx6dl-v1_1-eval-v3','allwinner,sun8i-h3-rtc',
-		'zii,rave-sp-esb','nvidia,tegra20-gmi','rockchip,rk3288-spdif','ibm,tacoma-bmc','fsl,ls1021a-gpio',
-		'allwinner,sun5i-a13-sram-a3-a4','renesas,scifb-r8a7743','st,stih407-picophyreset','st,ahci','facebook,tiogapass-bmc',
-		'innolux,n156bge-l21','fsl,imx35-esai','ti,keystone-dwc3','renesas,tpu-r8a7745','silergy,syr828',
-		'brcm,bcm2835-sdhost','renesas,hscif-r8a7791','st,stm32mp1-ipcc','wlf,wm8978','renesas,sh-mobile-msiof',
-		'ti,omap2420-i2c','marvell,armada-375-system-controller','brcm,l2-intc','ti,abb-v1','raspberrypi,model-a',
-		'x-powers,axp152','marvell,armada-370-sata','dlg,da9053','kiebackpeter,imx53-ddc','nxp,lpc3220-rtc',
-		'arm,pl061','ti,omap2-mailbox','ibm,fsi-master-hub','fsl,imx6sll-pxp','rockchip,rk3036-uart',
-		'brcm,bcm2836-thermal','raumfeld,raumfeld-speaker-one-pxa303','xlnx,zynq-ddrc-a05','renesas,r8a7790-cpg-mssr','fsl,imx31-rnga',
-		'fsl,imx7ulp-wdt','ti,omap3-wdt','allwinner,sun9i-a80-tcon-tv','atmel,sama5d3-gem','aspeed,ast2600-spi',
-		'st,stm32f746-pinctrl','ti,tsc2004','renesas,rcar-gen1-scif','hisilicon,hix5hd2-clock','fsl,imx27-kpp',
-		'fsl,mma7455','melfas,mms152','qcom,pm8058','st,stih407-tvout','nvidia,tegra-audio-alc5632',
-		'renesas,du-r8a7744','qcom,tcsr-mdm9615','fsl,imx21-gpio','qcom,msm8974-pinctrl','imx-audio-es8328',
-		'google,pi-rev11','brcm,bcm88312','dlink,dir685-touchkeys','renesas,xhci-r8a7743','raidsonic,ib-nas62x0',
-		'brcm,iproc-hr2-gpio','google,veyron-speedy','ti,ds90cf384a','cdns,uart-r1p8','socionext,uniphier-pxs2-pinctrl',
-		'fsl,imx51-tzic','timll,omap3-devkit8000','iom,ix2-200','sirf,prima2-lcd','google,veyron-speedy-rev5',
-		'samsung,clock-xxti','ti,dm816-prcm','qcom,spmi-gpio','rockchip,rk3228-usb2phy','national,lm75a',
-		'st,stm32-exti','rockchip,rk3036-vop','sirf,atlas7-jpeg','compulab,sbc-am57x','ti,dra746-pwmss',
-		'renesas,can-r8a7744','moxa,moxart-mdio','marvell,orion-mdio','national,lp3974','renesas,usb-phy-r8a7744',
-		'brcm,kona-i2c','brcm,iproc-rng200','fsl,imx6qp-mmdc','marvell,88f6282-pinctrl','renesas,gpio-r8a7743',
-		'arm,realview-eb','aspeed,ast2600-lpc','renesas,r7s72100-ostm','allwinner,sun8i-h3-msgbox','calxeda,hb-sregs-l2-ecc',
-		'renesas,scifb-r8a7794','synology,ds111','endless,ec100','ti,omap4-scm-core','samsung,aquila',
-		'atmel,at91sam9x5-can','ti,am335-sdhci','socionext,uniphier-sd-v3.1.1','samsung,exynos4412-mct','rockchip,saradc',
-		'qcom,kpss-wdt','fsl,imx6sl-pwm','microchip,sam9x60-wdt','nxp,lpc3250','sigma,smp8759-wdt',
-		'brcm,bcm2835-pm-wdt','abb,aristainetos2-imx6dl-7','sirf,atlas7-pmipc','renesas,thermal-r8a73a4','moxa,moxart-apb-clock',
-		'sstar,ssd201-smpctrl','acer,a500-iconia-ec','fsl,ls1021a-clockgen','riot,imx6s-riotboard','ti,keystone,pll-clock',
-		'renesas,sh73a0-cmt1','samsung,klte','dx,cc44p','fsl,imx6sl-lcdif','faraday,fttmr010',
-		'renesas,thermal-r8a7790','fsl,imx6sl-kpp','brcm,bcm2835-thermal','fsl,imx6sl-iomuxc-gpr','nvidia,tegra124-rtc',
-		'ti,omap2-mpu','st,spear1340-miphy','ti,dra76-evm','arm,cortex-a5-scu','allwinner,sun8i-h3-crypto',
-		'composite-video-connector','ti,tps65917','qcom,apq8064-saw2-v1.1-cpu','google,veyron-mickey-rev1','auo,g070vvn01',
-		'allwinner,sun4i-a10-emac','rockchip,rk3229','qcom,msm8974-cnoc','marvell,berlin2cd-soc-pinctrl','ti,omap4-smartreflex-mpu',
-		'allwinner,simple-framebuffer','fsl,imx6sx-kpp','allwinner,gt90h-v4','fsl,imx50-uart','mediatek,mt2701-g3dsys',
-		'fsl,imx7d-ocotp','zii,vf610dev-c','fsl,imx6ul','mediatek,mt7629-topckgen','socionext,uniphier-sld8-sysctrl',
-		'x-powers,axp813-adc','tcg,tpm_tis-spi','atmel,at91rm9200-ssc','nxp,lpc1850-ehci','marvell,db-88f6282-bp',
-		'socionext,uniphier-uart','samtec,vining','adi,adt7411','fsl,aips-bus','insignal,arndale',
-		'google,pit-rev11','brcm,bcm953012hr','startek,startek-kd050c','rockchip,rk3228-evb','macnica,sodia',
-		'ibm,swift-bmc','ti,bq24735','axis,artpec6','nxp,lpc-eth','brcm,bcm2837-thermal',
-		'renesas,emev2-smu-clkdiv','ti,am3352-wkup-m3','qcom,pm8058-rtc','altr,socfpga-a10-pll-clock','st,stm32mp1,pwr-reg',
-		'allwinner,sun8i-h3-mdio-internal','fsl,imx-audio-wm8962','cnxt,cx92755-i2c','renesas,etheravb-r8a7792','atmel,at91sam9263-ac97c',
-		'stericsson,db8500-prcmu-regulator','amlogic,meson8-clkc','ti,omap4-dpll-j-type-clock','allwinner,sun8i-a23-dma','fsl,imx35-flexcan',
-		'st,stm32mp157c-dk2','arm,pl341','phontech,mpa1600','crystalfontz,cfa10058','allwinner,sun8i-h3-codec',
-		'ti,wl1831-st','renesas,r8a73a4','lsi,axm5516-amarillo','fsl,imx25-audmux','arm,syscon-icst525',
-		'samsung,exynos4212-fimc-lite','google,nyan-blaze-rev1','nvidia,tegra30-host1x','ubnt,unifi-switch8','allwinner,sun8i-v3-rtc',
-		'rockchip,rk3036-i2c','fsl,mc13892','qcom,mmcc-apq8064','hisilicon,peri-subctrl','ti,omap5-scm-core',
-		'marvell,mmp-sspa','toradex,colibri-imx7s','allwinner,sun9i-a80-ohci','atmel,at91sam9g45-trng','bosch,bmc150_magn',
-		'renesas,i2c-r8a7742','lacie,netspace_lite_v2','arm,versatile-pb','oxsemi,ox820-pinctrl','xlnx,xuartps',
-		'adapteva,parallella','amlogic,meson8-sdhc','raspberrypi,3-model-b','fsl,imx25-iomuxc','brcm,bcm6345-uart',
-		'ti,ads7843','haoyu,marsboard-rk3066','asahi-kasei,ak4642','renesas,sh-mmcif','st,stm32f4-adc',
-		'lltc,ltc3676','mediatek,mt7623-pericfg','ti,omap2-dispc','fsl,imx7d-iomuxc-lpsr','fsl,vf610-edma',
-		'renesas,rza1-irqc','atmel,at91sam9g20-i2c','fsl,imx7ulp-tpm','via,vt8500-ehci','lsi,zevio-intc',
-		'renesas,r8a7745-sysc','qcom,pm8921','sharp,ls037v7dw01','nxp,lpc4337','allwinner,sun8i-a83t',
-		'qcom,pm8921-mpp','renesas,i2c-r8a7778','fsl,imx6sl-evk-wm8962','ti,omap5-ipu','fsl,imx25-scc',
-		'fsl,imx6sx-iomuxc','fsl,imx6ul-adc','allwinner,sun5i-a13-ohci','nxp,pcal6416','usb424,2514',
-		'solidrun,hummingboard/dl','renesas,ether-r8a7794','qcom,pm8941-wled','nxp,lpc3220-adc','friendlyarm,nanopi-neo',
-		'mediatek,mt2701-smi-larb','st,spear1310-pinmux','brcm,bcm53011-srab','nxp,lpc1788-i2c','infineon,ir38064',
-		'nvidia,tegra114-apbmisc','tcg,tpm-tis-i2c','atmel,at91rm9200-pmc','ti,k2g-ecap','brcm,cygnus-asiu-gpio',
-		'qcom,ipq806x-gmac','nxp,pnx4008-wdt','ti,keystone','usb424,9512','terasic,de0-atlas',
-		'amlogic,meson8b-saradc','renesas,pfc-r8a7793','atmel,sama5d3-udc','ti,am3352-elm','renesas,irqc-r8a77470',
-		'allwinner,sun8i-a23-cpuconfig','allwinner,sun8i-h3-r-pinctrl','samsung,s5pv210-audss-clock','aspeed,ast2500-fmc','renesas,scifb-r8a7742',
-		'nvidia,tegra124-timer','rockchip,rv1108-usb2phy','socionext,uniphier-sld8-ref','marvell,db-dxbc2','qcom,mdss',
-		'ti,tfp410','samsung,exynos4210-mct','ti,am5718-idk','fsl,imx7d-lcdif','asus,rk3288-tinker-s',
-		'x-powers,axp221-usb-power-supply','marvell,mv98dx3236-cpu-clock','qcom,riva-pil','gumstix,omap3-overo-summit','ti,omap5',
-		'olimex,a20-olinuxino-lime-emmc','sirf,atlas7-ioc','snps,dw-wdt','renesas,r8a7744-usb-dmac','Primeview-PD050VL1',
-		'synology,ds212jv20','fsl,imx6qp-prg','aspeed,ast2600-sdhci','ti,am437x-gp-evm','cortina,gemini-tvc',
-		'renesas,ostm','sirf,ns2m30-rproc','ti,am4372-d_can','fsl,imx27-nand','renesas,dmac-r8a7742',
-		'allwinner,sun6i-a31-pinctrl','w25x32','socionext,uniphier-ld4-ref','samsung,exynos5250-audss-clock','ti,davinci-wdt',
-		'brcm,bcm2711-genet-v5','brcm,cygnus-pcie-phy','imx-audio-tlv320aic32x4','samsung,exynos5260-clock-mif','st,stm32h743i-disco',
-		'fsl,imx7d-iomuxc-gpr','allwinner,sun8i-v3s','nvidia,tegra30-efuse','nxp,pca9551','toradex,colibri-imx7d-emmc-aster',
-		'arm,cortex-a15-timer','sirf,prima2-dmac','semtech,sx9500','x-powers,axp813-ac-power-supply','nvidia,tegra20-kbc',
-		'st,pcm-audio','atmel,at45','brcm,bcm2711-i2c','phytec,imx6dl-pbac06','nvidia,tegra124-pcie',
-		'mediatek,mt2701-timer','ti,bq27541','socionext,uniphier-pxs2-sd-clock','dh,stm32mp157c-dhcom-picoitx','qcom,ipq8064-pinctrl',
-		'energymicro,efm32-uart','nvidia,tn7','mediatek,mt6397','allwinner,sun8i-a23','fsl,imx53-ecspi',
-		'calao,usb-a9g20-lpw','allwinner,sun7i-a20-csi1','myir,zynq-zturn','buffalo,lschl','arm,pl181',
-		'wm8960-audio','fsl,spba-bus','allwinner,app4-evb1','maxim,max77693','ti,omap3-evm-37xx',
-		'st,stm32mp15-hsotg','fsl,imx6sll-evk','ti,am437x-sk-evm','marvell,orion-crypto','nvidia,tegra-audio-max98090-nyan-blaze',
-		'nvidia,tegra30-pmc','fsl,imx53-ccm','snps,arc-emac','element14,imx7s-warp','toshiba,et8ek8',
-		'amd,ethanolx-bmc','ti,omap4-mailbox','renesas,r8a7745-rst','xlnx,zynq-zc702','armadeus,imx6q-apf6dev',
-		'ti,emif-4d5','renesas,dbsc3-r8a7740','marvell,kirkwood-88f6702','nvidia,tegra114-udc','armadeus,imx51-apf51dev',
-		'fsi-master-hub','ti,ads1015','aspeed,ast2600-sd-controller','atmel,sama5d27-som1-ek','mmc-pwrseq-sd8787',
-		'tfc,s9700rtwv43tr-01b','via,vt8500','brcm,bcm7445-gpio','amlogic,meson8b-analog-top','google,pi-rev12',
-		'i2se,duckbill-2-485','fsl,imx-parallel-display','axentia,natte-2','fsl,imx6q-iomuxc-gpr','allwinner,sun7i-a20-usb-phy',
-		'gw,imx6q-gw560x','renesas,r8a7778-reset-wdt','fsl,mag3110','picochip,pc7302-pc3x3','ti,am3359-tsc',
-		'samsung,fimc','nvidia,tegra20-emc','lgphilips,lb035q02','socionext,uniphier-pro4-clock','fsl,imx23-evk',
-		'st,cpufreq-spear','google,nyan-blaze-rev0','aspeed,ast2500-ibt-bmc','facebook,yosemitev2-bmc','microchip,sam9x60-hlcdc',
-		'axis,artpec6-pcie-ep','nvidia,tegra114-car','fsl,imx6sl-audmux','oki,ml86v7667','qcom,pm8841-mpp',
-		'rockchip,rk3066-mali','samsung,exynos5250-pmu','st,spear320-evb','ti,musb-am33xx','renesas,tpu',
-		'ti,am3352-eqep','netgear,readynas','oxsemi,ox820-rps-timer','ti,am4-scm','nvidia,tegra124-host1x',
-		'picochip,pc3x2-timer','allwinner,sun6i-a31-mipi-dsi','sii,43wvf1g','gateworks,gw2358','polaroid,mid2407pxe03',
-		'mediatek,mt2701-evb','ti,da850','pwm-regulator','arm,vexpress,v2p-ca15_a7','atmel,24cs01',
-		'renesas,kzm9g','wexler,tab7200','nvidia,tegra124-ehci','stericsson,gpio-coh901','karo,tx28',
-		'atmel,at91rm9200-dbgu','arm,cortex-a5-pmu','xunlong,orangepi-zero-plus2-h3','ti,nspire-clp','ti,omap4-dpll-x2-clock',
-		'st,stm32h7-uart','renesas,em-sti','atmel,at91sam9260-smc','cortina,gemini','eukrea,mbmx287lc',
-		'qcom,pm8018-rtc','allwinner,sun8i-a33-tcon','ti,am3359-adc','renesas,scifb-r8a7790','rockchip,rk3288-pmu-sram',
-		'murata,ncp15wb473','ti,tps65217-charger','solomon,ssd1305fb-i2c','rockchip,px3','mediatek,mt2701-mmc',
-		'boundary,imx6q-nitrogen6_max','seagate,dart-2','samsung,exynos3-sysreg','microchip,mcp23017','atmel,sama5d3-adc',
-		'qcom,krait','netgear,r6250v1','samsung,exynos3250-cmu-dmc','nvidia,tegra124-emc','renesas,pci-r8a7744',
-		'ti,tps65218-dcdc6','ti,twl4030-vintana1','ti,tps65911','atmel,24cs08','amlogic,meson8-clk-measure',
-		'fsl,tzic','arm,realview-pb1176','marvell,armada-390-corediv-clock','zii,imx7d-rmu2','samsung,exynos3',
-		'renesas,ipmmu-r8a7791','google,veyron-speedy-rev9','arm,core-module-versatile','gw,imx6q-gw5910','myir,myd-lpc4357',
-		'stericsson,snd-soc-mop500','fsl,imx6sx-lcdif','st,stm32mp1-rtc','motorola,cpcap','renesas,r8a7742-lvds',
-		'difrnce,dit4350','sharp,gp2ap002a00f','samsung,s5pv210-g2d','mediatek,mt2701-m4u','ti,k2g-gpio',
-		'allwinner,sun8i-a23-display-frontend','mediatek,mt7629-sgmiisys','tronfy,mxq','renesas,r8a7745-wdt','phytec,imx6ull-pbacd10-emmc',
-		'ti,omap3-dss-interface-clock','asus,nexus7-flo','google,veyron-tiger-rev8','current-sense-shunt','synology,power-off',
-		'wlf,wm8731','nxp,lpc3220-motor-pwm','socionext,uniphier-pxs2-vodka','brcm,bcm21664-smc','fsl,imx6sl-usbmisc',
-		'st,stih407-irq-syscfg','fsl,imx21-kpp','fsl,ls1021a-pcie','fsl,imx31-gpt','fsl,imx50-gpio',
-		'adi,adv7180cp','fsl,imx6ul-lcdif','atmel,at91sam9260-matrix','socionext,uniphier-pro4-ave4','st,sdhci-spear',
-		'renesas,irqc-r8a7793','nvidia,tegra30-vi','mediatek,mt8173-hdmi-ddc','allwinner,sun4i-a10-wdt','microchip,sam9x60-pmc',
-		'nxp,pn544-i2c','ti,palmas-clk32kgaudio','fsl,imx6q-sabrelite','ovti,ov5640','adi,ad7879-1',
-		'fsl,mma8452','qcom,ipq8064-ap148','ti,keystone,psc-clock','nxp,pca9575','samsung,monk',
-		'ti,omap2-aes','marvell,armada370-thermal','nxp,lpc1850-dac','marvell,mmp3','renesas,iic-r8a7793',
-		'fsl,imx6sx-adc','dlg,da9063-onkey','sirf,atlas7-bt-usp','nxp,lpc1850-uart','allwinner,sun9i-a80-ehci',
-		'brcm,bcm2835-dma','samsung,exynos5420-scaler','samsung,s5pv210-pinctrl','phytec,imx27-pca100','ti,dra7-cpsw-switch',
-		'toradex,vf500-colibri_vf50','ti,twl4030-vdd1','ti,am35xx-gate-clock','rockchip,rk3288-mali','st,stm32-syscfg',
-		'qcom,rpm-mdm9615','ti,omap5-opp-supply','renesas,du-r8a7743','google,cros-ec-i2c','fsl,imx53-sahara',
-		'aspeed,ast2600-timer','brcm,cygnus-audiopll','isil,isl29030','ti,omap5-l3-noc','st,camera',
-		'renesas,i2c-r8a7792','cortina,gemini-pci','motorola,cpcap-led-cp','faraday,tve200','mediatek,mt7623-pwrap',
-		'gw,imx6q-gw5904','arm,realview-pbx-soc','allwinner,sun7i-a20-ccu','lacie,net2big_v2','allwinner,sun8i-a83t-cpucfg',
-		'ea,ea3250','nvidia,tegra30-i2c','marvell,mv88f6928-pinctrl','google,veyron-speedy-rev6','ti,am335x-evm',
-		'socionext,uniphier-pxs2-sdctrl','armadeus,imx28-apf28','compulab,utilite-pro','thingyjp,breadbee-crust','firefly,firefly-rk3288-reload',
-		'ti,k2l-evm','allwinner,ba10-tvbox','ti,k2g-evm','socionext,uniphier-sld8-peri-clock','allwinner,sun4i-a10-hdmi',
-		'renesas,tpu-r8a7740','renesas,sysc-rmobile','xunlong,orangepi-pc','amlogic,meson6-ir','zealz,imx6q-gk802',
-		'lg,ld070wx3-sl01','atmel,at91sam9260-nand-controller','sirf,atlas6','qcom,rpmcc-msm8974','renesas,r8a77470-usb-dmac',
-		'qcom,spi-qup-v2.2.1','denx,ma5d4evk','gw,imx6q-gw551x','voipac,imx53-dmm-668','isil,isl29018',
-		'fsl,imx6sx-src','axis,artpec6-clkctrl','qcom,wcn3660','st,sti-pwm','ti,tmp275',
-		'marvell,kirkwood-eth','ovti,ov2680','phytec,imx6dl-pbac06-nand','atmel,sama5d4ek','st,m41t81',
-		'ti,secure-ram','Chimei-LW700AT9003','fsl,imx53-smd','renesas,jpu-r8a7790','microchip,sam9x60-matrix',
-		'ti,tsc2007','fsl,imx6q-flexcan','fsl,imx7d-i2c','allwinner,sun8i-r40-emmc','qcom,gcc-msm8660',
-		'invensense,mpu3050','sirf,atlas7-retain','renesas,sdhi-r8a73a4','allwinner,sun8i-a33-display-engine','renesas,rcar-gen1-i2c',
-		'nvidia,tegra30-mc','nvidia,tegra30-pcie','technexion,imx6dl-pico-dwarf','calxeda,hb-a9periph-clock','arm,vexpress,v2p-ca5s',
-		'rockchip,rk3188-spi','ti,dm814-intc','qcom,krait-pmu','ti,omap5-cm-core','qcom,mdp4',
-		'aries,ma5d4evk','fsl,imx53-ahci','amlogic,meson8m2-saradc','fsl,imx6sx-gpio','globalscale,dreamplug',
-		'nvidia,tegra20-slink','xen,xenvm','nvidia,tegra30-hdmi','ti,tps659038','buffalo,wzr-600dhp2',
-		'marvell,a385-rd','atmel,sama5d34ek','emtrion,emcon-mx6-avari','allwinner,sun4i-a10-mod0-clk','samsung,s5pv210-mipi-video-phy',
-		'ti,dra7-l4-cfg','brcm,bcm4334-fmac','atmel,at91sam9g46-tdes','mediatek,mt8173-efuse','sigma,vantage-1172',
-		'ti,am33xx-intc','fsl,imx7d-sdb-reva','wm,wm8505-i2c','renesas,r1ex24128','ti,dra7xx-phy-gmii-sel',
-		'anvo,anv32e61w','fsl,imx6sll-pwm','brcm,brcmstb-gpio','allwinner,sun8i-a23-usb-phy','renesas,r8a7790-cmt0',
-		'atmel,sama5d3xmb-cmp','raspberrypi,model-b','technexion,imx6dl-pico-nymph','brcm,kona-usb2-phy','marvell,orion5x-88f5181',
-		'kosagi,imx6q-novena','fsl,imx6q-ba16-sgtl5000','renesas,pfc-r8a77470','ge,achc','oct,stm32mp15xx-osd32',
-		'arm,cortex-a9','renesas,hscif-r8a7742','ti,dm6441-gpio','st,nomadik-gpio','nvidia,tegra30-car',
-		'hardkernel,odroid-hc1','dallas,m41t00','intel,ixp4xx-network-processing-engine','renesas,pfc-r8a7779','marvell,mmp2-usb-phy',
-		'renesas,msiof-r8a7744','xunlong,orangepi-zero','samsung,s5pv210-fimc','ste,mcde-dsi','fsl,imx6dl-sabreauto',
-		'w25x80','aspeed,ast2500-lpc-host','idt,89hpes32h8','amazon,omap4-kc1','ethernet-phy-id0141.0cb0',
-		'fsl,imx6ul-gpc','tc3589x-gpio','renesas,pci-r8a7743','renesas,qspi-r8a77470','qcom,apq8084-sdhci',
-		'arm,vexpress,v2p-ca15,tc1','pci-host-ecam-generic','qcom,msm8974','x-powers,axp221','toradex,apalis_imx6q-ixora',
-		'allwinner,sun8i-h3-ohci','samsung,exynos3250-tmu','aspeed,ast2500-i2c-ic','google,spring','renesas,r8a7742',
-		'hisilicon,hip01-ca9x2','facebook,wedge100-bmc','fsl,imx6sx-gpt','mediatek,mt7623-xhci','ti,omap4-ipu',
-		'aesop,torbreck','renesas,pwm-r8a7742','denx,mcvevk','renesas,r8a73a4-cpg-clocks','brcm,bcm11351-wdt',
-		'dlg,da9063-watchdog','allwinner,sun6i-a31s','ramoops','fsl,imx6q-gpmi-nand','brcm,bcm21664-master-ccu',
-		'nuvoton,npcm750-rst','intel,xscale-uart','qcom,gcc-apq8084','ti,am4372-wkup-m3','fsl,imx6q-ocotp',
-		'mediatek,mt2701-disp-ovl','maxim,max8997-pmic','mediatek,mt2701-vdecsys','allwinner,q8-a33','socionext,uniphier-pxs2-usb3-hsphy',
-		'fsl,imx6-wandboard-sgtl5000','qcom,msm8960-cdp','st,stm32f769-pinctrl','renesas,scifa-r8a7743','fsl,imx27-gpt',
-		'fsl,imx6ul-uart','rockchip,rk3066-emac','renesas,em-gio','gemei,g9','atmel,at91sam9260-rstc',
-		'st,lsm303dlh-accel','olimex,a13-olinuxino','emCON-avari-sgtl5000','ampire,am-1280800n3tzqw-t00h','rockchip,rk3288-cru',
-		'google,nyan-blaze-rev7','marvell,mmp-gpio','compulab,trimslice','brcm,iproc-touchscreen','renesas,mmcif-r8a7744',
-		'renesas,scif-r8a7791','ti,omap3-mcbsp','renesas,sdhi-mmc-r8a77470','stericsson,u300-apptimer','maxim,max77686',
-		'pisosr-gpio','sii,s35390a','marvell,orion5x-88f5182-mbus','renesas,pci-r8a7742','mediatek,mt2701-pwrap',
-		'renesas,hscif-r8a7792','ti,tlv320aic3106','fsl,imx28-digctl','aspeed,ast2500-rtc','st,stm32-sai-sub-a',
-		'marvell,pxa168-eth','globalscale,mirabox','ibm,p8-occ-hwmon','fsl,imx6sll-mmdc','ti,am43',
-		'amlogic,meson-mx-sdio','marvell,berlin2q-system-pinctrl','socionext,uniphier-xdmac','ti,omap5-wdt','solidrun,cubox-i/q',
-		'google,veyron-fievel-rev2','myir,imx6ull-mys-6ulx-eval','isee,am335x-igep0033','arm,coresight-static-funnel','renesas,jpu-r8a7791',
-		'sirf,prima2-minigpsrtc','zte,zx296702-ad1','st,stm32746g-eval','toshiba,tc3589x-gpio','fsl,imx6qp-sabreauto',
-		'nvidia,tegra20-ac97','st,spear1310-evb','renesas,pfc-r8a7745','ti,omap4460-bandgap','allwinner,sun7i-a20-gmac',
-		'brcm,bcm2835-i2s','samsung,ltn101nt05','arm,syscon-icst525-integratorcp-cm-mem','fsl,imx6sx-pwm','arm,realview-pb11mp-syscon',
-		'pwm-clock','dummy,dit-hifi','renesas,pfc-r8a7744','marvell,rd88f6281-z0','altr,a10sr',
-		'ti,cpsw','qcom,wcnss-bt','amlogic,meson8b-smp-sram','renesas,usb-phy-r8a7791','engicam,imx6ul-isiot',
-		'st,lis331dlh','nintendo,nes-classic','allwinner,sun8i-h3-display-engine','brcm,bcm21664-i2c','sil,sii9022',
-		'allwinner,sun4i-a10-usb-phy','gpio-decoder','atmel,sama5d36','qcom,lcc-apq8064','ti,omap-usb3',
-		'marvell,armada-38x-crypto','marvell,berlin2cd','phytec,imx6q-pbab01','google,veyron-mighty-rev1','ti,omap3-smartreflex-mpu-iva',
-		'atmel,at91sam9260-wdt','nvidia,tegra114-ehci','delta,dps650ab','ds1100','mediatek,mt2701',
-		'allwinner,sun8i-r40-system-control','ti,dra7-pcie-ep','mediatek,mt7623-disp-ovl','sirf,nocfw-cpum','tenda,ac9',
-		'samsung,s5pv210-dmc','ti,am3359-icev2','toradex,apalis_imx6q','renesas,r1ex24016','sirf,atlas7-pwrc',
-		'aries,m28evk','microchip,sam9x60-nand-controller','ti,dra7xxx-qspi','mediatek,mt7623-sysirq','isil,isl29028',
-		'rockchip,rk3288-efuse','toradex,colibri_t20-eval-v3','fsl,imx6sl-i2c','google,veyron-tiger-rev1','ge,imx6q-b650v3',
-		'st,stm32h743i-eval','mediatek,mt8135-sysirq','atmel,sama5d2-chipid','ge,imx6q-b450v3','google,nyan-big-rev5',
-		'fsl,imx7ulp-evk','toradex,vf610-colibri_vf61-on-eval','nxp,lpc1850-creg','sirf,atlas6-clkc','dlg,da9062-watchdog',
-		'chipspark,popmetal-rk3288','fsl,mc13783','st,stih407-uni-player-pcm-out','mx66l51235l','fsl,imx7ulp-lpi2c',
-		'solomon,ssd1306fb-i2c','fsl,imx6sll','maxim,max77836','fsl,mpr121','maxim,max77693-charger',
-		'fii,kudo','raspberrypi,4-model-b','fsl,imx6sll-gpio','sigma,tango4-clkgen','micron,n25q128a13',
-		'incircuit,icnova-a20-swac','smsc,lan9303-i2c','sirf,prima2-usp-pcm','renesas,ipmmu-r8a7744','brcm,bcm2835-pwm',
-		'fsl,imx28-fec','elan,ekth3000','mediatek,mt7623-pwm','ti,am335x-shc','nvidia,tegra114-sdhci',
-		'arm,sp804','adi,adv7513','nvidia,tegra124-gpio','nvidia,tegra20-flowctrl','brcm,cygnus',
-		'stericsson,db8500-pinctrl','renesas,em-uart','linksprite,a10-pcduino2','toshiba,tc358764','phytec,imx6q-pbac06-emmc',
-		'ti,omap4-sdp','marvell,98dx4122-pinctrl','picochip,pc3x3-clk-gate','globalscale,guruplug','google,pit-rev10',
-		'nvidia,tegra114-pwm','phytec,imx6dl-pbab01','fsl,imx-osc26m','socionext,uniphier-ld4','sony,xperia-yuga',
-		'renesas,xhci-r8a7790','brcm,bcm53342','ti,dra7-l3-noc','rockchip,rk3288-dp-phy','samsung,exynos5420-mali',
-		'laird,dvk-som60','toradex,colibri-imx6ull-wifi-eval','aspeed,ast2600-mdio','arm,vexpress-sysreg','renesas,hscif-r8a7744',
-		'mele,a1000g-quad','nvidia,tegra-audio-wm8903-cardhu','aspeed,ast2400-adc','qcom,rpm-pm8018-regulators','bosch,bma023',
-		'lacie,net5big_v2','marvell,berlin2q-dmp','kobol,helios4','st,stm32h7-spdifrx','tpo,tpg110',
-		'mediatek,mt6323-regulator','arm,pl354','ti,da830-usb-phy-clocks','google,veyron-jaq-rev2','renesas,r8a77470-cmt0',
-		'brcm,bcm2836-vchiq','allwinner,sun8i-h3-pwm','qcom,pm8821','renesas,ipmmu-r8a7742','samsung,exynos5-sysreg',
-		'qcom,msm8960-pinctrl','ti,dm816','aspeed,ast2400-timer','brcm,bcm63138-armpll','rockchip,rk3228-hdmi-phy',
-		'fsl,imx51-babbage','renesas,scif-r8a77470','google,veyron-fievel-rev4','faraday,ftide010','poslab,imx6dl-savageboard',
-		'st,stm32-pwm','st,stm32mp151-pwr-mcu','brcm,brcmnand-v7.0','brcm,ocotp','samsung,mfc-v8',
-		'ti,tps65217','rockchip,rv1108-saradc','allwinner,sun7i-a20-sram-a3-a4','st,stmpe-ts','bluegiga,apx4devkit',
-		'ti,omap4-cm1','boundary,imx6q-nitrogen6_som2','atmel,sama5d2-pwm','brcm,bcm2835-hvs','arm,versatile-pci',
-		'st,stm32-tamp','samsung,exynos5250-dw-mshc','swir,wp8548','sirf,atlas7-cb','marvell,berlin2-system-pinctrl',
-		'marvell,armada-390-core-clock','altr,socfpga-dma-ecc','ti,tps65218-pwrbutton','qcom,saw2','samsung,exynos4210-fimc',
-		'arm,pl050','fsl,ls1021a','google,veyron-tiger','atmel,at91sam9263-pmc','ti,twl4030',
-		'mikrotik,crs328-4c-20s-4s','samsung,exynos5260-clock-egl','ti,omap3630','brcm,bcm4708','nxp,pca9544',
-		'rockchip,rk3036-usb','fsl,imx6sx-i2c','ti,am335x-cpsw','fsl,imx6sx-ecspi','faraday,fotg210',
-		'imx53-mba53-sgtl5000','snps,dw-mipi-dsi','amlogic,meson8-sdio','marvell,kirkwood-thermal','ti,tlv320aic3111',
-		'atmel,at91sam9g45-ehci','nuvoton,w83795g','ti,am35xx-interface-clock','fsl,imx-audio-ac97','sff,sff',
-		'nokia,smia','ti,bq20z45','brcm,sata3-ahci','arasan,sdhci-8.9a','microchip,24c32',
-		'fsl,imx28-pwm','renesas,r8a77470-apmu','sirf,prima2-pciiobg','allwinner,sun9i-a80-nmi','fsl,imx6ulz-14x14-evk',
-		'ti,nspire-cx','nokia,omap3-n900','atmel,at91sam9263-ebi0','renesas,r7s9210','allwinner,suniv-f1c100s-sram-d',
-		'itead,itead-ibox-a20','nvidia,tegra20-ehci','atmel,at91sam9n12','renesas,prr','oxsemi,ox820-sys-ctrl',
-		'fsl,imx51-sdma','plathome,openblocks-ax3-4','allwinner,sun8i-a83t-ths','olimex,a10-olinuxino-lime','qcom,apq8064',
-		'fsl,imx-audio-es8328','simple-pm-bus','toradex,colibri_imx6dl-eval-v3','renesas,etheravb-r8a77470','brcm,bcm58622-srab',
-		'fsl,imx53-usbmisc','marvell,armada-370-xp','renesas,r8a77470-sysc','yadro,nicole-bmc','fsl,imx6sx-mqs',
-		'sirf,atlas7','qcom,msm8974-ocmemnoc','allwinner,sun5i-a13','nuvoton,npcm750','exar,xra1403',
-		'arm,realview-pba8','renesas,xhci-r8a7744','ti,da830-usb-phy','allwinner,sun8i-r40-dw-hdmi','allwinner,sun7i-a20-can',
-		'asahi-kasei,ak8975','cnxt,cx92755-uc','qcom,spmi-temp-alarm','allwinner,sun8i-a23-drc','qcom,scm-ipq806x',
-		'marvell,pxa270-pwm','brcm,bcm59056','hisilicon,hi3519-sysctrl','allwinner,sun8i-a83t-msgbox','dps650ab',
-		'caninos,labrador-v2','google,snow-audio-max98095','gpio-fan','stericsson,ab8500-ext-regulator','mstar,infinity2m',
-		'ti,clkctrl-l4sec','fsl,imx27-iim','allwinner,sun4i-a10-display-backend','renesas,r8a7743','renesas,r8a7744',
-		'coresight-etb10','qcom,gpu-pwrlevels','meraki,mr32','ti,am3517-hecc','brcm,iproc-static-adc',
-		'atmel,sama5d2-smc','marvell,dove-mbus','samsung,s3c2440-i2c','ti,amc6821','samsung,exynos5250-usb2-phy',
-		'google,veyron-jerry','qcom,mdss-dsi-ctrl','arm,coresight-etm3x','samsung,s3c2416','renesas,r8a7743-usb-dmac',
-		'aspeed,ast2500-sgpio','n25q00aa','yadro,vesnin-bmc','qcom,pm8941-pwrkey','rocktech,rk070er9427',
-		'atmel,at91sam9261-nand-controller','google,peach','renesas,iic-r8a73a4','nvidia,tegra124-hda','atmel,at91sam9x5',
-		'arm,vexpress-reboot','rockchip,rk3288-power-controller','ti,am4-l4-wkup','st,spear1340-pcie','rockchip,rk3188',
-		'ti,omap4-dpll-m4xen-clock','ti,omap5-sham','st,nomadik-src-clock','renesas,kzm9d','marvell,a385-db-amc',
-		'ti,am437-sdhci','solidrun,cubox-i/dl','advantech,imx6q-dms-ba16','ti,dra62x','ti,da850-async1-clksrc',
-		'samsung,exynos5250-rotator','dallas,ds1672','samsung,exynos4','ti,k2g-sci','ti,omap2420-1w',
-		'actions,s500-uart','allwinner,sun8i-h3-hdmi-phy','mapleboard,mp130','nxp,lpc3220-sic','lg,lp129qe',
-		'qcom,msm8660-surf','fsl,imx31-iim','brcm,cygnus-ccm-gpio','lg,acx467akm-7','samsung,odroid-xu3-audio',
-		'qcom,rpm-msm8974','nvidia,tegra114-uart','allwinner,sun6i-a31-r-intc','vxt,vl050-8048nt-c01','nvidia,nvec',
-		'gw,imx6dl-gw5903','friendlyarm,tiny4412','ti,twl4030-vmmc2','csq,cs908','allwinner,suniv-f1c100s-pinctrl',
-		'mediatek,mt8127-uart','mqs-audio','allwinner,sun6i-a31-spdif','allwinner,sun7i-a20-sid','arm,cortex-a12-pmu',
-		'kionix,kxsd9','qcom,bam-v1.7.0','snps, dwc-eth-qos','samsung,trats2','google,nyan-big-rev7',
-		'allwinner,sun8i-a83t-i2s','marvell,mv98dx3236-corediv-clock','fsl,imx53-ldb','ibm,romulus-bmc','ti,netcp-gbe-9',
-		'fsl,imx1-uart','nvidia,tegra114-usb-phy','samsung,exynos4212-i2c-isp','allwinner,sun8i-h3-ccu','atmel,at91sam9260-adc',
-		'marvell,berlin2-adc','nvidia,tegra114-gpio','mediatek,mt7629-infracfg','fsl,imx25','nvidia,tegra114-ictlr',
-		'brcm,bcm2836-l1-intc','microchip,ksz8563','ti,da850-ecap','fsl,imx6qp','marvell,armadaxp',
-		'fsl,imx6q-pwm','miniand,hackberry','Sharp-LQ035Q7','ti,dra7-dsp-iommu','qcom,usb-hs-phy',
-		'nvidia,tegra-audio-wm9712','wm,wm8850-pinctrl','powervr,sgx531','alps,hscdtd008a','haoyu,a10-marsboard',
-		'fsl,imx6sx-sdb','fsl,imx27-cspi','brcm,bcm4708-pinmux','ltc2977','st,lis33de',
-		'ti,lm75','gw,imx6dl-gw54xx','qcom,pma8084','i2se,duckbill-2-enocean','overkiz,smartkiz',
-		'arm,vexpress,v2p-ca9','imx6dl-nit6xlite-sgtl5000','ti,keystone-pcie','stericsson,ab8500-regulator','ti,am3352-phy-gmii-sel',
-		'hisilicon,hi3519-crg','ouya,ouya','snps,dw-apb-wdg','ti,omap4-dsp','mediatek,mt7623-nfc',
-		'nvidia,tegra124-xusb','google,chromecast','nvidia,tegra30-pwm','nxp,pca9535','arm,versatile-tft-panel',
-		'DVI-SVGA','google,pit-rev13','ti,omap2420-mcbsp','fsl,imx51-weim','renesas,vin-r8a7745',
-		'seagate,dart-4','st,stmfx-0300','st,st-ohci-300x','ad,tegra-audio-plutux','mediatek,mt6397-regulator',
-		'fsl,imx25-epit','nvt210','renesas,du-r8a7793','fsl,imx1-weim','qcom,scm',
-		'mediatek,mt7623-apmixedsys','qcom,qfprom','ti,wl1273','ti,omap2420','ssif-bmc',
-		'renesas,hspi-r8a7778','sirf,ns2kal0-rproc','marvell,tauros2-cache','allwinner,sun8i-a23-tcon','nvidia,tegra-audio-wm9712-colibri_t20',
-		'ti,tca6424','gardena,smart-gateway-at91sam','arm,pl111','ti,omap-twl4030','ti,dra7-l4-wkup',
-		'fsl,ls1021ar2-flexcan','atmel,sama5d3','allwinner,sun8i-h3-video-engine','nvidia,tegra30-hsuart','fsl,ls1021a-extirq',
-		'marvell,dove-crypto','ti,usbhs-host','marvell,kirkwood-pcie','socionext,uniphier-sd-v2.91','mediatek,mt6589-sysirq',
-		'renesas,r1ex24002','lg,lp079qx1-sp0v','nvidia,tegra148-apbdma','oxsemi,ox810se-reset','elan,ektf2132',
-		'brcm,bcm5301x-rng','foxlink,fl500wvr00-a0t','brcm,bcm23550-sparrow','nvidia,tegra20-dc','fsl,imx6sx-pcie',
-		'olimex,a20-olinuxino-micro','aspeed,ast2400-video-engine','fsl,imx6q-arm2','rda,8810pl-uart','renesas,vin-r8a7743',
-		'sirf,prima2-efuse','xunlong,orangepi-i96','google,veyron-brain-rev0','rockchip,rk3036-emac','sirf,atlas7-sdhc',
-		'luxul,xwc-1000','fsl,imx6ul-gpio','mediatek,mt7623-auxadc','ti,am3-dpll-j-type-clock','nxp,lpc1850-adc',
-		'ti,omap3-1w','qcom,i2c-qup-v2.2.1','aries,imx53-m53evk','marvell,88E1510','ti,am3352-uart',
-		'wlf,wm1811','arm,cci-400-ctrl-if','rockchip,rk3036-timer','ti,dra752-bandgap','rockchip,rk3188-uart',
-		'eckelmann,siox-gpio','st-ericsson,mop500','mrvl,pxav3-mmc','kontron,imx6ul-n6310-som','altr,socfpga-fpga2hps-bridge',
-		'renesas,scifb-r8a7791','brcm,bcm47081','renesas,scifa-r8a7742','arm,pl320','calao,tny-a9260',
-		'nokia,n8x0','fsl,imx6sl-spdif','ti,omap4-musb','al,alpine-sysfabric-service','infineon,slb9670',
-		'kontron,imx6ul-n6310-s','rockchip,rk3188-i2s','brcm,brcmnand-v7.1','ti,tsc2046','bosch,m_can',
-		'renesas,vin-r8a7742','samsung,exynos4210-rotator','fsl,imx23-gpmi-nand','allwinner,sun5i-a13-mmc','aspeed,ast2400-ehci',
-		'rockchip,rk3228-spdif','allwinner,sun8i-v3s-de2-mixer','marvell,axp-matrix','netgear,r8000','marvell,88f6281-pinctrl',
-		'renesas,qspi-r8a7790','allwinner,sun7i-a20-mali','ti,netcp-gbe','sandisk,sansa_fuze_plus','st,stih407-rear-syscfg',
-		'renesas,r7s72100-mstp-clocks','renesas,sysc-r8a7740','rockchip,rv1108-pwm','allwinner,sun8i-h3-r-ccu','mediatek,mt7629-spi',
-		'qcom,ipq4019-wifi','fsl,imx7d-dma-apbh','ti,am33xx-l4-fw','rohm,bh1780gli','openpandora,omap3-pandora-600mhz',
-		'hisilicon,hisi-ahci','atmel,at91sam9x5-matrix','ralink,rt2880-uart','rockchip,rk3228-spi','spansion,s25fl008k',
-		'cypress,tm2-touchkey','armadeus,imx27-apf27dev','ti,composite-mux-clock','rockchip,rk3228-i2s','marvell,pxa-ohci',
-		'i2c-demux-pinctrl','brcm,bcm2837','lltc,lt3593','socionext,uniphier-pxs2-usb3-regulator','arm,pl310-cache',
-		'mrvl,mmp2','aspeed,ast2600-fsi-master','gpio-beeper','fsl,imx6sll-usdhc','mediatek,mt2701-dsi',
-		'lsi,nspire-classic-ahb-divider','st,stw4811','digi,connectcore-ccxmx51-som','urt,umsh-8596md-19t','altr,fpga-passive-serial',
-		'stericsson,ab8500-usb','isl,isl12022','google,veyron-tiger-rev6','samsung,exynos5420-jpeg','atmel,sama5d3-sckc',
-		'st,stm32f746-disco','samsung,exynos5260-clock-top','amlogic,meson8b-reset','rockchip,rv1108-uart','marvell,pj4a',
-		'sirf,prima2-romif','ti,omap5-dss','mxicy,mx25l4005a','mediatek,mt8135-pctl-b-syscfg','ti,dm8168-usb-phy',
-		'fsl,imx35-gpt','renesas,r8a7745-usb-dmac','gpio-backlight','nxp,pca9554','atmel,at91sam9x5-pmc',
-		'nvidia,tegra-audio-sgtl5000','brcm,bcm11351-root-ccu','mediatek,mt2701-ecc','st,stm32h7-dmamux','samsung,s2mps11-pmic',
-		'allwinner,sun4i-a10-mmc','samsung,exynos5-sata-phy-i2c','atmel,at91sam9261','mediatek,mt7623-disp-rdma','renesas,sdhi-sh73a0',
-		'ti,tpd12s015','nvidia,tegra114-pinmux','ti,omap4-dispc','renesas,r8a77470-rst','allwinner,sun8i-h2-plus',
-		'phytec,phy3250','marvell,armada-370-core-clock','ti,am3359-tscadc','epson,rx8900','qcom,sfpb-mutex',
-		'marvell,dove-sdhci','nvidia,tegra124-dc','sigma,tango4','ti,edma3-tptc','gw,ventana',
-		'n25q00','st,stih407-sas-codec','google,pi-rev14','marvell,dove','fsl,imx27-iomuxc',
-		'mrvl,mmp2-intc','stericsson,u300-syscon','nxp,lpc3220-key','active-semi,act8945a','hardkernel,odroid-xu4-audio',
-		'amlogic,meson8b-pwm','synology,ds210jv10','karo,imx25-tx25','olimex,a20-olinuxino-lime2-emmc','ovti,ov7670',
-		'qcom,i2c-qup-v1.1.1','marvell,mvebu-devbus','mediatek,mt7623-nor','zii,rave-wdt','luxul,xwr-3100v1',
-		'arm,vexpress','mediatek,mt7623-smi-common','hisilicon,hi3519','fsl,imx27-gpio','samsung,s5m8767-clk',
-		'cirrus,ep7209-pwm','allwinner,sun8i-a23-apb0-gates-clk','qcom,apq8060-dragonboard','brcm,bcm2835-dpi','nvidia,tegra124-ahub',
-		'renesas,rcar-gen2-iic','brcm,iproc-gpio','qca,qca7000','winbond,w25q128fw','fsl,imx50-i2c',
-		'marvell,berlin2q','renesas,rz-cpg-clocks','ti,keystone-aemif','renesas,r8a73a4-div6-clock','nxp,lpc3220-gpio',
-		'st-ericsson,href520','allwinner,sun6i-a31-apb0-gates-clk','gpio-poweroff','mediatek,mt2701-uart','google,veyron-tiger-rev3',
-		'marvell,armada-375-wdt','ti,am3-dpll-core-clock','qcom,dsi-phy-28nm-hpm','axis,artpec6-crypto','amlogic,meson-pwm',
-		'ti,omap4-wugen-mpu','aspeed,ast2400-gpio','samsung,lte430wq-f0c','samsung,exynos5420-pinctrl','oxsemi,ox820-rps-irq',
-		'calxeda,hb-ddr-ctrl','allwinner,sun4i-a10-sram-c1','st,spear300-shirq','smartrg,sr400ac','renesas,mmcif-r8a7742',
-		's25fl512s','xunlong,orangepi-2','mediatek,mt7623-timer','allwinner,sun6i-a31-mipi-dphy','allwinner,sun8i-r40-spi',
-		'allwinner,sun5i-a13-pwm','allwinner,sun9i-a80-display-backend','marvell,pxa910-clock','tcl,am335x-sl50','renesas,rspi-rz',
-		'ti,am4372-l3-noc','dlg,da9063','fsl,imx27-pdk','mediatek,mtk-btif','renesas,etheravb-r8a7791',
-		'fsl,ls1021a-ftm-alarm','dfi,fs700e-m60','edt,edt-ft5506','renesas,usbhs-r8a7743','via,vt8500-rtc',
-		'stericsson,u300','picochip,pc3x2-rtc','st,stih407-uni-reader-hdmi','nxp,uda1380','tq,mba53',
-		'ti,omap3-i2c','socionext,uniphier-pro4-mio-reset','ti,tps53679','intel,ixp4xx-ahb-queue-manager','allwinner,sun8i-r40-video-engine',
-		'sirf,nocfw-gnssm','samsung,clock-xusbxti','jesurun,q5','samsung,s3c6400-pwm','buffalo,wzr-900dhp',
-		'haoyu,hym8563','Odroid-X','acme,foxg20','qcom,scorpion-mp-pmu','cirrus,cs42888',
-		'nokia,n900-ir','renesas,r8a7742-apmu','marvell,mv98dx3236-gating-clock','linksys,panamera','ti,keystone-rng',
-		'mrvl,mmp-uart','google,veyron-minnie-rev0','aspeed,ast2400-lpc-snoop','samsung,s2mps11-clk','atmel,at91sam9x35ek',
-		'fsl,imx6sx-anatop','atmel,sama5d4-xplained','brcm,bcm58522','st,stih407-sbc-reg-syscfg','maxim,max17042',
-		'national,lm63','samsung,exynos5250-clock','kionix,kxtf9','fsl,16550-FIFO64','eeti,exc3000',
-		'st,stm32h7-sai','silabs,si570','brcm,bcm2711-vc5','ti,lm5066i','marvell,armada-375-usb-cluster',
-		'qcom,dsi-phy-28nm-8960','arm,cortex-a7','ti,omap2','brcm,bcm21664-root-ccu','allwinner,sun9i-a80-cpucfg',
-		'calxeda,hb-pll-clock','fsl,imx7ulp-pcc3','novatech,am335x-lxm','rockchip,rk3228-gmac','fsl,vf610',
-		'renesas,stout','buffalo,lswxl','nxp,pca9533','st,m25p16','marvell,98dx4251-pinctrl',
-		'brcm,bcm43540-bt','socionext,uniphier-ld4-sysctrl','allwinner,sun5i-a10s-display-engine','renesas,etheravb-rcar-gen2','tbs,a711-panel',
-		'google,veyron-jerry-rev12','marvell,kirkwood-mbus','renesas,r8a7744-cpg-mssr','globalscale,d3plug','sirf,atlas7-uart',
-		'fsl,imx31-audmux','mediatek,mt7623-audio','allwinner,sun8i-a23-evb','renesas,r8a7743-cmt0','vdl,lanmcu',
-		'wlf,wm8580','ti,dra7-dispc','zii,rave-sp-eeprom','marvell,88pg868','zii,vf610dev-b',
-		'nvidia,tegra30-dsi','rockchip,rockchip-audio-max98090','st,stih418-b2199','qcom,ssbi-gpio','fsl,imx51-pata',
-		'sirf,atlas6-pinctrl','allwinner,sun7i-a20-display-frontend','renesas,i2c-r8a7743','atmel,sama5d2-i2s','hannstar,hsd100pxn1',
-		'st,stih407-powerdown','atmel,sama5d2-ptc_ek','synology,ds411','brcm,brcmstb-ddr-shimphy-v1.0','google,nyan-blaze-rev10',
-		'sil,sii9234','microchip,sam9x60-pwm','ti,dra7-padconf','auo,b133htn01','marvell,armada-380-ahci',
-		'ti,omap3-no-wait-interface-clock','qcom,rpmcc','armadeus,imx1-apf9328','ti,bq20z75','amlogic,meson8-canvas',
-		'ks8851','ovti,ov2659','arm,arm11mpcore','ti,omap4-hdmi','everest,es8328',
-		'samsung,exynos4210-chipid','nvidia,tegra20-rtc','rockchip,rk3228-rga','nxp,tfa9879','arrow,stm32mp157a-avenger96',
-		'nvidia,tegra124-apbdma','innolux,g121x1-l03','fsl,imx6q-sabreauto','samsung,smdk4412','atmel,at91sam9x5-shdwc',
-		'marvell,sd8897-bt','usb0424,9730','fsl,imx7d-adc','ti,omap4-uart','fsl,imx6ul-mmdc',
-		'st,stpmic1-regulators','asus,rk3288-tinker','amlogic,meson-ao-uart','picochip,axi2pico-pc3x2','fsl,imx6q-wdt',
-		'microchip,sam9x60-sfr','al,alpine-cpu-resume','ti,omap4-l4-abe','brcm,bcm2835-pixelvalve1','picochip,pc7302-pc3x2',
-		'st,stm32-timer-trigger','marvell,db-xc3-24g4xg','xlnx,ps7-clkc','google,pi-rev16','samsung,s3c2410-wdt',
-		'technologic,ts4800-wdt','winbond,w25q80','microchip,sam9x60-gpbr','aspeed,ast2500-silicon-id','dlg,da9062-rtc',
-		'fsl,imx25-esdhc','linksys,ea9200','ti,twl4030-power-n900','bosch,bmp085','amlogic,meson8b-clkc',
-		'st,stih407-fdma-mpe31-13','marvell,berlin2q-ahci','ingrasys,zaius-bmc','amlogic,meson8b-cbus-pinctrl','olimex,a20-olimex-som-evb',
-		'dh,stm32mp153c-dhcom-som','adi,adp1653','marvell,armada-370-crypto','rockchip,rk3188-emac','amlogic,meson6-i2c',
-		'lemaker,bananapro','ti,k2l','arm,vexpress,v2p-ca15','samsung,exynos4212-g2d','realtek,alc5621',
-		'altr,socfpga-sdmmc-ecc','ti,am4372-i2c','sitronix,st1232','fsl,imx6sx-sabreauto','jedec,lpddr3-timings',
-		'sirf,prima2-rtciobg','fsl,imx6sx-sdb-reva','socionext,uniphier-mio-dmac','ti,k2hk-dsp','ti,omap3-dpll-core-clock',
-		'fsl,imx53-i2c','ti,omap3-beagle-xm','samsung,exynos4210-sysram-ns','fsl,imx7d-flexcan','iwave,g20m',
-		'rda,8810pl-gpio','synology,rs409','fsl,imx6q-gpt','samsung,exynos4210-combiner','qcom,usb-hs-phy-msm8974',
-		'x-powers,axp221-ac-power-supply','alphascale,asm9260-timer','bticino,imx6dl-mamoj','renesas,r8a7792-apmu','allwinner,sun5i-a13-ehci',
-		'ti,omap3-l4-core','fsl,imx6sx-ssi','ti,dra72-evm','mediatek,mt2712-i2c','renesas,tpu-r8a7791',
-		'ti,dss-gate-clock','netgear,readynas-nv+-v2','laird,wb45n','kobo,tolino-shine3','marvell,kirkwood-98DX4122',
-		'renesas,bsc-r8a73a4','karo,imx6q-tx6q','renesas,sdhi-r8a7778','wm8962-audio','fsl,imx6ul-pwm',
-		'seagate,dockstar','allwinner,sun8i-a83t-pinctrl','ti,adc081c','stericsson,ux500-pm-domains','allwinner,sun8i-a23-system-control',
-		'fsl,imx6ull-dcp','ti,omap5-mpu','ti,tps659038-pmic','st,lis3dh-accel','brcm,hr2',
-		'microsys,sbc6x','sharp,lq035q7db03','fsl,imx6dl-hdmi','synology,ds110','linux,spdif-dit',
-		'st,stm32-vrefbuf','qcom,idle-state-spc','mediatek,mt2701-bdpsys','Integrated SPDIF','myir,zynq-zturn-v5',
-		'qcom,hdmi-phy-8960','allwinner,sun6i-a31-i2s','microchip,sam9x60-rtc','mediatek,mt6580-uart','marvell,pxa300-gcu',
-		'ampere,smpro','ti,omap3-dsi','brcm,bcm2835-vc4','brcm,cygnus-srab','fsl,imx1-ccm',
-		'asus,grouper','socionext,uniphier-sld8-aidet','arm,cortex-a8','rockchip,px3-evb','fsl,imx6sx-uart',
-		'linksys,viper','arm,vexpress-volt','amlogic,meson8b-usb','renesas,msiof-r8a7792','samsung,s5k6a3',
-		'st-ericsson,u8500','amlogic,meson8m2-usb2-phy','marvell,armada375-thermal','intel,ixp43x','fsl,imx53-rtc',
-		'arm,cci-400-pmu,r1','faraday,ftgmac100','sirf,atlas6-ble','samsung,exynos5260','renesas,hscif-r8a77470',
-		'ti,dra718-evm','ti,tps53622','toradex,colibri_imx6dl-v1_1','qcom,smsm','amd,imageon-200.0',
-		'hisilicon,hix5hd2-i2c','allwinner,sun4i-a10-ir','atmel,at91sam9g20-pmc','isil,isl12022','sirf,atlas7-nand',
-		'sirf,prima2-gpsrtc','nvidia,tegra-audio-rt5640','xen,xen','efm32,dk3750','lacie,cloudbox',
-		'renesas,scif-r7s9210','ti,twl4030-power','renesas,rcar-gen2-sdhi','renesas,silk','bytedance,g220a-bmc',
-		'nvidia,tegra20-das','samsung,s5pc100-pwm','gw,imx6dl-gw552x','linksys,ea6300-v1','ti,keystone-dsp-gpio',
-		'fsl,imx-display-subsystem','st,stm32f42xx-rcc','fsl,mpr121-touchkey','brcm,brahma-b15-gic','renesas,qspi-r8a7794',
-		'fsl,imx35-kpp','ti,omap4-dmm','mediatek,mt2701-smi-common','nvidia,tegra-audio-rt5640-grouper','arm,realview-pbx-syscon',
-		'amlogic,meson8b-mali','brcm,nand-iproc','ti,dm8148-evm','compulab,cl-som-am57x','atmel,at91sam9g45-matrix',
-		'rda,8810pl-intc','marvell,berlin2','wm,wm8750-pinctrl','renesas,gether-r8a7740','renesas,usb-phy-r8a7745',
-		'renesas,hspi','brcm,iproc-nsp-gpio','renesas,usb-phy-r8a7790','dallas,ds1341','mstar,infinity',
-		'nxp,ptn3460','arm,coresight-dynamic-replicator','isil,isl12057','qcom,ipq806x-sata-phy','arm,primecell',
-		'renesas,r8a7740-cmt1','CLAA057VC01CW','atmel,at91sam9g45-pmc','atmel,at91sam9x5-rtc','fsl,imx6sx-ccm',
-		'fsl,imx27-usbmisc','sinovoip,bpi-m2','renesas,usbhs-r7s9210','rockchip,rk3066a-usb-phy','aspeed,ast2500-adc',
-		'st,stm32-uart','grinn,am335x-chilisom','fsl,imx25-usbmisc','raspberrypi,bcm2835-firmware','renesas,iic-r8a7745',
-		'st,stm32mp157-syscfg','st,stih410','rockchip,rk3036-pwm','phytec,imx6ul-pbacd10-nand','gw,imx6q-gw5907',
-		'aspeed,ast2400-silicon-id','armadeus,imx51-apf51','sirf,prima2-pwrc','samsung,s6e8aa0','socionext,uniphier-pxs2-dwc3-glue',
-		'technologic,ts4800-irqc','marvell,88f5182-pinctrl','ti,omap2430-padconf','fsl,imx51-cspi','regulator-haptic',
-		'nvidia,tegra20-epp','phg,pcf8563','altr,socfpga-gate-clk','amlogic,meson6-timer','ti,keystone-irq',
-		'renesas,pci-r8a7794','ti,am4-prcm','qihua,t3-cqa3t-bv3','ti,pcm5142','phytec,imx6ul-pcl063',
-		'nokia,n900-rom-rng','synology,rs212','motorola,droid-bionic','renesas,irqc-r8a7742','olpc,ap-sp',
-		'nvidia,tegra30-tvo','rockchip,rk3188-spdif','fsl,imx25-pdk','dlg,da9063-rtc','allwinner,sun8i-a83t-sid',
-		'marvell,armada-380-mpcore-soc-ctrl','lego,ev3-lcd','mediatek,mt8135-evbp1','tplink,archer-c5-v2','toradex,apalis-tk1-v1.2',
-		'atmel,at91sam9g20ek_2mmc','u-blox,neo-6m','renesas,r8a7791-cmt1','ti,am3352-rtc','lacie,inetspace_v2',
-		'simple-panel','sirf,prima2-security','mediatek,mt2701-pctl-a-syscfg','nxp,lpc1850-rtc','ad,tegra-audio-wm8903-medcom-wide',
-		'renesas,r8a7794-rst','cirrus,ep7209-fb','buglabs,imx31-bug','fsl,imx6sx-audmux','renesas,rcar-dmac',
-		'allwinner,sun9i-a80-prcm','technexion,imx7d-pico-nymph','atmel,at91sam9x5ek','sil,sii9022-cpi','marvell,kirkwood-audio',
-		'ti,bq24196','sochip,s3','marvell,aurora-system-cache','renesas,dmac-r8a7790','ti,tmp103',
-		'samsung,exynos4210-usb2-phy','samsung,i9100','google,veyron-mighty-rev2','ti,dm816-fapll-clock','headacoustics,omap3-ha-lcd',
-		'marvell,prestera','brcm,cygnus-asiu-clk','st,nomadik-hclk-clock','stericsson,stn8815-pinctrl','fsl,vf610-adc',
-		'mele,x1000','socionext,uniphier-pro4-sysctrl','renesas,ipmmu-r8a7745','st,stmpe801','fsl,imx6q',
-		'pci16c3,abcd','arm,psci-1.0','snps,dw-pcie','sirf,prima2-tsc','renesas,dmac-r8a7792',
-		'atmel,at91sam9g45-nand-controller','fsl,imx6-mipi-csi2','simple-framebuffer','via,vt8500-fb','ti,omap4-i2c',
-		'auo,g104sn02','dh,stm32mp157c-dhcom-pdk2','overkiz,kizbox','ti,am5728-idk','microchip,mcp4725',
-		'ti,wl1271','fsl,imx7ulp-usbmisc','ti,omap5-rfbi','coreriver,tc360-touchkey','wlf,wm8962',
-		'renesas,dmac-r8a7744','dlink,dns-320-a1','hitex,lpc4350-eval-board','renesas,r8a7779-sysc','nextthing,chip-pro',
-		'ti,keystone-navigator-qmss','fsl,imx25-pdk-sgtl5000','qcom,pma8084-mpp','renesas,scif-r8a7792','nvidia,cardhu-a04',
-		'gumstix,omap4-duovero-parlor','allwinner,sun5i-a10s-ccu','aspeed,ast2500-kcs-bmc-v2','himax,hx8369a','st,stih407-fdma-mpe31-12',
-		'ti,da850-evm','lm75','microchip,sam9x60-ebi','socionext,uniphier-sld8-mio-reset','allwinner,sun4i-a10-ps2',
-		'fsl,imx31-pata','nvidia,tegra114-apbdma','stericsson,ab8500-poweron-key','mediatek,mt8135-apmixedsys','brcm,bcm58305',
-		'arm,cortex-a15-pmu','qcom,rpm-pma8084-regulators','nvidia,tegra124-pwm','rockchip,rk3288-io-voltage-domain','stericsson,ab8505-regulator',
-		'mediatek,mt7623-scpsys','altr,l3regs','st,stm32f769-rcc','nxp,pcf8523','sirf,atlas6-cb',
-		'samsung,exynos3250-fimd','maxim,max17040','qcom,spmi-pmic','nvidia,tegra20-mpe','renesas,r8a7793-cmt0',
-		'olimex,a20-olimex-som204-evb','adi,adv7612','marvell,openrd','st,stih407-bdisp','renesas,ether-r8a7743',
-		'marvell,88e1310','stericsson,ux500-hash','renesas,r8a7740-div6-clock','jedec,lpddr2-s4','mediatek,mt7629-i2c',
-		'atmel,sam9x5-wm8731-audio','nvidia,tegra20-apbmisc','ti,omap4-l4-cfg','altr,socfpga-a10-ecc-manager','fsl,imx51-aipstz',
-		'xlnx,zynq-gpio-1.0','marvell,armada-370-xp-system-controller','gumstix,omap3-overo-chestnut43','x-powers,axp813','w25q32',
-		'google,veyron-jerry-rev10','rockchip,rk3288-dp','brcm,brcm2711-dvp','google,pit-rev7','renesas,du-r8a7745',
-		'olpc,xo1.5-battery','st,m41t82','ti,omap2-hsmmc','ti,am3352-ecap','sirf,prima2-pinctrl',
-		'marvell,dove-pcie','nvidia,tegra124-pinmux','amlogic,meson6-spifc','hisilicon,hip04-bootwrapper','mediatek,mt6589-wdt',
-		'hisilicon,hix5hd2-gmac','arm,vexpress-amp','google,nyan-big-rev2','cortina,gemini-pinctrl','mediatek,mt8135',
-		'marvell,a398-db','ti,sysc-omap4-simple','nokia,n900-battery','allwinner,sun7i-a20-gmac-clk','brcm,bcm2835-dsi0',
-		'nvidia,tegra30-ahb','arm,integrator-cp-timer','cirrus,cs2000-cp','gumstix,omap4-duovero','mmc-pwrseq-emmc',
-		'samsung,smdk6410','ti,tmp401','renesas,rzn1d400-db','aspeed,ast2600-i2c-bus','marvell,88f6192-pinctrl',
-		'renesas,i2c-r8a7794','imx6q-nitrogen6_max-sgtl5000','marvell,berlin-pwm','atmel,at91sam9g45-isi','picochip,pc3x3-gated-clk',
-		'renesas,tpu-r8a7743','st,stih407-softreset','brcm,bcm58625','nuvoton,npcm750-pinctrl','st,asc',
-		'brcm,bcm23550-gpio','fsl,imx1-dma','facebook,cmm-bmc','nxp,lpc1850-gpio','samsung,s3c2416-clock',
-		'amlogic,meson8b-pwrc','google,veyron-mickey-rev2','renesas,blanche','fsl,imx7d-wdt','qcom,pm8921-rtc',
-		'rockchip,rk3066-pmu','mediatek,mt2701-disp-color','eukrea,mbimxsd51','tq,imx53-mba53-sgtl5000','tplink,archer-c9-v1',
-		'renesas,r8a77470-cmt1','rockchip,rk3066a-efuse','cnxt,cx92755-pinctrl','qcom,rpm-msm8960','mediatek,mt7623-efuse',
-		'fsl,imx25-gpt','st,stm32h7-i2s','fsl,imx51-ecspi','linux,extcon-usb-gpio','atmel,at91sam9g45-lcdc',
-		'atmel,sama5d3xcm','renesas,rspi-r7s72100','allwinner,sun4i-a10-codec','ti,tsc2005','amlogic,meson8m2-sdhc',
-		'n25q128','nuvoton,npcm750-wdt','renesas,pci-r8a7790','samsung,exynos3250-adc','atmel,at91rm9200-nand',
-		'fsl,imx53-iomuxc','nvidia,jetson-tk1','renesas,dmac-r8a7791','rda,8810pl-timer','rockchip,rk3036-inno-hdmi',
-		'atmel,at91sam9260-gpbr','Aries','nvidia,tegra30-apbdma','snps,dw-apb-gpio-bank','atmel,sama5d3xcm-cmp',
-		'ti,am335x-bone-blue','brcm,hr2-armpll','marvell,berlin2-soc-pinctrl','allwinner,sun8i-a23-rtc','marvell,berlin2-reset',
-		'grinn,am335x-chiliboard','allwinner,sun7i-a20-mmc','arm,cortex-a9-twd-timer','ti,omap3-hsmmc','fsl,pfuze200',
-		'amlogic,meson8b-sdio','spansion,s25fl128s','ti,tps65910','fsl,imx6sl-wdt','fsl,imx53-kpp',
-		'somfy,animeo-ip','lacie,netspace_max_v2','lenovo,ix4-300d','nuvoton,npcm730','edt,etm0700g0bdh6',
-		'adm1278','netgear,readynas-duo-v2','maxim,max17047','nvidia,tegra30','qcom,apq8064-iommu',
-		'samsung-s5pv210-pmu','via,vt8500-pinctrl','skyworks,aat1290','samsung,exynos4210-uart','arm,pl011',
-		'brcm,ns-usb2-phy','st,stm32mp1-rcc','nvidia,cardhu-a02','samsung,exynos4210-mixer','nxp,lpc1850-rgu',
-		'renesas,mmcif-r8a7793','nxp,ohci-nxp','atmel,at91sam9rl','atmel,sama5d3xmb','fsl,imx21-gpt',
-		'rockchip,rk3228-usb','hyundai,a7hd','altr,socfpga-usb-ecc','gw,imx6q-gw553x','ti,omap36xx',
-		'adi,adt7473','st,quadfs','Odroid-U3','olimex,imx23-olinuxino','ti,palmas',
-		'google,veyron-speedy-rev3','renesas,scifa-sh73a0','intel,ixp4xx-timer','ti,tps65913-pinctrl','arm,pl180',
-		'nvidia,tegra-audio-wm8903-picasso','rockchip,rk3188-i2c','google,pi','nokia,omap3-n9','nvidia,tegra114-host1x',
-		'via,vt8500-pll-clock','ethernet-phy-id0141.0e90','fsl,imx6sx-ocotp','allwinner,sun8i-v3s-display-engine','fsl,imx6q-anatop',
-		'brcm,bcm53573','nvidia,tegra124-xusb-padctl','toradex,apalis_t30-v1.1-eval','ti,omap2420-mmc','fsl,imx31-cspi',
-		'merrii,a31-hummingbird','edt,edt-ft5306','amlogic,meson8b','xlnx,zynq-7000','isil,isl68137',
-		'ti,am4372-timer','mediatek,mt7623-mmsys','ti,wl1285','ti,dm814-l4ls','osddisplays,osd070t1718-19ts',
-		'mediatek,mt7623a-scpsys','arm,cortex-a9-pmu','st,ddci2c','mediatek,mt8135-timer','fsl,imx53-cspi',
-		'asahi-kasei,ak4643','fsl,imx-clk32','mediatek,mt2701-spi','sigma,smp8758','st,stih407-lpm-syscfg',
-		'amlogic,meson-hhi-sysctrl','allwinner,sun8i-r40-mmc','qt1070','lemaker,guitar-bb-rev-b','fsl,imx1-cspi',
-		'atmel,at91sam9g20ek-wm8731-audio','socionext,uniphier-sld8-soc-glue-debug','maxim,max7310','pocketbook,touch-lux-3','atmel,at91rm9200-ohci',
-		'fsl,vf610-lpuart','samsung,goni','silabs,si7020','mrvl,mmp2-brownstone','atmel,at91rm9200-tcb',
-		'socionext,uniphier-denali-nand-v5a','allwinner,sun4i-a10-lradc-keys','renesas,can-r8a7793','ti,omap3-mailbox','brcm,bcm4709-pinmux',
-		'i2c-mux','qcom,pm8058-vib','moxa,moxart-rtc','sirf,atlas7-memc','arm,mali-t604',
-		'imx-tlv320','ti,ivahd','marvell,mmp3-intc','renesas,r8a7791-rst','atmel,sama5d31ek',
-		'marvell,armadaxp-mv78230','hardkernel,odroid-xu3','st,stih407-uni-player-hdmi','fsl,imx53-ard','armadeus,imx6ull-opos6uldev',
-		'kontron,imx6ul-n6310-s-43','ns8250','brcm,bcm58625-srab','atmel,at91sam9g45-adc','marvell,axp-db',
-		'renesas,r8a73a4-mstp-clocks','fsl,imx50-owire','bosch,c_can','marvell,db-88f6281-bp','ti,twl4030-pwmled',
-		'allwinner,sun8i-a83t-i2c','marvell,armadaxp-thermal','compulab,omap3-sbc-t3730','arm,mps2-uart','fsl,imx53-tigerp',
-		'nxp,lpc1850-usb-otg-phy','prt,prtwd3','brcm,bcm2835-aux-spi','brcm,bcm11351-pwm','ti,da850-ddr-controller',
-		'renesas,intc-irqpin-sh73a0','rockchip,rk3288-lvds','acme,ariag25','technologic,imx6q-ts7970','brcm,bcm63138-pmb',
-		'nokia,n800','ti,omap5-mpu-dpll-clock','ti,bq27500','mrvl,apb-bus','nvidia,tegra20-host1x',
-		'samsung,rinato','qcom,msm-8660-qgic','ti,dm8168','eukrea,cpuimx35','arm,armv7-timer-mem',
-		'st,spear-timer','keymile,km_kirkwood','semtech,sx8654','st,stih410-b2120','licheepi,licheepi-one',
-		'allwinner,suniv-f1c100s-ic','renesas,du-r8a7794','st,clkgen-pll1','allwinner,sun8i-v3s-emac','mediatek,mt2701-eth',
-		'marvell,a375-db','ti,omap5430-bandgap','aspeed,ast2400-sdhci','brcm,nsp-genpll','linksys,nslu2',
-		'synology,ds210jv20','ti,keystone-usbphy','newhaven,nhd-4.3-480272ef-atxl','minix,neo-x8','fsl,imx51-gpio',
-		'samsung,exynos4210-fimd','fsl,imx31-rtc','nvidia,tegra-audio-alc5632-paz00','avic,tm097tdh02','libretech,all-h3-cc-h3',
-		'mediatek,trustzone-bootinfo','fsl,imx53-cpuvo-sgtl5000','cnm,codadx6','sirf,lcd','udoo,neoextended',
-		'aspeed-cvic','energymicro,efm32-i2c','mediatek,mt7629','toradex,tegra-audio-sgtl5000-colibri_t30','ti,sysc-pruss',
-		'ti,twl4030-power-omap3-evm','fsl,imx7d-gpio','x-powers,axp202-ac-power-supply','eeti,exc3000-i2c','aspeed,ast2400-spi',
-		'auvidea,h100','samsung,exynos5-gsc','renesas,sdhi-r8a7792','hisilicon,sd5203','st,stm32h7-exti',
-		'qcom,tcsr-ipq8064','ti,sysc-omap4-timer','fsl,imx6sx-tempmon','aspeed,ast2600-mac','nxp,lpc3220-usb-clk',
-		'st,stm32f746','ti,dm816-intc','arm,amba-primecell','dlink,dir-685-panel','gumstix,omap3-overo-palo43',
-		'ti,omap3630-sdma','allwinner,sun8i-a83t-de2-mixer-1','atmel,at91sam9x5-pinctrl','i2c-slave-mqueue','samsung,exynos5260-clock-g3d',
-		'synology,ds409','fsl,imx27-owire','vga-connector','st,spear310','smsc,lan91c111',
-		'nuvoton,npcm750-gcr','43WVF1G-0','marvell,rd-88f5182-nas','ti,keystone_mdio','qcom,crypto-v5.1',
-		'allwinner,sun8i-a23-mali','brcm,amac','mediatek,mt6592-evb','qcom,apq8074','allwinner,sun8i-a23-rsb',
-		'allwinner,sun6i-a31-musb','brcm,bcm2835-pixelvalve0','oct,osd3358-sm-refdesign','renesas,vsp1','socionext,uniphier-sld8-peri-reset',
-		'maxim,max8660','mediatek,mt8135-pwrap','marvell,sd8897','allwinner,sun8i-a23-codec-analog','allwinner,sun8i-a83t-emac',
-		'rockchip,rk3188-usb-phy','m25p32','aspeed,ast2400-ibt-bmc','marvell,armada-375-pp2','connector-analog-tv',
-		'arm,arm11mp-twd-wdt','marvell,mv64xxx-i2c','renesas,i2c-r8a7791','maxim,max98091','amlogic,meson8b-rng',
-		'nvidia,tegra-audio-wm8903-ventana','gw,imx6dl-gw5907','fsl,imx7d-sai','edt,etml1010g0dka','allwinner,sun7i-a20-hstimer',
-		'atmel,sama5d2-qspi','rockchip,rk3066-i2c','mediatek,mt2701-dpi','aspeed,ast2600-lhc','ti,nspire-tp',
-		'arm,arm11mp-twd-timer','renesas,vin-r8a7792','auo,b101ew05','st,w25q32','qcom,msm8974-tsens',
-		'nvidia,tegra30-i2s','atmel,at91sam9rl-pmc','google,veyron-mickey','renesas,pwm-rcar','fsl,imx6sx-gpmi-nand',
-		'nxp,se97','st,stih407-usb2-phy','renesas,rza2-usbhs','renesas,mtu2-r7s72100','netxeon,r89',
-		'fsl,imx1-iomuxc','ti,omap3-ssi-interface-clock','nvidia,tegra-audio-max98090-venice2','ti,dra62x-j5eco-evm','atmel,sama5d3-sfr',
-		'marvell,mv88f6828-pinctrl','fsl,ls1021a-lpuart','arm,integrator-timer','qualcomm,centriq2400-rep-bmc','fsl,imx25-nand',
-		'smsc,lan9117','silead,gsl1680','samsung,exynos-adc-v1','mediatek,mt8135-infracfg','mediatek,mt7623-vdecsys',
-		'mediatek,mtk-jpgenc','mele,a1000','wand,imx6dl-wandboard','mediatek,mt2701-disp-rdma','renesas,mmcif-r8a7743',
-		'ti,composite-interface-clock','atmel,at91sam9rl-lcdc','ti,am335x-bone-green-wireless','samsung,smdk-wm8994','empire-electronix,d709',
-		'renesas,scifa-r8a7794','aptina,mt9p031','mediatek,mt6323','marvell,armada-xp-timer','ti,twl4030-vaux2',
-		'brcm,bcm21664-gpio','wm,wm8650-pll-clock','allwinner,sun8i-a23-apb0-clk','fsl,imx35-usb','fsl,imx6sll-csi',
-		'ti,omap3-ssi','renesas,gpio-r8a7791','realtek,rt5639','imx51-babbage-sgtl5000','iom,iconnect-1.1',
-		'renesas,r8a7791-lvds','itead,iteaduino-plus-a10','ti,da830-uart','microchip,mcp3021','fsl,imx35-avic',
-		'samsung,midas-audio','fsl,imx6ul-snvs-lpgpr','allwinner,sun5i-a13-mbus','seagate,blackarmor-nas220','socionext,sc2000a',
-		'ti,dra7-scm-core','arm,pl010','ti,twl4030-vusb1v5','bluegiga,apx4devkit-sgtl5000','fsl,imx7d-gpmi-nand',
-		'lvds-decoder','phytec,imx27-pcm970','semtech,sx1509q','xlnx,pinctrl-zynq','nvidia,tegra114-mc',
-		'fsl,imx6sl-gpc','ti,am4372-qspi','arm,versatile-lcd','atmel,at91rm9200','samsung,exynos5420-audss-clock',
-		'socionext,uniphier-sld8-soc-glue','socionext,uniphier-pro4-soc-glue-debug','microchip,sama5d2-icp','atmel,sama5d2-hlcdc','lltc,ltc2497',
-		'renesas,ipmmu-r8a7794','caninos,labrador-base-m','ti,hsdiv-gate-clock','gumstix,omap3-overo-palo35','marvell,armada-380-pmsu',
-		'samsung,exynos5420-dp-video-phy','allwinner,sun8i-v3s-tcon','synology,ds109','st,lsm303dlh-magn','google,veyron-pinky-rev2',
-		'ti,ucd90160','fsl,imx6sll-iomuxc','olimex,a33-olinuxino','renesas,tmu-r8a7779','amlogic,meson8m2',
-		'arm,vexpress-sysreg,sys_flash','dserve,dsrv9703c','marvell,armada-390-spi','renesas,r8a7745-cpg-mssr','ti,k2l-dsp',
-		'fsl,fxls8471','renesas,r8a7743-rst','aspeed,ast2400-lpc-reset','atmel,at91sam9','brcm,bcm21664-dw-apb-uart',
-		'calxeda,hb-sregs','qcom,usb-hs-phy-apq8064','mediatek,mt7623-btif','rockchip,rk3288-i2c','cloudengines,pogoplugv3',
-		'onnn,cat9554','ti,clkctrl','samsung,exynos5250-g2d','ti,lp8733','sirf,prima2-audio',
-		'aspeed,ast2500-gfx','armadeus,imx6ul-opos6uldev','amlogic,meson8-smp-sram','arm,vexpress-sysreg,sys_mci','ti,tca6416',
-		'atmel,sama5d27-som1','rockchip,rk3288-dw-mshc','ti,omap4-hsmmc','toradex,vf500-colibri_vf50-on-eval','fsl,imx6sx-usbphy',
-		'st,st231-rproc','renesas,r8a77470-cpg-mssr','fsl,imx23-timrot','socionext,uniphier-pxs2-usb3-ssphy','mediatek,mt7623-dsi',
-		'snps,dw-dmac','allwinner,sun4i-a10-ohci','mediatek,mt6592-sysirq','ti,da830-evm-audio','renesas,r8a7791-wdt',
-		'qcom,msm8660-ebi2','mediatek,mt2701-hdmi','aspeed,ast2500-sd-controller','fsl,imx6sx-sai','marvell,mv88f6281gtw-ge',
-		'aspeed,silicon-id','stmpe,ts','st,stm32mp1-usbphyc','xunlong,orangepi-2g-iot','imx28-mbmx28lc-sgtl5000',
-		'nokia,omap3-n950','arm,cortex-a7-gic','insignal,origen','ti,omap-ocp2scp','allwinner,sun5i-a10s-hdmi',
-		'st,nomadik-pll-clock','arm,coresight-etb10','allwinner,mk802ii','renesas,mmcif-r8a7791','samsung,exynos4212-fimc',
-		'marvell,armada-370-spi','nvidia,tegra124-i2c','raspberrypi,model-b-plus','amlogic,meson8m2-wdt','socionext,uniphier-ld4-clock',
-		'qcom,i2c-qup-v2.1.1','wm,wm8505','st,flexgen-video','marvell,tauros3-cache','brcm,cygnus-vc4',
-		'renesas,du-r8a7792','wm,wm8850-pll-clock','ti,dm814-prcm','tmp421','qcom,sdhci-msm-v4',
-		'nxp,pca9538','arm,cci-400-pmu,r0','socionext,uniphier-pro4-perictrl','ti,twl6030-vaux3','mediatek,mt7629-pwm',
-		'renesas,gpio-r8a7793','allwinner,sun6i-a31-msgbox','phytec,rk3288-phycore-som','renesas,r8a7790-sysc','fsl,imx6q-audmux',
-		'cortina,gemini-ethernet-port','alphascale,asm9260devkit','rv4162','fsl,imx23-pinctrl','samsung,exynos-adc-v2',
-		'ti,twl6030-vana','tq,imx7s-tqma7','altr,socfpga-a10-gate-clk','fsl,imx6ul-src','amlogic,meson8b-dwmac',
-		'tronsmart,mxiii-plus','fsl,stmp3xxx-rtc','nuvoton,npcm750-pspi','atmel,sama5d27','samsung,exynos4210-csis',
-		'fsl,imx6sl-ecspi','st,st-hva','laird,wb50n','nuvoton,npcm750-reset','socionext,uniphier-pro4-usb2-phy',
-		'isil,isl9305','nokia,n900-audio','toradex,colibri-imx7d-aster','chunghwa,claa101wb01','nokia,n9-modem',
-		'samsung,s524ad0xd1','xlnx,zynq-reset','nxp,lpc4357','fsl,imx7d-ecspi','ti,omap3-aes',
-		'google,pi-rev15','qcom,ci-hdrc','ronetix,pm9g45','st,m41t0','ti,omap2420-gpmc',
-		'mrvl,pxa168','renesas,gpio-r8a7794','abb,aristainetos2-imx6dl-4','ti,omap4-wdt','gw,imx6dl-gw560x',
-		'marvell,armada390-mbus','moxa,uc-2101','ti,tps65218','licheepi,licheepi-nano','nvidia,tegra124-car',
-		'buffalo,lsvl','fsl,imx23-usbphy','amstaos,tsl2563','socionext,uniphier-efuse','ti,omap-usb2',
-		'fsl,imx35-ssi','brcm,bcm2711-emmc2','allwinner,sun8i-a83t-csi','st,stmpe811','allwinner,sun8i-a33-crypto',
-		'marvell,armada388','st,stmpe610','st,stpmic1-onkey','phytec,imx27-pcm038','intel,ixp4xx-udc',
-		'qcom,rpm-pm8841-regulators','renesas,riic-r7s72100','calaosystems,snowball-a9500','motorola,cpcap-led-green','ti,twl4030-audio',
-		'axis,artpec6-dev-board','st,stih407','storm,sl93512r','tbs,imx6q-tbs2910','mrvl,pxa-uart',
-		'atmel,at25df321a','calxeda,ecx-2000','aspeed,ast2500-mac','allwinner,sun8i-h3-codec-analog','renesas,r9a06g032',
-		'solidrun,clearfog-pro-a1','moxa,uc-8100-me-t','ti,k2g-message-manager','atmel,sama5d3-ddramc','marvell,mbus',
-		'allwinner,sun6i-a31-drc','renesas,rcar-gen2-wdt','maxim,max77836-muic','atmel,sama5d2-sfrbu','fsl,imx7ulp-lpuart',
-		'amlogic,meson8b-usb2-phy','rockchip,rk3288-usb-phy','samsung,exynos5410-audss-clock','sinovoip,bananapi-m2m','amlogic,meson8m2-pwrc',
-		'allwinner,sun8i-a23-sram-c1','renesas,r8a7791-cmt0','linksprite,a10-pcduino','xlnx,zynq-slcr','fsl,imx28-tx28-sgtl5000',
-		'fsl,imx-ckih1','ti,keystone-timer','qcom,wcnss','qcom,lcc-msm8960','ipmi-smic',
-		'st,stm32mp1-adc','rockchip,rk3288-vpu','arm,armv7-timer','via,vt8500-pmc','renesas,scif-r8a7790',
-		'atmel,at91sam9rl-shdwc','nuvoton,npcm750-jtag','marvell,armada-380-gating-clock','allwinner,sun6i-a31-display-frontend','fsl,imx23-gpio',
-		'marvell,berlin-cpu-ctrl','netgear,r7000','google,veyron-tiger-rev0','renesas,scif-r8a7745','mediatek,mt2701-nfc',
-		'capella,cm36651','fsl,imx35-ccm','rockchip,rk3188-pinctrl','renesas,cpg-div6-clock','solidrun,cubox',
-		'marvell,armada390','renesas,cpg-mstp-clocks','ti,am33xx-usb','marvell,openrd-ultimate','qcom,pronto',
-		'arm,armv8-timer','qcom,pm8058-keypad','renesas,iic-emev2','arm,versatile-ib2-syscon','xlnx,zynq-can-1.0',
-		'aspeed,ast2500-vuart','mediatek,mt8173-nor','socionext,uniphier-sld8-clock','brcm,bcm2835-aux','ge,imx53-cpuvo',
-		'qcom,msm-uartdm-v1.3','arm,gic-400','snps,dwc-ahci','lsi,zevio-gpio','socionext,uniphier-sld8-pinctrl',
-		'st,m95m02','atmel,at91sam9260','renesas,tmu-r8a7778','stericsson,ab8500-sysctrl','everest,es8388',
-		'st,stih407-uni-reader-pcm_in','renesas,r8a77470-wdt','renesas,pfc-r8a73a4','ti,am335x-pocketbeagle','marvell,pj4b',
-		'qcom,rpm-pm8941-regulators','fsl,vf610-nfc','st,quadfs-pll','marvell,armada-xp-cpu-clock','allwinner,sun7i-a20-codec',
-		'allwinner,sun9i-a80-crypto','samsung,exynos3250-cmu','ti,tca9554','buffalo,kurobox-pro','ti,sysc-omap4-sr',
-		'atmel,at91sam9rl-ebi','renesas,r8a7790','raumfeld,raumfeld-controller-pxa303','fsl,vf610m4','brcm,kona-timer',
-		'hisilicon,cpuctrl','fsl,imx25-tsadc','qcom,msm8974-pnoc','fsl,imx6ul-usb','ti,palmas-gpio',
-		'amlogic,meson8b-gpio-intc','nxp,pca9552','renesas,etheravb-r8a7794','ti,keystone-pllctrl','adi,adv7511w',
-		'm25p64','ti,omap4-dsi','karo,imx6qdl-tx6-sgtl5000','smsc,usb3503a','ovti,ov5645',
-		'renesas,rcar-gen2-scifa','realtek,rtd1295-watchdog','mrvl,pxa168-aspenite','arm,versatile-sic','samsung,s5pv210-spi',
-		'raydium,rm68200','stericsson,db8500','toradex,vf610-colibri_vf61','fsl,emi','virtual,mdio-gpio',
-		'laird,wbxx','atmel,at26df081a','allwinner,ga10h-v1.1','sipeed,lichee-zero-plus','ti,lp8556',
-		'cortina,gemini-usb','fsl,clkctrl','qcom,ipq4019-ap-dk04.1-c3','renesas,r7s9210-irqc','fsl,imx25-tcq',
-		'ti,dm814-timer','samsung,s5m8767-pmic','amlogic,meson6-uart','wiliboard,wbd222','mediatek,mt6580-sysirq',
-		'ti,tmp423','fsl,imx6sx-esai','ti,omap2-dpll-core-clock','google,veyron-jerry-rev11','renesas,scif-r8a7779',
-		'xunlong,orangepi-r1','video-mux','marvell,orion-sata','aspeed,ast2400-rtc','shiratech,stm32mp157a-iot-box',
-		'nxp,lpc3220-tsc','fsl,imx27-fb','wm,wm8650','qcom,msm8974-mmssnoc','ti,ina219',
-		'allwinner,sun8i-r40-pinctrl','realtek,alc5631','arm,realview-pbx','allwinner,sun9i-a80-usb-phy','fsl,imx7ulp-gpio',
-		'fsl,ls1021a-dcu','allwinner,sun4i-a10-ts','cloudengines,pogoplugv4','oxsemi,ox810se-sys-ctrl','ti,omap4-gpio',
-		'renesas,r8a7790-cmt1','nvidia,tegra20-mc-gart','sirf,ns2m31-rproc','allwinner,sun4i-a10-crypto','qcom,pronto-v2-pil',
-		'allwinner,sun5i-a10s-pwm','stericsson,dma40','allwinner,sun8i-a83t-ohci','atmel,at91sam9g35-pmc','renesas,scifa-r8a7793',
-		'fsl,imx7ulp-pcc2','seeed,stm32mp157c-odyssey','toradex,apalis_t30','st,stm32f4-adc-core','ti,dra746-pcie-ep',
-		'maxim,max1027','st,st33htpm-spi','fsl,imx23-auart','arm,l210-cache','arm,armv8-pmuv3',
-		'nvidia,tegra124-usb-phy','fsl,imx25-dryice','stericsson,u300-syscon-clk','toradex,apalis-tk1','fsl,imx6sx-spdif',
-		'active-semi,act8846','brcm,bcm63138-ahci','rockchip,rk3288-dw-hdmi','fsl,mma8451','fsl,imx6sl-usdhc',
-		'st,designware-i2s','ti,dra726-pcie-rc','google,veyron-jerry-rev4','ti,dra7-l4-per1','kiebackpeter,imx53-hsc',
-		'spear,spear-evb','arm,mali-t628','renesas,emev2','fsl,imx25-rngb','nxp,tda19971',
-		'fsl,imx53-esdhc','atmel,at91sam9x5-adc','st,spear600-adc','brcm,bcm2711-pixelvalve1','fsl,imx51-esdhc',
-		'zte,zx296702-pcu','google,cros-ec-keyb','fsl,imx6qp-pre','mediatek,mt7623-ecc','ti,dm814-phy-gmii-sel',
-		'allwinner,sun7i-a20-rtc','st,stm32429i-eval','allwinner,sun5i-a13-tcon','maxim,max31790','via,vt8500-intc',
-		'mediatek,mt2701-thermal','google,veyron-fievel-rev7','rockchip,rk3066-wdt','renesas,vin-r8a7744','cdns,at91sam9260-macb',
-		'm25p40','netron-dy,e231732','google,nyan-big-rev3','cirrus,cs42448','st,stih407-mailbox',
-		'panel-lvds','allwinner,sun4i-a10-nand','renesas,sata-r8a7791','nvidia,tegra20-i2c','renesas,thermal-r8a7743',
-		'iwave,g21m','samsung,exynos5250-wdt','maxim,ds2760','xunlong,orangepi-lite','motorola,droid4-panel',
-		'fsl,eim-bus','renesas,pfc-r8a7791','prt,prtvt7','ti,omap3','samsung,exynos4210-pwm',
-		'allwinner,sun4i-a10-timer','atmel,at91sam9263-matrix','samsung,galaxys','fsl,imx6ul-usbphy','ti,cp-intc',
-		'fsl,imx6sll-i2c','socionext,uniphier-pro4-ace','amlogic,meson-mx-bootrom','renesas,sbsc-sh73a0','stericsson,coh901318',
-		'allwinner,sun6i-a31-prcm','renesas,thermal-r8a7779','amlogic,meson8b-ddr-clkc','brcm,bcm2835','fsl,imx51-src',
-		'mediatek,mt7623-audsys','brcm,bcm2835-pixelvalve2','swir,mangoh-iotport-spi','st,stm32h7-spi','ysoft,imx6dl-yapp4-ursa',
-		'fsl,imx50-esdhc','qcom,msm8660','toradex,colibri-imx7d','mediatek,mt7623-wdt','ti,omap4-mcpdm',
-		'renesas,pcie-r8a7790','ti,am4-l4-fast','renesas,pcie-r8a7742','inet-tek,inet1','renesas,r7s72100-wdt',
-		'infineon,slb9635tt','nvidia,tegra-audio-rt5640-dalmore','st,sf-tc240t-9370-t','nxp,pcf8575','ti,am335x-bone-green',
-		'xlnx,zynq-cc108','kyo,tcg121xglp','renesas,pcie-r8a7791','renesas,r8a7778-mstp-clocks','stericsson,ab8505-gpio',
-		'renesas,scif-r8a7778','overkiz,kizboxmini-base','ti,omap3-padconf','capella,cm3605','allwinner,sun8i-a83t-de2-mixer-0',
-		'renesas,r8a7792-sysc','renesas,xhci-r8a7742','ti,dra7-prm-inst','nvidia,tegra20-i2s','stericsson,ab8500-codec',
-		'renesas,scifa-r8a7790','arm,versatile-vic','phytec,imx27-pca100-rdk','nxp,pca9555','insignal,arndale-octa',
-		'friendlyarm,nanopi-m1-plus','brcm,bcm2835-pm','ti,dm814-l4hs','renesas,r8a7793-apmu','hxt,stardragon4800-rep2-bmc',
-		'motorola,droid4','ti,k2hk-pscrst','fsl,imx27-sahara','st,stm32f469-pinctrl','ti,dwc3',
-		'karo,tx53','rockchip,rk3066-usb','mecer,xms6','imx7d-sgtl5000','marvell,kirkwood-core-clock',
-		'renesas,thermal-r8a7742','jdi,lt070me05000','luxul,xwc-2000-v1','sirf,nocfw-spramfw','ti,k2g-edma3-tptc',
-		'qcom,pm8018-mpp','nvidia,tegra20-uart','fsl,imx6sll-audmux','fsl,vf610-dcu','socionext,uniphier-ld6b-pinctrl',
-		'phytec,imx6q-pbac06','samsung,exynos5420-tmu','qcom,msm8974-sdhci','fsl,imx6sl-dcp','allwinner,sun8i-h3-mbus',
-		'xlnx,zynq-zc770-xm012','samsung,s5pv210-chipid','renesas,rcar_sound-r8a7791','microchip,sam9x60','mediatek,mt7623-dpi',
-		'rockchip,rk3288-evb-rk808','samsung,mfc-v7','st,stih407-hdmi','ti,omap3430-sdp','adm1272',
-		'brcm,bcm6328-timer','edt,etm0700g0edh6','crystalfontz,cfa10036','linux,bt-sco','nvidia,tegra20-apbdma',
-		'microchip,sam9x60-spi','google,pit-rev16','bosch,bma250e','cortina,gemini-sata-bridge','amlogic,canvas',
-		'fsl,imx-capture-subsystem','xlnx,zynq-usb-2.20a','sirf,nocfw-dramfw','atmel,sama5d4-hlcdc','st,stm32f4-otp',
-		'rockchip,rk3188-vop','fsl,imx25-usb','allwinner,sun8i-h3-usb-phy','atmel,sama5d2-securam','ti,k2g-sdhci',
-		'gw,imx6dl-gw53xx','stericsson,ab8500-chargalg','samsung,exynos5-dp','cirrus,ep7209-uart','fsl,imx6sx',
-		'synology,ds414','allwinner,sun8i-a83t-ehci','samsung,exynos5410-mipi-dsi','zte,zx-bus-matrix','iwave,g21d',
-		'fsl,imx6ul-fec','nvidia,tegra20-gpio','marvell,armada-xp-spi','qcom,smd','atmel,at91sam9g25ek',
-		'st,spear600-rtc','renesas,rcar-gen2-scifb','allwinner,sun8i-r40-ths','brcm,bcm2835-gpio','adi,adv7123',
-		'mediatek,mt2701-topckgen','option,gtm601','sirf,nocfw-audiom','renesas,ipmmu-r8a7743','fcs,fsa9480',
-		'samsung,exynos4-rng','st,stm32mp157','rockchip,rv1108-evb','renesas,ether-r8a7745','allwinner,sun7i-a20-sc-nmi',
-		'karo,imx6ul-tx6ul','mediatek,mt2701-mmsys','samsung,secure-firmware','ti,omap2420-h4','dell,wyse-ariel',
-		'st,stih407-clkgen-plla9','ti,davinci-i2c','nxp,lpc1850-creg-clk','ti,ths8134a','luxul,abr-4500-v1',
-		'maxim,max9485','radxa,rock','energymicro,efm32-timer','ti,opa362','samsung,smdkv310',
-		'microchip,24c64','socionext,uniphier-pxs2-ave4','fsl,imx28-icoll','ti,am3352-d_can','renesas,ether-r8a7790',
-		'renesas,r7s72100-ceu','rockchip,rk3066a','usb0424,3503','marvell,mv88f5181-core-clock','microchip,sam9x60-smc',
-		'adi,adv7511','allwinner,sun8i-a33','lacie,netxbig-gpio-ext','ti,keystone-reset','ibm,cffps',
-		'gumstix,omap3-overo','ti,adc128s052','renesas,i2c-r8a7779','allwinner,sun4i-a10-pwm','nvidia,tegra30-pinmux',
-		'renesas,pfc-r8a7743','ti,ucd9248','On-board SPDIF','svideo-connector','maxim,max77836-charger',
-		'xen,xen-4.2','arm,pl022','zte,zx296702-lsp1crpm-clk','fsl,imx6sll-anatop','socionext,uniphier-ld4-mio-reset',
-		'allwinner,sun5i-a13-system-control','brcm,bcm953012er','moxa,moxart-pll-clock','ti,wl1283-st','isee,omap3-igep0020-rev-f',
-		'fsl,avic','valve,steamlink','samsung,s5c73m3','samsung,s5pv210-keypad','ti,da850-lcdk',
-		'ti,omap4-prm-inst','ti,am335x-bone-black-wireless','renesas,qspi-r8a7742','renesas,r8a7793-wdt','amlogic,meson-saradc',
-		'imx6q-sabrelite-sgtl5000','raspberrypi,3-compute-module','allwinner,sun8i-r40-mbus','allwinner,sun8i-h3-tcon-tv','aspeed,ast2400-cf-fsi-master',
-		'toradex,colibri-imx7d-emmc','imx6-rex-sgtl5000','cubietech,a10-cubieboard','brcm,bcm2711-hdmi1','socionext,uniphier-pxs2-soc-glue-debug',
-		'renesas,sh73a0','fsl,vf500','fsl,vf610-nfc-nandcs','allwinner,sun8i-r40-ccu','st,stm32f769-disco',
-		'arm,syscon-icst525-integratorap-cm','calxeda,hb-sdhci','hisilicon,hi3620-clock','nxp,sja1105t','fsl,imx-ckih2',
-		'allwinner,sun6i-a31-crypto','usb424,9730','atmel,at91sam9263-udc','buffalo,lswvl','altr,socfpga',
-		'renesas,mmcif-r8a7790','google,snow','ti,k2e-pscrst','crystalfontz,cfa10057','ti,omap2-musb',
-		'cnxt,equinox','x-powers,axp223','rockchip,rk3066a-cru','marvell,mv88f5182-core-clock','atmel,sama5d36ek',
-		'renesas,koelsch','creative,x-fi3','samsung,s3c6410-clock','ti,omap4-mcspi','renesas,vin-r8a7793',
-		'mediatek,generic-tphy-v2','elan,ektf3624','ti,am4372-timer-1ms','marvell,a385-db','marvell,berlin2-clk',
-		'olimex,sam9-l9260','samsung,n8010','nxp,pcf8574','synology,ds212pv10','renesas,r8a7792-rst',
-		'socionext,uniphier-ld4-peri-clock','renesas,scifb-r8a7744','sirf,atlas7-dmac-v2','samsung,exynos5250-trng','ti,omap3-mpu',
-		'fsl,imx6sx-sdb-wm8962','cortina,gemini-syscon','microchip,sam9x60-i2smcc','wi2wi,w2sg0004','allwinner,h8homlet-v2',
-		'allwinner,sun7i-a20-hdmi','energymicro,efm32-spi','qcom,pma8084-gpio','renesas,r8a7794-wdt','socionext,uniphier-i2c',
-		'ti,dra7-l4-per3','renesas,scif-r7s72100','st,spear320-shirq','fsl,imx6sl-src','nokia,n810-wimax',
-		'brcm,nsp','st,lis302dl-spi','fsl,imx7ulp-iomuxc1','ti,twl4030-vmmc1','ti,omap3-intc',
-		'ti,k2g-dsp','ene,kb930','fsl,imx6q-usb','ti,pca9536','fsl,imx-ckil',
-		'nvidia,tegra124-spi','lsi,zevio-timer','fsl,imx6sl-evk','lacie,netxbig-leds','i2c-arb-gpio-challenge',
-		'allwinner,sun8i-a23-prcm','st,stih418-clk','arm,integrator-cp','logicpd,imx6q-logicpd','allwinner,sun8i-r40-csi0',
-		'imx53-m53evk-sgtl5000','st,spear1340','amlogic,meson8-ddr-clkc','allwinner,sun8i-r40-tcon-tv','kobo,aura',
-		'toshiba,tc358768','armadeus,imx27-apf27','st,stpmic1-wdt','marvell,armada-380-coherency-fabric','mediatek,mt7623a-rfb-nand',
-		'arm,versatile-fpga-irq','allwinner,sun6i-a31-ir','arm,cortex-a12','dlg,da9053-aa','marvell,armada-370-pcie',
-		'mediatek,mt6323-rtc','qcom,gcc-msm8960','winbond,w25q32','bananapi,s070wv20-ct16','edt,etm0700g0dh6',
-		'qcom,pcie-ipq8064','st,stmpe-adc','fsl,ls1021a-rcpm','ti,da830-mcasp-audio','cnxt,cx92755-rtc',
-		'colorfly,e708-q1','laird,gatwick','renesas,sh73a0-div6-clock','toshiba,tc358743','friendlyarm,nanopi-r1',
-		'ti,tps65090-charger','atmel,at91rm9200-pinctrl','technologic,imx6q-ts4900','zii,vf610dtu','tq,imx7d-tqma7',
-		'fsl,mxs-gpio','facebook,galaxy100-bmc','ti,tpa6130a2','mediatek,mt8173-cec','renesas,qspi-r8a7792',
-		'atmel,at91sam9261-ebi','renesas,etheravb-r8a7743','smsc,lan9118','io-channel-mux','marvell,armada-370-timer',
-		'allwinner,sun8i-h3-ehci','microchip,sam9x60-pit64b','phytec,imx6ul-pbacd10-emmc','advantech,imx6q-ba16','fsl,imx50-ecspi',
-		'ti,clkdm-gate-clock','mediatek,mt7629-ssusbsys','ti,dra718','fsl,imx6sll-tempmon','mediatek,mt2701-audio',
-		'arm,vexpress-dvimode','samsung,s5pv210-clock','qcom,rpm-pm8921-regulators','ti,da850-tilcdc','ethernet-phy-id004d.d072',
-		'ti,dra76-cal','renesas,sdhi-r7s9210','google,veyron-jerry-rev3','samsung,i9305','allwinner,sun4i-a10-rtc',
-		'nxp,lpc1850-cgu','st,m25l3205d','allwinner,sun6i-a31-i2c','nvidia,tegra20-timer','phicomm,k3',
-		'allwinner,sun8i-a83t-de2-clk','facebook,minipack-bmc','amlogic,meson8-uart','fsl,imx25-asic','st,stm32f469-rcc',
-		'raspberrypi,model-a-plus','nvidia,tegra114-rtc','fsl,imx51-ccm','allwinner,sun7i-a20-display-engine','linux,spdif-dir',
-		'qcom,pm8941','nvidia,tegra-audio-trimslice','marvell,dove-core-clock','ti,k2l-pscrst','rockchip,rk3288-hdmi-analog',
-		'eukrea,mbimxsd25-baseboard-cmo-qvga','renesas,riic-r7s9210','ti,twl4030-vdac','nvidia,tegra30-isp','socionext,uniphier-system-bus',
-		'atmel,at91sam9n12ek','ti,ehci-omap','fsl,imx6q-i2c','ti,7416374','st,l3gd20-gyro',
-		'mx25l6405d','fsl,imx6sx-gpc','st,stih407-c8sectpfe','atmel,at91sam9260-shdwc','primux,inet-d978-rev2',
-		'fairphone,fp2','renesas,scif-r8a7743','ti,am4372-mcspi','marvell,dove-divider-clock','nvidia,tegra124-apbmisc',
-		'hisilicon,hip01-sysctrl','esp,esp8089','dfi,fs700-m60-6qd','ti,netcp-gbe-2','cypress,cy8ctma140',
-		'ti,k2e-dsp','wiliboard,wbd111','smsc,usb3503','allwinner,sun50i-a64-mmc','snps,dw-apb-gpio',
-		'stericsson,fsmc-nand','marvell,armada398','allwinner,sun9i-a80-de-clks','socionext,uniphier-sld8-mioctrl','fsl,imx7d-uart',
-		'brcm,bcm-nsp-ahci','marvell,openrd-base','aspeed,ast2500-spi','mediatek,mt7623-hdmi','st,stm32-dcmi',
-		'revotics,imx6sl-warp','zyxel,nsa325','fsl,imx6sll-kpp','fsl,imx51-iim','ti,am33xx-mcasp-audio',
-		'axis,artpec6-syscon','renesas,can-r8a7745','renesas,shdma-r8a73a4','amlogic,meson8b-aobus-pinctrl','socionext,uniphier-smpctrl',
-		'maxium,max8925','oxsemi,ox810se-pinctrl','arm,versatile-sysreg','socionext,uniphier-ld4-reset','renesas,r8a7793-lvds',
-		'ti,tmp100','sinovoip,bpi-m2-zero','samsung,exynos5420','lge,hammerhead','fsl,imx53-ipu',
-		'nvidia,tegra20-pcie','nvidia,tegra30-epp','atmel,at91sam9261-udc','ti,da850-pll1','m41t00',
-		'ea,lpc4357-developers-kit','cypress,midas-touchkey','microcrystal,rv8803','atmel,at91sam9rlek','google,veyron-fievel-rev1',
-		'socionext,uniphier-ld4-mioctrl','renesas,r8a7778','invensense,mpu9250','picochip,spacc-l2','allwinner,sun9i-a80-usb-clks',
-		'fsl,imx6sl-uart','amlogic,meson8m2-aobus-pinctrl','renesas,irqc-r8a7745','renesas,r8a7744-cmt0','arm,integrator-cp-syscon',
-		'renesas,sata-r8a7790','fsl,aips','ti,omap4-sham','stericsson,db8500-i2c','renesas,rcar_sound-r8a7742',
-		'koe,tx31d200vm0baa','luxul,xwr-3150-v1','cirrus,cs42l51','nvidia,tegra114-ahb','fsl,imx6sll-rngb',
-		'renesas,r8a7793-sysc','mxicy,mx25l12805d','logicpd,dm3730-som-lv-devkit','toradex,colibri_imx6dl','mstar,mst-intc',
-		'corpro,gm7123','wits,pro-a20-dkt','invensense,mpu6515','st,spear1340-pinmux','ti,wl1831',
-		'ti,eeprom','atmel,sama5d4-dma','ntc,ncp15wb473','zii,vf610cfu1','marvell,armadaxp-mv78260',
-		'marvell,88e1118','ti,ds90c185','st,stmpe-pwm','edt,edt-ft5406','luxul,xap-810-v1',
-		'ti,mux-clock','samsung,mfc-v6','adi,adm1278','allwinner,sun6i-a31-apb0-clk','renesas,r8a7744-lvds',
-		'checkpoint,l-50','fsl,imx6sll-usbmisc','ti,lm3532','globalscale,sheevaplug','snps,dwmac-3.611',
-		'samsung,exynos4x12-pinctrl','marvell,a385-db-ap','rockchip,rk3066-spdif','st,stih407-sbc-pinctrl','st,stm32-dsi',
-		'sirf,prima2-pwm','st,stm32-lptimer','marvell,armada-xp-neta','mediatek,mt6323-keys','samsung,exynos3250-mipi-dsi',
-		'synology,ds212jv10','nxp,lpc3220-mic','mediatek,mt7623-imgsys','fsl,imx28-spi','renesas,du-r8a7790',
-		'samsung,exynos3250-pinctrl','marvell,armada-xp-pcie','samsung,s5pv210-adc','google,pit-rev14','brcm,kona-sdhci',
-		'sinovoip,bpi-m3','n25q32b','mediatek,mt7623-spi','aspeed,ast2600-ehci','renesas,r8a7794',
-		'brcm,bcm94708','fsl,imx27-aitc','st,spear600-smi','marvell,mv88f6720-pinctrl','mr25h256',
-		'st,stm32f469-qspi','fsl,imx50-cspi','marvell,armada375','tpo,td043mtea1','silabs,si5351a-msop',
-		'ipmb-dev','renesas,usb2-phy-r8a77470','raumfeld,raumfeld-speaker-m-pxa303','marvell,armada-380-core-clock','ti,da830-mmc',
-		'rockchip,rk3288-wdt','mediatek,mt7623-m4u','kam,imx7d-flex-concentrator','brcm,bcm4339-fmac','buffalo,wzr-1750dhp',
-		'ti,am4372-pwmss','tq,tqma53','renesas,r8a7740-ceu','arm,mps2-timer','issi,is25lp016d',
-		'sirf,atlas7-usbphy','st,stm32-power-config','marvell,pxa300','marvell,armada-380-neta-bm','google,veyron-mickey-rev0',
-		'microchip,mcp16502','nvidia,tegra114-efuse','samsung,ld9040','altr,sdram-edac-a10','samsung,s3c2410-wakeup-eint',
-		'ti,omap4-padconf','renesas,usbhs-r8a7790','menelaus','socionext,uniphier-pxs2-aio','ti,tlv320dac3100',
-		'renesas,intc-irqpin-r8a7778','st,stm32mp153','hardkernel,odroid-c1','amlogic,meson8b-canvas','fsl,imx53-ssi',
-		'brcm,nsp-lcpll0','lwn,display5','ti,omap3-gta04','ti,am3359-cppi41','gpio-vibrator',
-		'qcom,rmtfs-mem','renesas,ipmmu-vmsa','marvell,armada-380-xor','marvell,aurora-outer-cache','usb0424,ec00',
-		'renesas,gpio-r8a7779','mediatek,mt2701-imgsys','lacie,netspace_mini_v2','linksys,armada385','marvell,armada-380-timer',
-		'ti,omap-opp-supply','google,veyron-fievel-rev0','google,veyron-mickey-rev7','amlogic,meson8-aobus-pinctrl','renesas,vin-r8a77470',
-		'st,stih407-flash-pinctrl','mmio-mux','arm,vexpress-sysreg,sys_led','brcm,nand-bcm63138','rockchip,rk3228-grf',
-		'marvell,berlin2q-clk','motorola,cpcap-led-blue','allwinner,sun8i-a33-musb','nvidia,tegra20-vde','kiebackpeter,imx6q-tpc',
-		'gpio-mux','raspberrypi,firmware-reset','arm,cortex-a9-gic','renesas,emev2-smu-gclk','qcom,pcie-ipq4019',
-		'armadeus,st0700-adapt','allwinner,sun9i-a80-display-frontend','nxp,pca9635','ti,omap3-uart','allwinner,sun7i-a20-sram-d',
-		'st,spear-plgpio','avnet,zynq-microzed','incircuit,icnova-a20','nvidia,tegra124-hsuart','chuwi,v7-cw0825',
-		'al,alpine','cubietech,cubieboard6','marvell,armada-375-corediv-clock','phytec,imx6qdl-pcm058','olpc,xo1-battery',
-		'samsung,exynos4210-ehci','mediatek,mt7623','renesas,r7s72100-cpg-clocks','renesas,tpu-r8a7742','ti,twl4030-bci',
-		'topeet,itop4412-elite','amlogic,meson8m2-cbus-pinctrl','stericsson,db8500-prcmu-timer-4','qcom,pm8821-mpp','mediatek,mt8135-pctl-a-syscfg',
-		'nxp,pca9536','renesas,r8a7743-cmt1','i2c-cbus-gpio','marvell,dove-gating-clock','Odroid-XU4',
-		'ti,am43x-epos-evm','gw,gsc-fan','renesas,usb-phy-r8a77470','cdns,sam9x60-macb','fsl,imx1ads',
-		'nvidia,tegra124-dpaux','samsung,exynos5260-clock-gscl','fsl,imx6sll-gpc','rockchip,rk3228','rockchip,rk3036-pinctrl',
-		'raspberrypi,firmware-clocks','renesas,sdhi-r8a7779','picoxcell,fuse-pc3x2','gmt,g781','socionext,uniphier-ld4-soc-glue',
-		'aspeed,ast2500-i2c-bus','arm,versatile-flash','rockchip,rk3188-mali','yic,smdkv210','firefly,firefly-rk3288-beta',
-		'mediatek,mt7623-disp-color','renesas,r7s9210-pinctrl','cdns,wdt-r1p2','stericsson,ab8500-rtc','ti,twl4030-power-idle-osc-off',
-		'qcom,rpm-msm8660','linksprite,pcduino3-nano','ti,pbias-omap4','st,stih407-compositor','atmel,sama5',
-		'usb424,7500','ti,dm814-scm','stericsson,ab8500-btemp','himax,hx8369','motorola,cpcap-led-adl',
-		'al,alpine-msix','google,veyron-fievel','mediatek,mt8135-topckgen','brcm,bcm23550-cdc','xunlong,orangepi-plus',
-		'picoxcell,spi','sharp,lq043t3dx0-panel','faraday,ftgpio010','openpandora,omap3-pandora-1ghz','ti,omap4430-gpmc',
-		'arm,arm1136-pmu','synology,rs812','cirrus,ep7209-timer','samsung,s3c64xx-wakeup-eint','ti,omap2-l4',
-		'altr,socfpga-lwhps2fpga-bridge','rockchip,rk3288-rga','technologic,imx51-ts4800','fsl,vf610-dspi','picochip,pc3x3-pll',
-		'allwinner,sun8i-a23-timer','amarula,vyasa-rk3288','ti,nspire-classic-lcd-panel','renesas,r8a7794-apmu','renesas,r8a7744-sysc',
-		'renesas,hscif-r8a7745','brcm,phy-sata3','atmel,sama5d3-nand-controller','iom,iconnect','google,veyron-mickey-rev3',
-		'fsl,imx6q-gpio','brcm,bcm53125','kobo,clarahd','fsl,imx6q-gpc','fsl,imx28-dcp',
-		'aspeed,ast2400-pwm-tacho','mediatek,mt2701-hdmi-phy','nvidia,seaboard','ti,omap4-dpll-clock','solidrun,hummingboard2/dl',
-		'samsung,exynos5260-pinctrl','ti,dra7-d_can','google,veyron-tiger-rev4','fsl,imx6sll-src','alphascale,asm9260',
-		'ti,ths8134','netgear,r6300v2','realtek,rtd1195','lacie,ethernet-disk-mini-v2','google,veyron-mighty-rev4',
-		'atmel,at91sam9x5-ebi','amlogic,meson8-pmu','toradex,colibri-imx7d-eval-v3','ovti,ov2640','renesas,sdhi-r7s72100',
-		'emlid,neutis-n5h3-devboard','rockchip,rk3288-pinctrl','fsl,imx53','fsl,imx28-gpmi-nand','nvidia,tegra124-ahci',
-		'mpl,cec4','allwinner,a10s-mk802','isil,isl1208','renesas,gpio-r8a7742','fsl,imx1-i2c',
-		'renesas,r8a7745-apmu','holt,hi8435','nvidia,tegra30-ahub','yones-toptech,bs1078-v2','qcom,tcsr-msm8960',
-		'ti,tpd12s016','fsl,imx27-uart','sirf,prima2-memc','st,spear320','samsung,exynos5260-clock-g2d',
-		'brcm,bcm2711-gpio','mediatek,mt7623-hdmi-phy','hardkernel,odroid-xu4','atmel,sama5d2-adc','rockchip,rv1108-usb',
-		'qcom,msm-qgic2','picochip,spacc-ipsec','plx,pex8605','zii,vf610scu4-aib','eeprom-93xx46',
-		'sirf,reserved-memory','st,stm32mp157a-dk1','ti,am33xx-ehrpwm','fsl,imx6sx-fec','ti,lp8720',
-		'renesas,sh_fsi2','ibm,op-panel','ti,tps65218-dcdc5','renesas,etheravb-r8a7742','renesas,rcar-gen2-gpio',
-		'H100 on-board codec','brcm,bcm11351-i2c','socionext,uniphier-pro4-aidet','gw,imx6dl-gw551x','allwinner,sun4i-a10-mali',
-		'allwinner,sun8i-a83t-display-engine','aspeed,ast2500-lpc','fsl,imx35-usbmisc','st,stmpe1601','dummy,dir-hifi',
-		'vitesse,vsc7385','google,veyron-mighty-rev3','zyxel,nsa310a','eukrea,mbimxsd27-baseboard','brcm,bcm43438-bt',
-		'google,veyron-mighty','dh,stm32mp157c-dhcom-som','ti,twl4030-vpll2','mediatek,mt2701-disp-mutex','x-powers,axp209-battery-power-supply',
-		'fsl,imx6qp-sabresd','allwinner,sun7i-a20-csi0','fsl,ls1021a-dcfg','sgtl5000-audio','pov,protab2-ips9',
-		'allwinner,sun6i-a31-ehci','fsl,imx21-audmux','allwinner,sun8i-a83t-emmc','nxp,lpc3220-mlc','mxicy,mx25l8005',
-		'dvi-connector','allwinner,suniv-f1c100s','st,stm32h7-dac-core','sony,xperia-honami','faraday,fa526',
-		'avnet,zynq-zed','samsung,smdk2416','brcm,spi-bcm-qspi','qcom,pm8921-adc','edt,etm043080dh6gp',
-		'samsung,exynos4210-pmu','microchip,sam9x60-shdwc','moxa,moxart-timer','renesas,r8a7790-wdt','ti,omap5-prm',
-		'fsl,imx28-evk-sgtl5000','atmel,at91sam9g45-udc','fsl,imx23-rtc','fsl,imx6ul-wdt','crystalfontz,cfa10055',
-		'active-semi,act8865','smsc,emc1403','sdmc,dm2016','st,m25p','qcom,apq8084',
-		'ti,am33xx-l4-mpuss','fsl,imx25-pwm','nxp,pca9539','qcom,spmi-mpp','snps,dwmac-3.710',
-		'calao,qil-a9260','ti,am5728','atmel,at91sam9g45-pmecc','ti,dra7-mcasp-audio','atmel,at91sam9n12-matrix',
-		'ti,omap4430','sigma,smp8642-usb-phy','fsl,stmp378x-devb','brcm,iproc-ts-adc-syscon','renesas,iic-r8a7742',
-		'fairchild,74hc595','fsl,imx6sll-ocotp','renesas,scifa-r8a7744','atmel,at91sam9g45-rstc','ti,dra7-vpe',
-		'atmel,at91sam9rl-adc','luxul,xbr-4500-v1','ti,tca8418','samsung,smdk5420','qcom,apq8064-sata-phy',
-		'marvell,armada385','ti,dra72','inspur,fp5280g2-bmc','sirf,prima2-sysrtc','snps,designware-i2s',
-		'amlogic,meson8-saradc','himax,hx8357','renesas,sdhi-r8a77470','snps,dw-mshc','tbs-biometrics,a711',
-		'fsl,imx7d-ccm','thine,thc63lvdm83d','renesas,usbhs-r8a7794','infineon,dps310','lg,omap3-sniper',
-		'st,stm32mp1-exti','sony,nsz-gs7','ti,dra762','allwinner,sun6i-a31-tcon','imx6sx-nitrogen6sx-sgtl5000',
-		'karo,tx53-audio-sgtl5000','teejet,mt_ventoux','fsl,imx6ull-usdhc','renesas,rcar-gen2-can','brcm,bcm7445-sun-top-ctrl',
-		'moxa,moxart-dma','variscite,dt6customboard','globalscale,d2plug','portwell,neptune-bmc','fsl,vf610-i2c',
-		'brcm,bcm2711-pcie','nxp,pcf8574a','st,spear1340-evb','renesas,tmu-r8a7740','renesas,msiof-r8a7745',
-		'mediatek,mt2701-apmixedsys','nvidia,tegra-audio-max98090-nyan-big','sirf,atlas7-lcdc','allwinner,sun8i-a83t-rsb','ti,omap4-dss',
-		'ti,dm816-timer','allwinner,sun9i-a80-mmc-config-clk','socionext,uniphier-ld4-pinctrl','renesas,du-r8a77470','platform-uhci',
-		'aspeed,ast2400-pinctrl','renesas,etheravb-r8a7745','fsl,imx6q-ssi','gw,imx6q-gw5400-a','storlink,gemini324',
-		'v3,v360epc-pci','dmo,imx6q-edmqmx6','armadeus,imx6ull-opos6ul','renesas,pcie-r8a7743','renesas,rcar_sound-r8a7778',
-		'ilitek,ili9322','ricoh,rn5t567','samsung,exynos4212-adc','arm,tc11mp-gic','nvidia,tegra30-emc',
-		'national,lm85','st,flexgen','ti,irq-crossbar','vitesse,vsc7395','socionext,uniphier-pxs2-usb3-reset',
-		'compulab,omap3-sbc-t3517','wm,wm8650-pinctrl','allwinner,sun8i-a83t-pwm','fsl,imx35-weim','renesas,r8a7791-sysc',
-		'ti,clockdomain','sirf,prima2-dsp','atmel,at91sam9260-ebi','qcom,pm8841','fsl,imx7d-pcie-phy',
-		'google,veyron-minnie-rev4','fsl,imx-sabreauto-spdif','allwinner,sun8i-a83t-spdif','schulercontrol,imx28-sps1','ti,am33xx-l4-wkup',
-		'asus,rt-n18u','sst,w25q256','honestar,ssd201htv2','allwinner,sun8i-v3s-pinctrl','renesas,irqc',
-		'compulab,cm-t335','eukrea,mbimxsd25-baseboard','s25fl256s1','dataimage,scf0700c48ggu18','st,stw481x-vmmc',
-		'toradex,colibri_t30-eval-v3','auo,g101evn010','nxp,pcf85263','altr,sdram-edac','wm,prizm-ge-rops',
-		'fsl,imx6sx-weim','mediatek,mt7629-pinctrl','terasic,socfpga-cyclone5-sockit','msr,m28cu3','amlogic,meson6-wdt',
-		'rockchip,rk3228-dw-hdmi','fsl,imx23-digctl','inet-tek,inet9f-rev03','boundary,imx7d-nitrogen7','toradex,apalis_imx6q-ixora-v1.1',
-		'nvidia,roth','rockchip,rk3188-timer','mediatek,mt7530','st,stm32mp1-booster','aspeed,ast2500-p2a-ctrl',
-		'nvidia,tegra-audio-wm8903','amlogic,meson8m2-canvas','seagate,cumulus','renesas,r9a06g032-sysctrl','generic-uhci',
-		'allwinner,sun7i-a20-pinctrl','ti,omap2430-gpmc','fsl,imx53-owire','renesas,rspi-r7s9210','nvidia,tegra114-spi',
-		'nvidia,tegra20-pwm','cnxt,cx92755-wdt','st,miphy28lp-phy','udoo,imx6dl-udoo','phytec,imx6dl-pfla02',
-		'brcm,bcm2835-cprman','wobo,a10s-wobo-i5','mediatek,mt7623-disp-mutex','st,stm32f4-spi','allwinner,sun8i-r16',
-		'qcom,rpmcc-msm8660','marvell,armada-380-system-controller','phytec,imx6ul-pbacd10','fsl,imx6sl-ocotp','renesas,sdhi-r8a7790',
-		'marvell,armada380-thermal','microchip,mcp251xfd','allwinner,sun8i-v3','toradex,colibri_t20','nxp,lpc1788-rtc',
-		'rockchip,rk3288-sgrf','iwave,g23s','amlogic,meson8-efuse','atmel,at91rm9200-aic','marvell,a370-db',
-		'marvell,dove-thermal','allwinner,sun7i-a20-ohci','ti,omap3-dss','ti,abb-v2','fsl,imx6sl-ssi',
-		'atmel,usb-a9263','fsl,imx6ul-caam','zii,rave-sp-watchdog','renesas,pfc-r8a7794','ti,omap4-panda',
-		'atmel,sama5d3-ebi','samsung,artik5-eval','pmbus-fan','fsl,imx21-uart','okaya,rs800480t-7x0gp',
-		'ti,tlv320aic32x4','gumstix,omap3-overo-alto35','fsl,vf610-ccm','rockchip,rv1108-cru','ams,as3645a',
-		'ad,plutux','udoo,imx6q-udoo','ti,omap3430','zyxel,nsa320-mcu','rockchip,rk3228-timer',
-		'altr,socfpga-fpga-mgr','dlink,dns327l','phytec,rk3288-pcm-947','brcm,bcm21664-slave-ccu','ti,divider-clock',
-		'luxul,xap-1440-v1','nxp,lm75','x-powers,axp809','renesas,rcar-gen1-ether','aspeed,ast2600-lpc-host',
-		'ti,dra7-atl-clock','arm,cortex-a72-pmu','synology,rs411','mediatek,mt7623-mmc','arm,versatile-fpga',
-		'socionext,milbeaut-usio-uart','mediatek,mt7629-rfb','marvell,dove-db','silead,gsl3670','arm,realview-pb11mp',
-		'renesas,pwm-r8a7744','atmel,at91sam9g20','atmel,at91sam9x5-i2c','ti,sysc-omap3430-sr','mediatek,mt6577-i2c',
-		'oxsemi,ox820','fsl,imx53-src','fsl,imx35-sdma','ti,omap3-dispc','rockchip,rk3228-io-voltage-domain',
-		'marvell,berlin2-sata-phy','renesas,pfc-r8a7792','marvell,armada-390-gating-clock','nvidia,tegra114-hdmi','allwinner,sun4i-a10-dma',
-		'Fascinate4G','ti,tps62362','renesas,pfc-r8a7740','cortina,gemini-rtc','zte,zx296702-topcrm-clk',
-		'brcm,brcmstb','st,sta529','nxp,isp1707','qcom,ipq4019-dk04.1-c1','mediatek,eth-mac',
-		'st,clkgen-pll0','socionext,uniphier-ehci','rockchip,rk808','fsl,imx27-vpu','brcm,bcm2835-mbox',
-		'renesas,msiof-r8a7742','st,stmpe1600','amlogic,meson6-dwmac','n25q128a13','axentia,tse850-pcm5142',
-		'stericsson,db8500-prcmu','cloudengines,pogoe02','fsl,imx6sl-fec','marvell,armada-390-system-controller','aspeed,ast2400-sd-controller',
-		'qcom,adreno-3xx','faraday,ftdma020','arm,coresight-static-replicator','samsung,exynos4412-clock','efm32board',
-		'aspeed,ast2500-usb-vhub','allwinner,sun5i-a13-pinctrl','nxp,lpc1857-eeprom','lamobo,lamobo-r1','marvell,armada-xp-gating-clock',
-		'aspeed,ast2600-usb-vhub','ti,clkctrl-l4-secure','st,st-delta','usi,topkick','atmel,sama5d2-pmc',
-		'amlogic,meson8b-wdt','renesas,sata-r8a7742','fsl,aipi-bus','ti,tmp75','atmel,sama5d2-sfr',
-		'st,stm32f746-rcc','marvell,armada-375-crypto','eukrea,asoc-tlv320','buffalo,lsxl','allwinner,sun6i-a31-hdmi',
-		'cirrus,edb7211','mediatek,mt2701-audsys','compulab,am437x-sbc-t43','luxul,xwr-1200v1','generic-ahci',
-		'arm,impd1-vco2','fsl,imx6sl-gpt','renesas,scifb-r8a7745','allwinner,sun8i-a83t-ir','marvell,mmp2-clock',
-		'ti,am4372-wdt','fsl,imx7d-evk-wm8960','renesas,r8a73a4-cmt1','google,pit','st,lis3lv02dl-accel',
-		'fsl,imx53-qsb','aspeed,ast2600-xdma','qcom,pm8941-gpio','fsl,imx23-icoll','marvell,pxa168-clock',
-		'maxim,max98095','fsl,imx28-usb','sirf,prima2-pcicp','ti,omap2420-sdma','moxa,moxart-mac',
-		'mstar,infinity3','brcm,brcm53012','samsung,exynos5250-dp-video-phy','raumfeld,raumfeld-speaker-s-pxa303','lacie,nas2big',
-		'nvidia,tegra30-usb-phy','allwinner,r7-tv-dongle','axentia,nattis-2','qcom,msm8974-ocmem','renesas,scifb-r8a7740',
-		'allwinner,sun7i-a20-video-engine','renesas,hscif-r8a7779','nxp,lpc3220-spi','fsl,imx35-gpio','onnn,nct1008',
-		'ti,k2hk','fsl,imx7ulp-sim','arm,arm920t','marvell,mv78230-a0-i2c','aspeed,ast2500',
-		'hisilicon,hip04-d01','picoxcell,fuse-pc3x3','fsl,imx6ul-pxp','ti,am3517-emac','nuvoton,npcm750-uart',
-		'ti,trf7970a','imx53-cpuvo-sgtl5000','nxp,fxos8700','usi,topkick-1281P2','renesas,gpio-r8a7792',
-		'x-powers,axp209-adc','mediatek,mt7623-cir','ampire,am-480272h3tmqw-t01h','stericsson,db8500-musb','fsl,imx6sl',
-		'ti,twl6030-vdac','raspberrypi,model-b-rev2','marvell,armada-370-cpu-reset','nvidia,tegra30-vde','allwinner,sun8i-r40-de2-mixer-0',
-		'fsl,imx7s-mu','usb424,ec00','geniatech,atv1200','arm,syscon-icst307','eukrea,cpuimx51',
-		'marvell,orion5x','allwinner,sun4i-a10-sram-d','wm,wm8505-sdhc','nxp,pca9530','ti,emif-keystone',
-		'motorola,mapphone-cpcap-charger','nutsboard,imx6q-pistachio','amlogic,meson-uart','arm,realview-pba8-soc','technexion,imx6q-pico-nymph',
-		'usb424,9e00','brcm,brcmstb-aon-ctrl','sst,sst25vf016b','nxp,lpc3220-udc','samsung,exynos5420-hdmi',
-		'fsl,imx6ul-sai','ti,omap5-padconf','marvell,kirkwood-rtc','ti,omap5-scrm','innolux,ee101ia-01d',
-		'rockchip,rv1108-spi','synology,ds212','wm8782','ti,k2hk-evm','renesas,ether-r8a7791',
-		'sirf,cvd','renesas,rcar_sound-r8a7790','technexion,imx6q-pico-dwarf','microchip,24c128','microchip,sam9x60-dma',
-		'allwinner,sun8i-r40-ohci','phytec,imx6q-pbac06-nand','picochip,pc3x2','70mai,midrived08','renesas,pwm-r8a7791',
-		'google,veyron-fievel-rev8','nvidia,tegra114-i2c','fsl,imx31','allwinner,sun8i-h3-deinterlace','fsl,vf610-dac',
-		'samsung,exynos5250-fimd','ti,am335x-evmsk','marvell,mv78230-pinctrl','cirrus,ep7209-syscon2','st,lis3lv02d',
-		'socionext,uniphier-pxs2-peri-clock','qcom,ipq4019-ap-dk07.1-c2','arm,arm1176jz-s','zii,imx51-scu3-esb','fsl,vf610-flexcan',
-		'qcom,spmi-vadc','ti,tps65217-pwrbutton','parade,ps8625','nlt,nl12880bc20-spwg-24','ibm,mowgli-bmc',
-		'mediatek,mt6765-timer','qcom,pm8058-adc','mediatek,mt6577-sysirq','fsl,imx6dl-sabrelite','technologic,ts4800-ts',
-		'nuvoton,npcm750-timer','technologic,imx28-ts4600','mediatek,mt7623-hdmi-ddc','lenovo,hr855xg2-bmc','adi,ad7418',
-		'allwinner,sun9i-a80-tcon-lcd','atmel,sama5d2-sdhci','allwinner,sun5i-a13-sram-c1','mmc-slot','ti,bq24192',
-		'allwinner,sun8i-a23-display-engine','qcom,kpss-wdt-apq8064','gw,gsc','fsl,ftm-quaddec','ibm,fsi2spi-restricted',
-		'nvidia,venice2','nvidia,tegra20-ahb','qcom,lcc-mdm9615','st,stm32f7-hsotg','samsung,exynos5420-usbdrd-phy',
-		'allwinner,sun6i-a31-p2wi','cznic,turris-omnia-leds','aspeed,ast2500-ehci','renesas,scifb-sh73a0','buffalo,lsqvl',
-		'brcm,bcm11360','st,spear300-evb','samsung,exynos4210-tmu','renesas,rcar-gen2-scif','engicam,imx6-icore',
-		'nxp,pca8574','arm,core-module-integrator','arm,mali-t760','fsl,vf610-usbmisc','samsung,s6e63j0x03',
-		'brcm,genet-mdio-v5','renesas,scif-r8a7793','ti,tilcdc,panel','atmel,at91sam9260-dbgu','micrel,ks8851-mll',
-		'stericsson,db8500-mali','allwinner,sun7i-a20-tcon','realtek,smi-mdio','lvds-encoder','auo,b101aw03',
-		'aspeed,ast2500-lpc-snoop','allwinner,sun8i-a33-usb-phy','st,stmpe-gpio','ti,omap3-beagle','fsl,imx31-weim',
-		'fsl,imx7ulp-scg1','brcm,bcm88312-srab','brcm,sdhci-iproc-cygnus','oxsemi,ox820-gpio','cortina,gemini-power-controller',
-		'allwinner,sun8i-a33-display-frontend','st,spear600-ehci','nvidia,tegra20-nand','linksys,mamba','renesas,vin-r8a7791',
-		'fsl,imx6sx-sdb-spdif','marvell,armada370-mbus','n25q256a','renesas,r8a7742-rst','arm,cortex-a5-gic',
-		'allwinner,sun9i-a80-mmc','samsung,s3c2416-rtc','renesas,iic-r8a7744','xlnx,zynq-zed','variscite,var-dvk-om44',
-		'allwinner,sun8i-v3s-de2-clk','qcom,rpm-msg-ram','fsl,imx35-audmux','usb-c-connector','overkiz,kizboxmini-mb',
-		'renesas,scif-r8a7794','lg,lg4573','st,spear300-kbd','brcm,bcm4329-bt','nxp,pca9532',
-		'allwinner,sun8i-a83t-dw-hdmi','moxa,moxart-gpio','brcm,brcmstb-memc','ti,dra7-dsp','fsl,ls1021a-qdma',
-		'ti,wl1837','allwinner,sun8i-a83t-crypto','stericsson,ab8505','fsl,imx53-pwm','rda,8810pl',
-		'sirf,nocfw-btm','fsl,imx6q-src','zii,imx51-rdu1','ti,omap5-l4-wkup','nvidia,tegra20-hsuart',
-		'ti,lp87565-q1','ti,am4372-rtc','fsl,imx51-owire','ti,syscon-reset','qcom,ssbi',
-		'altr,socfpga-dw-mshc','stericsson,ux500-msp-i2s','nxp,tda998x','silergy,sy8106a','aspeed,ast2500-uhci',
-		'sirf,atlas7-dmac','fsl,imx6sx-sdb-mqs','mediatek,mt2701-mipi-tx','fsl,imx51-fec','amlogic,meson8-analog-top',
-		'ti,tlc59116','samsung,smdk5250','marvell,dove-global-config','nuvoton,npcm750-fiu','ti,tvp5146m2',
-		'national,lm95245','ti,palmas-gpadc','lltc,ltc3589-2','renesas,sdhi-r8a7743','syscon-reboot-mode',
-		'xicor,x1205','atmel,at91sam9x25-pmc','ti,twl4030-pwm','allwinner,sun8i-h3-emac','fsl,imx21-owire',
-		'st-ericsson,hrefv60+','st,stm32f4-i2c','renesas,scif','fsl,imx6sx-qspi','fsl,imx51-iomuxc',
-		'sony,acx565akm','ti,sysc-mcasp','chipspark,rayeager-px2','brcm,bcm2711-thermal','renesas,rcar-gen2-usb-phy',
-		'ibm,fsi2spi','google,nyan-blaze-rev3','qcom,msm8660-pinctrl','merrii,a20-hummingbird','zii,vf610spb4',
-		'pinctrl-single','renesas,hscif-r8a7794','samsung,i9300','samsung,s3c2410-pwm','arm,idle-state',
-		'epson,rx8010','renesas,pci-r8a7745','ti,twl6030-vusim','st,slim-rproc','dlink,dir-665',
-		'ti,emif-am4372','imx6q-ba16-sgtl5000','qcom,ipq4019-pinctrl','sirf,prima2-cphifbg','st,eeprom',
-		'brcm,kona-smc','samsung,exynos-ppmu','goodix,gt928','brcm,bcm11351-hub-ccu','synology,ds411j',
-		'nxp,pnx-i2c','nvidia,tegra20-car','intel,s2600wf-bmc','st,stm32-iwdg','marvell,mv78230-i2c',
-		'arm,coresight-tpiu','nvidia,tegra20-usb-phy','aspeed,ast2500-cf-fsi-master','aspeed,ast2400-lpc-host','fsl,imx7ulp-usbphy',
-		'atmel,sama5d4-rtc','renesas,r8a7790-lvds','fsl,imx31-uart','calxeda,hb-emmc-clock','qcom,scm-apq8064',
-		'fsl,imx6sx-pxp','samsung,midas','marvell,armada-xp-sdram-controller','nokia,h4p-bluetooth','samsung,exynos4-sysreg',
-		'sony,xperia-amami','ti,keystone-navigator-dma','sst,sst25vf040b','arm,sp810','arm,realview-eb-syscon',
-		'st,m25p32','qcom,bam-v1.3.0','brcm,bcm2835-armctrl-ic','gpio-key','atmel,maxtouch',
-		'fsl,imx50-tzic','google,nyan-blaze-rev2','fsl,imx6q-kpp','stericsson,nomadik-src','arm,cortex-a5',
-		'ti,omap5-hdmi','fsl,imx6sll-ccm','oxsemi,ox820-reset','brcm,bcm-keypad','ti,da850-psc0',
-		'renesas,r8a7792','asus,rt-ac68u','st,clkgen-c32','lego,ev3','arm,realview-eb11mp-revb-syscon',
-		'ti,am4372-ehrpwm','atmel,sama5d2','allwinner,sun8i-h3-dma','mediatek,mt2701-wm8960-machine','dlg,da9062',
-		'samsung,fascinate4g','brcm,bcm2835-v3d','allwinner,sun6i-a31-clock-reset','fsl,imx7d-usdhc','ti,tlv320aic3104',
-		'brcm,bcm11351-aon-ccu','fsl,imx7ulp-smc1','st,stmpe2401','marvell,dove-gpu-subsystem','polaroid,mid2809pxe04',
-		'brcm,trx','brcm,bcm2711-avs-monitor','marvell,mv78260-pinctrl','allwinner,sun8i-h3-i2s','samsung,golden',
-		'mediatek,mt6577-timer','aspeed,ast2600-rtc','fsl,imx31-gpio','abb,aristainetos-imx6dl-7','ti,omap2-l4-wkup',
-		'atmel,at91sam9rl-pwm','ti,keystone-spi','snps,spear-ahci','amlogic,meson8b-pmu','luxul,xap-1610-v1',
-		'fsl,vf610-src','allwinner,sun4i-a10-musb','atmel,at91rm9200-gpio','microchip,ar1021-i2c','renesas,r8a7743-lvds',
-		'yic,smdkc110','brcm,brcmstb-reboot','google,pit-rev15','grinn,imx6ul-liteboard','st,spear13xx-pwm',
-		'ti,dra7-atl','fsl,imx27-mmc','xlnx,zynq-microzed','arasan,cf-spear1340','mediatek,mt7629-wdt',
-		'm25p128','ti,k2g-ice','ibm,p10-occ','renesas,pci-r8a7791','friendlyarm,nanopi-neo-air',
-		'brcm,bcm2711-hvs','imx6-riotboard-sgtl5000','nvidia,tegra20-udc','nxp,pca9673','microchip,sam9x60-i2c',
-		'samsung,exynos5250-usbdrd-phy','aspeed,ast2600-scu-ic0','allwinner,sun4i-a10-ccu','raspberrypi,model-zero-w','ti,omap3430-sdma',
-		'arm,cortex-a5-twd-timer','renesas,pci-rcar-gen2','st,stm32f4-crc','marvell,sheeva-v7','ti,omap2-uart',
-		'arm,arm720t','nokia,retu','qcom,ipq4019-nand','maxim,max1619','allwinner,sun8i-h3-mali',
-		'renesas,sysc-sh73a0','marvell,mmp2-gpio','ti,omap-dmtimer-pwm','cnm,codahx4','brcm,bcm2835-spi',
-		'nvidia,tegra124-dfll','allwinner,sun5i-a13-display-engine','st,spear320-hmi','mediatek,mt7629-timer','google,veyron-jerry-rev7',
-		'brcm,nsp-pinmux','summit,smb347','ti,pcf8575','renesas,armadillo800eva','micron,n25q064',
-		'atmel,sama5d3-rstc','mediatek,mt6323-led','ti,omap4-des','stericsson,ab8500','ti,dra7-pcie',
-		'st,stm32-lptimer-counter','microchip,sam9x60-rstc','socionext,uniphier-pro4-pinctrl','qcom,rpm-apq8084','atmel,at93c46d',
-		'st,stm32f769','fsl,imx28','renesas,rcar-gyroadc','fsl,pfuze3000','renesas,r8a7793-cmt1',
-		'ti,sci-pm-domain','overkiz,kizbox3-hs','fsl,imx6sx-asrc','renesas,dmac-r8a7743','technexion,imx6q-pico-pi',
-		'generic-xhci','arm,vexpress-osc','karo,imx6qp-tx6qp','rockchip,rk3066-i2s','nxp,pca9505',
-		'fsl,imx23-dcp','mediatek,mt7623-jpgdec','st,stm32mp1-m4','abb,aristainetos-imx6dl-4','brcm,bcm11351-master-ccu',
-		'x-powers,ac100-rtc','fsl,imx6ull','mediatek,mt2701-ethsys','qcom,spmi-pmic-arb','ti,ts3a227e',
-		'socionext,uniphier-ld4-soc-glue-debug','fsl,imx-audio-wm8960','syscon-poweroff','solidrun,hummingboard/q','aspeed,ast2600-ibt-bmc',
-		'samsung,K3QF2F20DB','nvidia,tegra20-tvo','mediatek,mt8135-pinctrl','ti,nspire-cx-lcd-panel','marvell,armada-380-spi',
-		'brcm,bcm2711-hdmi0','amlogic,meson8-usb2-phy','st,stm32-thermal','lvds-panel','fsl,imx50-src',
-		'sst25wf080','olimex,a13-olinuxino-micro','globalscale,sheevaplug-esata','ti,twl4030-usb','fsl,vf610-gpio',
-		'x-powers,axp813-usb-power-supply','st,stusb1600','rockchip,rk818','ti,dm816-ahci','fsl,imx23-lradc',
-		'google,veyron-minnie-rev1','ti,omap3-hsotgusb-interface-clock','beagle,am5729-beagleboneai','hid-over-i2c','ilitek,ili2117',
-		'marvell,mvebu-sata-phy','ti,omap5-dsp','ti,wl1281','ricoh,r2025sd','samsung,exynos4210-srom',
-		'fsl,imx28-lradc','denx,m28evk','google,veyron-minnie-rev2','fsl,sgtl5000','ti,palmas-usb-vid',
-		'mediatek,mt7629-scpsys','fsl,imx6q-ipu','altr,clk-mgr','st,stm32mp1-iwdg','maxim,max77663',
-		'rockchip,rk3288-vop','allwinner,sun6i-a31-hstimer','intel,ixp42x','samsung,exynos5420-tmu-ext-triminfo','itian,sq201',
-		'gw,imx6dl-gw5912','arm,arm-firmware-suite','nvidia,tegra124-pmc','ti,omap34xx','atmel,at91sam9260-rtt',
-		'direct-mapped','renesas,rcar-gen2-hscif','mediatek,mt7629-pcie','marvell,orion-wdt','ti,tps6507x',
-		'licheepi,licheepi-zero','qcom,pm8921-keypad','infineon,ir35221','nvidia,tegra30-timer','fsl,icoll',
-		'renesas,r8a7791-gyroadc','snps,dw-apb-gpio-port','allwinner,sun8i-a83t-r-intc','eukrea,cpuimx25','arm,vexpress-shutdown',
-		'allwinner,sun8i-r40','cnxt,cx92755','isee,omap3-igep0030','allwinner,sun8i-r40-rtc','mediatek,generic-tphy-v1',
-		'renesas,scifa-r8a73a4','fsl,imx35-esdhc','cubietech,cubietruck-plus','fsl,imx7d-sdb','fsl,imx6sll-usbphy',
-		'allwinner,sun6i-a31s-pinctrl','st,m25p80','amlogic,meson8m2-dwmac','arm,integrator-ap-pci','marvell,rd88f6192',
-		'digi,ccimx6ulsom','fsl,imx53-sdma','fsl,imx28-mbmx28lc-sgtl5000','allwinner,sun4i-a10-sid','fsl,ls1021a-scfg',
-		'brcm,bcm58525','samsung,exynos5260-clock-kfc','fsl,imx6sx-usbmisc','samsung,n710x','asus,rt-ac56u',
-		'ti,da830-tbclksync','cirrus,ep7209','fsl,imx25-iim','fsl,imx28-evk','ad,medcom-wide',
-		'qcom,apq8084-sbc','atmel,sama5d3-pwm','nuvoton,npcm750-lpc-kcs','renesas,gpio-r8a7745','samsung,trats',
-		'allwinner,sun9i-a80-pinctrl','rohm,bu21013_tp','ti,omap2-prcm','st,stih407-core-syscfg','ti,dra742',
-		'renesas,rcar_sound-gen2','ti,tlv320aic3007','megachips,stdp4028-ge-b850v3-fw','nxp,rtc-pcf2123','brcm,bus-axi',
-		'renesas,nbpfaxi64dmac8b16','microchip,sam9x60ek','nvidia,tegra124-mc','arm,eb11mp-gic','ti,omap-infra',
-		'marvell,adma-1.0','timeriomem_rng','fsl,imx6qp-ipu','fsl,imx1-fb','moxa,moxart-uc-7112-lx',
-		'nvidia,tegra30-gr2d','atmel,sama5d2-gem','atmel,at91sam9261-lcdc','fpga-region','renesas,sdhi-r8a7745',
-		'marvell,armada-375-coherency-fabric','ge,imx6q-b850v3','ti,am3352-wkup-m3-ipc','renesas,r8a7790-usb-dmac','renesas,hscif-r8a7743',
-		'renesas,hscif-r8a7790','wits,colombus','st,stm32mp1-fmc2-nfc','brcm,bcm7445','marvell,kirkwood-gating-clock',
-		'innolux,n133hse-ea1','brcm,bcm947189acdbmr','samsung,exynos3250-pmu','allwinner,auxtek-t003','allwinner,sun8i-a33-ccu',
-		'samsung,s3c6410-i2s','samsung,exynos4210-secss','st,flexgen-audio','google,veyron-tiger-rev7','ti,am438x',
-		'atmel,at91sam9g25-pmc','fsl,imx28-rtc','technologic,imx6dl-ts4900','renesas,r8a7791','tx53-audio-sgtl5000',
-		'nxp,lpc1850-dwmac','bhf,cx9020','ad,tec','fsl,imx31-i2c','oxsemi,ox820-nand',
-		'renesas,qspi','atmel,asoc-wm8904','samsung,s5pv210-usb2-phy','xen,xenvm-4.2','phytec,imx6ull-pbacd10-nand',
-		'innolux,at043tn24','allwinner,sun7i-a20-tcon0','mstar,msc313-pmsleep','mrvl,pxa-ssp-dai','ti,dac7512',
-		'oxsemi,ox810se-rps-timer','samsung,s6e63m0','everspin,mr25h256','mediatek,mt6580-timer','renesas,gpio-r8a7790',
-		'atmel,sama5d2-isc','lemaker,guitar','fsl,imx6q-fec','chunghwa,claa101wa01a','mediatek,mt2701-auxadc',
-		'sirf,atlas7-usb','arm,arm1136jf-s','inversepath,imx53-usbarmory','operating-points-v2','mediatek,mt2701-scpsys',
-		'qcom,apq8084-pinctrl','emmicro,em3027','fsl,imx6q-sabresd','ti,am43xx-phy-gmii-sel','buffalo,lswsxl',
-		'renesas,bsid','ti,musb-dm816','nextthing,gr8-pinctrl','marvell,prestera-98dx3336','x-powers,ac100',
-		'atmel,at91sam9263-lcdc','ti,wl1283','maxim,max5821','st,comms-ssc4-i2c','fsl,vf610-ftm-pwm',
-		'renesas,r9a06g032-pinctrl','nvidia,tegra20-ictlr','mediatek,mt2701-hifsys','ti,dra7-evm','allwinner,sun6i-a31s-tcon',
-		'adi,adt7490','renesas,irqc-r8a73a4','mediatek,mt2701-wdt','emlid,neutis-n5h3','st,stm32h7-timer-trigger',
-		'mediatek,mt7629-nor','rockchip,rk3288-uart','regulator-gpio','altr,socfpga-a10-perip-clk','mediatek,mt7629-eth',
-		'netgear,readynas-2120','nvidia,tegra124-hdmi','fsl,imx-audio-tlv320aic32x4','arm,versatile-ab','fsl,imx27-pata',
-		'calxeda,hb-a9bus-clock','allwinner,sun8i-r40-crypto','microchip,sam9x60-adc','socionext,uniphier-system-cache','renesas,r7s9210-wdt',
-		'ti,clkctrl-l4per','aspeed,ast2600-pinctrl','ti,omap5-scm-padconf-core','wm8731','mediatek,mt7629-sysirq',
-		'socionext,uniphier-pxs2','fsl,imx51-sahara','renesas,r8a7792-cpg-mssr','qcom,kpss-wdt-msm8960','ti,twl4030-keypad',
-		'toradex,tegra-audio-sgtl5000-apalis_t30','cortina,gemini-ethernet','samsung,exynos3250','ti,am5748','marvell,berlin2cd-usb-phy',
-		'microchip,24lc128','asix,ax88796c','allwinner,sun8i-a83t-musb','ti,ucd90320','nuvoton,npcm750-jtag-master',
-		'marvell,mmp3-hsic-phy','renesas,porter','socionext,uniphier-pxs2-perictrl','aspeed,ast2400-vic','pwm-fan',
-		'oxsemi,ox810se-gpio','renesas,fdp1','intel,ixp43x-interrupt','mediatek,mt6323-pwrc','marvell,kirkwood',
-		'gpio-gate-clock','renesas,r7s9210-ostm','ti,twl4030-power-reset','allwinner,sun7i-a20-i2c','ti,omap3430-timer',
-		'rockchip,rk3188-efuse','ti,phy-pipe3-pcie','brcm,kona-wdt','ti,palmas-pwrbutton','nvidia,tegra114-timer',
-		'arm,cortex-a72','amlogic,meson8b-efuse','auo,b101ean01','altr,socfpga-a10-ocram-ecc','apx4devkit-sgtl5000',
-		'imx28-tx28-sgtl5000','brcm,bcm2835-hdmi','brcm,bcm11360-srab','rockchip,rk3229-evb','fsl,imx28-timrot',
-		'brcm,iproc-pwm','fsl,imx35-i2c','marvell,orion-sdio','fsl,imx35-cspi','aspeed,ast2600-fmc',
-		'x-powers,axp202-usb-power-supply','qcom,pm8941-misc','brcm,bcm11351-slave-ccu','renesas,usbhs-r8a77470','Midas',
-		'ti,keystone,main-pll-clock','sirf,prima2','marvell,prestera-98dx4251','samsung,s5pv210-i2s','renesas,sdhi-r8a7794',
-		'st,spear600-fsmc-nand','elimo,impetus','iwave,g20d','gumstix,omap3-overo-tobi','arm,arm11mpcore-pmu',
-		'jedec,lpddr2-timings','allwinner,sun6i-a31-ts','moxa,moxart','samsung,exynos-bus','ti,twl4030-vintdig',
-		'numonyx,js28f128','fsl,imx27-pwm','google,pi-rev13','silabs,si4713','microchip,mcp7940x',
-		'renesas,irqc-r8a7790','brcm,bcm2835-vchiq','amlogic,meson8b-uart','cdns,ttc','sirf, atlas7-g2d',
-		'atmel,at91sam9g46-sha','chipidea,usb2','aspeed,ast2500-sdhci','compal,paz00','dh,imx6q-dhcom-pdk2',
-		'renesas,rmobile-iic','atheros,ath6kl','st,stih407-rear-pinctrl','altr,socfpga-hps2fpga-bridge','nxp,lpc3220-timer',
-		'atmel,at91sam9261-pmc','gw,imx6dl-gw5913','aspeed,ast2600-lpc-ctrl','xunlong,orangepi-one','atmel,at91sam9260ek',
-		'gw,imx6q-gw54xx','fsl,imx7d-pwm','faraday,ftintc010','allwinner,sun5i-a10s','fsl,imx35-pdk',
-		'allwinner,sun50i-a64-emmc','brcm,bcm2835-vec','stericsson,pinctrl-u300','fsl,imx35-fec','brcm,bcm2835-i2c',
-		'allwinner,sun8i-r40-usb-phy','stericsson,ab8500-pwm','ti,omap2-iommu','renesas,sdhi-r8a7740','toradex,apalis-tk1-v1.2-eval',
-		'maxim,max31785a','ti,keystone-wdt','st,stm32f4x9-fsotg','gw,imx6q-gw52xx','renesas,usbhs-r8a7791',
-		'qcom,hdmi-tx-8960','altr,socfpga-cyclone5','semtech,sx1503q','chipidea,ci13611a-prima2','nvidia,tegra114-pmc',
-		'fsl,imx28-ocotp','fsl,imx51-ssi','stericsson,ux500-cryp','ti,tps65917-pmic','ti,am33xx-l4-fast',
-		'fsl,imx6q-snvs-lpgpr','fsl,imx50-ccm','atmel,sama5d3-pmc','stericsson,nomadik-pmu','mxicy,mx25u4035',
-		'nvidia,tegra114-dc','ti,twl4030-power-beagleboard-xm','qnap,power-off','x-powers,axp223-usb-power-supply','axentia,tse850v3',
-		'allwinner,sun8i-a83t-r-cpucfg','gmt,g762','brcm,nandcs','marvell,orion-eth','mediatek,mt2701-nor',
-		'sirf,prima2-dspif','atmel,at91sam9260-pmc','marvell,orion-system-controller','atmel,at91rm9200-st','renesas,ether-r8a7778',
-		'snps,dw-apb-timer','amd,imageon','raidsonic,ib-nas6210-b','fsl,imx6sx-iomuxc-gpr','marvell,orion-rtc',
-		'fsl,imx6ull-pxp','nvidia,tegra30-hda','atmel,at91rm9200ek','allwinner,sun8i-r40-gmac','ti,dra726-pcie-ep',
-		'allwinner,q8-a13','st,m41t94','renesas,pwm-r8a7745','ti,am5718','microchip,sam9x60-can',
-		'via,vt8500-timer','qcom,gcc-msm8974','samsung,exynos5250-dwusb3','digi,connectcore-ccxmx51-jsk','nxp,lpc1850-dmamux',
-		'rockchip,rk3228-vop','aspeed,ast2500-scu','marvell,armada-xp-crypto','mediatek,mt7623-hifsys','fsl,imx6dl-gpt',
-		'rockchip,rk3228-i2c','V2M-P1','marvell,bootrom','st,lsm9ds1-magn','renesas,fsi2-sh73a0',
-		'nvidia,tegra30-gmi','renesas,r8a7742-sysc','seagate,goflexnet','asahi-kasei,ak8963','plathome,openblocks-a7',
-		'ti,omap2-rfbi','qcom,pm8018','allwinner,sun5i-a10s-pinctrl','gumstix,omap3-overo-gallop43','marvell,armada-375-timer',
-		'atmel,sama5d2-aic','samsung,fascinate4g-wm8994','marvell,armada-375-gating-clock','fsl,imx6ul-tempmon','samsung,exynos5410-pmu',
-		'qcom,apq8084-saw2-v2.1-cpu','sirf,prima2-spi','nvidia,tegra30-actmon','ti,sysc','ti,omap4-dpll-core-clock',
-		'ti,twl4030-vaux3','qcom,pm8941-coincell','ti,emif-am3352','fsl,imx6ull-ocotp','arm,realview-pb1176-soc',
-		'mrvl,mmp-intc','mrvl,pxa3xx-ssp','microchip,24c02','renesas,r8a7742-cmt1','brcm,bcm53573-ilp',
-		'samsung,exynos4210-mipi-dsi','ti,dra746-ehrpwm','renesas,mmcif-r8a7740','brcm,bcm21664-resetmgr','rt5616',
-		'nvidia,tegra114-i2s','google,veyron-speedy-rev8','mediatek,mt6589','brcm,spum-nsp-crypto','renesas,ipmmu-r8a7793',
-		'st,stmfx-0300-pinctrl','allwinner,sun5i-a13-hstimer','st,stds75','fsl,imx50-evk','altr,a10sr-reset',
-		'alphascale,asm9260-clock-controller','st,stm32-rtc','ti,omap4-hsi-port','spansion,s25fl064k','ibm,p9-occ',
-		'fsl,imx53-gpt','marvell,armada-370-gating-clock','stericsson,ab8500-clk','arm,pl18x','rockchip,rv1108-usbgrf',
-		'sirf,atlas7-adc','allwinner,sun8i-v3s-usb-phy','st,lis2de12','mundoreader,bq-curie2','ti,palmas-pmic',
-		'allwinner,sun8i-h3-sid','brcm,brcm53016','fsl,imx31-avic','fsl,ls1021a-qspi','primux,inet97fv2',
-		'samsung,exynos5420-clock','edt,et057090dhu','allwinner,sun9i-a80-apbs-gates-clk','atmel,24c128','allwinner,sun9i-a80-display-engine',
-		'samsung,aries','microchip,sam9x60-usart','samsung,exynos5420-dw-mshc','google,veyron-jerry-rev15','sirf-prima2-rtciobg-bus',
-		'ti,da830-cfgchip','linksys,ea6500-v2','allwinner,sun8i-r40-tcon-top','ricoh,rc5t619','rockchip,rk3036-i2s',
-		'renesas,rcar-gen2-sata','google,veyron-jerry-rev13','allwinner,sun7i-a20-crypto','google,veyron-jaq-rev3','gmt,g751',
-		'st,stm32f4-dac-core','allwinner,sun4i-a10-mdio','st,stm32f7-uart','powervr,sgx510','renesas,intc-irqpin',
-		'tpo,td028ttec1','samsung,exynos4212-rotator','asahi-kasei,ak8974','marvell,mmp2-ssp','brcm,brahma-b15',
-		'ti,twl6030','friendlyarm,nanopi-duo2','compulab,omap5-sbc-t54','rockchip,rk2928-dw-mshc','cnxt,cx92755-timer',
-		'altr,socfpga-a10-fpga-mgr','arm,coresight-tmc','sirf,prima2-memcmon','google,veyron-jerry-rev5','renesas,can-r8a7743',
-		'brcm,bcm2835-rng','nvidia,tegra-audio-max98090-nyan','firefly,firefly-rk3288','stericsson,ab3100','ti,omap36xx-bandgap',
-		'renesas,ipmmu-r8a7790','ti,omap3-rfbi','renesas,r8a7743-cpg-mssr','socionext,uniphier-pxs2-clock','qcom,apq8084-mtp',
-		'nvidia,tegra20-dsi','allwinner,sun5i-a13-video-engine','pmbus','ad,tegra-audio-wm8903-tec','google,nyan-blaze-rev9',
-		'samsung,exynos4210-sdhci','qcom,ipq4019-mdio','dumb-vga-dac','arm,pl330','compulab,cl-som-imx7',
-		'atmel,sama5d4-pmc','intel,ixp4xx-flash','mx25l25635e','isee,omap3-igep0020','ti,am4372-gpio',
-		'allwinner,sun8i-r40-ahci','fsl,imx27-ccm','ti,wl1835','mediatek,mt7629-rng','brcm,bcm47189',
-		'arm,mali-400','st,stm32-timer-counter','arm,psci','lsi,axm55xx-reset','qcom,scorpion',
-		'fsl,imx6sll-wdt','nxp,lpc3220-slc','arm,versatile-i2c','st,stpmic1','mrvl,pxa-i2c',
-		'brcm,cygnus-genpll','altr,socfpga-a10-l2-ecc','brcm,nsp-amac','ti,ina231','atmel,at91sam9g45-ebi',
-		'fsl,imx6q-ldb','brcm,cygnus-v3d','samsung,skomer','amazon,omap3-echo','aspeed,ast2500-sdram-edac',
-		'boe,hv070wsa-100','phytec,imx6ull-pbacd10','marvell,dove-pmu','fsl,imx-audio-spdif','allwinner,sun6i-a31-ohci',
-		'st,stm32-ltdc','sancloud,am335x-boneenhanced','samsung,smdk5410','raidsonic,ib-4220-b','fsl,imx7d',
-		'technologic,ts7970-gpio','renesas,qspi-r8a7745','ti,twl4030-vusb1v8','fsl,imx25-flexcan','marvell,88E1111',
-		'renesas,riic-rz','sirf,prima2-cb','qcom,ipq4019-ap-dk07.1-c1','ti,sci-reset','allwinner,mk802',
-		'sirf,atlas7-video-codec','sinlinx,sina31s-sdk','samsung,s3c2416-pinctrl','pps-gpio','ti,davinci-dm6467-emac',
-		'sbs,sbs-battery','ti,814-elm','mundoreader,bq-edison2qc','fsl,imx25-ccm','cdns,zynq-gem',
-		'macronix,mx25l6405d','fsl,imx25-gpio','marvell,armada370','marvell,orion-timer','moxa,moxart-ic',
-		'rockchip,rk3288','renesas,iic-r8a7790','socionext,uniphier-pro4-dwc3-glue','rockchip,rk3288-mipi-dsi','rockchip,rk3288-evb-act8846',
-		'wm,wm8750','jedec,jc-42.4-temp','fsl,imx6sl-rngb','allwinner,sun6i-a31-dma','mrvl,axi-bus',
-		'brcm,nsp-gpio-a','socionext,uniphier-pxs2-sd-reset','via,vt8500-rhine','delta,dps800','x-powers,axp818',
-		'eeti,egalax_ts','synopsys,dwc-ahsata','arm,integrator-ap-lm','brcm,cygnus-mipipll','marvell,armada-38x-uart',
-		'stericsson,ab8500-debug','renesas,gpio-r8a77470','samsung,s5pv210-jpeg','fsl,imx6ul-usbmisc','prt,prtwd2',
-		'arm,pl192-vic','nvidia,tegra30-kbc','mediatek,mt2701-jpgdec','synology,ds110jv20','aspeed,ast2600-wdt',
-		'aspeed,ast2400-wdt','renesas,msiof-sh73a0','ti,ths8135','st,stih407-flash-syscfg','qcom,pm8058-keypad-led',
-		'sharp,lq101k1ly04','brcm,bcm11351-pinctrl','atmel,sama5d3-aic','nvidia,tegra124-actmon','fsl,imx53-flexcan',
-		'microchip,sama5d27-wlsom1-ek','fsl,vf610-wdt','renesas,dmac-r8a7745','radxa,rock2-square','brcm,bcm-nsp-rng',
-		'dlink,dns-320','brcm,bcm2048-nokia','mediatek,mt2701-musb','renesas,usbhs-r8a7744','fsl,imx6ulz',
-		'nvidia,tegra114','calxeda,ecx-2000-ddr-ctrl','qcom,apq8064-cm-qs600','marvell,orion5x-88f5182','ti,omap4460',
-		'ti,twl6030-vaux1','fsl,imx6ul-weim','xlnx,zynq-zc706','nvidia,tegra114-gr3d','calao,tny-a9g20',
-		'imx53-voipac-sgtl5000','google,veyron-mickey-rev8','mediatek,mt2701-i2c','ti,k2g','renesas,thermal-r8a7793',
-		'ti,phy-pipe3-sata','maxim,max1037','st,stm32mp15-bsec','invensense,mpu6050','renesas,usb-phy-r8a7743',
-		'marvell,coherency-fabric','brcm,bcm5301x-srab','ti,omap3-evm','axis,artpec6-pinctrl','fsl,imx6q-udoo-ac97',
-		'stericsson,db8500-thermal','macronix,mx25u4033','engicam,imx6-icore-rqs','fsl,imx-audio-sgtl5000','raumfeld,raumfeld-connector-pxa303',
-		'allwinner,sun8i-h3-de2-mixer-0','sirf,prima2-video-codec','mele,m3','fsl,imx28-lcdif','atmel,at91sam9rl-ssc',
-		'fsl,imx35-uart','phytec,imx6qp-pbac06','cirrus,ep7209-bus','rockchip,rv1108-tsadc','fsl,imx6ul-gpt',
-		'socionext,uniphier-sld8-mio-clock','ti,omap5-uevm','st,stm32f756-hash','ti,omap2420-timer','wlf,wm8904',
-		'ti,omap3-dpll-clock','mediatek,mt7622-scpsys','nuvoton,nau7802','fsl,imx25-gcq','ti,am3-prm-inst',
-		'st,spear300','brcm,kona-gpio','qcom,gcc-apq8064','ti,omap3-l3-smx','prt,prti6q',
-		'bosch,bma250','ti,omap2-gpio','microsoft,olympus-bmc','fsl,imx21-rtc','synology,ds210jv30',
-		'brcm,iproc-pcie','samsung,exynos3250-jpeg','ti,omap-sdma','ti,am4372-uart','pci8086,1533',
-		'ti,tps61052','brcm,bcm2835-txp','ti,omap3-gpio','fsl,imx27-wdt','allwinner,sun5i-a13-sram-d',
-		'st,stm32f469i-disco','microchip,sam9x60-udc','asahi-kasei,ak4104','ti,ohci-omap3','olpc,xo-1.75',
-		'brcm,brcmnand-v6.1','mediatek,mt7623-rng','marvell,armada-380-xhci','ti,omap4-rng','adi,adxl345',
-		'boundary,imx6dl-nitrogen6x','marvell,mbus-controller','operating-points-v2-ti-cpu','atmel,at91sam9x5-clk-slow-osc','xlnx,zynq-zc770-xm011',
-		'egnite,ethernut5','st,stw4811-usb','renesas,intc-irqpin-r8a7779','ti,da830-musb','renesas,r8a7793-rst',
-		'ti,am33xx-tilcdc','qcom,pm8941-regulators','lwn,bk4','renesas,apmu','st,lps331ap-press',
-		'sirf,atlas7-codec','realtek,rtl8366rb','arm,vexpress-power','amlogic,meson8','arm,vexpress-cf',
-		'ti,am335x-edma-crossbar','marvell,kirkwood-88f6281','fsl,imx6ul-usdhc','raspberrypi,model-zero','cortina,gemini-gpio',
-		'olimex,a20-olimex-som204-evb-emmc','ti,pruss-shmem','avago,apds9930','toradex,apalis_t30-v1.1','st,stih407-dwmac',
-		'fsl,imx53-tzic','nextthing,gr8-ccu','renesas,r8a7792-cmt1','motorola,cpcap-rtc','renesas,lager',
-		'microcrystal,rv4162','toradex,colibri-imx6ull-eval','ti,am3-prcm','atmel,at91sam9260-pit','ibm,fsi2pib',
-		'qcom,bam-v1.4.0','i2se,duckbill-2','google,veyron-jaq-rev4','atmel,sama5d35ek','renesas,r7s72100-irqc',
-		'arm,cortex-a53','ti,sysc-dra7-mcan','fsl,imx6sl-usbphy','sirf,prima2-rsc','ti,omap2-intc',
-		'fsl,imx6q-sdma','ti,omap4-l4-per','phytec,imx6qp-pbac06-nand','allwinner,sun8i-a83t-usb-phy','ti,tmp108',
-		'x-powers,axp806','maxim,max11801','stericsson,ab8500-fg','atmel,atecc508a','renesas,msiof-r8a7790',
-		'mrvl,mmp2-mux-intc','ti,wl1271-bluetooth-nokia','ti,k2g-sci-clk','marvell,pxa2xx-lcdc','allwinner,sun4i-a10-spi',
-		'ti,am437x-vpfe','arm,impd1-vco1','ti,omap34xx-bandgap','allwinner,sun7i-a20-ehci','brcm,bcm58522-srab',
-		'st,stm32mp15-i2c','microchip,sam9x60-aic','st,spear600-evb','qcom,pcie-apq8064','ti,omap2420-padconf',
-		'aspeed,ast2500-pwm-tacho','fsl,imx6sx-flexcan','renesas,du-r8a7791','fsl,imx28-auart','marvell,armadaxp-98dx4251',
-		'ams,as3711','renesas,rcar_sound-r8a7743','ti,twl6030-vaux2','poslab,imx6q-savageboard','samsung,artik5',
-		'st,comms-ssc4-spi','nvidia,tegra-audio-rt5640-beaver','nvidia,tegra30-flowctrl','lsi,nspire-cx-clock','samsung,exynos5420-i2s',
-		'google,snow-audio-max98091','cdns,qspi-nor','ti,omap2430-sdma','fsl,imx6q-ahci','mediatek,mt7623-thermal',
-		'fsl,imx23-pwm','hdmi-connector','amlogic,meson6','fsl,ls1021a-ahci','nvidia,tegra124-sdhci',
-		'snps,dw-apb-ictl','sirf,atlas7-vpp','stericsson,abx500-temp','armadeus,imx28-apf28dev','brcm,iproc-mailbox',
-		'kobo,tolino-shine2hd','samsung,exynos5260-clock-disp','solidrun,clearfog-base-a1','sff,sfp','ti,omap-counter32k',
-		'fsl,mma8450','socionext,uniphier-pxs2-thermal','raumfeld,raumfeld-speaker-l-pxa303','toshiba,tc358778','technexion,imx6ul-pico-hobbit',
-		'raspberrypi,bcm2835-power','marvell,kirkwood-88f6282','mrvl,pxa910-dkb','ti,omap3-smartreflex-core','rockchip,rk3288-grf',
-		'allwinner,sun7i-a20','ti,da830-rtc','ti,davinci-aemif','ti,omap2430-mcbsp','fsl,imx27-usb',
-		'ti,pbias-omap','lsi,axm5516-clks','altr,socfpga-arria10','sirf,ns2kal1-rproc','st,mlahb',
-		'st-ericsson,u9500','sigma,smp8734-ethernet','ciaa,lpc4337','samsung,exynos4210-pd','renesas,rcar-gen2-thermal',
-		'fsl,anatop-regulator','samsung,exynos5250-tmu','resistive-adc-touch','nvidia,tegra114-mipi','aspeed,ast2400-lhc',
-		'mxim,ds1339','renesas,r8a7740-mstp-clocks','st,spear600-ohci','marvell,dfx-server','st,stih407-front-pinctrl',
-		'qcom,pm8921-pwrkey','arm,arm1176jzf-devchip-gic','rikomagic,mk808','da850','marvell,armada370-audio',
-		'altr,sys-mgr','atmel,24c16','fsl,imx6q-weim','hardkernel,odroid-u3','rockchip,rk3288-pwm',
-		'fsl,imx6ul-ccm','compulab,cm-a510','st,stm32-pwm-lp','maxim,max77836-battery','linksprite,pcduino3',
-		'gw,imx6q-gw5912','renesas,ether-r8a7742','brcm,bcm58525-srab','renesas,r8a7790-apmu','fsl,imx6ul-iomuxc',
-		'ti,omap4-smartreflex-core','allwinner,sun8i-v3-pinctrl','fsl,imx50-usb','samsung,exynos5250-prng','synology,ds110jv10',
-		'marvell,orion5x-88f5181-mbus','nvidia,tegra124-cec','renesas,alt','nxp,lpc1850-scu','nvidia,tegra30-apbmisc',
-		'st,spdif-in','sirf,atlas7-ipc','ti,keystone-devctrl','nvidia,tegra124-ictlr','ti,da850-pll0',
-		'ti,twl4030-pwrbutton','st,stmpe-keypad','socionext,uniphier-gpio','brcm,bcm94709','sharp,gp2ap002s00f',
-		'lwn,mccmon6','renesas,r8a77470','fsl,imx6q-vpu','amlogic,meson8m2-clkc','allwinner,sun6i-a31-usb-phy',
-		'mediatek,mt7623-disp-pwm','nuvoton,npcm750-kcs-bmc','atmel,sama5d2-tcb','aspeed,ast2400-i2c-bus','google,pit-rev6',
-		'solidrun,clearfog-a1','mediatek,mt7623-mipi-tx','exynos4210-hdmiphy','brcm,nsp-armpll','mediatek,mt2701-disp-wdma',
-		'arm,armv7m-nvic','allo,sparky','fsl,imx6dl','buffalo,lsgl','fsl,imx51-usbmisc',
-		'renesas,msiof-r8a7791','st,stm32-timers','hardkernel,odroid-x','arm,vexpress-scc,v2p-ca15_a7','qcom,gcc-mdm9615',
-		'ti,am3517','microchip,sst25vf016b','marvell,rd-ac3x-48g4x2xl','ti,am3-dpll-clock','nec,nl4827hc19-05b',
-		'socionext,uniphier-pro4-usb3-regulator','ti,lp5562','aspeed,ast2400-fmc','winstar,wf70gtiagdng0','ti,sram',
-		'innolux,at070tn83','lacie,d2-network','brcm,bcm58622','samsung,exynos4412-pmu','fsl,imx28-clkctrl',
-		'marvell,pxa300-clocks','st,24c32','brcm,ns-thermal','amlogic,meson8-rtc','via,vt8500-device-clock',
-		'ibm,mihawk-bmc','armadeus,imx6q-apf6','qcom,mdm9615','hisilicon,hix5hd2-sata-phy','renesas,iic-sh73a0',
-		'fsl,imx6-sabreauto-cs42888','fsl,imx6q-mmdc','isil,isl29023','stericsson,s365','google,nyan-blaze-rev4',
-		'st,stm32mp1-dfsdm','marvell,armada-370-cpu-config','digi,ccimx6ulsbcpro','nxp,lpc3220-i2s','marvell,pxa-mmc',
-		'altr,socfpga-ocram-ecc','n25q512a','aspeed,ast2400-lpc','mxicy,mx25v8035f','ti,omap4-l4-wkup',
-		'samsung,exynos4212-hdmi','rockchip,display-subsystem','ti,dra7','brcm,bcm11351-dw-apb-uart','sirf,prima2-pulsec',
-		'renesas,irqc-r8a7792','marvell,rd-ac3x','cirrus,ep7209-syscon3','fsl,imx23-usb','crystalfontz,cfa10056',
-		'st,thermal-spear1340','aspeed,ast2400','eckelmann,imx6dl-ci4x10','snps,dwmac-3.50a','fsl,imx7d-usbmisc',
-		'nvidia,tegra30-mpe','qcom,gcc-ipq4019','cirrus,ep7209-mctrl-gpio','fsl,imx51-babbage-sgtl5000','fsl,imx6ul-kpp',
-		'overkiz,kizbox2-2','rockchip,rk3036-grf','aspeed,ast2500-cvic','socionext,uniphier-sld8-reset','ti,twl6030-pwmled',
-		'ti,omap2-mcspi','phytec,imx6q-pfla02','adi,adv7180','fsl,imx28-dma-apbh','nvidia,tegra-audio-max98090',
-		'marvell,mmp3-clock','allwinner,sun9i-a80-deu','ti,twl4030-vaux4','st,spear1310-miphy','fsl,mxs-audio-sgtl5000',
-		'renesas,tmu','ti,dm6441-spi','renesas,r8a7742-cpg-mssr','wm,wm8750-pll-clock','ti,wl1251',
-		'marvell,berlin2q-sata-phy','socionext,uniphier-pro4-usb3-ssphy','imx-spdif','fsl,imx35-iomuxc','allwinner,sun8i-v3-ccu',
-		'taos,tsl2550','nvidia,tegra20-gr3d','allwinner,sun4i-a10-tcon','sirf,prima2-rstc','i2se,duckbill',
-		'snps,dwmac-4.20a','mstar,msc313-gpio','pineriver,mini-xplus','ti,omap4-iommu','fsl,imx-audio-mqs',
-		'allwinner,sun8i-v3s-ccu','sirf,atlas7-gpio','telit,evk-pro3','fsl,imx6ull-14x14-evk','armadeus,imx6dl-apf6dev',
-		'usb424,3503','mediatek,mt7623-smi-larb','acer,picasso','micron,n25q032','samtec,imx6sx-vining-2000',
-		'fsl,imx6sx-usdhc','google,nyan-big-rev6','fsl,imx7d-sdma','ethernet-phy-id1234.d400','gumstix,am335x-pepper',
-		'fsl,vf610-sai','rockchip,rk3066-spi','mediatek,mt7623-disp-wdma','socionext,uniphier-dwc3','hardkernel,odroid-x2',
-		'st,stm32h743','samsung,exynos3250-usb2-phy','marvell,prestera-98dx3236','fsl,imx35-wdt','st,l3gd20',
-		'allwinner,sun8i-r40-sram-c1','amlogic,meson8-pwm','allwinner,sun8i-h3-pinctrl','renesas,bockw','samsung,exynos4210-spi',
-		'allwinner,sun8i-a83t-r-ccu','ti,omap5-dispc','asahi-kasei,ak4648','brcm,bcm58623','brcm,bcm21664-garnet',
-		'allwinner,sun8i-a23-ehci','mediatek,mt7623-infracfg','google,veyron-jaq-rev1','fsl,imx53-uart','ti,omap4-panda-es',
-		'brcm,bcm2711-pixelvalve4','atmel,at91sam9x5-tcb','arm,pl172','ti,twl4030-vusb3v1','mediatek,mt6577-uart',
-		'panel-dpi','aspeed,ast2400-usb-vhub','ti,ths8134b','renesas,irqc-r8a7791','fsl,imx53-iim',
-		'marvell,mv78460-pinctrl','ti,tps51632','fsl,imx6ul-14x14-evk','rockchip,rk3228-dw-mshc','fsl,imx1-gpio',
-		'ti,k2e-evm','ti,omap3430-gpmc','realtek,horseradish','renesas,r8a7778-cpg-clocks','st,stm32-dac',
-		'renesas,r8a7794-sysc','ti,twl6030-power','altr,socfpga-l2-ecc','google,veyron-brain','synology,ds213j',
-		'atmel,at91sam9g35ek','ti,ucd90120','st,stm32-rcc','pixcir,pixcir_tangoc','fsl,imx7s',
-		'ti,am437x-idk-evm','allwinner,sun6i-a31-display-engine','panel-dsi-cm','fsl,imx7d-fec','fsl,imx31-sdma',
-		'gw,imx6q-gw5903','ti,control-phy-otghs','renesas,r7s72100-ports','actions,s500-sps','ti,omap5-wugen-mpu',
-		'wlf,wm8903','fsl,imx25-kpp','samsung,aries-wm8994','synology,ds212pv20','renesas,scif-r8a7744',
-		'socionext,uniphier-ld4-peri-reset','ti,omap3-ldp','qcom,pm8058-mpp','qcom,wcnss-wlan','lsi,nspire-cx-ahb-divider',
-		'mediatek,mt8135-uart','fsl,imx1-aitc','socionext,uniphier-pxs2-peri-reset','renesas,thermal-r8a7791','sirf,atlas7-sdr',
-		'ysoft,imx6dl-yapp4-orion','allwinner,sun8i-a23-ccu','fsl,imx53-gpio','mrvl,mmp-twsi','socionext,milbeaut-m10v-evb',
-		'renesas,pfc-r8a7742','st,stih-cec','oxsemi,ox820-stdclk','marvell,orion-devbus','allwinner,sun8i-a23-ohci',
-		'arm,arm1176-pmu','fsl,imx21-i2c','brcm,bcm2711-pixelvalve3','st,stih407-uni-player-dac','stericsson,db8500-gpio',
-		'ti,composite-divider-clock','picochip,axi2pico-pc3x3','microchip,sam9x60-sdhci','rockchip,rk3066-tsadc','nxp,lpc1850-sct-pwm',
-		'ti,dm814-adpll-lj-clock','mediatek,mt7623n-rfb-emmc','ti,omap4-hsi','epson,rtc8564','dlg,da9052',
-		'marvell,kirkwood-crypto','fsl,imx6q-vdoa','renesas,rcar_sound-r8a7794','altr,a10sr-gpio','ti,twl4030-vio',
-		'fsl,imx6q-ecspi','tpo,taal','ibm,p9-sbefifo','ti,tmp105','marvell,orion-eth-port',
-		'renesas,r7s72100','sirf,prima2-usp','fsl,imx7ulp-mmdc','ibm,fsi-i2c-master','zte,zx296702-uart',
-		'ti,omap4-l3-noc','udoo,neobasic','acme,ariettag25','rockchip,rk3066-power-controller','brcm,bcm23550',
-		'ti,omap3-dpll-per-j-type-clock','netgear,wnr854t','arm,syscon-icst525-integratorap-sys','renesas,mtu2','arm,pl081',
-		'renesas,usb-phy-r8a7742','atmel,at91sam9n12-hlcdc','fsl,imx6q-nitrogen6_max-sgtl5000','qca,qca8337','aspeed,ast2600-lpc-reset',
-		'renesas,rcar_sound-r8a7793','ti,usbhs-tll','ti,omap3-prm','ti,da830-div4p5ena','renesas,sysc-r8a73a4',
-		'ti,dra7-cm-core','ti,am4372-mdio','socionext,uniphier-pro4-peri-clock','samsung,exynos5420-pmu','renesas,scifa-r8a7745',
-		'brcm,bcm7445-hif-cpubiuctrl','globalscale,guruplug-server-plus','ibm,cffps2','microchip,emc1413','primux,inet86dz',
-		'netgear,r8500','qcom,pm8921-gpio','fsl,imx28-gpio','ti,twl4030-vaux1','aspeed,ast2600-smpmem',
-		'rockchip,rk3288-gmac','samsung,s5pv210-onenand','brcm,bcm7445-sata-phy','technexion,imx6dl-pico-pi','linksys,caiman',
-		'renesas,mmcif-r8a73a4','st,stm32f429i-disco','fsl,imx6ull-rngb','renesas,rzn1-uart','pci10b5,8605',
-		'ti,am437x-usb2','mediatek,mt7623-g3dsys','rockchip,iommu','allwinner,sun4i-a10-sram-a3-a4','google,snow-audio-max98090',
-		'allwinner,sun8i-h3-spdif','ti,dra7-ipu','atmel,sama5d2-secumod','ti,dra74','buffalo,lsxhl',
-		'arm,cci-400','technexion,imx7d-pico-pi','renesas,r9a06g032-uart','nvidia,tegra20-isp','n25q128a11',
-		'none','lego,ev3-battery','samsung,exynos4210-sysram','ti,twl6030-vpp','aspeed,ast2600',
-		'fsl,imx7ulp-ocotp','google,veyron-fievel-rev3','novtech,imx7d-meerkat96','allwinner,sun6i-a31-spi','ti,omap4-cm2',
-		'fsl,imx7ulp-pwm','sirf,atlas7-vip0','microchip,sam9x60-rtt','usb424,2640','allwinner,sun8i-h3-dw-hdmi',
-		'winbond,w25q128','mediatek,mtk-xhci','ti,omap4-keypad','allwinner,sun8i-a23-display-backend','sirf,atlas7-lvdsc',
-		'google,nyan-blaze','ti,dra7-iommu','mstar,mercury5','fsl,imx7d-pcie','renesas,rcar-gen2-cmt0',
-		'ams,ccs811','boundary,imx6sx-nitrogen6sx','raspberrypi,firmware-gpio','allwinner,sun8i-h3-sram-c1','renesas,usb-dmac',
-		'renesas,usb2-phy-r7s9210','nvidia,tegra20-sdhci','allwinner,sun7i-a20-display-backend','marvell,88E1514','fsl,imx6q-nitrogen6x-sgtl5000',
-		'ti,fixed-factor-clock','qcom,pm8941-rtc','ti,dra7-cm-core-aon','google,cros-ec-spi','xlnx,zynq-xadc-1.00.a',
-		'technexion,imx6ul-pico-pi','fsl,imx53-qsrb','qcom,rpm-pm8901-regulators','mediatek,mtk-cirq','xlnx,zynq-devcfg-1.0',
-		'facebook,yamp-bmc','socionext,milbeaut-smp-sram','ti,twl5031','smsc,lan9221','wand,imx6qp-wandboard',
-		'mediatek,mt7629-xhci','marvell,armadaxp-mbus','atmel,sama5d4-i2c','arm,sp805','faraday,ftpci100',
-		'logicpd,imx31-lite','ti,abb-v3','renesas,r8a7779-cpg-clocks','synology,ds409slim','mediatek,mt6580',
-		'microchip,sam9x60-sckc','xlnx,zynq-zc770-xm010','technexion,imx6q-pico-hobbit','renesas,irqc-r8a7743','fsl,imx7ulp-usb',
-		'ti,da850-mstpri','armadeus,imx6dl-apf6','atmel,at91sam9260-sdramc','silead,gsl3675','atmel,sama5d36ek-cmp',
-		'fsl,imx53-asrc','fsl,imx23-mmc','renesas,rcar_sound-r8a7745','semtech,sx1301','synology,ds211j',
-		'google,pit-rev9','tq,imx7s-mba7','samsung,exynos4212-fimc-is','qcom,pm8941-iadc','kam,imx7d-flex-concentrator-mfg',
-		'samsung,exynos-sysmmu','qcom,rpm-pm8058-regulators','raidsonic,ib-nas6220-b','atmel,at91sam9263-ebi1','marvell,armada-xp-cpu-config',
-		'renesas,r8a7779-reset-wdt','usb0424,9514','dlink,dns-325-a1','cdns,at91rm9200-emac','zte,sysctrl',
-		'microchip,24c512','fsl,imx27-ssi','fsl,imx6ul-ecspi','allwinner,sun7i-a20-sram-c1','renesas,hscif',
-		'fsl,imx51-pwm','renesas,r8a7742-usb-dmac','allwinner,sun5i-a13-usb-phy','swir,mangoh-green-wp8548','ti,omap2-dss',
-		'arm,cortex-a8-pmu','renesas,r8a7792-cmt0','cdns,gem','renesas,r8a7791-usb-dmac','marvell,axp-gp',
-		'samsung,exynos5410-clock','allwinner,sun8i-a33-pinctrl','arm,external-bus-interface','renesas,intc-irqpin-r8a7740','hydis,hva40wv1',
-		'fsl,ls1021a-moxa-uc-8410a','atmel,sama5d4-gem','atmel,at91sam9rl-dma','renesas,bsc','ti,omap2430-sdp',
-		'spansion,s25fl064l','fsl,imx53-iomuxc-gpr','google,nyan-big-rev0','xunlong,orangepi-plus2e','renesas,i2c-r8a77470',
-		'renesas,sdhi-r8a7742','zii,rave-sp-mezz','fsl,imx6-armadeus-sgtl5000','dlg,da9210','ti,dm814-pllss',
-		'atmel,at25','hardkernel,odroid-xu3-lite','fsl,imx6sl-usb','gw,imx6dl-gw5904','st,sti-display-subsystem',
-		'shiratech,stm32mp157a-stinger96','stericsson,db8500-dma40','renesas,r8a7745','solomon,ssd1309fb-i2c','allwinner,sun8i-a23-r-pinctrl',
-		'allwinner,sun8i-h3-csi','allwinner,sun8i-a83t-system-controller','fsl,ls1021a-v1.0-dspi','allwinner,sun50i-a64-dma','atmel,sama5d3-hlcdc',
-		'nxp,sja1105q','microchip,cap1106','arm,mali-450','ti,sysc-omap2-timer','fsl,ftm-timer',
-		'rockchip,rk3036-cru','ti,tilcdc,slave','nxp,lpc3220-pwm','renesas,rcar_sound-gen1','atmel,sama5d4-pmecc',
-		'ti,omap-prm-inst','linutronix,testbox-v2','ti,dm816-scrm','samsung,exynos4210-clock','renesas,bsc-sh73a0',
-		'qcom,kpss-acc-v2','microchip,mcp4651-104','stericsson,ab8500-gpadc','eukrea,mbimxsd25-baseboard-dvi-vga','fsl,imx6sl-sdma',
-		'marvell,mv98dx3236-core-clock','atmel,at91sam9g46-aes','marvell,pdma-1.0','zii,vf610spu3','sgd,gktw70sdae4se',
-		'gw,imx6dl-gw5910','renesas,du-r8a7779','amlogic,meson8-pwrc','empire-electronix,m712','renesas,rcar-gen2-i2c',
-		'samsung,s5pv210-fimd','samsung,exynos5260-pmu','nvidia,tegra20-sflash','marvell,orion-bridge-intc','ti,twl4030-vsim',
-		'fsi-master','globalscale,dreamplug-003-ds2001','lenovo,hr630-bmc','altr,socfpga-stmmac-a10-s10','ti,dra7-hdmi',
-		'Micron,n25q128a11','brcm,cygnus-iproc-i2c','fsl,imx6ul-tsc','atmel,sama5d2-rtc','samsung,exynos5420-mixer',
-		'DVI-VGA','ti,dra7x-usb2','socionext,uniphier-pro4-reset','cirrus,ep7209-intc','microchip,usb2512b',
-		'qcom,apq8074-dragonboard','renesas,usbhs-r8a7742','arm,pl041','renesas,rcar-gen1-sdhi','calxeda,highbank',
-		'synology,ds213v10','renesas,rcar-gen2-xhci','renesas,emev2-smu','hisilicon,sysctrl','fsl,imx28-mmc',
-		'samsung,s3c64xx-pinctrl','fsl,imx50-sdma','qcom,rpm-apq8064','m28evk-sgtl5000','fsl,imx27-dma',
-		'jedec,lpddr3','incostartec,omap3-lilly-dbb056','arm,pl190-vic','atmel,at91sam9g45','renesas,irqc-r8a7744',
-		's35390a','mqmaker,miqi','fsl,mpl3115','ea,imx7ulp-com','aspeed,ast2400-lpc-bmc',
-		'ti,bq32000','gpio','socionext,uniphier-pro4-mio-clock','samsung,exynos5800','cirrus,ep7211',
-		'arm,cortex-m4','qcom,pm8941-charger','engicam,imx6ul-geam','aspeed,ast2500-lpc-reset','ad,tamonten',
-		'renesas,iic-r8a7743','qcom,msm8974-mss-pil','rockchip,rk3188-power-controller','buffalo,lschlv2','marvell,berlin2-ahci',
-		'ti,pbias-omap2','ti,twl4030-wdt','st,stm32-lptimer-trigger','incostartec,omap3-lilly-a83x','brcm,bcm2835-system-timer',
-		'atmel,at91sam9x5-hlcdc','aspeed,ast2600-lpc-snoop','arm,armv7m-systick','marvell,orion-nand','st,stih407-uni-player-spdif',
-		'marvell,armada370-nand-controller','sony,acx424akp','marvell,mv88e6190','adi,adt7476','dlink,dir-685',
-		'atmel,at91sam9g10-i2c','bosch,bma254','ti,omap5-l4-abe','synology,ds209','sirf,prima2-clkc',
-		'primux,inet98v-rev2','cypress,aries-touchkey','marvell,armada-380-corediv-clock','samsung,exynos4412-tmu','allwinner,sun5i-a13-ccu',
-		'fsl,imx6ul-ocotp','fsl,imx23-dma-apbx','x-powers,axp209-gpio','luxul,xap-1510v1','fsl,imx35-spdif',
-		'google,veyron-jerry-rev14','nvidia,gk20a','fsl,imx25-wdt','ti,twl6030-vusb','qcom,ipq4019',
-		'technologic,ts4900-gpio','renesas,r8a7745-cmt0','brcm,iproc-msi','mediatek,mt2701-cirq','ak,ak8975',
-		'sinovoip,bpi-m2-berry','toshiba,tc35893','socionext,uniphier-pro4-soc-glue','renesas,scifa','st,stih407-dwc3',
-		'atmel,at91rm9200-i2c','allwinner,sun6i-a31-rtc','ti,twl4030-vpll1','ti,sysc-omap4','amlogic,meson-mx-assist',
-		'phytec,am335x-wega','st,sta32x','actions,s500','fsl,imx6sl-gpio','synology,ds410j',
-		'mpl,cec4-10','fsl,imx6qp-pcie','synology,ds411slim','ti,am335x-timer-1ms','brcm,bcm63138-sata-phy',
-		'qcom,rpmcc-apq8064','cirrus,ep7209-dai','renesas,msiof-r8a7743','fsl,imx31-pwm','marvell,orion-ehci',
-		'fsl,vf610-qspi','renesas,pfc-emev2','ti,emif-4d','libretech,all-h3-cc-h2-plus','marvell,98dx3236-pinctrl',
-		'mediatek,mt6397-codec','calxeda,hb-ahci','qiaodian,qd43003c0-40','renesas,rcar-gen2-jpu','socionext,uniphier-pxs2-aidet',
-		'renesas,sdhi-r8a7793','maxtor,shared-storage-2','fsl,imx53-tve','sigma,tick-counter','ti,keystone-i2c',
-		'ti,am4372-ecap','fsl,imx50-audmux','nvidia,tegra30-dc','socionext,uniphier-pro4-usb3-reset','renesas,iic-r8a7791',
-		'redboot-fis','calao,usb-a9g20','renesas,r2a11302ft','aspeed,ast2400-lpc-ctrl','atmel,hlcdc-pwm',
-		'ti,dra742-uart','qcom,prng','arm,vexpress,v2m-p1','dlg,da9062-onkey','atmel,at91sam9g15ek',
-		'fsl,imx50-wdt','cirrus,ep7209-clk','atmel,at91sam9g45-ssc','eukrea,mbimxsd35-baseboard','ti,ads7957',
-		'atmel,at91sam9260-udc','ti,omap5-cm-core-aon','snps,dwc3','iwave,g22m','asus,tilapia',
-		'atmel,at91sam9263','renesas,genmai','allwinner,sun6i-a31-r-pinctrl','toradex,apalis_imx6q-eval','ti,da850-ahci',
-		'ti,am3517-craneboard','marvell,armada-380-rtc','sirf,atlas7-car','atmel,at91sam9x5-clk-slow-rc-osc','fsl,imx21-wdt',
-		'facebook,wedge400-bmc','dlink,dns-kirkwood','zii,vf610dev','renesas,rcar-gen2-usbhs','fsl,imx6q-hdmi',
-		'ti,twl6030-usb','focaltech,ft6236','x-powers,ac100-codec','atmel,sama5d3-nfc-io','samsung,s5p-cec',
-		'socionext,uniphier-sld8','fsl,imx53-m53evk-sgtl5000','allwinner,sun8i-r40-mali','nxp,isp1301','gw,imx6q-gw53xx',
-		'renesas,r8a7743-apmu','fsl,imx25-fb','qcom,lcc-ipq8064','atmel,sama5d3-pinctrl','compulab,am437x-cm-t43',
-		'sirf,atlas7-pmu-ldo','brcm,bcm2711-hdmi-i2c','ti,k2e','ti,composite-clock','microchip,sama5d27-wlsom1',
-		'fsl,imx53-nand','arm,coresight-dynamic-funnel','atmel,sama5d4-wdt','qcom,smem','arm,cortex-a53-pmu',
-		'mediatek,mt7623-mali','atmel,at91sam9x5-gpio','fsl,imx6ul-flexcan','marvell,armada380-mbus','allwinner,sun6i-a31-display-backend',
-		'xunlong,orangepi','arm,arm11mp-gic','wd,mbwe','samsung,exynos4210-audss-clock','atmel,hsmci',
-		'karo,imx6dl-tx6dl','ti,tlv320aic33','renesas,rzn1-pinctrl','allwinner,sun8i-r40-de2-clk','fsl,mma7455l',
-		'google,pi-rev10','atmel,at45db021d','fsl,imx23-dma-apbh','ti,dra7-dma-crossbar','ti,dra7-sdhci',
-		'ricoh,rn5t618','fsl,imx31-ccm','stericsson,ab3100-regulators','arm,syscon-icst525-integratorap-pci','fsl,imx25-i2c',
-		'imx6ul-sgtl5000','renesas,r8a7740','fsl,imx23-i2c','qcom,lpass-cpu','renesas,rcar-thermal',
-		'allwinner,sun8i-a23-codec','national,lp5523','fsl,imx31-mmc','nvidia,tegra124-i2s','st,rng',
-		'dallas,ds3231','brcm,bcm20702a1','sirf,hwspinlock','ti,tps6586x','ti,composite-gate-clock',
-		'samsung,ltn140at29-301','nvidia,tegra114-kbc','rockchip,rv1108-gmac','allwinner,sun4i-a10','samsung,s3c6410-wdt',
-		'renesas,rcar-gen2-vin','renesas,hscif-r8a7793','atmel,sama5d2-pinctrl','renesas,scifb-r8a73a4','renesas,sata-r8a7779',
-		'embest,imx6q-marsboard','fsl,imx23-spi','nvidia,tegra30-sdhci','snps,dwmac-3.70a','lsi,nspire-classic-clock',
-		'xunlong,orangepi-mini','arm,hdlcd','st,stih407-restart','fsi-master-gpio','nvidia,tegra30-gr3d',
-		'mstar,smpctrl','brcm,bcm7120-l2-intc','marvell,openrd-client','samsung,arndale-wm1811','x-powers,axp221-adc',
-		'renesas,i2c-r8a7790','socionext,uniphier-pro4','synaptics,synaptics_i2c','allwinner,sun8i-a83t-hdmi-phy','ti,omap4-prm',
-		'renesas,gpio-r8a7744','pinconf-single','ti,omap3-ssi-port','aspeed,ast2600-gpio','si,si7021a20',
-		'hit,hd44780','actions,owl-uart','st,stm32mp157-z-pinctrl','allwinner,suniv-f1c100s-system-control','allwinner,sun8i-a33-codec',
-		'samsung,exynos5420-nocp','fsl,imx6q-nitrogen6_som2-sgtl5000','nokia,himalaya','nuvoton,npcm750-clk','aspeed,ast2600-silicon-id',
-		'spansion,s25fl164k','honeywell,hmc5883l','synology,ds213airv10','orisetech,otm8009a','allwinner,sun6i-a31-ccu',
-		'samsung,exynos4210','socionext,uniphier-ld4-perictrl','ti,omap5-scm-wkup-pad-conf','atmel,tcb-timer','renesas,can-r8a7790',
-		'marvell,98dx3336-resume-ctrl','phytec,am335x-phycore-som','axentia,tse850-envelope-detector','ti,da850-psc1','rockchip,rk3066-hdmi',
-		'phytec,vf610-cosmic','fsl,imx6sx-wdt','ti,omap3-pre-es3-hsmmc','ti,omap3-zoom3','raspberrypi,3-model-b-plus',
-		'brcm,brcmstb-smpboot','nvidia,tegra30-ehci','ti,wl1837-st','pca9554','samsung,exynos5260-clock-mfc',
-		'imx6-pico-sgtl5000','brcm,bcm63138-bootlut','renesas,etheravb-r8a7744','qcom,mmcc-msm8974','samsung,s3c6400-hsotg',
-		'stericsson,coh901331','seeed,stm32mp157c-odyssey-som','vscom,onrisc','wm,wm8850','allwinner,suniv-f1c100s-wdt',
-		'mrvl,mmp-timer','gw,imx6q-gw552x','fsl,sec-v4.0-mon-rtc-lp','motorola,mapphone-cpcap-adc','cortina,gemini-watchdog',
-		'samsung,xyref5260','fsl,imx7d-gpt','ti,dra72-cal','nvidia,harmony','arm,cortex-a9-twd-wdt',
-		'microchip,sam9x60-pinctrl','st,stm32f429','brcm,bcm23550-smc','rotary-encoder','google,veyron-mickey-rev4',
-		'ti,omap5430-timer','ti,omap4-mcbsp','brcm,iproc-fa2-mbox','ti,omap2430-i2c','altr,socfpga-pll-clock',
-		'samsung,exynos5250-mali','toradex,apalis-tk1-eval','marvell,armada-390-pmsu','atmel,at91sam9261-matrix','oxsemi,ox810se',
-		'toradex,colibri_t20-iris','ti,dra722','compulab,cm-fx6','ti,davinci_mdio','ti,am437x-dwc3',
-		'ti,dra746-ecap','atmel,at91sam9261-i2c','samsung,exynos5420-oscclk','ti,cc2560','google,veyron-jaq',
-		'moxa,moxart-watchdog','atmel,at91sam9rl-udc','stericsson,coh901327','zyxel,nsa310','nvidia,tegra20-pmc',
-		'fsl,imx6sx-dma-apbh','hisilicon,hip04-fabric','st,stm32f469','marvell,armadaxp-98dx3336','st,stm32f7-i2c',
-		'axis,artpec6-pcie','hisilicon,hix5hd2','renesas,sdhi-r8a7791','atmel,sama5d2-pdmic','nvidia,ventana',
-		'zii,rave-sp-rdu1','marvell,pxa3xx-nand-controller','insignal,origen4412','renesas,usb-phy-r8a7794','samsung,exynos5260-clock-peri',
-		'fsl,pfuze100','ti,am3-scm','st,stih407-hda','fsl,imx6ul-csi','excito,b3',
-		'brcm,kona-pwm','ti,tps65090','brcm,bcm2836','google,cros-ec-i2c-tunnel','ti,tps65023',
-		'netgear,readynas-104','renesas,fsi2-r8a7740','allwinner,sun5i-a13-display-backend','denx,m28evk-sgtl5000','st,stm32-dma',
-		'ti,clkctrl-l4-per','marvell,armadaxp-mv78460','qcom,kpss-wdt-ipq4019','marvell,pxa-intc','hce,cosino_mega2560',
-		'rockchip,rockchip-spi','imx53-qsb-sgtl5000','nxp,lpc3220-uart','allwinner,sun8i-v3s-timer','arm,arm1176jzf',
-		'atmel,at91sam9x25ek','snps,dw-low-reset','bananapi,bpi-r2','hisilicon,hix5hd2-ir','nxp,pca9641',
-		'toradex,colibri_t30','nvd,9128','fsl,imx50-pwm','nuvoton,w83773g','samsung,exynos5',
-		'fsl,imx7d-src','mrvl,pxa910','st,stih407-clkgen-a9-mux','qcom,kpss-timer','allwinner,sun8i-r40-display-engine',
-		'innolux,n116bge','rervision,h3-dvk','stmpe,gpio','arm,pl110','qcom,kpss-acc-v1',
-		'friendlyarm,zeropi','brcm,bcm4709','st,stm32mp1-fmc2-ebi','st,stm32mp1-cryp','maxim,max77826',
-		'allwinner,sun6i-a31-codec','cadence,gem','st,stm32f429-pinctrl','ti,da850-dsp','renesas,r8a7744-apmu',
-		'qcom,apq8064-ifc6410','alt,alti6p','google,snow-rev4','samsung,p4note','renesas,wheat',
-		'ti,pbias-omap5','lsi,axxia-syscon','fsl,ls1021a-esdhc','samsung,s5pv210-uart','samsung,exynos4210-pinctrl',
-		'fsl,ls1021a-twr','hisilicon,hisi-gmac-v1','calao,usb-a9260','sirf,prima2-sdhc','ti,twl6030-vcxio',
-		'tmp100','brcm,bcm2836-armctrl-ic','ti,davinci-nand','nxp,24c02','ti,da830-timer',
-		'allwinner,sun4i-a10-tv-encoder','fsl,imx28-dma-apbx','sirf,nocfw-cgum','st,stih418','imx28-evk-sgtl5000',
-		'winbond,w25q64','microchip,sam9x60-tcb','sinovoip,bpi-m1-plus','brcm,bcm63138','rohm,dh2228fv',
-		'maxim,max31725','renesas,r8a7791-cpg-mssr','marvell,armada-xp-wdt','renesas,rcar-gen1-hscif','allwinner,sun7i-a20-system-control',
-		'fsl,imx51-audmux','honeywell,hmc5843','fsl,imx-osc','renesas,pcie-rcar-gen2','brcm,ns-bx-usb3-phy',
-		'samsung,exynos4x12-usb2-phy','CMO-QVGA','amlogic,meson-rng','st,lis3de','renesas,r8a7742-cmt0',
-		'renesas,vin-r8a7794','tq,imx7d-mba7','compulab,omap5-cm-t54','fsl,imx51-i2c','dlink,dns-313',
-		'cdns,macb','sigma,smp8642-intc','fsl,vf610-mscm-ir','samsung,exynos5420-wdt','renesas,dbsc-r8a73a4',
-		'ti,twl6040','ti,omap2-rng','google,veyron-speedy-rev7','qnap,ts419','ti,am3517-evm',
-		'qcom,msm8974-snoc','raspberrypi,2-model-b','rohm,bh1780','atmel,at91sam9x35-pmc','ti,twl6030-gpadc',
-		'ti,am437-padconf','arm,integrator-ap','snps,dw-apb-timer-osc','fsl,imx53-qsb-sgtl5000','allwinner,sun4i-a10-video-engine',
-		'xlnx,zynq-spi-r1p6','ti,tmp112','fsl,imx6q-ventana-sgtl5000','marvell,orion-xor','allwinner,sun8i-a23-i2c',
-		'arm,cortex-a5-twd-wdt','smsc,lan91c94','cypress,cy7c1019dv33-10zsxi','ti,am3-dpll-x2-clock','rockchip,rk3036-mali',
-		'marvell,orion-spi','nextthing,chip','isee,am335x-base0033','ti,omap2-apll-clock','ti,dra7-dss',
-		'compulab,omap3-cm-t3730','technexion,imx6ul-pico-dwarf','brcm,bcm21664','qcom,msm8974-adsp-pil','aspeed,ast2400-mac',
-		'fsl,imx6q-ccm','renesas,pwm-r8a77470','ti,da830-spi','shared-dma-pool','ti,sysc-omap2',
-		'marvell,armada-370-wdt','aspeed,ast2400-scu','ti,bq27200','x-powers,axp813-gpio','zii,imx6q-zii-rdu2',
-		'oxsemi,ox810se-stdclk','fsl,imx6q-dma-apbh','maxim,max17048','Odroid-XU3','panasonic,vvx10f004b00',
-		'samsung,exynos4212-jpeg','qcom,msm8974-bimc','sirf,nocfw-vdifm','quanta,q71l-bmc','laird,som60',
-		'fsl,imx25-uart','samsung,exynos5250-pinctrl','sirf,atlas7-iacc','rockchip,rk3288-tsadc','ti,da850-aemif',
-		'semtech,sx1502q','energymicro,efm32-adc','nvidia,tegra114-gr2d','marvell,kirkwood-cache','realtek,rt5616',
-		'brcm,cygnus-lcpll0','lg,lb070wv8','ti,cpsw-mdio','atmel,at91sam9n12-pmc','ti,dm814',
-		'cdns,i2c-r1p10','renesas,iic-r8a7794','samsung,24ad0xd1','samsung,exynos4210-wakeup-eint','usb424,7800',
-		'ti,66ak2g-navss-qm','ti,dm814-adpll-s-clock','atmel,at91rm9200-wdt','samsung,exynos5410-pinctrl','marvell,armada-375-core-clock',
-		'cznic,turris-omnia','ti,da850-pupd','dfi,fs700-m60-6dl','fsl,imx25-cspi','ti,palmas-rtc',
-		'google,veyron-jerry-rev6','allwinner,sun8i-t3','ti,omap3-interface-clock','qcom,gcc-msm8974pro','asus,rt-ac87u',
-		'menlo,m53cpld','ti,omap2-nand','atmel,tny-a9263','dh,stm32mp153c-dhcom-drc02','rockchip,rk3036-kylin',
-		'fsl,imx7d-qspi','qcom,msm-uartdm','fsl,imx6q-usbmisc','fsl,imx6dl-iomuxc','st,clkgen-mux',
-		'gpio-keys-polled','brcm,cygnus-pinmux','atmel,sama5d4-sckc','nxp,se97b','mediatek,mt8127-moose',
-		'nvidia,tegra30-uart','technexion,omap3-tao3530','allwinner,sun8i-a83t-dma','boundary,imx6qp-nitrogen6_max','nokia,n950-modem',
-		'renesas,sdhi-r8a7744','renesas,rcar-gen3-usb2-phy','atmel,at91sam9g25','rockchip,rk3188-wdt','fsl,imx6sll-usb',
-		'aspeed,ast2500-lhc','winbond,w25q80bl','denx,imx53-m53evk','i2se,duckbill-2-spi','fsl,imx25-ssi',
-		'atmel,sama5d35','atmel,sama5d31','ti,am33xx-l4-per'
-
-	],	
-	'powerpc' : [
-
-		'fsl,mpc5121-psc-ac97','fsl,bsc9131-ecm','fsl,T1042QDS','ibm,uic-405ex','ibm,plb440grx-pci',
-		'ibm,plb-440ep','mpc10x-pci','fsl,qoriq-memory-controller-v4.4','fsl,mpc5200b-cdm','ad,ad7414',
-		'fsl,pq1-soc','fsl,t1023-l3-cache-controller','fsl,mpc8378-dma','ibm,tah','dallas,ds1631',
-		'ibm,sdr-440epx','fsl,sec-v5.2-job-ring','fsl,mpc8280-pic','fsl,mpc5121-pata','fsl,mpc885ads-bcsr',
-		'fsl,mpc5125-psc-uart','TSEC','fsl,T1042RDB_PI','ppc4xx-rng','fsl,t1040-diu',
-		'fsl,mpc8572-elbc','fsl,P2020RDB-PC','fsl,t4240-dcsr-rcpm','denx,mpc8308_p1m','fsl,immr',
-		'fsl,t1040-dcsr-cnpc','fsl,b4420-dcsr-epu','fsl,T1024QDS','fsl,cpm1-usb','ibm,plb-pcix-440spe',
-		'fsl,p5040-elbc','fsl,mpic','fsl,sec-v6.0','fsl,mpc5200-gpio-wkup','fsl,mpc8569-l2-cache-controller',
-		'fsl,cpm2-fcc-enet','atmel,at24c128b','fsl,qman','ibm,plb440ep-pci','fsl,p5020-dcsr-rcpm',
-		'fsl,elo-dma-channel','ns16750','epson,rx8581','amcc,spi-440ep','fsl,mpc8568-pmc',
-		'rtc-ds1743','ibm,iic-460gt','fsl,mpc8641d-pmc','fsl,fman-xmdio','fsl,mpc5200-lpbfifo',
-		'fsl,sec-v5.2','fsl,T1042D4RDB','fsl,p5040-pin-control','MPC8349EMDS','fsl,qoriq-pcie-v2.4',
-		'fsl,mpc8569-immr','ibm,mcmal','keymile,kmcoge4','fsl,p5020ds-fpga','fsl,mpc5200b-rtc',
-		'fsl,srio-port-write-unit','fsl,p2041-dcsr-ocn','ibm,iic-405ez','fsl,mpc8308rdb','fsl,mpc8272-cpm-usb',
-		'fsl,mpc8378-elbc','MPC83xxRDB','fsl,mpc8313-pmc','fsl,b4420-dcsr-nal','fsl,raideng-v1.0-hp-ring',
-		'fsl,b4420-rcpm','fsl,mpc5121-gpio','fsl,mpc5125-fec','st,m41t80','fsl,mpc8360-pmc',
-		'ibm,cmu-error-irq','dallas,max6649','fsl,ssi-dma-channel','fsl,mpc860-cpm','fsl,mpc8555-cpm-pic',
-		'fsl,mpc5121ads','fsl,mpc8313-gtm','emerson,KSI8560','ibm,rgmii','fsl,mpc8323mds-bcsr',
-		'fsl,sec-v4.0-mon','ibm,uic-440ep','phytec,pcm030','fsl,mpc5200b-psc-ac97','fsl,mpc8272-mdio-bitbang',
-		'switches','amcc,spi-405ez','MPC85xxADS','fsl,sec-v4.2-job-ring','zarlink,le88266',
-		'pnpPNP,400','fsl,soc','fsl,mpc8572-memory-controller','eTSEC','fsl,qoriq-gpio',
-		'fsl,eloplus-dma','ibm,rgmii-wol-476gtr','fsl,p5040-dcsr-ocn','nintendo,hollywood-gpio','fsl,P3041DS',
-		'fsl,qoriq-pcie-v2.1','fsl,sec-v4.4-job-ring','fsl,mpc5121-dma','fsl,pq3-gpio','artesyn,mvme2500-fpga',
-		'fsl,cpm2-scc-uart','keymile,kmcent2','MPC83xxMDS','fsl,mpc5200b-ata','fsl,mpc8248-immr',
-		'fsl,mpc8555-ecm','fsl,ecm','fsl,mpc5200b-pci','fsl,mpc8568-guts','ibm,l2-cache-apm82181',
-		'fsl,mpc866-fec-enet','fsl,c293-guts','fsl,t1040-dcsr-rcpm','fsl,mpc5200-mscan','intel,82527',
-		'fsl,lite5200b','fsl,mpc8548-l2-cache-controller','ibm,iic-476gtr','eeprom','fsl,p4080-l3-cache-controller',
-		'atmel,24c01','fsl,t4240-rcpm','fsl,mpc8568-immr','fsl,mpc8247-scc-enet','fujitsu,mint',
-		'fsl,p3041-pcie','fsl,mc9s08qg8-mpc8377erdb','amcc,ieee1588-405ez','ibm,zmii-440epx','gef,ppc9a-fpga-pic',
-		'fsl,mpc8323-qe-pario-bank','fsl,p5020-sfp','fsl,tetra-fpga','pnpPNP,200','fsl,p5020-dcsr-epu',
-		'fsl,p5020-elbc','fsl,p5040-clockgen','fsl,p5040-l3-cache-controller','ibm,opb-440gx','ifm,ac14xx-fram',
-		'fsl,qman-portal','fsl,mpc8349-dma-channel','PowerPC,405EP','fsl,dcsr-e500mc-sb-proxy','ibm,emac-440ep',
-		'st,24c1024','amcc,taishan','mdio-mux-mmioreg','anon,charon','ibm,emac-apm821xx',
-		'fsl,mpc5200b-bestcomm','fsl,cpm2-spi','fsl,b4860-device-config','fsl,mpc8536-usb2-dr','nintendo,hollywood-pic',
-		'ibm,l2-cache-460ex','fsl,mpc8379rdb','fsl,mpc5121-axe','ibm,currituck','fsl,T1040RDB',
-		'amcc,makalu','amd,s29gl512n','fujitsu,lime','ibm,rgmii-440grx','fsl,mpc85xx-usb2-dr',
-		'fsl,mpc8548-lbc','amcc,ppc440epx-crypto','ibm,tah-440gx','fsl,ep88xc-bcsr','fsl,fpga-ngpixis',
-		'fsl,mpc8315-pcie','fsl,T1040D4RDB','fsl,b4420-dcsr-snpc','mpc10x','fsl,bsc9131-memory-controller',
-		'fsl,sec-v5.3-mon','atmel,24c256','dallas,ds1374','fsl,mpc8610-dma-channel','fujitsu,MB86277',
-		'ibm,plb-405ez','ifm,pdm360ng','intercontrol,digsy-mtc','fsl,mpc8313-fcm-nand','keymile,qriox',
-		'ibm,iic-460ex','fsl,gtm','xlnx,sysace','fsl,p5040-dcsr-epu','ibm,cpr-apm821xx',
-		'pme8572','fsl,dcsr-cpu-sb-proxy','ibm,tah-460ex','sdhci','tsi108-ethernet',
-		'ibm,uic','fsl,mpc8569-fcm-nand','promess,pro_module_general','ti,tsc2003','fsl,sec-v5.2-rtic',
-		'fsl,mpc5121-nfc','fsl,raideng-v1.0-lp-ring','fsl,t2080-dcsr-rcpm','fsl,t1040-dcsr-nal','fsl,ep88xc',
-		'fsl,sec3.1','fsl,mpc8540-dma','fsl,mpc8541-l2-cache-controller','fsl,p2041-dcsr-rcpm','fsl,mpc8347-dma-channel',
-		'ibm,l2-cache-440gx','fsl,mpc5200-psc','fsl,mpc5121-immr','fsl,mpc8569mds-bcsr-gpio','fsl,mpc8641hpcn',
-		'fsl,p5040-rcpm','ad,adm9240','fsl,p1023-ecm','fsl,p4080ds-fpga','fsl,mpc8610-ssi',
-		'tsi108-bridge','fsl,mpc8544-ecm','fsl,mpc8313-elbc','tsi108-pci','fsl,fman-mdio',
-		'ibm,mcmal-440epx','nintendo,hollywood-dsp','fsl,mpc860-pic','fsl,mpc5200-ohci','fsl,mpc5121-sram',
-		'ibm,uic-460gt','pciclass,0601','pnpPNP,303','amcc,ppc4xx-rng','fsl,pq1-pic',
-		'fsl,p2041-esdhc','tsi109-mdio','nxp,pca9556','fsl,dcsr-dpaa','fsl,t1040-scfg',
-		'fsl,mpc8541-dma','ibm,akebono-avr','fsl,mpc8560-brg','fsl,mpc8315-sata','fsl,mpc866ads-bcsr',
-		'fsl,gianfar-mdio','fsl,mpc5121-mscan','spansion,s25fl512s','fsl,MPC8569EMDS','fsl,mc9s08qg8-mpc8378erdb',
-		'amcc,ppc460ex-bcsr','fsl,mpc5200-xlb','MPC834xMDS','ibm,mcmal-440gx','tsi109-ethernet',
-		'ibm,uic-460ex','fsl,mpc8548cds-fpga','generic-sdhci','nintendo,flipper-si','ibm,emac-440gx',
-		'fsl,mpc885-localbus','fsl-usb2-mph-v1.2','fsl,mpc8379emds','ibm,sdram-476fsp2','ibm,dma-440gp',
-		'ibm,l2-cache-460gt','fsl,mpc8568-ecm','ibm,plb-pciex-apm821xx','fsl,t1040d4rdb-cpld','ibm,sdr-460sx',
-		'fsl,t1023-dcsr-cnpc','fsl,mpc8377-gpio','fsl,mpc8377-elbc','fsl,mpc8544-i2c','ibm,plb-440epx',
-		'ibm,akebono','fsl,t4240-dcsr-epu','micron,n25q512ax3','MPC8349EMITXGP','tqc,tqm8xx',
-		'fsl,t2080-esdhc','m41st85','fsl,fpga-qixis','PowerPC,405EX','gef,ppc9a-gpio',
-		'fsl,raideng-v1.0-job-ring','st,m25p40','Ebony-FPGA','fsl,p2041-sfp','ibm,emac-440spe',
-		'fsl,etsec2-tbi','fsl,P4080DS','ibm,mcmal-460sx','ibm,zmii-440ep','fsl,p2041-clockgen',
-		'fsl,soc-sram-error','fsl,mpc8568mds-bcsr','ibm,plb-440gp','fsl,mpc8280-mdio-bitbang','fsl,mpc8308-gpio',
-		'sst,sst25wf040','nxp,pca9546','fsl,t4240-sfp','fsl,mpc8280-usb','fsl,p1010-guts',
-		'ibm,ebc','fsl,mpc8548-immr','fsl,mpic-v3.1-msgr','fsl,mpc8555-immr','fsl,b4420-device-config',
-		'fsl,sec-v4.0','ibm,l2-cache','fsl,p1020-guts','fsl,mpc885ads','fsl,fpga-pixis',
-		'fsl,mpc866-pic','abb,socrates','ibm,opb-405ep','fsl,P1020UTM-PC','wlf,wm8776',
-		'fsl,cpm2-brg','fsl,mpc8536-fcm-nand','fsl,p1021mds-bcsr','ifm,o2d','nxp,pca9557',
-		'fsl,mpc885-scc-uart','fsl,p5040-device-config','fsl,mpc8568-memory-controller','fsl,p5040-serdes','amcc,yosemite',
-		'acube,sam440ep','fsl,mpc8313-dma','fsl,mc9s08qg8-mpc8315erdb','fsl,mpc5121-ipic','ethernet-phy-ieee802.3-c45',
-		'fsl,mpc8544-l2-cache-controller','ibm,dma-440grx','fsl,mpc5200-rtc','fsl,bman-portal','fsl,mpc5121-viu',
-		'fsl,mpc8360mds-bcsr','fsl,mpc8560-ecm','PowerPC,440EPx','fsl,t1040-rcpm','fsl,sec3.3',
-		'fsl,sec2.4','fsl,mpc8378rdb','ibm,opb-405ex','fsl,P1010RDB','ibm,currituck-fpga',
-		'fsl,mpc860-cpm-pic','fsl,pq-sata','fsl,T4240RDB','fsl,mpc8308-pcie','gef,fpga-wdt-1.00',
-		'fsl,fman-v3-port-tx','fsl,deepsleep-cpld','dallas,ds1307','maxim,ds26522','fsl,mpc5121-fec-mdio',
-		'fsl,mpc8560-dma-channel','nintendo,flipper-dsp','ibm,ebc-460ex','fsl,p5020-clockgen','fsl,pq2-localbus',
-		'dallas,ds1621','apm,bluestone','dallas,ds1338','fsl,mpc8360-immr','fsl,p2020-l2-cache-controller',
-		'st,m41t00','dallas,ds3232','fsl,corenet2-cf','ibm,ebc-405ez','gef,sbc310-gpio',
-		'fsl,sec-v6.0-job-ring','tsi109-pci','fsl,pq-sata-v2','fsl,ipic','fsl,srio-msg-unit',
-		'led','fsl,mpc866-fec-mdio','fsl,mpc5200-sram','fsl,mpc8572-fcm-nand','ibm,rgmii-460ex',
-		'fsl,mpc8377-dma','fsl,mpc5121rev2-clock','fsl,b4420-l3-cache-controller','fsl,mpc8323rdb-mmc-slot','fsl,mpc8378-esdhc',
-		'winbond,w83782d','fsl,t1040-serdes','xes,address-ctl-nand','fsl,mpc8540-pci','fsl,mpc5200-pic',
-		'fsl,mpc885-smc-uart','fsl,e500v2','plathome,obs600','promess,pro_module_dio','fsl,sec-v4.2-rtic',
-		'fsl,cpm-muram-data','MPC8560ADS','ibm,dma-440epx','fsl,p3041-dcsr-nal','ibm,emac',
-		'fsl,mpic-msi-v4.3','fsl,b4420-dcsr-ocn','fsl,mpc8641-mcm','fsl,t2080-rcpm','fsl,ucc-hdlc',
-		'fsl,mpc885-cpm','fsl,mpc8248-scc-uart','fsl,P1020RDB-PC','keymile,kmp204x','fsl,mpc8560-cpm-pic',
-		'fsl,mpc5200b-xlb','fsl,mpc5125-ioctl','amcc,can-405ez','fsl,p1023-l2-cache-controller','ibm,opb-405exr',
-		'fsl,mpc8379-fcm-nand','fsl,t2080-dcsr-ocn','ibm,opb-440gp','ata-generic','fsl,p2041-dcsr-epu',
-		'fsl,qman-pfdr','fsl,mpc8568mds-pib','fsl,t2080-dcsr-snpc','fsl,P1020RDB-PD','fsl,c293-memory-controller',
-		'fsl,b4860-clockgen','fsl,mpc8555-memory-controller','wrs,epld-localbus','fsl,p1022-diu','fsl,sec2.0',
-		'national,lm75','MPC831xRDB','fsl,esdhc','ge,imp3a-fpga-pic','ibm,cpr-440epx',
-		'fsl,t4240-pcie','fsl,p2020-ecm','dallas,ds75','gef,ppc9a-fpga-regs','fsl,mpc5121-rtc',
-		'fsl,mpc8555-cpm','amcc,ppc4xx-crypto','fsl,p5020-pcie','cpld','schindler,cm5200',
-		'linkstation','fsl,mpc8347e-localbus','zl2006','nintendo,gamecube','fsl,p2020-immr',
-		'fsl,mpc8272-cpm','fsl,mpc8247-localbus','fsl,mpc875-cpm-pic','fsl,mpc8377-fcm-nand','fsl,mpc8544-memory-controller',
-		'ibm,476gtr','nintendo,flipper-ai','fsl,p5040-sfp','ibm,usb-ehci-440epx','fsl,mpc8280',
-		'fsl,mpc8544-lbc','fsl,bsc9132qds-fpga','mscc,vsc9953-switch','tsi109-bridge','fsl,mpc8272ads-bcsr',
-		'fsl,b4860-dcsr-cnpc','fsl,mpc8536-elbc','fsl,mpc8377wlan','fsl,mpc8572-pme','keymile,KMETER1',
-		'promess,motionpro-led','fsl,mpc8272-scc-uart','mmc-spi-slot','fsl,mpc8272-brg','nintendo,hollywood-sdhci',
-		'ibm,uic-440gx','fsl,p1025-fcm-nand','fsl,bsc9132-pcie','fsl,mpc8315-pmc','fsl,p4080-dcsr-epu',
-		'ibm,plb-pciex','fsl,qoriq-pcie-v2.2','ibm,plb-pciex-405ex','fsl,mpc5200b-sram','fsl,mpc8360-qe-gtm',
-		'solomon,ssd1289fb','fsl,diu','pika,fpga-sd','ibm,ebc-440gx','fsl,p2020-guts',
-		'fsl,mpc5200b-mdio','plx,pex8648','fsl,raideng-v1.0-job-queue','fsl,ifc-nand','ibm,opb',
-		'fsl,MPC8572DS','ibm,cpr-440grx','fsl,mpc8641-localbus','fsl,ucc-mdio','hawk-bridge',
-		'ibm,iic-440ep','stx,gp3','simtek,stk14ca8','ibm,emac-405exr','nxp,pca9547',
-		'fsl,mpic-v1.2-msgr','ibm,akebono-fpga','ucc_uart','ifm,safety','MPC8555CDS',
-		'xes,xpedite5370','fsl,mpc5200-psc-uart','promess,motionpro-cpld','fsl,p1020-immr','spansion,s25fl256s1',
-		'fsl,mpc860-brg','fsl,mpc8272','fsl,p1023-guts','gef,ppc9a-fpga-wdt','fsl,mcm',
-		'amcc,xor-accelerator','ibm,zmii','ibm,sdram-apm8018x','fsl,mpc5200-bestcomm','plx,pex8518',
-		'fsl,pamu-v1.0','fsl,mpc8569-qe-usb','fsl,b4860-l3-cache-controller','fsl,mpc8569-elbc','gef,fpga-pic-1.00',
-		'ibm,plb-pciex-460ex','fsl,sec-v4.2-rtic-memory','fsl,p5020-esdhc','fsl,mpc860-smc-uart','fsl,mpc8272-localbus',
-		'ibm,holly','ibm,emac-460gt','anonymous,a3m071-fpga','fsl,t1040-dcsr-dpaa','fsl,t2080-cpld',
-		'fsl,p5040-esdhc','fsl,mpc8568-localbus','ibm,opb-440epx','fsl,mpc5121-i2c-ctrl','fsl,mpc8280-cpm',
-		'fsl,t1023-dcsr-snpc','promess,motionpro-anybus','pnpPNP,500','fsl,pq2-pci','fsl,ep8248e-bcsr',
-		'fsl,mpc8548-memory-controller','amcc,ppc460ex-rng','gef,fpga-pic','fsl,p1021-l2-cache-controller','fsl,mpc8280-scc-uart',
-		'fsl,b4860-dcsr-snpc','ibm,plb-pcix','fsl,mpc8541-cpm-pic','fsl,mpc8247-immr','pika,fpga',
-		'nxp,sja1000','ibm,zmii-440grx','fsl,p1021-elbc','mai-logic,articia-s','adi,adt7481',
-		'fsl,mpc8247-cpm','fsl,mpc5121-axe-app','ucc_geth','gef,ppc9a-paged-flash','PowerPC,405EZ',
-		'ibm,reset-warning-irq','ibm,ebc-440epx','st,nand512-a','ibm,sdram-405exr','ibm,plb-440grx',
-		'fsl,mpc5121-pci','fsl,T4240QDS','fsl,mpc5200b-psc-uart','fsl,mpc5200b-gpio','fsl,qoriq-memory-controller',
-		'fsl,mpc5200b-pic','fsl,mpc5121ads-cpld-pic','fsl,mpc8540-l2-cache-controller','fsl,cpm1','fsl,fman-v2-port-rx',
-		'PowerPC,440GX','amcc,acadia','fsl,qoriq-pcie-v3.0','fsl,p4080-dcsr-rcpm','fsl,mpic-msi',
-		'fsl,P1020MBG-PC','fsl,mpc8313-i2c','fsl,mpc5121-clock','st,sdhci-stih407','ibm,ebc-405exr',
-		'fsl,mpc885-cpm-pic','fsl,p2020-esdhc','analogue-and-micro,asp8347e','fsl,mpc8610hpcd-mmc-slot','MVME5100',
-		'fsl,mpc8541-immr','MPC8548CDS','national,DP83848VV','fsl,mpc8541-ecm','fsl,t2080-dcsr-cnpc',
-		'fsl,t1023-scfg','fsl,p1020rdb-pd-cpld','fsl,t4240-l2-cache-controller','fsl,T2081QDS','fsl,mpc8536-espi',
-		'fsl,sec-v5.0-rtic-memory','fsl,mpc860-scc-enet','ibm,mcmal-440gp','fsl,mpc8360-localbus','fsl,mpc8349-pci',
-		'fsl,mpc8610-fcm-nand','amd,s29gl01gp','ibm,uic-4xx','fsl,etsec2','gen,spidev',
-		'fsl,t1040-device-config','fsl,sec-v4.0-job-ring','fsl,mpc8540-ecm','ppc4xx-msi','fsl,qoriq-device-config-2.0',
-		'fsl,dcsr-e6500-sb-proxy','ibm,sdram-440epx','st,m24256','broadcom,BCM5481UA2KMLG','fsl,fman-v2-port-oh',
-		'amcc,sata-460ex','fsl,p1010rdb-cpld','fsl,mpc8308-dma','ibm,sdram-440spe','atmel,24c32',
-		'fsl,p2020ds-fpga','fsl,mpc866-localbus','ibm,iss-4xx','amd,s29gl032a','fsl,mpc8360-qe-pario-bank',
-		'fsl,bman','ti,pcf8574a','fsl,mpc5125-gpio','fsl,mpc8568mds-bcsr-gpio','jedec-flash',
-		'ibm,sdram-4xx-ddr2','fsl,mpc8541-brg','manroland,mucmc52','fsl,mpc8572-dma','atmel,at25df641',
-		'ibm,ebc-440spe','ibm,sdram-460ex','dallas,ds1339','ge,imp3a-fpga-wdt','tsi109-i2c',
-		'ibm,zmii-460gt','ibm,emac4sync','fsl,mpc5200b-fec','fsl,bsc9131-guts','fsl,qoriq-rcpm-2.1',
-		'fsl-usb2-dr-v2.4','bosch,cc770','fsl,p5020-dcsr-ocn','fsl,P1023RDB','fsl,mpc8540-pcix',
-		'manroland,mucmc52-aux-gpio','ibm,rgmii-wol','fsl,b4860-dcsr-ocn','fsl,eloplus-dma-channel','fsl,t1024-cpld',
-		'pnpPNP,100','usb-ohci','fsl,mpc8610-dma','fsl,t1040-clockgen','fsl,elbc-fcm-nand',
-		'fsl,mpc8560-scc-uart','fsl,t1040-dcsr-epu','fsl,mpc8572-dma-channel','fsl,p1023-memory-controller','fsl,mpc8314-pcie',
-		'ibm,sdr-440ep','fsl,pq1-fec-enet','iomega,storcenter','fsl,t4240-device-config','fsl,P1022DS',
-		'ibm,uic-440gp','fsl,mpc8560-immr','nxp,lm75a','sony,ps3','xes,MPC8548',
-		'ibm,ebc-405ep','fsl,p4080-pcie','atmel,24c04','ti,ina220','fsl,qman-fqd',
-		'fsl,p1020-elbc','fsl,P1010RDB-PB','fsl,p1010-immr','gef,ppc9a','fsl,C293PCIE',
-		'ibm,zmii-440gp','abb,socrates-nand','ibm,gpio-405ex','ibm,cpr-440spe','gianfar',
-		'fsl,qe-muram','ibm,gpio-405ez','fsl,P5040DS','fsl,sec-v5.0-mon','fsl,mpc8641-dma',
-		'fsl,p1022-memory-controller','fsl,mpc8610-pci','gef,sbc610','fsl,cpm-brg','fsl,cpm2-i2c',
-		'fsl,mpc8308-immr','fsl,mpc5121-sdhc','ethernet-phy-id13e5.1002','fsl,b4860qds-fpga','fsl,qoriq-rcpm-2.0',
-		'ibm,iss-sim-block-device','fsl,qoriq-rcpm-1.0','xes,xpedite5330','fsl,pq2ads-pci-pic','fsl,mpc5200b-i2c',
-		'st,m25p128','fsl,ep8248e-mdio-bitbang','ibm,cw-476fsp2','artesyn,mvme2500-cpld','ibm,sdr-apm821xx',
-		'gef,fpga-regs','nxp,sc28l92','fsl,mpc5200b-gpio-wkup','nintendo,hollywood-ai','fsl,p1022-l2-cache-controller',
-		'fsl,p1023-elbc','fsl,T2080RDB','fsl,mpc8572-msi','fsl,qe-muram-data','fsl,sec1.2',
-		'fsl,mpc8280-brg','fsl,mpc8548-pmc','fsl,mpc8360-qe-usb','ibm,usb-ohci-440epx','fsl,p1022-ecm',
-		'amcc,rainier','fsl,mpc8610-wdt','ibm,plb-pcix-460ex','fsl,P1025RDB','fsl,qoriq-memory-controller-v4.5',
-		'philips,sja1000','chrp,open-pic','amcc,dwc-otg','dallas,ds4510','fsl,mpc8540-memory-controller',
-		'fsl,P1022RDK','ibm,emac-440grx','ibm,iic-405ep','MPC8323ERDB','epson,rx8025',
-		'fsl,elo3-dma','fsl,mpc8610-elbc','fsl,mpc5121-reset','ibm,ebc-405ex','ibm,emac-460sx',
-		'fsl,P2041RDB','fsl,ecm-law','fsl,fman-v3-port-oh','fsl,mpc8379-sata','amcc,glacier',
-		'amcc,ppc460gt-crypto','ibm,iic-460sx','phytec,pcm030-audio-fabric','fsl,b4420qds-fpga','fsl,mpc8572-gpio',
-		'dallas,ds1337','fsl,mpc5121ads-cpld','fsl,dcsr-ocn','gef,sbc310','everspin,mram',
-		'fsl,p4080-serdes','fsl,sec-v5.0-job-ring','fsl,fman','microcrystal,rv3029','stx,gp3-8560',
-		'st,m41t62','nintendo,flipper-aram','fsl,sec-v5.0-rtic','fsl,t1023-dcsr-rcpm','smsc,lan8700',
-		'fsl,mpc885-pic','fsl,mpc8379-esdhc','fsl,p4080-dcsr-ocn','fsl,b4420-dcsr-dpaa','adi,ad7414',
-		'fsl,bsc9132-l2-cache-controller','fsl,p2020-fcm-nand','fsl-usb2-mph-v2.5','fsl,T1042RDB','PowerPC,440GRx',
-		'ibm,opb-440ep','fsl,mpc5125-psc','nintendo,flipper','fsl,p2041-dcsr-dpaa','ibm,emac4',
-		'fsl,mpc8610-pmc','denx,mpc8308_p1m-cpld','amd,am29lv652d','tsi108-mdio','fsl,srio',
-		'amcc,cameleon-405ez','fsl,T1024RDB','ibm,ebc-460sx','fsl,mpc8540-dma-channel','intc,82527',
-		'intel,lxt971','amcc,redwood','ibm,emac-405ep','fsl,mpc8241','ibm,mcmal-405ex',
-		'fsl,t2080-sfp','fsl,mpc5125ads','fsl,t1040-sfp','fsl,mpc8323-pmc','tqc,tqm8560',
-		'fsl,p5020-l3-cache-controller','fsl,c293pcie-cpld','fsl,mpc5200b-ohci','fsl,p1022-guts','MPC85xxDS',
-		'fsl,pq3-localbus','fsl,mpc8315-fcm-nand','fsl,mpc8536-sata','ibm,plb-pci','ibm,sdram-4xx-ddr3',
-		'fsl,p4080-dcsr-dpaa','fsl,mpc5121-diu','ibm,mcmal-405exr','nsc,lm87','ibm,mcmal-440ep',
-		'xes,xpedite5200','amcc,dac-405ez','fsl,b4860-pcie','fsl,b4420-pcie','winbond,w83793',
-		'fsl,mpc8280-fcc-enet','fsl,cpm1-i2c','fsl,fpga-qixis-i2c','fsl,dcsr-rcpm','fsl,mpc8610-guts',
-		'ibm,plb4','ibm,iic-405exr','MPC832xMDS','fsl,mpc8569-qe-spi','fsl,mpc875-brg',
-		'fsl,cpm2','fsl,cpm1-pic','fsl,mpc8379-dma','fsl,mpc8572-l2-cache-controller','nintendo,hollywood',
-		'fsl,b4860-dcsr-dpaa','ibm,cpm','ibm,mcmal-405ez','ibm,mcmal-476gtr','fsl,mpc8349-dma',
-		'vitesse-7385','fsl,mpc8323-dma','nintendo,hollywood-ipc','fsl,elbc','fsl,T1023RDB',
-		'ohci-be','fsl,p5040-dcsr-nal','ibm,476gtr-ahci','fsl,bsc9132-ecm','fsl,p5040-pcie',
-		'fsl,dcsr-cnpc','fsl,p5040-dcsr-rcpm','ibm,conf-error-irq','fsl,p5040ds-fpga','adm,adm1032',
-		'fsl,upm-nand','MPC8568EMDS','fsl,p2020-elbc','ibm,sdram-405ep','fsl,mpc8272-fcc-enet',
-		'fsl,mpc8272-i2c','fsl,dcsr-ddr','brcm,bcm54616S','fsl,mpc5200-gpt','fsl,mpc8536ds',
-		'amcc,katmai','ilitek,ili922x','xes,xcalibur1501','fsl,mpc8560-fcc-enet','artesyn,MVME7100',
-		'fsl,fman-xgec','tqc,tqm8555','fsl,sec3.0','fsl,ep8248e','fsl,mpc5200-lpb',
-		'fsl,mpc5121-ioctl','fsl,mpc8568-l2-cache-controller','fsl,mpc8272-pci','fsl,mpc8548-dma','nintendo,flipper-di',
-		'xes,MPC8572','fsl,lite5200','fsl,mpc5200-mdio','nintendo,hollywood-vi','ibm,plb-pciex-460sx',
-		'intersil,isl1208','SBC8548','fsl,mpc5200b-lpb','fsl,mcm-law','fsl,mpic-msg',
-		'fsl,raideng-v1.0','fsl,bman-fbpr','fsl,pamu','fsl,cpm1-smc-uart','zarlink,zl30364',
-		'fsl,mpc8377-esdhc','fsl,mpc8360mds-bcsr-gpio','amcc,eiger','ifm,o2d-csi','fsl,mpc8315erdb',
-		'fsl,c293-l2-cache-controller','promess,motionpro','fsl,mpc8323-qe-usb','fsl,mpc837xmds-bcsr','ibm,476gtr-hsta-msi',
-		'ibm,476gtr-sdhci','fsl,t1040-qe-siram','amcc,adc-405ez','fsl,mpc8349mds-bcsr','gef,sbc310-fpga-pic',
-		'nintendo,hollywood-control','ibm,sdram-460gt','fsl,qoriq-tmu','artesyn,mvme7100-bcsr','fsl,spi',
-		'mtd-ram','fsl,mpc8541-dma-channel','fsl,mpc885-usb','dallas,ds1682','ibm,opb-4xx',
-		'fsl,qoriq-clockgen-1.0','fsl,mpc5125-reset','fsl,cpm-muram','PowerPC,460GT','ibm,opb-460ex',
-		'ibm,dma-440spe','fsl,dcsr-epu','fsl,mpc8323-dma-channel','mosaixtech,icon','ibm,plb3',
-		'fsl,mpc8377-pcie','ibm,opb-460gt','fsl,p3041-clockgen','pika,fpga-sgl','fsl-usb2-dr-v2.2',
-		'fsl,mpc866-i2c','fsl,mpc8378-dma-channel','fsl,mpc8378emds','fsl,dcsr-e5500-sb-proxy','fsl,mpc8272ads',
-		'MPC8323EMDS','fsl,mpc875-cpm','fsl,mpc8347-dma','fsl,mpc5200-ata','fsl,mpc8610-mcm',
-		'keymile,bfticu','fsl,t2080-l2-cache-controller','mdio-mux-gpio','fsl,mpc5200b-psc-spi','fsl,mpc8544-immr',
-		'fsl,mpc8555-dma','fsl,p4080-elbc','ibm,opb-460sx','phytec,pcm032','fsl,P1021MDS',
-		'fsl,p1010-esdhc','fsl,mpc5121-pmc','fsl,bsc9132qds','fsl,t4240-dcsr-nal','promess,motionpro-kollmorgen',
-		'fsl,t4240-dcsr-ocn','MPC8541CDS','fsl,mpc8379-gpio','fsl,T2080QDS','MPC83xxMITX',
-		'atmel,24c64','fsl,P2020DS','FEC','fsl,ns16550','amcc,arches',
-		'fsl,b4860-dcsr-nal','fsl,p1020-esdhc','nintendo,flipper-pic','fsl,mpc8315-gtm','amcc,ppc405ex-crypto',
-		'fsl,mpc8315-dma','ibm,plb-460sx','fsl,mpc5121-psc-uart','mpc83xx_wdt','fsl,mpc8248-pic',
-		'fsl,mpc8540-immr','PowerPC, 476FSP2','fsl,mpc8569-guts','nintendo,flipper-pi','fsl,sec-v5.3',
-		'ibm,zmii-460ex','fsl,mpc885-scc-enet','fsl,mpc8569-memory-controller','ibm,plb405ep-pci','amd,am29lv28ml',
-		'tsi108-i2c','fsl,mpc8349emitx-pata','fsl,pq2fads','fsl,mpc885-brg','fsl,p1020-fcm-nand',
-		'ibm,i2o-440spe','MPC8313ERDB','nintendo,wii','amcc,haleakala','fsl,mpc8555-dma-channel',
-		'fsl,t4240-clockgen','ibm,sdram-440grx','ibm,uic-460sx','fsl,OCA4080','ibm,fsp2',
-		'fsl,p3041-dcsr-ocn','wind,sbc8641','tqc,tqm8548-upm-nand','ibm,tah-460sx','mpc74xx',
-		'fsl,fman-muram','fsl,p4080-clockgen','fsl,bsc9131rdb','fsl,cpm2-smc-uart','ppa8548',
-		'ibm,sdram-apm821xx','fsl,dcsr','fsl,t1023-pcie','fsl,bsc9132-memory-controller','ibm,plb-460ex',
-		'ibm,cpr-460ex','ibm,uic-405ez','nintendo,hollywood-si','ibm,sdram-44x-ddr2denali','micron,m25p32',
-		'MPC8544DS','fsl,fman-ptp-timer','fsl,mpc8377-dma-channel','ibm,opbd-error-irq','national,lm80',
-		'ibm,emac-476gtr','fsl,fman-v3-port-rx','fsl,mpc8248-localbus','ibm,ocm','ibm-emac4sync',
-		'keymile,km82xx','ge,imp3a-gpio','PowerPC,apm8018x','fsl,mpc8349e-localbus','fsl,cpm1-scc-uart',
-		'ibm,plb440gp-pcix','fsl,mpc837xmds','mdio-mux','hawk-pci','gef,sbc610-gpio',
-		'fsl,bsc9132-immr','talitos','fsl,mpc8610-msi','microchip,mcp7941x','fsl,P1024RDB',
-		'nintendo,hollywood-pi','fsl,corenet-cf','MPC8540ADS','intel,PC28F640P30T85','fsl,b4860-dcsr-rcpm',
-		'artesyn,MVME2500','fsl,p1010-flexcan','fsl,mpc8569-ecm','fsl,mpc5121-mbx','fsl_tlu',
-		'fsl,mpc885-fec-mdio','fsl,mpc8248-cpm','PowerPC,440EP','est,hotfoot','qe_udc',
-		'fsl,t1040rdb-cpld','fsl,mpc5200-psc-spi','ibm,mcmal-440grx','fsl,p2041-dcsr-nal','fsl,elo-dma',
-		'fsl,cpm2-pic','fsl,p1023-immr','ibm,plb-405ex','fsl,fman-memac','fsl,fman-dtsec',
-		'adi,adt7461','nintendo,hollywood-exi','fsl,mpc85xx-usb2-mph','fsl,sec-v5.3-rtic','fsl,mpc8536-usb2-mph',
-		'ibm,ppc4xx-gpio','fsl,b4420-clockgen','varisys,CYRUS','maxim,ds1050','fsl,mpc866-cpm-pic',
-		'fsl,etsec-ptp','fsl,t1023-esdhc','fsl,mpc8536-pmc','ibm,mc-ue-irq','ibm,cpr-440ep',
-		'nintendo,hollywood-di','ibm,sdram-405gp','fsl,t2080-clockgen','fsl,p3041-dcsr-rcpm','fsl,t2080-l3-cache-controller',
-		'fsl,b4860-dcsr-epu','fsl,dcsr-snpc','fsl,p5020-serdes','ibm,cpr-460gt','fsl,mpc8360-dma',
-		'ibm,tah-460gt','fsl,mpc8315-immr','ibm,rgmii-405ex','MPC834xMITX','atmel,spd',
-		'fsl,mpc5200-psc-ac97','fsl,mpc8377-sata','ibm,mcmal2','ibm,mcmal-460gt','fsl,mpc8560-dma',
-		'fsl,qoriq-pcie-v2.3','fsl,cpm1-scc-enet','maxim,max1237','ti,ads7846','atmel,24c02',
-		'anonymous,a4m072','abb,socrates-spi','fsl,mpc8641-msi','fsl,mpc8536-esdhc','fsl,mpc8548-ecm',
-		'MPC8349EMITX','fsl,sec1.0','emerson,KSI8560-cpld','maxim,max6625','ibm,plb-405exr',
-		'spansion,m25p80','fsl,qoriq-pcie','spansion,s25sl12801','gef,sbc310-fpga-wdt','fsl,t1024-diu',
-		'intel,JS28F128','PowerPC,apm821xx','fsl,mpc8377emds','fsl,mpc8379-dma-channel','fsl,mpc5121',
-		'cirrus,cs4270','MPC832xRDB','fsl,B4860QDS','st,24c256','fsl,bsc9131-l2-cache-controller',
-		'fsl,mpc8569-qe-pario-bank','amcc,ppc4xx-msi','amcc,ppc460ex-crypto','fsl,qoriq-memory-controller-v5.0','cache',
-		'fsl,mcu-mpc8349emitx','fsl,t2080-device-config','fsl,mpc5200-pci','nintendo,hollywood-usb-ohci','fsl,fman-memac-mdio',
-		'isil,zl6100','fsl,mpc8272ads-mdio-bitbang','fsl,t4240-dcsr-cnpc','fsl,etsec2-mdio','fsl,mpc866-cpm',
-		'fsl,mpc8572-immr','fsl,mpc8248-usb','fsl,p2020-memory-controller','ibm,dma-4xx','fsl,mpc8560-cpm',
-		'fsl,TWR-P1025','fsl,qe-gtm','fsl,mpc8541-cpm','fsl,mpc8548-pcie','fsl,t1023-device-config',
-		'ibm,rgmii-460gt','ibm,ndfc','fsl,mpc8536-ecm','ibm,476gtr-ohci','fsl,dcsr-nal',
-		'fsl,t1023-dcsr-nal','fsl,mpc8272-pic','PowerPC,460SX','fsl,p1020-memory-controller','ibm,opb-440grx',
-		'fsl,sec-v5.3-job-ring','ds1743','fsl,sec-v4.2','fsl,mpc8379-elbc','fsl,qoriq-pin-control-1.0',
-		'fsl,mpc8610-spi','fsl,p4080-sfp','smi,sm501','fsl,b4420-dcsr-rcpm','fsl,srio-rmu',
-		'ibm,mcmal-440spe','fsl,mpc860-localbus','ibm,zmii-440gx','fsl,p1010-l2-cache-controller','fsl,cpm2-usb',
-		'ibm,ebony','fsl,mpc8536-guts','fsl,t2080-serdes','ohci-le','fsl,pq-pcmcia',
-		'ibm,ebc-440ep','fsl,t1023-dcsr-ocn','fsl,mpc8555-brg','MPC8360EMDS','fsl,p3041-serdes',
-		'ibm,emac-440gp','fsl,mpc5121-wdt','fsl,mpc5121-psc-spi','fsl,mpc8247-pic','fsl,t1023-rcpm',
-		'fsl,P2020RDB','fsl,mpc8360-par_io','fsl,mpc866-brg','amcc,canyonlands','fsl,p3041-dcsr-dpaa',
-		'ibm,sdram-440gp','fsl,sec-v5.0','MPC836xMDS','SEC2','pnpPNP,501',
-		'ibm,iic-440spe','st,sdhci','fsl,cpm2-pario-bank','fsl,p1010-memory-controller','ibm,dma-440ep',
-		'ibm,sdram-440ep','fsl,mpc5200b-gpt','chrp,iic','fsl,sec-v5.2-mon','fsl,qoriq-clockgen-2.0',
-		'fsl,mpc8379-pmc','ge,imp3a-fpga-regs','fsl,p1021mds-pib','fsl,mpc875-immr','pnpPNP,700',
-		'tqc,tqm5200','fsl-usb2-mph','ibm,sdr-460ex','fsl,T1040QDS','fsl,p1023-pcie',
-		'fsl,mpc8272ads-pci-pic','ibm,mq-440spe','ibm,uic-440grx','fsl,mc9s08qg8-mpc8349emitx','nintendo,hollywood-usb-ehci',
-		'fsl,mpc5200-i2c','fsl,mpc5200b-immr','ibm,iic-currituck','fsl,mpc8641-dma-channel','ifm,netx',
-		'ibm,rgmii-460sx','fsl,mpc5121-psc-fifo','analogue-and-micro,adder875','fsl,mpc5200-cdm','fsl,sec-v5.3-rtic-memory',
-		'fsl,t4240-serdes','wlf,wm8960','fsl,mpc875-pic','ibm,hsta-msi','fsl,t1042rdb-cpld',
-		'fsl,pq2fads-bcsr','ibm,rgmii-405exr','fsl,t2080-pcie','ibm,ebc-440gp','gef,sbc310-paged-flash',
-		'fsl,c293-ecm','PowerPC,476','ibm,mcmal-405ep','fsl,MPC8572DS-CAMP','fsl,p1010-ecm',
-		'dallas,ds1340','fsl,p1020-ecm','ibm,sdram-460sx','fsl,mpc885','fsl,t1040-qe-si',
-		'ibm,plb-460gt','fsl,mpc5121-psc','fsl,c293-esdhc','fsl,qoriq-memory-controller-v4.7','fsl,mpc8378-gpio',
-		'fsl,mpc8536-immr','fsl,pq2pro-localbus','national,lm92','fsl,t4240-dcsr-dpaa','micron,n25q128a11',
-		'mpc5200b-psc-ac97','PowerPC,440GP','fsl,t2080-dcsr-nal','ibm,emac-460ex','fsl,mpc8247-brg',
-		'fsl-usb2-dr-v1.6','fsl,mpc8323-qe-pario','fsl,p3041-sfp','fsl,mpc5121-lpc','ramtron,24c64',
-		'ibm,iic-440gp','fsl,mpc8610-immr','fsl,qoriq-sfp-1.0','fsl,mpc8377rdb','fsl,mpc885-fec-enet',
-		'fsl,p1021-ecm','ricoh,rs5c372a','fsl,sec-v4.0-rtic','amcc,ppc440epx-rng','fsl,p5040-dcsr-dpaa',
-		'fsl,mpc8569-qe-gtm','fsl,pq2-pic','apm,klondike','tqc,tqm8548','pika,warp',
-		'ibm,iic-440epx','fsl,mpc885-i2c','fsl,p1021-memory-controller','fsl,mpc8377-pmc','fsl,mpc8641-guts',
-		'ibm,sdram-405ex','ibm,opb-405ez','ibm,476gtr-ehci','fsl,mpc8548-guts','fsl,p3041ds-fpga',
-		'fsl,mpic-global-timer','fsl,mpc8308-gtm','fsl,mpc8544-guts','fsl,bsc9132-guts','ibm,plb-pciex-476fpe',
-		'fsl,cpm2-scc-enet','fsl,corenet-law','fsl,ipic-msi','hw-rev','ge,imp3a',
-		'pnpPNP,b00','fsl,t2080-dcsr-epu','fsl,p3041-esdhc','fsl,t1040-pcie','anonymous,a3m071',
-		'fsl,sec-v4.0-rtic-memory','fsl,bsc9131-immr','fsl,mpc8360rdk','fsl,p2041-serdes','ti,tl16c752bpt',
-		'fsl,p1022ds-fpga','fsl-usb2-dr','ibm,sram-440gp','fsl-i2c','fsl,t4240qds-fpga',
-		'fsl,ifc','fsl,t1023-sfp','fsl-usb2-dr-v2.5','fsl,mpc8572-ecm','fsl,P1021RDB-PC',
-		'fsl,b4420-dcsr-cnpc','fsl,t4240-dcsr-snpc','ibm,uic-440epx','ibm,emac-405ex','fsl,P5020DS',
-		'fsl,P1020RDB','fsl,p4080-esdhc','fsl,b4420-l2-cache-controller','pericom,pt7c4338','fsl,qe-ic',
-		'linux,uio-pdrv-genirq','bcm5461a','ibm,emac-405ez','catalyst,24c32','fsl,p2041-l3-cache-controller',
-		'fsl,dcsr-corenet','fsl,t1023-serdes','fsl,corenet1-cf','fsl,p5020-dcsr-nal','fsl,mpc8248-smc-uart',
-		'fsl,mpc8548-localbus','fsl,cpm2-mdio-bitbang','fsl,p1022-immr','pnpPNP,f03','ibm,plb440epx-pci',
-		'fsl,mpc8560-localbus','fsl,p3041-l3-cache-controller','fsl,mpc8280-localbus','fsl,mpc5200b-psc','fsl,mpc8536ds-fpga-pixis',
-		'fsl,mpc8544-localbus','fsl,t1040-l3-cache-controller','gef,sbc610-paged-flash','eyetech,amigaone','fsl,mpc8360-pci',
-		'ibm,uic-405exr','atmel,24c08','fsl-usb2-mph-v1.6','MPC85xxMDS','fsl,dcsr-nxc',
-		'xes,xpedite5301','ns16550','fsl,mpc8315-dma-channel','atmel,24c512','fsl,mpc866-smc-uart',
-		'fsl,p1022-elbc','ibm,usb-ehci-460ex','fsl,qe','fsl,mpc8541-memory-controller','fsl,t4240-esdhc',
-		'fsl,p4080-dcsr-nal','fsl,mpc5200-fec','ibm,plb-4xx','ibm,gpio-440gp','fsl,pq2-soc',
-		'atmel,24c1024','ibm,iic','fsl,t1040-dcsr-snpc','ibm,emac-440epx','ibm,iic-405ex',
-		'fsl,p1010-pcie','fsl,mpc8536-l2-cache-controller','fsl,mpc8569mds-pib','fsl,B4420QDS','PowerPC,440SPe',
-		'fsl,mpc8315-elbc','fsl,mpc8572-tlu','pnpPNP,000','ibm,sdr-440grx','fsl,media5200-fpga',
-		'fsl,qoriq-device-config-1.0','ibm,plb-440spe','fsl,fman-v2-port-tx','fsl,sec-v4.4','fsl,p1021-immr',
-		'fsl,t1040-ucc-uart','eon,en25s64','ibm,sdr-440spe','ibm,ebc-460gt','nintendo,flipper-exi',
-		'fsl,mpc512x-lpbfifo','fsl,mpc875-smc-uart','ibm,plb-pcix-460gt','zarlink,zl30343','fsl,mpc5121-localbus',
-		'fsl,mpc8280-pci','fsl,mpc875-fec-mdio','snps,dma-spear1340','fsl,t1023-clockgen','fsl,mpc875-fec-enet',
-		'fsl,p1021-fcm-nand','ibm,mcmal-460ex','fsl,pq2fads-mdio-bitbang','amcc,kilauea','amd,s29gl256n',
-		'fsl,mpc8540-localbus','fsl,mpc5200-immr','manroland,uc101','fsl,mpc5121-usb2-dr','MPC85xxCDS',
-		'ibm,uic-440spe','fsl,mpc8641-soc','fsl,mc9s08qg8-mpc8379erdb','fsl,p1022-esdhc','fsl,MPC8610HPCD',
-		'ifm,ac14xx-asi-fpga','fsl,mpc8378-pcie','fsl,mpc5121-axe-base','fsl,mpc8536-memory-controller','fsl,mpc5200-spi',
-		'fsl,mpc8378-fcm-nand','ibm,cpc-440gp','fsl,sec-v5.2-rtic-memory','fsl,fpga-pixis-gpio-bank','nxp,usb-isp1761',
-		'fsl,sec-v4.2-mon','ibm,plb-pciex-440spe','PowerPC,4xx','fsl,p3041-elbc','fsl,gianfar-tbi',
-		'fsl,mpc5200b-mscan','usb-ehci','tqc,tqm8540','nxp,rtc8564','fsl,pq1-localbus',
-		'intel,JS28F640','fsl,mpc8378-pmc','ibm,rgmii-440epx','fsl,b4860-rcpm','fsl,mpc866ads',
-		'fsl,mpc8641-pcie','fsl,p1021-guts','fsl,mpc8569mds-bcsr','ibm,plb-440gx','fsl,p3041-dcsr-epu',
-		'fsl,p1014-l2-cache-controller','fsl,b4860-l2-cache-controller','ibm,iic-440grx','fsl,mpc5200-gpio','gef,fpga-wdt',
-		'ibm,cpr-460sx','fsl,p1020-l2-cache-controller','nintendo,flipper-vi','fsl,media5200','atmel,at24c16',
-		'ge,imp3a-paged-flash','ds1743-nvram','fsl,p2041-elbc','tqc,tqm8541','fsl,b4-clockgen',
-		'fsl,dcsr-npc','fsl,mpc5200b-spi','fsl,sec2.2','fsl,mpc8349-gpio','ibm,ebc-440grx',
-		'fsl,mpc8247-smc-uart','fsl,pq2pro-pic','fsl,mpc866-scc-enet','fsl,mpc8349-pmc','fsl,cpm1-brg',
-		'fsl,mpc8569-pmc','fsl,mpc5125','fsl,mpc5121-fec','fsl,mpc8248-fcc-enet','fsl,sec2.1',
-		'fsl,pq1-fec-mdio','fsl,srio-dbell-unit','dallas,ds1775','fsl,t1040-dcsr-ocn','amcc,sequoia',
-		'abb,socrates-fpga-pic','fsl,mpc5121-i2c','PowerPC,460EX','fsl,mpc8555-l2-cache-controller','fsl,t1023-dcsr-epu',
-		'ibm,plb6','fsl,mpc8548-dma-channel','ibm,opb-440spe','ibm,sdr-460gt','fsl,mpc8248-brg',
-		'amcc,bamboo','fsl,p2041-pcie','fsl,t4240-l3-cache-controller','fsl,p5020-dcsr-dpaa','ifm,ac14xx',
-		'fsl,t1042rdb_pi-cpld','ibm,bus-error-irq','fsl,mpc8360-dma-channel','fsl,mpc8572-guts','fsl,t1040-esdhc',
-		'PowerPC,405EXr','fsl,mpc8313-dma-channel'
-
-	],	
-	'mips' : [
-
-		'ingenic,jz4780-ost','img,pistachio-reset','ingenic,jz4740-uart','ingenic,jz4725b-i2s','restart-poweroff',
-		'pci8086,8801','usb-b-connector','snps,dwmac-4.10a','ingenic,x1830-mmc','i2c-mux-pinctrl',
-		'ingenic,x1830-dtrng','mscc,luton-icpu-intr','img,pistachio-dw-mshc','ingenic,x1000-i2c','smsc,lan9115',
-		'ingenic,jz4780','nxp,sc16is752','gpio-matrix-keypad','ingenic,x1000-phy','mscc,jr2-pcb118',
-		'ingenic,jz4740-pwm','pwm-backlight','adi,adt7420','mscc,serval-pinctrl','pwm-leds',
-		'mscc,ocelot-pcb120','pci8086,8817','ingenic,x1830-phy','ingenic,jz4725b-musb','brcm,bcm4330-bt',
-		'yna,cu1000-neo','intel,i8259','mti,mips14KEc','ingenic,xburst-mxu1.0','ingenic,jz4770-phy',
-		'ingenic,x1830-intc','mscc,ocelot-miim','img,ir-rev1','ingenic,x1830-i2c','sharp,ls020b1dd01d',
-		'ingenic,jz4725b-intc','ingenic,jz4780-pwm','mscc,jr2-pcb111','ingenic,x1000-ost','ingenic,jz4740-ohci',
-		'img,ci20','iio-hwmon','img,spfi','ingenic,jz4780-watchdog','ingenic,jz4770-rtc',
-		'ingenic,x1000-rtc','ingenic,jz4780-dma','jedec,spi-nor','ingenic,jz4770-codec','mscc,luton-pcb091',
-		'img,pistachio-mdc-dma','ingenic,jz4740-gpio','ingenic,x1830-gpio','fixed-clock','ingenic,jz4725b-lcd',
-		'ingenic,jz4740-nemc','img,pistachio','mmio-sram','spidev','mips,mips24KEc',
-		'xlnx,axi-pcie-host-1.00.a','ingenic,xburst-fpu1.0-mxu1.1','generic-ohci','intel,dt28f160','pci8086,8800',
-		'ingenic,x1000-dma','gpio-leds','ingenic,x1000-cgu','mscc,vsc7514-serdes','ingenic,jz4780-uart',
-		'gpio-ir-receiver','ingenic,x1830-rtc','mscc,jr2','ingenic,jz4725b-codec','ingenic,xburst-fpu2.0-mxu2.0',
-		'qi,lb60','ingenic,jz4740','ingenic,jz4780-phy','mscc,luton-pinctrl','mscc,ocelot-cpu-syscon',
-		'ingenic,jz4770-pinctrl','ingenic,jz4780-otg','ingenic,jz4725b-ipu','mscc,ocelot','ingenic,jz4780-cgu',
-		'ingenic,x1830-mac','spi-gpio','img,boston-clock','ingenic,jz4770','ingenic,jz4725b-tcu',
-		'ingenic,jz4740-mmc','ingenic,x1830-dma','img,pistachio-clk-periph','intel,28f128j3','ingenic,jz4780-mmc',
-		'snps,dwmac','fixed-partitions','ingenic,x1000-mac','ns16550a','mscc,serval',
-		'img,pistachio-pwm','img,spdif-in','ingenic,jz4780-bch','active-semi,act8600','ingenic,jz4770-i2s',
-		'ingenic,x1830-cgu','img,pistachio-clk','ingenic,jz4725b-gpio','ingenic,jz4770-watchdog','img,i2s-in',
-		'ingenic,jz4770-ost','ingenic,x1830-pinctrl','ingenic,jz4740-rtc','mscc,jaguar2-icpu-intr','mti,sead3-cpld',
-		'ingenic,jz4770-mmc','simple-bus','nxp,pca9545','mscc,jr2-pcb110','ingenic,jz4780-i2c',
-		'ethernet-phy-ieee802.3-c22','ingenic,jz4740-pinctrl','mscc,ocelot-chip-reset','kingdisplay,kd035g6-54nt','mscc,serval-pcb106',
-		'ingenic,jz4725b-nemc','snps,dw-apb-ssi','snps,dw-apb-uart','mscc,ocelot-i2c','mscc,ocelot-hsio',
-		'ingenic,jz4740-watchdog','ingenic,x1000-watchdog','gcw,zero','pci10ee,7021','snps,designware-i2c',
-		'ingenic,jz4740-ecc','mti,malta-lcd','syscon','simple-mfd','mmc-pwrseq-simple',
-		'ingenic,jz4770-musb','snps,dwc2','ingenic,jz4770-intc','ingenic,jz4725b-pwm','img,mips',
-		'mscc,serval-icpu-intr','generic-ehci','gpio-charger','ingenic,jz4725b','ni,169445-nand-gpio',
-		'mti,mips-cpc','ingenic,jz4725b-watchdog','ingenic,jz4770-dma','ingenic,jz4770-tcu','nxp,pcf8563',
-		'ingenic,jz4780-efuse','ingenic,jz4780-gpio','ingenic,jz4740-musb','cosmic,10001-adc','ingenic,x1830-otg',
-		'ingenic,jz4780-nemc','ingenic,jz4740-cgu','ingenic,jz4780-rng','syscon-reboot','img,pistachio-marduk',
-		'ingenic,jz4780-tcu','ingenic,x1830-watchdog','mti,sead3-lcd','ingenic,jz4740-tcu','ingenic,jz4725b-nand',
-		'ingenic,x1000-uart','img,pistachio-cr-top','ingenic,x1000-pinctrl','xlnx,xps-ethernetlite-3.00.a','brcm,bcm4329-fmac',
-		'mti,sead3-fpga','ethernet-phy-id0007.c0f0','ingenic,x1000-gpio','img,scb-i2c','img,pistachio-cr-periph',
-		'ingenic,jz4780-nand','ingenic,jz4725b-dma','register-bit-led','mips,m14Kc','pci8086,8802',
-		'img,boston','img,pistachio-usb-phy','gpio-keys','ingenic,jz4770-lcd','usb-nop-xceiv',
-		'img,hash-accelerator','ingenic,jz4760-mmc','ingenic,jz4740-battery','infineon,slb9645tt','ingenic,jz4770-uart',
-		'ingenic,x1000-mmc','ingenic,jz4725b-pinctrl','simple-audio-amplifier','mscc,vsc7514-switch','ingenic,jz4740-lcd',
-		'img,boston-lcd','ingenic,x1830','giantplus,gpm940b0','ingenic,x1830-ost','ingenic,jz4740-adc',
-		'davicom,dm9000','ti,ads7830','ni,169445','ingenic,jz4725b-uart','ingenic,jz4770-gpio',
-		'xlnx,xps-intc-1.00.a','mti,gic','simple-battery','mscc,luton','ingenic,jz4740-i2s',
-		'ingenic,jz4760-rtc','mti,cpu-interrupt-controller','cfi-flash','xlnx,xps-gpio-1.00.a','ingenic,jz4780-pinctrl',
-		'img,pistachio-gptimer','adc-keys','ingenic,x1000-otg','fixed-factor-clock','ingenic,jz4780-intc',
-		'mti,sead-3','mscc,ocelot-pcb123','vivante,gc','img,pistachio-internal-dac','gpio-control-nand',
-		'snps,dwmac-mdio','ingenic,jz4725b-bch','ingenic,jz4740-nand','img,boston-platform-regs','img,spdif-out',
-		'mscc,ocelot-pinctrl','mscc,ocelot-icpu-intr','spansion,s25fl016k','yna,cu1830-neo','ingenic,jz4740-codec',
-		'i2c-mux-gpio','mti,malta','ingenic,jz4725b-adc','mti,gic-timer','ingenic,jz4740-dma',
-		'ingenic,x1000-tcu','brcm,bcm4330-fmac','macronix,mx25l25635f','img,pdc-wdt','ingenic,jz4725b-cgu',
-		'mscc,jaguar2-pinctrl','isa','gpio-usb-b-connector','ingenic,jz4740-intc','img,i2s-out',
-		'ingenic,x1000-intc','digilent,nexys4ddr','mtd-rom','mti,mips14Kc','st,m41t81s',
-		'ingenic,jz4725b-rtc','img,pistachio-system-pinctrl','mti,interaptiv','mscc,ocelot-spi','ingenic,x1000-rng',
-		'mti,malta-fpga','regulator-fixed','ingenic,jz4770-pwm','ingenic,x1830-uart','ingenic,jz4770-adc',
-		'ingenic,jz4725b-mmc','mscc,serval-pcb105','i2c-gpio','motorola,mc146818','ingenic,jz4780-rtc',
-		'ingenic,x1000e','ingenic,x1830-tcu','ingenic,jz4725b-ost','simple-audio-card','img,parallel-out',
-		'xlnx,xps-iic-2.00.a','ethernet-phy-id0243.0c54','ylm,rs90','ingenic,jz4770-cgu','pci8086,8803',
-		'pwm-vibrator','mti,mips-cdmm'
-
-	]
-
-}
\ No newline at end of file
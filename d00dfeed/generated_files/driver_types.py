@@ -1,3914 +0,0 @@
-#! /usr/bin/python3
-
-########################################################################################################################
-# THIS FILE WAS AUTO GENERATED BY ./df_analyze.py
-########################################################################################################################
-
-
-DRIVER_NAME_TO_TYPE = {
-	
-	('intel,ce4100-cp', 'isa', 'pci') : 'OTHER',	
-	('motorola,mc146818',) : 'rtc',	
-	('fixed-clock',) : 'clk',	
-	('virtio,uml',) : 'virtio_uml.c',	
-	('fsl,mpc5121-immr', 'fsl,mpc5121-localbus', 'fsl,mpc5121-mbx', 'fsl,mpc5121-nfc', 'fsl,mpc5121-sram', 'fsl,mpc5121-pci', 'gpio-leds') : 'OTHER',	
-	('fsl,mpc512x-lpbfifo',) : 'OTHER',	
-	('ibm,vas',) : 'OTHER',	
-	('ibm,opal-prd',) : 'OTHER',	
-	('ibm,secvar-backend',) : 'OTHER',	
-	('fsl,pq2pro-localbus',) : 'OTHER',	
-	('fsl,mcu-mpc8349emitx',) : 'OTHER',	
-	('soc', 'simple-bus', 'gianfar', 'gpio-leds', 'fsl,qe') : 'OTHER',	
-	('fsl,mpc8313-pmc', 'fsl,mpc8349-pmc') : 'OTHER',	
-	('amcc,ppc4xx-msi',) : 'OTHER',	
-	('ibm,hsta-msi',) : 'OTHER',	
-	('simple-bus',) : 'OTHER',	
-	('fsl,ep8248e-mdio-bitbang', 'simple-bus', 'fsl,ep8248e-bcsr') : 'OTHER',	
-	('ibm,pmemory', 'ibm,pmemory-v2') : 'OTHER',	
-	('IBM,lhca', 'IBM,lhea') : 'OTHER',	
-	('pasemi,localbus', 'pasemi,sdc') : 'OTHER',	
-	('fsl,mpc5200-immr', 'fsl,mpc5200b-immr', 'mpc5200', 'mpc5200') : 'OTHER',	
-	('fsl,mpc5200-cdm', 'mpc5200-cdm', 'fsl,mpc5200-gpio', 'mpc5200-gpio') : 'OTHER',	
-	('fsl,mpc5200-gpio', 'mpc5200-gpio') : 'OTHER',	
-	('fsl,mpc5200-pci', 'mpc5200-pci') : 'OTHER',	
-	('fsl,mpc5200-lpbfifo',) : 'OTHER',	
-	('fsl,mpc5200-gpt', 'fsl,mpc5200-gpt-gpio', 'mpc5200-gpt') : 'OTHER',	
-	('fsl,mpc5200-pic', 'mpc5200-pic', 'fsl,mpc5200-bestcomm', 'mpc5200-bestcomm') : 'OTHER',	
-	('fsl,mpc5200-xlb', 'mpc5200-xlb', 'fsl,mpc5200-immr', 'fsl,mpc5200b-immr', 'simple-bus', 'fsl,lpb', 'mpc5200', 'mpc5200', 'fsl,mpc5200-gpt', 'mpc5200-gpt', 'fsl,mpc5200-cdm', 'mpc5200-cdm', 'fsl,mpc5200-gpio', 'fsl,mpc5200-gpio-wkup') : 'OTHER',	
-	('ibm,plb4', 'ibm,opb', 'ibm,ebc') : 'OTHER',	
-	('ibm,plb4', 'ibm,plb6', 'ibm,opb', 'ibm,ebc') : 'OTHER',	
-	('ibm,plb4', 'ibm,plb6', 'ibm,opb') : 'OTHER',	
-	('ibm,plb4', 'ibm,opb', 'ibm,ebc', 'simple-bus') : 'OTHER',	
-	('nintendo,hollywood',) : 'OTHER',	
-	('nintendo,flipper',) : 'OTHER',	
-	('hawk-bridge',) : 'OTHER',	
-	('fsl,srio',) : 'OTHER',	
-	('fsl,mpc8610-immr', 'fsl,mpc8610-guts', 'fsl,eloplus-dma', 'fsl,mpc8610-pci') : 'OTHER',	
-	('soc', 'simple-bus', 'gianfar', 'fsl,mpc8641-pcie') : 'OTHER',	
-	('soc',) : 'OTHER',	
-	('simple-bus', 'gianfar', 'fsl,srio') : 'OTHER',	
-	('sgy,gpio-halt', 'fsl,qoriq-gpio') : 'OTHER',	
-	('fsl,mpc8572-guts', 'fsl,p1020-guts', 'fsl,p1021-guts', 'fsl,p1022-guts', 'fsl,p1023-guts', 'fsl,p2020-guts', 'fsl,bsc9132-guts') : 'OTHER',	
-	('soc', 'simple-bus', 'gianfar', 'fsl,qe', 'fsl,cpm2', 'fsl,srio', 'fsl,eloplus-dma', 'fsl,mpc8548-guts', 'gpio-leds', 'fsl,mpc8540-pci', 'fsl,mpc8548-pcie', 'fsl,p1022-pcie', 'fsl,p1010-pcie', 'fsl,p1023-pcie', 'fsl,p4080-pcie', 'fsl,qoriq-pcie-v2.4', 'fsl,qoriq-pcie-v2.3', 'fsl,qoriq-pcie-v2.2', 'fsl,fman') : 'OTHER',	
-	('ibm,plb3', 'ibm,plb4', 'ibm,opb', 'ibm,ebc', 'simple-bus') : 'OTHER',	
-	('ibm,secureboot', 'ibm,secureboot-v1', 'ibm,secureboot-v2') : 'OTHER',	
-	('ibm,opb', 'simple-bus', 'wrs,epld-localbus') : 'OTHER',	
-	('fsl,elbc', 'fsl,pq3-localbus', 'fsl,pq2-localbus', 'fsl,pq2pro-localbus') : 'OTHER',	
-	('fsl,p2020-l2-cache-controller', 'fsl,p2010-l2-cache-controller', 'fsl,p1020-l2-cache-controller', 'fsl,p1011-l2-cache-controller', 'fsl,p1013-l2-cache-controller', 'fsl,p1022-l2-cache-controller', 'fsl,mpc8548-l2-cache-controller', 'fsl,mpc8544-l2-cache-controller', 'fsl,mpc8572-l2-cache-controller', 'fsl,mpc8536-l2-cache-controller', 'fsl,p1021-l2-cache-controller', 'fsl,p1012-l2-cache-controller', 'fsl,p1025-l2-cache-controller', 'fsl,p1016-l2-cache-controller', 'fsl,p1024-l2-cache-controller', 'fsl,p1015-l2-cache-controller', 'fsl,p1010-l2-cache-controller', 'fsl,bsc9131-l2-cache-controller') : 'OTHER',	
-	('fsl,mpic-global-timer',) : 'OTHER',	
-	('fsl,mpc8540-pci', 'fsl,mpc8548-pcie', 'fsl,mpc8610-pci', 'fsl,mpc8641-pcie', 'fsl,qoriq-pcie', 'fsl,qoriq-pcie-v2.1', 'fsl,qoriq-pcie-v2.2', 'fsl,qoriq-pcie-v2.3', 'fsl,qoriq-pcie-v2.4', 'fsl,qoriq-pcie-v3.0', 'fsl,p1022-pcie', 'fsl,p4080-pcie') : 'OTHER',	
-	('fsl,cpm1-pario-bank-a', 'fsl,cpm1-pario-bank-b', 'fsl,cpm1-pario-bank-c', 'fsl,cpm1-pario-bank-d', 'fsl,cpm1-pario-bank-e', 'fsl,cpm2-pario-bank') : 'OTHER',	
-	('fsl,mpc8548-pmc', 'fsl,mpc8641d-pmc') : 'OTHER',	
-	('fsl,mpic-v3.1-msgr',) : 'OTHER',	
-	('fsl,qoriq-rcpm-1.0', 'fsl,qoriq-rcpm-2.0', 'fsl,qoriq-rcpm-2.1') : 'OTHER',	
-	('fsl,mpic-msi', 'fsl,mpic-msi-v4.3', 'fsl,ipic-msi', 'fsl,vmpic-msi', 'fsl,vmpic-msi-v4.3') : 'OTHER',	
-	('open-pic',) : 'OTHER',	
-	('andestech,nds32v3-pmu',) : 'OTHER',	
-	('andestech,atl2c',) : 'OTHER',	
-	('netlogic,xlp-pic',) : 'OTHER',	
-	('brcm,bcm7038-l1-intc', 'brcm,bcm6345-l1-intc') : 'OTHER',	
-	('simple-bus', 'cavium,octeon-6335-uctl', 'cavium,octeon-5750-usbn', 'cavium,octeon-3860-bootbus', 'cavium,mdio-mux', 'gpio-leds', 'cavium,octeon-7130-usb-uctl') : 'OTHER',	
-	('cavium,octeon-3860-ciu', 'cavium,octeon-3860-gpio', 'cavium,octeon-6880-ciu2', 'cavium,octeon-7890-ciu3', 'cavium,octeon-7130-cib') : 'OTHER',	
-	('ralink,rt288x-pci',) : 'OTHER',	
-	('lantiq,pci-xway',) : 'OTHER',	
-	('ralink,rt3883-pci',) : 'OTHER',	
-	('mediatek,mt7620-pci',) : 'OTHER',	
-	('mti,ranchu',) : 'OTHER',	
-	('ingenic,jz4740', 'ingenic,jz4725b', 'ingenic,jz4770', 'ingenic,jz4775', 'ingenic,jz4780', 'ingenic,x1000', 'ingenic,x1000e', 'ingenic,x1830', 'ingenic,x2000', 'ingenic,x2000e') : 'OTHER',	
-	('lantiq,dcdc-xrx200',) : 'OTHER',	
-	('lantiq,gptu-xway',) : 'OTHER',	
-	('lantiq,vmmc-xway',) : 'OTHER',	
-	('lantiq,dma-xway',) : 'OTHER',	
-	('lantiq,icu',) : 'OTHER',	
-	('ralink,rt3883-soc',) : 'OTHER',	
-	('ralink,r2880-soc',) : 'OTHER',	
-	('ralink,rt2880-timer',) : 'OTHER',	
-	('mtk,mt7621-soc',) : 'OTHER',	
-	('ralink,rt3050-soc', 'ralink,rt3052-soc', 'ralink,rt3350-soc', 'ralink,rt3352-soc', 'ralink,rt5350-soc') : 'OTHER',	
-	('ralink,mt7620a-soc', 'ralink,mt7620n-soc', 'ralink,mt7628an-soc') : 'OTHER',	
-	('mti,cpu-interrupt-controller', 'ralink,rt2880-intc') : 'OTHER',	
-	('microchip,pic32mzda-infra',) : 'OTHER',	
-	('csky,csky-pmu',) : 'OTHER',	
-	('arm,integrator-ap-syscon',) : 'OTHER',	
-	('arm,core-module-integrator',) : 'soc/versatile',	
-	('arm,integrator-cp-syscon',) : 'OTHER',	
-	('rockchip,rk3288-pmu',) : 'OTHER',	
-	('arm,arm11mp-scu', 'arm,cortex-a9-scu', 'arm,cortex-a5-scu', 'arm,core-module-integrator', 'arm,realview-eb-syscon', 'arm,realview-pb11mp-syscon', 'arm,realview-pbx-syscon') : 'OTHER',	
-	('zte,zx296702-pcu',) : 'OTHER',	
-	('st,spear-timer',) : 'OTHER',	
-	('arm,arm11mpcore-pmu', 'arm,arm1176-pmu', 'arm,arm1136-pmu') : 'OTHER',	
-	('arm,cortex-a17-pmu', 'arm,cortex-a15-pmu', 'arm,cortex-a12-pmu', 'arm,cortex-a9-pmu', 'arm,cortex-a8-pmu', 'arm,cortex-a7-pmu', 'arm,cortex-a5-pmu', 'qcom,krait-pmu', 'qcom,scorpion-pmu', 'qcom,scorpion-mp-pmu') : 'OTHER',	
-	('mrvl,pxa25x-ssp', 'mvrl,pxa25x-nssp', 'mrvl,pxa27x-ssp', 'mrvl,pxa3xx-ssp', 'mvrl,pxa168-ssp', 'mrvl,pxa910-ssp', 'mrvl,ce4100-ssp') : 'OTHER',	
-	('brcm,bcm63138-bootlut',) : 'OTHER',	
-	('brcm,kona-smc', 'bcm,kona-smc') : 'OTHER',	
-	('stericsson,db8500', 'simple-bus') : 'OTHER',	
-	('stericsson,ux500-pm-domains',) : 'OTHER',	
-	('intel,lubbock-cplds-irqs', 'intel,mainstone-cplds-irqs') : 'OTHER',	
-	('marvell,pxa-intc',) : 'OTHER',	
-	('socionext,uniphier-system-cache',) : 'OTHER',	
-	('marvell,kirkwood-cache', 'marvell,feroceon-cache') : 'OTHER',	
-	('marvell,tauros2-cache',) : 'OTHER',	
-	('renesas,apmu',) : 'OTHER',	
-	('renesas,r8a7742-cpg-mssr', 'renesas,r8a7743-cpg-mssr', 'renesas,r8a7744-cpg-mssr', 'renesas,r8a7790-cpg-mssr', 'renesas,r8a7791-cpg-mssr', 'renesas,r8a7793-cpg-mssr') : 'OTHER',	
-	('dlg,da9063', 'dlg,da9063l', 'dlg,da9210') : 'OTHER',	
-	('ti,k2hk', 'ti,k2e', 'ti,k2l') : 'OTHER',	
-	('stericsson,s365',) : 'OTHER',	
-	('sirf,prima2-rtciobg',) : 'OTHER',	
-	('sirf,prima2-pwrc', 'sirf,prima2-memc') : 'OTHER',	
-	('sirf,atlas7-clkc',) : 'OTHER',	
-	('sirf,prima2-rstc',) : 'OTHER',	
-	('fsl,imx6q-mmdc', 'fsl,imx6qp-mmdc') : 'OTHER',	
-	('marvell,coherency-fabric', 'marvell,armada-375-coherency-fabric', 'marvell,armada-380-coherency-fabric') : 'OTHER',	
-	('marvell,armada-370-pmsu', 'marvell,armada-370-xp-pmsu', 'marvell,armada-380-pmsu') : 'OTHER',	
-	('marvell,armada-xp-pcie', 'marvell,armada-370-pcie', 'marvell,kirkwood-pcie') : 'OTHER',	
-	('marvell,98dx3336-resume-ctrl',) : 'OTHER',	
-	('marvell,orion-system-controller', 'marvell,armada-370-xp-system-controller', 'marvell,armada-375-system-controller') : 'OTHER',	
-	('atmel,sama5d2-gem', 'atmel,at91rm9200-rtc', 'atmel,sama5d3-udc', 'atmel,at91rm9200-ohci', 'usb-ohci', 'atmel,at91sam9g45-ehci', 'usb-ehci', 'atmel,sama5d2-sdhci', 'atmel,at91sam9x5-rtc', 'atmel,at91rm9200-ohci', 'usb-ohci', 'atmel,at91sam9g45-ehci', 'usb-ehci', 'atmel,at91sam9260-rtt', 'cdns,sam9x60-macb', 'atmel,at91rm9200-sdramc', 'atmel,at91sam9260-sdramc', 'atmel,at91sam9g45-ddramc', 'atmel,sama5d3-ddramc', 'atmel,sama5d2-shdwc', 'microchip,sam9x60-shdwc', 'atmel,at91rm9200-pmc', 'atmel,at91sam9260-pmc', 'atmel,at91sam9261-pmc', 'atmel,at91sam9263-pmc', 'atmel,at91sam9g45-pmc', 'atmel,at91sam9n12-pmc', 'atmel,at91sam9rl-pmc', 'atmel,at91sam9x5-pmc', 'atmel,sama5d3-pmc', 'atmel,sama5d4-pmc', 'atmel,sama5d2-pmc', 'microchip,sam9x60-pmc') : 'OTHER',	
-	('ti,omap2-prcm', 'ti,omap3-cm', 'ti,omap4-cm1', 'ti,omap4-cm2', 'ti,omap5-cm-core-aon', 'ti,omap5-cm-core', 'ti,dra7-cm-core-aon', 'ti,dra7-cm-core', 'ti,am3-prcm', 'ti,am4-prcm', 'ti,dm814-prcm', 'ti,dm816-prcm') : 'OTHER',	
-	('ti,am3-scm', 'ti,am4-scm', 'ti,omap2-scm', 'ti,omap3-scm', 'ti,dm814-scm', 'ti,dm816-scrm', 'ti,omap4-scm-core', 'ti,omap5-scm-core', 'ti,omap5-scm-wkup-pad-conf', 'ti,dra7-scm-core') : 'OTHER',	
-	('ti,omap3-prm',) : 'OTHER',	
-	('simple-bus', 'ti,omap-infra') : 'OTHER',	
-	('ti,clkctrl',) : 'OTHER',	
-	('ti,am3-prcm', 'ti,am4-prcm', 'ti,dm814-prcm', 'ti,dm814-pllss', 'ti,dm816-prcm', 'ti,omap2-prcm', 'ti,omap3-prm', 'ti,omap4-prm', 'ti,omap4-scrm', 'ti,omap5-prm', 'ti,omap5-scrm', 'ti,dra7-prm') : 'OTHER',	
-	('ti,omap4-wugen-mpu', 'ti,omap5-wugen-mpu') : 'OTHER',	
-	('samsung,exynos3250-pmu', 'samsung,exynos4210-pmu', 'samsung,exynos4412-pmu', 'samsung,exynos5250-pmu', 'samsung,exynos5420-pmu') : 'OTHER',	
-	('samsung,exynos5420', 'samsung,exynos5800') : 'OTHER',	
-	('samsung,exynos5260-pmu', 'samsung,exynos5410-pmu') : 'OTHER',	
-	('arm,cortex-a5-scu', 'arm,cortex-a9-scu') : 'OTHER',	
-	('arm,cortex-a15-gic', 'nvidia,tegra20-ictlr', 'nvidia,tegra30-ictlr') : 'OTHER',	
-	('xlnx,plbv46-pci-1.03.a',) : 'OTHER',	
-	('riscv,base-pmu',) : 'OTHER',	
-	('snps,arc700-pct', 'snps,archs-pct') : 'OTHER',	
-	('ti,c64x+emifa',) : 'OTHER',	
-	('ti,c64x+dscr',) : 'OTHER',	
-	('ti,c6455-pll', 'ti,c6457-pll', 'ti,c6472-pll', 'ti,c6474-pll', 'ti,c6678-pll', 'ti,c64x+pll') : 'OTHER',	
-	('SUNW,sun4v-pci',) : 'OTHER',	
-	('pciex108e,80f0',) : 'OTHER',	
-	('pci108e,8000',) : 'OTHER',	
-	('pci108e,a001', 'pci108e,a000') : 'OTHER',	
-	('m5819', 'isa-m5819p', 'isa-m5823p', 'ds1287', 'bq4802') : 'OTHER',	
-	('pci108e,a801', 'pci108e,8002', 'pci108e,8001') : 'OTHER',	
-	('sun4v',) : 'OTHER',	
-	('arm,armv8-pmuv3', 'arm,cortex-a34-pmu', 'arm,cortex-a35-pmu', 'arm,cortex-a53-pmu', 'arm,cortex-a55-pmu', 'arm,cortex-a57-pmu', 'arm,cortex-a65-pmu', 'arm,cortex-a72-pmu', 'arm,cortex-a73-pmu', 'arm,cortex-a75-pmu', 'arm,cortex-a76-pmu', 'arm,cortex-a77-pmu', 'arm,neoverse-e1-pmu', 'arm,neoverse-n1-pmu', 'cavium,thunder-pmu', 'brcm,vulcan-pmu') : 'OTHER',	
-	('ramoops',) : 'OTHER',	
-	('atmel,at91sam9263-ac97c',) : 'OTHER',	
-	('nvidia,tegra30-hda', 'nvidia,tegra194-hda') : 'OTHER',	
-	('sirf,sirf-audio-card',) : 'OTHER',	
-	('sirf,audio-port',) : 'OTHER',	
-	('sirf,prima2-usp-pcm',) : 'OTHER',	
-	('fsl,mxs-audio-sgtl5000',) : 'OTHER',	
-	('fsl,imx28-saif',) : 'OTHER',	
-	('st,stih407-uni-player-hdmi', 'st,stih407-uni-player-pcm-out', 'st,stih407-uni-player-dac', 'st,stih407-uni-player-spdif', 'st,stih407-uni-reader-pcm_in', 'st,stih407-uni-reader-hdmi') : 'OTHER',	
-	('zte,zx296702-spdif',) : 'OTHER',	
-	('zte,zx296718-tdm',) : 'OTHER',	
-	('zte,zx296702-i2s',) : 'OTHER',	
-	('img,i2s-out',) : 'OTHER',	
-	('img,i2s-in',) : 'OTHER',	
-	('img,parallel-out',) : 'OTHER',	
-	('img,spdif-out',) : 'OTHER',	
-	('img,spdif-in',) : 'OTHER',	
-	('img,pistachio-internal-dac',) : 'OTHER',	
-	('hisilicon,hi6210-i2s',) : 'OTHER',	
-	('microchip,sama7g5-spdiftx',) : 'OTHER',	
-	('microchip,sam9x60-i2smcc',) : 'OTHER',	
-	('atmel,sam9x5-wm8731-audio',) : 'OTHER',	
-	('mikroe,mikroe-proto',) : 'OTHER',	
-	('atmel,sama5d2-classd',) : 'OTHER',	
-	('atmel,at91sam9g20ek-wm8731-audio',) : 'OTHER',	
-	('atmel,sama5d2-i2s',) : 'OTHER',	
-	('atmel,asoc-wm8904',) : 'OTHER',	
-	('atmel,sama5d2-pdmic',) : 'OTHER',	
-	('axentia,tse850-pcm5142',) : 'OTHER',	
-	('microchip,sama7g5-spdifrx',) : 'OTHER',	
-	('socionext,uniphier-evea',) : 'OTHER',	
-	('socionext,uniphier-ld11-aio', 'socionext,uniphier-ld20-aio') : 'OTHER',	
-	('socionext,uniphier-pxs2-aio',) : 'OTHER',	
-	('brcm,bcm2835-i2s',) : 'OTHER',	
-	('brcm,bcm63xx-i2s',) : 'OTHER',	
-	('brcm,cygnus-audio',) : 'OTHER',	
-	('fsl,imx8qxp-dsp', 'fsl,imx8qm-dsp', 'fsl,imx8mp-dsp') : 'OTHER',	
-	('samsung,fascinate4g-wm8994', 'samsung,aries-wm8994') : 'OTHER',	
-	('samsung,s3c6410-i2s', 'samsung,s5pv210-i2s', 'samsung,exynos5420-i2s', 'samsung,exynos7-i2s', 'samsung,exynos7-i2s1') : 'OTHER',	
-	('samsung,tm2-audio',) : 'OTHER',	
-	('samsung,arndale-rt5631', 'samsung,arndale-alc5631', 'samsung,arndale-wm1811') : 'OTHER',	
-	('samsung,smdk-wm8994',) : 'OTHER',	
-	('google,snow-audio-max98090', 'google,snow-audio-max98091', 'google,snow-audio-max98095') : 'OTHER',	
-	('samsung,midas-audio',) : 'OTHER',	
-	('adi,axi-i2s-1.00.a',) : 'OTHER',	
-	('adi,axi-spdif-tx-1.00.a',) : 'OTHER',	
-	('amlogic,t9015',) : 'OTHER',	
-	('amlogic,axg-spdifin',) : 'OTHER',	
-	('amlogic,g12a-tohdmitx',) : 'OTHER',	
-	('amlogic,axg-spdifout',) : 'OTHER',	
-	('amlogic,axg-toddr', 'amlogic,g12a-toddr', 'amlogic,sm1-toddr') : 'OTHER',	
-	('amlogic,axg-tdmin', 'amlogic,g12a-tdmin', 'amlogic,sm1-tdmin') : 'OTHER',	
-	('amlogic,axg-tdm-iface',) : 'OTHER',	
-	('amlogic,aiu-gxbb', 'amlogic,aiu-gxl', 'amlogic,aiu-meson8', 'amlogic,aiu-meson8b') : 'OTHER',	
-	('amlogic,axg-frddr', 'amlogic,g12a-frddr', 'amlogic,sm1-frddr') : 'OTHER',	
-	('amlogic,axg-pdm',) : 'OTHER',	
-	('amlogic,gx-sound-card',) : 'OTHER',	
-	('amlogic,axg-tdmout', 'amlogic,g12a-tdmout', 'amlogic,sm1-tdmout') : 'OTHER',	
-	('amlogic,axg-sound-card',) : 'OTHER',	
-	('amlogic,g12a-toacodec',) : 'OTHER',	
-	('cdns,xtfpga-i2s',) : 'OTHER',	
-	('st,stm32h7-spdifrx',) : 'OTHER',	
-	('st,stm32h7-dfsdm-dai',) : 'OTHER',	
-	('st,stm32h7-i2s',) : 'OTHER',	
-	('st,stm32-sai-sub-a', 'st,stm32-sai-sub-b') : 'OTHER',	
-	('st,stm32f4-sai', 'st,stm32h7-sai') : 'OTHER',	
-	('audio-graph-card', 'audio-graph-scu-card') : 'OTHER',	
-	('simple-audio-card', 'simple-scu-audio-card') : 'OTHER',	
-	('marvell,kirkwood-audio', 'marvell,dove-audio', 'marvell,armada370-audio') : 'OTHER',	
-	('marvell,a370db-audio',) : 'OTHER',	
-	('stericsson,snd-soc-mop500',) : 'OTHER',	
-	('stericsson,ux500-msp-i2s',) : 'OTHER',	
-	('allwinner,sun4i-a10-spdif', 'allwinner,sun6i-a31-spdif', 'allwinner,sun8i-h3-spdif', 'allwinner,sun50i-h6-spdif') : 'OTHER',	
-	('allwinner,sun50i-a64-codec-analog',) : 'OTHER',	
-	('allwinner,sun4i-a10-codec', 'allwinner,sun6i-a31-codec', 'allwinner,sun7i-a20-codec', 'allwinner,sun8i-a23-codec', 'allwinner,sun8i-h3-codec', 'allwinner,sun8i-v3s-codec') : 'OTHER',	
-	('allwinner,sun4i-a10-i2s', 'allwinner,sun6i-a31-i2s', 'allwinner,sun8i-a83t-i2s', 'allwinner,sun8i-h3-i2s', 'allwinner,sun50i-a64-codec-i2s', 'allwinner,sun50i-h6-i2s') : 'OTHER',	
-	('allwinner,sun8i-a23-codec-analog', 'allwinner,sun8i-h3-codec-analog', 'allwinner,sun8i-v3s-codec-analog') : 'OTHER',	
-	('allwinner,sun8i-a33-codec', 'allwinner,sun50i-a64-codec') : 'OTHER',	
-	('ingenic,jz4740-i2s', 'ingenic,jz4760-i2s', 'ingenic,jz4770-i2s', 'ingenic,jz4780-i2s') : 'OTHER',	
-	('ti,omap-twl4030',) : 'OTHER',	
-	('ti,abe-twl6040',) : 'OTHER',	
-	('ti,da850-mcbsp',) : 'OTHER',	
-	('ti,da830-evm-audio',) : 'OTHER',	
-	('ti,omap2420-mcbsp', 'ti,omap2430-mcbsp', 'ti,omap3-mcbsp', 'ti,omap4-mcbsp') : 'OTHER',	
-	('ti,dm646x-mcasp-audio', 'ti,da830-mcasp-audio', 'ti,am33xx-mcasp-audio', 'ti,dra7-mcasp-audio') : 'OTHER',	
-	('nokia,n900-audio',) : 'OTHER',	
-	('ti,j721e-cpb-audio', 'ti,j721e-cpb-ivi-audio', 'ti,j7200-cpb-audio') : 'OTHER',	
-	('ti,omap4-dmic',) : 'OTHER',	
-	('ti,omap4-mcpdm',) : 'OTHER',	
-	('ti,tas5720', 'ti,tas5722') : 'OTHER',	
-	('linux,spdif-dir',) : 'OTHER',	
-	('adi,adau7118',) : 'OTHER',	
-	('cirrus,cs42l56',) : 'OTHER',	
-	('st,tda7419',) : 'OTHER',	
-	('realtek,rt5665', 'realtek,rt5666') : 'OTHER',	
-	('mediatek,mt6351-sound',) : 'OTHER',	
-	('realtek,rt5668b',) : 'OTHER',	
-	('cirrus,cs4270',) : 'OTHER',	
-	('rohm,bd28623',) : 'OTHER',	
-	('wlf,wm8753',) : 'OTHER',	
-	('wlf,wm8903',) : 'OTHER',	
-	('qcom,sm8250-lpass-wsa-macro',) : 'OTHER',	
-	('ti,tas2764',) : 'OTHER',	
-	('realtek,alc5623',) : 'OTHER',	
-	('cirrus,cs42l52',) : 'OTHER',	
-	('wlf,wm8731',) : 'OTHER',	
-	('wlf,wm8782',) : 'OTHER',	
-	('adi,ssm2305',) : 'OTHER',	
-	('ti,tlv320adc3140', 'ti,tlv320adc5140', 'ti,tlv320adc6140') : 'OTHER',	
-	('ti,tlv320aic32x4', 'ti,tlv320aic32x6') : 'OTHER',	
-	('invensense,ics43432',) : 'OTHER',	
-	('ingenic,jz4725b-codec',) : 'OTHER',	
-	('everest,es7134', 'everest,es7144', 'everest,es7154') : 'OTHER',	
-	('nxp,tfa9879',) : 'OTHER',	
-	('ti,pcm1681',) : 'OTHER',	
-	('ti,tas2562', 'ti,tas2563', 'ti,tas2564', 'ti,tas2110') : 'OTHER',	
-	('wlf,wm8510',) : 'OTHER',	
-	('realtek,rt5631', 'realtek,alc5631') : 'OTHER',	
-	('tempo,tscs454',) : 'OTHER',	
-	('maxim,max98088', 'maxim,max98089') : 'OTHER',	
-	('realtek,rt1015',) : 'OTHER',	
-	('wlf,wm8804',) : 'OTHER',	
-	('mscc,zl38060',) : 'OTHER',	
-	('nuvoton,nau8824',) : 'OTHER',	
-	('realtek,rt5660',) : 'OTHER',	
-	('wlf,wm8750', 'wlf,wm8987') : 'OTHER',	
-	('dmic-codec',) : 'OTHER',	
-	('tempo,tscs42A1', 'tempo,tscs42A2') : 'OTHER',	
-	('ti,pcm3060',) : 'OTHER',	
-	('wlf,wm8960',) : 'OTHER',	
-	('realtek,rt5514',) : 'OTHER',	
-	('everest,es7241',) : 'OTHER',	
-	('rockchip,rk3036-codec',) : 'OTHER',	
-	('adi,ssm2518',) : 'OTHER',	
-	('dlg,da7212', 'dlg,da7213') : 'OTHER',	
-	('ti,pcm1862', 'ti,pcm1863', 'ti,pcm1864', 'ti,pcm1865') : 'OTHER',	
-	('rockchip,rk3328-codec',) : 'OTHER',	
-	('adi,adau7002',) : 'OTHER',	
-	('wlf,wm8523',) : 'OTHER',	
-	('st,sta32x',) : 'OTHER',	
-	('wlf,wm8741',) : 'OTHER',	
-	('nxp,uda1334',) : 'OTHER',	
-	('wlf,wm8770',) : 'OTHER',	
-	('wlf,wm8728',) : 'OTHER',	
-	('wlf,wm8776',) : 'OTHER',	
-	('realtek,rt5616',) : 'OTHER',	
-	('cirrus,lochnagar2-soundcard',) : 'OTHER',	
-	('dlg,da7219',) : 'OTHER',	
-	('dlg,da9055-codec',) : 'OTHER',	
-	('cirrus,cs35l35',) : 'OTHER',	
-	('wlf,wm8978',) : 'OTHER',	
-	('maxim,max98390',) : 'OTHER',	
-	('adi,adau1361', 'adi,adau1461', 'adi,adau1761', 'adi,adau1961') : 'OTHER',	
-	('asahi-kasei,ak5558',) : 'OTHER',	
-	('asahi-kasei,ak4458', 'asahi-kasei,ak4497') : 'OTHER',	
-	('nuvoton,nau8540',) : 'OTHER',	
-	('ti,pcm1789',) : 'OTHER',	
-	('maxim,max9860',) : 'OTHER',	
-	('maxim,max98371',) : 'OTHER',	
-	('maxim,max9867',) : 'OTHER',	
-	('ti,tas5086',) : 'OTHER',	
-	('qcom,pm8916-wcd-analog-codec',) : 'OTHER',	
-	('ti,pcm3168a',) : 'OTHER',	
-	('ingenic,jz4770-codec',) : 'OTHER',	
-	('ti,ts3a227e',) : 'OTHER',	
-	('realtek,alc5632',) : 'OTHER',	
-	('cirrus,cs35l36',) : 'OTHER',	
-	('ti,pcm1792a',) : 'OTHER',	
-	('ti,tlv320aic310x', 'ti,tlv320aic311x', 'ti,tlv320aic3100', 'ti,tlv320aic3110', 'ti,tlv320aic3120', 'ti,tlv320aic3111', 'ti,tlv320dac3100', 'ti,tlv320dac3101') : 'OTHER',	
-	('realtek,rt5639', 'realtek,rt5640') : 'OTHER',	
-	('wlf,wm8711',) : 'OTHER',	
-	('cirrus,cs53l30',) : 'OTHER',	
-	('cirrus,cs35l32',) : 'OTHER',	
-	('cirrus,cs43130', 'cirrus,cs4399', 'cirrus,cs43131', 'cirrus,cs43198') : 'OTHER',	
-	('maxim,max98373',) : 'OTHER',	
-	('cirrus,cs4271',) : 'OTHER',	
-	('asahi-kasei,ak5386',) : 'OTHER',	
-	('realtek,rt1015p',) : 'OTHER',	
-	('wlf,wm8737',) : 'OTHER',	
-	('realtek,rt5677',) : 'OTHER',	
-	('ti,ads1174', 'ti,ads1178') : 'OTHER',	
-	('qcom,msm8916-wcd-digital-codec',) : 'OTHER',	
-	('maxim,max98090', 'maxim,max98091') : 'OTHER',	
-	('google,cros-ec-codec',) : 'OTHER',	
-	('cirrus,cs42448', 'cirrus,cs42888') : 'OTHER',	
-	('option,gtm601', 'broadmobi,bm818') : 'OTHER',	
-	('realtek,rt274',) : 'OTHER',	
-	('ti,tas6424',) : 'OTHER',	
-	('maxim,max98925',) : 'OTHER',	
-	('ti,pcm5121', 'ti,pcm5122', 'ti,pcm5141', 'ti,pcm5142') : 'OTHER',	
-	('asahi-kasei,ak4554',) : 'OTHER',	
-	('adi,adau1381', 'adi,adau1781') : 'OTHER',	
-	('maxim,max9759',) : 'OTHER',	
-	('realtek,rt1016',) : 'OTHER',	
-	('mediatek,mt6358-sound',) : 'OTHER',	
-	('mediatek,mt6660',) : 'OTHER',	
-	('linux,spdif-dit',) : 'OTHER',	
-	('st,sta529',) : 'OTHER',	
-	('cirrus,cs42l42',) : 'OTHER',	
-	('cirrus,cs4341a',) : 'OTHER',	
-	('adi,ssm4567',) : 'OTHER',	
-	('realtek,rt1011',) : 'OTHER',	
-	('asahi-kasei,ak4642', 'asahi-kasei,ak4643', 'asahi-kasei,ak4648') : 'OTHER',	
-	('adi,ssm2602',) : 'OTHER',	
-	('maxim,max98926',) : 'OTHER',	
-	('cirrus,cs42l73',) : 'OTHER',	
-	('nuvoton,nau8810', 'nuvoton,nau8812', 'nuvoton,nau8814') : 'OTHER',	
-	('simple-audio-mux',) : 'OTHER',	
-	('st,stih407-sas-codec',) : 'OTHER',	
-	('nuvoton,nau8822',) : 'OTHER',	
-	('maxim,max98504',) : 'OTHER',	
-	('qcom,sm8250-lpass-va-macro',) : 'OTHER',	
-	('wlf,wm8974',) : 'OTHER',	
-	('ti,tpa6130a2', 'ti,tpa6140a2') : 'OTHER',	
-	('dioo,dio2125', 'simple-audio-amplifier') : 'OTHER',	
-	('realtek,rt5682i',) : 'OTHER',	
-	('realtek,rt5651',) : 'OTHER',	
-	('maxim,max98095',) : 'OTHER',	
-	('cirrus,cs4234',) : 'OTHER',	
-	('delta,dfbmcs320', 'linux,bt-sco') : 'OTHER',	
-	('realtek,rt5645', 'realtek,rt5650') : 'OTHER',	
-	('ti,tlv320aic3x', 'ti,tlv320aic33', 'ti,tlv320aic3007', 'ti,tlv320aic3106', 'ti,tlv320aic3104') : 'OTHER',	
-	('cirrus,cs4265',) : 'OTHER',	
-	('sirf,prima2-audio-codec', 'sirf,atlas6-audio-codec') : 'OTHER',	
-	('realtek,rt5658', 'realtek,rt5659') : 'OTHER',	
-	('cirrus,cs35l33',) : 'OTHER',	
-	('zte,zx-aud96p22',) : 'OTHER',	
-	('wlf,wm8962',) : 'OTHER',	
-	('ingenic,jz4740-codec',) : 'OTHER',	
-	('ti,tas5707', 'ti,tas5711', 'ti,tas5717', 'ti,tas5719', 'ti,tas5721') : 'OTHER',	
-	('ti,pcm5102a',) : 'OTHER',	
-	('nxp,uda1380',) : 'OTHER',	
-	('maxim,max98927',) : 'OTHER',	
-	('wlf,wm8524',) : 'OTHER',	
-	('realtek,rt1308',) : 'OTHER',	
-	('dlg,da7217', 'dlg,da7218') : 'OTHER',	
-	('cirrus,cs35l34',) : 'OTHER',	
-	('asahi-kasei,ak4104',) : 'OTHER',	
-	('cirrus,cs4349',) : 'OTHER',	
-	('ti,tas2552',) : 'OTHER',	
-	('maxim,max98357a', 'maxim,max98360a') : 'OTHER',	
-	('asahi-kasei,ak4118',) : 'OTHER',	
-	('wlf,wm8580', 'wlf,wm8581') : 'OTHER',	
-	('everest,es8316',) : 'OTHER',	
-	('nuvoton,nau8315',) : 'OTHER',	
-	('fsl,sgtl5000',) : 'OTHER',	
-	('ti,tlv320aic23',) : 'OTHER',	
-	('wlf,wm8904', 'wlf,wm8912') : 'OTHER',	
-	('cirrus,cs42l51',) : 'OTHER',	
-	('adi,adau1701',) : 'OTHER',	
-	('realtek,rt5663',) : 'OTHER',	
-	('adi,ssm2602', 'adi,ssm2603', 'adi,ssm2604') : 'OTHER',	
-	('everest,es8328', 'everest,es8388') : 'OTHER',	
-	('asahi-kasei,ak4613',) : 'OTHER',	
-	('st,sta350',) : 'OTHER',	
-	('everest,es8328',) : 'OTHER',	
-	('ti,tas2770',) : 'OTHER',	
-	('adi,adau1977', 'adi,adau1978', 'adi,adau1979') : 'OTHER',	
-	('nuvoton,nau8825',) : 'OTHER',	
-	('realtek,rt1305', 'realtek,rt1306') : 'OTHER',	
-	('renesas,sh_fsi', 'renesas,sh_fsi2') : 'OTHER',	
-	('renesas,rcar_sound-gen1', 'renesas,rcar_sound-gen2', 'renesas,rcar_sound-gen3', 'renesas,rcar_sound-r8a77990') : 'OTHER',	
-	('intel,keembay-i2s', 'intel,keembay-tdm') : 'OTHER',	
-	('nvidia,tegra210-admaif', 'nvidia,tegra186-admaif') : 'OTHER',	
-	('nvidia,tegra-audio-wm8903',) : 'OTHER',	
-	('nvidia,tegra-audio-rt5640',) : 'OTHER',	
-	('nvidia,tegra210-dmic',) : 'OTHER',	
-	('nvidia,tegra210-i2s',) : 'OTHER',	
-	('nvidia,tegra186-dspk',) : 'OTHER',	
-	('nvidia,tegra210-ahub', 'nvidia,tegra186-ahub') : 'OTHER',	
-	('nvidia,tegra20-das',) : 'OTHER',	
-	('nvidia,tegra-audio-wm9712',) : 'OTHER',	
-	('nvidia,tegra20-i2s',) : 'OTHER',	
-	('nvidia,tegra-audio-rt5677',) : 'OTHER',	
-	('nvidia,tegra20-ac97',) : 'OTHER',	
-	('nvidia,tegra-audio-sgtl5000',) : 'OTHER',	
-	('nvidia,tegra-audio-alc5632',) : 'OTHER',	
-	('nvidia,tegra-audio-trimslice',) : 'OTHER',	
-	('nvidia,tegra124-i2s', 'nvidia,tegra30-i2s') : 'OTHER',	
-	('nvidia,tegra-audio-wm8753',) : 'OTHER',	
-	('nvidia,tegra-audio-max98090',) : 'OTHER',	
-	('nvidia,tegra124-ahub', 'nvidia,tegra114-ahub', 'nvidia,tegra30-ahub') : 'OTHER',	
-	('sprd,pcm-platform',) : 'OTHER',	
-	('sprd,sc9860-mcdt',) : 'OTHER',	
-	('mediatek,mtk-btcvsd-snd',) : 'OTHER',	
-	('mediatek,mt8183_da7219_max98357', 'mediatek,mt8183_da7219_rt1015', 'mediatek,mt8183_da7219_rt1015p') : 'OTHER',	
-	('mediatek,mt8183-audio',) : 'OTHER',	
-	('mediatek,mt8183_mt6358_ts3a227_max98357', 'mediatek,mt8183_mt6358_ts3a227_max98357b', 'mediatek,mt8183_mt6358_ts3a227_rt1015') : 'OTHER',	
-	('mediatek,mt8173-afe-pcm',) : 'OTHER',	
-	('mediatek,mt8173-rt5650',) : 'OTHER',	
-	('mediatek,mt8173-max98090',) : 'OTHER',	
-	('mediatek,mt8173-rt5650-rt5514',) : 'OTHER',	
-	('mediatek,mt8173-rt5650-rt5676',) : 'OTHER',	
-	('mediatek,mt6797-mt6351-sound',) : 'OTHER',	
-	('mediatek,mt6797-audio',) : 'OTHER',	
-	('mediatek,mt8192-audio',) : 'OTHER',	
-	('mediatek,mt8192_mt6359_rt1015_rt5682', 'mediatek,mt8192_mt6359_rt1015p_rt5682') : 'OTHER',	
-	('mediatek,mt2701-cs42448-machine',) : 'OTHER',	
-	('mediatek,mt2701-wm8960-machine',) : 'OTHER',	
-	('mediatek,mt2701-audio', 'mediatek,mt7622-audio') : 'OTHER',	
-	('rockchip,rockchip-audio-max98090',) : 'OTHER',	
-	('rockchip,pdm', 'rockchip,px30-pdm', 'rockchip,rk1808-pdm', 'rockchip,rk3308-pdm') : 'OTHER',	
-	('rockchip,rk3066-spdif', 'rockchip,rk3188-spdif', 'rockchip,rk3228-spdif', 'rockchip,rk3288-spdif', 'rockchip,rk3328-spdif', 'rockchip,rk3366-spdif', 'rockchip,rk3368-spdif', 'rockchip,rk3399-spdif') : 'OTHER',	
-	('rockchip,rk3066-i2s', 'rockchip,rk3188-i2s', 'rockchip,rk3288-i2s', 'rockchip,rk3399-i2s') : 'OTHER',	
-	('rockchip,rk3399-cdn-dp', 'dlg,da7219', 'dmic-codec', 'maxim,max98357a', 'realtek,rt5514', 'realtek,rt5514', 'rockchip,rk3399-gru-sound') : 'OTHER',	
-	('rockchip,rockchip-audio-rt5645',) : 'OTHER',	
-	('rockchip,rk3288-hdmi-analog',) : 'OTHER',	
-	('fsl,imx8mp-aud2htx',) : 'OTHER',	
-	('fsl,imx-audio-spdif',) : 'OTHER',	
-	('fsl,imx35-esai', 'fsl,vf610-esai', 'fsl,imx6ull-esai') : 'OTHER',	
-	('fsl,ssi-dma-channel',) : 'OTHER',	
-	('fsl,imx21-audmux', 'fsl,imx31-audmux') : 'OTHER',	
-	('fsl,mpc5200-psc-i2s', 'fsl,mpc5200b-psc-i2s') : 'OTHER',	
-	('fsl,imx35-asrc', 'fsl,imx53-asrc', 'fsl,imx8qm-asrc', 'fsl,imx8qxp-asrc') : 'OTHER',	
-	('fsl,mpc8610-ssi', 'fsl,imx51-ssi', 'fsl,imx35-ssi', 'fsl,imx21-ssi') : 'OTHER',	
-	('fsl,imx-audio-ac97', 'fsl,imx-audio-cs42888', 'fsl,imx-audio-cs427x', 'fsl,imx-audio-tlv320aic32x4', 'fsl,imx-audio-sgtl5000', 'fsl,imx-audio-wm8962', 'fsl,imx-audio-wm8960', 'fsl,imx-audio-mqs', 'fsl,imx-audio-wm8524', 'fsl,imx-audio-si476x') : 'OTHER',	
-	('eukrea,asoc-tlv320',) : 'OTHER',	
-	('fsl,mpc5200-psc-ac97', 'fsl,mpc5200b-psc-ac97') : 'OTHER',	
-	('fsl,imx8mm-micfil',) : 'OTHER',	
-	('fsl,imx-audio-hdmi', 'fsl,imx-audio-sii902x') : 'OTHER',	
-	('fsl,imx35-spdif', 'fsl,vf610-spdif', 'fsl,imx6sx-spdif', 'fsl,imx8qm-spdif') : 'OTHER',	
-	('fsl,imx-audio-es8328',) : 'OTHER',	
-	('fsl,imx-audio-sgtl5000',) : 'OTHER',	
-	('phytec,pcm030-audio-fabric',) : 'OTHER',	
-	('fsl,imx8qm-audmix',) : 'OTHER',	
-	('fsl,imx8qm-mqs', 'fsl,imx6sx-mqs') : 'OTHER',	
-	('fsl,imx8mp-xcvr',) : 'OTHER',	
-	('fsl,imx8mn-easrc',) : 'OTHER',	
-	('fsl,vf610-sai', 'fsl,imx6sx-sai', 'fsl,imx6ul-sai', 'fsl,imx7ulp-sai', 'fsl,imx8mq-sai', 'fsl,imx8qm-sai') : 'OTHER',	
-	('marvell,mmp-sspa',) : 'OTHER',	
-	('marvell,pxa250-ac97', 'marvell,pxa270-ac97', 'marvell,pxa300-ac97') : 'OTHER',	
-	('mrvl,pxa-ssp-dai',) : 'OTHER',	
-	('xlnx,i2s-transmitter-1.0', 'xlnx,i2s-receiver-1.0') : 'OTHER',	
-	('xlnx,audio-formatter-1.0',) : 'OTHER',	
-	('xlnx,spdif-2.0',) : 'OTHER',	
-	('snps,designware-i2s',) : 'OTHER',	
-	('google,sc7180-trogdor', 'google,sc7180-coachz') : 'OTHER',	
-	('qcom,q6adm-routing',) : 'OTHER',	
-	('qcom,q6afe-clocks',) : 'OTHER',	
-	('qcom,q6afe',) : 'OTHER',	
-	('qcom,q6asm',) : 'OTHER',	
-	('qcom,q6core',) : 'OTHER',	
-	('qcom,q6asm-dais',) : 'OTHER',	
-	('qcom,q6adm',) : 'OTHER',	
-	('qcom,q6afe-dais',) : 'OTHER',	
-	('qcom,apq8016-sbc-sndcard',) : 'OTHER',	
-	('qcom,sc7180-lpass-cpu',) : 'OTHER',	
-	('qcom,sm8250-sndcard', 'qcom,qrb5165-rb5-sndcard') : 'OTHER',	
-	('qcom,lpass-cpu',) : 'OTHER',	
-	('qcom,sdm845-sndcard', 'qcom,db845c-sndcard', 'lenovo,yoga-c630-sndcard') : 'OTHER',	
-	('qcom,apq8096-sndcard',) : 'OTHER',	
-	('google,storm-audio',) : 'OTHER',	
-	('qcom,lpass-cpu-apq8016',) : 'OTHER',	
-	('SUNW,CS4231',) : 'OTHER',	
-	('silead,gsl1680', 'silead,gsl1688', 'silead,gsl3670', 'silead,gsl3675', 'silead,gsl3692') : 'input/touchscreen',	
-	('raspberrypi,firmware-ts',) : 'input/touchscreen',	
-	('fsl,imx25-tcq',) : 'input/touchscreen',	
-	('zinitix,bt541',) : 'input/touchscreen',	
-	('neonode,zforce',) : 'input/touchscreen',	
-	('melfas,',) : 'input/touchscreen',	
-	('raydium,rm32380',) : 'input/touchscreen',	
-	('ti,tsc2046', 'ti,ads7843', 'ti,ads7845', 'ti,ads7846', 'ti,ads7873') : 'input/touchscreen',	
-	('semtech,sx8650', 'semtech,sx8654', 'semtech,sx8655', 'semtech,sx8656') : 'input/touchscreen',	
-	('ti,tsc2004',) : 'input/touchscreen',	
-	('ti,tsc2005',) : 'input/touchscreen',	
-	('resistive-adc-touch',) : 'input/touchscreen',	
-	('nxp,lpc3220-tsc',) : 'input/touchscreen',	
-	('maxim,max11801',) : 'input/touchscreen',	
-	('st,stmfts',) : 'input/touchscreen',	
-	('sis,9200-ts',) : 'input/touchscreen',	
-	('atmel,maxtouch', 'atmel,qt602240_ts', 'atmel,atmel_mxt_ts', 'atmel,atmel_mxt_tp', 'atmel,mXT224') : 'input/touchscreen',	
-	('elan,ekth3500',) : 'input/touchscreen',	
-	('brcm,iproc-touchscreen',) : 'input/touchscreen',	
-	('azoteq,iqs550', 'azoteq,iqs572', 'azoteq,iqs525') : 'input/touchscreen',	
-	('adi,ad7879',) : 'input/touchscreen',	
-	('samsung,s6sy761',) : 'input/touchscreen',	
-	('elan,ektf2127', 'elan,ektf2132') : 'input/touchscreen',	
-	('adi,ad7879-1',) : 'input/touchscreen',	
-	('toradex,vf50-touchscreen',) : 'input/touchscreen',	
-	('pixcir,pixcir_ts', 'pixcir,pixcir_tangoc') : 'input/touchscreen',	
-	('ti,am3359-tsc',) : 'input/touchscreen',	
-	('fsl,imx6ul-tsc',) : 'input/touchscreen',	
-	('melfas,mms114', 'melfas,mms152', 'melfas,mms345l') : 'input/touchscreen',	
-	('st,stmpe-ts',) : 'input/touchscreen',	
-	('technologic,ts4800-ts',) : 'input/touchscreen',	
-	('allwinner,sun4i-a10-ts', 'allwinner,sun5i-a13-ts', 'allwinner,sun6i-a31-ts') : 'mfd',	
-	('goodix,gt1151', 'goodix,gt5663', 'goodix,gt5688', 'goodix,gt911', 'goodix,gt9110', 'goodix,gt912', 'goodix,gt9147', 'goodix,gt917s', 'goodix,gt927', 'goodix,gt9271', 'goodix,gt928', 'goodix,gt9286', 'goodix,gt967') : 'input/touchscreen',	
-	('sitronix,st1232', 'sitronix,st1633') : 'input/touchscreen',	
-	('hideep,hideep-ts',) : 'input/touchscreen',	
-	('zeitec,zet6223',) : 'input/touchscreen',	
-	('eeti,egalax_ts',) : 'input/touchscreen',	
-	('rohm,bu21029',) : 'input/touchscreen',	
-	('microchip,ar1021-i2c',) : 'input/touchscreen',	
-	('edt,edt-ft5206', 'edt,edt-ft5306', 'edt,edt-ft5406', 'edt,edt-ft5506', 'evervision,ev-ft5726', 'focaltech,ft6236') : 'input/touchscreen',	
-	('chipone,icn8318',) : 'input/touchscreen',	
-	('eeti,exc3000', 'eeti,exc80h60', 'eeti,exc80h84') : 'input/touchscreen',	
-	('cypress,cy8ctma140',) : 'input/touchscreen',	
-	('eeti,exc3000-i2c',) : 'input/touchscreen',	
-	('auo,auo_pixcir_ts',) : 'input/touchscreen',	
-	('ti,tsc2007',) : 'input/touchscreen',	
-	('ilitek,ili210x', 'ilitek,ili2117', 'ilitek,ili2120', 'ilitek,ili251x') : 'input/touchscreen',	
-	('adc-joystick',) : 'input/joystick',	
-	('syna,rmi4-i2c',) : 'input/rmi4',	
-	('syna,rmi4-spi',) : 'input/rmi4',	
-	('xlnx,xps-ps2-1.00.a',) : 'input/serio',	
-	('olpc,ap-sp',) : 'input/serio',	
-	('allwinner,sun4i-a10-ps2',) : 'input/serio',	
-	('ps2-gpio',) : 'input/serio',	
-	('snps,arc_ps2',) : 'input/serio',	
-	('ALTR,ps2-1.0', 'altr,ps2-1.0') : 'input/serio',	
-	('gpio-mouse',) : 'input/mouse',	
-	('elan,ekth3000',) : 'input/mouse',	
-	('synaptics,synaptics_i2c',) : 'input/mouse',	
-	('cypress,cyapa',) : 'input/mouse',	
-	('ettus,e3x0-button',) : 'input/misc',	
-	('ti,tps65217-pwrbutton', 'ti,tps65218-pwrbutton') : 'input/misc',	
-	('zii,rave-sp-pwrbutton',) : 'input/misc',	
-	('dlg,da7280',) : 'input/misc',	
-	('ti,drv2667',) : 'input/misc',	
-	('dlg,da9063-onkey', 'dlg,da9062-onkey') : 'input/misc',	
-	('ti,palmas-pwrbutton',) : 'input/misc',	
-	('maxim,max77650-onkey',) : 'input/misc',	
-	('st,stpmic1-onkey',) : 'input/misc',	
-	('atmel,captouch',) : 'input/misc',	
-	('sirf,prima2-pwrc',) : 'input/misc',	
-	('stericsson,ab8500-ponkey',) : 'input/misc',	
-	('motorola,cpcap-pwrbutton',) : 'input/misc',	
-	('ti,twl4030-pwrbutton',) : 'input/misc',	
-	('azoteq,iqs269a',) : 'input/misc',	
-	('qcom,pm8058-pwrkey', 'qcom,pm8921-pwrkey') : 'input/misc',	
-	('fsl,mma8450',) : 'input/misc',	
-	('ti,drv2665',) : 'input/misc',	
-	('gpio-vibrator',) : 'input/misc',	
-	('gpio-decoder',) : 'input/misc',	
-	('qcom,pm8941-pwrkey', 'qcom,pm8941-resin') : 'input/misc',	
-	('ti,drv2604', 'ti,drv2604l', 'ti,drv2605', 'ti,drv2605l') : 'input/misc',	
-	('sprd,sc2721-vibrator', 'sprd,sc2730-vibrator', 'sprd,sc2731-vibrator') : 'input/misc',	
-	('SUNW,bbc-beep', 'SUNW,smbus-beep') : 'input/misc',	
-	('rotary-encoder',) : 'input/misc',	
-	('pwm-beeper',) : 'input/misc',	
-	('regulator-haptic',) : 'input/misc',	
-	('dell,wyse-ariel-ec-input',) : 'input/misc',	
-	('adi,adxl345', 'adi,adxl34x') : 'input/misc',	
-	('pwm-vibrator',) : 'input/misc',	
-	('qcom,pm8058-vib', 'qcom,pm8921-vib', 'qcom,pm8916-vib') : 'input/misc',	
-	('marvell,pxa27x-keypad',) : 'input/keyboard',	
-	('fsl,imx21-kpp',) : 'input/keyboard',	
-	('st,spear300-kbd',) : 'input/keyboard',	
-	('fsl,sec-v4.0-pwrkey',) : 'input/keyboard',	
-	('adc-keys',) : 'input/keyboard',	
-	('brcm,bcm-keypad',) : 'input/keyboard',	
-	('qcom,pm8058-keypad', 'qcom,pm8921-keypad') : 'input/keyboard',	
-	('microchip,qt1050',) : 'input/keyboard',	
-	('google,goldfish-events-keypad',) : 'input/keyboard',	
-	('dlink,dir685-touchkeys',) : 'input/keyboard',	
-	('ti,tca8418',) : 'input/keyboard',	
-	('ti,twl4030-keypad',) : 'input/keyboard',	
-	('gpio-keys',) : 'input/keyboard',	
-	('st,sti-keyscan',) : 'input/keyboard',	
-	('fsl,mpr121-touchkey',) : 'input/keyboard',	
-	('nxp,lpc3220-key',) : 'input/keyboard',	
-	('allwinner,sun4i-a10-lradc-keys', 'allwinner,sun8i-a83t-r-lradc') : 'input/keyboard',	
-	('fsl,imx-sc-key',) : 'input/keyboard',	
-	('cirrus,ep7209-keypad',) : 'input/keyboard',	
-	('gpio-matrix-keypad',) : 'input/keyboard',	
-	('nvidia,tegra114-kbc', 'nvidia,tegra30-kbc', 'nvidia,tegra20-kbc') : 'input/keyboard',	
-	('gpio-keys-polled',) : 'input/keyboard',	
-	('mediatek,mt6397-keys', 'mediatek,mt6323-keys') : 'input/keyboard',	
-	('samsung,s3c6410-keypad', 'samsung,s5pv210-keypad') : 'input/keyboard',	
-	('qt1070',) : 'input/keyboard',	
-	('ti,omap4-keypad',) : 'input/keyboard',	
-	('cypress,tm2-touchkey', 'cypress,midas-touchkey', 'cypress,aries-touchkey', 'coreriver,tc360-touchkey') : 'input/keyboard',	
-	('google,cros-ec-keyb',) : 'input/keyboard',	
-	('ti,nspire-keypad',) : 'input/keyboard',	
-	('microchip,cap1106', 'microchip,cap1126', 'microchip,cap1188') : 'input/keyboard',	
-	('st,spear1310-miphy',) : 'phy',	
-	('st,miphy28lp-phy',) : 'phy',	
-	('st,spear1340-miphy',) : 'phy',	
-	('st,stih407-usb2-phy',) : 'phy',	
-	('st,stm32mp1-usbphyc',) : 'phy',	
-	('intel,lgm-usb-phy',) : 'phy',	
-	('ingenic,jz4770-phy', 'ingenic,jz4775-phy', 'ingenic,jz4780-phy', 'ingenic,x1000-phy', 'ingenic,x1830-phy', 'ingenic,x2000-phy') : 'phy',	
-	('mscc,vsc7514-serdes',) : 'phy',	
-	('hisilicon,hi6220-usb-phy',) : 'phy',	
-	('hisilicon,hi3660-usb-phy',) : 'phy',	
-	('hisilicon,hix5hd2-sata-phy',) : 'phy',	
-	('hisilicon,hi3798cv200-combphy',) : 'phy',	
-	('hisilicon,inno-usb2-phy', 'hisilicon,hi3798cv200-usb2-phy') : 'phy',	
-	('motorola,cpcap-usb-phy', 'motorola,mapphone-cpcap-usb-phy') : 'phy',	
-	('motorola,mapphone-mdm6600',) : 'phy',	
-	('samsung,exynos5250-sata-phy',) : 'phy',	
-	('samsung,exynos5250-usbdrd-phy', 'samsung,exynos5420-usbdrd-phy', 'samsung,exynos5433-usbdrd-phy', 'samsung,exynos7-usbdrd-phy') : 'phy',	
-	('samsung,exynos7-ufs-phy',) : 'phy',	
-	('samsung,s5pv210-mipi-video-phy', 'samsung,exynos5420-mipi-video-phy', 'samsung,exynos5433-mipi-video-phy') : 'phy',	
-	('samsung,exynos3250-usb2-phy', 'samsung,exynos4210-usb2-phy', 'samsung,exynos4x12-usb2-phy', 'samsung,exynos5250-usb2-phy', 'samsung,exynos5420-usb2-phy', 'samsung,s5pv210-usb2-phy') : 'phy',	
-	('samsung,exynos5433-pcie-phy',) : 'phy',	
-	('samsung,exynos5250-dp-video-phy', 'samsung,exynos5420-dp-video-phy') : 'phy',	
-	('img,pistachio-usb-phy',) : 'phy',	
-	('nxp,lpc1850-usb-otg-phy',) : 'phy',	
-	('ti,j721e-wiz-16g', 'ti,j721e-wiz-10g') : 'phy',	
-	('ti,omap-usb2', 'ti,omap5-usb2', 'ti,dra7x-usb2', 'ti,dra7x-usb2-phy2', 'ti,am437x-usb2', 'ti,am654-usb2') : 'phy',	
-	('ti,dm8168-usb-phy',) : 'phy',	
-	('ti,twl4030-usb',) : 'phy',	
-	('ti,da830-usb-phy',) : 'phy',	
-	('ti,phy-am654-serdes',) : 'phy',	
-	('ti,phy-usb3', 'ti,omap-usb3', 'ti,phy-pipe3-sata', 'ti,phy-pipe3-pcie') : 'phy',	
-	('ti,control-phy-otghs', 'ti,control-phy-usb2', 'ti,control-phy-pipe3', 'ti,control-phy-pcie', 'ti,control-phy-usb2-dra7', 'ti,control-phy-usb2-am437') : 'phy',	
-	('apm,xgene-phy',) : 'phy',	
-	('lantiq,vrx200-pcie-phy', 'lantiq,arx300-pcie-phy') : 'phy',	
-	('lantiq,ase-usb2-phy', 'lantiq,danube-usb2-phy', 'lantiq,xrx100-usb2-phy', 'lantiq,xrx200-usb2-phy', 'lantiq,xrx300-usb2-phy') : 'phy',	
-	('allwinner,sun50i-h6-usb3-phy',) : 'phy',	
-	('allwinner,sun4i-a10-usb-phy', 'allwinner,sun5i-a13-usb-phy', 'allwinner,sun6i-a31-usb-phy', 'allwinner,sun7i-a20-usb-phy', 'allwinner,sun8i-a23-usb-phy', 'allwinner,sun8i-a33-usb-phy', 'allwinner,sun8i-a83t-usb-phy', 'allwinner,sun8i-h3-usb-phy', 'allwinner,sun8i-r40-usb-phy', 'allwinner,sun8i-v3s-usb-phy', 'allwinner,sun50i-a64-usb-phy', 'allwinner,sun50i-h6-usb-phy') : 'phy',	
-	('allwinner,sun9i-a80-usb-phy',) : 'phy',	
-	('allwinner,sun6i-a31-mipi-dphy',) : 'phy',	
-	('fsl,imx8mq-usb-phy', 'fsl,imx8mp-usb-phy') : 'phy',	
-	('fsl,imx8mq-mipi-dphy',) : 'phy',	
-	('ralink,rt3352-usbphy', 'mediatek,mt7620-usbphy', 'mediatek,mt7628-usbphy') : 'phy',	
-	('mediatek,mt7621-pci-phy',) : 'phy',	
-	('marvell,armada-380-comphy',) : 'phy',	
-	('marvell,mvebu-sata-phy',) : 'phy',	
-	('marvell,mmp2-usb-phy', 'marvell,pxa910-usb-phy', 'marvell,pxa168-usb-phy') : 'phy',	
-	('marvell,pxa1928-usb-phy',) : 'phy',	
-	('marvell,pxa1928-hsic-phy',) : 'phy',	
-	('marvell,berlin2-usb-phy', 'marvell,berlin2cd-usb-phy') : 'phy',	
-	('marvell,mmp3-hsic-phy',) : 'phy',	
-	('marvell,a3700-utmi-otg-phy', 'marvell,a3700-utmi-host-phy') : 'phy',	
-	('marvell,armada-375-usb-cluster',) : 'phy',	
-	('marvell,comphy-cp110',) : 'phy',	
-	('marvell,berlin2-sata-phy', 'marvell,berlin2q-sata-phy') : 'phy',	
-	('marvell,comphy-a3700',) : 'phy',	
-	('marvell,mmp3-usb-phy',) : 'phy',	
-	('qcom,usb-hs-phy',) : 'phy',	
-	('qcom,usb-hs-28nm-femtophy',) : 'phy',	
-	('qcom,ipq806x-usb-phy-hs', 'qcom,ipq806x-usb-phy-ss') : 'phy',	
-	('qcom,usb-hsic-phy',) : 'phy',	
-	('qca,ar7100-usb-phy',) : 'phy',	
-	('qcom,usb-hs-ipq4019-phy', 'qcom,usb-ss-ipq4019-phy') : 'phy',	
-	('qcom,apq8064-sata-phy',) : 'phy',	
-	('qcom,usb-ss-28nm-phy',) : 'phy',	
-	('qcom,ipq806x-sata-phy',) : 'phy',	
-	('qcom,ipq8074-qmp-usb3-phy', 'qcom,msm8996-qmp-pcie-phy', 'qcom,msm8996-qmp-ufs-phy', 'qcom,msm8996-qmp-usb3-phy', 'qcom,msm8998-qmp-pcie-phy', 'qcom,msm8998-qmp-ufs-phy', 'qcom,ipq8074-qmp-pcie-phy', 'qcom,sc7180-qmp-usb3-phy', 'qcom,sc7180-qmp-usb3-dp-phy', 'qcom,sdm845-qhp-pcie-phy', 'qcom,sdm845-qmp-pcie-phy', 'qcom,sdm845-qmp-usb3-phy', 'qcom,sdm845-qmp-usb3-uni-phy', 'qcom,sdm845-qmp-ufs-phy', 'qcom,msm8998-qmp-usb3-phy', 'qcom,sm8150-qmp-ufs-phy', 'qcom,sm8250-qmp-ufs-phy', 'qcom,sm8150-qmp-usb3-phy', 'qcom,sm8150-qmp-usb3-uni-phy', 'qcom,sm8250-qmp-usb3-phy', 'qcom,sm8250-qmp-usb3-uni-phy', 'qcom,sm8250-qmp-gen3x1-pcie-phy', 'qcom,sm8250-qmp-gen3x2-pcie-phy', 'qcom,sm8250-qmp-modem-pcie-phy', 'qcom,sc7180-qmp-usb3-dp-phy') : 'phy',	
-	('qcom,pcie2-phy',) : 'phy',	
-	('intel,keembay-emmc-phy',) : 'phy',	
-	('intel,keembay-usb-phy',) : 'phy',	
-	('intel,combo-phy', 'intel,combophy-lgm') : 'phy',	
-	('intel,lgm-emmc-phy',) : 'phy',	
-	('nvidia,tegra194-p2u',) : 'phy',	
-	('nvidia,tegra124-xusb-padctl', 'nvidia,tegra210-xusb-padctl', 'nvidia,tegra186-xusb-padctl', 'nvidia,tegra194-xusb-padctl') : 'phy',	
-	('brcm,bcm7216-usb-phy', 'brcm,bcm7211-usb-phy', 'brcm,brcmstb-usb-phy') : 'phy',	
-	('brcm,iproc-nsp-sata-phy',) : 'phy',	
-	('brcm,ns-usb2-phy',) : 'phy',	
-	('brcm,ns-ax-usb3-phy', 'brcm,ns-bx-usb3-phy') : 'phy',	
-	('brcm,kona-usb2-phy',) : 'phy',	
-	('brcm,sr-pcie-phy',) : 'phy',	
-	('brcm,bcm6318-usbh-phy', 'brcm,bcm6328-usbh-phy', 'brcm,bcm6358-usbh-phy', 'brcm,bcm6362-usbh-phy', 'brcm,bcm6368-usbh-phy', 'brcm,bcm63268-usbh-phy') : 'phy',	
-	('brcm,cygnus-pcie-phy',) : 'phy',	
-	('brcm,sr-usb-combo-phy', 'brcm,sr-usb-hs-phy') : 'phy',	
-	('brcm,ns2-drd-phy',) : 'phy',	
-	('brcm,ns2-pcie-phy',) : 'phy',	
-	('socionext,uniphier-pxs2-ahci-phy', 'socionext,uniphier-pxs3-ahci-phy') : 'phy',	
-	('socionext,uniphier-pro5-usb3-hsphy', 'socionext,uniphier-pxs2-usb3-hsphy', 'socionext,uniphier-ld20-usb3-hsphy', 'socionext,uniphier-pxs3-usb3-hsphy') : 'phy',	
-	('socionext,uniphier-pro4-usb3-ssphy', 'socionext,uniphier-pro5-usb3-ssphy', 'socionext,uniphier-pxs2-usb3-ssphy', 'socionext,uniphier-ld20-usb3-ssphy', 'socionext,uniphier-pxs3-usb3-ssphy') : 'phy',	
-	('socionext,uniphier-pro4-usb2-phy', 'socionext,uniphier-ld11-usb2-phy') : 'phy',	
-	('socionext,uniphier-pro5-pcie-phy', 'socionext,uniphier-ld20-pcie-phy', 'socionext,uniphier-pxs3-pcie-phy') : 'phy',	
-	('mediatek,mt2701-u3phy', 'mediatek,mt2712-u3phy', 'mediatek,mt8173-u3phy', 'mediatek,generic-tphy-v1', 'mediatek,generic-tphy-v2') : 'phy',	
-	('mediatek,mt2701-hdmi-phy', 'mediatek,mt8173-hdmi-phy') : 'phy',	
-	('mediatek,mt8183-ufsphy',) : 'phy',	
-	('mediatek,xsphy',) : 'phy',	
-	('mediatek,mt2701-mipi-tx', 'mediatek,mt8173-mipi-tx', 'mediatek,mt8183-mipi-tx') : 'phy',	
-	('rockchip,rk3066a-usb-phy', 'rockchip,rk3188-usb-phy', 'rockchip,rk3288-usb-phy') : 'phy',	
-	('rockchip,px30-usb2phy', 'rockchip,rk3228-usb2phy', 'rockchip,rk3328-usb2phy', 'rockchip,rk3366-usb2phy', 'rockchip,rk3399-usb2phy', 'rockchip,rv1108-usb2phy') : 'phy',	
-	('rockchip,rk3399-pcie-phy',) : 'phy',	
-	('rockchip,rk3399-mipi-dphy-rx0',) : 'phy',	
-	('rockchip,rk3399-emmc-phy',) : 'phy',	
-	('rockchip,px30-dsi-dphy', 'rockchip,rk3128-dsi-dphy', 'rockchip,rk3368-dsi-dphy') : 'phy',	
-	('rockchip,rk3399-typec-phy',) : 'phy',	
-	('rockchip,rk3228-hdmi-phy', 'rockchip,rk3328-hdmi-phy') : 'phy',	
-	('rockchip,rk3288-dp-phy',) : 'phy',	
-	('cdns,dphy',) : 'phy',	
-	('cdns,torrent-phy', 'ti,j721e-serdes-10g') : 'phy',	
-	('cdns,sierra-phy-t0', 'ti,sierra-phy-t0') : 'phy',	
-	('nxp,salvo-phy',) : 'phy',	
-	('xlnx,zynqmp-psgtr', 'xlnx,zynqmp-psgtr-v1.1') : 'phy',	
-	('amlogic,meson-gxl-usb2-phy',) : 'phy',	
-	('amlogic,axg-pcie-phy',) : 'phy',	
-	('amlogic,g12a-usb2-phy', 'amlogic,a1-usb2-phy') : 'phy',	
-	('amlogic,axg-mipi-pcie-analog-phy',) : 'phy',	
-	('amlogic,axg-mipi-dphy',) : 'phy',	
-	('amlogic,g12a-usb3-pcie-phy',) : 'phy',	
-	('amlogic,meson8-usb2-phy', 'amlogic,meson8b-usb2-phy', 'amlogic,meson8m2-usb2-phy', 'amlogic,meson-gxbb-usb2-phy') : 'phy',	
-	('renesas,usb-phy-r8a77470', 'renesas,usb-phy-r8a7790', 'renesas,usb-phy-r8a7791', 'renesas,usb-phy-r8a7794', 'renesas,rcar-gen2-usb-phy') : 'phy',	
-	('renesas,r8a77980-pcie-phy',) : 'phy',	
-	('renesas,rcar-gen3-usb3-phy',) : 'phy',	
-	('renesas,usb2-phy-r8a77470', 'renesas,usb2-phy-r8a7795', 'renesas,usb2-phy-r8a7796', 'renesas,usb2-phy-r8a77965', 'renesas,rcar-gen3-usb2-phy') : 'phy',	
-	('apm,xgene-reboot',) : 'power/reset',	
-	('zte,sysctrl',) : 'power/reset',	
-	('gpio-poweroff',) : 'power/reset',	
-	('syscon-reboot',) : 'power/reset',	
-	('lsi,axm55xx-reset',) : 'power/reset',	
-	('st,stih407-restart',) : 'power/reset',	
-	('syscon-poweroff',) : 'power/reset',	
-	('atmel,sama5d2-shdwc', 'microchip,sam9x60-shdwc', 'atmel,sama5d2-pmc', 'microchip,sam9x60-pmc') : 'power/reset',	
-	('hisilicon,sysctrl',) : 'power/reset',	
-	('qcom,pm8916-pon', 'qcom,pms405-pon', 'qcom,pm8998-pon') : 'power/reset',	
-	('restart-poweroff',) : 'power/reset',	
-	('qcom,pshold',) : 'power/reset',	
-	('ti,keystone-reset',) : 'power/reset',	
-	('arm,core-module-integrator', 'arm,core-module-versatile', 'arm,realview-eb-syscon', 'arm,realview-pb1176-syscon', 'arm,realview-pb11mp-syscon', 'arm,realview-pba8-syscon', 'arm,realview-pbx-syscon') : 'power/reset',	
-	('buffalo,ls421d', 'buffalo,ls421de') : 'power/reset',	
-	('mediatek,mt6323-pwrc',) : 'power/reset',	
-	('mscc,jaguar2-chip-reset', 'mscc,luton-chip-reset', 'mscc,ocelot-chip-reset', 'microchip,sparx5-chip-reset') : 'power/reset',	
-	('lltc,ltc2952',) : 'power/reset',	
-	('oxsemi,ox820-sys-ctrl',) : 'power/reset',	
-	('cortina,gemini-power-controller',) : 'power/reset',	
-	('arm,vexpress-reset', 'arm,vexpress-shutdown', 'arm,vexpress-reboot') : 'power/reset',	
-	('atmel,at91sam9260-sdramc', 'atmel,at91sam9g45-ddramc', 'atmel,at91sam9260-rstc', 'atmel,at91sam9g45-rstc', 'atmel,sama5d3-rstc', 'atmel,samx7-rstc', 'microchip,sam9x60-rstc') : 'power/reset',	
-	('qnap,power-off', 'synology,power-off') : 'power/reset',	
-	('brcm,bcm21664-resetmgr',) : 'power/reset',	
-	('regulator-poweroff',) : 'power/reset',	
-	('brcm,brcmstb-reboot', 'brcm,bcm7038-reboot') : 'power/reset',	
-	('nvmem-reboot-mode',) : 'power/reset',	
-	('syscon-reboot-mode',) : 'power/reset',	
-	('atmel,at91sam9260-shdwc', 'atmel,at91sam9rl-shdwc', 'atmel,at91sam9x5-shdwc') : 'power/reset',	
-	('gpio-restart',) : 'power/reset',	
-	('renesas,sysc-rmobile',) : 'power/reset',	
-	('richtek,rt9455',) : 'power/supply',	
-	('maxim,max14577-charger', 'maxim,max77836-charger') : 'power/supply',	
-	('ti,bq24150', 'ti,bq24150a', 'ti,bq24151', 'ti,bq24151a', 'ti,bq24152', 'ti,bq24153', 'ti,bq24153a', 'ti,bq24155', 'ti,bq24156', 'ti,bq24156a', 'ti,bq24157s', 'ti,bq24158') : 'power/supply',	
-	('qcom,pm8941-charger',) : 'power/supply',	
-	('maxim,max14656',) : 'power/supply',	
-	('ti,bq27200', 'ti,bq27210', 'ti,bq27500', 'ti,bq27510', 'ti,bq27520', 'ti,bq27500-1', 'ti,bq27510g1', 'ti,bq27510g2', 'ti,bq27510g3', 'ti,bq27520g1', 'ti,bq27520g2', 'ti,bq27520g3', 'ti,bq27520g4', 'ti,bq27521', 'ti,bq27530', 'ti,bq27531', 'ti,bq27541', 'ti,bq27542', 'ti,bq27546', 'ti,bq27742', 'ti,bq27545', 'ti,bq27411', 'ti,bq27421', 'ti,bq27425', 'ti,bq27426', 'ti,bq27441', 'ti,bq27621', 'ti,bq27z561', 'ti,bq28z610', 'ti,bq34z100') : 'power/supply',	
-	('ingenic,jz4740-battery',) : 'power/supply',	
-	('sbs,sbs-charger',) : 'power/supply',	
-	('ti,bq25890', 'ti,bq25892', 'ti,bq25895', 'ti,bq25896') : 'power/supply',	
-	('sprd,sc2731-charger',) : 'power/supply',	
-	('maxim,ds2760',) : 'power/supply',	
-	('sbs,sbs-battery', 'ti,bq20z65', 'ti,bq20z75') : 'power/supply',	
-	('stericsson,ab8500-chargalg',) : 'power/supply',	
-	('lltc,ltc3651-charger', 'lltc,lt3651-charger') : 'power/supply',	
-	('x-powers,axp202-ac-power-supply', 'x-powers,axp221-ac-power-supply', 'x-powers,axp813-ac-power-supply') : 'power/supply',	
-	('microchip,ucs1002',) : 'power/supply',	
-	('maxim,max17040', 'maxim,max17041', 'maxim,max17043', 'maxim,max77836-battery', 'maxim,max17044', 'maxim,max17048', 'maxim,max17049', 'maxim,max17058', 'maxim,max17059') : 'power/supply',	
-	('ti,bq25980', 'ti,bq25975', 'ti,bq25960') : 'power/supply',	
-	('sprd,sc2731-fgu',) : 'power/supply',	
-	('ti,bq24735',) : 'power/supply',	
-	('mps,mp2629_charger',) : 'power/supply',	
-	('google,goldfish-battery',) : 'power/supply',	
-	('ti,bq24250', 'ti,bq24251', 'ti,bq24257') : 'power/supply',	
-	('x-powers,axp202-usb-power-supply', 'x-powers,axp221-usb-power-supply', 'x-powers,axp223-usb-power-supply', 'x-powers,axp813-usb-power-supply') : 'power/supply',	
-	('ti,tps65090-charger',) : 'power/supply',	
-	('lltc,ltc2941', 'lltc,ltc2942', 'lltc,ltc2943', 'lltc,ltc2944') : 'power/supply',	
-	('olpc,xo1-battery', 'olpc,xo1.5-battery') : 'power/supply',	
-	('maxim,max77650-charger',) : 'power/supply',	
-	('ti,twl4030-bci',) : 'power/supply',	
-	('x-powers,axp209-battery-power-supply', 'x-powers,axp221-battery-power-supply', 'x-powers,axp813-battery-power-supply') : 'power/supply',	
-	('nxp,isp1704', 'nxp,isp1707') : 'power/supply',	
-	('stericsson,ab8500-charger',) : 'power/supply',	
-	('motorola,mapphone-cpcap-charger',) : 'power/supply',	
-	('stericsson,ab8500-fg',) : 'power/supply',	
-	('nokia,n900-battery',) : 'power/supply',	
-	('motorola,cpcap-battery',) : 'power/supply',	
-	('maxim,max8903',) : 'power/supply',	
-	('ti,tps65217-charger',) : 'power/supply',	
-	('cellwise,cw2015',) : 'power/supply',	
-	('summit,smb345', 'summit,smb347', 'summit,smb358') : 'power/supply',	
-	('stericsson,ab8500-btemp',) : 'power/supply',	
-	('rohm,bd99954',) : 'power/supply',	
-	('charger-manager',) : 'power/supply',	
-	('sbs,sbs-manager', 'lltc,ltc1760') : 'power/supply',	
-	('ti,bq25150', 'ti,bq25155') : 'power/supply',	
-	('ti,bq24190', 'ti,bq24192', 'ti,bq24192i', 'ti,bq24196') : 'power/supply',	
-	('lego,ev3-battery',) : 'power/supply',	
-	('gpio-charger',) : 'power/supply',	
-	('ti,lp8727',) : 'power/supply',	
-	('maxim,max17042', 'maxim,max17047', 'maxim,max17050', 'maxim,max17055') : 'power/supply',	
-	('atmel,at91rm9200-tcb', 'atmel,at91sam9x5-tcb', 'atmel,sama5d2-tcb', 'atmel,sama5d3-tcb', 'microchip,tcb-capture') : 'counter',	
-	('ti,am3352-eqep',) : 'counter',	
-	('st,stm32-timer-counter',) : 'counter',	
-	('fsl,ftm-quaddec',) : 'counter',	
-	('st,stm32-lptimer-counter',) : 'counter',	
-	('cdns,gpio-r1p02',) : 'gpio',	
-	('lantiq,gpio-stp-xway',) : 'gpio',	
-	('nvidia,tegra210-gpio', 'nvidia,tegra30-gpio', 'nvidia,tegra20-gpio') : 'gpio',	
-	('ti,lp3943-gpio',) : 'gpio',	
-	('mediatek,mt7621-gpio',) : 'gpio',	
-	('st,spear-spics-gpio',) : 'gpio',	
-	('sprd,sc9860-eic-debounce', 'sprd,sc9860-eic-latch', 'sprd,sc9860-eic-async', 'sprd,sc9860-eic-sync') : 'gpio',	
-	('sprd,sc9860-gpio',) : 'gpio',	
-	('cznic,moxtet-gpio',) : 'gpio',	
-	('rda,8810pl-gpio',) : 'gpio',	
-	('nintendo,hollywood-gpio',) : 'gpio',	
-	('sprd,sc2731-eic',) : 'gpio',	
-	('aspeed,ast2400-sgpio', 'aspeed,ast2500-sgpio') : 'gpio',	
-	('aspeed,ast2400-gpio', 'aspeed,ast2500-gpio', 'aspeed,ast2600-gpio') : 'gpio',	
-	('ad,gpio-adnp',) : 'gpio',	
-	('kontron,sl28cpld-gpio', 'kontron,sl28cpld-gpi', 'kontron,sl28cpld-gpo') : 'gpio',	
-	('abilis,tb10x-gpio',) : 'gpio',	
-	('mstar,msc313-gpio',) : 'gpio',	
-	('renesas,gpio-r8a7743', 'renesas,gpio-r8a7790', 'renesas,gpio-r8a7791', 'renesas,gpio-r8a7792', 'renesas,gpio-r8a7793', 'renesas,gpio-r8a7794', 'renesas,gpio-r8a7795', 'renesas,gpio-r8a7796', 'renesas,rcar-gen1-gpio', 'renesas,rcar-gen2-gpio', 'renesas,rcar-gen3-gpio', 'renesas,gpio-rcar') : 'gpio',	
-	('atmel,sama5d2-secumod',) : 'gpio',	
-	('adi,',) : 'gpio',	
-	('brcm,kona-gpio',) : 'gpio',	
-	('raspberrypi,firmware-gpio',) : 'gpio',	
-	('qcom,wcd9340-gpio', 'qcom,wcd9341-gpio') : 'gpio',	
-	('xlnx,zynq-gpio-1.0', 'xlnx,zynqmp-gpio-1.0', 'xlnx,versal-gpio-1.0', 'xlnx,pmc-gpio-1.0') : 'gpio',	
-	('nxp,pca6416', 'nxp,pca9505', 'nxp,pca9534', 'nxp,pca9535', 'nxp,pca9536', 'nxp,pca9537', 'nxp,pca9538', 'nxp,pca9539', 'nxp,pca9554', 'nxp,pca9555', 'nxp,pca9556', 'nxp,pca9557', 'nxp,pca9574', 'nxp,pca9575', 'nxp,pca9698', 'nxp,pcal6416', 'nxp,pcal6524', 'nxp,pcal9535', 'nxp,pcal9554b', 'nxp,pcal9555a', 'maxim,max7310', 'maxim,max7312', 'maxim,max7313', 'maxim,max7315', 'maxim,max7318', 'ti,pca6107', 'ti,pca9536', 'ti,tca6408', 'ti,tca6416', 'ti,tca6424', 'ti,tca9539', 'onnn,cat9554', 'onnn,pca9654', 'exar,xra1202') : 'gpio',	
-	('apm,xgene-gpio-sb',) : 'gpio',	
-	('snps,creg-gpio-axs10x', 'snps,creg-gpio-hsdk') : 'gpio',	
-	('maxim,max7319', 'maxim,max7320', 'maxim,max7321', 'maxim,max7322', 'maxim,max7323', 'maxim,max7324', 'maxim,max7325', 'maxim,max7326', 'maxim,max7327') : 'gpio',	
-	('ti,tpic2810',) : 'gpio',	
-	('ti,tps65218-gpio',) : 'gpio',	
-	('ti,omap4-gpio', 'ti,omap3-gpio', 'ti,omap2-gpio') : 'gpio',	
-	('fairchild,74hc595', 'nxp,74lvc594') : 'gpio',	
-	('socionext,uniphier-gpio',) : 'gpio',	
-	('fsl,imx23-gpio', 'fsl,imx28-gpio') : 'gpio',	
-	('fsl,mpc5200-gpio-wkup', 'fsl,mpc5200-gpio') : 'gpio',	
-	('cirrus,ep7209-gpio',) : 'gpio',	
-	('ti,palmas-gpio', 'ti,tps65913-gpio', 'ti,tps65914-gpio', 'ti,tps80036-gpio') : 'gpio',	
-	('gateworks,pld-gpio',) : 'gpio',	
-	('intel,pxa25x-gpio', 'intel,pxa26x-gpio', 'intel,pxa27x-gpio', 'intel,pxa3xx-gpio', 'marvell,pxa93x-gpio', 'marvell,mmp-gpio', 'marvell,mmp2-gpio', 'marvell,pxa1928-gpio') : 'gpio',	
-	('fsl,mpc8349-gpio', 'fsl,mpc8572-gpio', 'fsl,mpc8610-gpio', 'fsl,mpc5121-gpio', 'fsl,mpc5125-gpio', 'fsl,pq3-gpio', 'fsl,ls1028a-gpio', 'fsl,ls1088a-gpio', 'fsl,qoriq-gpio') : 'gpio',	
-	('nxp,lpc3220-gpio',) : 'gpio',	
-	('maxim,max31910', 'maxim,max31911', 'maxim,max31912', 'maxim,max31913', 'maxim,max31953', 'maxim,max31963') : 'gpio',	
-	('snps,dw-apb-gpio', 'apm,xgene-gpio-v2') : 'gpio',	
-	('marvell,orion-gpio', 'marvell,mv78200-gpio', 'marvell,armadaxp-gpio', 'marvell,armada-370-gpio', 'marvell,armada-8k-gpio') : 'gpio',	
-	('exar,xra1403',) : 'gpio',	
-	('ti,keystone-gpio', 'ti,am654-gpio', 'ti,dm6441-gpio') : 'gpio',	
-	('lantiq,gpio-mm',) : 'gpio',	
-	('cavium,octeon-3860-gpio',) : 'gpio',	
-	('fujitsu,mb86s70-gpio',) : 'gpio',	
-	('apm,xgene-gpio',) : 'gpio',	
-	('nxp,lpc1850-gpio',) : 'gpio',	
-	('pisosr-gpio',) : 'gpio',	
-	('netlogic,xlp832-gpio', 'netlogic,xlp316-gpio', 'netlogic,xlp208-gpio', 'netlogic,xlp980-gpio', 'netlogic,xlp532-gpio', 'brcm,vulcan-gpio') : 'gpio',	
-	('nvidia,tegra186-pmc', 'nvidia,tegra194-pmc', 'nvidia,tegra186-gpio', 'nvidia,tegra186-gpio-aon', 'nvidia,tegra194-gpio', 'nvidia,tegra194-gpio-aon') : 'gpio',	
-	('technologic,ts4900-gpio', 'technologic,ts7970-gpio') : 'gpio',	
-	('brcm,brcmstb-gpio',) : 'gpio',	
-	('intel,ixp4xx-gpio',) : 'gpio',	
-	('fsl,imx1-gpio', 'fsl,imx21-gpio', 'fsl,imx31-gpio', 'fsl,imx35-gpio', 'fsl,imx7d-gpio') : 'gpio',	
-	('sifive,gpio0', 'sifive,fu540-c000-gpio') : 'gpio',	
-	('qca,ar7100-gpio', 'qca,ar9340-gpio') : 'gpio',	
-	('altr,pio-1.0',) : 'gpio',	
-	('altr,a10sr-gpio',) : 'gpio',	
-	('fsl,vf610-gpio', 'fsl,imx7ulp-gpio') : 'gpio',	
-	('gpio-mockup',) : 'gpio',	
-	('lsi,zevio-gpio',) : 'gpio',	
-	('xlnx,xps-gpio-1.00.a',) : 'gpio',	
-	('zte,zx296702-gpio',) : 'gpio',	
-	('nxp,pcf8574', 'nxp,pcf8574a', 'nxp,pca8574', 'nxp,pca9670', 'nxp,pca9672', 'nxp,pca9674', 'nxp,pcf8575', 'nxp,pca8575', 'nxp,pca9671', 'nxp,pca9673', 'nxp,pca9675', 'maxim,max7328', 'maxim,max7329') : 'gpio',	
-	('brcm,bcm6345-gpio', 'wd,mbl-gpio', 'ni,169445-nand-gpio') : 'gpio',	
-	('renesas,em-gio',) : 'gpio',	
-	('ti,twl4030-gpio',) : 'gpio',	
-	('brcm,iproc-gpio-cca',) : 'gpio',	
-	('nxp,pca9570',) : 'gpio',	
-	('cortina,gemini-gpio', 'moxa,moxart-gpio', 'faraday,ftgpio010') : 'gpio',	
-	('technologic,ts4800-gpio',) : 'gpio',	
-	('sprd,hwspinlock-r3p0',) : 'hwspinlock',	
-	('sirf,hwspinlock',) : 'hwspinlock',	
-	('ti,omap4-hwspinlock', 'ti,am654-hwspinlock') : 'hwspinlock',	
-	('st,stm32-hwspinlock',) : 'hwspinlock',	
-	('qcom,sfpb-mutex', 'qcom,tcsr-mutex') : 'hwspinlock',	
-	('hisilicon,hns-roce-v1',) : 'infiniband',	
-	('mps,mp5416',) : 'regulator',	
-	('maxim,max8952',) : 'regulator',	
-	('nxp,pf8100', 'nxp,pf8121a', 'nxp,pf8200') : 'regulator',	
-	('st,stw481x-vmmc',) : 'regulator',	
-	('vctrl-regulator',) : 'regulator',	
-	('mediatek,mt6311-regulator',) : 'regulator',	
-	('st,stm32-vrefbuf',) : 'regulator',	
-	('mps,mp8867', 'mps,mp8869') : 'regulator',	
-	('maxim,max8660', 'maxim,max8661') : 'regulator',	
-	('silergy,sy8827n',) : 'regulator',	
-	('google,cros-ec-regulator',) : 'regulator',	
-	('onnn,fan53880',) : 'regulator',	
-	('cirrus,lochnagar2-micvdd', 'cirrus,lochnagar2-mic1vdd', 'cirrus,lochnagar2-mic2vdd', 'cirrus,lochnagar2-vddcore') : 'regulator',	
-	('maxim,max1586',) : 'regulator',	
-	('qcom,vqmmc-ipq4019-regulator',) : 'regulator',	
-	('silergy,sy8106a',) : 'regulator',	
-	('maxim,max8973', 'maxim,max77621') : 'regulator',	
-	('richtek,rt4801',) : 'regulator',	
-	('st,stm32h7-booster', 'st,stm32mp1-booster') : 'regulator',	
-	('microchip,mcp16502',) : 'regulator',	
-	('motorola,cpcap-regulator', 'motorola,mapphone-cpcap-regulator', 'motorola,xoom-cpcap-regulator') : 'regulator',	
-	('qcom,pm8004-regulators', 'qcom,pm8005-regulators', 'qcom,pm8841-regulators', 'qcom,pm8916-regulators', 'qcom,pm8941-regulators', 'qcom,pm8950-regulators', 'qcom,pm8994-regulators', 'qcom,pmi8994-regulators', 'qcom,pm660-regulators', 'qcom,pm660l-regulators', 'qcom,pms405-regulators') : 'regulator',	
-	('st,stpmic1-regulators',) : 'regulator',	
-	('maxim,max77826',) : 'regulator',	
-	('ti,tps62360', 'ti,tps62361', 'ti,tps62362', 'ti,tps62363') : 'regulator',	
-	('ti,lp8720', 'ti,lp8725') : 'regulator',	
-	('fsl,anatop-regulator',) : 'regulator',	
-	('raspberrypi,7inch-touchscreen-panel-regulator',) : 'regulator',	
-	('dlg,da9210',) : 'regulator',	
-	('ams,as3722-regulator',) : 'regulator',	
-	('ti,pbias-omap', 'ti,pbias-omap2', 'ti,pbias-omap3', 'ti,pbias-omap4', 'ti,pbias-omap5', 'ti,pbias-dra7') : 'regulator',	
-	('socionext,uniphier-pro4-usb3-regulator', 'socionext,uniphier-pro5-usb3-regulator', 'socionext,uniphier-pxs2-usb3-regulator', 'socionext,uniphier-ld20-usb3-regulator', 'socionext,uniphier-pxs3-usb3-regulator') : 'regulator',	
-	('qcom,rpm-mp5496-regulators', 'qcom,rpm-pm8841-regulators', 'qcom,rpm-pm8916-regulators', 'qcom,rpm-pm8941-regulators', 'qcom,rpm-pm8950-regulators', 'qcom,rpm-pm8953-regulators', 'qcom,rpm-pm8994-regulators', 'qcom,rpm-pm8998-regulators', 'qcom,rpm-pm660-regulators', 'qcom,rpm-pm660l-regulators', 'qcom,rpm-pma8084-regulators', 'qcom,rpm-pmi8994-regulators', 'qcom,rpm-pmi8998-regulators', 'qcom,rpm-pms405-regulators') : 'regulator',	
-	('ti,tps65020', 'ti,tps65021', 'ti,tps65023') : 'regulator',	
-	('mediatek,mt6397-regulator',) : 'regulator',	
-	('isl,isl9305', 'isil,isl9305', 'isl,isl9305h', 'isil,isl9305h') : 'regulator',	
-	('pwm-regulator',) : 'regulator',	
-	('regulator-gpio',) : 'regulator',	
-	('ti,abb-v1', 'ti,abb-v2', 'ti,abb-v3') : 'regulator',	
-	('lltc,ltc3589', 'lltc,ltc3589-1', 'lltc,ltc3589-2') : 'regulator',	
-	('pvs,pv88090',) : 'regulator',	
-	('arm,vexpress-volt',) : 'regulator',	
-	('ti,tps51632',) : 'regulator',	
-	('pvs,pv88060',) : 'regulator',	
-	('pvs,pv88080', 'pvs,pv88080-aa', 'pvs,pv88080-ba') : 'regulator',	
-	('ti,palmas-pmic', 'ti,twl6035-pmic', 'ti,twl6036-pmic', 'ti,twl6037-pmic', 'ti,tps65913-pmic', 'ti,tps65914-pmic', 'ti,tps80036-pmic', 'ti,tps659038-pmic', 'ti,tps65917-pmic') : 'regulator',	
-	('qcom,rpm-pm8018-regulators', 'qcom,rpm-pm8058-regulators', 'qcom,rpm-pm8901-regulators', 'qcom,rpm-pm8921-regulators', 'qcom,rpm-smb208-regulators') : 'regulator',	
-	('dlg,da9211', 'dlg,da9212', 'dlg,da9213', 'dlg,da9223', 'dlg,da9214', 'dlg,da9224', 'dlg,da9215', 'dlg,da9225') : 'regulator',	
-	('dlg,da9121', 'dlg,da9130', 'dlg,da9217', 'dlg,da9122', 'dlg,da9131', 'dlg,da9220', 'dlg,da9132') : 'regulator',	
-	('qcom,pmi8998-lab-ibb',) : 'regulator',	
-	('richtek,rtmv20',) : 'regulator',	
-	('silergy,sy8824c', 'silergy,sy8824e', 'silergy,sy20276', 'silergy,sy20278') : 'regulator',	
-	('st,stm32mp1,pwr-reg',) : 'regulator',	
-	('mps,mpq7920',) : 'regulator',	
-	('fsl,pfuze100', 'fsl,pfuze200', 'fsl,pfuze3000', 'fsl,pfuze3001') : 'regulator',	
-	('qcom,pm8150b-vbus-reg',) : 'regulator',	
-	('fcs,fan53526', 'fcs,fan53555', 'silergy,syr827', 'silergy,syr828') : 'regulator',	
-	('qcom,pm8005-rpmh-regulators', 'qcom,pm8009-rpmh-regulators', 'qcom,pm8009-1-rpmh-regulators', 'qcom,pm8150-rpmh-regulators', 'qcom,pm8150l-rpmh-regulators', 'qcom,pm8350-rpmh-regulators', 'qcom,pm8350c-rpmh-regulators', 'qcom,pm8998-rpmh-regulators', 'qcom,pmi8998-rpmh-regulators', 'qcom,pm6150-rpmh-regulators', 'qcom,pm6150l-rpmh-regulators', 'qcom,pmx55-rpmh-regulators') : 'regulator',	
-	('nxp,pca9450a', 'nxp,pca9450b', 'nxp,pca9450c') : 'regulator',	
-	('mediatek,mt6380-regulator',) : 'regulator',	
-	('maxim,max77650-regulator',) : 'regulator',	
-	('active-semi,act8600', 'active-semi,act8846', 'active-semi,act8865') : 'regulator',	
-	('regulator-fixed', 'regulator-fixed-clock', 'regulator-fixed-domain') : 'regulator',	
-	('marvell,88pg867', 'marvell,88pg868') : 'regulator',	
-	('lltc,ltc3676',) : 'regulator',	
-	('aspeed,ast2400-sdram-edac', 'aspeed,ast2500-sdram-edac', 'aspeed,ast2600-sdram-edac') : 'edac',	
-	('xlnx,zynq-ddrc-a05', 'xlnx,zynqmp-ddrc-2.40a') : 'edac',	
-	('calxeda,hb-sregs-l2-ecc',) : 'edac',	
-	('calxeda,hb-ddr-ctrl', 'calxeda,ecx-2000-ddr-ctrl') : 'edac',	
-	('altr,sdram-edac', 'altr,sdram-edac-a10', 'altr,socfpga-ecc-manager', 'altr,socfpga-l2-ecc', 'altr,socfpga-ocram-ecc', 'altr,socfpga-a10-l2-ecc', 'altr,socfpga-a10-ocram-ecc', 'altr,socfpga-eth-mac-ecc', 'altr,socfpga-nand-ecc', 'altr,socfpga-dma-ecc', 'altr,socfpga-usb-ecc', 'altr,socfpga-qspi-ecc', 'altr,socfpga-sdmmc-ecc', 'altr,sdram-edac-s10', 'altr,socfpga-a10-ecc-manager', 'altr,socfpga-s10-ecc-manager') : 'edac',	
-	('fsl,qoriq-memory-controller',) : 'edac',	
-	('arm,dmc-520',) : 'edac',	
-	('ti,emif-keystone', 'ti,emif-dra7xx') : 'edac',	
-	('marvell,armada-xp-sdram-controller', 'marvell,aurora-system-cache') : 'edac',	
-	('apm,xgene-edac',) : 'edac',	
-	('fsl,8540-l2-cache-controller', 'fsl,8541-l2-cache-controller', 'fsl,8544-l2-cache-controller', 'fsl,8548-l2-cache-controller', 'fsl,8555-l2-cache-controller', 'fsl,8568-l2-cache-controller', 'fsl,mpc8536-l2-cache-controller', 'fsl,mpc8540-l2-cache-controller', 'fsl,mpc8541-l2-cache-controller', 'fsl,mpc8544-l2-cache-controller', 'fsl,mpc8548-l2-cache-controller', 'fsl,mpc8555-l2-cache-controller', 'fsl,mpc8560-l2-cache-controller', 'fsl,mpc8568-l2-cache-controller', 'fsl,mpc8569-l2-cache-controller', 'fsl,mpc8572-l2-cache-controller', 'fsl,p1020-l2-cache-controller', 'fsl,p1021-l2-cache-controller', 'fsl,p2020-l2-cache-controller', 'fsl,t2080-l2-cache-controller', 'fsl,8540-memory-controller', 'fsl,8541-memory-controller', 'fsl,8544-memory-controller', 'fsl,8548-memory-controller', 'fsl,8555-memory-controller', 'fsl,8568-memory-controller', 'fsl,mpc8536-memory-controller', 'fsl,mpc8540-memory-controller', 'fsl,mpc8541-memory-controller', 'fsl,mpc8544-memory-controller', 'fsl,mpc8548-memory-controller', 'fsl,mpc8555-memory-controller', 'fsl,mpc8560-memory-controller', 'fsl,mpc8568-memory-controller', 'fsl,mpc8569-memory-controller', 'fsl,mpc8572-memory-controller', 'fsl,mpc8349-memory-controller', 'fsl,p1020-memory-controller', 'fsl,p1021-memory-controller', 'fsl,p2020-memory-controller', 'fsl,qoriq-memory-controller') : 'edac',	
-	('amazon,al-mc-edac',) : 'edac',	
-	('fcs,fsa9480', 'fcs,fsa880', 'ti,tsu6111') : 'extcon',	
-	('maxim,max14577-muic', 'maxim,max77836-muic') : 'extcon',	
-	('google,extcon-usbc-cros-ec',) : 'extcon',	
-	('ti,palmas-usb', 'ti,palmas-usb-vid', 'ti,twl6035-usb', 'ti,twl6035-usb-vid') : 'extcon',	
-	('qcom,pm8941-misc',) : 'extcon',	
-	('siliconmitus,sm5502-muic',) : 'extcon',	
-	('nxp,ptn5150',) : 'extcon',	
-	('linux,extcon-usb-gpio',) : 'extcon',	
-	('maxim,max3355',) : 'extcon',	
-	('richtek,rt8973a-muic',) : 'extcon',	
-	('ti,tusb320',) : 'extcon',	
-	('mxicy,mx25f0a-spi',) : 'spi',	
-	('ti,dm6441-spi', 'ti,da830-spi', 'ti,keystone-spi') : 'spi',	
-	('allwinner,sun6i-a31-spi', 'allwinner,sun8i-h3-spi') : 'spi',	
-	('renesas,hspi',) : 'spi',	
-	('nuvoton,npcm750-fiu',) : 'spi',	
-	('socionext,uniphier-scssi',) : 'spi',	
-	('nuvoton,npcm750-pspi',) : 'spi',	
-	('nvidia,tegra114-spi', 'nvidia,tegra124-spi', 'nvidia,tegra210-spi') : 'spi',	
-	('fsl,mpc5200-spi',) : 'spi',	
-	('adi,axi-spi-engine-1.00.a',) : 'spi',	
-	('marvell,orion-spi', 'marvell,armada-370-spi', 'marvell,armada-375-spi', 'marvell,armada-380-spi', 'marvell,armada-390-spi', 'marvell,armada-xp-spi') : 'spi',	
-	('qcom,qspi-v1',) : 'spi',	
-	('st,comms-ssc4-spi',) : 'spi',	
-	('st,stm32f469-qspi',) : 'spi',	
-	('img,spfi',) : 'spi',	
-	('nxp,lx2160a-fspi', 'nxp,imx8mm-fspi', 'nxp,imx8qxp-fspi') : 'spi',	
-	('qcom,geni-spi',) : 'spi',	
-	('qcom,spi-qup-v1.1.1', 'qcom,spi-qup-v2.1.1', 'qcom,spi-qup-v2.2.1') : 'spi',	
-	('spi-mux',) : 'spi',	
-	('fsl,spi', 'aeroflexgaisler,spictrl') : 'spi',	
-	('fsl,imx1-cspi', 'fsl,imx21-cspi', 'fsl,imx27-cspi', 'fsl,imx31-cspi', 'fsl,imx35-cspi', 'fsl,imx51-ecspi', 'fsl,imx53-ecspi') : 'spi',	
-	('marvell,armada-3700-spi',) : 'spi',	
-	('lantiq,ase-spi', 'lantiq,falcon-spi', 'lantiq,xrx100-spi', 'intel,lgm-spi') : 'spi',	
-	('fsl,imx23-spi', 'fsl,imx28-spi') : 'spi',	
-	('fsl,vf610-dspi', 'fsl,ls1021a-v1.0-dspi', 'fsl,ls1012a-dspi', 'fsl,ls1028a-dspi', 'fsl,ls1043a-dspi', 'fsl,ls1046a-dspi', 'fsl,ls2080a-dspi', 'fsl,ls2085a-dspi', 'fsl,lx2160a-dspi') : 'spi',	
-	('brcm,bcm2835-aux-spi',) : 'spi',	
-	('ralink,mt7621-spi',) : 'spi',	
-	('fsl,vf610-qspi', 'fsl,imx6sx-qspi', 'fsl,imx7d-qspi', 'fsl,imx6ul-qspi', 'fsl,ls1021a-qspi', 'fsl,ls2080a-qspi') : 'spi',	
-	('mediatek,mt8192-nor', 'mediatek,mt8173-nor') : 'spi',	
-	('samsung,s3c2443-spi', 'samsung,s3c6410-spi', 'samsung,s5pv210-spi', 'samsung,exynos4210-spi', 'samsung,exynos7-spi', 'samsung,exynos5433-spi') : 'spi',	
-	('jcore,spi2',) : 'spi',	
-	('xlnx,zynq-spi-r1p6', 'cdns,spi-r1p6') : 'spi',	
-	('brcm,spi-bcm7445-qspi', 'brcm,spi-bcm-qspi', 'brcm,spi-bcm7216-qspi', 'brcm,spi-bcm7278-qspi') : 'spi',	
-	('st,stm32h7-spi', 'st,stm32f4-spi') : 'spi',	
-	('mediatek,mt2712-spi-slave',) : 'spi',	
-	('sprd,sc9860-adi',) : 'spi',	
-	('nvidia,tegra30-slink', 'nvidia,tegra20-slink') : 'spi',	
-	('nxp,sc18is602', 'nxp,sc18is602b', 'nxp,sc18is603') : 'spi',	
-	('cdns,xtfpga-spi',) : 'spi',	
-	('renesas,rspi', 'renesas,rspi-rz', 'renesas,qspi') : 'spi',	
-	('allwinner,sun4i-a10-spi',) : 'spi',	
-	('fsl,mpc5200-psc-spi', 'mpc5200-psc-spi') : 'spi',	
-	('opencores,tiny-spi-rtlsvn2',) : 'spi',	
-	('atmel,at91rm9200-spi',) : 'spi',	
-	('nvidia,tegra20-sflash',) : 'spi',	
-	('renesas,sh-mobile-msiof', 'renesas,msiof-r8a7743', 'renesas,msiof-r8a7745', 'renesas,msiof-r8a7790', 'renesas,msiof-r8a7791', 'renesas,msiof-r8a7792', 'renesas,msiof-r8a7793', 'renesas,msiof-r8a7794', 'renesas,rcar-gen2-msiof', 'renesas,msiof-r8a7796', 'renesas,rcar-gen3-msiof', 'renesas,sh-msiof') : 'spi',	
-	('snps,dw-apb-ssi', 'mscc,ocelot-spi', 'mscc,jaguar2-spi', 'amazon,alpine-dw-apb-ssi', 'renesas,rzn1-spi', 'snps,dwc-ssi-1.01a', 'intel,keembay-ssi', 'microchip,sparx5-spi', 'canaan,k210-spi') : 'spi',	
-	('microchip,pic32mzda-sqi',) : 'spi',	
-	('cdns,qspi-nor', 'ti,k2g-qspi', 'ti,am654-ospi') : 'spi',	
-	('icpdas,lp8841-spi-rtc',) : 'spi',	
-	('cirrus,ep7209-spi',) : 'spi',	
-	('amlogic,meson-axg-spicc', 'amlogic,meson-g12a-spicc') : 'spi',	
-	('cavium,octeon-3010-spi',) : 'spi',	
-	('socionext,synquacer-spi',) : 'spi',	
-	('mediatek,mt2701-spi', 'mediatek,mt2712-spi', 'mediatek,mt6589-spi', 'mediatek,mt6765-spi', 'mediatek,mt7622-spi', 'mediatek,mt7629-spi', 'mediatek,mt8135-spi', 'mediatek,mt8173-spi', 'mediatek,mt8183-spi', 'mediatek,mt8192-spi') : 'spi',	
-	('fsl,imx7ulp-spi',) : 'spi',	
-	('netlogic,xlp832-spi',) : 'spi',	
-	('fsl,mpc5121-psc-spi', 'fsl,mpc5125-psc-spi') : 'spi',	
-	('energymicro,efm32-spi', 'efm32,spi') : 'spi',	
-	('spi-gpio',) : 'spi',	
-	('microchip,pic32mzda-spi',) : 'spi',	
-	('brcm,spi-nsp-qspi', 'brcm,spi-ns2-qspi') : 'spi',	
-	('sprd,sc9860-spi',) : 'spi',	
-	('xlnx,zynq-qspi-1.0',) : 'spi',	
-	('ibm,ppc4xx-spi',) : 'spi',	
-	('xlnx,axi-quad-spi-1.00.a', 'xlnx,xps-spi-2.00.a', 'xlnx,xps-spi-2.00.b') : 'spi',	
-	('amlogic,meson6-spifc', 'amlogic,meson-gxbb-spifc') : 'spi',	
-	('ti,omap2-mcspi', 'ti,omap4-mcspi', 'ti,am654-mcspi') : 'spi',	
-	('fsl,mpc8536-espi',) : 'spi',	
-	('mikrotik,rb4xx-spi',) : 'spi',	
-	('brcm,bcm6348-spi', 'brcm,bcm6358-spi') : 'spi',	
-	('ti,dra7xxx-qspi', 'ti,am4372-qspi') : 'spi',	
-	('rohm,dh2228fv', 'lineartechnology,ltc2488', 'ge,achc', 'semtech,sx1301', 'lwn,bk4', 'dh,dhcom-board', 'menlo,m53cpld', 'cisco,spi-petra') : 'spi',	
-	('brcm,spi-brcmstb-qspi', 'brcm,spi-brcmstb-mspi') : 'spi',	
-	('lantiq,sflash-falcon',) : 'spi',	
-	('marvell,mmp2-ssp',) : 'spi',	
-	('rockchip,px30-spi', 'rockchip,rk3036-spi', 'rockchip,rk3066-spi', 'rockchip,rk3188-spi', 'rockchip,rk3228-spi', 'rockchip,rk3288-spi', 'rockchip,rk3308-spi', 'rockchip,rk3328-spi', 'rockchip,rk3368-spi', 'rockchip,rk3399-spi', 'rockchip,rv1108-spi') : 'spi',	
-	('brcm,bcm2835-spi',) : 'spi',	
-	('qca,ar934x-spi',) : 'spi',	
-	('baikal,bt1-ssi', 'baikal,bt1-sys-ssi') : 'spi',	
-	('atmel,sama5d2-qspi', 'microchip,sam9x60-qspi') : 'spi',	
-	('qca,ar7100-spi',) : 'spi',	
-	('sirf,prima2-spi', 'sirf,prima2-usp-spi', 'sirf,atlas7-usp-spi') : 'spi',	
-	('ALTR,spi-1.0', 'altr,spi-1.0') : 'spi',	
-	('brcm,bcm6328-hsspi',) : 'spi',	
-	('xlnx,zynqmp-qspi-1.0',) : 'spi',	
-	('sifive,spi0',) : 'spi',	
-	('simple-bus', 'simple-mfd', 'isa', 'arm,amba-bus', 'operating-points-v2', 'qcom,rmtfs-mem', 'qcom,cmd-db', 'ramoops') : 'of',	
-	('compat3', 'compat2', 'compat2', 'compat2', 'compat2', 'compat2', 'test-device', 'unittest', 'unittest-gpio', 'unittest-i2c-bus') : 'of',	
-	('atmel,at91sam9x5-can', 'atmel,at91sam9263-can') : 'net/can',	
-	('fsl,mpc5200-cdm', 'fsl,mpc5200-mscan', 'fsl,mpc5121-mscan') : 'net/can',	
-	('microchip,mcp2517fd', 'microchip,mcp2518fd', 'microchip,mcp251xfd') : 'net/can',	
-	('ifi,canfd-1.0',) : 'net/can',	
-	('bosch,c_can', 'bosch,d_can', 'ti,dra7-d_can', 'ti,am3352-d_can', 'ti,am4372-d_can') : 'net/can',	
-	('xlnx,zynq-can-1.0', 'xlnx,axi-can-1.00.a', 'xlnx,canfd-1.0', 'xlnx,canfd-2.0') : 'net/can',	
-	('ti,am3517-hecc',) : 'net/can',	
-	('nxp,sja1000', 'technologic,sja1000') : 'net/can',	
-	('bosch,m_can',) : 'net/can',	
-	('ti,tcan4x5x',) : 'net/can',	
-	('fsl,imx8qm-flexcan', 'fsl,imx8mp-flexcan', 'fsl,imx6q-flexcan', 'fsl,imx28-flexcan', 'fsl,imx53-flexcan', 'fsl,imx35-flexcan', 'fsl,imx25-flexcan', 'fsl,p1010-flexcan', 'fsl,vf610-flexcan', 'fsl,ls1021ar2-flexcan', 'fsl,lx2160ar1-flexcan') : 'net/can',	
-	('bosch,cc770', 'bosch,cc770', 'intc,82527') : 'net/can',	
-	('renesas,rcar-gen3-canfd',) : 'net/can',	
-	('renesas,can-r8a7778', 'renesas,can-r8a7779', 'renesas,can-r8a7790', 'renesas,can-r8a7791', 'renesas,rcar-gen1-can', 'renesas,rcar-gen2-can', 'renesas,rcar-gen3-can') : 'net/can',	
-	('allwinner,sun4i-a10-can',) : 'net/can',	
-	('micrel,ks8995', 'micrel,ksz8864', 'micrel,ksz8795') : 'net/phy',	
-	('sff,sff', 'sff,sfp') : 'net/phy',	
-	('xlnx,gmii-to-rgmii-1.0',) : 'net/phy',	
-	('mdio-mux-multiplexer',) : 'net/mdio',	
-	('allwinner,sun4i-a10-mdio', 'allwinner,sun4i-mdio') : 'net/mdio',	
-	('brcm,genet-mdio-v5', 'brcm,genet-mdio-v4', 'brcm,genet-mdio-v3', 'brcm,genet-mdio-v2', 'brcm,genet-mdio-v1', 'brcm,unimac-mdio') : 'net/mdio',	
-	('amlogic,g12a-mdio-mux',) : 'net/mdio',	
-	('qcom,ipq8064-mdio',) : 'net/mdio',	
-	('brcm,mdio-mux-iproc',) : 'net/mdio',	
-	('brcm,40nm-ephy', 'broadcom,bcm5241', 'marvell,88E1111', 'marvell,88e1116', 'marvell,88e1118', 'marvell,88e1145', 'marvell,88e1149r', 'marvell,88e1310', 'marvell,88E1510', 'marvell,88E1514', 'moxa,moxart-rtl8201cp') : 'net/mdio',	
-	('mdio-mux-mmioreg',) : 'net/mdio',	
-	('mdio-mux-gpio', 'cavium,mdio-mux-sn74cbtlv3253') : 'net/mdio',	
-	('hisilicon,hisi-femac-mdio',) : 'net/mdio',	
-	('mscc,ocelot-miim',) : 'net/mdio',	
-	('aspeed,ast2600-mdio',) : 'net/mdio',	
-	('cavium,octeon-3860-mdio',) : 'net/mdio',	
-	('brcm,iproc-mdio',) : 'net/mdio',	
-	('virtual,mdio-gpio',) : 'net/mdio',	
-	('moxa,moxart-mdio',) : 'net/mdio',	
-	('qcom,ipq4019-mdio',) : 'net/mdio',	
-	('apm,xgene-mdio-rgmii', 'apm,xgene-mdio-xfi') : 'net/mdio',	
-	('smsc,lan9303-mdio',) : 'net/dsa',	
-	('vitesse,vsc7385', 'vitesse,vsc7388', 'vitesse,vsc7395', 'vitesse,vsc7398') : 'net/dsa',	
-	('microchip,ksz8765', 'microchip,ksz8794', 'microchip,ksz8795') : 'net/dsa',	
-	('microchip,ksz9477', 'microchip,ksz9897', 'microchip,ksz9893', 'microchip,ksz9563', 'microchip,ksz9567') : 'net/dsa',	
-	('microchip,ksz9477', 'microchip,ksz9897', 'microchip,ksz9893', 'microchip,ksz9563', 'microchip,ksz8563', 'microchip,ksz9567') : 'net/dsa',	
-	('marvell,mv88e6060',) : 'net/dsa',	
-	('mscc,vsc9953-switch',) : 'net/dsa',	
-	('smsc,lan9303-i2c',) : 'net/dsa',	
-	('brcm,bcm53010-srab', 'brcm,bcm53011-srab', 'brcm,bcm53012-srab', 'brcm,bcm53018-srab', 'brcm,bcm53019-srab', 'brcm,bcm5301x-srab', 'brcm,bcm11360-srab', 'brcm,bcm58522-srab', 'brcm,bcm58525-srab', 'brcm,bcm58535-srab', 'brcm,bcm58622-srab', 'brcm,bcm58623-srab', 'brcm,bcm58625-srab', 'brcm,bcm88312-srab', 'brcm,cygnus-srab', 'brcm,nsp-srab', 'brcm,omega-srab') : 'net/dsa',	
-	('brcm,bcm5325', 'brcm,bcm53115', 'brcm,bcm53125', 'brcm,bcm53128', 'brcm,bcm5365', 'brcm,bcm5389', 'brcm,bcm5395', 'brcm,bcm5397', 'brcm,bcm5398') : 'net/dsa',	
-	('brcm,bcm3384-switch', 'brcm,bcm6328-switch', 'brcm,bcm6368-switch', 'brcm,bcm63xx-switch') : 'net/dsa',	
-	('hirschmann,hellcreek-de1soc-r1',) : 'net/dsa',	
-	('realtek,rtl8366rb', 'realtek,rtl8366s') : 'net/dsa',	
-	('marvell,mv88e6085', 'marvell,mv88e6190', 'marvell,mv88e6250') : 'net/dsa',	
-	('lantiq,xrx200-gphy-fw', 'lantiq,xrx200a1x-gphy-fw', 'lantiq,xrx200a2x-gphy-fw', 'lantiq,xrx300-gphy-fw', 'lantiq,xrx330-gphy-fw', 'lantiq,xrx200-gswip') : 'net/dsa',	
-	('qca,ar9331-switch',) : 'net/dsa',	
-	('brcm,bcm7445-switch-v4.0', 'brcm,bcm7278-switch-v4.0', 'brcm,bcm7278-switch-v4.8') : 'net/dsa',	
-	('nxp,sja1105e', 'nxp,sja1105t', 'nxp,sja1105p', 'nxp,sja1105q', 'nxp,sja1105r', 'nxp,sja1105s') : 'net/dsa',	
-	('qca,qca8334', 'qca,qca8337') : 'net/dsa',	
-	('mediatek,mt7621', 'mediatek,mt7530', 'mediatek,mt7531') : 'net/dsa',	
-	('smsc,lan9115',) : 'net/ethernet',	
-	('smsc,lan91c94', 'smsc,lan91c111') : 'net/ethernet',	
-	('aurora,nb8800', 'sigma,smp8642-ethernet', 'sigma,smp8734-ethernet') : 'net/ethernet',	
-	('micrel,ks8851-mll',) : 'net/ethernet',	
-	('micrel,ks8851',) : 'net/ethernet',	
-	('amd,xgbe-seattle-v1a',) : 'net/ethernet',	
-	('ezchip,nps-mgt-enet',) : 'net/ethernet',	
-	('microchip,enc28j60',) : 'net/ethernet',	
-	('nxp,lpc-eth',) : 'net/ethernet',	
-	('calxeda,hb-xgmac',) : 'net/ethernet',	
-	('mscc,vsc7514-switch',) : 'net/ethernet',	
-	('qca,ar7100-eth', 'qca,ar7240-eth', 'qca,ar7241-eth', 'qca,ar7242-eth', 'qca,ar9130-eth', 'qca,ar9330-eth', 'qca,ar9340-eth', 'qca,qca9530-eth', 'qca,qca9550-eth', 'qca,qca9560-eth') : 'net/ethernet',	
-	('hisilicon,hip04-mac',) : 'net/ethernet',	
-	('hisilicon,mdio', 'hisilicon,hns-mdio') : 'net/ethernet',	
-	('hisilicon,hisi-gmac-v1', 'hisilicon,hisi-gmac-v2', 'hisilicon,hix5hd2-gmac', 'hisilicon,hi3798cv200-gmac', 'hisilicon,hi3516a-gmac') : 'net/ethernet',	
-	('hisilicon,hisi-femac-v1', 'hisilicon,hisi-femac-v2', 'hisilicon,hi3516cv300-femac') : 'net/ethernet',	
-	('hisilicon,hns-nic-v1', 'hisilicon,hns-nic-v2') : 'net/ethernet',	
-	('hisilicon,hns-dsaf-v1', 'hisilicon,hns-dsaf-v2') : 'net/ethernet',	
-	('ni,xge-enet-2.00', 'ni,xge-enet-3.00') : 'net/ethernet',	
-	('altr,tse-msgdma-1.0', 'altr,tse-1.0', 'ALTR,tse-1.0') : 'net/ethernet',	
-	('samsung,sxgbe-v2.0a',) : 'net/ethernet',	
-	('cirrus,cs8900', 'cirrus,cs8920') : 'net/ethernet',	
-	('SUNW,niusl',) : 'net/ethernet',	
-	('wiznet,w5100', 'wiznet,w5200', 'wiznet,w5500') : 'net/ethernet',	
-	('ti,am65-cpts', 'ti,j721e-cpts') : 'net/ethernet',	
-	('ti,cpsw', 'ti,am335x-cpsw', 'ti,am4372-cpsw', 'ti,dra7-cpsw') : 'net/ethernet',	
-	('ti,netcp-1.0',) : 'net/ethernet',	
-	('ti,davinci_mdio', 'ti,cpsw-mdio') : 'net/ethernet',	
-	('ti,davinci-dm6467-emac', 'ti,am3517-emac', 'ti,dm816-emac') : 'net/ethernet',	
-	('ti,cpsw-switch', 'ti,am335x-cpsw-switch', 'ti,am4372-cpsw-switch', 'ti,dra7-cpsw-switch') : 'net/ethernet',	
-	('ti,am654-cpsw-nuss', 'ti,j721e-cpsw-nuss') : 'net/ethernet',	
-	('cortina,gemini-ethernet-port', 'cortina,gemini-ethernet') : 'net/ethernet',	
-	('andestech,atmac100',) : 'net/ethernet',	
-	('faraday,ftgmac100',) : 'net/ethernet',	
-	('apm,xgene-enet', 'apm,xgene1-sgenet', 'apm,xgene1-xgenet', 'apm,xgene2-sgenet', 'apm,xgene2-xgenet') : 'net/ethernet',	
-	('allwinner,sun4i-a10-emac', 'allwinner,sun4i-emac') : 'net/ethernet',	
-	('fsl,gianfar-tbi', 'fsl,gianfar-mdio', 'gianfar', 'fsl,etsec2-tbi', 'fsl,etsec2-mdio', 'fsl,ucc-mdio', 'ucc_geth_phy', 'fsl,fman-mdio') : 'net/ethernet',	
-	('gianfar', 'fsl,etsec2') : 'net/ethernet',	
-	('fsl,mpc5200b-mdio', 'fsl,mpc5200-mdio', 'mpc5200b-fec-phy') : 'net/ethernet',	
-	('fsl,fman-xmdio', 'fsl,fman-memac-mdio') : 'net/ethernet',	
-	('fsl,cpm2-mdio-bitbang',) : 'net/ethernet',	
-	('fsl,pq1-fec-mdio', 'fsl,mpc5121-fec-mdio') : 'net/ethernet',	
-	('fsl,cpm1-scc-enet', 'fsl,cpm2-scc-enet', 'fsl,cpm2-fcc-enet', 'fsl,mpc5121-fec', 'fsl,mpc5125-fec', 'fsl,pq1-fec-enet') : 'net/ethernet',	
-	('fsl,imx25-fec', 'fsl,imx27-fec', 'fsl,imx28-fec', 'fsl,imx6q-fec', 'fsl,mvf600-fec', 'fsl,imx6sx-fec', 'fsl,imx6ul-fec') : 'net/ethernet',	
-	('fsl,fman-muram', 'fsl,fman') : 'net/ethernet',	
-	('fsl,fman-v3-port-rx', 'fsl,fman-v2-port-rx', 'fsl,fman-v3-port-tx', 'fsl,fman-v2-port-tx') : 'net/ethernet',	
-	('ucc_geth',) : 'net/ethernet',	
-	('fsl,mpc5200b-fec', 'fsl,mpc5200-fec', 'mpc5200-fec') : 'net/ethernet',	
-	('via,velocity-vt6110',) : 'net/ethernet',	
-	('via,vt8500-rhine',) : 'net/ethernet',	
-	('marvell,orion-mdio', 'marvell,xmdio') : 'net/ethernet',	
-	('marvell,armada-380-neta-bm',) : 'net/ethernet',	
-	('marvell,armada-370-neta', 'marvell,armada-xp-neta', 'marvell,armada-3700-neta') : 'net/ethernet',	
-	('marvell,pxa168-eth',) : 'net/ethernet',	
-	('marvell,armada-375-pp2', 'marvell,armada-7k-pp22') : 'net/ethernet',	
-	('marvell,orion-eth', 'marvell,kirkwood-eth') : 'net/ethernet',	
-	('opencores,ethoc',) : 'net/ethernet',	
-	('qcom,fsm9900-emac',) : 'net/ethernet',	
-	('qcom,fsm9900-emac-sgmii', 'qcom,qdf2432-emac-sgmii') : 'net/ethernet',	
-	('qca,qca7000',) : 'net/ethernet',	
-	('lantiq,xrx200-net',) : 'net/ethernet',	
-	('rockchip,rk3036-emac', 'rockchip,rk3066-emac', 'rockchip,rk3188-emac') : 'net/ethernet',	
-	('snps,arc-emac',) : 'net/ethernet',	
-	('cavium,octeon-5750-mix',) : 'net/ethernet',	
-	('IBM,lhea', 'IBM,lhea-ethernet', 'IBM,lhea') : 'net/ethernet',	
-	('brcm,genet-v1', 'brcm,genet-v2', 'brcm,genet-v3', 'brcm,genet-v4', 'brcm,genet-v5', 'brcm,bcm2711-genet-v5') : 'net/ethernet',	
-	('brcm,amac', 'brcm,nsp-amac', 'brcm,ns2-amac') : 'net/ethernet',	
-	('brcm,systemportlite-v1.00', 'brcm,systemport-v1.00', 'brcm,systemport') : 'net/ethernet',	
-	('socionext,synquacer-netsec',) : 'net/ethernet',	
-	('socionext,uniphier-pro4-ave4', 'socionext,uniphier-pxs2-ave4', 'socionext,uniphier-ld11-ave4', 'socionext,uniphier-ld20-ave4', 'socionext,uniphier-pxs3-ave4') : 'net/ethernet',	
-	('mediatek,mt8516-eth', 'mediatek,mt8518-eth', 'mediatek,mt8175-eth') : 'net/ethernet',	
-	('mediatek,mt2701-eth', 'mediatek,mt7621-eth', 'mediatek,mt7622-eth', 'mediatek,mt7623-eth', 'mediatek,mt7629-eth', 'ralink,rt5350-eth') : 'net/ethernet',	
-	('cdns,at32ap7000-macb', 'cdns,at91sam9260-macb', 'cdns,macb', 'cdns,np4-macb', 'cdns,pc302-gem', 'cdns,gem', 'cdns,sam9x60-macb', 'atmel,sama5d2-gem', 'atmel,sama5d3-gem', 'atmel,sama5d3-macb', 'atmel,sama5d4-gem', 'cdns,at91rm9200-emac', 'cdns,emac', 'cdns,zynqmp-gem', 'cdns,zynq-gem', 'sifive,fu540-c000-gem', 'microchip,sama7g5-gem', 'microchip,sama7g5-emac') : 'net/ethernet',	
-	('davicom,dm9000',) : 'net/ethernet',	
-	('xlnx,opb-ethernetlite-1.01.a', 'xlnx,opb-ethernetlite-1.01.b', 'xlnx,xps-ethernetlite-1.00.a', 'xlnx,xps-ethernetlite-2.00.a', 'xlnx,xps-ethernetlite-2.01.a', 'xlnx,xps-ethernetlite-3.00.a') : 'net/ethernet',	
-	('xlnx,axi-ethernet-1.00.a', 'xlnx,axi-ethernet-1.01.a', 'xlnx,axi-ethernet-2.01.a') : 'net/ethernet',	
-	('xlnx,xps-ll-temac-1.01.b', 'xlnx,xps-ll-temac-2.00.a', 'xlnx,xps-ll-temac-2.02.a', 'xlnx,xps-ll-temac-2.03.a') : 'net/ethernet',	
-	('moxa,moxart-mac',) : 'net/ethernet',	
-	('adaptrum,anarion-gmac',) : 'net/ethernet',	
-	('rockchip,px30-gmac', 'rockchip,rk3128-gmac', 'rockchip,rk3228-gmac', 'rockchip,rk3288-gmac', 'rockchip,rk3328-gmac', 'rockchip,rk3366-gmac', 'rockchip,rk3368-gmac', 'rockchip,rk3399-gmac', 'rockchip,rv1108-gmac') : 'net/ethernet',	
-	('mediatek,mt2712-gmac',) : 'net/ethernet',	
-	('amlogic,meson6-dwmac',) : 'net/ethernet',	
-	('nxp,lpc1850-dwmac',) : 'net/ethernet',	
-	('allwinner,sun8i-h3-emac', 'allwinner,sun8i-v3s-emac', 'allwinner,sun8i-a83t-emac', 'allwinner,sun8i-r40-gmac', 'allwinner,sun50i-a64-emac', 'allwinner,sun50i-h6-emac') : 'net/ethernet',	
-	('nxp,imx8mp-dwmac-eqos', 'nxp,imx8dxl-dwmac-eqos') : 'net/ethernet',	
-	('qcom,qcs404-ethqos',) : 'net/ethernet',	
-	('amlogic,meson8b-dwmac', 'amlogic,meson8m2-dwmac', 'amlogic,meson-gxbb-dwmac', 'amlogic,meson-axg-dwmac', 'amlogic,meson-g12a-dwmac') : 'net/ethernet',	
-	('st,stih415-dwmac', 'st,stih416-dwmac', 'st,stid127-dwmac', 'st,stih407-dwmac') : 'net/ethernet',	
-	('qcom,ipq806x-gmac',) : 'net/ethernet',	
-	('oxsemi,ox820-dwmac',) : 'net/ethernet',	
-	('st,stm32-dwmac', 'st,stm32mp1-dwmac') : 'net/ethernet',	
-	('snps,dwc-qos-ethernet-4.10',) : 'net/ethernet',	
-	('altr,socfpga-stmmac', 'altr,socfpga-stmmac-a10-s10') : 'net/ethernet',	
-	('intel,keembay-dwmac',) : 'net/ethernet',	
-	('snps,dwc-qos-ethernet-4.10', 'nvidia,tegra186-eqos') : 'net/ethernet',	
-	('st,spear600-gmac', 'snps,dwmac-3.50a', 'snps,dwmac-3.610', 'snps,dwmac-3.70a', 'snps,dwmac-3.710', 'snps,dwmac-4.00', 'snps,dwmac-4.10a', 'snps,dwmac', 'snps,dwxgmac-2.10', 'snps,dwxgmac') : 'net/ethernet',	
-	('allwinner,sun7i-a20-gmac',) : 'net/ethernet',	
-	('renesas,etheravb-r8a7790', 'renesas,etheravb-r8a7794', 'renesas,etheravb-rcar-gen2', 'renesas,etheravb-r8a7795', 'renesas,etheravb-rcar-gen3') : 'net/ethernet',	
-	('renesas,gether-r8a7740', 'renesas,ether-r8a7743', 'renesas,ether-r8a7745', 'renesas,ether-r8a7778', 'renesas,ether-r8a7779', 'renesas,ether-r8a7790', 'renesas,ether-r8a7791', 'renesas,ether-r8a7793', 'renesas,ether-r8a7794', 'renesas,gether-r8a77980', 'renesas,ether-r7s72100', 'renesas,ether-r7s9210', 'renesas,rcar-gen1-ether', 'renesas,rcar-gen2-ether') : 'net/ethernet',	
-	('cascoda,ca8210',) : 'net/ieee802154',	
-	('nxp,mcr20a',) : 'net/ieee802154',	
-	('adi,adf7242', 'adi,adf7241') : 'net/ieee802154',	
-	('microchip,mrf24j40', 'microchip,mrf24j40ma', 'microchip,mrf24j40mc') : 'net/ieee802154',	
-	('atmel,at86rf230', 'atmel,at86rf231', 'atmel,at86rf233', 'atmel,at86rf212') : 'net/ieee802154',	
-	('ti,cc2520',) : 'net/ieee802154',	
-	('fsl,ucc-hdlc',) : 'net/wan',	
-	('maxim,ds26522',) : 'net/wan',	
-	('microchip,wilc1000',) : 'net/wireless',	
-	('qcom,ipq8074-wifi', 'qcom,ipq6018-wifi') : 'net/wireless',	
-	('qcom,wcn3990-wifi',) : 'net/wireless',	
-	('qcom,ipq4019-wifi',) : 'net/wireless',	
-	('qcom,wcnss-wlan',) : 'net/wireless',	
-	('ti,wl1271', 'ti,wl1273', 'ti,wl1281', 'ti,wl1283', 'ti,wl1285', 'ti,wl1801', 'ti,wl1805', 'ti,wl1807', 'ti,wl1831', 'ti,wl1835', 'ti,wl1837') : 'net/wireless',	
-	('marvell,sd8897', 'marvell,sd8997') : 'net/wireless',	
-	('pci11ab,2b42', 'pci1b4b,2b42') : 'net/wireless',	
-	('mediatek,mt7628-wmac',) : 'net/wireless',	
-	('mediatek,mt7622-wmac',) : 'net/wireless',	
-	('hid-over-i2c',) : 'hid',	
-	('ti,am3359-tsc', 'ti,am3359-adc', 'ti,am3359-tscadc') : 'mfd',	
-	('kontron,sl28cpld',) : 'mfd',	
-	('qcom,wcd9340-gpio', 'qcom,soundwire-v1.3.0') : 'mfd',	
-	('mediatek,mt6360_pmu',) : 'mfd',	
-	('atmel,at91rm9200-usart', 'atmel,at91sam9260-usart') : 'mfd',	
-	('wlf,wm5102', 'wlf,wm5110', 'wlf,wm8280', 'wlf,wm8997', 'wlf,wm8998', 'wlf,wm1814', 'wlf,wm1831', 'cirrus,cs47l24') : 'mfd',	
-	('rockchip,rk805', 'rockchip,rk808', 'rockchip,rk809', 'rockchip,rk817', 'rockchip,rk818') : 'mfd',	
-	('wlf,wm8310', 'wlf,wm8311', 'wlf,wm8312', 'wlf,wm8320', 'wlf,wm8321', 'wlf,wm8325', 'wlf,wm8326') : 'mfd',	
-	('marvell,88pm860x',) : 'mfd',	
-	('ti,tps65912',) : 'mfd',	
-	('maxim,max8925',) : 'mfd',	
-	('ti,lm363x-regulator', 'ti,lm3631-backlight', 'ti,lm3632-backlight', 'ti,lm3633-backlight', 'ti,lm3633-leds', 'ti,lm3633-fault-monitor', 'ti,lm3695-backlight', 'ti,lm36274-backlight', 'ti,lm3631', 'ti,lm3632', 'ti,lm3633', 'ti,lm3695', 'ti,lm36274') : 'mfd',	
-	('hisilicon,hi6421-pmic', 'hisilicon,hi6421v530-pmic') : 'mfd',	
-	('ti,tps65910', 'ti,tps65911') : 'mfd',	
-	('ti,palmas', 'ti,tps659038', 'ti,tps65917') : 'mfd',	
-	('qcom,rpm-apq8064', 'qcom,rpm-msm8660', 'qcom,rpm-msm8960', 'qcom,rpm-ipq8064', 'qcom,rpm-mdm9615') : 'mfd',	
-	('ti,usbhs-tll',) : 'mfd',	
-	('qcom,spmi-pmic', 'qcom,pm8941', 'qcom,pm8841', 'qcom,pm8019', 'qcom,pm8226', 'qcom,pm8110', 'qcom,pma8084', 'qcom,pmi8962', 'qcom,pmd9635', 'qcom,pm8994', 'qcom,pmi8994', 'qcom,pm8916', 'qcom,pm8004', 'qcom,pm8909', 'qcom,pm8950', 'qcom,pmi8950', 'qcom,pm8998', 'qcom,pmi8998', 'qcom,pm8005', 'qcom,pm660l', 'qcom,pm660') : 'mfd',	
-	('dlg,da9063', 'dlg,da9063l') : 'mfd',	
-	('fsl,mc13892', 'fsl,mc34708') : 'mfd',	
-	('sprd,sc2731',) : 'mfd',	
-	('mps,mp2629_adc', 'mps,mp2629_charger', 'mps,mp2629') : 'mfd',	
-	('dlg,da9150-gpadc', 'dlg,da9150-charger', 'dlg,da9150-fuel-gauge', 'dlg,da9150') : 'mfd',	
-	('st,stmfx-0300-pinctrl', 'st,stmfx-0300-idd', 'st,stmfx-0300-ts', 'st,stmfx-0300') : 'mfd',	
-	('tc3589x', 'toshiba,tc35890', 'toshiba,tc35892', 'toshiba,tc35893', 'toshiba,tc35894', 'toshiba,tc35895', 'toshiba,tc35896') : 'mfd',	
-	('dlg,da9055-pmic',) : 'mfd',	
-	('atmel,sama5d2-flexcom',) : 'mfd',	
-	('st,stpmic1',) : 'mfd',	
-	('ene,kb3930',) : 'mfd',	
-	('qcom,pm8018', 'qcom,pm8058', 'qcom,pm8821', 'qcom,pm8921') : 'mfd',	
-	('ti,twl6030', 'ti,twl6032') : 'mfd',	
-	('maxim,max8998', 'national,lp3974', 'ti,lp3974') : 'mfd',	
-	('st,stm32-lptimer',) : 'mfd',	
-	('dlg,da9063-onkey',) : 'mfd',	
-	('allwinner,sun6i-a31-ar100-clk', 'allwinner,sun6i-a31-apb0-clk', 'allwinner,sun6i-a31-apb0-gates-clk', 'allwinner,sun4i-a10-mod0-clk', 'allwinner,sun6i-a31-clock-reset', 'allwinner,sun8i-a23-apb0-clk', 'allwinner,sun8i-a23-apb0-gates-clk', 'allwinner,sun6i-a31-clock-reset', 'allwinner,sun6i-a31-prcm', 'allwinner,sun8i-a23-prcm') : 'mfd',	
-	('samsung,s5m8767-clk', 'samsung,s2mps11-clk', 'samsung,s2mps13-clk', 'samsung,s2mps14-clk', 'samsung,s2mps13-clk', 'samsung,s5m8767-pmic', 'samsung,s2mps11-pmic', 'samsung,s2mps13-pmic', 'samsung,s2mps14-pmic', 'samsung,s2mps15-pmic', 'samsung,s2mpa01-pmic', 'samsung,s2mpu02-pmic') : 'mfd',	
-	('ti,ehci-omap', 'ti,ohci-omap3', 'ti,usbhs-host') : 'mfd',	
-	('maxim,max14577-muic', 'maxim,max14577-regulator', 'maxim,max14577-charger', 'maxim,max77836-muic', 'maxim,max77836-regulator', 'maxim,max77836-charger', 'maxim,max77836-battery', 'maxim,max14577', 'maxim,max77836') : 'mfd',	
-	('fsl,mc13783', 'fsl,mc13892', 'fsl,mc34708') : 'mfd',	
-	('wlf,wm1811', 'wlf,wm8994', 'wlf,wm8958') : 'mfd',	
-	('atmel,hlcdc-pwm', 'atmel,hlcdc-display-controller', 'atmel,at91sam9n12-hlcdc', 'atmel,at91sam9x5-hlcdc', 'atmel,sama5d2-hlcdc', 'atmel,sama5d3-hlcdc', 'atmel,sama5d4-hlcdc', 'microchip,sam9x60-hlcdc') : 'mfd',	
-	('mediatek,mt6323-rtc', 'mediatek,mt6323-regulator', 'mediatek,mt6323-led', 'mediatek,mt6323-keys', 'mediatek,mt6323-pwrc', 'mediatek,mt6358-regulator', 'mediatek,mt6358-rtc', 'mediatek,mt6358-sound', 'mediatek,mt6397-rtc', 'mediatek,mt6397-regulator', 'mediatek,mt6397-codec', 'mediatek,mt6397-clk', 'mediatek,mt6397-pinctrl', 'mediatek,mt6397-keys', 'mediatek,mt6323', 'mediatek,mt6358', 'mediatek,mt6397') : 'mfd',	
-	('stericsson,ab8500-sysctrl',) : 'mfd',	
-	('atmel,at91sam9260-smc', 'atmel,sama5d3-smc', 'atmel,sama5d2-smc') : 'mfd',	
-	('st,stmpe610', 'st,stmpe801', 'st,stmpe811', 'st,stmpe1600', 'st,stmpe1601', 'st,stmpe1801', 'st,stmpe2401', 'st,stmpe2403') : 'mfd',	
-	('maxim,max77843-muic', 'maxim,max77843-regulator', 'maxim,max77843-charger', 'maxim,max77843-fuelgauge', 'maxim,max77843-haptic', 'maxim,max77843') : 'mfd',	
-	('ti,tps61050', 'ti,tps61052') : 'mfd',	
-	('hisilicon,hi655x-pmic',) : 'mfd',	
-	('ti,tps6586x',) : 'mfd',	
-	('ti,tps6507x',) : 'mfd',	
-	('samsung,exynos5433-lpass',) : 'mfd',	
-	('maxim,max77686', 'maxim,max77802') : 'mfd',	
-	('cirrus,lochnagar1', 'cirrus,lochnagar2') : 'mfd',	
-	('ti,tps65217-pmic', 'ti,tps65217-bl', 'ti,tps65217-charger', 'ti,tps65217-pwrbutton', 'ti,tps65217') : 'mfd',	
-	('rohm,bd9571mwv',) : 'mfd',	
-	('maxim,max77650',) : 'mfd',	
-	('gw,gsc',) : 'mfd',	
-	('altr,sys-mgr', 'altr,sys-mgr-s10') : 'mfd',	
-	('azoteq,iqs620a-keys', 'azoteq,iqs620a-pwm', 'azoteq,iqs620a-keys', 'azoteq,iqs620a-pwm', 'azoteq,iqs621-keys', 'azoteq,iqs622-keys', 'azoteq,iqs624-keys', 'azoteq,iqs625-keys', 'azoteq,iqs620a', 'azoteq,iqs621', 'azoteq,iqs622', 'azoteq,iqs624', 'azoteq,iqs625') : 'mfd',	
-	('ti,twl4030-power', 'ti,twl4030-power-reset', 'ti,twl4030-power-idle', 'ti,twl4030-power-idle-osc-off', 'ti,twl4030-power-omap3-sdp', 'ti,twl4030-power-omap3-ldp', 'ti,twl4030-power-omap3-evm') : 'mfd',	
-	('khadas,mcu',) : 'mfd',	
-	('ams,as3711',) : 'mfd',	
-	('st,stw481x-vmmc', 'st,stw4810', 'st,stw4811') : 'mfd',	
-	('altr,a10sr-gpio', 'altr,a10sr-reset', 'altr,a10sr') : 'mfd',	
-	('dlg,da9055-gpio', 'dlg,da9055-regulator', 'dlg,da9055-regulator', 'dlg,da9055-regulator', 'dlg,da9055-regulator', 'dlg,da9055-regulator', 'dlg,da9055-regulator', 'dlg,da9055-regulator', 'dlg,da9055-regulator', 'dlg,da9055-onkey', 'dlg,da9055-rtc', 'dlg,da9055-hwmon', 'dlg,da9055-watchdog') : 'mfd',	
-	('smi,sm501',) : 'mfd',	
-	('fsl,imx23-lradc', 'fsl,imx28-lradc') : 'mfd',	
-	('ti,tps65090-charger', 'ti,tps65090') : 'mfd',	
-	('ricoh,rn5t567', 'ricoh,rn5t618', 'ricoh,rc5t619') : 'mfd',	
-	('active-semi,act8945a-charger', 'active-semi,act8945a') : 'mfd',	
-	('rohm,bd70528',) : 'mfd',	
-	('cirrus,cs47l15', 'cirrus,cs47l35', 'cirrus,cs47l85', 'cirrus,cs47l90', 'cirrus,cs47l91', 'cirrus,cs42l92', 'cirrus,cs47l92', 'cirrus,cs47l93', 'cirrus,wm1840') : 'mfd',	
-	('ti,lp87565', 'ti,lp87524-q1', 'ti,lp87565-q1', 'ti,lp87561-q1') : 'mfd',	
-	('richtek,rt5033-charger', 'richtek,rt5033-battery', 'richtek,rt5033-led', 'richtek,rt5033') : 'mfd',	
-	('stericsson,ab3100-regulators',) : 'mfd',	
-	('x-powers,ac100',) : 'mfd',	
-	('maxim,max8907',) : 'mfd',	
-	('fsl,imx25-tsadc',) : 'mfd',	
-	('ti,twl4030-audio',) : 'mfd',	
-	('st,stmpe610', 'st,stmpe801', 'st,stmpe811', 'st,stmpe1601', 'st,stmpe2401', 'st,stmpe2403') : 'mfd',	
-	('x-powers,axp152', 'x-powers,axp202', 'x-powers,axp209', 'x-powers,axp221', 'x-powers,axp223', 'x-powers,axp803', 'x-powers,axp806') : 'mfd',	
-	('zii,rave-sp-niu', 'zii,rave-sp-mezz', 'zii,rave-sp-esb', 'zii,rave-sp-rdu1', 'zii,rave-sp-rdu2') : 'mfd',	
-	('ti,tps65218-pwrbutton', 'ti,tps65218-gpio', 'ti,tps65218') : 'mfd',	
-	('maxim,max8997-pmic',) : 'mfd',	
-	('qcom,ssbi',) : 'mfd',	
-	('dlg,da9052', 'dlg,da9053-aa', 'dlg,da9053-ba', 'dlg,da9053-bb', 'dlg,da9053-bc') : 'mfd',	
-	('rohm,bd71828-leds', 'rohm,bd71828') : 'mfd',	
-	('rohm,bd71837', 'rohm,bd71847', 'rohm,bd71850') : 'mfd',	
-	('nokia,retu', 'nokia,tahvo') : 'mfd',	
-	('stericsson,abx500-clk', 'stericsson,ab8500-gpadc', 'stericsson,ab9540-gpio', 'stericsson,ab8500-debug', 'stericsson,ab8500-sysctrl', 'stericsson,ab8505-regulator', 'stericsson,ab8500-clk', 'stericsson,ab8500-gpadc', 'stericsson,ab8500-rtc', 'stericsson,ab8500-acc-det', 'stericsson,ab8500-poweron-key', 'stericsson,ab8500-pwm', 'stericsson,ab8505-gpio', 'stericsson,ab8500-usb', 'stericsson,ab8500-codec', 'stericsson,abx500-clk', 'stericsson,ab8500-gpadc', 'stericsson,ab8500-rtc', 'stericsson,ab8540-rtc') : 'mfd',	
-	('ams,as3722',) : 'mfd',	
-	('st,stm32-timers',) : 'mfd',	
-	('dlg,da9061-onkey', 'dlg,da9061', 'dlg,da9062') : 'mfd',	
-	('motorola,cpcap', 'st,6556002', 'motorola,mapphone-cpcap-adc', 'motorola,cpcap-battery', 'motorola,mapphone-cpcap-charger', 'motorola,mapphone-cpcap-regulator', 'motorola,cpcap-rtc', 'motorola,cpcap-pwrbutton', 'motorola,mapphone-cpcap-usb-phy', 'motorola,cpcap-led-red', 'motorola,cpcap-led-green', 'motorola,cpcap-led-blue', 'motorola,cpcap-led-adl', 'motorola,cpcap-led-cp') : 'mfd',	
-	('ti,tps65086',) : 'mfd',	
-	('ti,lp8733', 'ti,lp8732') : 'mfd',	
-	('stericsson,ab8500', 'stericsson,ab8505', 'stericsson,db8500-prcmu') : 'mfd',	
-	('ti,lp3943-pwm', 'ti,lp3943-gpio', 'ti,lp3943') : 'mfd',	
-	('brcm,bcm2835-pm-wdt', 'brcm,bcm2835-pm') : 'mfd',	
-	('brcm,bcm59056',) : 'mfd',	
-	('skyworks,sky81452-backlight', 'skyworks,sky81452') : 'mfd',	
-	('maxim,max77693-charger', 'maxim,max77693-muic', 'maxim,max77693-haptic', 'maxim,max77693-led', 'maxim,max77693') : 'mfd',	
-	('x-powers,axp223', 'x-powers,axp803', 'x-powers,axp806', 'x-powers,axp809', 'x-powers,axp813') : 'mfd',	
-	('arm,vexpress-sysreg,sys_led', 'arm,vexpress-sysreg,sys_mci', 'arm,vexpress-sysreg,sys_flash', 'arm,vexpress-sysreg') : 'mfd',	
-	('snps,arc-uart',) : 'tty',	
-	('PowerPC,8323', 'ucc_uart', 'fsl,t1040-ucc-uart') : 'tty',	
-	('nxp,lpc3220-hsuart',) : 'tty',	
-	('fsl,s32v234-linflexuart',) : 'tty',	
-	('atmel,at91rm9200-usart-serial',) : 'tty',	
-	('marvell,armada-3700-uart', 'marvell,armada-3700-uart-ext') : 'tty',	
-	('qca,ar9330-uart',) : 'tty',	
-	('brcm,bcm6345-uart',) : 'tty',	
-	('via,vt8500-uart', 'wm,wm8880-uart') : 'tty',	
-	('maxim,max3107', 'maxim,max3108', 'maxim,max3109', 'maxim,max14830') : 'tty',	
-	('litex,liteuart',) : 'tty',	
-	('fsl,vf610-lpuart', 'fsl,ls1021a-lpuart', 'fsl,ls1028a-lpuart', 'fsl,imx7ulp-lpuart', 'fsl,imx8qxp-lpuart') : 'tty',	
-	('actions,s500-uart', 'actions,s900-uart') : 'tty',	
-	('sab82532',) : 'tty',	
-	('ALTR,juart-1.0', 'altr,juart-1.0') : 'tty',	
-	('nxp,sc16is740', 'nxp,sc16is741', 'nxp,sc16is750', 'nxp,sc16is752', 'nxp,sc16is760', 'nxp,sc16is762') : 'tty',	
-	('st,stm32-uart', 'st,stm32f7-uart', 'st,stm32h7-uart') : 'tty',	
-	('arm,sbsa-uart',) : 'tty',	
-	('sprd,sc9836-uart',) : 'tty',	
-	('lantiq,asc', 'intel,lgm-asc') : 'tty',	
-	('energymicro,efm32-uart', 'efm32,uart') : 'tty',	
-	('renesas,scif-r7s72100', 'renesas,scif-r7s9210', 'renesas,rcar-gen1-scif', 'renesas,rcar-gen2-scif', 'renesas,rcar-gen3-scif', 'renesas,scif', 'renesas,scifa', 'renesas,scifb', 'renesas,hscif', 'renesas,sci') : 'tty',	
-	('arm,mps2-uart',) : 'tty',	
-	('cnxt,cx92755-usart',) : 'tty',	
-	('fsl,cpm1-smc-uart', 'fsl,cpm1-scc-uart', 'fsl,cpm2-smc-uart', 'fsl,cpm2-scc-uart') : 'tty',	
-	('socionext,milbeaut-usio-uart',) : 'tty',	
-	('fsl,imx6q-uart', 'fsl,imx53-uart', 'fsl,imx1-uart', 'fsl,imx21-uart') : 'tty',	
-	('nvidia,tegra194-tcu',) : 'tty',	
-	('sifive,fu540-c000-uart0', 'sifive,uart0') : 'tty',	
-	('su', 'su') : 'tty',	
-	('mrvl,pxa-uart', 'mrvl,mmp-uart') : 'tty',	
-	('cirrus,ep7209-uart',) : 'tty',	
-	('rda,8810pl-uart',) : 'tty',	
-	('nvidia,tegra20-uart',) : 'tty',	
-	('ingenic,jz4740-uart', 'ingenic,jz4760-uart', 'ingenic,jz4770-uart', 'ingenic,jz4775-uart', 'ingenic,jz4780-uart', 'ingenic,x1000-uart') : 'tty',	
-	('ns8250', 'ns16450', 'ns16550a', 'ns16550', 'ns16750', 'ns16850', 'nxp,lpc3220-uart', 'ralink,rt2880-uart', 'intel,xscale-uart', 'altr,16550-FIFO32', 'altr,16550-FIFO64', 'altr,16550-FIFO128', 'mediatek,mtk-btif', 'mrvl,mmp-uart', 'ti,da830-uart', 'nuvoton,npcm750-uart') : 'tty',	
-	('aspeed,ast2400-vuart', 'aspeed,ast2500-vuart') : 'tty',	
-	('socionext,uniphier-uart',) : 'tty',	
-	('snps,dw-apb-uart', 'cavium,octeon-3860-uart', 'marvell,armada-38x-uart', 'renesas,rzn1-uart') : 'tty',	
-	('nxp,lpc1850-uart',) : 'tty',	
-	('brcm,bcm2835-aux-uart',) : 'tty',	
-	('renesas,em-uart',) : 'tty',	
-	('mediatek,mt6577-uart',) : 'tty',	
-	('ti,am654-uart', 'ti,omap2-uart', 'ti,omap3-uart', 'ti,omap4-uart', 'ti,am3352-uart', 'ti,am4372-uart', 'ti,dra742-uart') : 'tty',	
-	('samsung,s3c2410-uart', 'samsung,s3c2412-uart', 'samsung,s3c2440-uart', 'samsung,s3c6400-uart', 'samsung,s5pv210-uart', 'samsung,exynos4210-uart', 'samsung,exynos5433-uart') : 'tty',	
-	('xlnx,xuartps', 'cdns,uart-r1p8', 'cdns,uart-r1p12', 'xlnx,zynqmp-uart') : 'tty',	
-	('ALTR,uart-1.0', 'altr,uart-1.0') : 'tty',	
-	('qcn', 'SUNW,sun4v-console') : 'tty',	
-	('qcom,msm-uartdm-v1.1', 'qcom,msm-uartdm-v1.2', 'qcom,msm-uartdm-v1.3', 'qcom,msm-uartdm-v1.4', 'qcom,msm-uart', 'qcom,msm-uartdm') : 'tty',	
-	('ti,omap2-uart', 'ti,omap3-uart', 'ti,omap4-uart') : 'tty',	
-	('xlnx,opb-uartlite-1.00.b', 'xlnx,xps-uartlite-1.00.a') : 'tty',	
-	('qcom,geni-debug-uart', 'qcom,geni-uart') : 'tty',	
-	('microchip,pic32mzda-uart',) : 'tty',	
-	('amlogic,meson-uart', 'amlogic,meson6-uart', 'amlogic,meson8-uart', 'amlogic,meson8b-uart', 'amlogic,meson-gx-uart') : 'tty',	
-	('fsl,mpc5200b-psc-uart', 'fsl,mpc5200-psc-uart', 'mpc5200-psc-uart', 'mpc5200-serial', 'fsl,mpc5121-psc-uart', 'fsl,mpc5125-psc-uart') : 'tty',	
-	('st,asc',) : 'tty',	
-	('sirf,prima2-uart', 'sirf,atlas7-uart', 'sirf,prima2-usp-uart', 'sirf,atlas7-usp-uart') : 'tty',	
-	('fsl,imx28-auart', 'fsl,imx23-auart', 'alphascale,asm9260-auart') : 'tty',	
-	('google,goldfish-tty',) : 'tty',	
-	('epapr,hv-byte-channel',) : 'tty',	
-	('ibm,opal-console-raw', 'ibm,opal-console-hvsi') : 'tty',	
-	('fsl,imx7d-gpc', 'fsl,imx8mq-gpc') : 'soc/imx',	
-	('qcom,msm8996-gic-v3',) : 'irqchip',	
-	('ti,keystone-irq',) : 'irqchip',	
-	('marvell,cp110-icu-nsr', 'marvell,cp110-icu-sei', 'marvell,cp110-icu') : 'irqchip',	
-	('ti,sci-inta',) : 'irqchip',	
-	('nvidia,tegra210-agic',) : 'irqchip',	
-	('img,pdc-intc',) : 'irqchip',	
-	('nvidia,tegra210-ictlr', 'nvidia,tegra30-ictlr', 'nvidia,tegra20-ictlr') : 'irqchip',	
-	('arm,realview-eb11mp-revb-syscon', 'arm,realview-eb11mp-revc-syscon', 'arm,realview-eb-syscon', 'arm,realview-pb11mp-syscon') : 'irqchip',	
-	('ti,sci-intr',) : 'irqchip',	
-	('renesas,rza1-irqc',) : 'irqchip',	
-	('kontron,sl28cpld-intc',) : 'irqchip',	
-	('socionext,uniphier-ld4-aidet', 'socionext,uniphier-pro4-aidet', 'socionext,uniphier-sld8-aidet', 'socionext,uniphier-pro5-aidet', 'socionext,uniphier-pxs2-aidet', 'socionext,uniphier-ld11-aidet', 'socionext,uniphier-ld20-aidet', 'socionext,uniphier-pxs3-aidet') : 'irqchip',	
-	('atmel,at91rm9200', 'atmel,at91sam9g45', 'atmel,at91sam9n12', 'atmel,at91sam9rl', 'atmel,at91sam9x5', 'atmel,at91sam9260', 'atmel,at91sam9261', 'atmel,at91sam9263', 'atmel,at91sam9g20') : 'irqchip',	
-	('atmel,sama5d3', 'atmel,sama5d4', 'microchip,sam9x60') : 'irqchip',	
-	('amlogic,meson8-gpio-intc', 'amlogic,meson8b-gpio-intc', 'amlogic,meson-gxbb-gpio-intc', 'amlogic,meson-gxl-gpio-intc', 'amlogic,meson-axg-gpio-intc', 'amlogic,meson-g12a-gpio-intc', 'amlogic,meson-sm1-gpio-intc', 'amlogic,meson-a1-gpio-intc') : 'irqchip',	
-	('fsl,1s1021a-msi', 'fsl,1s1043a-msi', 'fsl,ls1012a-msi', 'fsl,ls1021a-msi', 'fsl,ls1043a-msi', 'fsl,ls1043a-v1.1-msi', 'fsl,ls1046a-msi') : 'irqchip',	
-	('fsl,imx-irqsteer',) : 'irqchip',	
-	('ti,pruss-intc', 'ti,icssg-intc') : 'irqchip',	
-	('hisilicon,mbigen-v2',) : 'irqchip',	
-	('renesas,irqc',) : 'irqchip',	
-	('st,stm32mp1-exti',) : 'irqchip',	
-	('st,stih415-irq-syscfg', 'st,stih416-irq-syscfg', 'st,stih407-irq-syscfg', 'st,stid127-irq-syscfg') : 'irqchip',	
-	('fsl,imx-intmux',) : 'irqchip',	
-	('marvell,armada-8k-pic',) : 'irqchip',	
-	('renesas,intc-irqpin', 'renesas,intc-irqpin-r8a7778', 'renesas,intc-irqpin-r8a7779', 'renesas,intc-irqpin-r8a7740', 'renesas,intc-irqpin-sh73a0') : 'irqchip',	
-	('marvell,ap806-sei',) : 'irqchip',	
-	('marvell,ap806-gicp',) : 'irqchip',	
-	('technologic,ts4800-irqc',) : 'irqchip',	
-	('xiphera,xip8001b-trng',) : 'char',	
-	('atmel,at91sam9g45-trng', 'microchip,sam9x60-trng') : 'char',	
-	('fsl,imx21-rnga', 'fsl,imx31-rnga') : 'char',	
-	('fsl,imx25-rngb',) : 'char',	
-	('samsung,exynos5250-trng',) : 'char',	
-	('brcm,bcm2835-rng', 'brcm,bcm-nsp-rng', 'brcm,bcm5301x-rng', 'brcm,bcm6368-rng') : 'char',	
-	('brcm,bcm2711-rng200', 'brcm,bcm7211-rng200', 'brcm,bcm7278-rng200', 'brcm,iproc-rng200') : 'char',	
-	('arm,cryptocell-713-trng', 'arm,cryptocell-703-trng') : 'char',	
-	('nuvoton,npcm750-rng',) : 'char',	
-	('hisilicon,hip04-rng', 'hisilicon,hip05-rng') : 'char',	
-	('mediatek,mt7623-rng',) : 'char',	
-	('apm,xgene-rng',) : 'char',	
-	('nokia,n900-rom-rng',) : 'char',	
-	('timeriomem_rng',) : 'char',	
-	('ingenic,x1830-dtrng',) : 'char',	
-	('silex-insight,ba431-rng',) : 'char',	
-	('amlogic,meson-rng',) : 'char',	
-	('st,rng',) : 'char',	
-	('ingenic,jz4780-rng', 'ingenic,x1000-rng') : 'char',	
-	('st,stm32-rng',) : 'char',	
-	('ti,keystone-rng',) : 'char',	
-	('xlnx,opb-hwicap-1.00.b', 'xlnx,xps-hwicap-1.00.a') : 'char',	
-	('xillybus,xillybus-1.00.a', 'xlnx,xillybus-1.00.a') : 'char',	
-	('ibm,opal-oppanel',) : 'char',	
-	('nuvoton,npcm750-kcs-bmc',) : 'char',	
-	('ipmi-kcs', 'ipmi-smic', 'ipmi-bt') : 'char',	
-	('ibm,opal-ipmi',) : 'char',	
-	('aspeed,ast2400-ibt-bmc', 'aspeed,ast2500-ibt-bmc') : 'char',	
-	('aspeed,ast2400-kcs-bmc', 'aspeed,ast2500-kcs-bmc', 'aspeed,ast2400-kcs-bmc-v2', 'aspeed,ast2500-kcs-bmc-v2') : 'char',	
-	('socionext,synquacer-tpm-mmio',) : 'char',	
-	('tcg,tpm-tis-mmio',) : 'char',	
-	('atmel,at97sc3204t',) : 'char',	
-	('infineon,tpm_i2c_infineon', 'infineon,slb9635tt', 'infineon,slb9645tt') : 'char',	
-	('microsoft,ftpm',) : 'char',	
-	('st,st33htpm-spi', 'infineon,slb9670', 'tcg,tpm_tis-spi', 'google,cr50') : 'char',	
-	('nuvoton,npct501', 'winbond,wpct301', 'nuvoton,npct601') : 'char',	
-	('st,st33zp24-i2c',) : 'char',	
-	('st,st33zp24-spi',) : 'char',	
-	('ti,k2g-message-manager', 'ti,am654-secure-proxy') : 'mailbox',	
-	('rockchip,rk3368-mailbox',) : 'mailbox',	
-	('brcm,iproc-flexrm-mbox',) : 'mailbox',	
-	('fsl,imx7ulp-mu', 'fsl,imx6sx-mu', 'fsl,imx8-mu-scu') : 'mailbox',	
-	('nvidia,tegra186-hsp', 'nvidia,tegra194-hsp') : 'mailbox',	
-	('brcm,iproc-pdc-mbox', 'brcm,iproc-fa2-mbox') : 'mailbox',	
-	('brcm,bcm2835-mbox',) : 'mailbox',	
-	('qcom,ipq6018-apcs-apps-global', 'qcom,ipq8074-apcs-apps-global', 'qcom,msm8916-apcs-kpss-global', 'qcom,msm8994-apcs-kpss-global', 'qcom,msm8996-apcs-hmss-global', 'qcom,msm8998-apcs-hmss-global', 'qcom,qcs404-apcs-apps-global', 'qcom,sc7180-apss-shared', 'qcom,sdm660-apcs-hmss-global', 'qcom,sdm845-apss-shared', 'qcom,sm8150-apss-shared') : 'mailbox',	
-	('altr,mailbox-1.0',) : 'mailbox',	
-	('xlnx,zynqmp-ipi-mailbox',) : 'mailbox',	
-	('allwinner,sun6i-a31-msgbox',) : 'mailbox',	
-	('st,stm32mp1-ipcc',) : 'mailbox',	
-	('st,stih407-mailbox',) : 'mailbox',	
-	('apm,xgene-slimpro-mbox',) : 'mailbox',	
-	('sprd,sc9860-mailbox',) : 'mailbox',	
-	('hisilicon,hi6220-mbox',) : 'mailbox',	
-	('qcom,ipcc',) : 'mailbox',	
-	('amlogic,meson-gxbb-mhu',) : 'mailbox',	
-	('marvell,armada-3700-rwtm-mailbox',) : 'mailbox',	
-	('mailbox-test',) : 'mailbox',	
-	('hisilicon,hi3660-mbox',) : 'mailbox',	
-	('mediatek,mt8173-gce', 'mediatek,mt8183-gce', 'mediatek,mt6779-gce') : 'mailbox',	
-	('ti,am654-hbmc',) : 'mtd',	
-	('jedec,spi-nor',) : 'mtd',	
-	('nxp,lpc1773-spifi',) : 'mtd',	
-	('aspeed,ast2400-fmc', 'aspeed,ast2400-spi', 'aspeed,ast2500-fmc', 'aspeed,ast2500-spi') : 'mtd',	
-	('hisilicon,fmc-spi-nor',) : 'mtd',	
-	('amlogic,meson-gxl-nfc', 'amlogic,meson-axg-nfc') : 'mtd',	
-	('samsung,s3c2410-nand', 'samsung,s3c2412-nand', 'samsung,s3c2440-nand') : 'mtd',	
-	('fsl,upm-nand',) : 'mtd',	
-	('ti,am3352-elm',) : 'mtd',	
-	('ingenic,jz4780-bch',) : 'mtd',	
-	('ingenic,jz4740-nand', 'ingenic,jz4725b-nand', 'ingenic,jz4780-nand') : 'mtd',	
-	('ingenic,jz4725b-bch',) : 'mtd',	
-	('ingenic,jz4740-ecc',) : 'mtd',	
-	('marvell,orion-nand',) : 'mtd',	
-	('nxp,lpc3220-mlc',) : 'mtd',	
-	('fsl,mpc5121-nfc',) : 'mtd',	
-	('xlnx,zynqmp-nand-controller', 'arasan,nfc-v3p10') : 'mtd',	
-	('hisilicon,504-nfc',) : 'mtd',	
-	('fsl,vf610-nfc',) : 'mtd',	
-	('marvell,armada-8k-nand-controller', 'marvell,armada370-nand-controller', 'marvell,pxa3xx-nand-controller', 'marvell,armada-8k-nand', 'marvell,armada370-nand', 'marvell,pxa3xx-nand') : 'mtd',	
-	('cdns,hp-nfc',) : 'mtd',	
-	('nvidia,tegra20-nand',) : 'mtd',	
-	('atmel,at91sam9260-matrix', 'atmel,at91sam9261-matrix', 'atmel,at91sam9263-matrix', 'atmel,at91sam9rl-matrix', 'atmel,at91sam9g45-matrix', 'atmel,at91sam9n12-matrix', 'atmel,at91sam9x5-matrix', 'microchip,sam9x60-sfr', 'atmel,at91rm9200-nand-controller', 'atmel,at91sam9260-nand-controller', 'atmel,at91sam9261-nand-controller', 'atmel,at91sam9g45-nand-controller', 'atmel,sama5d3-nand-controller', 'microchip,sam9x60-nand-controller', 'atmel,at91rm9200-nand', 'atmel,sama5d4-nand', 'atmel,sama5d2-nand') : 'mtd',	
-	('atmel,sama5d4-nand', 'atmel,sama5d2-nand', 'atmel,at91sam9g45-pmecc', 'atmel,sama5d4-pmecc', 'atmel,sama5d2-pmecc') : 'mtd',	
-	('fsl,imx23-gpmi-nand', 'fsl,imx28-gpmi-nand', 'fsl,imx6q-gpmi-nand', 'fsl,imx6sx-gpmi-nand', 'fsl,imx7d-gpmi-nand') : 'mtd',	
-	('rockchip,px30-nfc', 'rockchip,rk2928-nfc', 'rockchip,rv1108-nfc') : 'mtd',	
-	('altr,socfpga-denali-nand', 'socionext,uniphier-denali-nand-v5a', 'socionext,uniphier-denali-nand-v5b') : 'mtd',	
-	('allwinner,sun4i-a10-nand', 'allwinner,sun8i-a23-nand-controller') : 'mtd',	
-	('mediatek,mt2701-nfc', 'mediatek,mt2712-nfc', 'mediatek,mt7622-nfc') : 'mtd',	
-	('oxsemi,ox820-nand',) : 'mtd',	
-	('gpio-control-nand',) : 'mtd',	
-	('renesas,shmobile-flctl-sh7372',) : 'mtd',	
-	('fsl,elbc-fcm-nand',) : 'mtd',	
-	('mxic,multi-itfc-v009-nand-controller',) : 'mtd',	
-	('fsl,imx21-nand', 'fsl,imx27-nand', 'fsl,imx25-nand', 'fsl,imx51-nand', 'fsl,imx53-nand') : 'mtd',	
-	('sigma,smp8758-nand',) : 'mtd',	
-	('intel,nand-controller', 'intel,lgm-ebunand') : 'mtd',	
-	('ibm,ndfc',) : 'mtd',	
-	('st,stm32mp15-fmc2', 'st,stm32mp1-fmc2-nfc') : 'mtd',	
-	('st,spear600-fsmc-nand', 'stericsson,fsmc-nand') : 'mtd',	
-	('fsl,ifc-nand',) : 'mtd',	
-	('qcom,ipq806x-nand', 'qcom,ipq4019-nand', 'qcom,ipq6018-nand', 'qcom,ipq8074-nand', 'qcom,sdx55-nand') : 'mtd',	
-	('ti,omap2-nand',) : 'mtd',	
-	('nxp,lpc3220-slc',) : 'mtd',	
-	('ti,davinci-nand', 'ti,keystone-nand') : 'mtd',	
-	('gen_nand',) : 'mtd',	
-	('brcm,brcmnand-v2.1', 'brcm,brcmnand-v2.2', 'brcm,brcmnand-v4.0', 'brcm,brcmnand-v5.0', 'brcm,brcmnand-v6.0', 'brcm,brcmnand-v6.1', 'brcm,brcmnand-v6.2', 'brcm,brcmnand-v7.0', 'brcm,brcmnand-v7.1', 'brcm,brcmnand-v7.2', 'brcm,brcmnand-v7.3') : 'mtd',	
-	('brcm,nand-bcm6368',) : 'mtd',	
-	('brcm,brcmnand',) : 'mtd',	
-	('brcm,nand-iproc',) : 'mtd',	
-	('brcm,nand-bcm63138',) : 'mtd',	
-	('mediatek,mt2701-ecc', 'mediatek,mt2712-ecc', 'mediatek,mt7622-ecc') : 'mtd',	
-	('lantiq,nand-xway',) : 'mtd',	
-	('spi-nand',) : 'mtd',	
-	('ti,omap2-onenand',) : 'mtd',	
-	('microchip,mchp23k256', 'microchip,mchp23lcv1024') : 'mtd',	
-	('st,spear600-smi',) : 'mtd',	
-	('atmel,at45', 'atmel,dataflash') : 'mtd',	
-	('m-systems,diskonchip-g3',) : 'mtd',	
-	('ibm,opal-flash',) : 'mtd',	
-	('st,spi-fsm',) : 'mtd',	
-	('fixed-partitions',) : 'mtd',	
-	('arm,arm-firmware-suite',) : 'mtd',	
-	('brcm,bcm963xx-imagetag',) : 'mtd',	
-	('brcm,bcm947xx-cfe-partitions',) : 'mtd',	
-	('brcm,trx',) : 'mtd',	
-	('redboot-fis',) : 'mtd',	
-	('brcm,bcm963xx-cfe-nor-partitions',) : 'mtd',	
-	('lantiq,nor',) : 'mtd',	
-	('arm,integrator-ap-syscon', 'arm,integrator-cp-syscon', 'arm,core-module-versatile', 'arm,realview-eb-syscon', 'arm,realview-pb1176-syscon', 'arm,realview-pb11mp-syscon', 'arm,realview-pba8-syscon', 'arm,realview-pbx-syscon', 'arm,external-bus-interface') : 'mtd',	
-	('cfi-flash', 'jedec-flash', 'mtd-ram', 'mtd-rom', 'direct-mapped') : 'mtd',	
-	('brcm,bcm7425-ahci', 'brcm,bcm7445-ahci', 'brcm,bcm63138-ahci', 'brcm,bcm-nsp-ahci', 'brcm,bcm7216-ahci') : 'ata',	
-	('ti,da850-ahci',) : 'ata',	
-	('arasan,cf-spear1340',) : 'ata',	
-	('nvidia,tegra124-ahci', 'nvidia,tegra210-ahci') : 'ata',	
-	('fsl,pq-sata', 'fsl,pq-sata-v2') : 'ata',	
-	('ti,dm816-ahci',) : 'ata',	
-	('cortina,gemini-sata-bridge',) : 'ata',	
-	('fsl,imx27-pata',) : 'ata',	
-	('renesas,rcar-sata', 'renesas,sata-r8a7779', 'renesas,sata-r8a7790', 'renesas,sata-r8a7790-es1', 'renesas,sata-r8a7791', 'renesas,sata-r8a7793', 'renesas,sata-r8a7795', 'renesas,rcar-gen2-sata', 'renesas,rcar-gen3-sata') : 'ata',	
-	('calxeda,hb-ahci',) : 'ata',	
-	('fsl,imx53-ahci', 'fsl,imx6q-ahci', 'fsl,imx6qp-ahci', 'fsl,imx8qm-ahci') : 'ata',	
-	('cavium,ebt3000-compact-flash',) : 'ata',	
-	('mediatek,mtk-ahci',) : 'ata',	
-	('allwinner,sun4i-a10-ahci', 'allwinner,sun8i-r40-ahci') : 'ata',	
-	('fsl,ls1021a-ahci', 'fsl,ls1028a-ahci', 'fsl,ls1043a-ahci', 'fsl,ls2080a-ahci', 'fsl,ls1046a-ahci', 'fsl,ls1088a-ahci', 'fsl,ls2088a-ahci', 'fsl,lx2160a-ahci') : 'ata',	
-	('ata-generic',) : 'ata',	
-	('marvell,armada-380-ahci', 'marvell,armada-3700-ahci') : 'ata',	
-	('fsl,mpc5200-ata', 'mpc5200-ata') : 'ata',	
-	('marvell,armada-370-sata', 'marvell,orion-sata') : 'ata',	
-	('amcc,sata-460ex',) : 'ata',	
-	('cavium,octeon-7130-sata-uctl',) : 'ata',	
-	('ceva,ahci-1v84',) : 'ata',	
-	('st,ahci',) : 'ata',	
-	('faraday,ftide010',) : 'ata',	
-	('generic-ahci', 'snps,spear-ahci', 'ibm,476gtr-ahci', 'snps,dwc-ahci', 'hisilicon,hisi-ahci', 'cavium,octeon-7130-ahci') : 'ata',	
-	('apm,xgene-ahci', 'apm,xgene-ahci-v2') : 'ata',	
-	('fsl,elbc-gpcm-uio', 'fsl,elbc-gpcm-uio') : 'uio',	
-	('nvidia,tegra30-ahb', 'nvidia,tegra20-ahb') : 'amba',	
-	('ti,omap3-1w', 'ti,am4372-hdq') : 'w1',	
-	('fsl,imx21-owire',) : 'w1',	
-	('w1-gpio',) : 'w1',	
-	('ti,da850-mstpri',) : 'bus',	
-	('fsl,qoriq-mc',) : 'bus',	
-	('ti,omap4-l3-noc', 'ti,omap5-l3-noc', 'ti,dra7-l3-noc', 'ti,am4372-l3-noc') : 'bus',	
-	('baikal,bt1-apb',) : 'bus',	
-	('hisilicon,hip06-lpc', 'hisilicon,hip07-lpc') : 'bus',	
-	('brcm,gisb-arb', 'brcm,bcm7445-gisb-arb', 'brcm,bcm7435-gisb-arb', 'brcm,bcm7400-gisb-arb', 'brcm,bcm7278-gisb-arb', 'brcm,bcm7038-gisb-arb') : 'bus',	
-	('allwinner,sun50i-a64-de2',) : 'bus',	
-	('technologic,ts-nbus',) : 'bus',	
-	('simple-bus', 'ti,sysc-omap2', 'ti,sysc-omap2-timer', 'ti,sysc-omap4', 'ti,sysc-omap4-timer', 'ti,sysc-omap4-simple', 'ti,sysc-omap3430-sr', 'ti,sysc-omap3630-sr', 'ti,sysc-omap4-sr', 'ti,sysc-omap3-sham', 'ti,sysc-omap-aes', 'ti,sysc-mcasp', 'ti,sysc-dra7-mcasp', 'ti,sysc-usb-host-fs', 'ti,sysc-dra7-mcan', 'ti,sysc-pruss') : 'bus',	
-	('ti,omap3-l3-smx',) : 'bus',	
-	('baikal,bt1-axi',) : 'bus',	
-	('allwinner,sun8i-a23-rsb',) : 'bus',	
-	('marvell,armada370-mbus', 'marvell,armada375-mbus', 'marvell,armada380-mbus', 'marvell,armadaxp-mbus', 'marvell,kirkwood-mbus', 'marvell,dove-mbus', 'marvell,orion5x-88f5281-mbus', 'marvell,orion5x-88f5182-mbus', 'marvell,orion5x-88f5181-mbus', 'marvell,orion5x-88f6183-mbus', 'marvell,mv78xx0-mbus') : 'bus',	
-	('nvidia,tegra210-aconnect',) : 'bus',	
-	('simple-pm-bus',) : 'bus',	
-	('socionext,uniphier-system-bus',) : 'bus',	
-	('cznic,moxtet',) : 'bus',	
-	('qcom,msm8660-ebi2', 'qcom,apq8060-ebi2') : 'bus',	
-	('arm,integrator-ap-syscon', 'arm,integrator-ap-lm') : 'bus',	
-	('ti,omap-ocp2scp', 'ti,am437x-ocp2scp') : 'bus',	
-	('fsl,imx1-weim', 'fsl,imx27-weim', 'fsl,imx50-weim', 'fsl,imx6q-weim', 'fsl,imx51-weim') : 'bus',	
-	('arm,cci-400', 'arm,cci-500', 'arm,cci-550', 'arm,cci-400-ctrl-if') : 'bus',	
-	('nvidia,tegra20-gmi', 'nvidia,tegra30-gmi') : 'bus',	
-	('qcom,spmi-pmic-arb',) : 'spmi',	
-	('ti,cc2560', 'ti,wl1271-st', 'ti,wl1273-st', 'ti,wl1281-st', 'ti,wl1283-st', 'ti,wl1285-st', 'ti,wl1801-st', 'ti,wl1805-st', 'ti,wl1807-st', 'ti,wl1831-st', 'ti,wl1835-st', 'ti,wl1837-st') : 'bluetooth',	
-	('qcom,wcnss-bt',) : 'bluetooth',	
-	('realtek,rtl8822cs-bt', 'realtek,rtl8723bs-bt') : 'bluetooth',	
-	('usb1286,204e', 'usbcf3,e300', 'usb4ca,301a') : 'bluetooth',	
-	('marvell,sd8897-bt', 'marvell,sd8997-bt') : 'bluetooth',	
-	('nokia,h4p-bluetooth',) : 'bluetooth',	
-	('mrvl,88w8897',) : 'bluetooth',	
-	('brcm,bcm20702a1', 'brcm,bcm4329-bt', 'brcm,bcm4345c5', 'brcm,bcm4330-bt', 'brcm,bcm43438-bt', 'brcm,bcm43540-bt', 'brcm,bcm4335a0') : 'bluetooth',	
-	('qcom,qca6174-bt', 'qcom,qca6390-bt', 'qcom,qca9377-bt', 'qcom,wcn3990-bt', 'qcom,wcn3991-bt', 'qcom,wcn3998-bt') : 'bluetooth',	
-	('mediatek,mt7622-bluetooth', 'mediatek,mt7663u-bluetooth', 'mediatek,mt7668u-bluetooth') : 'bluetooth',	
-	('rockchip,rk3399-dmc',) : 'devfreq',	
-	('samsung,exynos-bus',) : 'devfreq',	
-	('samsung,exynos5420-nocp',) : 'devfreq',	
-	('samsung,exynos-ppmu', 'samsung,exynos-ppmu-v2') : 'devfreq',	
-	('rockchip,rk3399-dfi',) : 'devfreq',	
-	('fsl,imx8mq-noc', 'fsl,imx8mm-noc', 'fsl,imx8mn-noc', 'fsl,imx8m-noc', 'fsl,imx8m-nic') : 'devfreq',	
-	('nvidia,tegra30-actmon', 'nvidia,tegra124-actmon') : 'devfreq',	
-	('fsl,imx8m-ddrc',) : 'devfreq',	
-	('mediatek,mt2701-m4u',) : 'iommu',	
-	('mediatek,mt2712-m4u', 'mediatek,mt6779-m4u', 'mediatek,mt8167-m4u', 'mediatek,mt8173-m4u', 'mediatek,mt8183-m4u') : 'iommu',	
-	('ti,omap2-iommu', 'ti,omap4-iommu', 'ti,dra7-iommu', 'ti,dra7-dsp-iommu') : 'iommu',	
-	('qcom,adreno', 'qcom,mdp4', 'qcom,mdss', 'qcom,sc7180-mdss', 'qcom,sc7180-mss-pil', 'qcom,sdm845-mdss', 'qcom,sdm845-mss-pil', 'qcom,msm8998-smmu-v2', 'qcom,sc7180-smmu-500', 'qcom,sdm630-smmu-v2', 'qcom,sdm845-smmu-500', 'qcom,sm8150-smmu-500', 'qcom,sm8250-smmu-500') : 'iommu',	
-	('arm,smmu-v1', 'arm,smmu-v2', 'arm,mmu-400', 'arm,mmu-401', 'arm,mmu-500', 'cavium,smmu-v2', 'nvidia,smmu-500', 'qcom,smmu-v2') : 'iommu',	
-	('qcom,msm-iommu-v1-ns', 'qcom,msm-iommu-v1-sec', 'qcom,msm-iommu-v1') : 'iommu',	
-	('arm,smmu-v3',) : 'iommu',	
-	('rockchip,iommu',) : 'iommu',	
-	('renesas,ipmmu-vmsa', 'renesas,ipmmu-r8a774a1', 'renesas,ipmmu-r8a774b1', 'renesas,ipmmu-r8a774c0', 'renesas,ipmmu-r8a774e1', 'renesas,ipmmu-r8a7795', 'renesas,ipmmu-r8a7796', 'renesas,ipmmu-r8a77961', 'renesas,ipmmu-r8a77965', 'renesas,ipmmu-r8a77970', 'renesas,ipmmu-r8a77990', 'renesas,ipmmu-r8a77995') : 'iommu',	
-	('fsl,qoriq-device-config-1.0', 'fsl,qoriq-device-config-2.0', 'fsl,t4240-l3-cache-controller', 'fsl,b4860-l3-cache-controller', 'fsl,p4080-l3-cache-controller') : 'iommu',	
-	('allwinner,sun50i-h6-iommu',) : 'iommu',	
-	('nvidia,tegra30-ahb',) : 'iommu',	
-	('qcom,apq8064-iommu',) : 'iommu',	
-	('lltc,lt3593',) : 'leds',	
-	('maxim,max77693-led',) : 'leds',	
-	('ti,lp5562',) : 'leds',	
-	('cznic,turris-omnia-leds',) : 'leds',	
-	('ti,lp8860',) : 'leds',	
-	('pwm-leds',) : 'leds',	
-	('ti,lm3532',) : 'leds',	
-	('ti,lp8501',) : 'leds',	
-	('issi,is31fl3190', 'issi,is31fl3191', 'issi,is31fl3193', 'issi,is31fl3196', 'issi,is31fl3199', 'si-en,sn3199') : 'leds',	
-	('kinetic,ktd2692',) : 'leds',	
-	('national,lp5521',) : 'leds',	
-	('issi,is31fl3236', 'issi,is31fl3235', 'issi,is31fl3218', 'si-en,sn3218', 'issi,is31fl3216', 'si-en,sn3216') : 'leds',	
-	('mediatek,mt6323-led',) : 'leds',	
-	('skyworks,aat1290',) : 'leds',	
-	('ubnt,acb-spi-led',) : 'leds',	
-	('lacie,ns2-leds',) : 'leds',	
-	('richtek,rt8515',) : 'leds',	
-	('gpio-leds',) : 'leds',	
-	('national,lp5523', 'ti,lp55231') : 'leds',	
-	('crane,cr0014114',) : 'leds',	
-	('qcom,pm8058-led', 'qcom,pm8058-keypad-led', 'qcom,pm8058-flash-led') : 'leds',	
-	('sgmicro,sgm3140',) : 'leds',	
-	('panasonic,an30259a',) : 'leds',	
-	('ti,lm3697',) : 'leds',	
-	('motorola,cpcap-led-red', 'motorola,cpcap-led-green', 'motorola,cpcap-led-blue', 'motorola,cpcap-led-adl', 'motorola,cpcap-led-cp') : 'leds',	
-	('nxp,pca9550', 'nxp,pca9551', 'nxp,pca9552', 'ibm,pca9552', 'nxp,pca9553') : 'leds',	
-	('sprd,sc2731-bltc',) : 'leds',	
-	('ti,tlc59116', 'ti,tlc59108') : 'leds',	
-	('ti,lm36010', 'ti,lm36011') : 'leds',	
-	('maxim,max77650-led',) : 'leds',	
-	('crane,el15203000',) : 'leds',	
-	('register-bit-led',) : 'leds',	
-	('ti,lp5009', 'ti,lp5012', 'ti,lp5018', 'ti,lp5024', 'ti,lp5030', 'ti,lp5036') : 'leds',	
-	('ti,lm36922', 'ti,lm36923') : 'leds',	
-	('lacie,netxbig-leds',) : 'leds',	
-	('nxp,pca9632', 'nxp,pca9633', 'nxp,pca9634', 'nxp,pca9635') : 'leds',	
-	('awinic,aw2013',) : 'leds',	
-	('ti,lm36274-backlight',) : 'leds',	
-	('nxp,pca9530', 'nxp,pca9531', 'nxp,pca9532', 'nxp,pca9533') : 'leds',	
-	('ams,as3645a',) : 'leds',	
-	('ti,tca6507',) : 'leds',	
-	('brcm,bcm6358-leds',) : 'leds',	
-	('brcm,bcm6328-leds',) : 'leds',	
-	('i2cpcf,8584',) : 'sbus',	
-	('SUNW,bbc-i2c',) : 'sbus',	
-	('cirrus,ep7209-fb',) : 'video/fbdev',	
-	('marvell,pxa270-lcdc', 'marvell,pxa300-lcdc', 'marvell,pxa2xx-lcdc') : 'video/fbdev',	
-	('wm,wm8505-fb',) : 'video/fbdev',	
-	('atmel,at91sam9261-lcdc', 'atmel,at91sam9263-lcdc', 'atmel,at91sam9g10-lcdc', 'atmel,at91sam9g45-lcdc', 'atmel,at91sam9g45es-lcdc', 'atmel,at91sam9rl-lcdc') : 'video/fbdev',	
-	('simple-framebuffer',) : 'video/fbdev',	
-	('via,vt8500-fb',) : 'video/fbdev',	
-	('ti,omap2-dispc', 'ti,omap3-dispc', 'ti,omap4-dispc', 'ti,omap5-dispc', 'ti,dra7-dispc') : 'gpu',	
-	('ti,omap3-dsi', 'ti,omap4-dsi', 'ti,omap5-dsi') : 'gpu',	
-	('ti,omap5-hdmi', 'ti,dra7-hdmi') : 'gpu',	
-	('ti,omap4-hdmi',) : 'gpu',	
-	('ti,omap2-dss', 'ti,omap3-dss', 'ti,omap4-dss', 'ti,omap5-dss', 'ti,dra7-dss') : 'gpu',	
-	('ti,omap2-venc', 'ti,omap3-venc', 'ti,omap4-venc') : 'gpu',	
-	('omapdss,panel-dpi',) : 'video/fbdev',	
-	('omapdss,sharp,ls037v7dw01',) : 'video/fbdev',	
-	('omapdss,tpo,td028ttec1', 'omapdss,toppoly,td028ttec1') : 'video/fbdev',	
-	('omapdss,ti,tpd12s015',) : 'video/fbdev',	
-	('omapdss,hdmi-connector',) : 'video/fbdev',	
-	('omapdss,svideo-connector', 'omapdss,composite-video-connector') : 'video/fbdev',	
-	('omapdss,dvi-connector',) : 'video/fbdev',	
-	('omapdss,ti,opa362',) : 'video/fbdev',	
-	('omapdss,panel-dsi-cm',) : 'gpu',	
-	('omapdss,sony,acx565akm',) : 'video/fbdev',	
-	('omapdss,ti,tfp410',) : 'video/fbdev',	
-	('omapdss,lgphilips,lb035q02',) : 'video/fbdev',	
-	('omapdss,tpo,td043mtea1',) : 'video/fbdev',	
-	('omapdss,nec,nl8048hl11',) : 'video/fbdev',	
-	('wm,prizm-ge-rops',) : 'video/fbdev',	
-	('fsl,mpc5121-diu', 'fsl,diu') : 'video/fbdev',	
-	('fujitsu,MB86276', 'fujitsu,lime', 'fujitsu,MB86277', 'fujitsu,mint', 'fujitsu,MB86293', 'fujitsu,MB86294', 'fujitsu,coral') : 'video/fbdev',	
-	('opencores,ocfb',) : 'video/fbdev',	
-	('solomon,ssd1305fb-i2c', 'solomon,ssd1306fb-i2c', 'solomon,ssd1307fb-i2c', 'solomon,ssd1309fb-i2c') : 'video/fbdev',	
-	('google,goldfish-fb',) : 'video/fbdev',	
-	('fsl,imx1-fb', 'fsl,imx21-fb') : 'video/fbdev',	
-	('marvell,pxa300-gcu',) : 'video/fbdev',	
-	('xlnx,xps-tft-1.00.a', 'xlnx,xps-tft-2.00.a', 'xlnx,xps-tft-2.01.a', 'xlnx,plb-tft-cntlr-ref-1.00.a', 'xlnx,plb-dvi-cntlr-ref-1.00.c') : 'video/fbdev',	
-	('pwm-backlight',) : 'video/backlight',	
-	('qcom,pm8941-wled', 'qcom,pmi8998-wled', 'qcom,pm660l-wled', 'qcom,pm8150l-wled') : 'video/backlight',	
-	('platform-lcd',) : 'video/backlight',	
-	('skyworks,sky81452-backlight',) : 'video/backlight',	
-	('arc,arc2c0608',) : 'video/backlight',	
-	('ti,tps65217-bl',) : 'video/backlight',	
-	('gpio-backlight',) : 'video/backlight',	
-	('himax,hx8357', 'himax,hx8369') : 'video/backlight',	
-	('kinetic,ktd253',) : 'video/backlight',	
-	('ti,lp8550', 'ti,lp8551', 'ti,lp8552', 'ti,lp8553', 'ti,lp8555', 'ti,lp8556', 'ti,lp8557') : 'video/backlight',	
-	('led-backlight',) : 'video/backlight',	
-	('zii,rave-sp-backlight',) : 'video/backlight',	
-	('ti,lm3630a',) : 'video/backlight',	
-	('atmel,at91sam9260-ebi', 'atmel,at91sam9261-ebi', 'atmel,at91sam9263-ebi0', 'atmel,at91sam9263-ebi1', 'atmel,at91sam9rl-ebi', 'atmel,at91sam9g45-ebi', 'atmel,at91sam9x5-ebi', 'atmel,sama5d3-ebi', 'microchip,sam9x60-ebi') : 'memory',	
-	('brcm,bcm7268-dpfe-cpu', 'brcm,bcm7271-dpfe-cpu', 'brcm,bcm7278-dpfe-cpu', 'brcm,bcm7211-dpfe-cpu', 'brcm,dpfe-cpu') : 'memory',	
-	('ti,emif-4d', 'ti,emif-4d5') : 'memory',	
-	('fsl,ifc',) : 'memory',	
-	('ti,davinci-aemif', 'ti,da850-aemif') : 'memory',	
-	('ti,emif-am3352', 'ti,emif-am4372') : 'memory',	
-	('st,stm32mp1-fmc2-ebi',) : 'memory',	
-	('samsung,exynos5422-dmc',) : 'memory',	
-	('marvell,mvebu-devbus', 'marvell,orion-devbus') : 'memory',	
-	('mediatek,mt8167-smi-larb', 'mediatek,mt8173-smi-larb', 'mediatek,mt2701-smi-larb', 'mediatek,mt2712-smi-larb', 'mediatek,mt6779-smi-larb', 'mediatek,mt8183-smi-larb', 'mediatek,mt8192-smi-larb', 'mediatek,mt8173-smi-common', 'mediatek,mt8167-smi-common', 'mediatek,mt2701-smi-common', 'mediatek,mt2712-smi-common', 'mediatek,mt6779-smi-common', 'mediatek,mt8183-smi-common', 'mediatek,mt8192-smi-common') : 'memory',	
-	('ti,omap2420-gpmc', 'ti,omap2430-gpmc', 'ti,omap3430-gpmc', 'ti,omap4430-gpmc', 'ti,am3352-gpmc') : 'memory',	
-	('renesas,rcar-gen3-rpc-if',) : 'memory',	
-	('ingenic,jz4740-nemc', 'ingenic,jz4780-nemc') : 'memory',	
-	('atmel,at91rm9200-sdramc', 'atmel,at91sam9260-sdramc', 'atmel,at91sam9g45-ddramc', 'atmel,sama5d3-ddramc') : 'memory',	
-	('baikal,bt1-l2-ctl',) : 'memory',	
-	('cfi-flash', 'arm,pl353-nand-r2p1') : 'memory',	
-	('nvidia,tegra20-mc-gart', 'nvidia,tegra30-mc', 'nvidia,tegra114-mc', 'nvidia,tegra124-mc', 'nvidia,tegra132-mc', 'nvidia,tegra210-mc') : 'memory',	
-	('nvidia,tegra210-emc',) : 'memory',	
-	('nvidia,tegra186-emc', 'nvidia,tegra194-emc') : 'memory',	
-	('nvidia,tegra20-emc',) : 'memory',	
-	('nvidia,tegra186-mc', 'nvidia,tegra194-mc') : 'memory',	
-	('nvidia,tegra124-emc', 'nvidia,tegra132-emc') : 'memory',	
-	('nvidia,tegra30-emc',) : 'memory',	
-	('ti,da850-ddr-controller',) : 'memory',	
-	('fsl,corenet1-cf', 'fsl,corenet2-cf') : 'memory',	
-	('qcom,slim-ngd-v1.5.0', 'qcom,slim-ngd-v2.1.0') : 'slimbus',	
-	('qcom,slim', 'qcom,apq8064-slim') : 'slimbus',	
-	('adi,adg792a', 'adi,adg792g') : 'mux',	
-	('adi,adgs1408', 'adi,adgs1409') : 'mux',	
-	('gpio-mux',) : 'mux',	
-	('mmio-mux', 'reg-mux') : 'mux',	
-	('idt,8a34000', 'idt,8a34001', 'idt,8a34002', 'idt,8a34003', 'idt,8a34004', 'idt,8a34005', 'idt,8a34006', 'idt,8a34007', 'idt,8a34008', 'idt,8a34009', 'idt,8a34010', 'idt,8a34011', 'idt,8a34012', 'idt,8a34013', 'idt,8a34014', 'idt,8a34015', 'idt,8a34016', 'idt,8a34017', 'idt,8a34018', 'idt,8a34019', 'idt,8a34040', 'idt,8a34041', 'idt,8a34042', 'idt,8a34043', 'idt,8a34044', 'idt,8a34045', 'idt,8a34046', 'idt,8a34047', 'idt,8a34048', 'idt,8a34049') : 'ptp',	
-	('ines,ptp-ctrl',) : 'ptp',	
-	('idt,82p33810', 'idt,82p33813', 'idt,82p33814', 'idt,82p33831', 'idt,82p33910', 'idt,82p33913', 'idt,82p33914', 'idt,82p33931') : 'ptp',	
-	('brcm,ptp-dte',) : 'ptp',	
-	('fsl,etsec-ptp', 'fsl,fman-ptp-timer') : 'ptp',	
-	('xlnx,opb-sysace-1.00.b', 'xlnx,opb-sysace-1.00.c', 'xlnx,xps-sysace-1.00.a', 'xlnx,sysace') : 'block',	
-	('atmel,at91rm9200-cf',) : 'pcmcia',	
-	('qcom,soundwire-v1.3.0', 'qcom,soundwire-v1.5.1') : 'soundwire',	
-	('cavium,pci-host-thunder-pem',) : 'pci',	
-	('xlnx,nwl-pcie-2.11',) : 'pci',	
-	('renesas,pcie-r8a7779', 'renesas,pcie-r8a7790', 'renesas,pcie-r8a7791', 'renesas,pcie-rcar-gen2', 'renesas,pcie-r8a7795', 'renesas,pcie-rcar-gen3') : 'pci',	
-	('renesas,pci-r8a7790', 'renesas,pci-r8a7791', 'renesas,pci-r8a7794', 'renesas,pci-rcar-gen2') : 'pci',	
-	('apm,xgene1-msi',) : 'pci',	
-	('rockchip,rk3399-pcie',) : 'pci',	
-	('apm,xgene-pcie',) : 'pci',	
-	('arm,versatile-pci',) : 'pci',	
-	('brcm,iproc-pcie', 'brcm,iproc-pcie-paxb-v2', 'brcm,iproc-pcie-paxc', 'brcm,iproc-pcie-paxc-v2') : 'pci',	
-	('xlnx,axi-pcie-host-1.00.a',) : 'pci',	
-	('brcm,bcm2711-pcie', 'brcm,bcm7211-pcie', 'brcm,bcm7278-pcie', 'brcm,bcm7216-pcie', 'brcm,bcm7445-pcie') : 'pci',	
-	('pci-host-cam-generic', 'pci-host-ecam-generic', 'marvell,armada8k-pcie-ecam', 'socionext,synquacer-pcie-ecam', 'snps,dw-pcie-ecam') : 'pci',	
-	('renesas,r8a774c0-pcie-ep', 'renesas,rcar-gen3-pcie-ep') : 'pci',	
-	('fsl,lx2160a-pcie',) : 'pci',	
-	('mbvl,gpex40-pcie',) : 'pci',	
-	('sigma,smp8759-pcie',) : 'pci',	
-	('v3,v360epc-pci',) : 'pci',	
-	('marvell,armada-3700-pcie',) : 'pci',	
-	('nvidia,tegra186-pcie', 'nvidia,tegra210-pcie', 'nvidia,tegra124-pcie', 'nvidia,tegra30-pcie', 'nvidia,tegra20-pcie') : 'pci',	
-	('cdns,cdns-pcie-host', 'cdns,cdns-pcie-ep') : 'pci',	
-	('ti,j721e-pcie-host', 'ti,j721e-pcie-ep') : 'pci',	
-	('xlnx,versal-cpm-host-1.00',) : 'pci',	
-	('cavium,pci-host-thunder-ecam',) : 'pci',	
-	('marvell,armada-xp-pcie', 'marvell,armada-370-pcie', 'marvell,dove-pcie', 'marvell,kirkwood-pcie') : 'pci',	
-	('altr,msi-1.0',) : 'pci',	
-	('altr,pcie-root-port-1.0', 'altr,pcie-root-port-2.0') : 'pci',	
-	('faraday,ftpci100', 'faraday,ftpci100-dual') : 'pci',	
-	('axis,artpec6-pcie', 'axis,artpec6-pcie-ep', 'axis,artpec7-pcie', 'axis,artpec7-pcie-ep') : 'pci',	
-	('ti,keystone-pcie', 'ti,am654-pcie-rc', 'ti,am654-pcie-ep') : 'pci',	
-	('marvell,armada8k-pcie',) : 'pci',	
-	('st,spear1340-pcie',) : 'pci',	
-	('nvidia,tegra194-pcie', 'nvidia,tegra194-pcie-ep') : 'pci',	
-	('intel,lgm-pcie',) : 'pci',	
-	('amlogic,axg-pcie', 'amlogic,g12a-pcie') : 'pci',	
-	('socionext,uniphier-pcie',) : 'pci',	
-	('fsl,imx6q-pcie', 'fsl,imx6sx-pcie', 'fsl,imx6qp-pcie', 'fsl,imx7d-pcie', 'fsl,imx8mq-pcie') : 'pci',	
-	('hisilicon,kirin960-pcie',) : 'pci',	
-	('snps,dw-pcie', 'snps,dw-pcie-ep') : 'pci',	
-	('fsl,ls1012a-pcie', 'fsl,ls1021a-pcie', 'fsl,ls1028a-pcie', 'fsl,ls1043a-pcie', 'fsl,ls1046a-pcie', 'fsl,ls2080a-pcie', 'fsl,ls2085a-pcie', 'fsl,ls2088a-pcie', 'fsl,ls1088a-pcie') : 'pci',	
-	('hisilicon,hi3798cv200-pcie',) : 'pci',	
-	('ti,dra7-pcie', 'ti,dra7-pcie-ep', 'ti,dra746-pcie-rc', 'ti,dra726-pcie-rc', 'ti,dra746-pcie-ep', 'ti,dra726-pcie-ep') : 'pci',	
-	('qcom,pcie-apq8084', 'qcom,pcie-ipq8064', 'qcom,pcie-ipq8064-v2', 'qcom,pcie-apq8064', 'qcom,pcie-msm8996', 'qcom,pcie-ipq8074', 'qcom,pcie-ipq4019', 'qcom,pcie-qcs404', 'qcom,pcie-sdm845', 'qcom,pcie-sm8250') : 'pci',	
-	('socionext,uniphier-pro5-pcie-ep',) : 'pci',	
-	('samsung,exynos5433-pcie',) : 'pci',	
-	('fsl,ls1046a-pcie-ep', 'fsl,ls1088a-pcie-ep', 'fsl,ls2088a-pcie-ep') : 'pci',	
-	('amazon,al-alpine-v2-pcie', 'amazon,al-alpine-v3-pcie') : 'pci',	
-	('mediatek,mt2701-pcie', 'mediatek,mt7623-pcie', 'mediatek,mt2712-pcie', 'mediatek,mt7622-pcie', 'mediatek,mt7629-pcie') : 'pci',	
-	('loongson,ls2k-pci', 'loongson,ls7a-pci', 'loongson,rs780e-pci') : 'pci',	
-	('rockchip,rk3399-pcie-ep',) : 'pci',	
-	('virtio,mmio', 'virtio,mmio') : 'virtio',	
-	('arm,psci-1.0',) : 'cpuidle',	
-	('arm,idle-state',) : 'cpuidle',	
-	('qcom,idle-state-spc', 'qcom,msm8974-saw2-v2.1-cpu', 'qcom,apq8084-saw2-v2.1-cpu', 'qcom,apq8064-saw2-v1.1-cpu') : 'cpuidle',	
-	('arm,idle-state', 'arm,vexpress,v2p-ca15_a7', 'google,peach') : 'cpuidle',	
-	('sirf,atlas7-ioc', 'sirf,atlas7-gpio') : 'pinctrl',	
-	('sirf,prima2-rsc', 'sirf,prima2-pinctrl', 'sirf,atlas6-pinctrl') : 'pinctrl',	
-	('via,vt8500-pinctrl',) : 'pinctrl',	
-	('wm,wm8850-pinctrl',) : 'pinctrl',	
-	('wm,wm8505-pinctrl',) : 'pinctrl',	
-	('wm,wm8750-pinctrl',) : 'pinctrl',	
-	('wm,wm8650-pinctrl',) : 'pinctrl',	
-	('microchip,sparx5-sgpio', 'mscc,luton-sgpio', 'mscc,ocelot-sgpio') : 'pinctrl',	
-	('semtech,sx1501q', 'semtech,sx1502q', 'semtech,sx1503q', 'semtech,sx1504q', 'semtech,sx1505q', 'semtech,sx1506q', 'semtech,sx1507q', 'semtech,sx1508q', 'semtech,sx1509q') : 'pinctrl',	
-	('bitmain,bm1880-pinctrl',) : 'pinctrl',	
-	('lantiq,pinctrl-falcon',) : 'pinctrl',	
-	('cortina,gemini-pinctrl',) : 'pinctrl',	
-	('marvell,berlin2-soc-pinctrl', 'marvell,berlin2-system-pinctrl') : 'pinctrl',	
-	('syna,as370-soc-pinctrl',) : 'pinctrl',	
-	('marvell,berlin4ct-soc-pinctrl', 'marvell,berlin4ct-avio-pinctrl', 'marvell,berlin4ct-system-pinctrl') : 'pinctrl',	
-	('marvell,berlin2q-soc-pinctrl', 'marvell,berlin2q-system-pinctrl') : 'pinctrl',	
-	('marvell,berlin2cd-soc-pinctrl', 'marvell,berlin2cd-system-pinctrl') : 'pinctrl',	
-	('stericsson,pinctrl-u300',) : 'pinctrl',	
-	('ti,omap3-padconf', 'ti,omap4-padconf', 'ti,omap5-padconf', 'ti,dra7-padconf', 'ti,am437-padconf', 'pinctrl-single', 'pinconf-single') : 'pinctrl',	
-	('zte,zx296718-pmm',) : 'pinctrl',	
-	('atmel,sama5d2-pinctrl', 'microchip,sama7g5-pinctrl') : 'pinctrl',	
-	('microchip,mcp23008', 'microchip,mcp23017', 'microchip,mcp23018', 'mcp,mcp23008', 'mcp,mcp23017') : 'pinctrl',	
-	('oxsemi,ox810se-pinctrl', 'oxsemi,ox820-pinctrl', 'oxsemi,ox810se-gpio', 'oxsemi,ox820-gpio') : 'pinctrl',	
-	('socionext,uniphier-pro4-pinctrl',) : 'pinctrl',	
-	('socionext,uniphier-pxs3-pinctrl',) : 'pinctrl',	
-	('socionext,uniphier-ld11-pinctrl',) : 'pinctrl',	
-	('socionext,uniphier-sld8-pinctrl',) : 'pinctrl',	
-	('socionext,uniphier-pxs2-pinctrl',) : 'pinctrl',	
-	('socionext,uniphier-pro5-pinctrl',) : 'pinctrl',	
-	('socionext,uniphier-ld20-pinctrl',) : 'pinctrl',	
-	('socionext,uniphier-ld6b-pinctrl',) : 'pinctrl',	
-	('socionext,uniphier-ld4-pinctrl',) : 'pinctrl',	
-	('brcm,bcm11351-pinctrl',) : 'pinctrl',	
-	('brcm,ns2-pinmux',) : 'pinctrl',	
-	('brcm,cygnus-pinmux',) : 'pinctrl',	
-	('brcm,nsp-pinmux',) : 'pinctrl',	
-	('brcm,bcm2835-gpio', 'brcm,bcm2711-gpio', 'brcm,bcm7211-gpio') : 'pinctrl',	
-	('brcm,bcm4708-pinmux', 'brcm,bcm4709-pinmux', 'brcm,bcm53012-pinmux') : 'pinctrl',	
-	('brcm,nsp-gpio-a',) : 'pinctrl',	
-	('brcm,iproc-gpio', 'brcm,cygnus-ccm-gpio', 'brcm,cygnus-asiu-gpio', 'brcm,cygnus-crmu-gpio', 'brcm,iproc-nsp-gpio', 'brcm,iproc-stingray-gpio') : 'pinctrl',	
-	('samsung,exynos3250-pinctrl', 'samsung,exynos4210-pinctrl', 'samsung,exynos4x12-pinctrl', 'samsung,exynos5250-pinctrl', 'samsung,exynos5260-pinctrl', 'samsung,exynos5410-pinctrl', 'samsung,exynos5420-pinctrl', 'samsung,s5pv210-pinctrl', 'samsung,exynos5433-pinctrl', 'samsung,exynos7-pinctrl', 'samsung,s3c64xx-pinctrl', 'samsung,s3c2412-pinctrl', 'samsung,s3c2416-pinctrl', 'samsung,s3c2440-pinctrl', 'samsung,s3c2450-pinctrl') : 'pinctrl',	
-	('samsung,s5pv210-wakeup-eint', 'samsung,exynos4210-wakeup-eint', 'samsung,exynos7-wakeup-eint') : 'pinctrl',	
-	('samsung,s3c2410-wakeup-eint', 'samsung,s3c2412-wakeup-eint') : 'pinctrl',	
-	('samsung,s3c64xx-wakeup-eint',) : 'pinctrl',	
-	('ams,as3722-pinctrl',) : 'pinctrl',	
-	('ti,palmas-pinctrl', 'ti,tps65913-pinctrl', 'ti,tps80036-pinctrl') : 'pinctrl',	
-	('axis,artpec6-pinctrl',) : 'pinctrl',	
-	('mscc,luton-pinctrl', 'mscc,serval-pinctrl', 'mscc,ocelot-pinctrl', 'mscc,jaguar2-pinctrl', 'microchip,sparx5-pinctrl') : 'pinctrl',	
-	('amlogic,meson8b-cbus-pinctrl', 'amlogic,meson8b-aobus-pinctrl') : 'pinctrl',	
-	('amlogic,meson8-cbus-pinctrl', 'amlogic,meson8-aobus-pinctrl', 'amlogic,meson8m2-cbus-pinctrl', 'amlogic,meson8m2-aobus-pinctrl') : 'pinctrl',	
-	('amlogic,meson-axg-periphs-pinctrl', 'amlogic,meson-axg-aobus-pinctrl') : 'pinctrl',	
-	('amlogic,meson-gxl-periphs-pinctrl', 'amlogic,meson-gxl-aobus-pinctrl') : 'pinctrl',	
-	('amlogic,meson-g12a-periphs-pinctrl', 'amlogic,meson-g12a-aobus-pinctrl') : 'pinctrl',	
-	('amlogic,meson-a1-periphs-pinctrl',) : 'pinctrl',	
-	('amlogic,meson-gxbb-periphs-pinctrl', 'amlogic,meson-gxbb-aobus-pinctrl') : 'pinctrl',	
-	('marvell,dove-pinctrl',) : 'pinctrl',	
-	('marvell,mv88f6920-pinctrl', 'marvell,mv88f6925-pinctrl', 'marvell,mv88f6928-pinctrl') : 'pinctrl',	
-	('marvell,mv88f6710-pinctrl',) : 'pinctrl',	
-	('marvell,armada3710-sb-pinctrl', 'marvell,armada3710-nb-pinctrl') : 'pinctrl',	
-	('marvell,ap806-pinctrl',) : 'pinctrl',	
-	('marvell,mv88f6810-pinctrl', 'marvell,mv88f6820-pinctrl', 'marvell,mv88f6828-pinctrl') : 'pinctrl',	
-	('marvell,88f6180-pinctrl', 'marvell,88f6190-pinctrl', 'marvell,88f6192-pinctrl', 'marvell,88f6281-pinctrl', 'marvell,88f6282-pinctrl', 'marvell,98dx4122-pinctrl', 'marvell,98dx1135-pinctrl') : 'pinctrl',	
-	('marvell,mv88f6720-pinctrl',) : 'pinctrl',	
-	('marvell,mv78230-pinctrl', 'marvell,mv78260-pinctrl', 'marvell,mv78460-pinctrl', 'marvell,98dx3236-pinctrl', 'marvell,98dx4251-pinctrl') : 'pinctrl',	
-	('marvell,88f5181-pinctrl', 'marvell,88f5181l-pinctrl', 'marvell,88f5182-pinctrl', 'marvell,88f5281-pinctrl') : 'pinctrl',	
-	('actions,s700-pinctrl',) : 'pinctrl',	
-	('actions,s500-pinctrl',) : 'pinctrl',	
-	('actions,s900-pinctrl',) : 'pinctrl',	
-	('st,stih407-sbc-pinctrl', 'st,stih407-front-pinctrl', 'st,stih407-rear-pinctrl', 'st,stih407-flash-pinctrl') : 'pinctrl',	
-	('microchip,pic32mzda-pinctrl', 'microchip,pic32mzda-gpio') : 'pinctrl',	
-	('cnxt,cx92755-pinctrl',) : 'pinctrl',	
-	('cirrus,lochnagar-pinctrl',) : 'pinctrl',	
-	('allwinner,sun8i-a23-r-pinctrl',) : 'pinctrl',	
-	('allwinner,sun8i-a83t-pinctrl',) : 'pinctrl',	
-	('allwinner,sun6i-a31-pinctrl', 'allwinner,sun6i-a31s-pinctrl') : 'pinctrl',	
-	('allwinner,sun8i-h3-pinctrl',) : 'pinctrl',	
-	('allwinner,sun8i-a33-pinctrl',) : 'pinctrl',	
-	('allwinner,sun4i-a10-pinctrl', 'allwinner,sun7i-a20-pinctrl', 'allwinner,sun8i-r40-pinctrl') : 'pinctrl',	
-	('allwinner,sun8i-h3-r-pinctrl',) : 'pinctrl',	
-	('allwinner,sun50i-h6-pinctrl',) : 'pinctrl',	
-	('allwinner,sun6i-a31-r-pinctrl',) : 'pinctrl',	
-	('allwinner,sun8i-a23-pinctrl',) : 'pinctrl',	
-	('allwinner,sun50i-a64-pinctrl',) : 'pinctrl',	
-	('allwinner,sun50i-a64-r-pinctrl',) : 'pinctrl',	
-	('allwinner,sun50i-a100-r-pinctrl',) : 'pinctrl',	
-	('allwinner,sun50i-a100-pinctrl',) : 'pinctrl',	
-	('allwinner,sun50i-h6-r-pinctrl',) : 'pinctrl',	
-	('allwinner,sun8i-v3-pinctrl', 'allwinner,sun8i-v3s-pinctrl') : 'pinctrl',	
-	('allwinner,sun9i-a80-pinctrl',) : 'pinctrl',	
-	('allwinner,sun5i-a10s-pinctrl', 'allwinner,sun5i-a13-pinctrl', 'nextthing,gr8-pinctrl') : 'pinctrl',	
-	('allwinner,sun50i-h5-pinctrl',) : 'pinctrl',	
-	('allwinner,sun9i-a80-r-pinctrl',) : 'pinctrl',	
-	('allwinner,sun8i-a83t-r-pinctrl',) : 'pinctrl',	
-	('allwinner,suniv-f1c100s-pinctrl',) : 'pinctrl',	
-	('ti,dra7-iodelay',) : 'pinctrl',	
-	('ti,da850-pupd',) : 'pinctrl',	
-	('toshiba,tmpv7708-pinctrl',) : 'pinctrl',	
-	('fsl,imx1-iomuxc',) : 'pinctrl',	
-	('fsl,imx23-pinctrl',) : 'pinctrl',	
-	('fsl,imx6sll-iomuxc-gpr', 'fsl,imx6sll-iomuxc') : 'pinctrl',	
-	('fsl,imx8mp-iomuxc-gpr', 'fsl,imx8mp-iomuxc') : 'pinctrl',	
-	('fsl,imx8dxl-iomuxc',) : 'pinctrl',	
-	('fsl,imx8mm-iomuxc-gpr', 'fsl,imx8mm-iomuxc') : 'pinctrl',	
-	('fsl,imx51-iomuxc',) : 'pinctrl',	
-	('fsl,imx6q-iomuxc-gpr', 'fsl,imx6q-iomuxc') : 'pinctrl',	
-	('fsl,imx8mn-iomuxc-gpr', 'fsl,imx8mn-iomuxc') : 'pinctrl',	
-	('fsl,imx28-pinctrl',) : 'pinctrl',	
-	('fsl,imx8mq-iomuxc-gpr', 'fsl,imx8mq-iomuxc') : 'pinctrl',	
-	('fsl,imx27-iomuxc',) : 'pinctrl',	
-	('fsl,imx7ulp-iomuxc1',) : 'pinctrl',	
-	('fsl,imx6ul-iomuxc-gpr', 'fsl,imx6ul-iomuxc', 'fsl,imx6ull-iomuxc-snvs') : 'pinctrl',	
-	('fsl,imx53-iomuxc-gpr', 'fsl,imx53-iomuxc') : 'pinctrl',	
-	('fsl,imx8qxp-iomuxc',) : 'pinctrl',	
-	('fsl,imx50-iomuxc-gpr', 'fsl,imx50-iomuxc') : 'pinctrl',	
-	('fsl,vf610-iomuxc',) : 'pinctrl',	
-	('fsl,imx6sl-iomuxc-gpr', 'fsl,imx6sl-iomuxc') : 'pinctrl',	
-	('fsl,imx6sx-iomuxc-gpr', 'fsl,imx6sx-iomuxc') : 'pinctrl',	
-	('fsl,imx25-iomuxc',) : 'pinctrl',	
-	('fsl,imx35-iomuxc',) : 'pinctrl',	
-	('fsl,imx8qm-iomuxc',) : 'pinctrl',	
-	('fsl,imx6q-iomuxc-gpr', 'fsl,imx6dl-iomuxc') : 'pinctrl',	
-	('fsl,imx7d-iomuxc-gpr', 'fsl,imx7d-iomuxc', 'fsl,imx7d-iomuxc-lpsr') : 'pinctrl',	
-	('ralink,rt2880-pinmux',) : 'pinctrl',	
-	('nuvoton,npcm750-pinctrl',) : 'pinctrl',	
-	('stericsson,gpio-coh901',) : 'pinctrl',	
-	('nxp,lpc1850-scu',) : 'pinctrl',	
-	('microchip,mcp23s08', 'microchip,mcp23s17', 'microchip,mcp23s18', 'mcp,mcp23s08', 'mcp,mcp23s17') : 'pinctrl',	
-	('st,stmfx-0300-pinctrl',) : 'pinctrl',	
-	('nvidia,tegra20-gpio', 'nvidia,tegra20-pinmux') : 'pinctrl',	
-	('nvidia,tegra30-gpio', 'nvidia,tegra30-pinmux') : 'pinctrl',	
-	('nvidia,tegra194-pinmux',) : 'pinctrl',	
-	('nvidia,tegra124-xusb-padctl',) : 'pinctrl',	
-	('nvidia,tegra210-gpio', 'nvidia,tegra210-pinmux') : 'pinctrl',	
-	('nvidia,tegra114-gpio', 'nvidia,tegra114-pinmux') : 'pinctrl',	
-	('nvidia,tegra124-gpio', 'nvidia,tegra124-pinmux') : 'pinctrl',	
-	('rockchip,gpio-bank', 'rockchip,rk3188-gpio-bank0', 'rockchip,px30-pinctrl', 'rockchip,rv1108-pinctrl', 'rockchip,rk2928-pinctrl', 'rockchip,rk3036-pinctrl', 'rockchip,rk3066a-pinctrl', 'rockchip,rk3066b-pinctrl', 'rockchip,rk3128-pinctrl', 'rockchip,rk3188-pinctrl', 'rockchip,rk3228-pinctrl', 'rockchip,rk3288-pinctrl', 'rockchip,rk3308-pinctrl', 'rockchip,rk3328-pinctrl', 'rockchip,rk3368-pinctrl', 'rockchip,rk3399-pinctrl') : 'pinctrl',	
-	('intel,lgm-io',) : 'pinctrl',	
-	('sprd,sc9860-pinctrl',) : 'pinctrl',	
-	('x-powers,axp209-gpio', 'x-powers,axp813-gpio') : 'pinctrl',	
-	('aspeed,ast2600-pinctrl',) : 'pinctrl',	
-	('aspeed,ast2400-pinctrl', 'aspeed,g4-pinctrl') : 'pinctrl',	
-	('aspeed,ast2500-pinctrl', 'aspeed,g5-pinctrl') : 'pinctrl',	
-	('mediatek,mt8167-pinctrl',) : 'pinctrl',	
-	('mediatek,mt2712-pinctrl',) : 'pinctrl',	
-	('mediatek,mt7629-pinctrl',) : 'pinctrl',	
-	('mediatek,mt7622-pinctrl',) : 'pinctrl',	
-	('mediatek,mt6765-pinctrl',) : 'pinctrl',	
-	('mediatek,mt8173-pinctrl',) : 'pinctrl',	
-	('mediatek,mt8192-pinctrl',) : 'pinctrl',	
-	('mediatek,mt2701-pinctrl', 'mediatek,mt7623-pinctrl') : 'pinctrl',	
-	('mediatek,mt6779-pinctrl',) : 'pinctrl',	
-	('mediatek,mt8135-pinctrl',) : 'pinctrl',	
-	('mediatek,mt8516-pinctrl',) : 'pinctrl',	
-	('mediatek,mt8183-pinctrl',) : 'pinctrl',	
-	('mediatek,mt6797-pinctrl',) : 'pinctrl',	
-	('mediatek,mt6397-pinctrl',) : 'pinctrl',	
-	('mediatek,mt8127-pinctrl',) : 'pinctrl',	
-	('mediatek,mt7623-moore-pinctrl',) : 'pinctrl',	
-	('marvell,pxa25x-pinctrl',) : 'pinctrl',	
-	('marvell,pxa27x-pinctrl',) : 'pinctrl',	
-	('img,pistachio-system-pinctrl',) : 'pinctrl',	
-	('st,spear320-pinmux',) : 'pinctrl',	
-	('st,spear1340-pinmux',) : 'pinctrl',	
-	('st,spear-plgpio',) : 'pinctrl',	
-	('st,spear300-pinmux',) : 'pinctrl',	
-	('st,spear1310-pinmux',) : 'pinctrl',	
-	('st,spear310-pinmux',) : 'pinctrl',	
-	('xlnx,pinctrl-zynq',) : 'pinctrl',	
-	('stericsson,ab8500-gpio', 'stericsson,ab8505-gpio') : 'pinctrl',	
-	('stericsson,stn8815-pinctrl', 'stericsson,db8500-pinctrl', 'stericsson,db8540-pinctrl', 'st,nomadik-gpio') : 'pinctrl',	
-	('ingenic,jz4740-gpio', 'ingenic,jz4725b-gpio', 'ingenic,jz4760-gpio', 'ingenic,jz4770-gpio', 'ingenic,jz4780-gpio', 'ingenic,x1000-gpio', 'ingenic,x1830-gpio', 'ingenic,jz4740-pinctrl', 'ingenic,jz4725b-pinctrl', 'ingenic,jz4760-pinctrl', 'ingenic,jz4760b-pinctrl', 'ingenic,jz4770-pinctrl', 'ingenic,jz4780-pinctrl', 'ingenic,x1000-pinctrl', 'ingenic,x1000e-pinctrl', 'ingenic,x1500-pinctrl', 'ingenic,x1830-pinctrl') : 'pinctrl',	
-	('qcom,pm8005-gpio', 'qcom,pm8916-gpio', 'qcom,pm8941-gpio', 'qcom,pm8950-gpio', 'qcom,pmi8950-gpio', 'qcom,pm8994-gpio', 'qcom,pmi8994-gpio', 'qcom,pm8998-gpio', 'qcom,pmi8998-gpio', 'qcom,pma8084-gpio', 'qcom,pms405-gpio', 'qcom,pm660-gpio', 'qcom,pm660l-gpio', 'qcom,pm8150-gpio', 'qcom,pm8150b-gpio', 'qcom,pm8150l-gpio', 'qcom,pm6150-gpio', 'qcom,pm6150l-gpio', 'qcom,pmx55-gpio') : 'pinctrl',	
-	('qcom,msm8660-pinctrl',) : 'pinctrl',	
-	('qcom,msm8953-pinctrl',) : 'pinctrl',	
-	('qcom,msm8916-pinctrl',) : 'pinctrl',	
-	('qcom,ipq6018-pinctrl',) : 'pinctrl',	
-	('qcom,mdm9615-pinctrl',) : 'pinctrl',	
-	('qcom,pm8841-mpp', 'qcom,pm8916-mpp', 'qcom,pm8941-mpp', 'qcom,pm8950-mpp', 'qcom,pmi8950-mpp', 'qcom,pm8994-mpp', 'qcom,pma8084-mpp', 'qcom,spmi-mpp') : 'pinctrl',	
-	('qcom,msm8974-pinctrl',) : 'pinctrl',	
-	('qcom,msm8226-pinctrl',) : 'pinctrl',	
-	('qcom,ipq4019-pinctrl',) : 'pinctrl',	
-	('qcom,msm8960-pinctrl',) : 'pinctrl',	
-	('qcom,sm8250-lpass-lpi-pinctrl',) : 'pinctrl',	
-	('qcom,msm8976-pinctrl',) : 'pinctrl',	
-	('qcom,sdx55-pinctrl',) : 'pinctrl',	
-	('qcom,pm8018-mpp', 'qcom,pm8038-mpp', 'qcom,pm8058-mpp', 'qcom,pm8917-mpp', 'qcom,pm8821-mpp', 'qcom,pm8921-mpp', 'qcom,ssbi-mpp') : 'pinctrl',	
-	('qcom,sc7180-pinctrl',) : 'pinctrl',	
-	('qcom,msm8998-pinctrl',) : 'pinctrl',	
-	('qcom,ipq8064-pinctrl',) : 'pinctrl',	
-	('qcom,sm8150-pinctrl',) : 'pinctrl',	
-	('qcom,msm8992-pinctrl', 'qcom,msm8994-pinctrl') : 'pinctrl',	
-	('qcom,sc7280-pinctrl',) : 'pinctrl',	
-	('qcom,qcs404-pinctrl',) : 'pinctrl',	
-	('qcom,ipq8074-pinctrl',) : 'pinctrl',	
-	('qcom,sm8250-pinctrl',) : 'pinctrl',	
-	('qcom,apq8064-pinctrl',) : 'pinctrl',	
-	('qcom,pm8018-gpio', 'qcom,pm8038-gpio', 'qcom,pm8058-gpio', 'qcom,pm8917-gpio', 'qcom,pm8921-gpio') : 'pinctrl',	
-	('qcom,msm8996-pinctrl',) : 'pinctrl',	
-	('qcom,apq8084-pinctrl',) : 'pinctrl',	
-	('qcom,sdm845-pinctrl',) : 'pinctrl',	
-	('qcom,sdm660-pinctrl', 'qcom,sdm630-pinctrl') : 'pinctrl',	
-	('st,stm32f769-pinctrl',) : 'pinctrl',	
-	('st,stm32f429-pinctrl',) : 'pinctrl',	
-	('st,stm32f469-pinctrl',) : 'pinctrl',	
-	('st,stm32h743-pinctrl',) : 'pinctrl',	
-	('st,stm32mp157-pinctrl', 'st,stm32mp157-z-pinctrl') : 'pinctrl',	
-	('st,stm32f746-pinctrl',) : 'pinctrl',	
-	('lantiq,pinctrl-xway', 'lantiq,pinctrl-xr9', 'lantiq,pinctrl-ase', 'lantiq,ase-pinctrl', 'lantiq,danube-pinctrl', 'lantiq,xrx100-pinctrl', 'lantiq,xrx200-pinctrl', 'lantiq,xrx300-pinctrl') : 'pinctrl',	
-	('atmel,sama5d3-pinctrl', 'atmel,at91sam9x5-pinctrl', 'atmel,at91rm9200-pinctrl', 'microchip,sam9x60-pinctrl', 'atmel,at91sam9x5-gpio', 'atmel,at91rm9200-gpio', 'microchip,sam9x60-gpio') : 'pinctrl',	
-	('renesas,r7s9210-pinctrl',) : 'pinctrl',	
-	('renesas,rzn1-pinctrl',) : 'pinctrl',	
-	('renesas,pfc-emev2', 'renesas,pfc-r8a73a4', 'renesas,pfc-r8a7740', 'renesas,pfc-r8a7742', 'renesas,pfc-r8a7743', 'renesas,pfc-r8a7744', 'renesas,pfc-r8a7745', 'renesas,pfc-r8a77470', 'renesas,pfc-r8a774a1', 'renesas,pfc-r8a774b1', 'renesas,pfc-r8a774c0', 'renesas,pfc-r8a774e1', 'renesas,pfc-r8a7778', 'renesas,pfc-r8a7779', 'renesas,pfc-r8a7790', 'renesas,pfc-r8a7791', 'renesas,pfc-r8a7792', 'renesas,pfc-r8a7793', 'renesas,pfc-r8a7794', 'renesas,pfc-r8a7795', 'renesas,pfc-r8a7795', 'renesas,pfc-r8a7796', 'renesas,pfc-r8a77961', 'renesas,pfc-r8a77965', 'renesas,pfc-r8a77970', 'renesas,pfc-r8a77980', 'renesas,pfc-r8a77990', 'renesas,pfc-r8a77995', 'renesas,pfc-sh73a0') : 'pinctrl',	
-	('abilis,tb10x-iomux',) : 'pinctrl',	
-	('aspeed,ast2600-fsi-master',) : 'fsi',	
-	('aspeed,ast2400-cf-fsi-master', 'aspeed,ast2500-cf-fsi-master') : 'fsi',	
-	('ibm,p9-occ', 'ibm,p10-occ') : 'fsi',	
-	('fsi-master-gpio',) : 'fsi',	
-	('snps,g210-tc-6.00-20bit', 'snps,g210-tc-6.00-40bit') : 'scsi',	
-	('ti,j721e-ufs',) : 'scsi',	
-	('hisilicon,hi3660-ufs', 'hisilicon,hi3670-ufs') : 'scsi',	
-	('mediatek,mt8183-ufshci',) : 'scsi',	
-	('qcom,ufshc',) : 'scsi',	
-	('cdns,ufshc', 'cdns,ufshc-m31-16nm') : 'scsi',	
-	('samsung,exynos7-ufs',) : 'scsi',	
-	('hisilicon,hip06-sas-v2', 'hisilicon,hip07-sas-v2') : 'scsi',	
-	('hisilicon,hip05-sas-v1',) : 'scsi',	
-	('brcm,bus-axi',) : 'bcma',	
-	('pps-gpio',) : 'pps',	
-	('marvell,dove-pmu',) : 'soc/dove',	
-	('fsl,imx8mq', 'fsl,imx8mm', 'fsl,imx8mn', 'fsl,imx8mp') : 'soc/imx',	
-	('fsl,imx6q-gpc', 'fsl,imx6qp-gpc', 'fsl,imx6sl-gpc', 'fsl,imx6sx-gpc') : 'soc/imx',	
-	('intel,ixp4xx-ahb-queue-manager',) : 'soc/ixp4xx',	
-	('intel,ixp4xx-network-processing-engine',) : 'soc/ixp4xx',	
-	('litex,soc-controller',) : 'soc/litex',	
-	('zte,zx296718-pcu',) : 'soc/zte',	
-	('atmel,at91rm9200', 'atmel,at91sam9', 'atmel,sama5', 'atmel,samv7') : 'soc/atmel',	
-	('atmel,sama5d2-sfr', 'atmel,sama5d4-sfr') : 'soc/atmel',	
-	('kendryte,k210-sysctl',) : 'soc/kendryte',	
-	('raspberrypi,bcm2835-power',) : 'soc/bcm',	
-	('mmio-sram', 'brcm,brcmstb-aon-ctrl', 'brcm,brcmstb-ddr-phy-v71.1', 'brcm,brcmstb-ddr-phy-v72.0', 'brcm,brcmstb-ddr-phy-v225.1', 'brcm,brcmstb-ddr-phy-v240.1', 'brcm,brcmstb-ddr-phy-v240.2', 'brcm,brcmstb-ddr-shimphy-v1.0', 'brcm,brcmstb-memc-ddr-rev-b.2.1', 'brcm,brcmstb-memc-ddr-rev-b.2.2', 'brcm,brcmstb-memc-ddr-rev-b.2.3', 'brcm,brcmstb-memc-ddr-rev-b.3.0', 'brcm,brcmstb-memc-ddr-rev-b.3.1', 'brcm,brcmstb-memc-ddr') : 'soc/bcm',	
-	('brcm,brcmstb-aon-ctrl', 'brcm,brcmstb-ddr-phy', 'brcm,brcmstb-memc-arb', 'brcm,brcmstb-timers') : 'soc/bcm',	
-	('brcm,brcmstb', 'brcm,bcm7125-sun-top-ctrl', 'brcm,bcm7346-sun-top-ctrl', 'brcm,bcm7358-sun-top-ctrl', 'brcm,bcm7360-sun-top-ctrl', 'brcm,bcm7362-sun-top-ctrl', 'brcm,bcm7420-sun-top-ctrl', 'brcm,bcm7425-sun-top-ctrl', 'brcm,bcm7429-sun-top-ctrl', 'brcm,bcm7435-sun-top-ctrl', 'brcm,brcmstb-sun-top-ctrl') : 'soc/bcm',	
-	('brcm,bcm6318-power-controller', 'brcm,bcm6328-power-controller', 'brcm,bcm6362-power-controller', 'brcm,bcm63268-power-controller') : 'soc/bcm',	
-	('samsung,exynos4210-pd', 'samsung,exynos5433-pd') : 'soc/samsung',	
-	('samsung,exynos3250-pmu', 'samsung,exynos4210-pmu', 'samsung,exynos4412-pmu', 'samsung,exynos5250-pmu', 'samsung,exynos5410-pmu', 'samsung,exynos5420-pmu', 'samsung,exynos5433-pmu', 'samsung,exynos7-pmu') : 'soc/samsung',	
-	('samsung,exynos4210-chipid',) : 'soc/samsung',	
-	('actions,s500-sps', 'actions,s700-sps', 'actions,s900-sps') : 'soc/actions',	
-	('arm,realview-eb-soc', 'arm,realview-pb1176-soc', 'arm,realview-pb11mp-soc', 'arm,realview-pba8-soc', 'arm,realview-pbx-soc') : 'soc/versatile',	
-	('allwinner,sun4i-a10-sram-controller', 'allwinner,sun4i-a10-system-control', 'allwinner,sun5i-a13-system-control', 'allwinner,sun8i-a23-system-control', 'allwinner,sun8i-h3-system-control', 'allwinner,sun50i-a64-sram-controller', 'allwinner,sun50i-a64-system-control', 'allwinner,sun50i-h5-system-control') : 'soc/sunxi',	
-	('ti,am654-navss-ringacc',) : 'soc/ti',	
-	('ti,am3352-wkup-m3-ipc', 'ti,am4372-wkup-m3-ipc') : 'soc/ti',	
-	('ti,am3356-pruss', 'ti,am4376-pruss0', 'ti,am4376-pruss1', 'ti,am5728-pruss', 'ti,k2g-pruss', 'ti,am654-icssg', 'ti,j721e-icssg') : 'soc/ti',	
-	('ti,omap3-smartreflex-core', 'ti,omap3-smartreflex-mpu-iva', 'ti,omap4-smartreflex-core', 'ti,omap4-smartreflex-mpu', 'ti,omap4-smartreflex-iva') : 'soc/ti',	
-	('ti,keystone-navigator-qmss', 'ti,66ak2g-navss-qm') : 'soc/ti',	
-	('ti,omap4-prm-inst', 'ti,omap5-prm-inst', 'ti,dra7-prm-inst', 'ti,am3-prm-inst', 'ti,am4-prm-inst') : 'soc/ti',	
-	('ti,sci-pm-domain',) : 'soc/ti',	
-	('ti,keystone-navigator-dma',) : 'soc/ti',	
-	('ti,am654-chipid',) : 'soc/ti',	
-	('lantiq,xrx200-fpi',) : 'soc/lantiq',	
-	('nvidia,tegra234-pmc', 'nvidia,tegra194-pmc', 'nvidia,tegra186-pmc', 'nvidia,tegra210-pmc', 'nvidia,tegra132-pmc', 'nvidia,tegra124-pmc', 'nvidia,tegra114-pmc', 'nvidia,tegra30-pmc', 'nvidia,tegra20-pmc') : 'soc/tegra',	
-	('nvidia,tegra20', 'nvidia,tegra30', 'nvidia,tegra114', 'nvidia,tegra124', 'nvidia,tegra132', 'nvidia,tegra210') : 'soc/tegra',	
-	('nvidia,tegra20-car', 'nvidia,tegra30-car', 'nvidia,tegra114-car', 'nvidia,tegra124-car', 'nvidia,tegra132-car', 'nvidia,tegra210-car', 'nvidia,tegra234-efuse', 'nvidia,tegra194-efuse', 'nvidia,tegra186-efuse', 'nvidia,tegra210-efuse', 'nvidia,tegra132-efuse', 'nvidia,tegra124-efuse', 'nvidia,tegra114-efuse', 'nvidia,tegra30-efuse', 'nvidia,tegra20-efuse') : 'soc/tegra',	
-	('nvidia,tegra20-apbmisc', 'nvidia,tegra186-misc', 'nvidia,tegra194-misc', 'nvidia,tegra234-misc') : 'soc/tegra',	
-	('nvidia,tegra210-flowctrl', 'nvidia,tegra124-flowctrl', 'nvidia,tegra114-flowctrl', 'nvidia,tegra30-flowctrl', 'nvidia,tegra20-flowctrl') : 'soc/tegra',	
-	('aspeed,ast2400-lpc-snoop', 'aspeed,ast2500-lpc-snoop', 'aspeed,ast2600-lpc-snoop') : 'soc/aspeed',	
-	('aspeed,ast2400-p2a-ctrl', 'aspeed,ast2500-p2a-ctrl') : 'soc/aspeed',	
-	('aspeed,ast2400-lpc-ctrl', 'aspeed,ast2500-lpc-ctrl', 'aspeed,ast2600-lpc-ctrl') : 'soc/aspeed',	
-	('mediatek,mt2701-scpsys', 'mediatek,mt2712-scpsys', 'mediatek,mt6797-scpsys', 'mediatek,mt7622-scpsys', 'mediatek,mt7623a-scpsys', 'mediatek,mt8173-scpsys') : 'soc/mediatek',	
-	('mediatek,mt6323', 'mediatek,mt6351', 'mediatek,mt6357', 'mediatek,mt6358', 'mediatek,mt6359', 'mediatek,mt6380-regulator', 'mediatek,mt6397', 'mediatek,mt2701-pwrap', 'mediatek,mt6765-pwrap', 'mediatek,mt6779-pwrap', 'mediatek,mt6797-pwrap', 'mediatek,mt7622-pwrap', 'mediatek,mt8135-pwrap', 'mediatek,mt8173-pwrap', 'mediatek,mt8183-pwrap', 'mediatek,mt8516-pwrap') : 'soc/mediatek',	
-	('mediatek,mt2701-mmsys', 'mediatek,mt2712-mmsys', 'mediatek,mt6779-mmsys', 'mediatek,mt6797-mmsys', 'mediatek,mt8173-mmsys', 'mediatek,mt8183-mmsys') : 'soc/mediatek',	
-	('mediatek,mt6779-devapc',) : 'soc/mediatek',	
-	('mediatek,mt8173-power-controller', 'mediatek,mt8183-power-controller', 'mediatek,mt8192-power-controller') : 'soc/mediatek',	
-	('rockchip,px30-power-controller', 'rockchip,rk3036-power-controller', 'rockchip,rk3066-power-controller', 'rockchip,rk3128-power-controller', 'rockchip,rk3188-power-controller', 'rockchip,rk3228-power-controller', 'rockchip,rk3288-power-controller', 'rockchip,rk3328-power-controller', 'rockchip,rk3366-power-controller', 'rockchip,rk3368-power-controller', 'rockchip,rk3399-power-controller') : 'soc/rockchip',	
-	('rockchip,rk3036-grf', 'rockchip,rk3128-grf', 'rockchip,rk3228-grf', 'rockchip,rk3288-grf', 'rockchip,rk3328-grf', 'rockchip,rk3368-grf', 'rockchip,rk3399-grf') : 'soc/rockchip',	
-	('rockchip,px30-io-voltage-domain', 'rockchip,px30-pmu-io-voltage-domain', 'rockchip,rk3188-io-voltage-domain', 'rockchip,rk3228-io-voltage-domain', 'rockchip,rk3288-io-voltage-domain', 'rockchip,rk3328-io-voltage-domain', 'rockchip,rk3368-io-voltage-domain', 'rockchip,rk3368-pmu-io-voltage-domain', 'rockchip,rk3399-io-voltage-domain', 'rockchip,rk3399-pmu-io-voltage-domain', 'rockchip,rv1108-io-voltage-domain', 'rockchip,rv1108-pmu-io-voltage-domain') : 'soc/rockchip',	
-	('fsl,qe',) : 'soc/fsl',	
-	('fsl,qoriq-rcpm-2.1+',) : 'soc/fsl',	
-	('fsl,qoriq-device-config-1.0', 'fsl,qoriq-device-config-2.0', 'fsl,p1010-guts', 'fsl,p1020-guts', 'fsl,p1021-guts', 'fsl,p1022-guts', 'fsl,p1023-guts', 'fsl,p2020-guts', 'fsl,bsc9131-guts', 'fsl,bsc9132-guts', 'fsl,mpc8536-guts', 'fsl,mpc8544-guts', 'fsl,mpc8548-guts', 'fsl,mpc8568-guts', 'fsl,mpc8569-guts', 'fsl,mpc8572-guts', 'fsl,ls1021a-dcfg', 'fsl,ls1043a-dcfg', 'fsl,ls2080a-dcfg', 'fsl,ls1088a-dcfg', 'fsl,ls1012a-dcfg', 'fsl,ls1046a-dcfg', 'fsl,lx2160a-dcfg', 'fsl,ls1028a-dcfg') : 'soc/fsl',	
-	('fsl,dpaa2-console',) : 'soc/fsl',	
-	('fsl,bman',) : 'soc/fsl',	
-	('fsl,bman-portal',) : 'soc/fsl',	
-	('fsl,qman-portal',) : 'soc/fsl',	
-	('fsl,qman',) : 'soc/fsl',	
-	('sifive,fu540-c000-ccache',) : 'soc/sifive',	
-	('xlnx,vcu', 'xlnx,vcu-logicoreip-1.0') : 'soc/xilinx',	
-	('xlnx,zynqmp-power',) : 'soc/xilinx',	
-	('qcom,tcsr-ipq8064', 'qcom,tcsr-apq8064', 'qcom,tcsr-msm8960', 'qcom,tcsr-msm8660', 'qcom,gsbi-v1.0.0') : 'soc/qcom',	
-	('qcom,sc7180-rpmhpd', 'qcom,sdm845-rpmhpd', 'qcom,sdx55-rpmhpd', 'qcom,sm8150-rpmhpd', 'qcom,sm8250-rpmhpd') : 'soc/qcom',	
-	('qcom,msm8974-ocmem',) : 'soc/qcom',	
-	('qcom,apr', 'qcom,apr-v2') : 'soc/qcom',	
-	('qcom,rpmh-rsc',) : 'soc/qcom',	
-	('qcom,smp2p',) : 'soc/qcom',	
-	('qcom,smem',) : 'soc/qcom',	
-	('qcom,sc7180-aoss-qmp', 'qcom,sdm845-aoss-qmp', 'qcom,sm8150-aoss-qmp', 'qcom,sm8250-aoss-qmp') : 'soc/qcom',	
-	('qcom,sc7180-llcc', 'qcom,sdm845-llcc', 'qcom,sm8150-llcc') : 'soc/qcom',	
-	('qcom,geni-se-qup',) : 'soc/qcom',	
-	('qcom,smsm',) : 'soc/qcom',	
-	('qcom,qcs404-cpr',) : 'soc/qcom',	
-	('qcom,msm8916-rpmpd', 'qcom,msm8939-rpmpd', 'qcom,msm8976-rpmpd', 'qcom,msm8996-rpmpd', 'qcom,msm8998-rpmpd', 'qcom,qcs404-rpmpd', 'qcom,sdm660-rpmpd') : 'soc/qcom',	
-	('qcom,wcnss',) : 'soc/qcom',	
-	('qcom,rpm-apq8084', 'qcom,rpm-ipq6018', 'qcom,rpm-msm8916', 'qcom,rpm-msm8936', 'qcom,rpm-msm8974', 'qcom,rpm-msm8976', 'qcom,rpm-msm8994', 'qcom,rpm-msm8996', 'qcom,rpm-msm8998', 'qcom,rpm-sdm660', 'qcom,rpm-qcs404') : 'soc/qcom',	
-	('qcom,rmtfs-mem',) : 'soc/qcom',	
-	('qcom,cmd-db',) : 'soc/qcom',	
-	('amlogic,meson-gx-pwrc-vpu', 'amlogic,meson-g12a-pwrc-vpu') : 'soc/amlogic',	
-	('amlogic,meson-a1-pwrc',) : 'soc/amlogic',	
-	('amlogic,meson8-canvas', 'amlogic,meson8b-canvas', 'amlogic,meson8m2-canvas', 'amlogic,canvas') : 'soc/amlogic',	
-	('amlogic,meson-gx-clk-measure', 'amlogic,meson8-clk-measure', 'amlogic,meson8b-clk-measure', 'amlogic,meson-axg-clk-measure', 'amlogic,meson-g12a-clk-measure', 'amlogic,meson-sm1-clk-measure') : 'soc/amlogic',	
-	('amlogic,meson8-analog-top', 'amlogic,meson8b-analog-top') : 'soc/amlogic',	
-	('amlogic,meson8-pwrc', 'amlogic,meson8b-pwrc', 'amlogic,meson8m2-pwrc', 'amlogic,meson-axg-pwrc', 'amlogic,meson-gxbb-pwrc', 'amlogic,meson-g12a-pwrc', 'amlogic,meson-sm1-pwrc') : 'soc/amlogic',	
-	('renesas,r7s72100', 'renesas,r7s9210', 'renesas,r8a73a4', 'renesas,r8a7740', 'renesas,r8a7742', 'renesas,r8a7743', 'renesas,r8a7744', 'renesas,r8a7745', 'renesas,r8a77470', 'renesas,r8a774a1', 'renesas,r8a774b1', 'renesas,r8a774c0', 'renesas,r8a774e1', 'renesas,r8a7778', 'renesas,r8a7779', 'renesas,r8a7790', 'renesas,r8a7791', 'renesas,r8a7792', 'renesas,r8a7793', 'renesas,r8a7794', 'renesas,r8a7795', 'renesas,r8a7796', 'renesas,r8a77961', 'renesas,r8a77965', 'renesas,r8a77970', 'renesas,r8a77980', 'renesas,r8a77990', 'renesas,r8a77995', 'renesas,r8a779a0', 'renesas,sh73a0') : 'soc/renesas',	
-	('arm,coresight-etm3x', 'renesas,dbsc-r8a73a4', 'renesas,dbsc3-r8a7740', 'renesas,sbsc-sh73a0') : 'soc/renesas',	
-	('renesas,r8a7742-sysc', 'renesas,r8a7743-sysc', 'renesas,r8a7744-sysc', 'renesas,r8a7745-sysc', 'renesas,r8a77470-sysc', 'renesas,r8a774a1-sysc', 'renesas,r8a774b1-sysc', 'renesas,r8a774c0-sysc', 'renesas,r8a774e1-sysc', 'renesas,r8a7779-sysc', 'renesas,r8a7790-sysc', 'renesas,r8a7791-sysc', 'renesas,r8a7793-sysc', 'renesas,r8a7792-sysc', 'renesas,r8a7794-sysc', 'renesas,r8a7795-sysc', 'renesas,r8a7796-sysc', 'renesas,r8a77961-sysc', 'renesas,r8a77965-sysc', 'renesas,r8a77970-sysc', 'renesas,r8a77980-sysc', 'renesas,r8a77990-sysc', 'renesas,r8a77995-sysc') : 'soc/renesas',	
-	('renesas,r8a779a0-sysc',) : 'soc/renesas',	
-	('renesas,r8a7742-rst', 'renesas,r8a7743-rst', 'renesas,r8a7744-rst', 'renesas,r8a7745-rst', 'renesas,r8a77470-rst', 'renesas,r8a774a1-rst', 'renesas,r8a774b1-rst', 'renesas,r8a774c0-rst', 'renesas,r8a774e1-rst', 'renesas,r8a7778-reset-wdt', 'renesas,r8a7779-reset-wdt', 'renesas,r8a7790-rst', 'renesas,r8a7791-rst', 'renesas,r8a7792-rst', 'renesas,r8a7793-rst', 'renesas,r8a7794-rst', 'renesas,r8a7795-rst', 'renesas,r8a7796-rst', 'renesas,r8a77961-rst', 'renesas,r8a77965-rst', 'renesas,r8a77970-rst', 'renesas,r8a77980-rst', 'renesas,r8a77990-rst', 'renesas,r8a77995-rst', 'renesas,r8a779a0-rst') : 'soc/renesas',	
-	('atmel,at91sam9g46-sha',) : 'crypto',	
-	('atmel,at91sam9g46-aes',) : 'crypto',	
-	('hisilicon,hip06-sec', 'hisilicon,hip07-sec') : 'crypto',	
-	('fsl,imx23-dcp', 'fsl,imx28-dcp') : 'crypto',	
-	('qcom,crypto-v5.1', 'qcom,crypto-v5.4') : 'crypto',	
-	('fsl,imx53-sahara', 'fsl,imx27-sahara') : 'crypto',	
-	('axis,artpec6-crypto', 'axis,artpec7-crypto') : 'crypto',	
-	('brcm,spum-crypto', 'brcm,spum-nsp-crypto', 'brcm,spu2-crypto', 'brcm,spu2-v2-crypto') : 'crypto',	
-	('atmel,at91sam9g46-tdes',) : 'crypto',	
-	('stericsson,ux500-hash',) : 'crypto',	
-	('stericsson,ux500-cryp',) : 'crypto',	
-	('inside-secure,safexcel-eip97ies', 'inside-secure,safexcel-eip197b', 'inside-secure,safexcel-eip197d', 'inside-secure,safexcel-eip97', 'inside-secure,safexcel-eip197') : 'crypto',	
-	('qcom,prng', 'qcom,prng-ee') : 'crypto',	
-	('picochip,spacc-ipsec', 'picochip,spacc-l2') : 'crypto',	
-	('allwinner,sun4i-a10-crypto', 'allwinner,sun8i-a33-crypto') : 'crypto',	
-	('allwinner,sun8i-h3-crypto', 'allwinner,sun8i-r40-crypto', 'allwinner,sun50i-a64-crypto', 'allwinner,sun50i-h5-crypto', 'allwinner,sun50i-h6-crypto') : 'crypto',	
-	('allwinner,sun8i-a83t-crypto', 'allwinner,sun9i-a80-crypto') : 'crypto',	
-	('marvell,orion-crypto', 'marvell,kirkwood-crypto', 'marvell,dove-crypto', 'marvell,armada-370-crypto', 'marvell,armada-xp-crypto', 'marvell,armada-375-crypto', 'marvell,armada-38x-crypto') : 'crypto',	
-	('img,hash-accelerator',) : 'crypto',	
-	('amd,ccp-seattle-v1a',) : 'crypto',	
-	('atmel,atsha204a',) : 'crypto',	
-	('ppc4xx-rng', 'amcc,ppc460ex-rng', 'amcc,ppc440epx-rng') : 'crypto',	
-	('fsl,sec-v4.0-job-ring', 'fsl,sec4.0-job-ring') : 'crypto',	
-	('fsl,sec-v4.0', 'fsl,sec4.0') : 'crypto',	
-	('samsung,s5pv210-secss', 'samsung,exynos4210-secss', 'samsung,exynos5433-slim-sss') : 'crypto',	
-	('mediatek,eip97-crypto',) : 'crypto',	
-	('rockchip,rk3288-crypto',) : 'crypto',	
-	('fsl,sec1.0', 'fsl,sec2.0') : 'crypto',	
-	('SUNW,n2-cwq', 'SUNW,vf-cwq', 'SUNW,kt-cwq', 'SUNW,n2-mau', 'SUNW,vf-mau', 'SUNW,kt-mau') : 'crypto',	
-	('arm,cryptocell-703-ree', 'arm,cryptocell-713-ree', 'arm,cryptocell-712-ree', 'arm,cryptocell-710-ree', 'arm,cryptocell-630p-ree') : 'crypto',	
-	('samsung,exynos4-rng', 'samsung,exynos5250-prng') : 'crypto',	
-	('ti,j721e-sa2ul', 'ti,am654-sa2ul') : 'crypto',	
-	('xlnx,zynqmp-aes',) : 'crypto',	
-	('atmel,atecc508a',) : 'crypto',	
-	('st,stm32f756-cryp', 'st,stm32mp1-cryp') : 'crypto',	
-	('st,stm32f7-crc',) : 'crypto',	
-	('st,stm32f456-hash', 'st,stm32f756-hash') : 'crypto',	
-	('amlogic,gxl-crypto',) : 'crypto',	
-	('intel,keembay-ocs-aes',) : 'crypto',	
-	('linaro,optee-tz',) : 'tee',	
-	('allwinner,sun4i-a10', 'allwinner,sun5i-a10s', 'allwinner,sun5i-a13', 'allwinner,sun5i-r8', 'allwinner,sun6i-a31', 'allwinner,sun6i-a31s', 'allwinner,sun7i-a20', 'allwinner,sun8i-a23', 'allwinner,sun8i-a83t', 'allwinner,sun8i-h3', 'apm,xgene-shadowcat', 'arm,integrator-ap', 'arm,integrator-cp', 'hisilicon,hi3660', 'fsl,imx27', 'fsl,imx51', 'fsl,imx53', 'marvell,berlin', 'marvell,pxa250', 'marvell,pxa270', 'samsung,exynos3250', 'samsung,exynos4210', 'samsung,exynos5250', 'samsung,exynos5800', 'renesas,emev2', 'renesas,r7s72100', 'renesas,r8a73a4', 'renesas,r8a7740', 'renesas,r8a7742', 'renesas,r8a7743', 'renesas,r8a7744', 'renesas,r8a7745', 'renesas,r8a7778', 'renesas,r8a7779', 'renesas,r8a7790', 'renesas,r8a7791', 'renesas,r8a7792', 'renesas,r8a7793', 'renesas,r8a7794', 'renesas,sh73a0', 'rockchip,rk2928', 'rockchip,rk3036', 'rockchip,rk3066a', 'rockchip,rk3066b', 'rockchip,rk3188', 'rockchip,rk3228', 'rockchip,rk3288', 'rockchip,rk3328', 'rockchip,rk3366', 'rockchip,rk3368', 'rockchip,rk3399', 'st-ericsson,u8500', 'st-ericsson,u8540', 'st-ericsson,u9500', 'st-ericsson,u9540', 'ti,omap2', 'ti,omap4', 'ti,omap5', 'xlnx,zynq-7000', 'xlnx,zynqmp', 'allwinner,sun50i-h6', 'calxeda,highbank', 'calxeda,ecx-2000', 'fsl,imx7ulp', 'fsl,imx7d', 'fsl,imx8mq', 'fsl,imx8mm', 'fsl,imx8mn', 'fsl,imx8mp', 'marvell,armadaxp', 'mediatek,mt2701', 'mediatek,mt2712', 'mediatek,mt7622', 'mediatek,mt7623', 'mediatek,mt8167', 'mediatek,mt817x', 'mediatek,mt8173', 'mediatek,mt8176', 'mediatek,mt8183', 'mediatek,mt8516', 'nvidia,tegra20', 'nvidia,tegra30', 'nvidia,tegra124', 'nvidia,tegra210', 'qcom,apq8096', 'qcom,msm8996', 'qcom,qcs404', 'qcom,sc7180', 'qcom,sdm845', 'st,stih407', 'st,stih410', 'st,stih418', 'sigma,tango4', 'ti,am33xx', 'ti,am43', 'ti,dra7', 'ti,omap3', 'qcom,ipq8064', 'qcom,apq8064', 'qcom,msm8974', 'qcom,msm8960') : 'cpufreq',	
-	('fsl,b4420-clockgen', 'fsl,b4860-clockgen', 'fsl,t2080-clockgen', 'fsl,t4240-clockgen') : 'cpufreq',	
-	('calxeda,highbank', 'calxeda,ecx-2000') : 'cpufreq',	
-	('nvidia,tegra186-ccplex-cluster',) : 'cpufreq',	
-	('qcom,cpufreq-hw', 'qcom,cpufreq-epss') : 'cpufreq',	
-	('st,stih407', 'st,stih410') : 'cpufreq',	
-	('marvell,armada-3700-nb-pm',) : 'cpufreq',	
-	('ti,am33xx', 'ti,am3517', 'ti,am43', 'ti,dra7', 'ti,omap34xx', 'ti,omap36xx', 'ti,omap3430', 'ti,omap3630') : 'cpufreq',	
-	('qcom,apq8096', 'qcom,msm8996', 'qcom,qcs404', 'qcom,ipq8064', 'qcom,apq8064', 'qcom,msm8974', 'qcom,msm8960') : 'cpufreq',	
-	('allwinner,sun50i-h6',) : 'cpufreq',	
-	('nvidia,tegra194-ccplex',) : 'cpufreq',	
-	('marvell,ap806-cpu-clock',) : 'cpufreq',	
-	('mediatek,mt2701', 'mediatek,mt2712', 'mediatek,mt7622', 'mediatek,mt7623', 'mediatek,mt8167', 'mediatek,mt817x', 'mediatek,mt8173', 'mediatek,mt8176', 'mediatek,mt8183', 'mediatek,mt8516') : 'cpufreq',	
-	('sigma,tango4',) : 'cpufreq',	
-	('sony,cxd2880',) : 'media',	
-	('fsl,imx6ull-pxp',) : 'media',	
-	('samsung,s5pv210-g2d', 'samsung,exynos4212-g2d') : 'media',	
-	('ti,am437x-vpfe',) : 'media',	
-	('st,stih407-c8sectpfe',) : 'media',	
-	('st,st-delta',) : 'media',	
-	('st,st-hva',) : 'media',	
-	('st,stih407-bdisp',) : 'media',	
-	('renesas,vsp1', 'renesas,vsp2') : 'media',	
-	('renesas,jpu-r8a7790', 'renesas,jpu-r8a7791', 'renesas,jpu-r8a7792', 'renesas,jpu-r8a7793', 'renesas,rcar-gen2-jpu') : 'media',	
-	('fsl,imx27-vpu', 'fsl,imx51-vpu', 'fsl,imx53-vpu', 'fsl,imx6q-vpu', 'fsl,imx6dl-vpu') : 'media',	
-	('fsl,imx6q-vdoa',) : 'media',	
-	('fsl,mpc5121-viu',) : 'media',	
-	('mediatek,mt8173-mdp-rdma', 'mediatek,mt8173-mdp-rsz', 'mediatek,mt8173-mdp-wdma', 'mediatek,mt8173-mdp-wrot', 'mediatek,mt8173-mdp') : 'media',	
-	('mediatek,mt8173-vcodec-enc', 'mediatek,mt8183-vcodec-enc') : 'media',	
-	('mediatek,mt8173-vcodec-dec',) : 'media',	
-	('atmel,sama5d2-isc',) : 'media',	
-	('atmel,at91sam9g45-isi',) : 'media',	
-	('samsung,s5pv210-jpeg', 'samsung,exynos3250-jpeg', 'samsung,exynos4210-jpeg', 'samsung,exynos4212-jpeg', 'samsung,exynos5420-jpeg', 'samsung,exynos5433-jpeg') : 'media',	
-	('mediatek,mt8173-vpu',) : 'media',	
-	('amlogic,axg-ge2d',) : 'media',	
-	('ti,da850-vpif',) : 'media',	
-	('mediatek,mt8173-jpgdec', 'mediatek,mt2701-jpgdec', 'mediatek,mtk-jpgenc') : 'media',	
-	('allwinner,sun6i-a31-csi', 'allwinner,sun8i-a83t-csi', 'allwinner,sun8i-h3-csi', 'allwinner,sun8i-v3s-csi', 'allwinner,sun50i-a64-csi') : 'media',	
-	('allwinner,sun8i-h3-deinterlace',) : 'media',	
-	('allwinner,sun4i-a10-csi1', 'allwinner,sun7i-a20-csi0') : 'media',	
-	('allwinner,sun8i-a83t-de2-rotate',) : 'media',	
-	('ti,omap3-isp',) : 'media',	
-	('ti,dra7-vpe',) : 'media',	
-	('ti,dra72-cal', 'ti,dra72-pre-es2-cal', 'ti,dra76-cal', 'ti,am654-cal') : 'media',	
-	('samsung,s5pv210-csis', 'samsung,exynos4210-csis', 'samsung,exynos5250-csis') : 'media',	
-	('samsung,exynos4212-fimc-is',) : 'media',	
-	('samsung,exynos4212-fimc-lite', 'samsung,exynos5250-fimc-lite') : 'media',	
-	('samsung,fimc',) : 'media',	
-	('samsung,s5pv210-fimc', 'samsung,exynos4210-fimc', 'samsung,exynos4212-fimc') : 'media',	
-	('renesas,fcpf', 'renesas,fcpv') : 'media',	
-	('renesas,r7s72100-ceu', 'renesas,r8a7740-ceu') : 'media',	
-	('renesas,rcar-gen3-drif',) : 'media',	
-	('rockchip,rk3399-cif-isp',) : 'media',	
-	('rockchip,rk3288-rga', 'rockchip,rk3399-rga') : 'media',	
-	('cdns,csi2tx', 'cdns,csi2tx-1.3', 'cdns,csi2tx-2.1') : 'media',	
-	('cdns,csi2rx',) : 'media',	
-	('samsung,exynos5250-gsc', 'samsung,exynos5420-gsc', 'samsung,exynos5433-gsc', 'samsung,exynos5-gsc') : 'media',	
-	('renesas,fdp1',) : 'media',	
-	('xlnx,mipi-csi2-rx-subsystem-5.0',) : 'media',	
-	('xlnx,v-tpg-5.0',) : 'media',	
-	('xlnx,video',) : 'media',	
-	('xlnx,v-tc-6.1',) : 'media',	
-	('renesas,vin-r8a774a1', 'renesas,vin-r8a774b1', 'renesas,vin-r8a774c0', 'renesas,vin-r8a774e1', 'renesas,vin-r8a7778', 'renesas,vin-r8a7779', 'renesas,rcar-gen2-vin', 'renesas,vin-r8a7795', 'renesas,vin-r8a7796', 'renesas,vin-r8a77965', 'renesas,vin-r8a77970', 'renesas,vin-r8a77980', 'renesas,vin-r8a77990', 'renesas,vin-r8a77995') : 'media',	
-	('renesas,r8a774a1-csi2', 'renesas,r8a774b1-csi2', 'renesas,r8a774c0-csi2', 'renesas,r8a774e1-csi2', 'renesas,r8a7795-csi2', 'renesas,r8a7796-csi2', 'renesas,r8a77965-csi2', 'renesas,r8a77970-csi2', 'renesas,r8a77980-csi2', 'renesas,r8a77990-csi2') : 'media',	
-	('samsung,mfc-v5', 'samsung,mfc-v6', 'samsung,mfc-v7', 'samsung,mfc-v8', 'samsung,exynos5433-mfc', 'samsung,mfc-v10') : 'media',	
-	('marvell,mmp2-ccic',) : 'media',	
-	('video-mux',) : 'media',	
-	('aspeed,ast2400-video-engine', 'aspeed,ast2500-video-engine', 'aspeed,ast2600-video-engine') : 'media',	
-	('marvell,pxa270-qci',) : 'media',	
-	('qcom,msm8916-camss', 'qcom,msm8996-camss', 'qcom,sdm660-camss') : 'media',	
-	('venus-decoder',) : 'media',	
-	('qcom,msm8916-venus', 'qcom,msm8996-venus', 'qcom,sdm845-venus', 'qcom,sdm845-venus-v2', 'qcom,sc7180-venus') : 'media',	
-	('venus-encoder',) : 'media',	
-	('st,stm32-dcmi',) : 'media',	
-	('st,comms-irb',) : 'media',	
-	('img,ir-rev1',) : 'media',	
-	('amlogic,meson6-ir', 'amlogic,meson8b-ir', 'amlogic,meson-gxbb-ir') : 'media',	
-	('hisilicon,hix5hd2-ir', 'hisilicon,hi3796cv300-ir') : 'media',	
-	('gpio-ir-tx',) : 'media',	
-	('gpio-ir-receiver',) : 'media',	
-	('ir-spi-led',) : 'media',	
-	('sigma,smp8642-ir',) : 'media',	
-	('allwinner,sun4i-a10-ir', 'allwinner,sun5i-a13-ir', 'allwinner,sun6i-a31-ir') : 'media',	
-	('zte,zx296718-irdec',) : 'media',	
-	('pwm-ir-tx',) : 'media',	
-	('nokia,n900-ir',) : 'media',	
-	('mediatek,mt7623-cir', 'mediatek,mt7622-cir') : 'media',	
-	('amlogic,meson-g12a-ao-cec', 'amlogic,meson-sm1-ao-cec') : 'media',	
-	('amlogic,meson-gx-ao-cec',) : 'media',	
-	('nvidia,tegra114-cec', 'nvidia,tegra124-cec', 'nvidia,tegra210-cec') : 'media',	
-	('st,stm32-cec',) : 'media',	
-	('chrontel,ch7322',) : 'media',	
-	('socionext,mn884433', 'socionext,mn884434-0', 'socionext,mn884434-1') : 'media',	
-	('composite-video-connector', 'svideo-connector', 'nokia,smia') : 'media',	
-	('mipi-ccs-1.1', 'mipi-ccs-1.0', 'mipi-ccs', 'nokia,smia') : 'media',	
-	('maxim,max9286',) : 'media',	
-	('dongwoon,dw9807-vcm',) : 'media',	
-	('toshiba,et8ek8',) : 'media',	
-	('ti,ths8200',) : 'media',	
-	('asahi-kasei,ak7375',) : 'media',	
-	('sony,imx214',) : 'media',	
-	('ti,tvp7002',) : 'media',	
-	('adi,adv7611', 'adi,adv7612') : 'media',	
-	('ovti,ov7725', 'ovti,ov7720') : 'media',	
-	('samsung,s5k6a3',) : 'media',	
-	('toshiba,tc358743',) : 'media',	
-	('samsung,s5k5baf',) : 'media',	
-	('st,st-mipid02',) : 'media',	
-	('ovti,ov5647',) : 'media',	
-	('ovti,ov5640',) : 'media',	
-	('ovti,ov9650', 'ovti,ov9652') : 'media',	
-	('ovti,ov7251',) : 'media',	
-	('panasonic,amg88xx', 'melexis,mlx90640') : 'media',	
-	('aptina,mt9p031', 'aptina,mt9p031m') : 'media',	
-	('nxp,tda19971', 'nxp,tda19973') : 'media',	
-	('sony,imx290',) : 'media',	
-	('adi,adv7343',) : 'media',	
-	('adi,adv7180', 'adi,adv7180cp', 'adi,adv7180st', 'adi,adv7182', 'adi,adv7280', 'adi,adv7280-m', 'adi,adv7281', 'adi,adv7281-m', 'adi,adv7281-ma', 'adi,adv7282', 'adi,adv7282-m') : 'media',	
-	('dongwoon,dw9714',) : 'media',	
-	('sony,imx219',) : 'media',	
-	('onnn,mt9m001',) : 'media',	
-	('adi,adv7481', 'adi,adv7482') : 'media',	
-	('dongwoon,dw9768', 'giantec,gt9769') : 'media',	
-	('ovti,ov8856',) : 'media',	
-	('ovti,ov5645',) : 'media',	
-	('ovti,ov02a10',) : 'media',	
-	('sony,imx274',) : 'media',	
-	('ovti,ov2685',) : 'media',	
-	('ovti,ov5695',) : 'media',	
-	('aptina,mt9v111',) : 'media',	
-	('ovti,ov2640',) : 'media',	
-	('ti,tvp5146', 'ti,tvp5146m2', 'ti,tvp5147', 'ti,tvp5147m1') : 'media',	
-	('micron,mt9m111',) : 'media',	
-	('ovti,ov2680',) : 'media',	
-	('adi,ad5820', 'adi,ad5821', 'adi,ad5823') : 'media',	
-	('aptina,mt9v022', 'aptina,mt9v022m', 'aptina,mt9v024', 'aptina,mt9v024m', 'aptina,mt9v032', 'aptina,mt9v032m', 'aptina,mt9v034', 'aptina,mt9v034m') : 'media',	
-	('imi,rdacm20',) : 'media',	
-	('ovti,ov7740',) : 'media',	
-	('maxim,max2175',) : 'media',	
-	('ti,tvp5150',) : 'media',	
-	('samsung,s5c73m3',) : 'media',	
-	('ovti,ov2659',) : 'media',	
-	('ovti,ov7670',) : 'media',	
-	('silabs,si4713',) : 'media',	
-	('silabs,si470x',) : 'media',	
-	('xlnx,fpga-slave-serial',) : 'fpga',	
-	('lattice,ice40-fpga-mgr',) : 'fpga',	
-	('altr,socfpga-a10-fpga-mgr',) : 'fpga',	
-	('fpga-region',) : 'fpga',	
-	('xlnx,pr-decoupler-1.00', 'xlnx,pr-decoupler') : 'fpga',	
-	('altr,a10-pr-ip',) : 'fpga',	
-	('altr,socfpga-fpga-mgr',) : 'fpga',	
-	('altr,socfpga-fpga2sdram-bridge',) : 'fpga',	
-	('intel,stratix10-soc-fpga-mgr', 'intel,agilex-soc-fpga-mgr') : 'fpga',	
-	('xlnx,zynqmp-pcap-fpga',) : 'fpga',	
-	('altr,socfpga-hps2fpga-bridge', 'altr,socfpga-lwhps2fpga-bridge', 'altr,socfpga-fpga2hps-bridge') : 'fpga',	
-	('lattice,machxo2-slave-spi',) : 'fpga',	
-	('xlnx,zynq-devcfg-1.0',) : 'fpga',	
-	('altr,fpga-passive-serial', 'altr,fpga-arria10-passive-serial') : 'fpga',	
-	('altr,freeze-bridge-controller',) : 'fpga',	
-	('ti,omap-opp-supply', 'ti,omap5-opp-supply', 'ti,omap5-core-opp-supply') : 'opp',	
-	('gw,gsc-adc',) : 'hwmon',	
-	('adi,adt7473', 'adi,adt7475', 'adi,adt7476', 'adi,adt7490') : 'hwmon',	
-	('pwm-fan',) : 'hwmon',	
-	('ti,ads7828', 'ti,ads7830') : 'hwmon',	
-	('lantiq,cputemp',) : 'hwmon',	
-	('kontron,sl28cpld-fan',) : 'hwmon',	
-	('national,lm95235', 'national,lm95245') : 'hwmon',	
-	('arm,vexpress-volt', 'arm,vexpress-amp', 'arm,vexpress-temp', 'arm,vexpress-power', 'arm,vexpress-energy') : 'hwmon',	
-	('moortec,mr75203',) : 'hwmon',	
-	('cirrus,lochnagar2-hwmon',) : 'hwmon',	
-	('microchip,mcp3021', 'microchip,mcp3221') : 'hwmon',	
-	('iio-hwmon',) : 'hwmon',	
-	('maxim,max6650', 'maxim,max6651') : 'hwmon',	
-	('ibm,p8-occ-hwmon',) : 'hwmon',	
-	('nuvoton,w83773g',) : 'hwmon',	
-	('maxim,max1619',) : 'hwmon',	
-	('ti,ina219', 'ti,ina220', 'ti,ina226', 'ti,ina230', 'ti,ina231') : 'iio/adc',	
-	('adi,axi-fan-control-1.00.a',) : 'hwmon',	
-	('ti,lm70', 'ti,tmp121', 'ti,tmp122', 'ti,lm71', 'ti,lm74') : 'hwmon',	
-	('gmt,g762', 'gmt,g763') : 'hwmon',	
-	('gpio-fan',) : 'hwmon',	
-	('ti,tmp512', 'ti,tmp513') : 'hwmon',	
-	('ti,lm87', 'adi,adm1024') : 'hwmon',	
-	('syna,as370-hwmon',) : 'hwmon',	
-	('arm,scpi-sensors', 'amlogic,meson-gxbb-scpi-sensors') : 'hwmon',	
-	('adi,ltc2947',) : 'hwmon',	
-	('ti,tmp102',) : 'hwmon',	
-	('adi,adt75', 'dallas,ds1775', 'dallas,ds75', 'dallas,ds7505', 'gmt,g751', 'national,lm75', 'national,lm75a', 'national,lm75b', 'maxim,max6625', 'maxim,max6626', 'maxim,max31725', 'maxim,max31726', 'maxim,mcp980x', 'nxp,pct2075', 'st,stds75', 'st,stlm75', 'microchip,tcn75', 'ti,tmp100', 'ti,tmp101', 'ti,tmp105', 'ti,tmp112', 'ti,tmp175', 'ti,tmp275', 'ti,tmp75', 'ti,tmp75b', 'ti,tmp75c') : 'hwmon',	
-	('ti,tmp421', 'ti,tmp422', 'ti,tmp423', 'ti,tmp441', 'ti,tmp442') : 'hwmon',	
-	('maxim,max31730',) : 'hwmon',	
-	('adi,adm1177',) : 'hwmon',	
-	('ti,lm73',) : 'hwmon',	
-	('SUNW,ebus-pic16f747-env',) : 'hwmon',	
-	('national,lm63', 'national,lm64', 'national,lm96163') : 'hwmon',	
-	('baikal,bt1-pvt',) : 'hwmon',	
-	('jedec,jc-42.4-temp',) : 'hwmon',	
-	('maxim,max6581', 'maxim,max6602', 'maxim,max6622', 'maxim,max6636', 'maxim,max6689', 'maxim,max6693', 'maxim,max6694', 'maxim,max6697', 'maxim,max6698', 'maxim,max6699') : 'hwmon',	
-	('adi,ad7416', 'adi,ad7417', 'adi,ad7418') : 'hwmon',	
-	('honeywell,hih6130',) : 'hwmon',	
-	('zyxel,nsa320-mcu',) : 'hwmon',	
-	('aspeed,ast2400-pwm-tacho', 'aspeed,ast2500-pwm-tacho') : 'hwmon',	
-	('ad,ad7414',) : 'hwmon',	
-	('ti,tmp103',) : 'hwmon',	
-	('inspur,ipsps1',) : 'hwmon',	
-	('ibm,cffps1', 'ibm,cffps2', 'ibm,cffps') : 'hwmon',	
-	('delta,q54sj108a2',) : 'hwmon',	
-	('ti,tps53647', 'ti,tps53667', 'ti,tps53679', 'ti,tps53681', 'ti,tps53688') : 'hwmon',	
-	('lltc,ltc2972', 'lltc,ltc2974', 'lltc,ltc2975', 'lltc,ltc2977', 'lltc,ltc2978', 'lltc,ltc2979', 'lltc,ltc2980', 'lltc,ltc3880', 'lltc,ltc3882', 'lltc,ltc3883', 'lltc,ltc3884', 'lltc,ltc3886', 'lltc,ltc3887', 'lltc,ltc3889', 'lltc,ltc7880', 'lltc,ltm2987', 'lltc,ltm4664', 'lltc,ltm4675', 'lltc,ltm4676', 'lltc,ltm4677', 'lltc,ltm4678', 'lltc,ltm4680', 'lltc,ltm4686', 'lltc,ltm4700') : 'hwmon',	
-	('st,pm6764tr',) : 'hwmon',	
-	('ti,cd9200', 'ti,cd9220', 'ti,cd9222', 'ti,cd9224', 'ti,cd9240', 'ti,cd9244', 'ti,cd9246', 'ti,cd9248') : 'hwmon',	
-	('adi,adm1266',) : 'hwmon',	
-	('maxim,max31785', 'maxim,max31785a') : 'hwmon',	
-	('infineon,xdpe12254', 'infineon,xdpe12284') : 'hwmon',	
-	('maxim,max20710', 'maxim,max20730', 'maxim,max20734', 'maxim,max20743') : 'hwmon',	
-	('ti,ucd9000', 'ti,ucd90120', 'ti,ucd90124', 'ti,ucd90160', 'ti,ucd90320', 'ti,ucd9090', 'ti,ucd90910') : 'hwmon',	
-	('mps,mp2975',) : 'hwmon',	
-	('adi,adm1027', 'adi,adt7463', 'adi,adt7468', 'national,lm85', 'national,lm85b', 'national,lm85c', 'ti,lm96000', 'smsc,emc6d100', 'smsc,emc6d101', 'smsc,emc6d102', 'smsc,emc6d103', 'smsc,emc6d103s') : 'hwmon',	
-	('nuvoton,npcm750-pwm-fan',) : 'hwmon',	
-	('amd,sbtsi',) : 'hwmon',	
-	('ti,ina209',) : 'hwmon',	
-	('maxim,max6621',) : 'hwmon',	
-	('apm,xgene-slimpro-hwmon',) : 'hwmon',	
-	('lltc,ltc4151',) : 'hwmon',	
-	('ti,adc128d818',) : 'hwmon',	
-	('sensirion,sht15',) : 'hwmon',	
-	('epcos,b57330v2103', 'epcos,b57891s0103', 'murata,ncp03wb473', 'murata,ncp03wf104', 'murata,ncp15wb473', 'murata,ncp15wl333', 'murata,ncp15xh103', 'murata,ncp18wb473', 'murata,ncp21wb473', 'ntc,ncp03wb473', 'ntc,ncp15wb473', 'ntc,ncp15wl333', 'ntc,ncp18wb473', 'ntc,ncp21wb473') : 'hwmon',	
-	('stts751',) : 'hwmon',	
-	('sensirion,shtc1', 'sensirion,shtw1', 'sensirion,shtc3') : 'hwmon',	
-	('adi,adm1032', 'adi,adt7461', 'adi,adt7461a', 'gmt,g781', 'national,lm90', 'national,lm86', 'national,lm89', 'national,lm99', 'dallas,max6646', 'dallas,max6647', 'dallas,max6649', 'dallas,max6654', 'dallas,max6657', 'dallas,max6658', 'dallas,max6659', 'dallas,max6680', 'dallas,max6681', 'dallas,max6695', 'dallas,max6696', 'onnn,nct1008', 'winbond,w83l771', 'nxp,sa56004', 'ti,tmp451') : 'hwmon',	
-	('ti,tmp108',) : 'hwmon',	
-	('ti,ina3221',) : 'hwmon',	
-	('adi,ltc2992',) : 'hwmon',	
-	('stericsson,abx500-temp',) : 'hwmon',	
-	('microchip,sparx5-temp',) : 'hwmon',	
-	('mediatek,mt7621-hsdma',) : 'staging',	
-	('cavium,octeon-3860-pip',) : 'staging',	
-	('mediatek,mt7621-pci',) : 'staging',	
-	('google,arche-platform', 'google,arche-platform', 'usbffff,2') : 'staging',	
-	('toshiba,apb-dummy-codec',) : 'staging',	
-	('usbffff,2',) : 'staging',	
-	('ralink,rt305x-gdma', 'ralink,rt3883-gdma') : 'staging',	
-	('xlnx,clocking-wizard',) : 'staging',	
-	('brcm,bcm2835-vchiq', 'brcm,bcm2836-vchiq') : 'staging',	
-	('hisilicon,hi6421-spmi',) : 'staging',	
-	('hisilicon,hi3670-usb-phy',) : 'staging',	
-	('hisilicon,kirin970-spmi-controller',) : 'staging',	
-	('silabs,wfx-sdio', 'silabs,wf200') : 'staging',	
-	('silabs,wfx-spi', 'silabs,wf200') : 'staging',	
-	('nvidia,nvec',) : 'staging',	
-	('xlnx,axi-fifo-mm-s-4.1',) : 'staging',	
-	('fsl,imx6-mipi-csi2',) : 'staging',	
-	('fsl,imx-capture-subsystem',) : 'staging',	
-	('fsl,imx7-csi', 'fsl,imx6ul-csi') : 'staging',	
-	('fsl,imx7-mipi-csi2',) : 'staging',	
-	('rockchip,rk3399-vpu', 'rockchip,rk3328-vpu', 'rockchip,rk3288-vpu', 'nxp,imx8mq-vpu') : 'staging',	
-	('nvidia,tegra20-vde',) : 'staging',	
-	('amlogic,gxbb-vdec', 'amlogic,gxm-vdec', 'amlogic,gxl-vdec', 'amlogic,g12a-vdec', 'amlogic,sm1-vdec') : 'staging',	
-	('allwinner,sun4i-a10-video-engine', 'allwinner,sun5i-a13-video-engine', 'allwinner,sun7i-a20-video-engine', 'allwinner,sun8i-a33-video-engine', 'allwinner,sun8i-h3-video-engine', 'allwinner,sun8i-v3s-video-engine', 'allwinner,sun8i-r40-video-engine', 'allwinner,sun50i-a64-video-engine', 'allwinner,sun50i-h5-video-engine', 'allwinner,sun50i-h6-video-engine') : 'staging',	
-	('allegro,al5e-1.1',) : 'staging',	
-	('rockchip,rk3399-vdec',) : 'staging',	
-	('nvidia,tegra210-csi', 'nvidia,tegra210-vi') : 'staging',	
-	('nvidia,tegra210-csi',) : 'staging',	
-	('nvidia,tegra210-vi',) : 'staging',	
-	('arcx,anybus-controller',) : 'staging',	
-	('cavium,octeon-5750-usbc',) : 'staging',	
-	('Smarthome-Wolf,pi433',) : 'staging',	
-	('adi,ad2s1210',) : 'staging',	
-	('adi,ad7745', 'adi,ad7746', 'adi,ad7747') : 'staging',	
-	('adi,adis16240',) : 'staging',	
-	('adi,adis16203',) : 'staging',	
-	('adi,ad7816', 'adi,ad7817', 'adi,ad7818') : 'staging',	
-	('adi,ad5933', 'adi,ad5934') : 'staging',	
-	('adi,ad9833', 'adi,ad9834', 'adi,ad9837', 'adi,ad9838') : 'staging',	
-	('adi,adt7316', 'adi,adt7317', 'adi,adt7318', 'adi,adt7516', 'adi,adt7517', 'adi,adt7519') : 'staging',	
-	('fsl,imx6q-mlb150', 'renesas,mlp', 'rcar,medialb-dim2', 'xlnx,axi4-os62420_3pin-1.00.a', 'xlnx,axi4-os62420_6pin-1.00.a') : 'staging',	
-	('qcom,sc7180-aggre1-noc', 'qcom,sc7180-aggre2-noc', 'qcom,sc7180-camnoc-virt', 'qcom,sc7180-compute-noc', 'qcom,sc7180-config-noc', 'qcom,sc7180-dc-noc', 'qcom,sc7180-gem-noc', 'qcom,sc7180-ipa-virt', 'qcom,sc7180-mc-virt', 'qcom,sc7180-mmss-noc', 'qcom,sc7180-npu-noc', 'qcom,sc7180-qup-virt', 'qcom,sc7180-system-noc') : 'interconnect',	
-	('qcom,bcm-voter',) : 'interconnect',	
-	('qcom,sm8250-aggre1-noc', 'qcom,sm8250-aggre2-noc', 'qcom,sm8250-compute-noc', 'qcom,sm8250-config-noc', 'qcom,sm8250-dc-noc', 'qcom,sm8250-gem-noc', 'qcom,sm8250-ipa-virt', 'qcom,sm8250-mc-virt', 'qcom,sm8250-mmss-noc', 'qcom,sm8250-npu-noc', 'qcom,sm8250-system-noc') : 'interconnect',	
-	('qcom,qcs404-bimc', 'qcom,qcs404-pcnoc', 'qcom,qcs404-snoc') : 'interconnect',	
-	('qcom,sm8150-aggre1-noc', 'qcom,sm8150-aggre2-noc', 'qcom,sm8150-camnoc-virt', 'qcom,sm8150-compute-noc', 'qcom,sm8150-config-noc', 'qcom,sm8150-dc-noc', 'qcom,sm8150-gem-noc', 'qcom,sm8150-ipa-virt', 'qcom,sm8150-mc-virt', 'qcom,sm8150-mmss-noc', 'qcom,sm8150-system-noc') : 'interconnect',	
-	('qcom,msm8916-bimc', 'qcom,msm8916-pcnoc', 'qcom,msm8916-snoc') : 'interconnect',	
-	('qcom,sdm845-aggre1-noc', 'qcom,sdm845-aggre2-noc', 'qcom,sdm845-config-noc', 'qcom,sdm845-dc-noc', 'qcom,sdm845-gladiator-noc', 'qcom,sdm845-mem-noc', 'qcom,sdm845-mmss-noc', 'qcom,sdm845-system-noc') : 'interconnect',	
-	('qcom,msm8974-bimc', 'qcom,msm8974-cnoc', 'qcom,msm8974-mmssnoc', 'qcom,msm8974-ocmemnoc', 'qcom,msm8974-pnoc', 'qcom,msm8974-snoc') : 'interconnect',	
-	('qcom,sc7180-osm-l3', 'qcom,sdm845-osm-l3', 'qcom,sm8150-osm-l3', 'qcom,sm8250-epss-l3') : 'interconnect',	
-	('socionext,uniphier-pro4-usb3-reset', 'socionext,uniphier-pro5-usb3-reset', 'socionext,uniphier-pxs2-usb3-reset', 'socionext,uniphier-ld20-usb3-reset', 'socionext,uniphier-pxs3-usb3-reset', 'socionext,uniphier-pro4-ahci-reset', 'socionext,uniphier-pxs2-ahci-reset', 'socionext,uniphier-pxs3-ahci-reset') : 'reset',	
-	('qcom,sdm845-pdc-global',) : 'reset',	
-	('st,stih407-powerdown', 'st,stih407-softreset', 'st,stih407-picophyreset') : 'reset',	
-	('marvell,berlin2-reset',) : 'reset',	
-	('socionext,uniphier-ld4-reset', 'socionext,uniphier-pro4-reset', 'socionext,uniphier-sld8-reset', 'socionext,uniphier-pro5-reset', 'socionext,uniphier-pxs2-reset', 'socionext,uniphier-ld11-reset', 'socionext,uniphier-ld20-reset', 'socionext,uniphier-pxs3-reset', 'socionext,uniphier-ld4-mio-reset', 'socionext,uniphier-pro4-mio-reset', 'socionext,uniphier-sld8-mio-reset', 'socionext,uniphier-pro5-sd-reset', 'socionext,uniphier-pxs2-sd-reset', 'socionext,uniphier-ld11-mio-reset', 'socionext,uniphier-ld11-sd-reset', 'socionext,uniphier-ld20-sd-reset', 'socionext,uniphier-pxs3-sd-reset', 'socionext,uniphier-ld4-peri-reset', 'socionext,uniphier-pro4-peri-reset', 'socionext,uniphier-sld8-peri-reset', 'socionext,uniphier-pro5-peri-reset', 'socionext,uniphier-pxs2-peri-reset', 'socionext,uniphier-ld11-peri-reset', 'socionext,uniphier-ld20-peri-reset', 'socionext,uniphier-pxs3-peri-reset', 'socionext,uniphier-ld11-adamv-reset', 'socionext,uniphier-ld20-adamv-reset') : 'reset',	
-	('snps,axs10x-reset',) : 'reset',	
-	('hisilicon,hi3660-reset',) : 'reset',	
-	('hisilicon,hi6220-sysctrl', 'hisilicon,hi6220-mediactrl', 'hisilicon,hi6220-aoctrl') : 'reset',	
-	('allwinner,sun6i-a31-ahb1-reset',) : 'reset',	
-	('raspberrypi,firmware-reset',) : 'reset',	
-	('ti,sci-reset',) : 'reset',	
-	('img,pistachio-reset',) : 'reset',	
-	('altr,rst-mgr',) : 'reset',	
-	('altr,stratix10-rst-mgr', 'st,stm32-rcc', 'allwinner,sun6i-a31-clock-reset', 'zte,zx296718-reset', 'aspeed,ast2400-lpc-reset', 'aspeed,ast2500-lpc-reset', 'bitmain,bm1880-reset', 'snps,dw-high-reset', 'snps,dw-low-reset') : 'reset',	
-	('altr,a10sr-reset',) : 'reset',	
-	('nxp,lpc1850-rgu',) : 'reset',	
-	('qca,ar7100-reset',) : 'reset',	
-	('fsl,imx7d-src', 'fsl,imx8mq-src', 'fsl,imx8mp-src') : 'reset',	
-	('xlnx,zynqmp-reset', 'xlnx,versal-reset') : 'reset',	
-	('amlogic,meson-axg-audio-arb', 'amlogic,meson-sm1-audio-arb') : 'reset',	
-	('amlogic,meson8b-reset', 'amlogic,meson-gxbb-reset', 'amlogic,meson-axg-reset', 'amlogic,meson-a1-reset') : 'reset',	
-	('snps,hsdk-reset',) : 'reset',	
-	('brcm,bcm7216-pcie-sata-rescal',) : 'reset',	
-	('intel,rcu-lgm', 'intel,rcu-xrx200') : 'reset',	
-	('nuvoton,npcm750-reset',) : 'reset',	
-	('xlnx,zynq-reset',) : 'reset',	
-	('qcom,sdm845-aoss-cc',) : 'reset',	
-	('brcm,bcm6345-reset',) : 'reset',	
-	('ti,syscon-reset',) : 'reset',	
-	('brcm,brcmstb-reset',) : 'reset',	
-	('st,stm32mp1-rcc',) : 'clk',	
-	('lantiq,danube-reset', 'lantiq,xrx200-reset') : 'reset',	
-	('oxsemi,ox810se-reset', 'oxsemi,ox820-reset') : 'reset',	
-	('arm,dsu-pmu',) : 'perf',	
-	('arm,ccn-502', 'arm,ccn-504', 'arm,ccn-512') : 'perf',	
-	('arm,statistical-profiling-extension-v1',) : 'perf',	
-	('fsl,imx8-ddr-pmu', 'fsl,imx8m-ddr-pmu', 'fsl,imx8mq-ddr-pmu', 'fsl,imx8mm-ddr-pmu', 'fsl,imx8mn-ddr-pmu', 'fsl,imx8mp-ddr-pmu') : 'perf',	
-	('arm,cmn-600',) : 'perf',	
-	('arm,cci-400-pmu', 'arm,cci-400-pmu,r0', 'arm,cci-400-pmu,r1', 'arm,cci-500-pmu,r0', 'arm,cci-550-pmu,r0') : 'perf',	
-	('st,stm32-thermal',) : 'thermal',	
-	('st,stih415-sas-thermal', 'st,stih415-mpe-thermal', 'st,stih416-sas-thermal', 'st,stid127-thermal') : 'thermal',	
-	('st,stih416-mpe-thermal', 'st,stih407-thermal') : 'thermal',	
-	('hisilicon,tsensor', 'hisilicon,hi3660-tsensor') : 'thermal',	
-	('zte,zx296718-thermal',) : 'thermal',	
-	('stericsson,db8500-thermal',) : 'thermal',	
-	('mediatek,mt8173-thermal', 'mediatek,mt2701-thermal', 'mediatek,mt2712-thermal', 'mediatek,mt7622-thermal', 'mediatek,mt8183-thermal') : 'thermal',	
-	('marvell,kirkwood-thermal',) : 'thermal',	
-	('allwinner,sun8i-a83t-ths', 'allwinner,sun8i-h3-ths', 'allwinner,sun8i-r40-ths', 'allwinner,sun50i-a64-ths', 'allwinner,sun50i-a100-ths', 'allwinner,sun50i-h5-ths', 'allwinner,sun50i-h6-ths') : 'thermal',	
-	('fsl,imx-sc-thermal',) : 'thermal',	
-	('rockchip,px30-tsadc', 'rockchip,rv1108-tsadc', 'rockchip,rk3228-tsadc', 'rockchip,rk3288-tsadc', 'rockchip,rk3328-tsadc', 'rockchip,rk3366-tsadc', 'rockchip,rk3368-tsadc', 'rockchip,rk3399-tsadc') : 'thermal',	
-	('samsung,exynos3250-tmu', 'samsung,exynos4210-tmu', 'samsung,exynos4412-tmu', 'samsung,exynos5250-tmu', 'samsung,exynos5260-tmu', 'samsung,exynos5420-tmu', 'samsung,exynos5420-tmu-ext-triminfo', 'samsung,exynos5433-tmu', 'samsung,exynos7-tmu') : 'thermal',	
-	('sprd,ums512-thermal',) : 'thermal',	
-	('amlogic,g12a-ddr-thermal', 'amlogic,g12a-cpu-thermal') : 'thermal',	
-	('renesas,r8a774a1-thermal', 'renesas,r8a774b1-thermal', 'renesas,r8a774e1-thermal', 'renesas,r8a7795-thermal', 'renesas,r8a7796-thermal', 'renesas,r8a77961-thermal', 'renesas,r8a77965-thermal', 'renesas,r8a77980-thermal', 'renesas,r8a779a0-thermal') : 'thermal',	
-	('st,thermal-spear1340',) : 'thermal',	
-	('generic-adc-thermal',) : 'thermal',	
-	('amazon,al-thermal',) : 'thermal',	
-	('fsl,imx6q-tempmon', 'fsl,imx6sx-tempmon', 'fsl,imx7d-tempmon') : 'thermal',	
-	('marvell,armadaxp-thermal', 'marvell,armada370-thermal', 'marvell,armada375-thermal', 'marvell,armada380-thermal', 'marvell,armada-ap806-thermal', 'marvell,armada-cp110-thermal') : 'thermal',	
-	('ti,am654-vtm',) : 'thermal',	
-	('fsl,imx8mm-tmu', 'fsl,imx8mp-tmu') : 'thermal',	
-	('socionext,uniphier-pxs2-thermal', 'socionext,uniphier-ld20-thermal', 'socionext,uniphier-pxs3-thermal') : 'thermal',	
-	('ti,omap34xx-bandgap', 'ti,omap36xx-bandgap', 'ti,omap4430-bandgap', 'ti,omap4460-bandgap', 'ti,omap4470-bandgap', 'ti,omap5430-bandgap', 'ti,dra752-bandgap') : 'thermal',	
-	('nvidia,tegra124-soctherm', 'nvidia,tegra132-soctherm', 'nvidia,tegra210-soctherm') : 'thermal',	
-	('nvidia,tegra186-bpmp-thermal',) : 'thermal',	
-	('renesas,rcar-thermal', 'renesas,rcar-gen2-thermal', 'renesas,thermal-r8a774c0', 'renesas,thermal-r8a77970', 'renesas,thermal-r8a77990', 'renesas,thermal-r8a77995') : 'thermal',	
-	('brcm,sr-thermal',) : 'thermal',	
-	('brcm,avs-tmon-bcm7216', 'brcm,avs-tmon') : 'thermal',	
-	('brcm,ns-thermal',) : 'thermal',	
-	('brcm,bcm2835-thermal', 'brcm,bcm2836-thermal', 'brcm,bcm2837-thermal') : 'thermal',	
-	('brcm,bcm2711-thermal',) : 'thermal',	
-	('marvell,dove-thermal',) : 'thermal',	
-	('sigma,smp8758-thermal',) : 'thermal',	
-	('dlg,da9062-thermal',) : 'thermal',	
-	('qcom,spmi-temp-alarm',) : 'thermal',	
-	('qcom,msm8916-tsens', 'qcom,msm8939-tsens', 'qcom,msm8974-tsens', 'qcom,msm8976-tsens', 'qcom,msm8996-tsens', 'qcom,tsens-v1', 'qcom,tsens-v2') : 'thermal',	
-	('fsl,qoriq-tmu', 'fsl,imx8mq-tmu') : 'thermal',	
-	('snps,dw-i3c-master-1.00a',) : 'i3c',	
-	('cdns,i3c-master',) : 'i3c',	
-	('mipi-i3c-hci',) : 'i3c',	
-	('google,cros-ec-typec',) : 'platform',	
-	('google,cros-ec-spi',) : 'platform',	
-	('google,cros-ec-i2c',) : 'platform',	
-	('google,cros-ec-rpmsg',) : 'platform',	
-	('loongson,rs780e-acpi',) : 'platform',	
-	('google,android-pipe',) : 'platform',	
-	('olpc,xo1.75-ec',) : 'platform',	
-	('ralink,rt2880-wdt',) : 'watchdog',	
-	('dlg,da9062-watchdog',) : 'watchdog',	
-	('qcom,kpss-timer', 'qcom,scss-timer', 'qcom,kpss-wdt') : 'watchdog',	
-	('nxp,lpc1850-wwdt',) : 'watchdog',	
-	('amlogic,meson-gxbb-wdt',) : 'watchdog',	
-	('renesas,rcar-gen2-wdt', 'renesas,rcar-gen3-wdt') : 'watchdog',	
-	('sigma,smp8642-wdt', 'sigma,smp8759-wdt') : 'watchdog',	
-	('stericsson,coh901327',) : 'watchdog',	
-	('nxp,pnx4008-wdt',) : 'watchdog',	
-	('renesas,r7s9210-wdt', 'renesas,rza-wdt') : 'watchdog',	
-	('fsl,imx-sc-wdt',) : 'watchdog',	
-	('sprd,sp9860-wdt',) : 'watchdog',	
-	('ti,twl4030-wdt',) : 'watchdog',	
-	('lantiq,wdt', 'lantiq,xrx100-wdt', 'lantiq,falcon-wdt') : 'watchdog',	
-	('ti,davinci-wdt',) : 'watchdog',	
-	('samsung,s3c2410-wdt', 'samsung,s3c6410-wdt', 'samsung,exynos5250-wdt', 'samsung,exynos5420-wdt', 'samsung,exynos7-wdt') : 'watchdog',	
-	('atmel,at91sam9260-wdt',) : 'watchdog',	
-	('ti,j7-rti-wdt',) : 'watchdog',	
-	('linux,wdt-gpio',) : 'watchdog',	
-	('xlnx,xps-timebase-wdt-1.00.a', 'xlnx,xps-timebase-wdt-1.01.a') : 'watchdog',	
-	('brcm,kona-wdt',) : 'watchdog',	
-	('toshiba,visconti-wdt',) : 'watchdog',	
-	('cdns,wdt-r1p2',) : 'watchdog',	
-	('sirf,atlas7-tick',) : 'watchdog',	
-	('microchip,pic32mzda-wdt',) : 'watchdog',	
-	('zii,rave-wdt',) : 'watchdog',	
-	('sirf,prima2-tick',) : 'watchdog',	
-	('st,stm32-iwdg', 'st,stm32mp1-iwdg') : 'watchdog',	
-	('img,pdc-wdt',) : 'watchdog',	
-	('arm,smc-wdt',) : 'watchdog',	
-	('qca,ar7130-wdt',) : 'watchdog',	
-	('mediatek,mt2712-wdt', 'mediatek,mt6589-wdt', 'mediatek,mt8183-wdt') : 'watchdog',	
-	('ingenic,jz4740-watchdog', 'ingenic,jz4780-watchdog') : 'watchdog',	
-	('kontron,sl28cpld-wdt',) : 'watchdog',	
-	('moxa,moxart-watchdog',) : 'watchdog',	
-	('amlogic,meson6-wdt', 'amlogic,meson8-wdt', 'amlogic,meson8b-wdt', 'amlogic,meson8m2-wdt') : 'watchdog',	
-	('mediatek,mt7621-wdt',) : 'watchdog',	
-	('mpc83xx_wdt', 'fsl,mpc8610-wdt', 'fsl,mpc823-wdt') : 'watchdog',	
-	('faraday,ftwdt010', 'cortina,gemini-watchdog') : 'watchdog',	
-	('brcm,bcm7038-wdt',) : 'watchdog',	
-	('zii,rave-sp-watchdog-legacy', 'zii,rave-sp-watchdog') : 'watchdog',	
-	('aspeed,ast2400-wdt', 'aspeed,ast2500-wdt', 'aspeed,ast2600-wdt') : 'watchdog',	
-	('atmel,at91rm9200-wdt',) : 'watchdog',	
-	('st,stpmic1-wdt',) : 'watchdog',	
-	('qcom,pm8916-wdt',) : 'watchdog',	
-	('gef,fpga-wdt',) : 'watchdog',	
-	('fsl,imx7ulp-wdt',) : 'watchdog',	
-	('atmel,sama5d4-wdt', 'microchip,sam9x60-wdt') : 'watchdog',	
-	('socionext,uniphier-wdt',) : 'watchdog',	
-	('st,stih407-lpc',) : 'rtc',	
-	('nuvoton,npcm750-wdt',) : 'watchdog',	
-	('microchip,pic32mzda-dmt',) : 'watchdog',	
-	('fsl,imx21-wdt',) : 'watchdog',	
-	('arm,sbsa-gwdt',) : 'watchdog',	
-	('snps,dw-wdt',) : 'watchdog',	
-	('marvell,armada-3700-wdt',) : 'watchdog',	
-	('zte,zx296718-wdt',) : 'watchdog',	
-	('technologic,ts4800-wdt',) : 'watchdog',	
-	('men,a021-wdt',) : 'watchdog',	
-	('nvidia,tegra30-timer',) : 'watchdog',	
-	('ti,omap3-wdt',) : 'watchdog',	
-	('allwinner,sun4i-a10-wdt', 'allwinner,sun6i-a31-wdt') : 'watchdog',	
-	('cnxt,cx92755-wdt',) : 'watchdog',	
-	('marvell,orion-wdt', 'marvell,armada-370-wdt', 'marvell,armada-xp-wdt', 'marvell,armada-375-wdt', 'marvell,armada-380-wdt') : 'watchdog',	
-	('realtek,rtd1295-watchdog',) : 'watchdog',	
-	('alphascale,asm9260-wdt',) : 'watchdog',	
-	('ingenic,x1000-ost',) : 'clocksource',	
-	('ti,omap-counter32k', 'ti,omap2420-timer', 'ti,omap3430-timer', 'ti,omap4430-timer', 'ti,omap5430-timer', 'ti,am335x-timer', 'ti,am335x-timer-1ms', 'ti,dm814-timer', 'ti,dm816-timer') : 'clocksource',	
-	('ingenic,jz4740-tcu', 'ingenic,jz4725b-tcu', 'ingenic,jz4770-tcu', 'ingenic,x1000-tcu') : 'clk',	
-	('ti,omap2420-timer', 'ti,omap3430-timer', 'ti,omap4430-timer', 'ti,omap5430-timer', 'ti,am335x-timer', 'ti,am335x-timer-1ms', 'ti,dm816-timer') : 'clocksource',	
-	('ingenic,jz4725b-ost', 'ingenic,jz4770-ost') : 'clocksource',	
-	('picochip,pc3x2-rtc',) : 'clocksource',	
-	('cdns,ttc',) : 'clocksource',	
-	('renesas,mtu2',) : 'clocksource',	
-	('atmel,at91rm9200-tcb', 'atmel,at91sam9x5-tcb', 'atmel,sama5d2-tcb') : 'clocksource',	
-	('renesas,cmt-48', 'renesas,cmt-48-gen2', 'renesas,r8a7740-cmt1', 'renesas,sh73a0-cmt1', 'renesas,rcar-gen2-cmt0', 'renesas,rcar-gen2-cmt1', 'renesas,rcar-gen3-cmt0', 'renesas,rcar-gen3-cmt1') : 'clocksource',	
-	('st,stm32-lptimer-timer',) : 'clocksource',	
-	('renesas,em-sti',) : 'clocksource',	
-	('renesas,tmu',) : 'clocksource',	
-	('holtek,ht16k33',) : 'auxdisplay',	
-	('modtronix,lcd2s',) : 'auxdisplay',	
-	('img,boston-lcd', 'mti,malta-lcd', 'mti,sead3-lcd') : 'auxdisplay',	
-	('hit,hd44780',) : 'auxdisplay',	
-	('arm,versatile-lcd',) : 'auxdisplay',	
-	('arm,scpi-pre-1.0', 'arm,scpi', 'arm,scpi-pre-1.0') : 'firmware',	
-	('qemu,fw-cfg-mmio',) : 'firmware',	
-	('fsl,imx8qxp-scu-pd', 'fsl,scu-pd') : 'firmware',	
-	('fsl,imx-scu',) : 'firmware',	
-	('ti,k2g-sci', 'ti,am654-sci') : 'firmware',	
-	('arm,scmi', 'arm,scmi-smc') : 'firmware',	
-	('arm,psci', 'arm,psci-0.2', 'arm,psci-1.0') : 'firmware',	
-	('amlogic,meson-gxbb-sm',) : 'firmware',	
-	('arm,scpi-power-domains',) : 'firmware',	
-	('cznic,turris-mox-rwtm',) : 'firmware',	
-	('coreboot',) : 'firmware',	
-	('nvidia,tegra186-bpmp', 'nvidia,tegra210-bpmp') : 'firmware',	
-	('arm,sdei-1.0',) : 'firmware',	
-	('intel,stratix10-svc', 'intel,agilex-svc') : 'firmware',	
-	('raspberrypi,bcm2835-firmware',) : 'firmware',	
-	('xlnx,zynqmp-firmware', 'xlnx,versal-firmware') : 'firmware',	
-	('qcom,scm-apq8064', 'qcom,scm-apq8084', 'qcom,scm-ipq4019', 'qcom,scm-msm8660', 'qcom,scm-msm8960', 'qcom,scm-msm8916', 'qcom,scm-msm8974', 'qcom,scm-msm8994', 'qcom,scm-msm8996', 'qcom,scm') : 'firmware',	
-	('silabs,si514',) : 'clk',	
-	('st,flexgen-audio', 'st,flexgen-video') : 'clk',	
-	('intel,cgu-lgm',) : 'clk',	
-	('fsl,imx8mp-ccm',) : 'clk',	
-	('fsl,imx8mn-ccm',) : 'clk',	
-	('fsl,scu-clk', 'fsl,imx8qxp-clk') : 'clk',	
-	('fsl,imx8mq-ccm',) : 'clk',	
-	('fsl,imx8mm-ccm',) : 'clk',	
-	('fsl,imx8qxp-lpcg-adma', 'fsl,imx8qxp-lpcg-conn', 'fsl,imx8qxp-lpcg-lsio', 'fsl,imx8qxp-lpcg') : 'clk',	
-	('microchip,pic32mzda-clk',) : 'clk',	
-	('nxp,lpc1850-creg-clk',) : 'clk',	
-	('allwinner,sun9i-a80-de-clks',) : 'clk',	
-	('allwinner,sun50i-h6-ccu',) : 'clk',	
-	('allwinner,sun50i-a100-ccu',) : 'clk',	
-	('allwinner,sun9i-a80-usb-clks',) : 'clk',	
-	('allwinner,sun8i-a83t-ccu',) : 'clk',	
-	('allwinner,sun8i-r40-ccu',) : 'clk',	
-	('allwinner,sun9i-a80-ccu',) : 'clk',	
-	('allwinner,sun50i-a64-ccu',) : 'clk',	
-	('allwinner,sun50i-a100-r-ccu',) : 'clk',	
-	('allwinner,sun8i-a83t-de2-clk', 'allwinner,sun8i-h3-de2-clk', 'allwinner,sun8i-r40-de2-clk', 'allwinner,sun8i-v3s-de2-clk', 'allwinner,sun50i-a64-de2-clk', 'allwinner,sun50i-h5-de2-clk', 'allwinner,sun50i-h6-de3-clk') : 'clk',	
-	('maxim,max9485',) : 'clk',	
-	('adi,axi-clkgen-2.00.a',) : 'clk',	
-	('st,stm32f42xx-rcc', 'st,stm32f469-rcc', 'st,stm32f746-rcc', 'st,stm32f769-rcc') : 'clk',	
-	('idt,5p49v5923', 'idt,5p49v5925', 'idt,5p49v5933', 'idt,5p49v5935', 'idt,5p49v6901', 'idt,5p49v6965') : 'clk',	
-	('fsl,ls1028a-plldig',) : 'clk',	
-	('silabs,si5351a', 'silabs,si5351a-msop', 'silabs,si5351b', 'silabs,si5351c') : 'clk',	
-	('bitmain,bm1880-clk',) : 'clk',	
-	('snps,axs10x-i2s-pll-clock',) : 'clk',	
-	('snps,axs10x-pgu-pll-clock',) : 'clk',	
-	('silabs,si5340', 'silabs,si5341', 'silabs,si5342', 'silabs,si5344', 'silabs,si5345') : 'clk',	
-	('arm,scpi-dvfs-clocks', 'arm,scpi-variable-clocks', 'arm,scpi-clocks') : 'clk',	
-	('zte,zx296718-topcrm', 'zte,zx296718-lsp0crm', 'zte,zx296718-lsp1crm', 'zte,zx296718-audiocrm') : 'clk',	
-	('cirrus,cs2000-cp',) : 'clk',	
-	('ti,palmas-clk32kg', 'ti,palmas-clk32kgaudio') : 'clk',	
-	('hisilicon,hi3670-crgctrl', 'hisilicon,hi3670-pctrl', 'hisilicon,hi3670-pmuctrl', 'hisilicon,hi3670-sctrl', 'hisilicon,hi3670-iomcu', 'hisilicon,hi3670-media1-crg', 'hisilicon,hi3670-media2-crg') : 'clk',	
-	('hisilicon,hi3516cv300-crg', 'hisilicon,hi3516cv300-sysctrl') : 'clk',	
-	('hisilicon,hi3660-crgctrl', 'hisilicon,hi3660-pctrl', 'hisilicon,hi3660-pmuctrl', 'hisilicon,hi3660-sctrl', 'hisilicon,hi3660-iomcu') : 'clk',	
-	('hisilicon,hi6220-stub-clk',) : 'clk',	
-	('hisilicon,hi3798cv200-crg', 'hisilicon,hi3798cv200-sysctrl') : 'clk',	
-	('hisilicon,hi3519-crg',) : 'clk',	
-	('hisilicon,hi3660-stub-clk',) : 'clk',	
-	('cirrus,lochnagar1-clk', 'cirrus,lochnagar2-clk') : 'clk',	
-	('cortina,gemini-syscon',) : 'clk',	
-	('axis,artpec6-clkctrl',) : 'clk',	
-	('socionext,uniphier-ld4-clock', 'socionext,uniphier-pro4-clock', 'socionext,uniphier-sld8-clock', 'socionext,uniphier-pro5-clock', 'socionext,uniphier-pxs2-clock', 'socionext,uniphier-ld11-clock', 'socionext,uniphier-ld20-clock', 'socionext,uniphier-pxs3-clock', 'socionext,uniphier-ld4-mio-clock', 'socionext,uniphier-pro4-mio-clock', 'socionext,uniphier-sld8-mio-clock', 'socionext,uniphier-pro5-sd-clock', 'socionext,uniphier-pxs2-sd-clock', 'socionext,uniphier-ld11-mio-clock', 'socionext,uniphier-ld20-sd-clock', 'socionext,uniphier-pxs3-sd-clock', 'socionext,uniphier-ld4-peri-clock', 'socionext,uniphier-pro4-peri-clock', 'socionext,uniphier-sld8-peri-clock', 'socionext,uniphier-pro5-peri-clock', 'socionext,uniphier-pxs2-peri-clock', 'socionext,uniphier-ld11-peri-clock', 'socionext,uniphier-ld20-peri-clock', 'socionext,uniphier-pxs3-peri-clock') : 'clk',	
-	('brcm,brcm2711-dvp',) : 'clk',	
-	('brcm,bcm3368-clocks', 'brcm,bcm6318-clocks', 'brcm,bcm6318-ubus-clocks', 'brcm,bcm6328-clocks', 'brcm,bcm6358-clocks', 'brcm,bcm6362-clocks', 'brcm,bcm6368-clocks', 'brcm,bcm63268-clocks') : 'clk',	
-	('brcm,sr-genpll0', 'brcm,sr-genpll2', 'brcm,sr-genpll4', 'brcm,sr-genpll5', 'brcm,sr-lcpll0', 'brcm,sr-lcpll1', 'brcm,sr-lcpll-pcie') : 'clk',	
-	('raspberrypi,firmware-clocks',) : 'clk',	
-	('brcm,bcm2835-aux',) : 'clk',	
-	('brcm,bcm2835-cprman', 'brcm,bcm2711-cprman') : 'clk',	
-	('samsung,exynos3250-pmu', 'samsung,exynos4210-pmu', 'samsung,exynos4412-pmu', 'samsung,exynos5250-pmu', 'samsung,exynos5410-pmu', 'samsung,exynos5420-pmu', 'samsung,exynos5433-pmu') : 'clk',	
-	('samsung,clock-xxti', 'samsung,clock-xusbxti') : 'clk',	
-	('samsung,exynos5250-clock', 'samsung,exynos5420-clock', 'samsung,exynos5800-clock') : 'clk',	
-	('samsung,exynos5433-cmu-aud', 'samsung,exynos5433-cmu-cam0', 'samsung,exynos5433-cmu-cam1', 'samsung,exynos5433-cmu-disp', 'samsung,exynos5433-cmu-g2d', 'samsung,exynos5433-cmu-g3d', 'samsung,exynos5433-cmu-fsys', 'samsung,exynos5433-cmu-gscl', 'samsung,exynos5433-cmu-mfc', 'samsung,exynos5433-cmu-hevc', 'samsung,exynos5433-cmu-isp', 'samsung,exynos5433-cmu-mscl', 'samsung,exynos5433-cmu-imem') : 'clk',	
-	('samsung,clock-xxti',) : 'clk',	
-	('samsung,exynos5420-oscclk',) : 'clk',	
-	('samsung,s5pv210-audss-clock',) : 'clk',	
-	('samsung,exynos4412-isp-clock',) : 'clk',	
-	('samsung,exynos3250-cmu-isp',) : 'clk',	
-	('amlogic,meson8-ddr-clkc', 'amlogic,meson8b-ddr-clkc') : 'clk',	
-	('amlogic,axg-clkc',) : 'clk',	
-	('amlogic,g12a-clkc', 'amlogic,g12b-clkc', 'amlogic,sm1-clkc') : 'clk',	
-	('amlogic,gxbb-clkc', 'amlogic,gxl-clkc') : 'clk',	
-	('amlogic,axg-audio-clkc', 'amlogic,g12a-audio-clkc', 'amlogic,sm1-audio-clkc') : 'clk',	
-	('ti,da850-psc0', 'ti,da850-psc1') : 'clk',	
-	('ti,da850-pll1',) : 'clk',	
-	('ti,da830-tbclksync', 'ti,da830-div4p5ena', 'ti,da850-async1-clksrc', 'ti,da850-async3-clksrc', 'ti,da830-usb-phy-clocks') : 'clk',	
-	('marvell,armada-3700-xtal-clock',) : 'clk',	
-	('marvell,armada-3700-tbg-clock',) : 'clk',	
-	('marvell,armada-3700-periph-clock-nb', 'marvell,armada-3700-periph-clock-sb') : 'clk',	
-	('marvell,ap806-system-controller', 'marvell,ap806-clock', 'marvell,ap807-clock') : 'clk',	
-	('marvell,cp110-system-controller0', 'marvell,cp110-clock') : 'clk',	
-	('marvell,ap806-cpu-clock', 'marvell,ap807-cpu-clock') : 'clk',	
-	('marvell,mmp2-audio-clock',) : 'clk',	
-	('actions,s500-cmu',) : 'clk',	
-	('actions,s700-cmu',) : 'clk',	
-	('actions,s900-cmu',) : 'clk',	
-	('silabs,si544a', 'silabs,si544b', 'silabs,si544c') : 'clk',	
-	('xlnx,zynqmp-clk', 'xlnx,versal-clk') : 'clk',	
-	('arm,im-pd1-syscon',) : 'clk',	
-	('arm,vexpress-osc',) : 'clk',	
-	('silabs,si570', 'silabs,si571', 'silabs,si598', 'silabs,si599') : 'clk',	
-	('stericsson,ab8500-clk',) : 'clk',	
-	('allwinner,sun6i-a31-ar100-clk',) : 'clk',	
-	('allwinner,sun8i-a23-apb0-clk',) : 'clk',	
-	('allwinner,sun6i-a31-apb0-gates-clk', 'allwinner,sun8i-a23-apb0-gates-clk') : 'clk',	
-	('allwinner,sun6i-a31-apb0-clk',) : 'clk',	
-	('allwinner,sun4i-a10-mod0-clk',) : 'clk',	
-	('allwinner,sun9i-a80-mmc-config-clk',) : 'clk',	
-	('fixed-mmio-clock',) : 'clk',	
-	('allwinner,sun4i-a10-pll3-2x-clk', 'fixed-factor-clock') : 'clk',	
-	('ti,dra7-atl',) : 'clk',	
-	('ti,dm814-adpll-s-clock', 'ti,dm814-adpll-lj-clock') : 'clk',	
-	('ti,clockdomain', 'ti,clockdomain') : 'clk',	
-	('fixed-clock', 'fixed-factor-clock') : 'clk',	
-	('ti,cdce706',) : 'clk',	
-	('pwm-clock',) : 'clk',	
-	('snps,hsdk-gp-pll-clock', 'snps,hsdk-hdmi-pll-clock') : 'clk',	
-	('aspeed,ast2600-scu',) : 'clk',	
-	('fsl,vf610-sai-clock',) : 'clk',	
-	('lsi,axm5516-clks',) : 'clk',	
-	('atmel,sama5d2-pmc',) : 'clk',	
-	('stericsson,nomadik-src',) : 'clk',	
-	('microchip,sparx5-dpll',) : 'clk',	
-	('fsl,ls1028a-flexspi-clk', 'fsl,lx2160a-flexspi-clk') : 'clk',	
-	('aspeed,ast2400-scu', 'aspeed,ast2500-scu') : 'clk',	
-	('ti,am654-ehrpwm-tbclk',) : 'clk',	
-	('ti,k2g-sci-clk',) : 'clk',	
-	('nvidia,tegra20-pmc',) : 'clk',	
-	('nvidia,tegra30-pmc',) : 'clk',	
-	('nvidia,tegra124-dfll', 'nvidia,tegra210-dfll') : 'clk',	
-	('nvidia,tegra114-pmc',) : 'clk',	
-	('nvidia,tegra210-pmc',) : 'clk',	
-	('nvidia,tegra124-pmc',) : 'clk',	
-	('intel,stratix10-clkmgr',) : 'clk',	
-	('intel,agilex-clkmgr',) : 'clk',	
-	('sprd,sc9860-pmu-gate', 'sprd,sc9860-pll', 'sprd,sc9860-ap-clk', 'sprd,sc9860-aon-prediv', 'sprd,sc9860-apahb-gate', 'sprd,sc9860-aon-gate', 'sprd,sc9860-aonsecure-clk', 'sprd,sc9860-agcp-gate', 'sprd,sc9860-gpu-clk', 'sprd,sc9860-vsp-clk', 'sprd,sc9860-vsp-gate', 'sprd,sc9860-cam-clk', 'sprd,sc9860-cam-gate', 'sprd,sc9860-disp-clk', 'sprd,sc9860-disp-gate', 'sprd,sc9860-apapb-gate') : 'clk',	
-	('sprd,sc9863a-ap-clk', 'sprd,sc9863a-pmu-gate', 'sprd,sc9863a-pll', 'sprd,sc9863a-mpll', 'sprd,sc9863a-rpll', 'sprd,sc9863a-dpll', 'sprd,sc9863a-aon-clk', 'sprd,sc9863a-apahb-gate', 'sprd,sc9863a-aonapb-gate', 'sprd,sc9863a-mm-gate', 'sprd,sc9863a-mm-clk', 'sprd,sc9863a-apapb-gate') : 'clk',	
-	('mediatek,mt7622-pciesys', 'mediatek,mt7622-ssusbsys') : 'clk',	
-	('mediatek,mt2712-bdpsys',) : 'clk',	
-	('mediatek,mt8183-ipu_adl',) : 'clk',	
-	('mediatek,mt2712-vdecsys',) : 'clk',	
-	('mediatek,mt7629-pciesys', 'mediatek,mt7629-ssusbsys') : 'clk',	
-	('mediatek,mt7629-apmixedsys', 'mediatek,mt7629-infracfg', 'mediatek,mt7629-topckgen', 'mediatek,mt7629-pericfg') : 'clk',	
-	('mediatek,mt6797-vencsys',) : 'clk',	
-	('mediatek,mt6797-imgsys',) : 'clk',	
-	('mediatek,mt6765-mmsys',) : 'clk',	
-	('mediatek,mt8183-camsys',) : 'clk',	
-	('mediatek,mt6779-camsys',) : 'clk',	
-	('mediatek,mt6765-vcodecsys',) : 'clk',	
-	('mediatek,mt2712-jpgdecsys',) : 'clk',	
-	('mediatek,mt7629-ethsys', 'mediatek,mt7629-sgmiisys') : 'clk',	
-	('mediatek,mt8183-imgsys',) : 'clk',	
-	('mediatek,mt2701-vdecsys',) : 'clk',	
-	('mediatek,mt8183-vdecsys',) : 'clk',	
-	('mediatek,mt2712-apmixedsys', 'mediatek,mt2712-topckgen', 'mediatek,mt2712-infracfg', 'mediatek,mt2712-pericfg', 'mediatek,mt2712-mcucfg') : 'clk',	
-	('mediatek,mt8183-vencsys',) : 'clk',	
-	('mediatek,mt6779-audio',) : 'clk',	
-	('mediatek,mt6779-ipesys',) : 'clk',	
-	('mediatek,mt2701-ethsys',) : 'clk',	
-	('mediatek,mt6779-mfgcfg',) : 'clk',	
-	('mediatek,mt2701-audsys',) : 'clk',	
-	('mediatek,mt8183-mfgcfg',) : 'clk',	
-	('mediatek,mt2712-mfgcfg',) : 'clk',	
-	('mediatek,mt7622-ethsys', 'mediatek,mt7622-sgmiisys') : 'clk',	
-	('mediatek,mt6765-audsys',) : 'clk',	
-	('mediatek,mt6765-imgsys',) : 'clk',	
-	('mediatek,mt8183-audiosys',) : 'clk',	
-	('mediatek,mt2701-topckgen', 'mediatek,mt2701-infracfg', 'mediatek,mt2701-pericfg', 'mediatek,mt2701-apmixedsys') : 'clk',	
-	('mediatek,mt6765-mipi0a',) : 'clk',	
-	('mediatek,mt6765-apmixedsys', 'mediatek,mt6765-topckgen', 'mediatek,mt6765-infracfg') : 'clk',	
-	('mediatek,mt7622-audsys',) : 'clk',	
-	('mediatek,mt6797-vdecsys',) : 'clk',	
-	('mediatek,mt2701-bdpsys',) : 'clk',	
-	('mediatek,mt6797-topckgen', 'mediatek,mt6797-infracfg', 'mediatek,mt6797-apmixedsys') : 'clk',	
-	('mediatek,mt6779-apmixed', 'mediatek,mt6779-topckgen', 'mediatek,mt6779-infracfg_ao') : 'clk',	
-	('mediatek,mt2701-g3dsys',) : 'clk',	
-	('mediatek,mt6779-imgsys',) : 'clk',	
-	('mediatek,mt6765-camsys',) : 'clk',	
-	('mediatek,mt2701-imgsys',) : 'clk',	
-	('mediatek,mt6779-vencsys',) : 'clk',	
-	('mediatek,mt8183-ipu_conn',) : 'clk',	
-	('mediatek,mt2712-imgsys',) : 'clk',	
-	('mediatek,mt7622-apmixedsys', 'mediatek,mt7622-infracfg', 'mediatek,mt7622-topckgen', 'mediatek,mt7622-pericfg') : 'clk',	
-	('mediatek,mt8183-ipu_core0',) : 'clk',	
-	('mediatek,mt8183-ipu_core1',) : 'clk',	
-	('mediatek,mt2701-hifsys',) : 'clk',	
-	('mediatek,mt6779-vdecsys',) : 'clk',	
-	('mediatek,mt2712-vencsys',) : 'clk',	
-	('mediatek,mt8183-apmixedsys', 'mediatek,mt8183-topckgen', 'mediatek,mt8183-infracfg', 'mediatek,mt8183-pericfg', 'mediatek,mt8183-mcucfg') : 'clk',	
-	('rockchip,rk3399-cru', 'rockchip,rk3399-pmucru') : 'clk',	
-	('sifive,fu540-c000-prci', 'sifive,fu740-c000-prci') : 'clk',	
-	('ti,cdce913', 'ti,cdce925', 'ti,cdce937', 'ti,cdce949') : 'clk',	
-	('gpio-mux-clock', 'gpio-gate-clock') : 'clk',	
-	('socionext,milbeaut-m10v-ccu',) : 'clk',	
-	('samsung,s2mps11-clk', 'samsung,s2mps13-clk', 'samsung,s2mps14-clk', 'samsung,s5m8767-clk') : 'clk',	
-	('qcom,qcs404-q6sstopcc',) : 'clk',	
-	('qcom,sc7180-gpucc',) : 'clk',	
-	('qcom,sc7180-rpmh-clk', 'qcom,sdm845-rpmh-clk', 'qcom,sdx55-rpmh-clk', 'qcom,sm8150-rpmh-clk', 'qcom,sm8250-rpmh-clk', 'qcom,sm8350-rpmh-clk') : 'clk',	
-	('qcom,msm8998-gpucc',) : 'clk',	
-	('qcom,sdm845-lpasscc',) : 'clk',	
-	('qcom,gcc-sdx55',) : 'clk',	
-	('qcom,gcc-qcs404',) : 'clk',	
-	('qcom,msm8996-apcc',) : 'clk',	
-	('qcom,gcc-msm8974', 'qcom,gcc-msm8974pro', 'qcom,gcc-msm8974pro-ac') : 'clk',	
-	('qcom,gcc-apq8084',) : 'clk',	
-	('qcom,msm8916-a53pll',) : 'clk',	
-	('qcom,gcc-sm8250',) : 'clk',	
-	('qcom,sm8150-videocc',) : 'clk',	
-	('qcom,gcc-sc7180',) : 'clk',	
-	('qcom,gcc-msm8994',) : 'clk',	
-	('qcom,mmcc-msm8996',) : 'clk',	
-	('qcom,gcc-ipq4019',) : 'clk',	
-	('qcom,gcc-sm8150',) : 'clk',	
-	('qcom,mmcc-msm8998',) : 'clk',	
-	('qcom,lcc-mdm9615',) : 'clk',	
-	('qcom,gcc-sdm845',) : 'clk',	
-	('qcom,sc7180-mss',) : 'clk',	
-	('qcom,sdm845-dispcc',) : 'clk',	
-	('qcom,gcc-msm8998',) : 'clk',	
-	('qcom,krait-cc-v1', 'qcom,krait-cc-v2') : 'clk',	
-	('qcom,mmcc-apq8084',) : 'clk',	
-	('qcom,gcc-sdm630', 'qcom,gcc-sdm660') : 'clk',	
-	('qcom,gcc-msm8996',) : 'clk',	
-	('qcom,gcc-msm8939',) : 'clk',	
-	('qcom,sdm845-camcc',) : 'clk',	
-	('qcom,lcc-ipq8064',) : 'clk',	
-	('qcom,gcc-msm8960', 'qcom,gcc-apq8064') : 'clk',	
-	('qcom,sc7180-videocc',) : 'clk',	
-	('qcom,ipq6018-a53pll',) : 'clk',	
-	('qcom,sm8250-videocc',) : 'clk',	
-	('qcom,gcc-mdm9615',) : 'clk',	
-	('qcom,rpmcc-msm8916', 'qcom,rpmcc-msm8936', 'qcom,rpmcc-msm8974', 'qcom,rpmcc-msm8976', 'qcom,rpmcc-msm8992', 'qcom,rpmcc-msm8994', 'qcom,rpmcc-msm8996', 'qcom,rpmcc-msm8998', 'qcom,rpmcc-qcs404', 'qcom,rpmcc-sdm660') : 'clk',	
-	('qcom,gcc-ipq8074',) : 'clk',	
-	('qcom,hfpll',) : 'clk',	
-	('qcom,sc7180-lpasshm', 'qcom,sc7180-lpasscorecc') : 'clk',	
-	('qcom,gcc-msm8660',) : 'clk',	
-	('qcom,gcc-msm8916',) : 'clk',	
-	('qcom,sm8250-gpucc',) : 'clk',	
-	('qcom,kpss-acc-v1', 'qcom,kpss-gcc') : 'clk',	
-	('qcom,sm8150-dispcc', 'qcom,sm8250-dispcc') : 'clk',	
-	('qcom,sc7180-dispcc',) : 'clk',	
-	('qcom,mmcc-msm8960', 'qcom,mmcc-apq8064') : 'clk',	
-	('qcom,sdm845-videocc',) : 'clk',	
-	('qcom,gcc-ipq6018',) : 'clk',	
-	('qcom,spmi-clkdiv',) : 'clk',	
-	('qcom,sm8250-lpass-aoncc', 'qcom,sm8250-lpass-audiocc') : 'clk',	
-	('qcom,gcc-ipq8064',) : 'clk',	
-	('qcom,mmcc-msm8974',) : 'clk',	
-	('qcom,rpmcc-msm8660', 'qcom,rpmcc-apq8060', 'qcom,rpmcc-apq8064', 'qcom,rpmcc-ipq806x') : 'clk',	
-	('qcom,sdm845-gpucc',) : 'clk',	
-	('qcom,sm8150-gpucc',) : 'clk',	
-	('qcom,sc7180-camcc',) : 'clk',	
-	('qcom,qcs404-turingcc',) : 'clk',	
-	('qcom,lcc-msm8960', 'qcom,lcc-apq8064') : 'clk',	
-	('oxsemi,ox810se-stdclk', 'oxsemi,ox820-stdclk') : 'clk',	
-	('fixed-clock', 'fixed-factor-clock', 'stericsson,u300-syscon-clk', 'stericsson,u300-syscon-mclk') : 'clk',	
-	('renesas,emev2-smu',) : 'clk',	
-	('renesas,r9a06g032-sysctrl',) : 'clk',	
-	('renesas,r7s9210-cpg-mssr', 'renesas,r8a7742-cpg-mssr', 'renesas,r8a7743-cpg-mssr', 'renesas,r8a7744-cpg-mssr', 'renesas,r8a7745-cpg-mssr', 'renesas,r8a77470-cpg-mssr', 'renesas,r8a774a1-cpg-mssr', 'renesas,r8a774b1-cpg-mssr', 'renesas,r8a774c0-cpg-mssr', 'renesas,r8a774e1-cpg-mssr', 'renesas,r8a7790-cpg-mssr', 'renesas,r8a7791-cpg-mssr', 'renesas,r8a7793-cpg-mssr', 'renesas,r8a7792-cpg-mssr', 'renesas,r8a7794-cpg-mssr', 'renesas,r8a7795-cpg-mssr', 'renesas,r8a7796-cpg-mssr', 'renesas,r8a77961-cpg-mssr', 'renesas,r8a77965-cpg-mssr', 'renesas,r8a77970-cpg-mssr', 'renesas,r8a77980-cpg-mssr', 'renesas,r8a77990-cpg-mssr', 'renesas,r8a77995-cpg-mssr', 'renesas,r8a779a0-cpg-mssr') : 'clk',	
-	('renesas,rcar-gen3-usb2-clock-sel',) : 'clk',	
-	('gpio-usb-b-connector',) : 'usb',	
-	('ingenic,jz4770-phy', 'ingenic,jz4780-phy', 'ingenic,x1000-phy', 'ingenic,x1830-phy') : 'usb',	
-	('nvidia,tegra30-usb-phy', 'nvidia,tegra20-usb-phy') : 'usb',	
-	('ti,am335x-usb-ctrl-module',) : 'usb',	
-	('nxp,isp1301',) : 'usb',	
-	('ti,am335x-usb-phy',) : 'usb',	
-	('usb-nop-xceiv',) : 'usb',	
-	('fsl,imx6sx-usbphy', 'fsl,imx6sl-usbphy', 'fsl,imx6q-usbphy', 'fsl,imx23-usbphy', 'fsl,vf610-usbphy', 'fsl,imx6ul-usbphy', 'fsl,imx7ulp-usbphy') : 'usb',	
-	('ti,twl6030-usb',) : 'usb',	
-	('ti,keystone-usbphy',) : 'usb',	
-	('qcom,dwc3', 'qcom,msm8996-dwc3', 'qcom,msm8998-dwc3', 'qcom,sdm845-dwc3') : 'usb',	
-	('samsung,exynos5250-dwusb3', 'samsung,exynos5433-dwusb3', 'samsung,exynos7-dwusb3') : 'usb',	
-	('rockchip,rk3399-dwc3', 'xlnx,zynqmp-dwc3', 'cavium,octeon-7130-usb-uctl', 'sprd,sc9860-dwc3', 'allwinner,sun50i-h6-dwc3', 'hisilicon,hi3670-dwc3', 'intel,keembay-dwc3') : 'usb',	
-	('snps,dwc3', 'synopsys,dwc3') : 'usb',	
-	('st,stih407-dwc3',) : 'usb',	
-	('amlogic,meson-gxl-usb-ctrl', 'amlogic,meson-gxm-usb-ctrl', 'amlogic,meson-axg-usb-ctrl', 'amlogic,meson-g12a-usb-ctrl', 'amlogic,meson-a1-usb-ctrl') : 'usb',	
-	('ti,keystone-dwc3', 'ti,am654-dwc3') : 'usb',	
-	('fsl,imx25-usbmisc', 'fsl,imx35-usbmisc', 'fsl,imx27-usbmisc', 'fsl,imx51-usbmisc', 'fsl,imx53-usbmisc', 'fsl,imx6q-usbmisc', 'fsl,vf610-usbmisc', 'fsl,imx6sx-usbmisc', 'fsl,imx6ul-usbmisc', 'fsl,imx7d-usbmisc', 'fsl,imx7ulp-usbmisc') : 'usb',	
-	('nvidia,tegra20-udc', 'nvidia,tegra30-udc', 'nvidia,tegra114-udc', 'nvidia,tegra124-udc') : 'usb',	
-	('qcom,ci-hdrc',) : 'usb',	
-	('chipidea,usb2', 'xlnx,zynq-usb-2.20a', 'lsi,zevio-usb') : 'usb',	
-	('fsl,imx23-usb', 'fsl,imx28-usb', 'fsl,imx27-usb', 'fsl,imx6q-usb', 'fsl,imx6sl-usb', 'fsl,imx6sx-usb', 'fsl,imx6ul-usb', 'fsl,imx7d-usb', 'fsl,imx7ulp-usb') : 'usb',	
-	('fsl,mpc8323-qe-usb', 'fsl,mpc8360-qe-usb', 'fsl,mpc8272-cpm-usb') : 'usb',	
-	('aspeed,ast2400-usb-vhub', 'aspeed,ast2500-usb-vhub', 'aspeed,ast2600-usb-vhub') : 'usb',	
-	('brcm,bdc-udc-v2', 'brcm,bdc') : 'usb',	
-	('maxim,max3420-udc', 'maxim,max3421-udc') : 'usb',	
-	('renesas,r8a7795-usb3-peri', 'renesas,rcar-gen3-usb3-peri') : 'usb',	
-	('nvidia,tegra210-xudc', 'nvidia,tegra186-xudc', 'nvidia,tegra194-xudc') : 'usb',	
-	('brcm,ns2-udc', 'brcm,cygnus-udc', 'brcm,iproc-udc') : 'usb',	
-	('nxp,lpc3220-udc',) : 'usb',	
-	('atmel,at91sam9rl-udc', 'atmel,at91sam9g45-udc', 'atmel,sama5d3-udc', 'microchip,sam9x60-udc', 'atmel,at91sam9g45-pmc', 'atmel,at91sam9rl-pmc', 'atmel,at91sam9x5-pmc') : 'usb',	
-	('marvell,pxa270-udc',) : 'usb',	
-	('atmel,at91rm9200-udc', 'atmel,at91sam9260-udc', 'atmel,at91sam9261-udc', 'atmel,at91sam9263-udc') : 'usb',	
-	('xlnx,usb2-device-4.00.a',) : 'usb',	
-	('cdns,usb3', 'fsl,imx8qm-usb3') : 'usb',	
-	('cdns,usb3',) : 'usb',	
-	('ti,j721e-usb',) : 'usb',	
-	('nvidia,tegra124-xusb', 'nvidia,tegra210-xusb', 'nvidia,tegra186-xusb', 'nvidia,tegra194-xusb') : 'usb',	
-	('marvell,pxau2o-ehci',) : 'usb',	
-	('fsl,mpc8323-qe-usb',) : 'usb',	
-	('nuvoton,npcm750-ehci',) : 'usb',	
-	('ti,ehci-omap',) : 'usb',	
-	('st,st-ohci-300x',) : 'usb',	
-	('via,vt8500-ehci', 'wm,prizm-ehci', 'generic-ehci', 'cavium,octeon-6335-ehci') : 'usb',	
-	('st,spear600-ohci',) : 'usb',	
-	('maxim,max3421',) : 'usb',	
-	('generic-uhci', 'platform-uhci') : 'usb',	
-	('st,st-ehci-300x',) : 'usb',	
-	('atmel,at91rm9200-ohci',) : 'usb',	
-	('nxp,ohci-nxp',) : 'usb',	
-	('hisilicon,hi3798cv200-xhci',) : 'usb',	
-	('marvell,pxa-ohci',) : 'usb',	
-	('samsung,s3c2410-ohci',) : 'usb',	
-	('xlnx,xps-usb-host-1.00.a',) : 'usb',	
-	('samsung,exynos4210-ohci',) : 'usb',	
-	('samsung,exynos4210-ehci',) : 'usb',	
-	('atmel,at91sam9g45-ehci',) : 'usb',	
-	('ohci-bigendian', 'ohci-be', 'ohci-littledian', 'ohci-le') : 'usb',	
-	('marvell,orion-ehci', 'marvell,armada-3700-ehci') : 'usb',	
-	('mediatek,mt8173-xhci', 'mediatek,mtk-xhci') : 'usb',	
-	('brcm,ehci-brcm-v2', 'brcm,bcm7445-ehci') : 'usb',	
-	('nvidia,tegra30-ehci', 'nvidia,tegra20-ehci') : 'usb',	
-	('generic-xhci', 'xhci-platform', 'marvell,armada-375-xhci', 'marvell,armada-380-xhci', 'marvell,armada3700-xhci', 'renesas,xhci-r8a7790', 'renesas,xhci-r8a7791', 'renesas,xhci-r8a7793', 'renesas,xhci-r8a7795', 'renesas,xhci-r8a7796', 'renesas,rcar-gen2-xhci', 'renesas,rcar-gen3-xhci', 'brcm,xhci-brcm-v2', 'brcm,bcm7445-xhci') : 'usb',	
-	('faraday,fotg210',) : 'usb',	
-	('ti,da830-ohci',) : 'usb',	
-	('st,spear600-ehci',) : 'usb',	
-	('generic-ohci', 'cavium,octeon-6335-ohci', 'ti,ohci-omap3') : 'usb',	
-	('fsl-usb2-mph', 'fsl-usb2-dr', 'fsl,mpc5121-usb2-dr') : 'usb',	
-	('usb-ehci',) : 'usb',	
-	('brcm,bcm2835-usb', 'hisilicon,hi6220-usb', 'rockchip,rk3066-usb', 'lantiq,arx100-usb', 'lantiq,xrx200-usb', 'snps,dwc2', 'samsung,s3c6400-hsotg', 'amlogic,meson8-usb', 'amlogic,meson8b-usb', 'amlogic,meson-gxbb-usb', 'amlogic,meson-g12a-usb', 'amcc,dwc-otg', 'apm,apm82181-dwc-otg', 'st,stm32f4x9-fsotg', 'st,stm32f4x9-hsotg', 'st,stm32f7-hsotg', 'st,stm32mp15-fsotg', 'st,stm32mp15-hsotg') : 'usb',	
-	('mediatek,mt8173-mtu3', 'mediatek,mtu3') : 'usb',	
-	('renesas,usbhs-r8a774c0', 'renesas,usbhs-r8a7790', 'renesas,usbhs-r8a7791', 'renesas,usbhs-r8a7794', 'renesas,usbhs-r8a7795', 'renesas,usbhs-r8a7796', 'renesas,usbhs-r8a77990', 'renesas,usbhs-r8a77995', 'renesas,rcar-gen2-usbhs', 'renesas,rcar-gen3-usbhs', 'renesas,rza1-usbhs', 'renesas,rza2-usbhs') : 'usb',	
-	('ti,tps6598x',) : 'usb',	
-	('qcom,pm8150b-usb-typec',) : 'usb',	
-	('mediatek,mt6360-tcpc',) : 'usb',	
-	('maxim,max33359',) : 'usb',	
-	('richtek,rt1711h',) : 'usb',	
-	('fcs,fusb302',) : 'usb',	
-	('nxp,ptn5110',) : 'usb',	
-	('st,stusb1600',) : 'usb',	
-	('ti,hd3ss3220',) : 'usb',	
-	('nxp,usb-isp1760', 'nxp,usb-isp1761') : 'usb',	
-	('microchip,usb2422', 'microchip,usb2512b', 'microchip,usb2512bi', 'microchip,usb2513b', 'microchip,usb2513bi', 'microchip,usb2514b', 'microchip,usb2514bi', 'microchip,usb2517', 'microchip,usb2517i') : 'usb',	
-	('smsc,usb3503', 'smsc,usb3503a') : 'usb',	
-	('brcm,usb-pinmap',) : 'usb',	
-	('smsc,usb4604',) : 'usb',	
-	('stericsson,db8500-musb',) : 'usb',	
-	('allwinner,sun4i-a10-musb', 'allwinner,sun6i-a31-musb', 'allwinner,sun8i-a33-musb', 'allwinner,sun8i-h3-musb') : 'usb',	
-	('mediatek,mtk-musb',) : 'usb',	
-	('ti,omap4-musb', 'ti,omap3-musb') : 'usb',	
-	('ti,musb-am33xx', 'ti,musb-dm816') : 'usb',	
-	('ingenic,jz4740-musb', 'ingenic,jz4770-musb') : 'usb',	
-	('ti,da830-musb',) : 'usb',	
-	('marvell,nfc-i2c',) : 'nfc',	
-	('marvell,nfc-spi',) : 'nfc',	
-	('nxp,pn544-i2c',) : 'nfc',	
-	('st,st95hf',) : 'nfc',	
-	('st,st21nfcb-i2c', 'st,st21nfcb_i2c', 'st,st21nfcc-i2c') : 'nfc',	
-	('st,st21nfcb-spi',) : 'nfc',	
-	('st,st21nfca-i2c', 'st,st21nfca_i2c') : 'nfc',	
-	('samsung,s3fwrn5-i2c',) : 'nfc',	
-	('samsung,s3fwrn82',) : 'nfc',	
-	('nxp,pn532', 'nxp,pn533-i2c', 'nxp,pn532-i2c') : 'nfc',	
-	('nxp,pn532',) : 'nfc',	
-	('nxp,nxp-nci-i2c',) : 'nfc',	
-	('ti,trf7970a',) : 'nfc',	
-	('ti,afe4404',) : 'iio/health',	
-	('maxim,max30102', 'maxim,max30105') : 'iio/health',	
-	('ti,afe4403',) : 'iio/health',	
-	('maxim,max30100',) : 'iio/health',	
-	('adi,ad2s1200', 'adi,ad2s1205') : 'iio/resolver',	
-	('adi,ad2s90',) : 'iio/resolver',	
-	('adi,adxl372',) : 'iio/accel',	
-	('fsl,mma7660',) : 'iio/accel',	
-	('bosch,bma400',) : 'iio/accel',	
-	('bosch,bmc150_accel', 'bosch,bmi055_accel', 'bosch,bma255', 'bosch,bma250e', 'bosch,bma222', 'bosch,bma222e', 'bosch,bma280') : 'iio/accel',	
-	('kionix,kxcjk1013', 'kionix,kxcj91008', 'kionix,kxtj21009', 'kionix,kxtf9') : 'iio/accel',	
-	('kionix,kxsd9',) : 'iio/accel',	
-	('st,lis3lv02d', 'st,lis3lv02dl-accel', 'st,lsm303dlh-accel', 'st,lsm303dlhc-accel', 'st,lis3dh-accel', 'st,lsm330d-accel', 'st,lsm330dl-accel', 'st,lsm330dlc-accel', 'st,lis331dl-accel', 'st,lis331dlh-accel', 'st,lsm303dl-accel', 'st,lsm303dlm-accel', 'st,lsm330-accel', 'st,lsm303agr-accel', 'st,lis2dh12-accel', 'st,h3lis331dl-accel', 'st,lis3l02dq', 'st,lng2dm-accel', 'st,lis2dw12', 'st,lis3de', 'st,lis2de12', 'st,lis2hh12') : 'iio/accel',	
-	('domintech,dmard05', 'domintech,dmard06', 'domintech,dmard07') : 'iio/accel',	
-	('fsl,mma8451', 'fsl,mma8452', 'fsl,mma8453', 'fsl,mma8652', 'fsl,mma8653', 'fsl,fxls8471') : 'iio/accel',	
-	('adi,adxl345', 'adi,adxl375') : 'iio/accel',	
-	('st,lis302dl-spi', 'st,lis3lv02dl-accel', 'st,lis3dh-accel', 'st,lsm330d-accel', 'st,lsm330dl-accel', 'st,lsm330dlc-accel', 'st,lis331dlh-accel', 'st,lsm330-accel', 'st,lsm303agr-accel', 'st,lis2dh12-accel', 'st,lis3l02dq', 'st,lng2dm-accel', 'st,h3lis331dl-accel', 'st,lis331dl-accel', 'st,lis2dw12', 'st,lis3dhh', 'st,lis3de') : 'iio/accel',	
-	('bosch,bma023', 'bosch,bma150', 'bosch,bma180', 'bosch,bma250', 'bosch,bma254', 'bosch,smb380') : 'iio/accel',	
-	('fsl,mma7455', 'fsl,mma7456') : 'iio/accel',	
-	('ingenic,jz4725b-adc', 'ingenic,jz4740-adc', 'ingenic,jz4770-adc') : 'iio/adc',	
-	('aspeed,ast2400-adc', 'aspeed,ast2500-adc') : 'iio/adc',	
-	('atmel,sama5d2-adc',) : 'iio/adc',	
-	('samsung,s3c2410-adc', 'samsung,s3c2416-adc', 'samsung,s3c2440-adc', 'samsung,s3c2443-adc', 'samsung,s3c6410-adc', 'samsung,s5pv210-adc', 'samsung,exynos4212-adc', 'samsung,exynos-adc-v1', 'samsung,exynos-adc-v2', 'samsung,exynos3250-adc', 'samsung,exynos7-adc') : 'iio/adc',	
-	('mps,mp2629_adc',) : 'iio/adc',	
-	('brcm,iproc-static-adc',) : 'iio/adc',	
-	('st,spear600-adc',) : 'iio/adc',	
-	('st,stm32h7-dfsdm', 'st,stm32mp1-dfsdm') : 'iio/adc',	
-	('maxim,max1027', 'maxim,max1029', 'maxim,max1031', 'maxim,max1227', 'maxim,max1229', 'maxim,max1231') : 'iio/adc',	
-	('maxim,max11100',) : 'iio/adc',	
-	('adi,axi-adc-10.0.a',) : 'iio/adc',	
-	('mediatek,mt6360-adc',) : 'iio/adc',	
-	('adi,ad7124-4', 'adi,ad7124-8') : 'iio/adc',	
-	('ti,twl4030-madc',) : 'iio/adc',	
-	('adi,ad7190', 'adi,ad7192', 'adi,ad7193', 'adi,ad7195') : 'iio/adc',	
-	('ti,ads1015', 'ti,ads1115') : 'iio/adc',	
-	('ti,adc141s626', 'ti,adc161s626') : 'iio/adc',	
-	('maxim,max1117', 'maxim,max1118', 'maxim,max1119') : 'iio/adc',	
-	('cosmic,10001-adc',) : 'iio/adc',	
-	('qcom,spmi-adc5', 'qcom,spmi-adc7', 'qcom,spmi-adc-rev2') : 'iio/adc',	
-	('adi,ad7605-4', 'adi,ad7606-4', 'adi,ad7606-6', 'adi,ad7606-8', 'adi,ad7606b', 'adi,ad7616') : 'iio/adc',	
-	('axentia,tse850-envelope-detector',) : 'iio/adc',	
-	('adi,ad7605-4', 'adi,ad7606-4', 'adi,ad7606-6', 'adi,ad7606-8') : 'iio/adc',	
-	('ti,adc128s052', 'ti,adc122s021', 'ti,adc122s051', 'ti,adc122s101', 'ti,adc124s021', 'ti,adc124s051', 'ti,adc124s101') : 'iio/adc',	
-	('xlnx,zynq-xadc-1.00.a', 'xlnx,axi-xadc-1.00.a') : 'iio/adc',	
-	('nxp,lpc1850-adc',) : 'iio/adc',	
-	('lltc,ltc2497',) : 'iio/adc',	
-	('avia,hx711',) : 'iio/adc',	
-	('adi,ad7949', 'adi,ad7682', 'adi,ad7689') : 'iio/adc',	
-	('rockchip,saradc', 'rockchip,rk3066-tsadc', 'rockchip,rk3399-saradc') : 'iio/adc',	
-	('maxim,max1241',) : 'iio/adc',	
-	('ti,tlc3541', 'ti,tlc4541') : 'iio/adc',	
-	('maxim,max9611', 'maxim,max9612') : 'iio/adc',	
-	('motorola,cpcap-adc', 'motorola,mapphone-cpcap-adc') : 'iio/adc',	
-	('ti,am3359-adc',) : 'iio/adc',	
-	('st,stm32f4-adc-core', 'st,stm32h7-adc-core', 'st,stm32mp1-adc-core') : 'iio/adc',	
-	('ti,adc108s102',) : 'iio/adc',	
-	('fsl,imx25-gcq',) : 'iio/adc',	
-	('x-powers,axp209-adc', 'x-powers,axp221-adc', 'x-powers,axp813-adc') : 'iio/adc',	
-	('qcom,spmi-iadc',) : 'iio/adc',	
-	('sd-modulator', 'ads1201') : 'iio/adc',	
-	('adi,ad7768-1',) : 'iio/adc',	
-	('nxp,lpc3220-adc',) : 'iio/adc',	
-	('mcp3001', 'mcp3002', 'mcp3004', 'mcp3008', 'mcp3201', 'mcp3202', 'mcp3204', 'mcp3208', 'mcp3301', 'microchip,mcp3001', 'microchip,mcp3002', 'microchip,mcp3004', 'microchip,mcp3008', 'microchip,mcp3201', 'microchip,mcp3202', 'microchip,mcp3204', 'microchip,mcp3208', 'microchip,mcp3301', 'microchip,mcp3550-50', 'microchip,mcp3550-60', 'microchip,mcp3551', 'microchip,mcp3553') : 'iio/adc',	
-	('mcp3422',) : 'iio/adc',	
-	('ti,adc12130', 'ti,adc12132', 'ti,adc12138') : 'iio/adc',	
-	('ti,ads124s06', 'ti,ads124s08') : 'iio/adc',	
-	('adi,ad7091r5',) : 'iio/adc',	
-	('ti,ads8684', 'ti,ads8688') : 'iio/adc',	
-	('qcom,pm8018-adc', 'qcom,pm8038-adc', 'qcom,pm8058-adc', 'qcom,pm8921-adc') : 'iio/adc',	
-	('ti,ads7950', 'ti,ads7951', 'ti,ads7952', 'ti,ads7953', 'ti,ads7954', 'ti,ads7955', 'ti,ads7956', 'ti,ads7957', 'ti,ads7958', 'ti,ads7959', 'ti,ads7960', 'ti,ads7961') : 'iio/adc',	
-	('microchip,mcp3911',) : 'iio/adc',	
-	('ti,adc084s021',) : 'iio/adc',	
-	('holt,hi8435',) : 'iio/adc',	
-	('qcom,spmi-vadc',) : 'iio/adc',	
-	('fsl,imx7d-adc',) : 'iio/adc',	
-	('allwinner,sun8i-a33-ths',) : 'iio/adc',	
-	('adi,ad9265', 'adi,ad9434', 'adi,ad9467') : 'iio/adc',	
-	('marvell,berlin2-adc',) : 'iio/adc',	
-	('st,stm32-dfsdm-adc', 'st,stm32-dfsdm-dmic') : 'iio/adc',	
-	('amlogic,meson8-saradc', 'amlogic,meson8b-saradc', 'amlogic,meson8m2-saradc', 'amlogic,meson-gxbb-saradc', 'amlogic,meson-gxl-saradc', 'amlogic,meson-gxm-saradc', 'amlogic,meson-axg-saradc', 'amlogic,meson-g12a-saradc') : 'iio/adc',	
-	('st,stmpe-adc',) : 'iio/adc',	
-	('nuvoton,nau7802',) : 'iio/adc',	
-	('adi,ad7904', 'adi,ad7914', 'adi,ad7923', 'adi,ad7924', 'adi,ad7908', 'adi,ad7918', 'adi,ad7928') : 'iio/adc',	
-	('fsl,vf610-adc',) : 'iio/adc',	
-	('ti,palmas-gpadc',) : 'iio/adc',	
-	('sprd,sc2731-adc',) : 'iio/adc',	
-	('lltc,ltc2496',) : 'iio/adc',	
-	('mediatek,mt2701-auxadc', 'mediatek,mt2712-auxadc', 'mediatek,mt7622-auxadc', 'mediatek,mt8173-auxadc', 'mediatek,mt6765-auxadc') : 'iio/adc',	
-	('adi,ad7292',) : 'iio/adc',	
-	('ti,ads8344',) : 'iio/adc',	
-	('ti,adc081c', 'ti,adc101c', 'ti,adc121c') : 'iio/adc',	
-	('ti,twl6030-gpadc', 'ti,twl6032-gpadc') : 'iio/adc',	
-	('atmel,at91sam9260-adc', 'atmel,at91sam9rl-adc', 'atmel,at91sam9g45-adc', 'atmel,at91sam9x5-adc', 'atmel,sama5d3-adc') : 'iio/adc',	
-	('ti,adc0831', 'ti,adc0832', 'ti,adc0834', 'ti,adc0838') : 'iio/adc',	
-	('adi,ad7291',) : 'iio/adc',	
-	('nuvoton,npcm750-adc',) : 'iio/adc',	
-	('st,stm32f4-adc', 'st,stm32h7-adc', 'st,stm32mp1-adc') : 'iio/adc',	
-	('st,l3g4200d-gyro', 'st,lsm330d-gyro', 'st,lsm330dl-gyro', 'st,lsm330dlc-gyro', 'st,l3gd20-gyro', 'st,l3gd20h-gyro', 'st,l3g4is-gyro', 'st,lsm330-gyro', 'st,lsm9ds0-gyro') : 'iio/gyro',	
-	('adi,adxrs290',) : 'iio/gyro',	
-	('nxp,fxas21002c',) : 'iio/gyro',	
-	('bosch,bmg160', 'bosch,bmi055_gyro') : 'iio/gyro',	
-	('invensense,itg3200',) : 'iio/gyro',	
-	('invensense,mpu3050', 'invn,mpu3050') : 'iio/gyro',	
-	('ti,lmp91000', 'ti,lmp91002') : 'iio/potentiostat',	
-	('capella,cm3218', 'capella,cm32181') : 'iio/light',	
-	('ams,as73211',) : 'iio/light',	
-	('vishay,veml6030',) : 'iio/light',	
-	('sharp,gp2ap002a00f', 'sharp,gp2ap002s00f') : 'iio/light',	
-	('isil,isl29018', 'isil,isl29023', 'isil,isl29035') : 'iio/light',	
-	('adi,adux1020',) : 'iio/light',	
-	('capella,cm3605',) : 'iio/light',	
-	('amstaos,tsl2580', 'amstaos,tsl2581', 'amstaos,tsl2583') : 'iio/light',	
-	('st,vl6180',) : 'iio/light',	
-	('isl,isl29028', 'isil,isl29028', 'isil,isl29030') : 'iio/light',	
-	('rohm,bh1710', 'rohm,bh1715', 'rohm,bh1721', 'rohm,bh1750', 'rohm,bh1751') : 'iio/light',	
-	('dynaimage,al3320a',) : 'iio/light',	
-	('amstaos,tsl2560', 'amstaos,tsl2561', 'amstaos,tsl2562', 'amstaos,tsl2563') : 'iio/light',	
-	('upisemi,usd5182',) : 'iio/light',	
-	('rohm,bh1780gli',) : 'iio/light',	
-	('capella,cm36651',) : 'iio/light',	
-	('sharp,gp2ap020a00f',) : 'iio/light',	
-	('maxim,max44009',) : 'iio/light',	
-	('dynaimage,al3010',) : 'iio/light',	
-	('vishay,vcnl4000', 'vishay,vcnl4010', 'vishay,vcnl4020', 'vishay,vcnl4040', 'vishay,vcnl4200') : 'iio/light',	
-	('st,uvis25',) : 'iio/light',	
-	('ti,opt3001',) : 'iio/light',	
-	('capella,cm3232',) : 'iio/light',	
-	('sensortek,stk3310', 'sensortek,stk3311', 'sensortek,stk3335') : 'iio/light',	
-	('avago,apds9960',) : 'iio/light',	
-	('amstaos,tsl2571', 'amstaos,tsl2671', 'amstaos,tmd2671', 'amstaos,tsl2771', 'amstaos,tmd2771', 'amstaos,tsl2572', 'amstaos,tsl2672', 'amstaos,tmd2672', 'amstaos,tsl2772', 'amstaos,tmd2772', 'avago,apds9930') : 'iio/light',	
-	('vishay,vcnl4035',) : 'iio/light',	
-	('onnn,noa1305',) : 'iio/light',	
-	('io-channel-mux',) : 'iio/multiplexer',	
-	('maxim,max5481', 'maxim,max5482', 'maxim,max5483', 'maxim,max5484') : 'iio/potentiometer',	
-	('maxim,max5432', 'maxim,max5433', 'maxim,max5434', 'maxim,max5435') : 'iio/potentiometer',	
-	('maxim,ds1803-010', 'maxim,ds1803-050', 'maxim,ds1803-100') : 'iio/potentiometer',	
-	('adi,ad5272-020', 'adi,ad5272-050', 'adi,ad5272-100', 'adi,ad5274-020', 'adi,ad5274-100') : 'iio/potentiometer',	
-	('microchip,mcp4131-502', 'microchip,mcp4131-103', 'microchip,mcp4131-503', 'microchip,mcp4131-104', 'microchip,mcp4132-502', 'microchip,mcp4132-103', 'microchip,mcp4132-503', 'microchip,mcp4132-104', 'microchip,mcp4141-502', 'microchip,mcp4141-103', 'microchip,mcp4141-503', 'microchip,mcp4141-104', 'microchip,mcp4142-502', 'microchip,mcp4142-103', 'microchip,mcp4142-503', 'microchip,mcp4142-104', 'microchip,mcp4151-502', 'microchip,mcp4151-103', 'microchip,mcp4151-503', 'microchip,mcp4151-104', 'microchip,mcp4152-502', 'microchip,mcp4152-103', 'microchip,mcp4152-503', 'microchip,mcp4152-104', 'microchip,mcp4161-502', 'microchip,mcp4161-103', 'microchip,mcp4161-503', 'microchip,mcp4161-104', 'microchip,mcp4162-502', 'microchip,mcp4162-103', 'microchip,mcp4162-503', 'microchip,mcp4162-104', 'microchip,mcp4231-502', 'microchip,mcp4231-103', 'microchip,mcp4231-503', 'microchip,mcp4231-104', 'microchip,mcp4232-502', 'microchip,mcp4232-103', 'microchip,mcp4232-503', 'microchip,mcp4232-104', 'microchip,mcp4241-502', 'microchip,mcp4241-103', 'microchip,mcp4241-503', 'microchip,mcp4241-104', 'microchip,mcp4242-502', 'microchip,mcp4242-103', 'microchip,mcp4242-503', 'microchip,mcp4242-104', 'microchip,mcp4251-502', 'microchip,mcp4251-103', 'microchip,mcp4251-503', 'microchip,mcp4251-104', 'microchip,mcp4252-502', 'microchip,mcp4252-103', 'microchip,mcp4252-503', 'microchip,mcp4252-104', 'microchip,mcp4261-502', 'microchip,mcp4261-103', 'microchip,mcp4261-503', 'microchip,mcp4261-104', 'microchip,mcp4262-502', 'microchip,mcp4262-103', 'microchip,mcp4262-503', 'microchip,mcp4262-104') : 'iio/potentiometer',	
-	('microchip,mcp41010', 'microchip,mcp41050', 'microchip,mcp41100', 'microchip,mcp42010', 'microchip,mcp42050', 'microchip,mcp42100') : 'iio/potentiometer',	
-	('memsic,mmc35240',) : 'iio/magnetometer',	
-	('st,lsm303dlh-magn', 'st,lsm303dlhc-magn', 'st,lsm303dlm-magn', 'st,lis3mdl-magn', 'st,lsm303agr-magn', 'st,lis2mdl', 'st,lsm9ds1-magn') : 'iio/magnetometer',	
-	('st,lis3mdl-magn', 'st,lsm303agr-magn', 'st,lis2mdl', 'st,lsm9ds1-magn') : 'iio/magnetometer',	
-	('bosch,bmc150_magn', 'bosch,bmc156_magn', 'bosch,bmm150_magn', 'bosch,bmm150') : 'iio/magnetometer',	
-	('fsl,mag3110',) : 'iio/magnetometer',	
-	('pni,rm3100',) : 'iio/magnetometer',	
-	('asahi-kasei,ak8975', 'ak8975', 'asahi-kasei,ak8963', 'ak8963', 'asahi-kasei,ak09911', 'ak09911', 'asahi-kasei,ak09912', 'ak09912') : 'iio/magnetometer',	
-	('honeywell,hmc5843', 'honeywell,hmc5883', 'honeywell,hmc5883l', 'honeywell,hmc5983') : 'iio/magnetometer',	
-	('asahi-kasei,ak8974', 'alps,hscdtd008a') : 'iio/magnetometer',	
-	('bosch,bmp085', 'bosch,bmp180', 'bosch,bmp181', 'bosch,bmp280', 'bosch,bme280') : 'iio/pressure',	
-	('meas,ms5611', 'meas,ms5607') : 'iio/pressure',	
-	('murata,zpa2326',) : 'iio/pressure',	
-	('asc,dlhl60d', 'asc,dlhl60g') : 'iio/pressure',	
-	('invensense,icp10100',) : 'iio/pressure',	
-	('st,lps001wp-press', 'st,lps25h-press', 'st,lps331ap-press', 'st,lps22hb-press', 'st,lps33hw', 'st,lps35hw', 'st,lps22hh') : 'iio/pressure',	
-	('hoperf,hp03',) : 'iio/pressure',	
-	('fsl,mpl3115',) : 'iio/pressure',	
-	('meas,ms5637', 'meas,ms5805', 'meas,ms5837', 'meas,ms8607-temppressure') : 'iio/pressure',	
-	('bosch,bme280', 'bosch,bmp280', 'bosch,bmp180', 'bosch,bmp085') : 'iio/pressure',	
-	('st,stm32-lptimer-trigger',) : 'iio/trigger',	
-	('st,stm32-timer-trigger', 'st,stm32h7-timer-trigger') : 'iio/trigger',	
-	('adi,adis16470', 'adi,adis16475-1', 'adi,adis16475-2', 'adi,adis16475-3', 'adi,adis16477-1', 'adi,adis16477-2', 'adi,adis16477-3', 'adi,adis16465-1', 'adi,adis16465-2', 'adi,adis16465-3', 'adi,adis16467-1', 'adi,adis16467-2', 'adi,adis16467-3', 'adi,adis16500', 'adi,adis16505-1', 'adi,adis16505-2', 'adi,adis16505-3', 'adi,adis16507-1', 'adi,adis16507-2', 'adi,adis16507-3') : 'iio/imu',	
-	('bosch,bmi160',) : 'iio/imu',	
-	('nxp,fxos8700',) : 'iio/imu',	
-	('invensense,mpu6050', 'invensense,mpu6500', 'invensense,mpu6515', 'invensense,mpu9150', 'invensense,mpu9250', 'invensense,mpu9255', 'invensense,icm20608', 'invensense,icm20609', 'invensense,icm20689', 'invensense,icm20602', 'invensense,icm20690', 'invensense,iam20680') : 'iio/imu',	
-	('invensense,mpu6000', 'invensense,mpu6500', 'invensense,mpu6515', 'invensense,mpu9250', 'invensense,mpu9255', 'invensense,icm20608', 'invensense,icm20609', 'invensense,icm20689', 'invensense,icm20602', 'invensense,icm20690', 'invensense,iam20680') : 'iio/imu',	
-	('adi,adis16460',) : 'iio/imu',	
-	('st,lsm6ds3', 'st,lsm6ds3h', 'st,lsm6dsl', 'st,lsm6dsm', 'st,ism330dlc', 'st,lsm6dso', 'st,asm330lhh', 'st,lsm6dsox', 'st,lsm6dsr', 'st,lsm6ds3tr-c', 'st,ism330dhcx', 'st,lsm9ds1-imu', 'st,lsm6ds0', 'st,lsm6dsrx', 'st,lsm6dst', 'st,lsm6dsop') : 'iio/imu',	
-	('adi,adis16375', 'adi,adis16480', 'adi,adis16485', 'adi,adis16488', 'adi,adis16490', 'adi,adis16495-1', 'adi,adis16495-2', 'adi,adis16495-3', 'adi,adis16497-1', 'adi,adis16497-2', 'adi,adis16497-3') : 'iio/imu',	
-	('invensense,icm42600', 'invensense,icm42602', 'invensense,icm42605', 'invensense,icm42622') : 'iio/imu',	
-	('current-sense-amplifier', 'current-sense-shunt', 'voltage-divider') : 'iio/afe',	
-	('ti,dac5571', 'ti,dac6571', 'ti,dac7571', 'ti,dac5574', 'ti,dac6574', 'ti,dac7574', 'ti,dac5573', 'ti,dac6573', 'ti,dac7573') : 'iio/dac',	
-	('adi,ad5592r',) : 'iio/dac',	
-	('dpot-dac',) : 'iio/dac',	
-	('fsl,vf610-dac',) : 'iio/dac',	
-	('lltc,ltc1660', 'lltc,ltc1665') : 'iio/dac',	
-	('adi,ad5593r',) : 'iio/dac',	
-	('adi,ad5755', 'adi,ad5755-1', 'adi,ad5757', 'adi,ad5735', 'adi,ad5737') : 'iio/dac',	
-	('ti,dac5311', 'ti,dac6311', 'ti,dac7311') : 'iio/dac',	
-	('adi,ad5758',) : 'iio/dac',	
-	('adi,ad7303',) : 'iio/dac',	
-	('maxim,max5821',) : 'iio/dac',	
-	('lltc,ltc2632-l12', 'lltc,ltc2632-l10', 'lltc,ltc2632-l8', 'lltc,ltc2632-h12', 'lltc,ltc2632-h10', 'lltc,ltc2632-h8', 'lltc,ltc2634-l12', 'lltc,ltc2634-l10', 'lltc,ltc2634-l8', 'lltc,ltc2634-h12', 'lltc,ltc2634-h10', 'lltc,ltc2634-h8', 'lltc,ltc2636-l12', 'lltc,ltc2636-l10', 'lltc,ltc2636-l8', 'lltc,ltc2636-h12', 'lltc,ltc2636-h10', 'lltc,ltc2636-h8') : 'iio/dac',	
-	('microchip,mcp4725', 'microchip,mcp4726') : 'iio/dac',	
-	('nxp,lpc1850-dac',) : 'iio/dac',	
-	('ti,dac7512',) : 'iio/dac',	
-	('st,stm32-dac',) : 'iio/dac',	
-	('ti,dac082s085', 'ti,dac102s085', 'ti,dac122s085', 'ti,dac084s085', 'ti,dac104s085', 'ti,dac124s085') : 'iio/dac',	
-	('adi,ad5770r',) : 'iio/dac',	
-	('adi,ad5311r', 'adi,ad5338r', 'adi,ad5671r', 'adi,ad5675r', 'adi,ad5691r', 'adi,ad5692r', 'adi,ad5693', 'adi,ad5693r', 'adi,ad5694', 'adi,ad5694r', 'adi,ad5695r', 'adi,ad5696', 'adi,ad5696r') : 'iio/dac',	
-	('st,stm32f4-dac-core', 'st,stm32h7-dac-core') : 'iio/dac',	
-	('ti,dac7612', 'ti,dac7612u', 'ti,dac7612ub') : 'iio/dac',	
-	('maxim,ds4422', 'maxim,ds4424') : 'iio/dac',	
-	('bosch,bme680',) : 'iio/chemical',	
-	('ams,iaq-core',) : 'iio/chemical',	
-	('sensirion,sps30',) : 'iio/chemical',	
-	('plantower,pms1003', 'plantower,pms3003', 'plantower,pms5003', 'plantower,pms6003', 'plantower,pms7003', 'plantower,pmsa003') : 'iio/chemical',	
-	('sensirion,scd30',) : 'iio/chemical',	
-	('atlas,co2-ezo', 'atlas,o2-ezo', 'atlas,hum-ezo') : 'iio/chemical',	
-	('ams,ccs811',) : 'iio/chemical',	
-	('sgx,vz89x', 'sgx,vz89te') : 'iio/chemical',	
-	('atlas,ph-sm', 'atlas,ec-sm', 'atlas,orp-sm', 'atlas,do-sm', 'atlas,rtd-sm') : 'iio/chemical',	
-	('sensirion,sgp30', 'sensirion,sgpc3') : 'iio/chemical',	
-	('melexis,mlx90632',) : 'iio/temperature',	
-	('ti,tmp007',) : 'iio/temperature',	
-	('maxim,max31856',) : 'iio/temperature',	
-	('meas,tsys01',) : 'iio/temperature',	
-	('maxim,max6675', 'maxim,max31855', 'maxim,max31855k', 'maxim,max31855j', 'maxim,max31855n', 'maxim,max31855s', 'maxim,max31855t', 'maxim,max31855e', 'maxim,max31855r') : 'iio/temperature',	
-	('melexis,mlx90614',) : 'iio/temperature',	
-	('adi,ltc2983',) : 'iio/temperature',	
-	('maxbotix,mb1202', 'maxbotix,mb1212', 'maxbotix,mb1222', 'maxbotix,mb1232', 'maxbotix,mb1242', 'maxbotix,mb7040', 'maxbotix,mb7137') : 'iio/proximity',	
-	('semtech,sx9500',) : 'iio/proximity',	
-	('semtech,sx9310', 'semtech,sx9311') : 'iio/proximity',	
-	('devantech,srf04', 'maxbotix,mb1000', 'maxbotix,mb1010', 'maxbotix,mb1020', 'maxbotix,mb1030', 'maxbotix,mb1040') : 'iio/proximity',	
-	('devantech,srf02', 'devantech,srf08', 'devantech,srf10') : 'iio/proximity',	
-	('st,vl53l0x',) : 'iio/proximity',	
-	('pulsedlight,lidar-lite-v2', 'grmn,lidar-lite-v3') : 'iio/proximity',	
-	('vishay,vcnl3020',) : 'iio/proximity',	
-	('renesas,isl29501',) : 'iio/proximity',	
-	('parallax,ping', 'parallax,laserping') : 'iio/proximity',	
-	('ams,as3935',) : 'iio/proximity',	
-	('adi,adf4371', 'adi,adf4372') : 'iio/frequency',	
-	('adi,adf4350', 'adi,adf4351') : 'iio/frequency',	
-	('st,hts221',) : 'iio/humidity',	
-	('silabs,si7020',) : 'iio/humidity',	
-	('ti,hdc1000', 'ti,hdc1008', 'ti,hdc1010', 'ti,hdc1050', 'ti,hdc1080') : 'iio/humidity',	
-	('ti,hdc2010', 'ti,hdc2080') : 'iio/humidity',	
-	('dht11',) : 'iio/humidity',	
-	('meas,htu21', 'meas,ms8607-humidity') : 'iio/humidity',	
-	('adi,hmc425a',) : 'iio/amplifiers',	
-	('domain-idle-state',) : 'base',	
-	('nokia,n900-modem', 'nokia,n950-modem', 'nokia,n9-modem') : 'hsi/clients',	
-	('ti,omap3-ssi',) : 'hsi/controllers',	
-	('ti,omap3-ssi-port',) : 'hsi/controllers',	
-	('arm,coresight-static-funnel',) : 'hwtracing',	
-	('arm,coresight-replicator', 'arm,coresight-static-replicator') : 'hwtracing',	
-	('ti,bq32000',) : 'rtc',	
-	('nxp,pcf85263', 'nxp,pcf85363') : 'rtc',	
-	('microcrystal,rv8803', 'epson,rx8803', 'epson,rx8900') : 'rtc',	
-	('amlogic,meson6-rtc', 'amlogic,meson8-rtc', 'amlogic,meson8b-rtc', 'amlogic,meson8m2-rtc') : 'rtc',	
-	('microcrystal,rv3032',) : 'rtc',	
-	('emmicro,em3027',) : 'rtc',	
-	('maxim,mcp795',) : 'rtc',	
-	('cnxt,cx92755-rtc',) : 'rtc',	
-	('nxp,pcf2123', 'microcrystal,rv2123', 'nxp,rtc-pcf2123') : 'rtc',	
-	('nxp,pcf8563', 'epson,rtc8564', 'microcrystal,rv8564') : 'rtc',	
-	('mediatek,mt2712-rtc',) : 'rtc',	
-	('nxp,lpc1788-rtc',) : 'rtc',	
-	('nxp,pcf8523', 'microcrystal,rv8523') : 'rtc',	
-	('maxim,ds1302',) : 'rtc',	
-	('sprd,sc2731-rtc',) : 'rtc',	
-	('mrvl,sa1100-rtc', 'mrvl,mmp-rtc') : 'rtc',	
-	('fsl,imx1-rtc', 'fsl,imx21-rtc') : 'rtc',	
-	('apm,xgene-rtc',) : 'rtc',	
-	('fsl,sec-v4.0-mon-rtc-lp',) : 'rtc',	
-	('abracon,abx80x', 'abracon,ab0801', 'abracon,ab0803', 'abracon,ab0804', 'abracon,ab0805', 'abracon,ab1801', 'abracon,ab1803', 'abracon,ab1804', 'abracon,ab1805', 'microcrystal,rv1805') : 'rtc',	
-	('dallas,ds1374',) : 'rtc',	
-	('abracon,abeoz9',) : 'rtc',	
-	('motorola,cpcap-rtc',) : 'rtc',	
-	('cortina,gemini-rtc', 'faraday,ftrtc010') : 'rtc',	
-	('isil,isl1208', 'isil,isl1209', 'isil,isl1218', 'isil,isl1219') : 'rtc',	
-	('dlg,da9063-rtc', 'dlg,da9062-rtc') : 'rtc',	
-	('nvidia,tegra20-rtc',) : 'rtc',	
-	('cdns,rtc-r109v3',) : 'rtc',	
-	('atmel,at91sam9260-rtt',) : 'rtc',	
-	('sirf,prima2-sysrtc',) : 'rtc',	
-	('epson,rtc7301sf', 'epson,rtc7301dg') : 'rtc',	
-	('qcom,pm8921-rtc', 'qcom,pm8018-rtc', 'qcom,pm8058-rtc', 'qcom,pm8941-rtc') : 'rtc',	
-	('isl,isl12022', 'isil,isl12022') : 'rtc',	
-	('epson,rx6110',) : 'rtc',	
-	('amlogic,meson-vrtc',) : 'rtc',	
-	('dallas,ds1307', 'dallas,ds1308', 'dallas,ds1337', 'dallas,ds1338', 'dallas,ds1339', 'dallas,ds1388', 'dallas,ds1340', 'dallas,ds1341', 'maxim,ds3231', 'st,m41t0', 'st,m41t00', 'st,m41t11', 'microchip,mcp7940x', 'microchip,mcp7941x', 'pericom,pt7c4338', 'epson,rx8025', 'isil,isl12057', 'epson,rx8130') : 'rtc',	
-	('google,goldfish-rtc',) : 'rtc',	
-	('marvell,armada-380-rtc', 'marvell,armada-8k-rtc') : 'rtc',	
-	('mediatek,mt7622-rtc', 'mediatek,soc-rtc') : 'rtc',	
-	('haoyu,hym8563',) : 'rtc',	
-	('renesas,sh-rtc',) : 'rtc',	
-	('st,m41t62', 'st,m41t65', 'st,m41t80', 'st,m41t81', 'st,m41t81s', 'st,m41t82', 'st,m41t83', 'st,m41t84', 'st,m41t85', 'st,m41t87', 'microcrystal,rv4162', 'st,rv4162', 'rv4162') : 'rtc',	
-	('maxim,ds1742',) : 'rtc',	
-	('whwave,sd3078',) : 'rtc',	
-	('x-powers,ac100-rtc',) : 'rtc',	
-	('allwinner,sun6i-a31-rtc', 'allwinner,sun8i-a23-rtc', 'allwinner,sun8i-h3-rtc', 'allwinner,sun8i-r40-rtc', 'allwinner,sun8i-v3-rtc', 'allwinner,sun50i-h5-rtc', 'allwinner,sun50i-h6-rtc') : 'rtc',	
-	('moxa,moxart-rtc',) : 'rtc',	
-	('dallas,ds3232',) : 'rtc',	
-	('xlnx,zynqmp-rtc',) : 'rtc',	
-	('nxp,pcf2127', 'nxp,pcf2129', 'nxp,pca2129') : 'rtc',	
-	('atmel,at91rm9200-rtc', 'atmel,at91sam9x5-rtc', 'atmel,sama5d4-rtc', 'atmel,sama5d2-rtc', 'microchip,sam9x60-rtc') : 'rtc',	
-	('fsl,ls1012a-ftm-alarm', 'fsl,ls1021a-ftm-alarm', 'fsl,ls1028a-ftm-alarm', 'fsl,ls1043a-ftm-alarm', 'fsl,ls1046a-ftm-alarm', 'fsl,ls1088a-ftm-alarm', 'fsl,ls208xa-ftm-alarm', 'fsl,lx2160a-ftm-alarm') : 'rtc',	
-	('via,vt8500-rtc',) : 'rtc',	
-	('fsl,imx53-rtc',) : 'rtc',	
-	('epson,rx8010',) : 'rtc',	
-	('brcm,brcmstb-waketimer',) : 'rtc',	
-	('microcrystal,rv3029',) : 'rtc',	
-	('dallas,ds1672',) : 'rtc',	
-	('aspeed,ast2400-rtc', 'aspeed,ast2500-rtc', 'aspeed,ast2600-rtc') : 'rtc',	
-	('samsung,s3c2410-rtc', 'samsung,s3c2416-rtc', 'samsung,s3c2443-rtc', 'samsung,s3c6410-rtc', 'samsung,exynos3250-rtc') : 'rtc',	
-	('ti,palmas-rtc',) : 'rtc',	
-	('abracon,abb5zes3',) : 'rtc',	
-	('st,spear600-rtc',) : 'rtc',	
-	('ricoh,r2025sd', 'ricoh,r2221tl', 'ricoh,rs5c372a', 'ricoh,rs5c372b', 'ricoh,rv5c386', 'ricoh,rv5c387a') : 'rtc',	
-	('allwinner,sun4i-a10-rtc', 'allwinner,sun7i-a20-rtc') : 'rtc',	
-	('ingenic,jz4740-rtc', 'ingenic,jz4760-rtc', 'ingenic,jz4780-rtc') : 'rtc',	
-	('isil,isl12026',) : 'rtc',	
-	('nxp,pcf85063', 'nxp,pcf85063tp', 'nxp,pcf85063a', 'microcrystal,rv8263') : 'rtc',	
-	('fsl,imx25-rtc',) : 'rtc',	
-	('nxp,lpc3220-rtc',) : 'rtc',	
-	('epson,rx8571', 'epson,rx8581') : 'rtc',	
-	('mediatek,mt6323-rtc', 'mediatek,mt6358-rtc', 'mediatek,mt6397-rtc') : 'rtc',	
-	('fsl,imx8qxp-sc-rtc',) : 'rtc',	
-	('alphascale,asm9260-rtc',) : 'rtc',	
-	('marvell,orion-rtc',) : 'rtc',	
-	('microchip,pic32mzda-rtc',) : 'rtc',	
-	('stericsson,coh901331',) : 'rtc',	
-	('fsl,mpc5121-rtc', 'fsl,mpc5200-rtc') : 'rtc',	
-	('xircom,x1205',) : 'rtc',	
-	('microcrystal,rv3028',) : 'rtc',	
-	('st,stm32-rtc', 'st,stm32h7-rtc', 'st,stm32mp1-rtc') : 'rtc',	
-	('marvell,pxa-rtc',) : 'rtc',	
-	('ti,twl4030-rtc',) : 'rtc',	
-	('dallas,ds1390',) : 'rtc',	
-	('fsl,stmp3xxx-rtc',) : 'rtc',	
-	('realtek,rtd1295-rtc',) : 'rtc',	
-	('s35390a', 'sii,s35390a') : 'rtc',	
-	('st,stm32mp1-m4',) : 'remoteproc',	
-	('qcom,ipq8074-wcss-pil',) : 'remoteproc',	
-	('qcom,msm8974-adsp-pil', 'qcom,msm8996-adsp-pil', 'qcom,msm8996-slpi-pil', 'qcom,msm8998-adsp-pas', 'qcom,msm8998-slpi-pas', 'qcom,qcs404-adsp-pas', 'qcom,qcs404-cdsp-pas', 'qcom,qcs404-wcss-pas', 'qcom,sc7180-mpss-pas', 'qcom,sdm845-adsp-pas', 'qcom,sdm845-cdsp-pas', 'qcom,sm8150-adsp-pas', 'qcom,sm8150-cdsp-pas', 'qcom,sm8150-mpss-pas', 'qcom,sm8150-slpi-pas', 'qcom,sm8250-adsp-pas', 'qcom,sm8250-cdsp-pas', 'qcom,sm8250-slpi-pas') : 'remoteproc',	
-	('st,st40-rproc', 'st,st231-rproc') : 'remoteproc',	
-	('ti,da850-dsp',) : 'remoteproc',	
-	('ti,am3356-pru', 'ti,am4376-pru', 'ti,am5728-pru', 'ti,k2g-pru', 'ti,am654-pru', 'ti,am654-rtu', 'ti,am654-tx-pru', 'ti,j721e-pru', 'ti,j721e-rtu', 'ti,j721e-tx-pru') : 'remoteproc',	
-	('qcom,qcs404-cdsp-pil', 'qcom,sdm845-adsp-pil') : 'remoteproc',	
-	('qcom,wcn3620', 'qcom,wcn3660', 'qcom,wcn3680') : 'remoteproc',	
-	('ti,am3352-wkup-m3', 'ti,am4372-wkup-m3') : 'remoteproc',	
-	('qcom,riva-pil', 'qcom,pronto-v1-pil', 'qcom,pronto-v2-pil') : 'remoteproc',	
-	('ti,am654-r5fss', 'ti,j721e-r5fss', 'ti,j7200-r5fss') : 'remoteproc',	
-	('qcom,q6v5-pil', 'qcom,msm8916-mss-pil', 'qcom,msm8974-mss-pil', 'qcom,msm8996-mss-pil', 'qcom,msm8998-mss-pil', 'qcom,sc7180-mss-pil', 'qcom,sdm845-mss-pil') : 'remoteproc',	
-	('fsl,imx7d-cm4', 'fsl,imx6sx-cm4') : 'remoteproc',	
-	('ti,j721e-c66-dsp', 'ti,j721e-c71-dsp') : 'remoteproc',	
-	('ingenic,jz4770-vpu-rproc',) : 'remoteproc',	
-	('mediatek,mt8183-scp', 'mediatek,mt8192-scp') : 'remoteproc',	
-	('ti,k2hk-dsp', 'ti,k2l-dsp', 'ti,k2e-dsp', 'ti,k2g-dsp') : 'remoteproc',	
-	('qcom,smd',) : 'rpmsg',	
-	('qcom,glink-rpm',) : 'rpmsg',	
-	('globaltop,pa6h',) : 'gnss',	
-	('fastrax,uc430', 'linx,r4', 'wi2wi,w2sg0004', 'wi2wi,w2sg0008i', 'wi2wi,w2sg0084i') : 'gnss',	
-	('u-blox,neo-6m', 'u-blox,neo-8', 'u-blox,neo-m8') : 'gnss',	
-	('atmel,at91sam9n12-hlcdc', 'atmel,at91sam9x5-hlcdc', 'atmel,sama5d2-hlcdc', 'atmel,sama5d3-hlcdc', 'atmel,sama5d4-hlcdc', 'microchip,sam9x60-hlcdc', 'atmel,hlcdc-display-controller') : 'gpu',	
-	('brcm,bcm2835-vec',) : 'gpu',	
-	('brcm,bcm2835-hdmi', 'brcm,bcm2711-hdmi0', 'brcm,bcm2711-hdmi1') : 'gpu',	
-	('brcm,bcm2835-txp',) : 'gpu',	
-	('brcm,bcm2835-dpi',) : 'gpu',	
-	('brcm,bcm2835-v3d', 'brcm,cygnus-v3d', 'brcm,vc4-v3d') : 'gpu',	
-	('brcm,bcm2835-dsi1',) : 'gpu',	
-	('brcm,bcm2711-hvs', 'brcm,bcm2835-hvs') : 'gpu',	
-	('brcm,bcm2835-pixelvalve0', 'brcm,bcm2835-pixelvalve1', 'brcm,bcm2835-pixelvalve2', 'brcm,bcm2711-pixelvalve0', 'brcm,bcm2711-pixelvalve1', 'brcm,bcm2711-pixelvalve2', 'brcm,bcm2711-pixelvalve3', 'brcm,bcm2711-pixelvalve4') : 'gpu',	
-	('brcm,bcm2711-vc5', 'brcm,bcm2835-vc4', 'brcm,cygnus-vc4') : 'gpu',	
-	('fsl,imx-display-subsystem',) : 'gpu',	
-	('fsl,imx6q-ldb', 'fsl,imx6q-ldb', 'fsl,imx53-ldb') : 'gpu',	
-	('fsl,imx-parallel-display',) : 'gpu',	
-	('nxp,imx8mq-dcss',) : 'gpu',	
-	('fsl,imx6q-hdmi', 'fsl,imx6dl-hdmi') : 'gpu',	
-	('fsl,imx53-tve',) : 'gpu',	
-	('ingenic,jz4740-lcd', 'ingenic,jz4725b-lcd', 'ingenic,jz4770-lcd') : 'gpu',	
-	('ingenic,jz4725b-ipu', 'ingenic,jz4760-ipu') : 'gpu',	
-	('ste,mcde-dsi',) : 'gpu',	
-	('ste,mcde',) : 'gpu',	
-	('st,stih407-hdmi',) : 'gpu',	
-	('st,stih416-hda', 'st,stih407-hda') : 'gpu',	
-	('st,stih407-hqvdp',) : 'gpu',	
-	('st,stih407-compositor',) : 'gpu',	
-	('st,stih407-tvout',) : 'gpu',	
-	('st,sti-display-subsystem',) : 'gpu',	
-	('st,vtg',) : 'gpu',	
-	('st,stih407-dvo',) : 'gpu',	
-	('arm,mali-400', 'arm,mali-450') : 'gpu',	
-	('zte,zx296718-hdmi',) : 'gpu',	
-	('zte,zx296718-vou',) : 'gpu',	
-	('zte,zx296718-tvenc',) : 'gpu',	
-	('zte,zx296718-dpc',) : 'gpu',	
-	('zte,zx296718-vga',) : 'gpu',	
-	('hisilicon,hi6220-dsi',) : 'gpu',	
-	('hisilicon,hi6220-ade',) : 'gpu',	
-	('intel,keembay-display',) : 'gpu',	
-	('ti,tfp410',) : 'gpu',	
-	('toshiba,tc358767',) : 'gpu',	
-	('thine,thc63lvd1024',) : 'gpu',	
-	('lontium,lt9611',) : 'gpu',	
-	('lontium,lt9611uxc',) : 'gpu',	
-	('parade,ps8640',) : 'gpu',	
-	('toshiba,tc358768', 'toshiba,tc358778') : 'gpu',	
-	('parade,ps8622', 'parade,ps8625') : 'gpu',	
-	('toshiba,tc358764',) : 'gpu',	
-	('composite-video-connector', 'dvi-connector', 'hdmi-connector', 'svideo-connector', 'vga-connector') : 'gpu',	
-	('lvds-decoder', 'lvds-encoder', 'thine,thc63lvdm83d') : 'gpu',	
-	('sil,sii9234',) : 'gpu',	
-	('toshiba,tc358775',) : 'gpu',	
-	('ti,sn65dsi86',) : 'gpu',	
-	('toshiba,tc358762',) : 'gpu',	
-	('fsl,imx8mq-nwl-dsi',) : 'gpu',	
-	('cdns,dsi',) : 'gpu',	
-	('analogix,anx7625',) : 'gpu',	
-	('analogix,anx7808', 'analogix,anx7812', 'analogix,anx7814', 'analogix,anx7818') : 'gpu',	
-	('analogix,anx6345',) : 'gpu',	
-	('adi,adv7511', 'adi,adv7511w', 'adi,adv7513', 'adi,adv7533', 'adi,adv7535') : 'gpu',	
-	('ti,tpd12s015',) : 'gpu',	
-	('nxp,ptn3460',) : 'gpu',	
-	('megachips,stdp4028-ge-b850v3-fw', 'megachips,stdp2690-ge-b850v3-fw') : 'gpu',	
-	('dumb-vga-dac', 'adi,adv7123', 'ti,opa362', 'ti,ths8135', 'ti,ths8134') : 'gpu',	
-	('chrontel,ch7033',) : 'gpu',	
-	('cdns,mhdp8546', 'ti,j721e-mhdp8546') : 'gpu',	
-	('sil,sii9022',) : 'gpu',	
-	('sil,sii8620',) : 'gpu',	
-	('jianda,jd-t18003-t01', 'okaya,rh128128t') : 'gpu',	
-	('multi-inno,mi0283qt',) : 'gpu',	
-	('adafruit,yx240qv29',) : 'gpu',	
-	('lego,ev3-lcd',) : 'gpu',	
-	('adafruit,yx350hv15',) : 'gpu',	
-	('pervasive,e1144cs021', 'pervasive,e1190cs021', 'pervasive,e2200cs021', 'pervasive,e2271cs021') : 'gpu',	
-	('vot,v220hf01a-t',) : 'gpu',	
-	('waveshare,rpi-lcd-35', 'ozzmaker,piscreen') : 'gpu',	
-	('composite-video-connector', 'svideo-connector', 'hdmi-connector', 'dvi-connector', 'amlogic,meson-gxbb-vpu', 'amlogic,meson-gxl-vpu', 'amlogic,meson-gxm-vpu', 'amlogic,meson-g12a-vpu') : 'gpu',	
-	('amlogic,meson-gxbb-dw-hdmi', 'amlogic,meson-gxl-dw-hdmi', 'amlogic,meson-gxm-dw-hdmi', 'amlogic,meson-g12a-dw-hdmi') : 'gpu',	
-	('vivante,gc',) : 'gpu',	
-	('samsung,exynos5433-mic',) : 'gpu',	
-	('samsung,s3c6400-fimd', 'samsung,s5pv210-fimd', 'samsung,exynos3250-fimd', 'samsung,exynos4210-fimd', 'samsung,exynos5250-fimd', 'samsung,exynos5420-fimd') : 'gpu',	
-	('samsung,exynos5250-g2d', 'samsung,exynos4212-g2d') : 'gpu',	
-	('samsung,exynos5433-decon', 'samsung,exynos5433-decon-tv') : 'gpu',	
-	('samsung,exynos5-dp',) : 'gpu',	
-	('samsung,s5pv210-rotator', 'samsung,exynos4210-rotator', 'samsung,exynos4212-rotator', 'samsung,exynos5250-rotator') : 'gpu',	
-	('samsung,exynos3250-mipi-dsi', 'samsung,exynos4210-mipi-dsi', 'samsung,exynos5410-mipi-dsi', 'samsung,exynos5422-mipi-dsi', 'samsung,exynos5433-mipi-dsi') : 'gpu',	
-	('samsung,exynos5420-scaler', 'samsung,exynos5433-scaler') : 'gpu',	
-	('samsung,exynos4210-fimc', 'samsung,exynos4212-fimc') : 'gpu',	
-	('samsung,exynos4210-hdmi', 'samsung,exynos4212-hdmi', 'samsung,exynos5420-hdmi', 'samsung,exynos5433-hdmi') : 'gpu',	
-	('samsung,exynos7-decon',) : 'gpu',	
-	('samsung,exynos5-gsc', 'samsung,exynos5250-gsc', 'samsung,exynos5420-gsc', 'samsung,exynos5433-gsc') : 'gpu',	
-	('samsung,exynos4210-mixer', 'samsung,exynos4212-mixer', 'samsung,exynos5-mixer', 'samsung,exynos5250-mixer', 'samsung,exynos5420-mixer') : 'gpu',	
-	('st,stm32-dsi',) : 'gpu',	
-	('st,stm32-ltdc',) : 'gpu',	
-	('arm,mali-dp500', 'arm,mali-dp550', 'arm,mali-dp650') : 'gpu',	
-	('arm,mali-d71', 'arm,mali-d32') : 'gpu',	
-	('ti,omap2-dss', 'ti,omap3-dss', 'ti,omap4-dss', 'ti,omap5-dss', 'ti,dra7-dss', 'panel-dsi-cm') : 'gpu',	
-	('ti,omap4-dmm', 'ti,omap5-dmm') : 'gpu',	
-	('ti,k2g-dss', 'ti,am65x-dss', 'ti,j721e-dss') : 'gpu',	
-	('arm,core-module-integrator', 'arm,versatile-sysreg', 'arm,realview-eb-syscon', 'arm,realview-pb1176-syscon', 'arm,realview-pb11mp-syscon', 'arm,realview-pba8-syscon', 'arm,realview-pbx-syscon', 'arm,vexpress-muxfpga', 'arm,im-pd1-syscon') : 'gpu',	
-	('nvidia,gk20a', 'nvidia,gm20b', 'nvidia,gp10b') : 'gpu',	
-	('snps,arcpgu',) : 'gpu',	
-	('mantix,mlaf057we51-x',) : 'gpu',	
-	('truly,nt35597-2K-display',) : 'gpu',	
-	('samsung,ld9040',) : 'gpu',	
-	('sii,43wvf1g',) : 'gpu',	
-	('ronbo,rb070d30',) : 'gpu',	
-	('sharp,ls037v7dw01',) : 'gpu',	
-	('rocktech,jh057n00900', 'xingbangda,xbd599') : 'gpu',	
-	('techstar,ts8550b',) : 'gpu',	
-	('lgphilips,lb035q02',) : 'gpu',	
-	('abt,y030xx067a',) : 'gpu',	
-	('tpo,td028ttec1', 'toppoly,td028ttec1') : 'gpu',	
-	('samsung,s6e63m0',) : 'gpu',	
-	('raydium,rm68200',) : 'gpu',	
-	('hydis,hva40wv1',) : 'gpu',	
-	('samsung,s6e8aa0',) : 'gpu',	
-	('kingdisplay,kd035g6-54nt',) : 'gpu',	
-	('dlink,dir-685-panel', 'ilitek,ili9322') : 'gpu',	
-	('leadtek,ltk050h3146w', 'leadtek,ltk050h3146w-a2') : 'gpu',	
-	('samsung,s6e63j0x03',) : 'gpu',	
-	('sony,acx424akp',) : 'gpu',	
-	('raspberrypi,7inch-touchscreen-panel',) : 'gpu',	
-	('leadtek,ltk500hd1829',) : 'gpu',	
-	('arm,versatile-tft-panel',) : 'gpu',	
-	('feixin,k101-im2ba02',) : 'gpu',	
-	('panasonic,vvx10f034n00',) : 'gpu',	
-	('samsung,sofef00', 'samsung,s6e3fc2x01') : 'gpu',	
-	('ampire,am-1280800n3tzqw-t00h', 'ampire,am-480272h3tmqw-t01h', 'ampire,am800480r3tmqwa1h', 'arm,rtsm-display', 'armadeus,st0700-adapt', 'auo,b101aw03', 'auo,b101ean01', 'auo,b101xtn01', 'auo,b116xa01', 'auo,b116xw03', 'auo,b133htn01', 'auo,b133xtn01', 'auo,g070vvn01', 'auo,g101evn010', 'auo,g104sn02', 'auo,g121ean01', 'auo,g133han01', 'auo,g156xtn01', 'auo,g185han01', 'auo,g190ean01', 'auo,p320hvn03', 'auo,t215hvn01', 'avic,tm070ddh03', 'bananapi,s070wv20-ct16', 'boe,hv070wsa-100', 'boe,nv101wxmn51', 'boe,nv133fhm-n61', 'boe,nv133fhm-n62', 'boe,nv140fhmn49', 'cdtech,s043wq26h-ct7', 'cdtech,s070pws19hp-fc21', 'cdtech,s070swv29hg-dc44', 'cdtech,s070wv95-ct16', 'chefree,ch101olhlwh-002', 'chunghwa,claa070wp03xg', 'chunghwa,claa101wa01a', 'chunghwa,claa101wb01', 'dataimage,scf0700c48ggu18', 'dlc,dlc0700yzg-1', 'dlc,dlc1010gig', 'edt,et035012dm6', 'edt,etm043080dh6gp', 'edt,etm0430g0dh6', 'edt,et057090dhu', 'edt,et070080dh6', 'edt,etm0700g0dh6', 'edt,etm0700g0bdh6', 'edt,etm0700g0edh6', 'evervision,vgg804821', 'foxlink,fl500wvr00-a0t', 'frida,frd350h54004', 'friendlyarm,hd702e', 'giantplus,gpg482739qs5', 'giantplus,gpm940b0', 'hannstar,hsd070pww1', 'hannstar,hsd100pxn1', 'hit,tx23d38vm0caa', 'innolux,at043tn24', 'innolux,at070tn92', 'innolux,g070y2-l01', 'innolux,g101ice-l01', 'innolux,g121i1-l01', 'innolux,g121x1-l03', 'innolux,n116bge', 'innolux,n125hce-gn1', 'innolux,n156bge-l21', 'innolux,p120zdg-bf1', 'innolux,zj070na-01p', 'ivo,m133nwf4-r0', 'kingdisplay,kd116n21-30nv-a010', 'koe,tx14d24vm1bpa', 'koe,tx26d202vm0bwa', 'koe,tx31d200vm0baa', 'kyo,tcg121xglp', 'lemaker,bl035-rgb-002', 'lg,lb070wv8', 'lg,lp079qx1-sp0v', 'lg,lp097qx1-spa1', 'lg,lp120up1', 'lg,lp129qe', 'logicpd,type28', 'logictechno,lt161010-2nhc', 'logictechno,lt161010-2nhr', 'logictechno,lt170410-2whc', 'mitsubishi,aa070mc01-ca1', 'nec,nl12880bc20-05', 'nec,nl4827hc19-05b', 'netron-dy,e231732', 'neweast,wjfh116008a', 'newhaven,nhd-4.3-480272ef-atxl', 'nlt,nl192108ac18-02d', 'nvd,9128', 'okaya,rs800480t-7x0gp', 'olimex,lcd-olinuxino-43-ts', 'ontat,yx700wv03', 'ortustech,com37h3m05dtc', 'ortustech,com37h3m99dtc', 'ortustech,com43h4m85ulc', 'osddisplays,osd070t1718-19ts', 'pda,91-00156-a0', 'powertip,ph800480t013-idf02', 'qiaodian,qd43003c0-40', 'rocktech,rk070er9427', 'rocktech,rk101ii01d-ct', 'samsung,lsn122dl01-c01', 'samsung,ltn101nt05', 'samsung,ltn140at29-301', 'satoz,sat050at40h12r2', 'sharp,ld-d5116z01b', 'sharp,lq035q7db03', 'sharp,lq070y3dg3b', 'sharp,lq101k1ly04', 'sharp,lq123p1jx31', 'sharp,ls020b1dd01d', 'shelly,sca07010-bfn-lnn', 'starry,kr070pe2t', 'starry,kr122ea0sra', 'tfc,s9700rtwv43tr-01b', 'tianma,tm070jdhg30', 'tianma,tm070jvhg33', 'tianma,tm070rvhg71', 'ti,nspire-cx-lcd-panel', 'ti,nspire-classic-lcd-panel', 'toshiba,lt089ac29000', 'tpk,f07a-0102', 'tpk,f10a-0102', 'urt,umsh-8596md-t', 'urt,umsh-8596md-1t', 'urt,umsh-8596md-7t', 'urt,umsh-8596md-11t', 'urt,umsh-8596md-19t', 'urt,umsh-8596md-20t', 'vxt,vl050-8048nt-c01', 'winstar,wf35ltiacd', 'yes-optoelectronics,ytc700tlag-05-201c', 'panel-dpi', 'auo,b080uan01', 'boe,tv080wum-nl0', 'lg,ld070wx3-sl01', 'lg,lh500wx1-sd03', 'panasonic,vvx10f004b00', 'lg,acx467akm-7', 'osddisplays,osd101t2045-53ts') : 'gpu',	
-	('innolux,p079zca', 'innolux,p097pfg') : 'gpu',	
-	('sony,acx565akm',) : 'gpu',	
-	('sharp,lq101r1sx01',) : 'gpu',	
-	('samsung,s6e3ha2', 'samsung,s6e3hf2') : 'gpu',	
-	('raydium,rm67191',) : 'gpu',	
-	('orisetech,otm8009a',) : 'gpu',	
-	('boe,himax8279d8p', 'boe,himax8279d10p') : 'gpu',	
-	('kingdisplay,kd097d04',) : 'gpu',	
-	('osddisplays,osd101t2587-53ts',) : 'gpu',	
-	('jdi,lt070me05000',) : 'gpu',	
-	('xinpeng,xpp055c272',) : 'gpu',	
-	('tianma,fhd-video',) : 'gpu',	
-	('elida,kd35t133',) : 'gpu',	
-	('sharp,ls043t1le01-qhd',) : 'gpu',	
-	('tdo,tl070wsh30',) : 'gpu',	
-	('samsung,s6d16d0',) : 'gpu',	
-	('tpo,td043mtea1',) : 'gpu',	
-	('lg,lg4573',) : 'gpu',	
-	('asus,z00t-tm5p5-n35596',) : 'gpu',	
-	('samsung,s6e88a0-ams452ef01',) : 'gpu',	
-	('nec,nl8048hl11',) : 'gpu',	
-	('sitronix,st7789v',) : 'gpu',	
-	('tpo,tpg110',) : 'gpu',	
-	('visionox,rm69299-1080p-display',) : 'gpu',	
-	('boe,tv101wum-nl6', 'auo,kd101n80-45na', 'boe,tv101wum-n53', 'auo,b101uan08.3', 'boe,tv105wum-nw0') : 'gpu',	
-	('olimex,lcd-olinuxino',) : 'gpu',	
-	('panel-lvds',) : 'gpu',	
-	('feiyang,fy07024di26a30d',) : 'gpu',	
-	('bananapi,lhr050h41', 'feixin,k101-im2byl02') : 'gpu',	
-	('nvidia,tegra124-vic', 'nvidia,tegra210-vic', 'nvidia,tegra186-vic', 'nvidia,tegra194-vic') : 'gpu',	
-	('nvidia,tegra194-sor', 'nvidia,tegra186-sor', 'nvidia,tegra210-sor1', 'nvidia,tegra210-sor', 'nvidia,tegra132-sor', 'nvidia,tegra124-sor') : 'gpu',	
-	('nvidia,tegra194-dc', 'nvidia,tegra186-dc', 'nvidia,tegra210-dc', 'nvidia,tegra124-dc', 'nvidia,tegra114-dc', 'nvidia,tegra30-dc', 'nvidia,tegra20-dc') : 'gpu',	
-	('nvidia,tegra210-dsi', 'nvidia,tegra132-dsi', 'nvidia,tegra124-dsi', 'nvidia,tegra114-dsi') : 'gpu',	
-	('nvidia,tegra30-gr2d', 'nvidia,tegra20-gr2d') : 'gpu',	
-	('nvidia,tegra124-hdmi', 'nvidia,tegra114-hdmi', 'nvidia,tegra30-hdmi', 'nvidia,tegra20-hdmi') : 'gpu',	
-	('nvidia,tegra20-dc', 'nvidia,tegra20-hdmi', 'nvidia,tegra20-gr2d', 'nvidia,tegra20-gr3d', 'nvidia,tegra30-dc', 'nvidia,tegra30-hdmi', 'nvidia,tegra30-gr2d', 'nvidia,tegra30-gr3d', 'nvidia,tegra114-dsi', 'nvidia,tegra114-hdmi', 'nvidia,tegra114-gr3d', 'nvidia,tegra124-dc', 'nvidia,tegra124-sor', 'nvidia,tegra124-hdmi', 'nvidia,tegra124-dsi', 'nvidia,tegra124-vic', 'nvidia,tegra132-dsi', 'nvidia,tegra210-dc', 'nvidia,tegra210-dsi', 'nvidia,tegra210-sor', 'nvidia,tegra210-sor1', 'nvidia,tegra210-vic', 'nvidia,tegra186-display', 'nvidia,tegra186-dc', 'nvidia,tegra186-sor', 'nvidia,tegra186-sor1', 'nvidia,tegra186-vic', 'nvidia,tegra194-display', 'nvidia,tegra194-dc', 'nvidia,tegra194-sor', 'nvidia,tegra194-vic') : 'gpu',	
-	('nvidia,tegra114-gr3d', 'nvidia,tegra30-gr3d', 'nvidia,tegra20-gr3d') : 'gpu',	
-	('nvidia,tegra194-dpaux', 'nvidia,tegra186-dpaux', 'nvidia,tegra210-dpaux', 'nvidia,tegra124-dpaux') : 'gpu',	
-	('nvidia,tegra194-display', 'nvidia,tegra186-display') : 'gpu',	
-	('qcom,mdp5', 'qcom,mdss_mdp') : 'gpu',	
-	('qcom,sdm845-dpu', 'qcom,sc7180-dpu') : 'gpu',	
-	('qcom,hdmi-tx-8996', 'qcom,hdmi-tx-8994', 'qcom,hdmi-tx-8084', 'qcom,hdmi-tx-8974', 'qcom,hdmi-tx-8960', 'qcom,hdmi-tx-8660') : 'gpu',	
-	('qcom,hdmi-phy-8660', 'qcom,hdmi-phy-8960', 'qcom,hdmi-phy-8974', 'qcom,hdmi-phy-8084', 'qcom,hdmi-phy-8996') : 'gpu',	
-	('qcom,sc7180-dp',) : 'gpu',	
-	('qcom,dsi-phy-28nm-hpm', 'qcom,dsi-phy-28nm-hpm-fam-b', 'qcom,dsi-phy-28nm-lp', 'qcom,dsi-phy-20nm', 'qcom,dsi-phy-28nm-8960', 'qcom,dsi-phy-14nm', 'qcom,dsi-phy-14nm-660', 'qcom,dsi-phy-10nm', 'qcom,dsi-phy-10nm-8998', 'qcom,dsi-phy-7nm', 'qcom,dsi-phy-7nm-8150') : 'gpu',	
-	('qcom,mdss-dsi-ctrl',) : 'gpu',	
-	('qcom,mdss-edp',) : 'gpu',	
-	('qcom,adreno', 'qcom,adreno-3xx', 'amd,imageon', 'qcom,kgsl-3d0', 'qcom,mdp4', 'qcom,mdss', 'qcom,sdm845-mdss', 'qcom,sc7180-mdss') : 'gpu',	
-	('qcom,adreno', 'qcom,adreno-3xx', 'amd,imageon', 'qcom,kgsl-3d0') : 'gpu',	
-	('aspeed,ast2500-gfx',) : 'gpu',	
-	('mediatek,mt2701-dsi', 'mediatek,mt8173-dsi', 'mediatek,mt8183-dsi') : 'gpu',	
-	('mediatek,mt2701-disp-ovl', 'mediatek,mt8173-disp-ovl') : 'gpu',	
-	('mediatek,mt2701-dpi', 'mediatek,mt8173-dpi', 'mediatek,mt8183-dpi') : 'gpu',	
-	('mediatek,mt2701-disp-ovl', 'mediatek,mt8173-disp-ovl', 'mediatek,mt2701-disp-rdma', 'mediatek,mt8173-disp-rdma', 'mediatek,mt8173-disp-wdma', 'mediatek,mt2701-disp-color', 'mediatek,mt8173-disp-color', 'mediatek,mt8173-disp-aal', 'mediatek,mt8173-disp-gamma', 'mediatek,mt8173-disp-ufoe', 'mediatek,mt2701-dsi', 'mediatek,mt8173-dsi', 'mediatek,mt2701-dpi', 'mediatek,mt8173-dpi', 'mediatek,mt2701-disp-mutex', 'mediatek,mt2712-disp-mutex', 'mediatek,mt8173-disp-mutex', 'mediatek,mt2701-disp-pwm', 'mediatek,mt8173-disp-pwm', 'mediatek,mt8173-disp-od', 'mediatek,mt2701-mmsys', 'mediatek,mt7623-mmsys', 'mediatek,mt2712-mmsys', 'mediatek,mt8173-mmsys') : 'gpu',	
-	('mediatek,mt2701-disp-color', 'mediatek,mt8167-disp-color', 'mediatek,mt8173-disp-color') : 'gpu',	
-	('mediatek,mt2701-disp-mutex', 'mediatek,mt2712-disp-mutex', 'mediatek,mt8167-disp-mutex', 'mediatek,mt8173-disp-mutex') : 'gpu',	
-	('mediatek,mt2701-hdmi', 'mediatek,mt8173-hdmi') : 'gpu',	
-	('mediatek,mt2701-disp-rdma', 'mediatek,mt8173-disp-rdma') : 'gpu',	
-	('mediatek,mt8173-hdmi-ddc',) : 'gpu',	
-	('mediatek,mt8173-cec',) : 'gpu',	
-	('amlogic,meson-gxm-mali', 'amlogic,meson-g12a-mali', 'arm,mali-t604', 'arm,mali-t624', 'arm,mali-t628', 'arm,mali-t720', 'arm,mali-t760', 'arm,mali-t820', 'arm,mali-t830', 'arm,mali-t860', 'arm,mali-t880', 'arm,mali-bifrost') : 'gpu',	
-	('fsl,imx23-lcdif', 'fsl,imx28-lcdif', 'fsl,imx6sx-lcdif') : 'gpu',	
-	('rockchip,rk3288-dp', 'rockchip,rk3399-edp') : 'gpu',	
-	('rockchip,rk3036-vop', 'rockchip,rk3126-vop', 'rockchip,px30-vop-big', 'rockchip,px30-vop-lit', 'rockchip,rk3066-vop', 'rockchip,rk3188-vop', 'rockchip,rk3288-vop', 'rockchip,rk3368-vop', 'rockchip,rk3366-vop', 'rockchip,rk3399-vop-big', 'rockchip,rk3399-vop-lit', 'rockchip,rk3228-vop', 'rockchip,rk3328-vop') : 'gpu',	
-	('rockchip,px30-mipi-dsi', 'rockchip,rk3288-mipi-dsi', 'rockchip,rk3399-mipi-dsi') : 'gpu',	
-	('rockchip,rk3066-hdmi',) : 'gpu',	
-	('rockchip,rk3399-cdn-dp',) : 'gpu',	
-	('rockchip,rk3228-dw-hdmi', 'rockchip,rk3288-dw-hdmi', 'rockchip,rk3328-dw-hdmi', 'rockchip,rk3399-dw-hdmi') : 'gpu',	
-	('rockchip,rk3288-lvds', 'rockchip,px30-lvds') : 'gpu',	
-	('rockchip,rk3036-inno-hdmi',) : 'gpu',	
-	('rockchip,display-subsystem',) : 'gpu',	
-	('ti,am33xx-tilcdc', 'ti,da850-tilcdc') : 'gpu',	
-	('ti,tilcdc,panel',) : 'gpu',	
-	('brcm,7268-v3d', 'brcm,7278-v3d') : 'gpu',	
-	('allwinner,sun4i-a10-display-engine', 'allwinner,sun5i-a10s-display-engine', 'allwinner,sun5i-a13-display-engine', 'allwinner,sun6i-a31-display-engine', 'allwinner,sun6i-a31s-display-engine', 'allwinner,sun7i-a20-display-engine', 'allwinner,sun8i-a23-display-engine', 'allwinner,sun8i-a33-display-engine', 'allwinner,sun8i-a83t-display-engine', 'allwinner,sun8i-h3-display-engine', 'allwinner,sun8i-r40-display-engine', 'allwinner,sun8i-v3s-display-engine', 'allwinner,sun9i-a80-display-engine', 'allwinner,sun50i-a64-display-engine', 'allwinner,sun50i-h6-display-engine') : 'gpu',	
-	('allwinner,sun6i-a31-drc', 'allwinner,sun6i-a31s-drc', 'allwinner,sun8i-a23-drc', 'allwinner,sun8i-a33-drc', 'allwinner,sun9i-a80-drc') : 'gpu',	
-	('allwinner,sun8i-r40-tcon-top', 'allwinner,sun50i-h6-tcon-top') : 'gpu',	
-	('allwinner,sun8i-a83t-hdmi-phy', 'allwinner,sun8i-h3-hdmi-phy', 'allwinner,sun8i-r40-hdmi-phy', 'allwinner,sun50i-a64-hdmi-phy', 'allwinner,sun50i-h6-hdmi-phy') : 'gpu',	
-	('allwinner,sun4i-a10-hdmi', 'allwinner,sun5i-a10s-hdmi', 'allwinner,sun6i-a31-hdmi') : 'gpu',	
-	('allwinner,sun6i-a31-mipi-dsi', 'allwinner,sun50i-a64-mipi-dsi') : 'gpu',	
-	('allwinner,sun8i-a83t-de2-mixer-0', 'allwinner,sun8i-a83t-de2-mixer-1', 'allwinner,sun8i-h3-de2-mixer-0', 'allwinner,sun8i-r40-de2-mixer-0', 'allwinner,sun8i-r40-de2-mixer-1', 'allwinner,sun8i-v3s-de2-mixer', 'allwinner,sun50i-a64-de2-mixer-0', 'allwinner,sun50i-a64-de2-mixer-1', 'allwinner,sun50i-h6-de3-mixer-0') : 'gpu',	
-	('allwinner,sun4i-a10-display-frontend', 'allwinner,sun7i-a20-display-frontend', 'allwinner,sun8i-a23-display-frontend', 'allwinner,sun8i-a33-display-frontend') : 'gpu',	
-	('allwinner,sun4i-a10-tcon', 'allwinner,sun5i-a13-tcon', 'allwinner,sun6i-a31-tcon', 'allwinner,sun6i-a31s-tcon', 'allwinner,sun7i-a20-tcon', 'allwinner,sun7i-a20-tcon0', 'allwinner,sun7i-a20-tcon1', 'allwinner,sun8i-a23-tcon', 'allwinner,sun8i-a33-tcon', 'allwinner,sun8i-a83t-tcon-lcd', 'allwinner,sun8i-a83t-tcon-tv', 'allwinner,sun8i-r40-tcon-tv', 'allwinner,sun8i-v3s-tcon', 'allwinner,sun9i-a80-tcon-lcd', 'allwinner,sun9i-a80-tcon-tv') : 'gpu',	
-	('allwinner,sun4i-a10-display-backend', 'allwinner,sun5i-a13-display-backend', 'allwinner,sun6i-a31-display-backend', 'allwinner,sun7i-a20-display-backend', 'allwinner,sun8i-a23-display-backend', 'allwinner,sun8i-a33-display-backend', 'allwinner,sun9i-a80-display-backend') : 'gpu',	
-	('allwinner,sun4i-a10-tv-encoder',) : 'gpu',	
-	('allwinner,sun8i-a83t-dw-hdmi', 'allwinner,sun50i-h6-dw-hdmi') : 'gpu',	
-	('fsl,ls1021a-dcu', 'fsl,vf610-dcu') : 'gpu',	
-	('xlnx,zynqmp-dpsub-1.7',) : 'gpu',	
-	('renesas,r8a7742-lvds', 'renesas,r8a7743-lvds', 'renesas,r8a7744-lvds', 'renesas,r8a774a1-lvds', 'renesas,r8a774b1-lvds', 'renesas,r8a774c0-lvds', 'renesas,r8a774e1-lvds', 'renesas,r8a7790-lvds', 'renesas,r8a7791-lvds', 'renesas,r8a7793-lvds', 'renesas,r8a7795-lvds', 'renesas,r8a7796-lvds', 'renesas,r8a77965-lvds', 'renesas,r8a77970-lvds', 'renesas,r8a77980-lvds', 'renesas,r8a77990-lvds', 'renesas,r8a77995-lvds') : 'gpu',	
-	('renesas,du-r8a7742', 'renesas,du-r8a7743', 'renesas,du-r8a7744', 'renesas,du-r8a7745', 'renesas,du-r8a77470', 'renesas,du-r8a774a1', 'renesas,du-r8a774b1', 'renesas,du-r8a774c0', 'renesas,du-r8a774e1', 'renesas,du-r8a7779', 'renesas,du-r8a7790', 'renesas,du-r8a7791', 'renesas,du-r8a7792', 'renesas,du-r8a7793', 'renesas,du-r8a7794', 'renesas,du-r8a7795', 'renesas,du-r8a7796', 'renesas,du-r8a77961', 'renesas,du-r8a77965', 'renesas,du-r8a77970', 'renesas,du-r8a77980', 'renesas,du-r8a77990', 'renesas,du-r8a77995') : 'gpu',	
-	('renesas,du-',) : 'gpu',	
-	('renesas,rcar-gen3-hdmi',) : 'gpu',	
-	('renesas,rcar-gen3-cmm', 'renesas,rcar-gen2-cmm') : 'gpu',	
-	('nxp,tda998x',) : 'gpu',	
-	('faraday,tve200',) : 'gpu',	
-	('fsl,imx51-ipu', 'fsl,imx53-ipu', 'fsl,imx6q-ipu', 'fsl,imx6qp-ipu') : 'gpu',	
-	('fsl,imx6qp-pre',) : 'gpu',	
-	('fsl,imx6qp-prg',) : 'gpu',	
-	('nvidia,tegra194-host1x', 'nvidia,tegra186-host1x', 'nvidia,tegra210-host1x', 'nvidia,tegra124-host1x', 'nvidia,tegra114-host1x', 'nvidia,tegra30-host1x', 'nvidia,tegra20-host1x') : 'gpu',	
-	('nvidia,tegra114-mipi', 'nvidia,tegra124-mipi', 'nvidia,tegra132-mipi', 'nvidia,tegra210-mipi') : 'gpu',	
-	('lm75', 'ds1775') : 'macintosh',	
-	('ad7417',) : 'macintosh',	
-	('fcu',) : 'macintosh',	
-	('lm87cimt',) : 'macintosh',	
-	('max6690',) : 'macintosh',	
-	('smu-sat',) : 'macintosh',	
-	('amlogic,meson8b-pwm', 'amlogic,meson-gxbb-pwm', 'amlogic,meson-gxbb-ao-pwm', 'amlogic,meson-axg-ee-pwm', 'amlogic,meson-axg-ao-pwm', 'amlogic,meson-g12a-ee-pwm', 'amlogic,meson-g12a-ao-pwm-ab', 'amlogic,meson-g12a-ao-pwm-cd') : 'pwm',	
-	('ingenic,jz4740-pwm', 'ingenic,jz4725b-pwm') : 'pwm',	
-	('sprd,ums512-pwm',) : 'pwm',	
-	('intel,lgm-pwm',) : 'pwm',	
-	('st,sti-pwm',) : 'pwm',	
-	('st,spear320-pwm', 'st,spear1340-pwm') : 'pwm',	
-	('samsung,s3c2410-pwm', 'samsung,s3c6400-pwm', 'samsung,s5p6440-pwm', 'samsung,s5pc100-pwm', 'samsung,exynos4210-pwm') : 'pwm',	
-	('rockchip,rk2928-pwm', 'rockchip,rk3288-pwm', 'rockchip,vop-pwm', 'rockchip,rk3328-pwm') : 'pwm',	
-	('brcm,iproc-pwm',) : 'pwm',	
-	('atmel,at91rm9200-tcb', 'atmel,at91sam9x5-tcb', 'atmel,sama5d2-tcb', 'atmel,tcb-pwm') : 'pwm',	
-	('nxp,pca9685-pwm',) : 'pwm',	
-	('ti,am3352-ehrpwm', 'ti,am33xx-ehrpwm') : 'pwm',	
-	('kontron,sl28cpld-pwm',) : 'pwm',	
-	('nxp,lpc3220-pwm',) : 'pwm',	
-	('mediatek,mt2712-pwm', 'mediatek,mt7622-pwm', 'mediatek,mt7623-pwm', 'mediatek,mt7628-pwm', 'mediatek,mt7629-pwm', 'mediatek,mt8183-pwm', 'mediatek,mt8516-pwm') : 'pwm',	
-	('fsl,imx23-pwm',) : 'pwm',	
-	('zte,zx296718-pwm',) : 'pwm',	
-	('fsl,imx7ulp-pwm',) : 'pwm',	
-	('st,stm32-pwm-lp',) : 'pwm',	
-	('ti,omap-dmtimer-pwm',) : 'pwm',	
-	('allwinner,sun4i-a10-pwm', 'allwinner,sun5i-a10s-pwm', 'allwinner,sun5i-a13-pwm', 'allwinner,sun7i-a20-pwm', 'allwinner,sun8i-h3-pwm', 'allwinner,sun50i-a64-pwm', 'allwinner,sun50i-h6-pwm') : 'pwm',	
-	('img,pistachio-pwm',) : 'pwm',	
-	('nxp,lpc1850-sct-pwm',) : 'pwm',	
-	('atmel,at91sam9rl-pwm', 'atmel,sama5d3-pwm', 'atmel,sama5d2-pwm', 'microchip,sam9x60-pwm') : 'pwm',	
-	('mediatek,mt2701-disp-pwm', 'mediatek,mt6595-disp-pwm', 'mediatek,mt8173-disp-pwm', 'mediatek,mt8183-disp-pwm') : 'pwm',	
-	('hisilicon,hi3516cv300-pwm', 'hisilicon,hi3519v100-pwm', 'hisilicon,hi3559v100-shub-pwm', 'hisilicon,hi3559v100-pwm') : 'pwm',	
-	('marvell,berlin-pwm',) : 'pwm',	
-	('sifive,pwm0',) : 'pwm',	
-	('renesas,pwm-rcar',) : 'pwm',	
-	('ti,lp3943-pwm',) : 'pwm',	
-	('st,stm32-pwm',) : 'pwm',	
-	('brcm,bcm2835-pwm',) : 'pwm',	
-	('nvidia,tegra20-pwm', 'nvidia,tegra186-pwm', 'nvidia,tegra194-pwm') : 'pwm',	
-	('renesas,tpu-r8a73a4', 'renesas,tpu-r8a7740', 'renesas,tpu-r8a7790', 'renesas,tpu') : 'pwm',	
-	('fsl,vf610-ftm-pwm', 'fsl,imx8qm-ftm-pwm') : 'pwm',	
-	('fsl,imx1-pwm',) : 'pwm',	
-	('fsl,imx27-pwm',) : 'pwm',	
-	('ti,twl4030-pwmled', 'ti,twl6030-pwmled') : 'pwm',	
-	('atmel,at91sam9n12-hlcdc', 'atmel,at91sam9x5-hlcdc', 'atmel,sama5d2-hlcdc', 'atmel,sama5d3-hlcdc', 'atmel,sama5d4-hlcdc', 'microchip,sam9x60-hlcdc', 'atmel,hlcdc-pwm') : 'pwm',	
-	('intel,keembay-pwm',) : 'pwm',	
-	('cirrus,ep7209-pwm',) : 'pwm',	
-	('ti,twl4030-pwm', 'ti,twl6030-pwm') : 'pwm',	
-	('via,vt8500-pwm',) : 'pwm',	
-	('brcm,kona-pwm',) : 'pwm',	
-	('brcm,bcm7038-pwm',) : 'pwm',	
-	('marvell,pxa250-pwm', 'marvell,pxa270-pwm', 'marvell,pxa168-pwm', 'marvell,pxa910-pwm') : 'pwm',	
-	('google,cros-ec-pwm',) : 'pwm',	
-	('fsl,imx8qxp-scu-ocotp', 'fsl,imx8qm-scu-ocotp') : 'nvmem',	
-	('fsl,imx6q-snvs-lpgpr', 'fsl,imx6ul-snvs-lpgpr', 'fsl,imx7d-snvs-lpgpr') : 'nvmem',	
-	('brcm,ocotp', 'brcm,ocotp-v2') : 'nvmem',	
-	('qcom,spmi-sdam',) : 'nvmem',	
-	('nxp,lpc1850-otp',) : 'nvmem',	
-	('fsl,imx23-ocotp', 'fsl,imx28-ocotp') : 'nvmem',	
-	('fsl,imx6q-ocotp', 'fsl,imx6sl-ocotp', 'fsl,imx6sx-ocotp', 'fsl,imx6ul-ocotp', 'fsl,imx6ull-ocotp', 'fsl,imx7d-ocotp', 'fsl,imx6sll-ocotp', 'fsl,imx7ulp-ocotp', 'fsl,imx8mq-ocotp', 'fsl,imx8mm-ocotp', 'fsl,imx8mn-ocotp', 'fsl,imx8mp-ocotp') : 'nvmem',	
-	('rockchip,rockchip-efuse', 'rockchip,rk3066a-efuse', 'rockchip,rk3188-efuse', 'rockchip,rk3228-efuse', 'rockchip,rk3288-efuse', 'rockchip,rk3368-efuse', 'rockchip,rk3328-efuse', 'rockchip,rk3399-efuse') : 'nvmem',	
-	('socionext,uniphier-efuse',) : 'nvmem',	
-	('sprd,ums312-efuse',) : 'nvmem',	
-	('zii,rave-sp-eeprom',) : 'nvmem',	
-	('mediatek,mt8173-efuse', 'mediatek,efuse') : 'nvmem',	
-	('nxp,lpc1857-eeprom',) : 'nvmem',	
-	('st,stm32f4-otp', 'st,stm32mp15-bsec') : 'nvmem',	
-	('fsl,vf610-ocotp',) : 'nvmem',	
-	('qcom,qfprom', 'qcom,sc7180-qfprom') : 'nvmem',	
-	('fsl,imx25-iim', 'fsl,imx27-iim', 'fsl,imx31-iim', 'fsl,imx35-iim', 'fsl,imx51-iim', 'fsl,imx53-iim') : 'nvmem',	
-	('ingenic,jz4780-efuse',) : 'nvmem',	
-	('amlogic,meson-gxbb-efuse',) : 'nvmem',	
-	('sprd,sc2731-efuse', 'sprd,sc2730-efuse') : 'nvmem',	
-	('allwinner,sun4i-a10-sid', 'allwinner,sun7i-a20-sid', 'allwinner,sun8i-a83t-sid', 'allwinner,sun8i-h3-sid', 'allwinner,sun50i-a64-sid', 'allwinner,sun50i-h5-sid', 'allwinner,sun50i-h6-sid') : 'nvmem',	
-	('xlnx,zynqmp-nvmem-fw',) : 'nvmem',	
-	('rockchip,px30-otp', 'rockchip,rk3308-otp') : 'nvmem',	
-	('amlogic,meson6-efuse', 'amlogic,meson8-efuse', 'amlogic,meson8b-efuse') : 'nvmem',	
-	('cavium,octeon-6130-mmc', 'cavium,octeon-7890-mmc') : 'mmc',	
-	('microchip,pic32mzda-sdhci',) : 'mmc',	
-	('amlogic,meson-gx-mmc', 'amlogic,meson-gxbb-mmc', 'amlogic,meson-gxl-mmc', 'amlogic,meson-gxm-mmc', 'amlogic,meson-axg-mmc') : 'mmc',	
-	('fsl,imx23-mmc', 'fsl,imx28-mmc') : 'mmc',	
-	('brcm,bcm2835-sdhci', 'brcm,bcm2711-emmc2', 'brcm,sdhci-iproc-cygnus', 'brcm,sdhci-iproc') : 'mmc',	
-	('amlogic,meson8-sdhc', 'amlogic,meson8b-sdhc', 'amlogic,meson8m2-sdhc') : 'mmc',	
-	('renesas,usdhi6rol0',) : 'mmc',	
-	('mmc-spi-slot',) : 'mmc',	
-	('st,spear300-sdhci',) : 'mmc',	
-	('atmel,hsmci',) : 'mmc',	
-	('atmel,sama5d2-sdhci', 'microchip,sam9x60-sdhci') : 'mmc',	
-	('marvell,pxa-mmc',) : 'mmc',	
-	('fujitsu,mb86s70-sdhci-3.0',) : 'mmc',	
-	('st,sdhci',) : 'mmc',	
-	('qcom,sdhci-msm-v4', 'qcom,sdhci-msm-v5', 'qcom,sdm845-sdhci', 'qcom,sc7180-sdhci') : 'mmc',	
-	('samsung,s3c6410-sdhci', 'samsung,exynos4210-sdhci') : 'mmc',	
-	('mediatek,mt8135-mmc', 'mediatek,mt8173-mmc', 'mediatek,mt8183-mmc', 'mediatek,mt2701-mmc', 'mediatek,mt2712-mmc', 'mediatek,mt7622-mmc', 'mediatek,mt8516-mmc', 'mediatek,mt7620-mmc', 'mediatek,mt6779-mmc') : 'mmc',	
-	('marvell,dove-sdhci',) : 'mmc',	
-	('mrvl,pxav2-mmc',) : 'mmc',	
-	('ti,am654-sdhci-5.1', 'ti,j721e-sdhci-8bit', 'ti,j721e-sdhci-4bit') : 'mmc',	
-	('brcm,kona-sdhci', 'bcm,kona-sdhci') : 'mmc',	
-	('mrvl,pxav3-mmc', 'marvell,armada-380-sdhci') : 'mmc',	
-	('marvell,armada-ap806-sdhci', 'marvell,armada-cp110-sdhci', 'marvell,armada-3700-sdhci') : 'mmc',	
-	('brcm,bcm7425-sdhci', 'brcm,bcm7445-sdhci', 'brcm,bcm7216-sdhci') : 'mmc',	
-	('actions,owl-mmc',) : 'mmc',	
-	('snps,dwcmshc-sdhci',) : 'mmc',	
-	('wm,wm8505-sdhc',) : 'mmc',	
-	('zte,zx296718-dw-mshc',) : 'mmc',	
-	('ti,dra7-sdhci', 'ti,k2g-sdhci', 'ti,am335-sdhci', 'ti,am437-sdhci') : 'mmc',	
-	('aspeed,ast2400-sdhci', 'aspeed,ast2500-sdhci', 'aspeed,ast2600-sdhci', 'aspeed,ast2400-sd-controller', 'aspeed,ast2500-sd-controller', 'aspeed,ast2600-sd-controller') : 'mmc',	
-	('ti,dm6441-mmc', 'ti,da830-mmc') : 'mmc',	
-	('allwinner,sun4i-a10-mmc', 'allwinner,sun5i-a13-mmc', 'allwinner,sun7i-a20-mmc', 'allwinner,sun8i-a83t-emmc', 'allwinner,sun9i-a80-mmc', 'allwinner,sun50i-a64-mmc', 'allwinner,sun50i-a64-emmc') : 'mmc',	
-	('sprd,sdhci-r11',) : 'mmc',	
-	('socionext,milbeaut-m10v-sdhci-3.0',) : 'mmc',	
-	('mellanox,bluefield-dw-mshc',) : 'mmc',	
-	('microchip,dw-sparx5-sdhci',) : 'mmc',	
-	('ti,omap2420-mmc',) : 'mmc',	
-	('brcm,bcm2835-sdhost',) : 'mmc',	
-	('hisilicon,hi3660-dw-mshc', 'hisilicon,hi4511-dw-mshc', 'hisilicon,hi6220-dw-mshc') : 'mmc',	
-	('sirf,prima2-sdhc',) : 'mmc',	
-	('ti,omap2-hsmmc', 'ti,omap3-pre-es3-hsmmc', 'ti,omap3-hsmmc', 'ti,omap4-hsmmc', 'ti,am33xx-hsmmc') : 'mmc',	
-	('snps,dw-mshc', 'altr,socfpga-dw-mshc', 'img,pistachio-dw-mshc') : 'mmc',	
-	('rockchip,rk3399-sdhci-5.1', 'intel,lgm-sdhci-5.1-emmc', 'intel,lgm-sdhci-5.1-sdxc', 'intel,keembay-sdhci-5.1-emmc', 'intel,keembay-sdhci-5.1-sd', 'intel,keembay-sdhci-5.1-sdio', 'arasan,sdhci-8.9a', 'arasan,sdhci-5.1', 'arasan,sdhci-4.9a', 'xlnx,zynqmp-8.9a', 'xlnx,versal-8.9a') : 'mmc',	
-	('fsl,imx21-mmc', 'fsl,imx31-mmc', 'fsl,mpc5121-sdhc') : 'mmc',	
-	('hisilicon,hi3798cv200-dw-mshc',) : 'mmc',	
-	('renesas,sh-mmcif',) : 'mmc',	
-	('rockchip,rk2928-dw-mshc', 'rockchip,rk3288-dw-mshc') : 'mmc',	
-	('moxa,moxart-mmc', 'faraday,ftsdc010') : 'mmc',	
-	('nintendo,hollywood-sdhci',) : 'mmc',	
-	('samsung,s3c2410-sdi', 'samsung,s3c2412-sdi', 'samsung,s3c2440-sdi') : 'mmc',	
-	('socionext,uniphier-sd4hc', 'cdns,sd4hc') : 'mmc',	
-	('ingenic,jz4740-mmc', 'ingenic,jz4725b-mmc', 'ingenic,jz4760-mmc', 'ingenic,jz4780-mmc', 'ingenic,x1000-mmc') : 'mmc',	
-	('amlogic,meson8-sdio', 'amlogic,meson8b-sdio') : 'mmc',	
-	('renesas,sdhi-sh73a0', 'renesas,sdhi-r8a73a4', 'renesas,sdhi-r8a7740', 'renesas,sdhi-r7s72100', 'renesas,sdhi-r8a7778', 'renesas,sdhi-r8a7779', 'renesas,sdhi-r8a7743', 'renesas,sdhi-r8a7745', 'renesas,sdhi-r8a7790', 'renesas,sdhi-r8a7791', 'renesas,sdhi-r8a7792', 'renesas,sdhi-r8a7793', 'renesas,sdhi-r8a7794', 'renesas,rcar-gen1-sdhi', 'renesas,rcar-gen2-sdhi', 'renesas,sdhi-shmobile') : 'mmc',	
-	('marvell,orion-sdio',) : 'mmc',	
-	('samsung,exynos4412-dw-mshc', 'samsung,exynos5250-dw-mshc', 'samsung,exynos5420-dw-mshc', 'samsung,exynos5420-dw-mshc-smu', 'samsung,exynos7-dw-mshc', 'samsung,exynos7-dw-mshc-smu') : 'mmc',	
-	('socionext,uniphier-sd-v2.91', 'socionext,uniphier-sd-v3.1', 'socionext,uniphier-sd-v3.1.1') : 'mmc',	
-	('nvidia,tegra194-sdhci', 'nvidia,tegra186-sdhci', 'nvidia,tegra210-sdhci', 'nvidia,tegra124-sdhci', 'nvidia,tegra114-sdhci', 'nvidia,tegra30-sdhci', 'nvidia,tegra20-sdhci') : 'mmc',	
-	('renesas,sdhi-r7s9210', 'renesas,sdhi-mmc-r8a77470', 'renesas,sdhi-r8a7795', 'renesas,sdhi-r8a7796', 'renesas,rcar-gen3-sdhi') : 'mmc',	
-	('fsl,ls1021a-esdhc', 'fsl,ls1046a-esdhc', 'fsl,ls1012a-esdhc', 'fsl,p1010-esdhc', 'fsl,mpc8379-esdhc', 'fsl,mpc8536-esdhc', 'fsl,esdhc', 'fsl,t1040-scfg', 'fsl,ls1012a-scfg', 'fsl,ls1046a-scfg') : 'mmc',	
-	('fsl,imx25-esdhc', 'fsl,imx35-esdhc', 'fsl,imx51-esdhc', 'fsl,imx53-esdhc', 'fsl,imx6sx-usdhc', 'fsl,imx6sl-usdhc', 'fsl,imx6sll-usdhc', 'fsl,imx6q-usdhc', 'fsl,imx6ull-usdhc', 'fsl,imx7d-usdhc', 'fsl,imx7ulp-usdhc', 'fsl,imx8qxp-usdhc', 'fsl,imx8mm-usdhc') : 'mmc',	
-	('mmc-pwrseq-emmc',) : 'mmc',	
-	('mmc-pwrseq-sd8787',) : 'mmc',	
-	('mmc-pwrseq-simple',) : 'mmc',	
-	('eckelmann,siox-gpio',) : 'siox',	
-	('pmem-region', 'pmem-region-v2') : 'nvdimm',	
-	('qcom,pm8941-coincell',) : 'misc',	
-	('qemu,pvpanic-mmio',) : 'misc',	
-	('idt,89hpes8nt2', 'idt,89hpes12nt3', 'idt,89hpes24nt6ag2', 'idt,89hpes32nt8ag2', 'idt,89hpes32nt8bg2', 'idt,89hpes12nt12g2', 'idt,89hpes16nt16g2', 'idt,89hpes24nt24g2', 'idt,89hpes32nt24ag2', 'idt,89hpes32nt24bg2', 'idt,89hpes12n3', 'idt,89hpes12n3a', 'idt,89hpes24n3', 'idt,89hpes24n3a', 'idt,89hpes32h8', 'idt,89hpes32h8g2', 'idt,89hpes48h12', 'idt,89hpes48h12g2', 'idt,89hpes48h12ag2', 'idt,89hpes16h16', 'idt,89hpes22h16', 'idt,89hpes22h16g2', 'idt,89hpes34h16', 'idt,89hpes34h16g2', 'idt,89hpes64h16', 'idt,89hpes64h16g2', 'idt,89hpes64h16ag2', 'idt,89hpes12t3g2', 'idt,89hpes24t3g2', 'idt,89hpes16t4', 'idt,89hpes4t4g2', 'idt,89hpes10t4g2', 'idt,89hpes16t4g2', 'idt,89hpes16t4ag2', 'idt,89hpes5t5', 'idt,89hpes6t5', 'idt,89hpes8t5', 'idt,89hpes8t5a', 'idt,89hpes24t6', 'idt,89hpes6t6g2', 'idt,89hpes24t6g2', 'idt,89hpes16t7', 'idt,89hpes32t8', 'idt,89hpes32t8g2', 'idt,89hpes48t12', 'idt,89hpes48t12g2') : 'misc',	
-	('atmel,24c00', 'atmel,24c01', 'atmel,24cs01', 'atmel,24c02', 'atmel,24cs02', 'atmel,24mac402', 'atmel,24mac602', 'atmel,spd', 'atmel,24c04', 'atmel,24cs04', 'atmel,24c08', 'atmel,24cs08', 'atmel,24c16', 'atmel,24cs16', 'atmel,24c32', 'atmel,24cs32', 'atmel,24c64', 'atmel,24cs64', 'atmel,24c128', 'atmel,24c256', 'atmel,24c512', 'atmel,24c1024', 'atmel,24c2048') : 'misc',	
-	('atmel,at25',) : 'misc',	
-	('eeprom-93xx46', 'atmel,at93c46d') : 'misc',	
-	('qcom,fastrpc-compute-cb', 'qcom,fastrpc') : 'misc',	
-	('xlnx,sd-fec-1.1',) : 'misc',	
-	('hisilicon,gpio_hubv1', 'hisilicon,kirin970_hikey_usbhub') : 'misc',	
-	('mmio-sram', 'atmel,sama5d2-securam') : 'misc',	
-	('st,lis302dl-spi',) : 'misc',	
-	('st,lis3lv02d',) : 'misc',	
-	('atmel,at91rm9200-ssc', 'atmel,at91sam9rl-ssc', 'atmel,at91sam9g45-ssc') : 'misc',	
-	('ibm,coherent-platform-facility',) : 'misc',	
-	('taos,tsl2550',) : 'misc',	
-	('atmel,at91rm9200-tcb', 'atmel,at91sam9x5-tcb') : 'misc',	
-	('dallas,ds1682',) : 'misc',	
-	('cavium,octeon-3860-twsi', 'cavium,octeon-7890-twsi') : 'i2c',	
-	('zte,zx296718-i2c',) : 'i2c',	
-	('img,scb-i2c',) : 'i2c',	
-	('energymicro,efm32-i2c',) : 'i2c',	
-	('cnxt,cx92755-i2c',) : 'i2c',	
-	('altr,softip-i2c-v1.0',) : 'i2c',	
-	('hisilicon,hix5hd2-i2c',) : 'i2c',	
-	('snps,designware-i2c', 'mscc,ocelot-i2c', 'baikal,bt1-sys-i2c') : 'i2c',	
-	('sirf,prima2-i2c',) : 'i2c',	
-	('samsung,exynos5-hsi2c', 'samsung,exynos5250-hsi2c', 'samsung,exynos5260-hsi2c', 'samsung,exynos7-hsi2c') : 'i2c',	
-	('fsl,imx1-i2c', 'fsl,imx21-i2c', 'fsl,vf610-i2c') : 'i2c',	
-	('xlnx,xps-iic-2.00.a',) : 'i2c',	
-	('i2c-gpio',) : 'i2c',	
-	('mediatek,mt7621-i2c',) : 'i2c',	
-	('ingenic,jz4770-i2c', 'ingenic,jz4780-i2c', 'ingenic,x1000-i2c') : 'i2c',	
-	('cdns,i2c-r1p10', 'cdns,i2c-r1p14') : 'i2c',	
-	('fsl,imx23-i2c', 'fsl,imx28-i2c') : 'i2c',	
-	('lsi,api2c',) : 'i2c',	
-	('fsl,cpm1-i2c', 'fsl,cpm2-i2c') : 'i2c',	
-	('aspeed,ast2400-i2c-bus', 'aspeed,ast2500-i2c-bus', 'aspeed,ast2600-i2c-bus') : 'i2c',	
-	('nxp,pca9564', 'nxp,pca9665') : 'i2c',	
-	('sprd,sc9860-i2c',) : 'i2c',	
-	('atmel,at91rm9200-i2c', 'atmel,at91sam9260-i2c', 'atmel,at91sam9261-i2c', 'atmel,at91sam9g20-i2c', 'atmel,at91sam9g10-i2c', 'atmel,at91sam9x5-i2c', 'atmel,sama5d4-i2c', 'atmel,sama5d2-i2c', 'microchip,sam9x60-i2c') : 'i2c',	
-	('qcom,i2c-qup-v1.1.1', 'qcom,i2c-qup-v2.1.1', 'qcom,i2c-qup-v2.2.1') : 'i2c',	
-	('intel,iop3xx-i2c', 'intel,ixp4xx-i2c') : 'i2c',	
-	('ibm,iic',) : 'i2c',	
-	('apm,xgene-slimpro-i2c',) : 'i2c',	
-	('fsl,imx7ulp-lpi2c',) : 'i2c',	
-	('mrvl,pxa-i2c', 'mrvl,pwri2c', 'mrvl,mmp-twsi', 'marvell,armada-3700-i2c') : 'i2c',	
-	('nvidia,tegra194-i2c', 'nvidia,tegra186-i2c', 'nvidia,tegra210-i2c-vi', 'nvidia,tegra210-i2c', 'nvidia,tegra124-i2c', 'nvidia,tegra114-i2c', 'nvidia,tegra30-i2c', 'nvidia,tegra20-i2c', 'nvidia,tegra20-i2c-dvc') : 'i2c',	
-	('renesas,iic-emev2',) : 'i2c',	
-	('socionext,synquacer-i2c',) : 'i2c',	
-	('brcm,kona-i2c',) : 'i2c',	
-	('mpc5200-i2c', 'fsl,mpc5200b-i2c', 'fsl,mpc5200-i2c', 'fsl,mpc5121-i2c', 'fsl,mpc8313-i2c', 'fsl,mpc8543-i2c', 'fsl,mpc8544-i2c', 'fsl-i2c') : 'i2c',	
-	('brcm,brcmstb-i2c', 'brcm,brcmper-i2c', 'brcm,bcm2711-hdmi-i2c') : 'i2c',	
-	('i2c-cbus-gpio',) : 'i2c',	
-	('allwinner,sun6i-a31-p2wi',) : 'i2c',	
-	('arm,versatile-i2c',) : 'i2c',	
-	('nxp,lpc1788-i2c',) : 'i2c',	
-	('nuvoton,npcm750-i2c',) : 'i2c',	
-	('renesas,iic-r8a73a4', 'renesas,iic-r8a7740', 'renesas,iic-r8a774c0', 'renesas,iic-r8a7790', 'renesas,iic-r8a7791', 'renesas,iic-r8a7792', 'renesas,iic-r8a7793', 'renesas,iic-r8a7794', 'renesas,iic-r8a7795', 'renesas,iic-r8a77990', 'renesas,iic-sh73a0', 'renesas,rcar-gen2-iic', 'renesas,rcar-gen3-iic', 'renesas,rmobile-iic') : 'i2c',	
-	('nxp,pnx-i2c',) : 'i2c',	
-	('qcom,msm8916-cci', 'qcom,msm8996-cci', 'qcom,sdm845-cci') : 'i2c',	
-	('brcm,bcm2711-i2c', 'brcm,bcm2835-i2c') : 'i2c',	
-	('ti,omap4-i2c', 'ti,omap3-i2c', 'ti,omap2430-i2c', 'ti,omap2420-i2c') : 'i2c',	
-	('rockchip,rv1108-i2c', 'rockchip,rk3066-i2c', 'rockchip,rk3188-i2c', 'rockchip,rk3228-i2c', 'rockchip,rk3288-i2c', 'rockchip,rk3399-i2c') : 'i2c',	
-	('opencores,i2c-ocores', 'aeroflexgaisler,i2cmst', 'sifive,fu540-c000-i2c', 'sifive,i2c0') : 'i2c',	
-	('netlogic,xlp980-i2c',) : 'i2c',	
-	('st,ddci2c',) : 'i2c',	
-	('mediatek,mt2712-i2c', 'mediatek,mt6577-i2c', 'mediatek,mt6589-i2c', 'mediatek,mt7622-i2c', 'mediatek,mt8173-i2c', 'mediatek,mt8183-i2c', 'mediatek,mt8192-i2c') : 'i2c',	
-	('st,stm32f7-i2c', 'st,stm32mp15-i2c') : 'i2c',	
-	('mellanox,i2c-mlxbf1', 'mellanox,i2c-mlxbf2') : 'i2c',	
-	('socionext,uniphier-fi2c',) : 'i2c',	
-	('google,cros-ec-i2c-tunnel',) : 'i2c',	
-	('st,comms-ssc-i2c', 'st,comms-ssc4-i2c') : 'i2c',	
-	('wm,wm8505-i2c',) : 'i2c',	
-	('brcm,iproc-i2c', 'brcm,iproc-nic-i2c') : 'i2c',	
-	('ti,davinci-i2c', 'ti,keystone-i2c') : 'i2c',	
-	('allwinner,sun4i-a10-i2c', 'allwinner,sun6i-a31-i2c', 'marvell,mv64xxx-i2c', 'marvell,mv78230-i2c', 'marvell,mv78230-a0-i2c') : 'i2c',	
-	('socionext,uniphier-i2c',) : 'i2c',	
-	('ibm,opal-i2c',) : 'i2c',	
-	('renesas,i2c-r8a7778', 'renesas,i2c-r8a7779', 'renesas,i2c-r8a7790', 'renesas,i2c-r8a7791', 'renesas,i2c-r8a7792', 'renesas,i2c-r8a7793', 'renesas,i2c-r8a7794', 'renesas,i2c-r8a7795', 'renesas,i2c-r8a7796', 'renesas,i2c-rcar', 'renesas,rcar-gen1-i2c', 'renesas,rcar-gen2-i2c', 'renesas,rcar-gen3-i2c') : 'i2c',	
-	('st,stm32f4-i2c',) : 'i2c',	
-	('nvidia,tegra186-bpmp-i2c',) : 'i2c',	
-	('amlogic,meson6-i2c', 'amlogic,meson-gxbb-i2c', 'amlogic,meson-axg-i2c') : 'i2c',	
-	('samsung,s3c2410-i2c', 'samsung,s3c2440-i2c', 'samsung,s3c2440-hdmiphy-i2c', 'samsung,exynos5-sata-phy-i2c') : 'i2c',	
-	('renesas,riic-rz',) : 'i2c',	
-	('actions,s500-i2c', 'actions,s700-i2c', 'actions,s900-i2c') : 'i2c',	
-	('qcom,geni-i2c',) : 'i2c',	
-	('i2c-mux',) : 'i2c',	
-	('nxp,pca9540', 'nxp,pca9542', 'nxp,pca9543', 'nxp,pca9544', 'nxp,pca9545', 'nxp,pca9546', 'nxp,pca9547', 'nxp,pca9548', 'nxp,pca9846', 'nxp,pca9847', 'nxp,pca9848', 'nxp,pca9849') : 'i2c',	
-	('lltc,ltc4305', 'lltc,ltc4306') : 'i2c',	
-	('i2c-mux-gpio',) : 'i2c',	
-	('i2c-mux-reg',) : 'i2c',	
-	('nxp,pca9541',) : 'i2c',	
-	('i2c-arb-gpio-challenge',) : 'i2c',	
-	('i2c-mux-pinctrl',) : 'i2c',	
-	('i2c-demux-pinctrl',) : 'i2c',	
-	('socionext,uniphier-xdmac',) : 'dma',	
-	('adi,axi-dmac-1.00.a',) : 'dma',	
-	('stericsson,coh901318',) : 'dma',	
-	('marvell,orion-xor', 'marvell,armada-380-xor', 'marvell,armada-3700-xor') : 'dma',	
-	('nvidia,tegra148-apbdma', 'nvidia,tegra114-apbdma', 'nvidia,tegra30-apbdma', 'nvidia,tegra20-apbdma') : 'dma',	
-	('snps,axi-dma-1.01a',) : 'dma',	
-	('renesas,nbpfaxi64dmac1b4', 'renesas,nbpfaxi64dmac1b8', 'renesas,nbpfaxi64dmac1b16', 'renesas,nbpfaxi64dmac4b4', 'renesas,nbpfaxi64dmac4b8', 'renesas,nbpfaxi64dmac4b16', 'renesas,nbpfaxi64dmac8b4', 'renesas,nbpfaxi64dmac8b8', 'renesas,nbpfaxi64dmac8b16') : 'dma',	
-	('fsl,vf610-edma', 'fsl,ls1028a-edma', 'fsl,imx7ulp-edma') : 'dma',	
-	('st,stm32h7-mdma',) : 'dma',	
-	('st,stm32-dma', 'st,stm32h7-dmamux') : 'dma',	
-	('moxa,moxart-dma',) : 'dma',	
-	('apm,xgene-storm-dma',) : 'dma',	
-	('marvell,pdma-1.0',) : 'dma',	
-	('nxp,lpc1850-dmamux',) : 'dma',	
-	('fsl,imx1-dma', 'fsl,imx21-dma', 'fsl,imx27-dma') : 'dma',	
-	('allwinner,sun4i-a10-dma',) : 'dma',	
-	('fsl,imx23-dma-apbh', 'fsl,imx23-dma-apbx', 'fsl,imx28-dma-apbh', 'fsl,imx28-dma-apbx') : 'dma',	
-	('ingenic,jz4740-dma', 'ingenic,jz4725b-dma', 'ingenic,jz4770-dma', 'ingenic,jz4780-dma', 'ingenic,x1000-dma', 'ingenic,x1830-dma') : 'dma',	
-	('atmel,at91sam9rl-dma', 'atmel,at91sam9g45-dma') : 'dma',	
-	('actions,s900-dma', 'actions,s700-dma') : 'dma',	
-	('st,stm32-dma',) : 'dma',	
-	('ti,edma3', 'ti,edma3-tpcc', 'ti,edma3-tptc') : 'dma',	
-	('ti,am654-navss-main-udmap', 'ti,am654-navss-mcu-udmap', 'ti,j721e-navss-main-udmap', 'ti,j721e-navss-mcu-udmap', 'ti,am64-dmss-bcdma', 'ti,am64-dmss-pktdma') : 'dma',	
-	('ti,dra7-dma-crossbar', 'ti,am335x-edma-crossbar', 'ti,edma3-tpcc', 'ti,omap4430-sdma', 'ti,edma3', 'ti,edma3-tpcc') : 'dma',	
-	('ti,omap2420-sdma', 'ti,omap2430-sdma', 'ti,omap3430-sdma', 'ti,omap3630-sdma', 'ti,omap4430-sdma') : 'dma',	
-	('ti,am3359-cppi41', 'ti,da830-cppi41') : 'dma',	
-	('fsl,mpc5200-sram', 'mpc5200-sram', 'fsl,mpc5200-bestcomm', 'mpc5200-bestcomm') : 'dma',	
-	('img,pistachio-mdc-dma',) : 'dma',	
-	('brcm,iproc-sba', 'brcm,iproc-sba-v2') : 'dma',	
-	('allwinner,sun6i-a31-dma', 'allwinner,sun8i-a23-dma', 'allwinner,sun8i-a83t-dma', 'allwinner,sun8i-h3-dma', 'allwinner,sun8i-v3s-dma', 'allwinner,sun50i-a64-dma', 'allwinner,sun50i-a100-dma', 'allwinner,sun50i-h6-dma') : 'dma',	
-	('sprd,sc9860-dma',) : 'dma',	
-	('fsl,raideng-v1.0',) : 'dma',	
-	('socionext,uniphier-mio-dmac',) : 'dma',	
-	('brcm,bcm2835-dma',) : 'dma',	
-	('renesas,rcar-dmac',) : 'dma',	
-	('renesas,shdma-mux',) : 'dma',	
-	('renesas,usb-dmac',) : 'dma',	
-	('socionext,milbeaut-m10v-hdmac',) : 'dma',	
-	('hisilicon,k3-dma-1.0', 'hisilicon,hisi-pcm-asp-dma-1.0') : 'dma',	
-	('stericsson,dma40',) : 'dma',	
-	('fsl,mpc5121-dma', 'fsl,mpc8308-dma') : 'dma',	
-	('socionext,milbeaut-m10v-xdmac',) : 'dma',	
-	('zte,zx296702-dma',) : 'dma',	
-	('mediatek,mt7623-hsdma', 'mediatek,mt7622-hsdma') : 'dma',	
-	('mediatek,mt6577-uart-dma',) : 'dma',	
-	('mediatek,mt6765-cqdma',) : 'dma',	
-	('marvell,xor-v2',) : 'dma',	
-	('snps,dma-spear1340',) : 'dma',	
-	('nvidia,tegra210-adma', 'nvidia,tegra186-adma') : 'dma',	
-	('atmel,sama5d4-dma', 'microchip,sama7g5-dma') : 'dma',	
-	('xlnx,axi-dma-1.00.a', 'xlnx,axi-cdma-1.00.a', 'xlnx,axi-vdma-1.00.a', 'xlnx,axi-mcdma-1.00.a') : 'dma',	
-	('xlnx,zynqmp-dpdma',) : 'dma',	
-	('xlnx,zynqmp-dma-1.0',) : 'dma',	
-	('fsl,ls1021a-qdma',) : 'dma',	
-	('st,stih407-fdma-mpe31-11', 'st,stih407-fdma-mpe31-12', 'st,stih407-fdma-mpe31-13') : 'dma',	
-	('fsl,elo3-dma', 'fsl,eloplus-dma', 'fsl,elo-dma') : 'dma',	
-	('qcom,hidma-mgmt-1.0',) : 'dma',	
-	('qcom,hidma-1.0', 'qcom,hidma-1.1', 'qcom,hidma-1.2') : 'dma',	
-	('qcom,sdm845-gpi-dma',) : 'dma',	
-	('qcom,adm',) : 'dma',	
-	('qcom,bam-v1.3.0', 'qcom,bam-v1.4.0', 'qcom,bam-v1.7.0') : 'dma',	
-	('sifive,fu540-c000-pdma',) : 'dma',	
-	('fsl,imx6q-sdma', 'fsl,imx53-sdma', 'fsl,imx51-sdma', 'fsl,imx35-sdma', 'fsl,imx31-sdma', 'fsl,imx25-sdma', 'fsl,imx7d-sdma', 'fsl,imx8mq-sdma') : 'dma',	
-	('sirf,prima2-dmac', 'sirf,atlas7-dmac', 'sirf,atlas7-dmac-v2') : 'dma',	
-	('marvell,adma-1.0', 'marvell,pxa910-squ') : 'dma'
-
-}
\ No newline at end of file
@@ -1,3914 +0,0 @@
-#! /usr/bin/python3
-
-########################################################################################################################
-# THIS FILE WAS AUTO GENERATED BY ./df_analyze.py
-########################################################################################################################
-
-
-DRIVER_NAME_TO_SLOC = {
-	
-	('motorola,mc146818',) : 841,	
-	('fsl,pq2pro-localbus',) : 45,	
-	('fixed-clock',) : 127,	
-	('ibm,hsta-msi',) : 122,	
-	('ibm,vas',) : 151,	
-	('ibm,plb4', 'ibm,plb6', 'ibm,opb') : 218,	
-	('intel,ce4100-cp', 'isa', 'pci') : 210,	
-	('ibm,plb4', 'ibm,opb', 'ibm,ebc', 'simple-bus') : 68,	
-	('ibm,opal-prd',) : 269,	
-	('ibm,plb4', 'ibm,plb6', 'ibm,opb', 'ibm,ebc') : 158,	
-	('fsl,ep8248e-mdio-bitbang', 'simple-bus', 'fsl,ep8248e-bcsr') : 208,	
-	('simple-bus',) : 92,	
-	('ibm,plb4', 'ibm,opb', 'ibm,ebc') : 32,	
-	('fsl,mpc5121-immr', 'fsl,mpc5121-localbus', 'fsl,mpc5121-mbx', 'fsl,mpc5121-nfc', 'fsl,mpc5121-sram', 'fsl,mpc5121-pci', 'gpio-leds') : 284,	
-	('nintendo,flipper',) : 51,	
-	('soc', 'simple-bus', 'gianfar', 'gpio-leds', 'fsl,qe') : 85,	
-	('virtio,uml',) : 811,	
-	('pasemi,localbus', 'pasemi,sdc') : 291,	
-	('nintendo,hollywood',) : 114,	
-	('fsl,mpc512x-lpbfifo',) : 320,	
-	('hawk-bridge',) : 118,	
-	('fsl,mpc5200-gpio', 'mpc5200-gpio') : 141,	
-	('fsl,mcu-mpc8349emitx',) : 143,	
-	('fsl,srio',) : 525,	
-	('fsl,mpc5200-cdm', 'mpc5200-cdm', 'fsl,mpc5200-gpio', 'mpc5200-gpio') : 94,	
-	('soc', 'simple-bus', 'gianfar', 'fsl,mpc8641-pcie') : 21,	
-	('fsl,mpc8610-immr', 'fsl,mpc8610-guts', 'fsl,eloplus-dma', 'fsl,mpc8610-pci') : 201,	
-	('simple-bus', 'gianfar', 'fsl,srio') : 47,	
-	('soc',) : 174,	
-	('fsl,mpc8572-guts', 'fsl,p1020-guts', 'fsl,p1021-guts', 'fsl,p1022-guts', 'fsl,p1023-guts', 'fsl,p2020-guts', 'fsl,bsc9132-guts') : 52,	
-	('sgy,gpio-halt', 'fsl,qoriq-gpio') : 92,	
-	('fsl,mpc8313-pmc', 'fsl,mpc8349-pmc') : 262,	
-	('ibm,plb3', 'ibm,plb4', 'ibm,opb', 'ibm,ebc', 'simple-bus') : 34,	
-	('IBM,lhca', 'IBM,lhea') : 276,	
-	('soc', 'simple-bus', 'gianfar', 'fsl,qe', 'fsl,cpm2', 'fsl,srio', 'fsl,eloplus-dma', 'fsl,mpc8548-guts', 'gpio-leds', 'fsl,mpc8540-pci', 'fsl,mpc8548-pcie', 'fsl,p1022-pcie', 'fsl,p1010-pcie', 'fsl,p1023-pcie', 'fsl,p4080-pcie', 'fsl,qoriq-pcie-v2.4', 'fsl,qoriq-pcie-v2.3', 'fsl,qoriq-pcie-v2.2', 'fsl,fman') : 66,	
-	('fsl,mpc5200-lpbfifo',) : 302,	
-	('ibm,secureboot', 'ibm,secureboot-v1', 'ibm,secureboot-v2') : 37,	
-	('fsl,mpc5200-pci', 'mpc5200-pci') : 271,	
-	('ibm,pmemory', 'ibm,pmemory-v2') : 725,	
-	('amcc,ppc4xx-msi',) : 190,	
-	('fsl,p2020-l2-cache-controller', 'fsl,p2010-l2-cache-controller', 'fsl,p1020-l2-cache-controller', 'fsl,p1011-l2-cache-controller', 'fsl,p1013-l2-cache-controller', 'fsl,p1022-l2-cache-controller', 'fsl,mpc8548-l2-cache-controller', 'fsl,mpc8544-l2-cache-controller', 'fsl,mpc8572-l2-cache-controller', 'fsl,mpc8536-l2-cache-controller', 'fsl,p1021-l2-cache-controller', 'fsl,p1012-l2-cache-controller', 'fsl,p1025-l2-cache-controller', 'fsl,p1016-l2-cache-controller', 'fsl,p1024-l2-cache-controller', 'fsl,p1015-l2-cache-controller', 'fsl,p1010-l2-cache-controller', 'fsl,bsc9131-l2-cache-controller') : 127,	
-	('fsl,elbc', 'fsl,pq3-localbus', 'fsl,pq2-localbus', 'fsl,pq2pro-localbus') : 261,	
-	('fsl,cpm1-pario-bank-a', 'fsl,cpm1-pario-bank-b', 'fsl,cpm1-pario-bank-c', 'fsl,cpm1-pario-bank-d', 'fsl,cpm1-pario-bank-e', 'fsl,cpm2-pario-bank') : 40,	
-	('ibm,secvar-backend',) : 83,	
-	('fsl,mpc5200-immr', 'fsl,mpc5200b-immr', 'mpc5200', 'mpc5200') : 155,	
-	('fsl,mpc8548-pmc', 'fsl,mpc8641d-pmc') : 49,	
-	('ibm,opb', 'simple-bus', 'wrs,epld-localbus') : 402,	
-	('fsl,mpic-global-timer',) : 325,	
-	('fsl,mpic-v3.1-msgr',) : 162,	
-	('fsl,mpc5200-pic', 'mpc5200-pic', 'fsl,mpc5200-bestcomm', 'mpc5200-bestcomm') : 234,	
-	('andestech,atl2c',) : 46,	
-	('fsl,qoriq-rcpm-1.0', 'fsl,qoriq-rcpm-2.0', 'fsl,qoriq-rcpm-2.1') : 237,	
-	('brcm,bcm7038-l1-intc', 'brcm,bcm6345-l1-intc') : 21,	
-	('fsl,mpc5200-gpt', 'fsl,mpc5200-gpt-gpio', 'mpc5200-gpt') : 432,	
-	('mti,ranchu',) : 41,	
-	('fsl,mpc5200-xlb', 'mpc5200-xlb', 'fsl,mpc5200-immr', 'fsl,mpc5200b-immr', 'simple-bus', 'fsl,lpb', 'mpc5200', 'mpc5200', 'fsl,mpc5200-gpt', 'mpc5200-gpt', 'fsl,mpc5200-cdm', 'mpc5200-cdm', 'fsl,mpc5200-gpio', 'fsl,mpc5200-gpio-wkup') : 174,	
-	('lantiq,pci-xway',) : 169,	
-	('netlogic,xlp-pic',) : 214,	
-	('fsl,mpic-msi', 'fsl,mpic-msi-v4.3', 'fsl,ipic-msi', 'fsl,vmpic-msi', 'fsl,vmpic-msi-v4.3') : 380,	
-	('ralink,rt288x-pci',) : 187,	
-	('ingenic,jz4740', 'ingenic,jz4725b', 'ingenic,jz4770', 'ingenic,jz4775', 'ingenic,jz4780', 'ingenic,x1000', 'ingenic,x1000e', 'ingenic,x1830', 'ingenic,x2000', 'ingenic,x2000e') : 70,	
-	('lantiq,dcdc-xrx200',) : 30,	
-	('mediatek,mt7620-pci',) : 267,	
-	('lantiq,vmmc-xway',) : 38,	
-	('ralink,rt3883-pci',) : 371,	
-	('fsl,mpc8540-pci', 'fsl,mpc8548-pcie', 'fsl,mpc8610-pci', 'fsl,mpc8641-pcie', 'fsl,qoriq-pcie', 'fsl,qoriq-pcie-v2.1', 'fsl,qoriq-pcie-v2.2', 'fsl,qoriq-pcie-v2.3', 'fsl,qoriq-pcie-v2.4', 'fsl,qoriq-pcie-v3.0', 'fsl,p1022-pcie', 'fsl,p4080-pcie') : 807,	
-	('lantiq,gptu-xway',) : 122,	
-	('lantiq,dma-xway',) : 177,	
-	('ralink,rt3883-soc',) : 109,	
-	('ralink,rt2880-timer',) : 90,	
-	('ralink,r2880-soc',) : 76,	
-	('mtk,mt7621-soc',) : 148,	
-	('lantiq,icu',) : 268,	
-	('mti,cpu-interrupt-controller', 'ralink,rt2880-intc') : 116,	
-	('microchip,pic32mzda-infra',) : 31,	
-	('simple-bus', 'cavium,octeon-6335-uctl', 'cavium,octeon-5750-usbn', 'cavium,octeon-3860-bootbus', 'cavium,mdio-mux', 'gpio-leds', 'cavium,octeon-7130-usb-uctl') : 773,	
-	('arm,core-module-integrator',) : 100,	
-	('ralink,rt3050-soc', 'ralink,rt3052-soc', 'ralink,rt3350-soc', 'ralink,rt3352-soc', 'ralink,rt5350-soc') : 218,	
-	('arm,integrator-ap-syscon',) : 113,	
-	('arm,arm11mp-scu', 'arm,cortex-a9-scu', 'arm,cortex-a5-scu', 'arm,core-module-integrator', 'arm,realview-eb-syscon', 'arm,realview-pb11mp-syscon', 'arm,realview-pbx-syscon') : 63,	
-	('andestech,nds32v3-pmu',) : 860,	
-	('arm,integrator-cp-syscon',) : 76,	
-	('zte,zx296702-pcu',) : 137,	
-	('st,spear-timer',) : 142,	
-	('rockchip,rk3288-pmu',) : 178,	
-	('mrvl,pxa25x-ssp', 'mvrl,pxa25x-nssp', 'mrvl,pxa27x-ssp', 'mrvl,pxa3xx-ssp', 'mvrl,pxa168-ssp', 'mrvl,pxa910-ssp', 'mrvl,ce4100-ssp') : 143,	
-	('brcm,bcm63138-bootlut',) : 89,	
-	('brcm,kona-smc', 'bcm,kona-smc') : 84,	
-	('ralink,mt7620a-soc', 'ralink,mt7620n-soc', 'ralink,mt7628an-soc') : 526,	
-	('stericsson,ux500-pm-domains',) : 35,	
-	('stericsson,db8500', 'simple-bus') : 74,	
-	('ti,k2hk', 'ti,k2e', 'ti,k2l') : 24,	
-	('intel,lubbock-cplds-irqs', 'intel,mainstone-cplds-irqs') : 127,	
-	('open-pic',) : 1208,	
-	('arm,arm11mpcore-pmu', 'arm,arm1176-pmu', 'arm,arm1136-pmu') : 352,	
-	('marvell,pxa-intc',) : 165,	
-	('marvell,tauros2-cache',) : 137,	
-	('renesas,r8a7742-cpg-mssr', 'renesas,r8a7743-cpg-mssr', 'renesas,r8a7744-cpg-mssr', 'renesas,r8a7790-cpg-mssr', 'renesas,r8a7791-cpg-mssr', 'renesas,r8a7793-cpg-mssr') : 129,	
-	('stericsson,s365',) : 65,	
-	('renesas,apmu',) : 151,	
-	('sirf,prima2-pwrc', 'sirf,prima2-memc') : 86,	
-	('sirf,atlas7-clkc',) : 56,	
-	('sirf,prima2-rtciobg',) : 86,	
-	('socionext,uniphier-system-cache',) : 261,	
-	('marvell,kirkwood-cache', 'marvell,feroceon-cache') : 181,	
-	('dlg,da9063', 'dlg,da9063l', 'dlg,da9210') : 140,	
-	('sirf,prima2-rstc',) : 58,	
-	('marvell,armada-xp-pcie', 'marvell,armada-370-pcie', 'marvell,kirkwood-pcie') : 96,	
-	('csky,csky-pmu',) : 855,	
-	('marvell,coherency-fabric', 'marvell,armada-375-coherency-fabric', 'marvell,armada-380-coherency-fabric') : 145,	
-	('marvell,orion-system-controller', 'marvell,armada-370-xp-system-controller', 'marvell,armada-375-system-controller') : 103,	
-	('marvell,98dx3336-resume-ctrl',) : 128,	
-	('marvell,armada-370-pmsu', 'marvell,armada-370-xp-pmsu', 'marvell,armada-380-pmsu') : 349,	
-	('ti,omap2-prcm', 'ti,omap3-cm', 'ti,omap4-cm1', 'ti,omap4-cm2', 'ti,omap5-cm-core-aon', 'ti,omap5-cm-core', 'ti,dra7-cm-core-aon', 'ti,dra7-cm-core', 'ti,am3-prcm', 'ti,am4-prcm', 'ti,dm814-prcm', 'ti,dm816-prcm') : 181,	
-	('simple-bus', 'ti,omap-infra') : 252,	
-	('fsl,imx6q-mmdc', 'fsl,imx6qp-mmdc') : 375,	
-	('arm,cortex-a5-scu', 'arm,cortex-a9-scu') : 51,	
-	('samsung,exynos5260-pmu', 'samsung,exynos5410-pmu') : 118,	
-	('arm,cortex-a15-gic', 'nvidia,tegra20-ictlr', 'nvidia,tegra30-ictlr') : 52,	
-	('cavium,octeon-3860-ciu', 'cavium,octeon-3860-gpio', 'cavium,octeon-6880-ciu2', 'cavium,octeon-7890-ciu3', 'cavium,octeon-7130-cib') : 1950,	
-	('ti,omap4-wugen-mpu', 'ti,omap5-wugen-mpu') : 162,	
-	('ti,c64x+emifa',) : 54,	
-	('ti,omap3-prm',) : 372,	
-	('xlnx,plbv46-pci-1.03.a',) : 80,	
-	('samsung,exynos5420', 'samsung,exynos5800') : 161,	
-	('ti,am3-prcm', 'ti,am4-prcm', 'ti,dm814-prcm', 'ti,dm814-pllss', 'ti,dm816-prcm', 'ti,omap2-prcm', 'ti,omap3-prm', 'ti,omap4-prm', 'ti,omap4-scrm', 'ti,omap5-prm', 'ti,omap5-scrm', 'ti,dra7-prm') : 373,	
-	('ti,am3-scm', 'ti,am4-scm', 'ti,omap2-scm', 'ti,omap3-scm', 'ti,dm814-scm', 'ti,dm816-scrm', 'ti,omap4-scm-core', 'ti,omap5-scm-core', 'ti,omap5-scm-wkup-pad-conf', 'ti,dra7-scm-core') : 546,	
-	('riscv,base-pmu',) : 253,	
-	('samsung,exynos3250-pmu', 'samsung,exynos4210-pmu', 'samsung,exynos4412-pmu', 'samsung,exynos5250-pmu', 'samsung,exynos5420-pmu') : 401,	
-	('atmel,sama5d2-gem', 'atmel,at91rm9200-rtc', 'atmel,sama5d3-udc', 'atmel,at91rm9200-ohci', 'usb-ohci', 'atmel,at91sam9g45-ehci', 'usb-ehci', 'atmel,sama5d2-sdhci', 'atmel,at91sam9x5-rtc', 'atmel,at91rm9200-ohci', 'usb-ohci', 'atmel,at91sam9g45-ehci', 'usb-ehci', 'atmel,at91sam9260-rtt', 'cdns,sam9x60-macb', 'atmel,at91rm9200-sdramc', 'atmel,at91sam9260-sdramc', 'atmel,at91sam9g45-ddramc', 'atmel,sama5d3-ddramc', 'atmel,sama5d2-shdwc', 'microchip,sam9x60-shdwc', 'atmel,at91rm9200-pmc', 'atmel,at91sam9260-pmc', 'atmel,at91sam9261-pmc', 'atmel,at91sam9263-pmc', 'atmel,at91sam9g45-pmc', 'atmel,at91sam9n12-pmc', 'atmel,at91sam9rl-pmc', 'atmel,at91sam9x5-pmc', 'atmel,sama5d3-pmc', 'atmel,sama5d4-pmc', 'atmel,sama5d2-pmc', 'microchip,sam9x60-pmc') : 578,	
-	('sun4v',) : 5,	
-	('arm,cortex-a17-pmu', 'arm,cortex-a15-pmu', 'arm,cortex-a12-pmu', 'arm,cortex-a9-pmu', 'arm,cortex-a8-pmu', 'arm,cortex-a7-pmu', 'arm,cortex-a5-pmu', 'qcom,krait-pmu', 'qcom,scorpion-pmu', 'qcom,scorpion-mp-pmu') : 1209,	
-	('ti,c64x+dscr',) : 295,	
-	('ti,c6455-pll', 'ti,c6457-pll', 'ti,c6472-pll', 'ti,c6474-pll', 'ti,c6678-pll', 'ti,c64x+pll') : 319,	
-	('snps,arc700-pct', 'snps,archs-pct') : 399,	
-	('pci108e,a001', 'pci108e,a000') : 430,	
-	('pciex108e,80f0',) : 349,	
-	('pci108e,8000',) : 410,	
-	('sirf,audio-port',) : 53,	
-	('m5819', 'isa-m5819p', 'isa-m5823p', 'ds1287', 'bq4802') : 468,	
-	('sirf,sirf-audio-card',) : 109,	
-	('fsl,mxs-audio-sgtl5000',) : 131,	
-	('nvidia,tegra30-hda', 'nvidia,tegra194-hda') : 365,	
-	('sirf,prima2-usp-pcm',) : 297,	
-	('zte,zx296702-spdif',) : 267,	
-	('SUNW,sun4v-pci',) : 913,	
-	('zte,zx296702-i2s',) : 342,	
-	('zte,zx296718-tdm',) : 319,	
-	('atmel,at91sam9263-ac97c',) : 617,	
-	('ramoops',) : 621,	
-	('st,stih407-uni-player-hdmi', 'st,stih407-uni-player-pcm-out', 'st,stih407-uni-player-dac', 'st,stih407-uni-player-spdif', 'st,stih407-uni-reader-pcm_in', 'st,stih407-uni-reader-hdmi') : 310,	
-	('img,parallel-out',) : 217,	
-	('arm,armv8-pmuv3', 'arm,cortex-a34-pmu', 'arm,cortex-a35-pmu', 'arm,cortex-a53-pmu', 'arm,cortex-a55-pmu', 'arm,cortex-a57-pmu', 'arm,cortex-a65-pmu', 'arm,cortex-a72-pmu', 'arm,cortex-a73-pmu', 'arm,cortex-a75-pmu', 'arm,cortex-a76-pmu', 'arm,cortex-a77-pmu', 'arm,neoverse-e1-pmu', 'arm,neoverse-n1-pmu', 'cavium,thunder-pmu', 'brcm,vulcan-pmu') : 751,	
-	('pci108e,a801', 'pci108e,8002', 'pci108e,8001') : 1006,	
-	('img,i2s-out',) : 421,	
-	('fsl,imx28-saif',) : 512,	
-	('img,pistachio-internal-dac',) : 184,	
-	('img,i2s-in',) : 420,	
-	('mikroe,mikroe-proto',) : 114,	
-	('img,spdif-out',) : 322,	
-	('atmel,sam9x5-wm8731-audio',) : 126,	
-	('atmel,asoc-wm8904',) : 128,	
-	('atmel,at91sam9g20ek-wm8731-audio',) : 168,	
-	('hisilicon,hi6210-i2s',) : 441,	
-	('img,spdif-in',) : 594,	
-	('microchip,sama7g5-spdiftx',) : 599,	
-	('atmel,sama5d2-i2s',) : 465,	
-	('atmel,sama5d2-classd',) : 437,	
-	('axentia,tse850-pcm5142',) : 257,	
-	('fsl,imx8qxp-dsp', 'fsl,imx8qm-dsp', 'fsl,imx8mp-dsp') : 98,	
-	('microchip,sam9x60-i2smcc',) : 656,	
-	('socionext,uniphier-pxs2-aio',) : 208,	
-	('ti,clkctrl',) : 1847,	
-	('socionext,uniphier-evea',) : 382,	
-	('socionext,uniphier-ld11-aio', 'socionext,uniphier-ld20-aio') : 277,	
-	('brcm,bcm63xx-i2s',) : 231,	
-	('samsung,arndale-rt5631', 'samsung,arndale-alc5631', 'samsung,arndale-wm1811') : 138,	
-	('samsung,smdk-wm8994',) : 118,	
-	('google,snow-audio-max98090', 'google,snow-audio-max98091', 'google,snow-audio-max98095') : 175,	
-	('atmel,sama5d2-pdmic',) : 485,	
-	('adi,axi-i2s-1.00.a',) : 204,	
-	('adi,axi-spdif-tx-1.00.a',) : 185,	
-	('microchip,sama7g5-spdifrx',) : 630,	
-	('amlogic,g12a-tohdmitx',) : 195,	
-	('brcm,bcm2835-i2s',) : 580,	
-	('amlogic,t9015',) : 243,	
-	('samsung,midas-audio',) : 363,	
-	('samsung,fascinate4g-wm8994', 'samsung,aries-wm8994') : 463,	
-	('samsung,tm2-audio',) : 468,	
-	('amlogic,axg-tdmin', 'amlogic,g12a-tdmin', 'amlogic,sm1-tdmin') : 159,	
-	('amlogic,axg-spdifin',) : 315,	
-	('amlogic,axg-spdifout',) : 302,	
-	('amlogic,axg-toddr', 'amlogic,g12a-toddr', 'amlogic,sm1-toddr') : 219,	
-	('amlogic,gx-sound-card',) : 85,	
-	('amlogic,axg-tdmout', 'amlogic,g12a-tdmout', 'amlogic,sm1-tdmout') : 223,	
-	('amlogic,aiu-gxbb', 'amlogic,aiu-gxl', 'amlogic,aiu-meson8', 'amlogic,aiu-meson8b') : 264,	
-	('amlogic,axg-frddr', 'amlogic,g12a-frddr', 'amlogic,sm1-frddr') : 254,	
-	('amlogic,g12a-toacodec',) : 163,	
-	('amlogic,axg-tdm-iface',) : 364,	
-	('amlogic,axg-pdm',) : 434,	
-	('amlogic,axg-sound-card',) : 231,	
-	('st,stm32h7-dfsdm-dai',) : 257,	
-	('st,stm32f4-sai', 'st,stm32h7-sai') : 188,	
-	('brcm,cygnus-audio',) : 945,	
-	('marvell,a370db-audio',) : 105,	
-	('cdns,xtfpga-i2s',) : 414,	
-	('stericsson,snd-soc-mop500',) : 106,	
-	('audio-graph-card', 'audio-graph-scu-card') : 448,	
-	('marvell,kirkwood-audio', 'marvell,dove-audio', 'marvell,armada370-audio') : 440,	
-	('samsung,s3c6410-i2s', 'samsung,s5pv210-i2s', 'samsung,exynos5420-i2s', 'samsung,exynos7-i2s', 'samsung,exynos7-i2s1') : 1144,	
-	('simple-audio-card', 'simple-scu-audio-card') : 429,	
-	('allwinner,sun4i-a10-spdif', 'allwinner,sun6i-a31-spdif', 'allwinner,sun8i-h3-spdif', 'allwinner,sun50i-h6-spdif') : 442,	
-	('st,stm32h7-spdifrx',) : 710,	
-	('st,stm32h7-i2s',) : 699,	
-	('allwinner,sun50i-a64-codec-analog',) : 341,	
-	('ti,omap-twl4030',) : 217,	
-	('ti,abe-twl6040',) : 234,	
-	('ingenic,jz4740-i2s', 'ingenic,jz4760-i2s', 'ingenic,jz4770-i2s', 'ingenic,jz4780-i2s') : 399,	
-	('allwinner,sun8i-a23-codec-analog', 'allwinner,sun8i-h3-codec-analog', 'allwinner,sun8i-v3s-codec-analog') : 563,	
-	('stericsson,ux500-msp-i2s',) : 585,	
-	('adi,adau7118',) : 22,	
-	('linux,spdif-dir',) : 52,	
-	('ti,da830-evm-audio',) : 354,	
-	('ti,da850-mcbsp',) : 486,	
-	('st,stm32-sai-sub-a', 'st,stm32-sai-sub-b') : 1078,	
-	('ti,omap4-dmic',) : 347,	
-	('nokia,n900-audio',) : 310,	
-	('ti,omap4-mcpdm',) : 367,	
-	('allwinner,sun8i-a33-codec', 'allwinner,sun50i-a64-codec') : 893,	
-	('ti,tas5720', 'ti,tas5722') : 455,	
-	('rohm,bd28623',) : 151,	
-	('allwinner,sun4i-a10-i2s', 'allwinner,sun6i-a31-i2s', 'allwinner,sun8i-a83t-i2s', 'allwinner,sun8i-h3-i2s', 'allwinner,sun50i-a64-codec-i2s', 'allwinner,sun50i-h6-i2s') : 1120,	
-	('st,tda7419',) : 467,	
-	('ti,tlv320aic32x4', 'ti,tlv320aic32x6') : 36,	
-	('cirrus,cs4270',) : 392,	
-	('adi,ssm2305',) : 62,	
-	('ti,j721e-cpb-audio', 'ti,j721e-cpb-ivi-audio', 'ti,j7200-cpb-audio') : 649,	
-	('wlf,wm8782',) : 91,	
-	('allwinner,sun4i-a10-codec', 'allwinner,sun6i-a31-codec', 'allwinner,sun7i-a20-codec', 'allwinner,sun8i-a23-codec', 'allwinner,sun8i-h3-codec', 'allwinner,sun8i-v3s-codec') : 1257,	
-	('invensense,ics43432',) : 45,	
-	('ti,omap2420-mcbsp', 'ti,omap2430-mcbsp', 'ti,omap3-mcbsp', 'ti,omap4-mcbsp') : 914,	
-	('ti,tas2764',) : 504,	
-	('everest,es7134', 'everest,es7144', 'everest,es7154') : 205,	
-	('mediatek,mt6351-sound',) : 996,	
-	('nxp,tfa9879',) : 243,	
-	('ti,pcm1681',) : 236,	
-	('cirrus,cs42l56',) : 954,	
-	('wlf,wm8804',) : 42,	
-	('ingenic,jz4725b-codec',) : 423,	
-	('wlf,wm8731',) : 561,	
-	('realtek,alc5623',) : 733,	
-	('ti,pcm3060',) : 35,	
-	('ti,tas2562', 'ti,tas2563', 'ti,tas2564', 'ti,tas2110') : 608,	
-	('wlf,wm8510',) : 501,	
-	('dmic-codec',) : 127,	
-	('cirrus,cs42l52',) : 825,	
-	('mscc,zl38060',) : 421,	
-	('ti,dm646x-mcasp-audio', 'ti,da830-mcasp-audio', 'ti,am33xx-mcasp-audio', 'ti,dra7-mcasp-audio') : 1578,	
-	('everest,es7241',) : 207,	
-	('ti,tlv320adc3140', 'ti,tlv320adc5140', 'ti,tlv320adc6140') : 783,	
-	('ti,pcm1862', 'ti,pcm1863', 'ti,pcm1864', 'ti,pcm1865') : 36,	
-	('wlf,wm8753',) : 1049,	
-	('realtek,rt1015',) : 993,	
-	('adi,adau7002',) : 89,	
-	('rockchip,rk3036-codec',) : 347,	
-	('wlf,wm8903',) : 1497,	
-	('wlf,wm8750', 'wlf,wm8987') : 543,	
-	('qcom,sm8250-lpass-wsa-macro',) : 1865,	
-	('realtek,rt5668b',) : 1993,	
-	('rockchip,rk3328-codec',) : 371,	
-	('realtek,rt5660',) : 970,	
-	('wlf,wm8523',) : 365,	
-	('realtek,rt5631', 'realtek,alc5631') : 1177,	
-	('wlf,wm8728',) : 230,	
-	('adi,ssm2518',) : 610,	
-	('nxp,uda1334',) : 189,	
-	('cirrus,lochnagar2-soundcard',) : 171,	
-	('wlf,wm8741',) : 489,	
-	('realtek,rt5514',) : 336,	
-	('tempo,tscs42A1', 'tempo,tscs42A2') : 1092,	
-	('wlf,wm8770',) : 476,	
-	('wlf,wm8960',) : 973,	
-	('wlf,wm8776',) : 387,	
-	('maxim,max98088', 'maxim,max98089') : 1234,	
-	('nuvoton,nau8824',) : 1394,	
-	('adi,adau1361', 'adi,adau1461', 'adi,adau1761', 'adi,adau1961') : 43,	
-	('ti,pcm1789',) : 38,	
-	('st,sta32x',) : 817,	
-	('ti,pcm3168a',) : 32,	
-	('asahi-kasei,ak5558',) : 290,	
-	('maxim,max98371',) : 338,	
-	('ti,pcm1792a',) : 30,	
-	('dlg,da7212', 'dlg,da7213') : 1392,	
-	('ti,ts3a227e',) : 258,	
-	('realtek,rt5616',) : 1058,	
-	('asahi-kasei,ak4458', 'asahi-kasei,ak4497') : 560,	
-	('maxim,max9860',) : 502,	
-	('maxim,max98390',) : 771,	
-	('nuvoton,nau8540',) : 618,	
-	('maxim,max9867',) : 474,	
-	('dlg,da9055-codec',) : 1010,	
-	('wlf,wm8978',) : 686,	
-	('wlf,wm8711',) : 333,	
-	('asahi-kasei,ak5386',) : 0,	
-	('ti,tas5086',) : 598,	
-	('cirrus,cs35l35',) : 1273,	
-	('qcom,pm8916-wcd-analog-codec',) : 968,	
-	('cirrus,cs35l32',) : 397,	
-	('ingenic,jz4770-codec',) : 628,	
-	('tempo,tscs454',) : 2404,	
-	('realtek,rt1015p',) : 99,	
-	('ti,ads1174', 'ti,ads1178') : 65,	
-	('option,gtm601', 'broadmobi,bm818') : 72,	
-	('realtek,alc5632',) : 776,	
-	('cirrus,cs4271',) : 500,	
-	('maxim,max98373',) : 487,	
-	('dlg,da7219',) : 1843,	
-	('cirrus,cs53l30',) : 771,	
-	('ti,pcm5121', 'ti,pcm5122', 'ti,pcm5141', 'ti,pcm5142') : 35,	
-	('realtek,rt5665', 'realtek,rt5666') : 3416,	
-	('wlf,wm8737',) : 480,	
-	('asahi-kasei,ak4554',) : 52,	
-	('adi,adau1381', 'adi,adau1781') : 47,	
-	('cirrus,cs42448', 'cirrus,cs42888') : 471,	
-	('ti,tlv320aic310x', 'ti,tlv320aic311x', 'ti,tlv320aic3100', 'ti,tlv320aic3110', 'ti,tlv320aic3120', 'ti,tlv320aic3111', 'ti,tlv320dac3100', 'ti,tlv320dac3101') : 1173,	
-	('ti,tas6424',) : 534,	
-	('cirrus,cs35l36',) : 1512,	
-	('maxim,max9759',) : 131,	
-	('maxim,max98925',) : 481,	
-	('google,cros-ec-codec',) : 741,	
-	('qcom,msm8916-wcd-digital-codec',) : 895,	
-	('linux,spdif-dit',) : 53,	
-	('realtek,rt274',) : 934,	
-	('asahi-kasei,ak4642', 'asahi-kasei,ak4643', 'asahi-kasei,ak4648') : 0,	
-	('realtek,rt1016',) : 522,	
-	('st,sta529',) : 292,	
-	('adi,ssm2602',) : 20,	
-	('cirrus,cs4341a',) : 244,	
-	('mediatek,mt6660',) : 416,	
-	('simple-audio-mux',) : 74,	
-	('adi,ssm4567',) : 377,	
-	('dioo,dio2125', 'simple-audio-amplifier') : 77,	
-	('st,stih407-sas-codec',) : 289,	
-	('realtek,rt5639', 'realtek,rt5640') : 1956,	
-	('maxim,max98926',) : 440,	
-	('maxim,max98504',) : 265,	
-	('delta,dfbmcs320', 'linux,bt-sco') : 73,	
-	('realtek,rt5682i',) : 224,	
-	('cirrus,cs43130', 'cirrus,cs4399', 'cirrus,cs43131', 'cirrus,cs43198') : 2025,	
-	('ti,tpa6130a2', 'ti,tpa6140a2') : 220,	
-	('nuvoton,nau8810', 'nuvoton,nau8812', 'nuvoton,nau8814') : 672,	
-	('wlf,wm8974',) : 501,	
-	('maxim,max98090', 'maxim,max98091') : 1820,	
-	('zte,zx-aud96p22',) : 254,	
-	('cirrus,cs4265',) : 465,	
-	('ingenic,jz4740-codec',) : 259,	
-	('ti,pcm5102a',) : 33,	
-	('sirf,prima2-audio-codec', 'sirf,atlas6-audio-codec') : 409,	
-	('nuvoton,nau8822',) : 818,	
-	('wlf,wm8524',) : 162,	
-	('cirrus,cs42l42',) : 1549,	
-	('cirrus,cs42l73',) : 972,	
-	('cirrus,cs4234',) : 656,	
-	('qcom,sm8250-lpass-va-macro',) : 1145,	
-	('mediatek,mt6358-sound',) : 1535,	
-	('cirrus,cs4349',) : 258,	
-	('asahi-kasei,ak4104',) : 238,	
-	('maxim,max98357a', 'maxim,max98360a') : 131,	
-	('cirrus,cs35l33',) : 926,	
-	('ti,tas5707', 'ti,tas5711', 'ti,tas5717', 'ti,tas5719', 'ti,tas5721') : 652,	
-	('nuvoton,nau8315',) : 112,	
-	('maxim,max98927',) : 736,	
-	('nxp,uda1380',) : 505,	
-	('asahi-kasei,ak4118',) : 303,	
-	('realtek,rt1308',) : 686,	
-	('ti,tas2552',) : 543,	
-	('realtek,rt1011',) : 2038,	
-	('ti,tlv320aic23',) : 31,	
-	('everest,es8328', 'everest,es8388') : 27,	
-	('maxim,max98095',) : 1477,	
-	('adi,ssm2602', 'adi,ssm2603', 'adi,ssm2604') : 29,	
-	('everest,es8328',) : 20,	
-	('realtek,rt5651',) : 1599,	
-	('cirrus,cs35l34',) : 911,	
-	('ti,tlv320aic3x', 'ti,tlv320aic33', 'ti,tlv320aic3007', 'ti,tlv320aic3106', 'ti,tlv320aic3104') : 1161,	
-	('adi,adau1977', 'adi,adau1978', 'adi,adau1979') : 45,	
-	('adi,adau1701',) : 648,	
-	('wlf,wm8580', 'wlf,wm8581') : 755,	
-	('cirrus,cs42l51',) : 585,	
-	('everest,es8316',) : 560,	
-	('asahi-kasei,ak4613',) : 447,	
-	('nvidia,tegra-audio-rt5640',) : 142,	
-	('ti,tas2770',) : 542,	
-	('nvidia,tegra-audio-wm8903',) : 253,	
-	('intel,keembay-i2s', 'intel,keembay-tdm') : 496,	
-	('nvidia,tegra210-dmic',) : 309,	
-	('nvidia,tegra-audio-wm9712',) : 106,	
-	('nvidia,tegra20-das',) : 137,	
-	('fsl,sgtl5000',) : 1119,	
-	('nvidia,tegra210-admaif', 'nvidia,tegra186-admaif') : 611,	
-	('st,sta350',) : 899,	
-	('nvidia,tegra186-dspk',) : 297,	
-	('realtek,rt1305', 'realtek,rt1306') : 929,	
-	('nvidia,tegra20-ac97',) : 297,	
-	('nvidia,tegra210-ahub', 'nvidia,tegra186-ahub') : 491,	
-	('nvidia,tegra-audio-sgtl5000',) : 140,	
-	('nvidia,tegra-audio-rt5677',) : 217,	
-	('nvidia,tegra20-i2s',) : 309,	
-	('nvidia,tegra-audio-trimslice',) : 109,	
-	('nvidia,tegra-audio-alc5632',) : 169,	
-	('nvidia,tegra210-i2s',) : 556,	
-	('wlf,wm8904', 'wlf,wm8912') : 1598,	
-	('realtek,rt5677',) : 3662,	
-	('nvidia,tegra-audio-max98090',) : 185,	
-	('dlg,da7217', 'dlg,da7218') : 2426,	
-	('nvidia,tegra124-i2s', 'nvidia,tegra30-i2s') : 425,	
-	('renesas,rcar_sound-gen1', 'renesas,rcar_sound-gen2', 'renesas,rcar_sound-gen3', 'renesas,rcar_sound-r8a77990') : 1056,	
-	('nvidia,tegra-audio-wm8753',) : 118,	
-	('realtek,rt5645', 'realtek,rt5650') : 2891,	
-	('renesas,sh_fsi', 'renesas,sh_fsi2') : 1239,	
-	('nvidia,tegra124-ahub', 'nvidia,tegra114-ahub', 'nvidia,tegra30-ahub') : 520,	
-	('wlf,wm8962',) : 2960,	
-	('mediatek,mt8173-max98090',) : 139,	
-	('mediatek,mt8173-rt5650-rt5514',) : 171,	
-	('sprd,pcm-platform',) : 379,	
-	('mediatek,mt8173-rt5650',) : 247,	
-	('mediatek,mt8173-rt5650-rt5676',) : 225,	
-	('mediatek,mt6797-mt6351-sound',) : 187,	
-	('mediatek,mt2701-wm8960-machine',) : 117,	
-	('realtek,rt5658', 'realtek,rt5659') : 3232,	
-	('nuvoton,nau8825',) : 1682,	
-	('sprd,sc9860-mcdt',) : 642,	
-	('mediatek,mt8183_da7219_max98357', 'mediatek,mt8183_da7219_rt1015', 'mediatek,mt8183_da7219_rt1015p') : 593,	
-	('mediatek,mt8183_mt6358_ts3a227_max98357', 'mediatek,mt8183_mt6358_ts3a227_max98357b', 'mediatek,mt8183_mt6358_ts3a227_rt1015') : 538,	
-	('mediatek,mt2701-cs42448-machine',) : 321,	
-	('rockchip,rk3066-spdif', 'rockchip,rk3188-spdif', 'rockchip,rk3228-spdif', 'rockchip,rk3288-spdif', 'rockchip,rk3328-spdif', 'rockchip,rk3366-spdif', 'rockchip,rk3368-spdif', 'rockchip,rk3399-spdif') : 269,	
-	('fsl,imx-audio-spdif',) : 69,	
-	('rockchip,rockchip-audio-rt5645',) : 166,	
-	('rockchip,rockchip-audio-max98090',) : 306,	
-	('rockchip,rk3288-hdmi-analog',) : 187,	
-	('fsl,imx8mp-aud2htx',) : 216,	
-	('rockchip,pdm', 'rockchip,px30-pdm', 'rockchip,rk1808-pdm', 'rockchip,rk3308-pdm') : 453,	
-	('mediatek,mt8173-afe-pcm',) : 880,	
-	('rockchip,rk3399-cdn-dp', 'dlg,da7219', 'dmic-codec', 'maxim,max98357a', 'realtek,rt5514', 'realtek,rt5514', 'rockchip,rk3399-gru-sound') : 411,	
-	('realtek,rt5663',) : 3058,	
-	('mediatek,mt6797-audio',) : 673,	
-	('rockchip,rk3066-i2s', 'rockchip,rk3188-i2s', 'rockchip,rk3288-i2s', 'rockchip,rk3399-i2s') : 519,	
-	('fsl,mpc5200-psc-i2s', 'fsl,mpc5200b-psc-i2s') : 114,	
-	('mediatek,mt8183-audio',) : 1000,	
-	('fsl,imx21-audmux', 'fsl,imx31-audmux') : 246,	
-	('mediatek,mtk-btcvsd-snd',) : 957,	
-	('eukrea,asoc-tlv320',) : 149,	
-	('mediatek,mt8192_mt6359_rt1015_rt5682', 'mediatek,mt8192_mt6359_rt1015p_rt5682') : 867,	
-	('fsl,mpc5200-psc-ac97', 'fsl,mpc5200b-psc-ac97') : 199,	
-	('fsl,ssi-dma-channel',) : 436,	
-	('fsl,imx-audio-hdmi', 'fsl,imx-audio-sii902x') : 164,	
-	('fsl,imx-audio-es8328',) : 168,	
-	('phytec,pcm030-audio-fabric',) : 86,	
-	('fsl,imx-audio-sgtl5000',) : 161,	
-	('mediatek,mt2701-audio', 'mediatek,mt7622-audio') : 1070,	
-	('fsl,imx35-esai', 'fsl,vf610-esai', 'fsl,imx6ull-esai') : 779,	
-	('fsl,imx8mm-micfil',) : 556,	
-	('fsl,imx-audio-ac97', 'fsl,imx-audio-cs42888', 'fsl,imx-audio-cs427x', 'fsl,imx-audio-tlv320aic32x4', 'fsl,imx-audio-sgtl5000', 'fsl,imx-audio-wm8962', 'fsl,imx-audio-wm8960', 'fsl,imx-audio-mqs', 'fsl,imx-audio-wm8524', 'fsl,imx-audio-si476x') : 596,	
-	('fsl,imx8qm-mqs', 'fsl,imx6sx-mqs') : 233,	
-	('fsl,imx8qm-audmix',) : 397,	
-	('marvell,pxa250-ac97', 'marvell,pxa270-ac97', 'marvell,pxa300-ac97') : 195,	
-	('xlnx,i2s-transmitter-1.0', 'xlnx,i2s-receiver-1.0') : 123,	
-	('fsl,imx35-asrc', 'fsl,imx53-asrc', 'fsl,imx8qm-asrc', 'fsl,imx8qxp-asrc') : 818,	
-	('marvell,mmp-sspa',) : 382,	
-	('xlnx,spdif-2.0',) : 240,	
-	('fsl,mpc8610-ssi', 'fsl,imx51-ssi', 'fsl,imx35-ssi', 'fsl,imx21-ssi') : 935,	
-	('mediatek,mt8192-audio',) : 1938,	
-	('qcom,q6afe-clocks',) : 198,	
-	('google,sc7180-trogdor', 'google,sc7180-coachz') : 271,	
-	('xlnx,audio-formatter-1.0',) : 497,	
-	('mrvl,pxa-ssp-dai',) : 579,	
-	('qcom,q6core',) : 257,	
-	('qcom,apq8016-sbc-sndcard',) : 131,	
-	('fsl,imx35-spdif', 'fsl,vf610-spdif', 'fsl,imx6sx-spdif', 'fsl,imx8qm-spdif') : 983,	
-	('snps,designware-i2s',) : 506,	
-	('fsl,imx8mp-xcvr',) : 940,	
-	('qcom,lpass-cpu',) : 128,	
-	('fsl,vf610-sai', 'fsl,imx6sx-sai', 'fsl,imx6ul-sai', 'fsl,imx7ulp-sai', 'fsl,imx8mq-sai', 'fsl,imx8qm-sai') : 872,	
-	('qcom,sm8250-sndcard', 'qcom,qrb5165-rb5-sndcard') : 151,	
-	('qcom,q6adm-routing',) : 934,	
-	('qcom,apq8096-sndcard',) : 95,	
-	('qcom,sc7180-lpass-cpu',) : 223,	
-	('google,storm-audio',) : 88,	
-	('qcom,q6adm',) : 436,	
-	('qcom,lpass-cpu-apq8016',) : 229,	
-	('qcom,sdm845-sndcard', 'qcom,db845c-sndcard', 'lenovo,yoga-c630-sndcard') : 422,	
-	('raspberrypi,firmware-ts',) : 153,	
-	('ti,tsc2004',) : 46,	
-	('zinitix,bt541',) : 376,	
-	('ti,tsc2005',) : 57,	
-	('fsl,imx8mn-easrc',) : 1400,	
-	('silead,gsl1680', 'silead,gsl1688', 'silead,gsl3670', 'silead,gsl3675', 'silead,gsl3692') : 432,	
-	('fsl,imx25-tcq',) : 376,	
-	('resistive-adc-touch',) : 118,	
-	('qcom,q6afe',) : 1357,	
-	('semtech,sx8650', 'semtech,sx8654', 'semtech,sx8655', 'semtech,sx8656') : 302,	
-	('qcom,q6asm-dais',) : 1021,	
-	('maxim,max11801',) : 138,	
-	('adi,ad7879',) : 42,	
-	('nxp,lpc3220-tsc',) : 253,	
-	('neonode,zforce',) : 577,	
-	('sis,9200-ts',) : 249,	
-	('qcom,q6asm',) : 1221,	
-	('adi,ad7879-1',) : 45,	
-	('brcm,iproc-touchscreen',) : 321,	
-	('qcom,q6afe-dais',) : 1419,	
-	('raydium,rm32380',) : 799,	
-	('elan,ektf2127', 'elan,ektf2132') : 230,	
-	('toradex,vf50-touchscreen',) : 222,	
-	('st,stmfts',) : 522,	
-	('ti,tsc2046', 'ti,ads7843', 'ti,ads7845', 'ti,ads7846', 'ti,ads7873') : 856,	
-	('samsung,s6sy761',) : 354,	
-	('melfas,',) : 1063,	
-	('technologic,ts4800-ts',) : 141,	
-	('ti,am3359-tsc',) : 370,	
-	('st,stmpe-ts',) : 222,	
-	('azoteq,iqs550', 'azoteq,iqs572', 'azoteq,iqs525') : 732,	
-	('allwinner,sun4i-a10-ts', 'allwinner,sun5i-a13-ts', 'allwinner,sun6i-a31-ts') : 120,	
-	('zeitec,zet6223',) : 168,	
-	('fsl,imx6ul-tsc',) : 376,	
-	('eeti,egalax_ts',) : 169,	
-	('pixcir,pixcir_ts', 'pixcir,pixcir_tangoc') : 383,	
-	('microchip,ar1021-i2c',) : 122,	
-	('melfas,mms114', 'melfas,mms152', 'melfas,mms345l') : 418,	
-	('sitronix,st1232', 'sitronix,st1633') : 258,	
-	('rohm,bu21029',) : 243,	
-	('chipone,icn8318',) : 173,	
-	('cypress,cy8ctma140',) : 210,	
-	('SUNW,CS4231',) : 1446,	
-	('elan,ekth3500',) : 966,	
-	('eeti,exc3000', 'eeti,exc80h60', 'eeti,exc80h84') : 282,	
-	('eeti,exc3000-i2c',) : 167,	
-	('xlnx,xps-ps2-1.00.a',) : 189,	
-	('adc-joystick',) : 175,	
-	('olpc,ap-sp',) : 162,	
-	('syna,rmi4-i2c',) : 238,	
-	('ti,tsc2007',) : 255,	
-	('allwinner,sun4i-a10-ps2',) : 218,	
-	('ALTR,ps2-1.0', 'altr,ps2-1.0') : 89,	
-	('auo,auo_pixcir_ts',) : 426,	
-	('gpio-mouse',) : 109,	
-	('snps,arc_ps2',) : 177,	
-	('ilitek,ili210x', 'ilitek,ili2117', 'ilitek,ili2120', 'ilitek,ili251x') : 349,	
-	('hideep,hideep-ts',) : 735,	
-	('ettus,e3x0-button',) : 84,	
-	('syna,rmi4-spi',) : 352,	
-	('zii,rave-sp-pwrbutton',) : 58,	
-	('ti,tps65217-pwrbutton', 'ti,tps65218-pwrbutton') : 106,	
-	('ps2-gpio',) : 302,	
-	('maxim,max77650-onkey',) : 85,	
-	('goodix,gt1151', 'goodix,gt5663', 'goodix,gt5688', 'goodix,gt911', 'goodix,gt9110', 'goodix,gt912', 'goodix,gt9147', 'goodix,gt917s', 'goodix,gt927', 'goodix,gt9271', 'goodix,gt928', 'goodix,gt9286', 'goodix,gt967') : 877,	
-	('synaptics,synaptics_i2c',) : 386,	
-	('st,stpmic1-onkey',) : 122,	
-	('stericsson,ab8500-ponkey',) : 81,	
-	('ti,palmas-pwrbutton',) : 171,	
-	('dlg,da9063-onkey', 'dlg,da9062-onkey') : 193,	
-	('motorola,cpcap-pwrbutton',) : 71,	
-	('sirf,prima2-pwrc',) : 124,	
-	('ti,drv2667',) : 335,	
-	('ti,twl4030-pwrbutton',) : 64,	
-	('atmel,captouch',) : 168,	
-	('edt,edt-ft5206', 'edt,edt-ft5306', 'edt,edt-ft5406', 'edt,edt-ft5506', 'evervision,ev-ft5726', 'focaltech,ft6236') : 951,	
-	('gpio-decoder',) : 83,	
-	('fsl,mma8450',) : 126,	
-	('gpio-vibrator',) : 125,	
-	('ti,drv2665',) : 200,	
-	('qcom,pm8058-pwrkey', 'qcom,pm8921-pwrkey') : 298,	
-	('qcom,pm8941-pwrkey', 'qcom,pm8941-resin') : 219,	
-	('sprd,sc2721-vibrator', 'sprd,sc2730-vibrator', 'sprd,sc2731-vibrator') : 134,	
-	('SUNW,bbc-beep', 'SUNW,smbus-beep') : 228,	
-	('dell,wyse-ariel-ec-input',) : 109,	
-	('pwm-beeper',) : 165,	
-	('atmel,maxtouch', 'atmel,qt602240_ts', 'atmel,atmel_mxt_ts', 'atmel,atmel_mxt_tp', 'atmel,mXT224') : 2149,	
-	('regulator-haptic',) : 165,	
-	('rotary-encoder',) : 234,	
-	('dlg,da7280',) : 913,	
-	('cypress,cyapa',) : 878,	
-	('elan,ekth3000',) : 951,	
-	('ti,drv2604', 'ti,drv2604l', 'ti,drv2605', 'ti,drv2605l') : 470,	
-	('adi,adxl345', 'adi,adxl34x') : 94,	
-	('pwm-vibrator',) : 173,	
-	('fsl,sec-v4.0-pwrkey',) : 138,	
-	('qcom,pm8058-vib', 'qcom,pm8921-vib', 'qcom,pm8916-vib') : 151,	
-	('dlink,dir685-touchkeys',) : 102,	
-	('adc-keys',) : 138,	
-	('st,spear300-kbd',) : 252,	
-	('google,goldfish-events-keypad',) : 138,	
-	('ti,tca8418',) : 240,	
-	('brcm,bcm-keypad',) : 275,	
-	('fsl,imx21-kpp',) : 330,	
-	('ti,twl4030-keypad',) : 253,	
-	('microchip,qt1050',) : 393,	
-	('fsl,imx-sc-key',) : 125,	
-	('qcom,pm8058-keypad', 'qcom,pm8921-keypad') : 418,	
-	('st,sti-keyscan',) : 172,	
-	('nxp,lpc3220-key',) : 210,	
-	('marvell,pxa27x-keypad',) : 519,	
-	('fsl,mpr121-touchkey',) : 262,	
-	('allwinner,sun4i-a10-lradc-keys', 'allwinner,sun8i-a83t-r-lradc') : 196,	
-	('cirrus,ep7209-keypad',) : 123,	
-	('azoteq,iqs269a',) : 1216,	
-	('gpio-keys-polled',) : 250,	
-	('mediatek,mt6397-keys', 'mediatek,mt6323-keys') : 231,	
-	('qt1070',) : 169,	
-	('gpio-keys',) : 590,	
-	('gpio-matrix-keypad',) : 368,	
-	('cypress,tm2-touchkey', 'cypress,midas-touchkey', 'cypress,aries-touchkey', 'coreriver,tc360-touchkey') : 243,	
-	('ti,nspire-keypad',) : 177,	
-	('ti,omap4-keypad',) : 293,	
-	('st,spear1310-miphy',) : 179,	
-	('ingenic,jz4770-phy', 'ingenic,jz4775-phy', 'ingenic,jz4780-phy', 'ingenic,x1000-phy', 'ingenic,x1830-phy', 'ingenic,x2000-phy') : 0,	
-	('st,stih407-usb2-phy',) : 106,	
-	('samsung,s3c6410-keypad', 'samsung,s5pv210-keypad') : 391,	
-	('st,spear1340-miphy',) : 188,	
-	('microchip,cap1106', 'microchip,cap1126', 'microchip,cap1188') : 347,	
-	('google,cros-ec-keyb',) : 350,	
-	('nvidia,tegra114-kbc', 'nvidia,tegra30-kbc', 'nvidia,tegra20-kbc') : 508,	
-	('hisilicon,hi6220-usb-phy',) : 110,	
-	('samsung,exynos5433-pcie-phy',) : 126,	
-	('hisilicon,hix5hd2-sata-phy',) : 136,	
-	('hisilicon,hi3660-usb-phy',) : 150,	
-	('hisilicon,inno-usb2-phy', 'hisilicon,hi3798cv200-usb2-phy') : 122,	
-	('intel,lgm-usb-phy',) : 184,	
-	('st,stm32mp1-usbphyc',) : 287,	
-	('samsung,exynos5250-sata-phy',) : 167,	
-	('mscc,vsc7514-serdes',) : 390,	
-	('samsung,exynos7-ufs-phy',) : 237,	
-	('hisilicon,hi3798cv200-combphy',) : 187,	
-	('samsung,s5pv210-mipi-video-phy', 'samsung,exynos5420-mipi-video-phy', 'samsung,exynos5433-mipi-video-phy') : 256,	
-	('samsung,exynos3250-usb2-phy', 'samsung,exynos4210-usb2-phy', 'samsung,exynos4x12-usb2-phy', 'samsung,exynos5250-usb2-phy', 'samsung,exynos5420-usb2-phy', 'samsung,s5pv210-usb2-phy') : 179,	
-	('motorola,mapphone-mdm6600',) : 387,	
-	('motorola,cpcap-usb-phy', 'motorola,mapphone-cpcap-usb-phy') : 476,	
-	('samsung,exynos5250-dp-video-phy', 'samsung,exynos5420-dp-video-phy') : 69,	
-	('st,miphy28lp-phy',) : 811,	
-	('nxp,lpc1850-usb-otg-phy',) : 87,	
-	('samsung,exynos5250-usbdrd-phy', 'samsung,exynos5420-usbdrd-phy', 'samsung,exynos5433-usbdrd-phy', 'samsung,exynos7-usbdrd-phy') : 589,	
-	('img,pistachio-usb-phy',) : 140,	
-	('ti,dm8168-usb-phy',) : 173,	
-	('ti,da830-usb-phy',) : 157,	
-	('allwinner,sun50i-h6-usb3-phy',) : 114,	
-	('ti,omap-usb2', 'ti,omap5-usb2', 'ti,dra7x-usb2', 'ti,dra7x-usb2-phy2', 'ti,am437x-usb2', 'ti,am654-usb2') : 321,	
-	('ti,control-phy-otghs', 'ti,control-phy-usb2', 'ti,control-phy-pipe3', 'ti,control-phy-pcie', 'ti,control-phy-usb2-dra7', 'ti,control-phy-usb2-am437') : 203,	
-	('lantiq,ase-usb2-phy', 'lantiq,danube-usb2-phy', 'lantiq,xrx100-usb2-phy', 'lantiq,xrx200-usb2-phy', 'lantiq,xrx300-usb2-phy') : 157,	
-	('lantiq,vrx200-pcie-phy', 'lantiq,arx300-pcie-phy') : 315,	
-	('allwinner,sun9i-a80-usb-phy',) : 122,	
-	('fsl,imx8mq-usb-phy', 'fsl,imx8mp-usb-phy') : 136,	
-	('marvell,mvebu-sata-phy',) : 77,	
-	('allwinner,sun6i-a31-mipi-dphy',) : 221,	
-	('ralink,rt3352-usbphy', 'mediatek,mt7620-usbphy', 'mediatek,mt7628-usbphy') : 153,	
-	('ti,twl4030-usb',) : 515,	
-	('marvell,armada-380-comphy',) : 175,	
-	('marvell,mmp3-hsic-phy',) : 52,	
-	('marvell,pxa1928-hsic-phy',) : 125,	
-	('marvell,berlin2-usb-phy', 'marvell,berlin2cd-usb-phy') : 147,	
-	('marvell,pxa1928-usb-phy',) : 217,	
-	('mediatek,mt7621-pci-phy',) : 211,	
-	('marvell,mmp2-usb-phy', 'marvell,pxa910-usb-phy', 'marvell,pxa168-usb-phy') : 218,	
-	('ti,phy-am654-serdes',) : 587,	
-	('ti,phy-usb3', 'ti,omap-usb3', 'ti,phy-pipe3-sata', 'ti,phy-pipe3-pcie') : 648,	
-	('marvell,armada-375-usb-cluster',) : 82,	
-	('marvell,a3700-utmi-otg-phy', 'marvell,a3700-utmi-host-phy') : 158,	
-	('ti,j721e-wiz-16g', 'ti,j721e-wiz-10g') : 687,	
-	('fsl,imx8mq-mipi-dphy',) : 342,	
-	('marvell,berlin2-sata-phy', 'marvell,berlin2q-sata-phy') : 188,	
-	('marvell,mmp3-usb-phy',) : 185,	
-	('allwinner,sun4i-a10-usb-phy', 'allwinner,sun5i-a13-usb-phy', 'allwinner,sun6i-a31-usb-phy', 'allwinner,sun7i-a20-usb-phy', 'allwinner,sun8i-a23-usb-phy', 'allwinner,sun8i-a33-usb-phy', 'allwinner,sun8i-a83t-usb-phy', 'allwinner,sun8i-h3-usb-phy', 'allwinner,sun8i-r40-usb-phy', 'allwinner,sun8i-v3s-usb-phy', 'allwinner,sun50i-a64-usb-phy', 'allwinner,sun50i-h6-usb-phy') : 665,	
-	('marvell,comphy-a3700',) : 236,	
-	('qcom,usb-hs-phy',) : 212,	
-	('qcom,usb-hsic-phy',) : 107,	
-	('qca,ar7100-usb-phy',) : 64,	
-	('qcom,usb-hs-ipq4019-phy', 'qcom,usb-ss-ipq4019-phy') : 87,	
-	('qcom,usb-hs-28nm-femtophy',) : 262,	
-	('qcom,ipq806x-sata-phy',) : 134,	
-	('qcom,apq8064-sata-phy',) : 187,	
-	('qcom,ipq806x-usb-phy-hs', 'qcom,ipq806x-usb-phy-ss') : 347,	
-	('qcom,usb-ss-28nm-phy',) : 160,	
-	('apm,xgene-phy',) : 1263,	
-	('brcm,bcm6318-usbh-phy', 'brcm,bcm6328-usbh-phy', 'brcm,bcm6358-usbh-phy', 'brcm,bcm6362-usbh-phy', 'brcm,bcm6368-usbh-phy', 'brcm,bcm63268-usbh-phy') : 0,	
-	('nvidia,tegra194-p2u',) : 71,	
-	('qcom,pcie2-phy',) : 204,	
-	('intel,keembay-emmc-phy',) : 168,	
-	('intel,keembay-usb-phy',) : 195,	
-	('intel,lgm-emmc-phy',) : 155,	
-	('brcm,ns-usb2-phy',) : 83,	
-	('brcm,kona-usb2-phy',) : 87,	
-	('marvell,comphy-cp110',) : 810,	
-	('brcm,ns-ax-usb3-phy', 'brcm,ns-bx-usb3-phy') : 137,	
-	('brcm,cygnus-pcie-phy',) : 128,	
-	('brcm,sr-pcie-phy',) : 160,	
-	('intel,combo-phy', 'intel,combophy-lgm') : 407,	
-	('brcm,sr-usb-combo-phy', 'brcm,sr-usb-hs-phy') : 220,	
-	('brcm,bcm7216-usb-phy', 'brcm,bcm7211-usb-phy', 'brcm,brcmstb-usb-phy') : 426,	
-	('socionext,uniphier-pxs2-ahci-phy', 'socionext,uniphier-pxs3-ahci-phy') : 217,	
-	('brcm,ns2-pcie-phy',) : 58,	
-	('socionext,uniphier-pro4-usb2-phy', 'socionext,uniphier-ld11-usb2-phy') : 149,	
-	('brcm,ns2-drd-phy',) : 294,	
-	('socionext,uniphier-pro4-usb3-ssphy', 'socionext,uniphier-pro5-usb3-ssphy', 'socionext,uniphier-pxs2-usb3-ssphy', 'socionext,uniphier-ld20-usb3-ssphy', 'socionext,uniphier-pxs3-usb3-ssphy') : 233,	
-	('brcm,iproc-nsp-sata-phy',) : 618,	
-	('mediatek,mt8183-ufsphy',) : 139,	
-	('socionext,uniphier-pro5-pcie-phy', 'socionext,uniphier-ld20-pcie-phy', 'socionext,uniphier-pxs3-pcie-phy') : 200,	
-	('mediatek,mt2701-hdmi-phy', 'mediatek,mt8173-hdmi-phy') : 141,	
-	('socionext,uniphier-pro5-usb3-hsphy', 'socionext,uniphier-pxs2-usb3-hsphy', 'socionext,uniphier-ld20-usb3-hsphy', 'socionext,uniphier-pxs3-usb3-hsphy') : 313,	
-	('mediatek,mt2701-mipi-tx', 'mediatek,mt8173-mipi-tx', 'mediatek,mt8183-mipi-tx') : 154,	
-	('rockchip,rk3288-dp-phy',) : 93,	
-	('rockchip,rk3399-pcie-phy',) : 307,	
-	('rockchip,rk3399-emmc-phy',) : 260,	
-	('rockchip,rk3399-mipi-dphy-rx0',) : 260,	
-	('rockchip,rk3066a-usb-phy', 'rockchip,rk3188-usb-phy', 'rockchip,rk3288-usb-phy') : 377,	
-	('nvidia,tegra124-xusb-padctl', 'nvidia,tegra210-xusb-padctl', 'nvidia,tegra186-xusb-padctl', 'nvidia,tegra194-xusb-padctl') : 869,	
-	('rockchip,px30-dsi-dphy', 'rockchip,rk3128-dsi-dphy', 'rockchip,rk3368-dsi-dphy') : 469,	
-	('mediatek,xsphy',) : 411,	
-	('cdns,dphy',) : 248,	
-	('nxp,salvo-phy',) : 242,	
-	('amlogic,axg-pcie-phy',) : 128,	
-	('amlogic,meson-gxl-usb2-phy',) : 209,	
-	('mediatek,mt2701-u3phy', 'mediatek,mt2712-u3phy', 'mediatek,mt8173-u3phy', 'mediatek,generic-tphy-v1', 'mediatek,generic-tphy-v2') : 867,	
-	('amlogic,axg-mipi-pcie-analog-phy',) : 166,	
-	('cdns,sierra-phy-t0', 'ti,sierra-phy-t0') : 642,	
-	('amlogic,g12a-usb2-phy', 'amlogic,a1-usb2-phy') : 282,	
-	('amlogic,axg-mipi-dphy',) : 200,	
-	('rockchip,rk3399-typec-phy',) : 814,	
-	('renesas,r8a77980-pcie-phy',) : 85,	
-	('apm,xgene-reboot',) : 54,	
-	('amlogic,g12a-usb3-pcie-phy',) : 300,	
-	('amlogic,meson8-usb2-phy', 'amlogic,meson8b-usb2-phy', 'amlogic,meson8m2-usb2-phy', 'amlogic,meson-gxbb-usb2-phy') : 237,	
-	('renesas,rcar-gen3-usb3-phy',) : 140,	
-	('zte,sysctrl',) : 52,	
-	('xlnx,zynqmp-psgtr', 'xlnx,zynqmp-psgtr-v1.1') : 554,	
-	('gpio-poweroff',) : 59,	
-	('renesas,usb-phy-r8a77470', 'renesas,usb-phy-r8a7790', 'renesas,usb-phy-r8a7791', 'renesas,usb-phy-r8a7794', 'renesas,rcar-gen2-usb-phy') : 280,	
-	('rockchip,rk3228-hdmi-phy', 'rockchip,rk3328-hdmi-phy') : 865,	
-	('lsi,axm55xx-reset',) : 54,	
-	('syscon-reboot',) : 63,	
-	('rockchip,px30-usb2phy', 'rockchip,rk3228-usb2phy', 'rockchip,rk3328-usb2phy', 'rockchip,rk3366-usb2phy', 'rockchip,rk3399-usb2phy', 'rockchip,rv1108-usb2phy') : 947,	
-	('st,stih407-restart',) : 63,	
-	('renesas,usb2-phy-r8a77470', 'renesas,usb2-phy-r8a7795', 'renesas,usb2-phy-r8a7796', 'renesas,usb2-phy-r8a77965', 'renesas,rcar-gen3-usb2-phy') : 455,	
-	('syscon-poweroff',) : 57,	
-	('restart-poweroff',) : 32,	
-	('hisilicon,sysctrl',) : 44,	
-	('qcom,pm8916-pon', 'qcom,pms405-pon', 'qcom,pm8998-pon') : 68,	
-	('atmel,sama5d2-shdwc', 'microchip,sam9x60-shdwc', 'atmel,sama5d2-pmc', 'microchip,sam9x60-pmc') : 253,	
-	('ti,keystone-reset',) : 104,	
-	('qcom,pshold',) : 42,	
-	('arm,core-module-integrator', 'arm,core-module-versatile', 'arm,realview-eb-syscon', 'arm,realview-pb1176-syscon', 'arm,realview-pb11mp-syscon', 'arm,realview-pba8-syscon', 'arm,realview-pbx-syscon') : 109,	
-	('mediatek,mt6323-pwrc',) : 57,	
-	('buffalo,ls421d', 'buffalo,ls421de') : 82,	
-	('mscc,jaguar2-chip-reset', 'mscc,luton-chip-reset', 'mscc,ocelot-chip-reset', 'microchip,sparx5-chip-reset') : 101,	
-	('oxsemi,ox820-sys-ctrl',) : 169,	
-	('brcm,bcm21664-resetmgr',) : 34,	
-	('arm,vexpress-reset', 'arm,vexpress-shutdown', 'arm,vexpress-reboot') : 90,	
-	('lltc,ltc2952',) : 142,	
-	('regulator-poweroff',) : 40,	
-	('qnap,power-off', 'synology,power-off') : 76,	
-	('cortina,gemini-power-controller',) : 108,	
-	('atmel,at91sam9260-sdramc', 'atmel,at91sam9g45-ddramc', 'atmel,at91sam9260-rstc', 'atmel,at91sam9g45-rstc', 'atmel,sama5d3-rstc', 'atmel,samx7-rstc', 'microchip,sam9x60-rstc') : 164,	
-	('nvmem-reboot-mode',) : 47,	
-	('syscon-reboot-mode',) : 56,	
-	('brcm,brcmstb-reboot', 'brcm,bcm7038-reboot') : 96,	
-	('renesas,sysc-rmobile',) : 49,	
-	('gpio-restart',) : 89,	
-	('atmel,at91sam9260-shdwc', 'atmel,at91sam9rl-shdwc', 'atmel,at91sam9x5-shdwc') : 146,	
-	('ingenic,jz4740-battery',) : 131,	
-	('maxim,max14656',) : 229,	
-	('sbs,sbs-charger',) : 168,	
-	('ti,bq27200', 'ti,bq27210', 'ti,bq27500', 'ti,bq27510', 'ti,bq27520', 'ti,bq27500-1', 'ti,bq27510g1', 'ti,bq27510g2', 'ti,bq27510g3', 'ti,bq27520g1', 'ti,bq27520g2', 'ti,bq27520g3', 'ti,bq27520g4', 'ti,bq27521', 'ti,bq27530', 'ti,bq27531', 'ti,bq27541', 'ti,bq27542', 'ti,bq27546', 'ti,bq27742', 'ti,bq27545', 'ti,bq27411', 'ti,bq27421', 'ti,bq27425', 'ti,bq27426', 'ti,bq27441', 'ti,bq27621', 'ti,bq27z561', 'ti,bq28z610', 'ti,bq34z100') : 225,	
-	('microchip,ucs1002',) : 0,	
-	('maxim,max14577-charger', 'maxim,max77836-charger') : 419,	
-	('lltc,ltc3651-charger', 'lltc,lt3651-charger') : 145,	
-	('qcom,ipq8074-qmp-usb3-phy', 'qcom,msm8996-qmp-pcie-phy', 'qcom,msm8996-qmp-ufs-phy', 'qcom,msm8996-qmp-usb3-phy', 'qcom,msm8998-qmp-pcie-phy', 'qcom,msm8998-qmp-ufs-phy', 'qcom,ipq8074-qmp-pcie-phy', 'qcom,sc7180-qmp-usb3-phy', 'qcom,sc7180-qmp-usb3-dp-phy', 'qcom,sdm845-qhp-pcie-phy', 'qcom,sdm845-qmp-pcie-phy', 'qcom,sdm845-qmp-usb3-phy', 'qcom,sdm845-qmp-usb3-uni-phy', 'qcom,sdm845-qmp-ufs-phy', 'qcom,msm8998-qmp-usb3-phy', 'qcom,sm8150-qmp-ufs-phy', 'qcom,sm8250-qmp-ufs-phy', 'qcom,sm8150-qmp-usb3-phy', 'qcom,sm8150-qmp-usb3-uni-phy', 'qcom,sm8250-qmp-usb3-phy', 'qcom,sm8250-qmp-usb3-uni-phy', 'qcom,sm8250-qmp-gen3x1-pcie-phy', 'qcom,sm8250-qmp-gen3x2-pcie-phy', 'qcom,sm8250-qmp-modem-pcie-phy', 'qcom,sc7180-qmp-usb3-dp-phy') : 3258,	
-	('sprd,sc2731-charger',) : 352,	
-	('x-powers,axp202-ac-power-supply', 'x-powers,axp221-ac-power-supply', 'x-powers,axp813-ac-power-supply') : 283,	
-	('qcom,pm8941-charger',) : 709,	
-	('maxim,ds2760',) : 520,	
-	('google,goldfish-battery',) : 210,	
-	('mps,mp2629_charger',) : 476,	
-	('ti,bq24735',) : 339,	
-	('ti,tps65090-charger',) : 240,	
-	('cdns,torrent-phy', 'ti,j721e-serdes-10g') : 2812,	
-	('maxim,max17040', 'maxim,max17041', 'maxim,max17043', 'maxim,max77836-battery', 'maxim,max17044', 'maxim,max17048', 'maxim,max17049', 'maxim,max17058', 'maxim,max17059') : 430,	
-	('ti,bq25890', 'ti,bq25892', 'ti,bq25895', 'ti,bq25896') : 744,	
-	('richtek,rt9455',) : 1077,	
-	('maxim,max77650-charger',) : 258,	
-	('olpc,xo1-battery', 'olpc,xo1.5-battery') : 523,	
-	('lltc,ltc2941', 'lltc,ltc2942', 'lltc,ltc2943', 'lltc,ltc2944') : 458,	
-	('x-powers,axp202-usb-power-supply', 'x-powers,axp221-usb-power-supply', 'x-powers,axp223-usb-power-supply', 'x-powers,axp813-usb-power-supply') : 460,	
-	('nxp,isp1704', 'nxp,isp1707') : 307,	
-	('sbs,sbs-battery', 'ti,bq20z65', 'ti,bq20z75') : 869,	
-	('nokia,n900-battery',) : 163,	
-	('ti,bq24150', 'ti,bq24150a', 'ti,bq24151', 'ti,bq24151a', 'ti,bq24152', 'ti,bq24153', 'ti,bq24153a', 'ti,bq24155', 'ti,bq24156', 'ti,bq24156a', 'ti,bq24157s', 'ti,bq24158') : 1273,	
-	('x-powers,axp209-battery-power-supply', 'x-powers,axp221-battery-power-supply', 'x-powers,axp813-battery-power-supply') : 423,	
-	('ti,tps65217-charger',) : 171,	
-	('ti,bq25980', 'ti,bq25975', 'ti,bq25960') : 978,	
-	('ti,bq24250', 'ti,bq24251', 'ti,bq24257') : 761,	
-	('maxim,max8903',) : 299,	
-	('motorola,mapphone-cpcap-charger',) : 621,	
-	('sprd,sc2731-fgu',) : 788,	
-	('ti,twl4030-bci',) : 778,	
-	('lego,ev3-battery',) : 149,	
-	('motorola,cpcap-battery',) : 615,	
-	('stericsson,ab8500-chargalg',) : 1259,	
-	('sbs,sbs-manager', 'lltc,ltc1760') : 285,	
-	('gpio-charger',) : 262,	
-	('cellwise,cw2015',) : 496,	
-	('fsl,ftm-quaddec',) : 198,	
-	('ti,am3352-eqep',) : 288,	
-	('atmel,at91rm9200-tcb', 'atmel,at91sam9x5-tcb', 'atmel,sama5d2-tcb', 'atmel,sama5d3-tcb', 'microchip,tcb-capture') : 269,	
-	('st,stm32-timer-counter',) : 276,	
-	('cdns,gpio-r1p02',) : 185,	
-	('stericsson,ab8500-btemp',) : 611,	
-	('ti,lp3943-gpio',) : 142,	
-	('lantiq,gpio-stp-xway',) : 188,	
-	('ti,lp8727',) : 408,	
-	('summit,smb345', 'summit,smb347', 'summit,smb358') : 844,	
-	('st,spear-spics-gpio',) : 110,	
-	('rohm,bd99954',) : 704,	
-	('mediatek,mt7621-gpio',) : 229,	
-	('st,stm32-lptimer-counter',) : 479,	
-	('cznic,moxtet-gpio',) : 114,	
-	('ti,bq25150', 'ti,bq25155') : 817,	
-	('sprd,sc9860-gpio',) : 196,	
-	('nintendo,hollywood-gpio',) : 191,	
-	('rda,8810pl-gpio',) : 190,	
-	('sprd,sc9860-eic-debounce', 'sprd,sc9860-eic-latch', 'sprd,sc9860-eic-async', 'sprd,sc9860-eic-sync') : 480,	
-	('kontron,sl28cpld-gpio', 'kontron,sl28cpld-gpi', 'kontron,sl28cpld-gpo') : 113,	
-	('maxim,max17042', 'maxim,max17047', 'maxim,max17050', 'maxim,max17055') : 841,	
-	('sprd,sc2731-eic',) : 232,	
-	('abilis,tb10x-gpio',) : 153,	
-	('charger-manager',) : 1036,	
-	('nvidia,tegra210-gpio', 'nvidia,tegra30-gpio', 'nvidia,tegra20-gpio') : 464,	
-	('atmel,sama5d2-secumod',) : 136,	
-	('mstar,msc313-gpio',) : 323,	
-	('qcom,wcd9340-gpio', 'qcom,wcd9341-gpio') : 79,	
-	('aspeed,ast2400-sgpio', 'aspeed,ast2500-sgpio') : 356,	
-	('raspberrypi,firmware-gpio',) : 172,	
-	('ti,bq24190', 'ti,bq24192', 'ti,bq24192i', 'ti,bq24196') : 1367,	
-	('ad,gpio-adnp',) : 351,	
-	('ti,tpic2810',) : 86,	
-	('snps,creg-gpio-axs10x', 'snps,creg-gpio-hsdk') : 120,	
-	('ti,tps65218-gpio',) : 162,	
-	('renesas,gpio-r8a7743', 'renesas,gpio-r8a7790', 'renesas,gpio-r8a7791', 'renesas,gpio-r8a7792', 'renesas,gpio-r8a7793', 'renesas,gpio-r8a7794', 'renesas,gpio-r8a7795', 'renesas,gpio-r8a7796', 'renesas,rcar-gen1-gpio', 'renesas,rcar-gen2-gpio', 'renesas,rcar-gen3-gpio', 'renesas,gpio-rcar') : 415,	
-	('adi,',) : 294,	
-	('apm,xgene-gpio-sb',) : 222,	
-	('fairchild,74hc595', 'nxp,74lvc594') : 122,	
-	('cirrus,ep7209-gpio',) : 57,	
-	('brcm,kona-gpio',) : 432,	
-	('stericsson,ab8500-fg',) : 1853,	
-	('gateworks,pld-gpio',) : 71,	
-	('ti,palmas-gpio', 'ti,tps65913-gpio', 'ti,tps65914-gpio', 'ti,tps80036-gpio') : 139,	
-	('fsl,imx23-gpio', 'fsl,imx28-gpio') : 249,	
-	('fsl,mpc5200-gpio-wkup', 'fsl,mpc5200-gpio') : 194,	
-	('socionext,uniphier-gpio',) : 308,	
-	('maxim,max7319', 'maxim,max7320', 'maxim,max7321', 'maxim,max7322', 'maxim,max7323', 'maxim,max7324', 'maxim,max7325', 'maxim,max7326', 'maxim,max7327') : 482,	
-	('stericsson,ab8500-charger',) : 2100,	
-	('lantiq,gpio-mm',) : 71,	
-	('aspeed,ast2400-gpio', 'aspeed,ast2500-gpio', 'aspeed,ast2600-gpio') : 783,	
-	('exar,xra1403',) : 144,	
-	('fsl,mpc8349-gpio', 'fsl,mpc8572-gpio', 'fsl,mpc8610-gpio', 'fsl,mpc5121-gpio', 'fsl,mpc5125-gpio', 'fsl,pq3-gpio', 'fsl,ls1028a-gpio', 'fsl,ls1088a-gpio', 'fsl,qoriq-gpio') : 281,	
-	('xlnx,zynq-gpio-1.0', 'xlnx,zynqmp-gpio-1.0', 'xlnx,versal-gpio-1.0', 'xlnx,pmc-gpio-1.0') : 589,	
-	('nxp,lpc3220-gpio',) : 329,	
-	('cavium,octeon-3860-gpio',) : 81,	
-	('fujitsu,mb86s70-gpio',) : 156,	
-	('maxim,max31910', 'maxim,max31911', 'maxim,max31912', 'maxim,max31913', 'maxim,max31953', 'maxim,max31963') : 308,	
-	('pisosr-gpio',) : 109,	
-	('apm,xgene-gpio',) : 138,	
-	('nxp,pca6416', 'nxp,pca9505', 'nxp,pca9534', 'nxp,pca9535', 'nxp,pca9536', 'nxp,pca9537', 'nxp,pca9538', 'nxp,pca9539', 'nxp,pca9554', 'nxp,pca9555', 'nxp,pca9556', 'nxp,pca9557', 'nxp,pca9574', 'nxp,pca9575', 'nxp,pca9698', 'nxp,pcal6416', 'nxp,pcal6524', 'nxp,pcal9535', 'nxp,pcal9554b', 'nxp,pcal9555a', 'maxim,max7310', 'maxim,max7312', 'maxim,max7313', 'maxim,max7315', 'maxim,max7318', 'ti,pca6107', 'ti,pca9536', 'ti,tca6408', 'ti,tca6416', 'ti,tca6424', 'ti,tca9539', 'onnn,cat9554', 'onnn,pca9654', 'exar,xra1202') : 826,	
-	('intel,pxa25x-gpio', 'intel,pxa26x-gpio', 'intel,pxa27x-gpio', 'intel,pxa3xx-gpio', 'marvell,pxa93x-gpio', 'marvell,mmp-gpio', 'marvell,mmp2-gpio', 'marvell,pxa1928-gpio') : 531,	
-	('ti,keystone-gpio', 'ti,am654-gpio', 'ti,dm6441-gpio') : 372,	
-	('technologic,ts4900-gpio', 'technologic,ts7970-gpio') : 107,	
-	('snps,dw-apb-gpio', 'apm,xgene-gpio-v2') : 565,	
-	('nxp,lpc1850-gpio',) : 268,	
-	('intel,ixp4xx-gpio',) : 195,	
-	('altr,a10sr-gpio',) : 70,	
-	('sifive,gpio0', 'sifive,fu540-c000-gpio') : 193,	
-	('netlogic,xlp832-gpio', 'netlogic,xlp316-gpio', 'netlogic,xlp208-gpio', 'netlogic,xlp980-gpio', 'netlogic,xlp532-gpio', 'brcm,vulcan-gpio') : 303,	
-	('qca,ar7100-gpio', 'qca,ar9340-gpio') : 207,	
-	('ti,omap4-gpio', 'ti,omap3-gpio', 'ti,omap2-gpio') : 967,	
-	('altr,pio-1.0',) : 225,	
-	('fsl,imx1-gpio', 'fsl,imx21-gpio', 'fsl,imx31-gpio', 'fsl,imx35-gpio', 'fsl,imx7d-gpio') : 378,	
-	('lsi,zevio-gpio',) : 118,	
-	('marvell,orion-gpio', 'marvell,mv78200-gpio', 'marvell,armadaxp-gpio', 'marvell,armada-370-gpio', 'marvell,armada-8k-gpio') : 823,	
-	('fsl,vf610-gpio', 'fsl,imx7ulp-gpio') : 237,	
-	('brcm,brcmstb-gpio',) : 531,	
-	('zte,zx296702-gpio',) : 202,	
-	('nvidia,tegra186-pmc', 'nvidia,tegra194-pmc', 'nvidia,tegra186-gpio', 'nvidia,tegra186-gpio-aon', 'nvidia,tegra194-gpio', 'nvidia,tegra194-gpio-aon') : 631,	
-	('xlnx,xps-gpio-1.00.a',) : 202,	
-	('nxp,pca9570',) : 81,	
-	('technologic,ts4800-gpio',) : 50,	
-	('nxp,pcf8574', 'nxp,pcf8574a', 'nxp,pca8574', 'nxp,pca9670', 'nxp,pca9672', 'nxp,pca9674', 'nxp,pcf8575', 'nxp,pca8575', 'nxp,pca9671', 'nxp,pca9673', 'nxp,pca9675', 'maxim,max7328', 'maxim,max7329') : 247,	
-	('renesas,em-gio',) : 245,	
-	('sirf,hwspinlock',) : 60,	
-	('sprd,hwspinlock-r3p0',) : 94,	
-	('gpio-mockup',) : 377,	
-	('brcm,iproc-gpio-cca',) : 229,	
-	('st,stm32-hwspinlock',) : 94,	
-	('ti,omap4-hwspinlock', 'ti,am654-hwspinlock') : 104,	
-	('ti,twl4030-gpio',) : 370,	
-	('qcom,sfpb-mutex', 'qcom,tcsr-mutex') : 120,	
-	('mps,mp5416',) : 175,	
-	('brcm,bcm6345-gpio', 'wd,mbl-gpio', 'ni,169445-nand-gpio') : 452,	
-	('cortina,gemini-gpio', 'moxa,moxart-gpio', 'faraday,ftgpio010') : 220,	
-	('st,stw481x-vmmc',) : 68,	
-	('mediatek,mt6311-regulator',) : 116,	
-	('nxp,pf8100', 'nxp,pf8121a', 'nxp,pf8200') : 385,	
-	('maxim,max8952',) : 218,	
-	('st,stm32-vrefbuf',) : 199,	
-	('silergy,sy8827n',) : 131,	
-	('qcom,vqmmc-ipq4019-regulator',) : 69,	
-	('onnn,fan53880',) : 142,	
-	('mps,mp8867', 'mps,mp8869') : 276,	
-	('google,cros-ec-regulator',) : 169,	
-	('vctrl-regulator',) : 354,	
-	('cirrus,lochnagar2-micvdd', 'cirrus,lochnagar2-mic1vdd', 'cirrus,lochnagar2-mic2vdd', 'cirrus,lochnagar2-vddcore') : 189,	
-	('silergy,sy8106a',) : 94,	
-	('st,stm32h7-booster', 'st,stm32mp1-booster') : 87,	
-	('maxim,max1586',) : 190,	
-	('maxim,max8660', 'maxim,max8661') : 327,	
-	('richtek,rt4801',) : 149,	
-	('maxim,max77826',) : 226,	
-	('raspberrypi,7inch-touchscreen-panel-regulator',) : 134,	
-	('dlg,da9210',) : 162,	
-	('microchip,mcp16502',) : 364,	
-	('fsl,anatop-regulator',) : 235,	
-	('ti,pbias-omap', 'ti,pbias-omap2', 'ti,pbias-omap3', 'ti,pbias-omap4', 'ti,pbias-omap5', 'ti,pbias-dra7') : 168,	
-	('st,stpmic1-regulators',) : 484,	
-	('motorola,cpcap-regulator', 'motorola,mapphone-cpcap-regulator', 'motorola,xoom-cpcap-regulator') : 421,	
-	('ti,tps62360', 'ti,tps62361', 'ti,tps62362', 'ti,tps62363') : 346,	
-	('socionext,uniphier-pro4-usb3-regulator', 'socionext,uniphier-pro5-usb3-regulator', 'socionext,uniphier-pxs2-usb3-regulator', 'socionext,uniphier-ld20-usb3-regulator', 'socionext,uniphier-pxs3-usb3-regulator') : 144,	
-	('maxim,max8973', 'maxim,max77621') : 581,	
-	('isl,isl9305', 'isil,isl9305', 'isl,isl9305h', 'isil,isl9305h') : 147,	
-	('ti,tps65020', 'ti,tps65021', 'ti,tps65023') : 237,	
-	('arm,vexpress-volt',) : 66,	
-	('ams,as3722-regulator',) : 677,	
-	('ti,lp8720', 'ti,lp8725') : 713,	
-	('mediatek,mt6397-regulator',) : 303,	
-	('pwm-regulator',) : 260,	
-	('regulator-gpio',) : 244,	
-	('pvs,pv88090',) : 289,	
-	('ti,tps51632',) : 259,	
-	('lltc,ltc3589', 'lltc,ltc3589-1', 'lltc,ltc3589-2') : 345,	
-	('pvs,pv88060',) : 280,	
-	('qcom,pmi8998-lab-ibb',) : 122,	
-	('ti,abb-v1', 'ti,abb-v2', 'ti,abb-v3') : 473,	
-	('qcom,pm8150b-vbus-reg',) : 66,	
-	('st,stm32mp1,pwr-reg',) : 123,	
-	('silergy,sy8824c', 'silergy,sy8824e', 'silergy,sy20276', 'silergy,sy20278') : 160,	
-	('pvs,pv88080', 'pvs,pv88080-aa', 'pvs,pv88080-ba') : 419,	
-	('dlg,da9211', 'dlg,da9212', 'dlg,da9213', 'dlg,da9223', 'dlg,da9214', 'dlg,da9224', 'dlg,da9215', 'dlg,da9225') : 389,	
-	('mps,mpq7920',) : 236,	
-	('richtek,rtmv20',) : 273,	
-	('mediatek,mt6380-regulator',) : 263,	
-	('fcs,fan53526', 'fcs,fan53555', 'silergy,syr827', 'silergy,syr828') : 392,	
-	('qcom,rpm-mp5496-regulators', 'qcom,rpm-pm8841-regulators', 'qcom,rpm-pm8916-regulators', 'qcom,rpm-pm8941-regulators', 'qcom,rpm-pm8950-regulators', 'qcom,rpm-pm8953-regulators', 'qcom,rpm-pm8994-regulators', 'qcom,rpm-pm8998-regulators', 'qcom,rpm-pm660-regulators', 'qcom,rpm-pm660l-regulators', 'qcom,rpm-pma8084-regulators', 'qcom,rpm-pmi8994-regulators', 'qcom,rpm-pmi8998-regulators', 'qcom,rpm-pms405-regulators') : 865,	
-	('marvell,88pg867', 'marvell,88pg868') : 78,	
-	('maxim,max77650-regulator',) : 316,	
-	('calxeda,hb-sregs-l2-ecc',) : 98,	
-	('qcom,pm8004-regulators', 'qcom,pm8005-regulators', 'qcom,pm8841-regulators', 'qcom,pm8916-regulators', 'qcom,pm8941-regulators', 'qcom,pm8950-regulators', 'qcom,pm8994-regulators', 'qcom,pmi8994-regulators', 'qcom,pm660-regulators', 'qcom,pm660l-regulators', 'qcom,pms405-regulators') : 1541,	
-	('regulator-fixed', 'regulator-fixed-clock', 'regulator-fixed-domain') : 199,	
-	('fsl,qoriq-memory-controller',) : 34,	
-	('lltc,ltc3676',) : 274,	
-	('fsl,pfuze100', 'fsl,pfuze200', 'fsl,pfuze3000', 'fsl,pfuze3001') : 659,	
-	('aspeed,ast2400-sdram-edac', 'aspeed,ast2500-sdram-edac', 'aspeed,ast2600-sdram-edac') : 244,	
-	('qcom,rpm-pm8018-regulators', 'qcom,rpm-pm8058-regulators', 'qcom,rpm-pm8901-regulators', 'qcom,rpm-pm8921-regulators', 'qcom,rpm-smb208-regulators') : 719,	
-	('dlg,da9121', 'dlg,da9130', 'dlg,da9217', 'dlg,da9122', 'dlg,da9131', 'dlg,da9220', 'dlg,da9132') : 755,	
-	('calxeda,hb-ddr-ctrl', 'calxeda,ecx-2000-ddr-ctrl') : 189,	
-	('nxp,pca9450a', 'nxp,pca9450b', 'nxp,pca9450c') : 610,	
-	('active-semi,act8600', 'active-semi,act8846', 'active-semi,act8865') : 607,	
-	('ti,emif-keystone', 'ti,emif-dra7xx') : 224,	
-	('fcs,fsa9480', 'fcs,fsa880', 'ti,tsu6111') : 254,	
-	('ti,palmas-pmic', 'ti,twl6035-pmic', 'ti,twl6036-pmic', 'ti,twl6037-pmic', 'ti,tps65913-pmic', 'ti,tps65914-pmic', 'ti,tps80036-pmic', 'ti,tps659038-pmic', 'ti,tps65917-pmic') : 1210,	
-	('qcom,pm8005-rpmh-regulators', 'qcom,pm8009-rpmh-regulators', 'qcom,pm8009-1-rpmh-regulators', 'qcom,pm8150-rpmh-regulators', 'qcom,pm8150l-rpmh-regulators', 'qcom,pm8350-rpmh-regulators', 'qcom,pm8350c-rpmh-regulators', 'qcom,pm8998-rpmh-regulators', 'qcom,pmi8998-rpmh-regulators', 'qcom,pm6150-rpmh-regulators', 'qcom,pm6150l-rpmh-regulators', 'qcom,pmx55-rpmh-regulators') : 765,	
-	('qcom,pm8941-misc',) : 99,	
-	('arm,dmc-520',) : 412,	
-	('amazon,al-mc-edac',) : 237,	
-	('marvell,armada-xp-sdram-controller', 'marvell,aurora-system-cache') : 451,	
-	('google,extcon-usbc-cros-ec',) : 356,	
-	('maxim,max3355',) : 83,	
-	('fsl,8540-l2-cache-controller', 'fsl,8541-l2-cache-controller', 'fsl,8544-l2-cache-controller', 'fsl,8548-l2-cache-controller', 'fsl,8555-l2-cache-controller', 'fsl,8568-l2-cache-controller', 'fsl,mpc8536-l2-cache-controller', 'fsl,mpc8540-l2-cache-controller', 'fsl,mpc8541-l2-cache-controller', 'fsl,mpc8544-l2-cache-controller', 'fsl,mpc8548-l2-cache-controller', 'fsl,mpc8555-l2-cache-controller', 'fsl,mpc8560-l2-cache-controller', 'fsl,mpc8568-l2-cache-controller', 'fsl,mpc8569-l2-cache-controller', 'fsl,mpc8572-l2-cache-controller', 'fsl,p1020-l2-cache-controller', 'fsl,p1021-l2-cache-controller', 'fsl,p2020-l2-cache-controller', 'fsl,t2080-l2-cache-controller', 'fsl,8540-memory-controller', 'fsl,8541-memory-controller', 'fsl,8544-memory-controller', 'fsl,8548-memory-controller', 'fsl,8555-memory-controller', 'fsl,8568-memory-controller', 'fsl,mpc8536-memory-controller', 'fsl,mpc8540-memory-controller', 'fsl,mpc8541-memory-controller', 'fsl,mpc8544-memory-controller', 'fsl,mpc8548-memory-controller', 'fsl,mpc8555-memory-controller', 'fsl,mpc8560-memory-controller', 'fsl,mpc8568-memory-controller', 'fsl,mpc8569-memory-controller', 'fsl,mpc8572-memory-controller', 'fsl,mpc8349-memory-controller', 'fsl,p1020-memory-controller', 'fsl,p1021-memory-controller', 'fsl,p2020-memory-controller', 'fsl,qoriq-memory-controller') : 467,	
-	('maxim,max14577-muic', 'maxim,max77836-muic') : 512,	
-	('ti,palmas-usb', 'ti,palmas-usb-vid', 'ti,twl6035-usb', 'ti,twl6035-usb-vid') : 304,	
-	('ti,tusb320',) : 121,	
-	('nxp,ptn5150',) : 211,	
-	('linux,extcon-usb-gpio',) : 189,	
-	('xlnx,zynq-ddrc-a05', 'xlnx,zynqmp-ddrc-2.40a') : 847,	
-	('renesas,hspi',) : 185,	
-	('siliconmitus,sm5502-muic',) : 481,	
-	('mxicy,mx25f0a-spi',) : 427,	
-	('nuvoton,npcm750-pspi',) : 302,	
-	('richtek,rt8973a-muic',) : 493,	
-	('fsl,mpc5200-spi',) : 331,	
-	('adi,axi-spi-engine-1.00.a',) : 411,	
-	('allwinner,sun6i-a31-spi', 'allwinner,sun8i-h3-spi') : 446,	
-	('nuvoton,npcm750-fiu',) : 567,	
-	('socionext,uniphier-scssi',) : 521,	
-	('st,comms-ssc4-spi',) : 297,	
-	('marvell,orion-spi', 'marvell,armada-370-spi', 'marvell,armada-375-spi', 'marvell,armada-380-spi', 'marvell,armada-390-spi', 'marvell,armada-xp-spi') : 465,	
-	('qcom,qspi-v1',) : 470,	
-	('spi-mux',) : 95,	
-	('ti,dm6441-spi', 'ti,da830-spi', 'ti,keystone-spi') : 608,	
-	('hisilicon,hns-roce-v1',) : 3429,	
-	('altr,sdram-edac', 'altr,sdram-edac-a10', 'altr,socfpga-ecc-manager', 'altr,socfpga-l2-ecc', 'altr,socfpga-ocram-ecc', 'altr,socfpga-a10-l2-ecc', 'altr,socfpga-a10-ocram-ecc', 'altr,socfpga-eth-mac-ecc', 'altr,socfpga-nand-ecc', 'altr,socfpga-dma-ecc', 'altr,socfpga-usb-ecc', 'altr,socfpga-qspi-ecc', 'altr,socfpga-sdmmc-ecc', 'altr,sdram-edac-s10', 'altr,socfpga-a10-ecc-manager', 'altr,socfpga-s10-ecc-manager') : 1408,	
-	('st,stm32f469-qspi',) : 523,	
-	('apm,xgene-edac',) : 1458,	
-	('img,spfi',) : 527,	
-	('qcom,geni-spi',) : 550,	
-	('brcm,bcm2835-aux-spi',) : 343,	
-	('ralink,mt7621-spi',) : 254,	
-	('fsl,spi', 'aeroflexgaisler,spictrl') : 549,	
-	('nxp,lx2160a-fspi', 'nxp,imx8mm-fspi', 'nxp,imx8qxp-fspi') : 705,	
-	('fsl,imx23-spi', 'fsl,imx28-spi') : 422,	
-	('nvidia,tegra114-spi', 'nvidia,tegra124-spi', 'nvidia,tegra210-spi') : 1130,	
-	('marvell,armada-3700-spi',) : 552,	
-	('jcore,spi2',) : 149,	
-	('lantiq,ase-spi', 'lantiq,falcon-spi', 'lantiq,xrx100-spi', 'intel,lgm-spi') : 698,	
-	('fsl,vf610-qspi', 'fsl,imx6sx-qspi', 'fsl,imx7d-qspi', 'fsl,imx6ul-qspi', 'fsl,ls1021a-qspi', 'fsl,ls2080a-qspi') : 588,	
-	('cdns,xtfpga-spi',) : 102,	
-	('xlnx,zynq-spi-r1p6', 'cdns,spi-r1p6') : 342,	
-	('qcom,spi-qup-v1.1.1', 'qcom,spi-qup-v2.1.1', 'qcom,spi-qup-v2.2.1') : 876,	
-	('nxp,sc18is602', 'nxp,sc18is602b', 'nxp,sc18is603') : 228,	
-	('mediatek,mt2712-spi-slave',) : 366,	
-	('sprd,sc9860-adi',) : 371,	
-	('fsl,vf610-dspi', 'fsl,ls1021a-v1.0-dspi', 'fsl,ls1012a-dspi', 'fsl,ls1028a-dspi', 'fsl,ls1043a-dspi', 'fsl,ls1046a-dspi', 'fsl,ls2080a-dspi', 'fsl,ls2085a-dspi', 'fsl,lx2160a-dspi') : 924,	
-	('mediatek,mt8192-nor', 'mediatek,mt8173-nor') : 633,	
-	('opencores,tiny-spi-rtlsvn2',) : 204,	
-	('allwinner,sun4i-a10-spi',) : 319,	
-	('fsl,mpc5200-psc-spi', 'mpc5200-psc-spi') : 328,	
-	('fsl,imx1-cspi', 'fsl,imx21-cspi', 'fsl,imx27-cspi', 'fsl,imx31-cspi', 'fsl,imx35-cspi', 'fsl,imx51-ecspi', 'fsl,imx53-ecspi') : 1165,	
-	('cirrus,ep7209-spi',) : 111,	
-	('cavium,octeon-3010-spi',) : 64,	
-	('icpdas,lp8841-spi-rtc',) : 151,	
-	('snps,dw-apb-ssi', 'mscc,ocelot-spi', 'mscc,jaguar2-spi', 'amazon,alpine-dw-apb-ssi', 'renesas,rzn1-spi', 'snps,dwc-ssi-1.01a', 'intel,keembay-ssi', 'microchip,sparx5-spi', 'canaan,k210-spi') : 229,	
-	('samsung,s3c2443-spi', 'samsung,s3c6410-spi', 'samsung,s5pv210-spi', 'samsung,exynos4210-spi', 'samsung,exynos7-spi', 'samsung,exynos5433-spi') : 990,	
-	('nvidia,tegra20-sflash',) : 444,	
-	('microchip,pic32mzda-sqi',) : 437,	
-	('amlogic,meson-axg-spicc', 'amlogic,meson-g12a-spicc') : 541,	
-	('brcm,spi-nsp-qspi', 'brcm,spi-ns2-qspi') : 102,	
-	('energymicro,efm32-spi', 'efm32,spi') : 290,	
-	('nvidia,tegra30-slink', 'nvidia,tegra20-slink') : 916,	
-	('netlogic,xlp832-spi',) : 314,	
-	('spi-gpio',) : 205,	
-	('renesas,rspi', 'renesas,rspi-rz', 'renesas,qspi') : 916,	
-	('socionext,synquacer-spi',) : 590,	
-	('fsl,mpc5121-psc-spi', 'fsl,mpc5125-psc-spi') : 372,	
-	('brcm,spi-bcm7445-qspi', 'brcm,spi-bcm-qspi', 'brcm,spi-bcm7216-qspi', 'brcm,spi-bcm7278-qspi') : 996,	
-	('mikrotik,rb4xx-spi',) : 122,	
-	('mediatek,mt2701-spi', 'mediatek,mt2712-spi', 'mediatek,mt6589-spi', 'mediatek,mt6765-spi', 'mediatek,mt7622-spi', 'mediatek,mt7629-spi', 'mediatek,mt8135-spi', 'mediatek,mt8173-spi', 'mediatek,mt8183-spi', 'mediatek,mt8192-spi') : 627,	
-	('ibm,ppc4xx-spi',) : 274,	
-	('brcm,spi-brcmstb-qspi', 'brcm,spi-brcmstb-mspi') : 24,	
-	('xlnx,axi-quad-spi-1.00.a', 'xlnx,xps-spi-2.00.a', 'xlnx,xps-spi-2.00.b') : 319,	
-	('amlogic,meson6-spifc', 'amlogic,meson-gxbb-spifc') : 273,	
-	('st,stm32h7-spi', 'st,stm32f4-spi') : 1158,	
-	('xlnx,zynq-qspi-1.0',) : 412,	
-	('cdns,qspi-nor', 'ti,k2g-qspi', 'ti,am654-ospi') : 932,	
-	('fsl,imx7ulp-spi',) : 669,	
-	('microchip,pic32mzda-spi',) : 553,	
-	('renesas,sh-mobile-msiof', 'renesas,msiof-r8a7743', 'renesas,msiof-r8a7745', 'renesas,msiof-r8a7790', 'renesas,msiof-r8a7791', 'renesas,msiof-r8a7792', 'renesas,msiof-r8a7793', 'renesas,msiof-r8a7794', 'renesas,rcar-gen2-msiof', 'renesas,msiof-r8a7796', 'renesas,rcar-gen3-msiof', 'renesas,sh-msiof') : 983,	
-	('atmel,at91rm9200-spi',) : 1146,	
-	('brcm,bcm6348-spi', 'brcm,bcm6358-spi') : 457,	
-	('lantiq,sflash-falcon',) : 277,	
-	('fsl,mpc8536-espi',) : 549,	
-	('sprd,sc9860-spi',) : 691,	
-	('qca,ar934x-spi',) : 165,	
-	('qca,ar7100-spi',) : 154,	
-	('baikal,bt1-ssi', 'baikal,bt1-sys-ssi') : 181,	
-	('rohm,dh2228fv', 'lineartechnology,ltc2488', 'ge,achc', 'semtech,sx1301', 'lwn,bk4', 'dh,dhcom-board', 'menlo,m53cpld', 'cisco,spi-petra') : 544,	
-	('ti,dra7xxx-qspi', 'ti,am4372-qspi') : 642,	
-	('ALTR,spi-1.0', 'altr,spi-1.0') : 247,	
-	('sifive,spi0',) : 279,	
-	('brcm,bcm6328-hsspi',) : 355,	
-	('rockchip,px30-spi', 'rockchip,rk3036-spi', 'rockchip,rk3066-spi', 'rockchip,rk3188-spi', 'rockchip,rk3228-spi', 'rockchip,rk3288-spi', 'rockchip,rk3308-spi', 'rockchip,rk3328-spi', 'rockchip,rk3368-spi', 'rockchip,rk3399-spi', 'rockchip,rv1108-spi') : 596,	
-	('atmel,sama5d2-qspi', 'microchip,sam9x60-qspi') : 468,	
-	('ti,omap2-mcspi', 'ti,omap4-mcspi', 'ti,am654-mcspi') : 1057,	
-	('nxp,sja1000', 'technologic,sja1000') : 215,	
-	('bosch,m_can',) : 122,	
-	('fsl,mpc5200-cdm', 'fsl,mpc5200-mscan', 'fsl,mpc5121-mscan') : 300,	
-	('simple-bus', 'simple-mfd', 'isa', 'arm,amba-bus', 'operating-points-v2', 'qcom,rmtfs-mem', 'qcom,cmd-db', 'ramoops') : 386,	
-	('bosch,cc770', 'bosch,cc770', 'intc,82527') : 161,	
-	('bosch,c_can', 'bosch,d_can', 'ti,dra7-d_can', 'ti,am3352-d_can', 'ti,am4372-d_can') : 294,	
-	('brcm,bcm2835-spi',) : 705,	
-	('xlnx,gmii-to-rgmii-1.0',) : 73,	
-	('mdio-mux-multiplexer',) : 68,	
-	('xlnx,zynqmp-qspi-1.0',) : 752,	
-	('ti,tcan4x5x',) : 355,	
-	('allwinner,sun4i-a10-mdio', 'allwinner,sun4i-mdio') : 109,	
-	('ifi,canfd-1.0',) : 713,	
-	('qcom,ipq8064-mdio',) : 108,	
-	('micrel,ks8995', 'micrel,ksz8864', 'micrel,ksz8795') : 342,	
-	('brcm,genet-mdio-v5', 'brcm,genet-mdio-v4', 'brcm,genet-mdio-v3', 'brcm,genet-mdio-v2', 'brcm,genet-mdio-v1', 'brcm,unimac-mdio') : 218,	
-	('amlogic,g12a-mdio-mux',) : 252,	
-	('ti,am3517-hecc',) : 658,	
-	('marvell,mmp2-ssp',) : 1284,	
-	('brcm,mdio-mux-iproc',) : 203,	
-	('mdio-mux-gpio', 'cavium,mdio-mux-sn74cbtlv3253') : 58,	
-	('allwinner,sun4i-a10-can',) : 555,	
-	('atmel,at91sam9x5-can', 'atmel,at91sam9263-can') : 783,	
-	('sirf,prima2-spi', 'sirf,prima2-usp-spi', 'sirf,atlas7-usp-spi') : 971,	
-	('mdio-mux-mmioreg',) : 115,	
-	('hisilicon,hisi-femac-mdio',) : 98,	
-	('aspeed,ast2600-mdio',) : 107,	
-	('cavium,octeon-3860-mdio',) : 76,	
-	('mscc,ocelot-miim',) : 138,	
-	('renesas,can-r8a7778', 'renesas,can-r8a7779', 'renesas,can-r8a7790', 'renesas,can-r8a7791', 'renesas,rcar-gen1-can', 'renesas,rcar-gen2-can', 'renesas,rcar-gen3-can') : 647,	
-	('brcm,iproc-mdio',) : 144,	
-	('brcm,40nm-ephy', 'broadcom,bcm5241', 'marvell,88E1111', 'marvell,88e1116', 'marvell,88e1118', 'marvell,88e1145', 'marvell,88e1149r', 'marvell,88e1310', 'marvell,88E1510', 'marvell,88E1514', 'moxa,moxart-rtl8201cp') : 313,	
-	('virtual,mdio-gpio',) : 124,	
-	('qcom,ipq4019-mdio',) : 134,	
-	('moxa,moxart-mdio',) : 112,	
-	('smsc,lan9303-mdio',) : 94,	
-	('xlnx,zynq-can-1.0', 'xlnx,axi-can-1.00.a', 'xlnx,canfd-1.0', 'xlnx,canfd-2.0') : 1000,	
-	('vitesse,vsc7385', 'vitesse,vsc7388', 'vitesse,vsc7395', 'vitesse,vsc7398') : 81,	
-	('microchip,ksz8765', 'microchip,ksz8794', 'microchip,ksz8795') : 65,	
-	('microchip,ksz9477', 'microchip,ksz9897', 'microchip,ksz9893', 'microchip,ksz9563', 'microchip,ksz9567') : 60,	
-	('microchip,ksz9477', 'microchip,ksz9897', 'microchip,ksz9893', 'microchip,ksz9563', 'microchip,ksz8563', 'microchip,ksz9567') : 74,	
-	('apm,xgene-mdio-rgmii', 'apm,xgene-mdio-xfi') : 307,	
-	('smsc,lan9303-i2c',) : 66,	
-	('marvell,mv88e6060',) : 184,	
-	('renesas,rcar-gen3-canfd',) : 1166,	
-	('brcm,bcm3384-switch', 'brcm,bcm6328-switch', 'brcm,bcm6368-switch', 'brcm,bcm63xx-switch') : 173,	
-	('brcm,bcm5325', 'brcm,bcm53115', 'brcm,bcm53125', 'brcm,bcm53128', 'brcm,bcm5365', 'brcm,bcm5389', 'brcm,bcm5395', 'brcm,bcm5397', 'brcm,bcm5398') : 233,	
-	('realtek,rtl8366rb', 'realtek,rtl8366s') : 288,	
-	('fsl,imx8qm-flexcan', 'fsl,imx8mp-flexcan', 'fsl,imx6q-flexcan', 'fsl,imx28-flexcan', 'fsl,imx53-flexcan', 'fsl,imx35-flexcan', 'fsl,imx25-flexcan', 'fsl,p1010-flexcan', 'fsl,vf610-flexcan', 'fsl,ls1021ar2-flexcan', 'fsl,lx2160ar1-flexcan') : 1476,	
-	('brcm,bcm53010-srab', 'brcm,bcm53011-srab', 'brcm,bcm53012-srab', 'brcm,bcm53018-srab', 'brcm,bcm53019-srab', 'brcm,bcm5301x-srab', 'brcm,bcm11360-srab', 'brcm,bcm58522-srab', 'brcm,bcm58525-srab', 'brcm,bcm58535-srab', 'brcm,bcm58622-srab', 'brcm,bcm58623-srab', 'brcm,bcm58625-srab', 'brcm,bcm88312-srab', 'brcm,cygnus-srab', 'brcm,nsp-srab', 'brcm,omega-srab') : 425,	
-	('micrel,ks8851-mll',) : 154,	
-	('microchip,mcp2517fd', 'microchip,mcp2518fd', 'microchip,mcp251xfd') : 1856,	
-	('micrel,ks8851',) : 240,	
-	('qca,ar9331-switch',) : 535,	
-	('compat3', 'compat2', 'compat2', 'compat2', 'compat2', 'compat2', 'test-device', 'unittest', 'unittest-gpio', 'unittest-i2c-bus') : 1963,	
-	('sff,sff', 'sff,sfp') : 1668,	
-	('amd,xgbe-seattle-v1a',) : 317,	
-	('ezchip,nps-mgt-enet',) : 361,	
-	('hirschmann,hellcreek-de1soc-r1',) : 829,	
-	('mscc,vsc9953-switch',) : 1018,	
-	('brcm,bcm7445-switch-v4.0', 'brcm,bcm7278-switch-v4.0', 'brcm,bcm7278-switch-v4.8') : 911,	
-	('qca,qca8334', 'qca,qca8337') : 977,	
-	('hisilicon,mdio', 'hisilicon,hns-mdio') : 363,	
-	('samsung,sxgbe-v2.0a',) : 154,	
-	('aurora,nb8800', 'sigma,smp8642-ethernet', 'sigma,smp8734-ethernet') : 917,	
-	('nxp,lpc-eth',) : 952,	
-	('lantiq,xrx200-gphy-fw', 'lantiq,xrx200a1x-gphy-fw', 'lantiq,xrx200a2x-gphy-fw', 'lantiq,xrx300-gphy-fw', 'lantiq,xrx330-gphy-fw', 'lantiq,xrx200-gswip') : 1361,	
-	('hisilicon,hip04-mac',) : 737,	
-	('microchip,enc28j60',) : 999,	
-	('hisilicon,hisi-femac-v1', 'hisilicon,hisi-femac-v2', 'hisilicon,hi3516cv300-femac') : 679,	
-	('smsc,lan91c94', 'smsc,lan91c111') : 1309,	
-	('mscc,vsc7514-switch',) : 1061,	
-	('calxeda,hb-xgmac',) : 1281,	
-	('hisilicon,hisi-gmac-v1', 'hisilicon,hisi-gmac-v2', 'hisilicon,hix5hd2-gmac', 'hisilicon,hi3798cv200-gmac', 'hisilicon,hi3516a-gmac') : 947,	
-	('wiznet,w5100', 'wiznet,w5200', 'wiznet,w5500') : 290,	
-	('ti,davinci_mdio', 'ti,cpsw-mdio') : 333,	
-	('ni,xge-enet-2.00', 'ni,xge-enet-3.00') : 945,	
-	('qca,ar7100-eth', 'qca,ar7240-eth', 'qca,ar7241-eth', 'qca,ar7242-eth', 'qca,ar9130-eth', 'qca,ar9330-eth', 'qca,ar9340-eth', 'qca,qca9530-eth', 'qca,qca9550-eth', 'qca,qca9560-eth') : 1405,	
-	('smsc,lan9115',) : 1610,	
-	('ti,am65-cpts', 'ti,j721e-cpts') : 698,	
-	('mediatek,mt7621', 'mediatek,mt7530', 'mediatek,mt7531') : 1800,	
-	('altr,tse-msgdma-1.0', 'altr,tse-1.0', 'ALTR,tse-1.0') : 1016,	
-	('fsl,mpc5200b-mdio', 'fsl,mpc5200-mdio', 'mpc5200b-fec-phy') : 95,	
-	('cirrus,cs8900', 'cirrus,cs8920') : 1199,	
-	('fsl,cpm2-mdio-bitbang',) : 130,	
-	('nxp,sja1105e', 'nxp,sja1105t', 'nxp,sja1105p', 'nxp,sja1105q', 'nxp,sja1105r', 'nxp,sja1105s') : 2080,	
-	('fsl,fman-xmdio', 'fsl,fman-memac-mdio') : 200,	
-	('fsl,gianfar-tbi', 'fsl,gianfar-mdio', 'gianfar', 'fsl,etsec2-tbi', 'fsl,etsec2-mdio', 'fsl,ucc-mdio', 'ucc_geth_phy', 'fsl,fman-mdio') : 281,	
-	('fsl,pq1-fec-mdio', 'fsl,mpc5121-fec-mdio') : 142,	
-	('allwinner,sun4i-a10-emac', 'allwinner,sun4i-emac') : 557,	
-	('hisilicon,hns-nic-v1', 'hisilicon,hns-nic-v2') : 1548,	
-	('andestech,atmac100',) : 652,	
-	('ti,cpsw', 'ti,am335x-cpsw', 'ti,am4372-cpsw', 'ti,dra7-cpsw') : 1220,	
-	('ti,davinci-dm6467-emac', 'ti,am3517-emac', 'ti,dm816-emac') : 1212,	
-	('fsl,cpm1-scc-enet', 'fsl,cpm2-scc-enet', 'fsl,cpm2-fcc-enet', 'fsl,mpc5121-fec', 'fsl,mpc5125-fec', 'fsl,pq1-fec-enet') : 694,	
-	('marvell,orion-mdio', 'marvell,xmdio') : 282,	
-	('marvell,armada-380-neta-bm',) : 297,	
-	('hisilicon,hns-dsaf-v1', 'hisilicon,hns-dsaf-v2') : 1987,	
-	('ti,cpsw-switch', 'ti,am335x-cpsw-switch', 'ti,am4372-cpsw-switch', 'ti,dra7-cpsw-switch') : 1381,	
-	('faraday,ftgmac100',) : 1162,	
-	('fsl,mpc5200b-fec', 'fsl,mpc5200-fec', 'mpc5200-fec') : 636,	
-	('ti,netcp-1.0',) : 1537,	
-	('ti,am654-cpsw-nuss', 'ti,j721e-cpsw-nuss') : 1547,	
-	('qcom,fsm9900-emac-sgmii', 'qcom,qdf2432-emac-sgmii') : 254,	
-	('snps,arc-emac',) : 56,	
-	('qca,qca7000',) : 678,	
-	('qcom,fsm9900-emac',) : 457,	
-	('rockchip,rk3036-emac', 'rockchip,rk3066-emac', 'rockchip,rk3188-emac') : 185,	
-	('fsl,fman-v3-port-rx', 'fsl,fman-v2-port-rx', 'fsl,fman-v3-port-tx', 'fsl,fman-v2-port-tx') : 1246,	
-	('apm,xgene-enet', 'apm,xgene1-sgenet', 'apm,xgene1-xgenet', 'apm,xgene2-sgenet', 'apm,xgene2-xgenet') : 1512,	
-	('cortina,gemini-ethernet-port', 'cortina,gemini-ethernet') : 1733,	
-	('lantiq,xrx200-net',) : 352,	
-	('brcm,amac', 'brcm,nsp-amac', 'brcm,ns2-amac') : 183,	
-	('marvell,mv88e6085', 'marvell,mv88e6190', 'marvell,mv88e6250') : 4186,	
-	('opencores,ethoc',) : 826,	
-	('marvell,pxa168-eth',) : 1010,	
-	('adaptrum,anarion-gmac',) : 97,	
-	('fsl,fman-muram', 'fsl,fman') : 2003,	
-	('nxp,lpc1850-dwmac',) : 62,	
-	('amlogic,meson6-dwmac',) : 66,	
-	('moxa,moxart-mac',) : 387,	
-	('mediatek,mt2712-gmac',) : 301,	
-	('via,vt8500-rhine',) : 1541,	
-	('nxp,imx8mp-dwmac-eqos', 'nxp,imx8dxl-dwmac-eqos') : 211,	
-	('cavium,octeon-5750-mix',) : 1029,	
-	('xlnx,opb-ethernetlite-1.01.a', 'xlnx,opb-ethernetlite-1.01.b', 'xlnx,xps-ethernetlite-1.00.a', 'xlnx,xps-ethernetlite-2.00.a', 'xlnx,xps-ethernetlite-2.01.a', 'xlnx,xps-ethernetlite-3.00.a') : 593,	
-	('st,stih415-dwmac', 'st,stih416-dwmac', 'st,stid127-dwmac', 'st,stih407-dwmac') : 258,	
-	('qcom,ipq806x-gmac',) : 258,	
-	('qcom,qcs404-ethqos',) : 398,	
-	('mediatek,mt8516-eth', 'mediatek,mt8518-eth', 'mediatek,mt8175-eth') : 1010,	
-	('amlogic,meson8b-dwmac', 'amlogic,meson8m2-dwmac', 'amlogic,meson-gxbb-dwmac', 'amlogic,meson-axg-dwmac', 'amlogic,meson-g12a-dwmac') : 323,	
-	('oxsemi,ox820-dwmac',) : 123,	
-	('gianfar', 'fsl,etsec2') : 2224,	
-	('via,velocity-vt6110',) : 1900,	
-	('intel,keembay-dwmac',) : 127,	
-	('xlnx,xps-ll-temac-1.01.b', 'xlnx,xps-ll-temac-2.00.a', 'xlnx,xps-ll-temac-2.02.a', 'xlnx,xps-ll-temac-2.03.a') : 941,	
-	('davicom,dm9000',) : 1006,	
-	('st,spear600-gmac', 'snps,dwmac-3.50a', 'snps,dwmac-3.610', 'snps,dwmac-3.70a', 'snps,dwmac-3.710', 'snps,dwmac-4.00', 'snps,dwmac-4.10a', 'snps,dwmac', 'snps,dwxgmac-2.10', 'snps,dwxgmac') : 61,	
-	('st,stm32-dwmac', 'st,stm32mp1-dwmac') : 337,	
-	('rockchip,px30-gmac', 'rockchip,rk3128-gmac', 'rockchip,rk3228-gmac', 'rockchip,rk3288-gmac', 'rockchip,rk3328-gmac', 'rockchip,rk3366-gmac', 'rockchip,rk3368-gmac', 'rockchip,rk3399-gmac', 'rockchip,rv1108-gmac') : 1033,	
-	('allwinner,sun8i-h3-emac', 'allwinner,sun8i-v3s-emac', 'allwinner,sun8i-a83t-emac', 'allwinner,sun8i-r40-gmac', 'allwinner,sun50i-a64-emac', 'allwinner,sun50i-h6-emac') : 845,	
-	('marvell,orion-eth', 'marvell,kirkwood-eth') : 2107,	
-	('altr,socfpga-stmmac', 'altr,socfpga-stmmac-a10-s10') : 335,	
-	('socionext,uniphier-pro4-ave4', 'socionext,uniphier-pxs2-ave4', 'socionext,uniphier-ld11-ave4', 'socionext,uniphier-ld20-ave4', 'socionext,uniphier-pxs3-ave4') : 1252,	
-	('socionext,synquacer-netsec',) : 1478,	
-	('fsl,imx25-fec', 'fsl,imx27-fec', 'fsl,imx28-fec', 'fsl,imx6q-fec', 'fsl,mvf600-fec', 'fsl,imx6sx-fec', 'fsl,imx6ul-fec') : 2515,	
-	('snps,dwc-qos-ethernet-4.10',) : 410,	
-	('allwinner,sun7i-a20-gmac',) : 121,	
-	('snps,dwc-qos-ethernet-4.10', 'nvidia,tegra186-eqos') : 342,	
-	('xlnx,axi-ethernet-1.00.a', 'xlnx,axi-ethernet-1.01.a', 'xlnx,axi-ethernet-2.01.a') : 1197,	
-	('ucc_geth',) : 2766,	
-	('maxim,ds26522',) : 131,	
-	('brcm,systemportlite-v1.00', 'brcm,systemport-v1.00', 'brcm,systemport') : 1876,	
-	('mediatek,mt7628-wmac',) : 55,	
-	('mediatek,mt7622-wmac',) : 42,	
-	('kontron,sl28cpld',) : 30,	
-	('ti,wl1271', 'ti,wl1273', 'ti,wl1281', 'ti,wl1283', 'ti,wl1285', 'ti,wl1801', 'ti,wl1805', 'ti,wl1807', 'ti,wl1831', 'ti,wl1835', 'ti,wl1837') : 289,	
-	('atmel,at91rm9200-usart', 'atmel,at91sam9260-usart') : 39,	
-	('qcom,wcd9340-gpio', 'qcom,soundwire-v1.3.0') : 215,	
-	('nxp,mcr20a',) : 942,	
-	('ti,am3359-tsc', 'ti,am3359-adc', 'ti,am3359-tscadc') : 229,	
-	('qcom,ipq8074-wifi', 'qcom,ipq6018-wifi') : 468,	
-	('adi,adf7242', 'adi,adf7241') : 903,	
-	('qcom,ipq4019-wifi',) : 559,	
-	('ti,cc2520',) : 871,	
-	('microchip,wilc1000',) : 667,	
-	('IBM,lhea', 'IBM,lhea-ethernet', 'IBM,lhea') : 2429,	
-	('mediatek,mt6360_pmu',) : 335,	
-	('mediatek,mt2701-eth', 'mediatek,mt7621-eth', 'mediatek,mt7622-eth', 'mediatek,mt7623-eth', 'mediatek,mt7629-eth', 'ralink,rt5350-eth') : 2081,	
-	('microchip,mrf24j40', 'microchip,mrf24j40ma', 'microchip,mrf24j40mc') : 1001,	
-	('marvell,armada-370-neta', 'marvell,armada-xp-neta', 'marvell,armada-3700-neta') : 3455,	
-	('fsl,ucc-hdlc',) : 874,	
-	('brcm,genet-v1', 'brcm,genet-v2', 'brcm,genet-v3', 'brcm,genet-v4', 'brcm,genet-v5', 'brcm,bcm2711-genet-v5') : 2827,	
-	('ti,tps65912',) : 37,	
-	('qcom,wcnss-wlan',) : 974,	
-	('atmel,at86rf230', 'atmel,at86rf231', 'atmel,at86rf233', 'atmel,at86rf212') : 1174,	
-	('hid-over-i2c',) : 815,	
-	('rockchip,rk805', 'rockchip,rk808', 'rockchip,rk809', 'rockchip,rk817', 'rockchip,rk818') : 519,	
-	('maxim,max8925',) : 171,	
-	('ti,lm363x-regulator', 'ti,lm3631-backlight', 'ti,lm3632-backlight', 'ti,lm3633-backlight', 'ti,lm3633-leds', 'ti,lm3633-fault-monitor', 'ti,lm3695-backlight', 'ti,lm36274-backlight', 'ti,lm3631', 'ti,lm3632', 'ti,lm3633', 'ti,lm3695', 'ti,lm36274') : 143,	
-	('hisilicon,hi6421-pmic', 'hisilicon,hi6421v530-pmic') : 83,	
-	('qcom,wcn3990-wifi',) : 1131,	
-	('cascoda,ca8210',) : 1876,	
-	('renesas,etheravb-r8a7790', 'renesas,etheravb-r8a7794', 'renesas,etheravb-rcar-gen2', 'renesas,etheravb-r8a7795', 'renesas,etheravb-rcar-gen3') : 1483,	
-	('fsl,mc13892', 'fsl,mc34708') : 68,	
-	('qcom,spmi-pmic', 'qcom,pm8941', 'qcom,pm8841', 'qcom,pm8019', 'qcom,pm8226', 'qcom,pm8110', 'qcom,pma8084', 'qcom,pmi8962', 'qcom,pmd9635', 'qcom,pm8994', 'qcom,pmi8994', 'qcom,pm8916', 'qcom,pm8004', 'qcom,pm8909', 'qcom,pm8950', 'qcom,pmi8950', 'qcom,pm8998', 'qcom,pmi8998', 'qcom,pm8005', 'qcom,pm660l', 'qcom,pm660') : 111,	
-	('wlf,wm5102', 'wlf,wm5110', 'wlf,wm8280', 'wlf,wm8997', 'wlf,wm8998', 'wlf,wm1814', 'wlf,wm1831', 'cirrus,cs47l24') : 995,	
-	('ti,tps65910', 'ti,tps65911') : 351,	
-	('ti,usbhs-tll',) : 296,	
-	('mps,mp2629_adc', 'mps,mp2629_charger', 'mps,mp2629') : 46,	
-	('sprd,sc2731',) : 177,	
-	('dlg,da9063', 'dlg,da9063l') : 324,	
-	('ti,palmas', 'ti,tps659038', 'ti,tps65917') : 523,	
-	('dlg,da9055-pmic',) : 54,	
-	('atmel,sama5d2-flexcom',) : 76,	
-	('wlf,wm8310', 'wlf,wm8311', 'wlf,wm8312', 'wlf,wm8320', 'wlf,wm8321', 'wlf,wm8325', 'wlf,wm8326') : 1309,	
-	('marvell,88pm860x',) : 893,	
-	('dlg,da9150-gpadc', 'dlg,da9150-charger', 'dlg,da9150-fuel-gauge', 'dlg,da9150') : 366,	
-	('st,stpmic1',) : 152,	
-	('st,stm32-lptimer',) : 64,	
-	('ene,kb3930',) : 131,	
-	('cdns,at32ap7000-macb', 'cdns,at91sam9260-macb', 'cdns,macb', 'cdns,np4-macb', 'cdns,pc302-gem', 'cdns,gem', 'cdns,sam9x60-macb', 'atmel,sama5d2-gem', 'atmel,sama5d3-gem', 'atmel,sama5d3-macb', 'atmel,sama5d4-gem', 'cdns,at91rm9200-emac', 'cdns,emac', 'cdns,zynqmp-gem', 'cdns,zynq-gem', 'sifive,fu540-c000-gem', 'microchip,sama7g5-gem', 'microchip,sama7g5-emac') : 3237,	
-	('tc3589x', 'toshiba,tc35890', 'toshiba,tc35892', 'toshiba,tc35893', 'toshiba,tc35894', 'toshiba,tc35895', 'toshiba,tc35896') : 298,	
-	('st,stmfx-0300-pinctrl', 'st,stmfx-0300-idd', 'st,stmfx-0300-ts', 'st,stmfx-0300') : 346,	
-	('renesas,gether-r8a7740', 'renesas,ether-r8a7743', 'renesas,ether-r8a7745', 'renesas,ether-r8a7778', 'renesas,ether-r8a7779', 'renesas,ether-r8a7790', 'renesas,ether-r8a7791', 'renesas,ether-r8a7793', 'renesas,ether-r8a7794', 'renesas,gether-r8a77980', 'renesas,ether-r7s72100', 'renesas,ether-r7s9210', 'renesas,rcar-gen1-ether', 'renesas,rcar-gen2-ether') : 2370,	
-	('qcom,rpm-apq8064', 'qcom,rpm-msm8660', 'qcom,rpm-msm8960', 'qcom,rpm-ipq8064', 'qcom,rpm-mdm9615') : 581,	
-	('maxim,max8998', 'national,lp3974', 'ti,lp3974') : 233,	
-	('allwinner,sun6i-a31-ar100-clk', 'allwinner,sun6i-a31-apb0-clk', 'allwinner,sun6i-a31-apb0-gates-clk', 'allwinner,sun4i-a10-mod0-clk', 'allwinner,sun6i-a31-clock-reset', 'allwinner,sun8i-a23-apb0-clk', 'allwinner,sun8i-a23-apb0-gates-clk', 'allwinner,sun6i-a31-clock-reset', 'allwinner,sun6i-a31-prcm', 'allwinner,sun8i-a23-prcm') : 104,	
-	('ti,twl6030', 'ti,twl6032') : 273,	
-	('atmel,hlcdc-pwm', 'atmel,hlcdc-display-controller', 'atmel,at91sam9n12-hlcdc', 'atmel,at91sam9x5-hlcdc', 'atmel,sama5d2-hlcdc', 'atmel,sama5d3-hlcdc', 'atmel,sama5d4-hlcdc', 'microchip,sam9x60-hlcdc') : 102,	
-	('dlg,da9063-onkey',) : 121,	
-	('fsl,mc13783', 'fsl,mc13892', 'fsl,mc34708') : 112,	
-	('qcom,pm8018', 'qcom,pm8058', 'qcom,pm8821', 'qcom,pm8921') : 433,	
-	('mediatek,mt6323-rtc', 'mediatek,mt6323-regulator', 'mediatek,mt6323-led', 'mediatek,mt6323-keys', 'mediatek,mt6323-pwrc', 'mediatek,mt6358-regulator', 'mediatek,mt6358-rtc', 'mediatek,mt6358-sound', 'mediatek,mt6397-rtc', 'mediatek,mt6397-regulator', 'mediatek,mt6397-codec', 'mediatek,mt6397-clk', 'mediatek,mt6397-pinctrl', 'mediatek,mt6397-keys', 'mediatek,mt6323', 'mediatek,mt6358', 'mediatek,mt6397') : 160,	
-	('marvell,sd8897', 'marvell,sd8997') : 2029,	
-	('samsung,s5m8767-clk', 'samsung,s2mps11-clk', 'samsung,s2mps13-clk', 'samsung,s2mps14-clk', 'samsung,s2mps13-clk', 'samsung,s5m8767-pmic', 'samsung,s2mps11-pmic', 'samsung,s2mps13-pmic', 'samsung,s2mps14-pmic', 'samsung,s2mps15-pmic', 'samsung,s2mpa01-pmic', 'samsung,s2mpu02-pmic') : 369,	
-	('pci11ab,2b42', 'pci1b4b,2b42') : 2091,	
-	('stericsson,ab8500-sysctrl',) : 102,	
-	('marvell,armada-375-pp2', 'marvell,armada-7k-pp22') : 4510,	
-	('maxim,max14577-muic', 'maxim,max14577-regulator', 'maxim,max14577-charger', 'maxim,max77836-muic', 'maxim,max77836-regulator', 'maxim,max77836-charger', 'maxim,max77836-battery', 'maxim,max14577', 'maxim,max77836') : 336,	
-	('st,stmpe610', 'st,stmpe801', 'st,stmpe811', 'st,stmpe1600', 'st,stmpe1601', 'st,stmpe1801', 'st,stmpe2401', 'st,stmpe2403') : 82,	
-	('atmel,at91sam9260-smc', 'atmel,sama5d3-smc', 'atmel,sama5d2-smc') : 121,	
-	('ti,ehci-omap', 'ti,ohci-omap3', 'ti,usbhs-host') : 559,	
-	('wlf,wm1811', 'wlf,wm8994', 'wlf,wm8958') : 447,	
-	('maxim,max77843-muic', 'maxim,max77843-regulator', 'maxim,max77843-charger', 'maxim,max77843-fuelgauge', 'maxim,max77843-haptic', 'maxim,max77843') : 138,	
-	('hisilicon,hi655x-pmic',) : 123,	
-	('ti,tps61050', 'ti,tps61052') : 146,	
-	('ti,tps6507x',) : 82,	
-	('samsung,exynos5433-lpass',) : 124,	
-	('maxim,max77650',) : 168,	
-	('rohm,bd9571mwv',) : 152,	
-	('altr,sys-mgr', 'altr,sys-mgr-s10') : 108,	
-	('maxim,max77686', 'maxim,max77802') : 177,	
-	('gw,gsc',) : 174,	
-	('cirrus,lochnagar1', 'cirrus,lochnagar2') : 271,	
-	('ti,tps65217-pmic', 'ti,tps65217-bl', 'ti,tps65217-charger', 'ti,tps65217-pwrbutton', 'ti,tps65217') : 254,	
-	('khadas,mcu',) : 102,	
-	('ams,as3711',) : 151,	
-	('altr,a10sr-gpio', 'altr,a10sr-reset', 'altr,a10sr') : 107,	
-	('ti,tps6586x',) : 406,	
-	('active-semi,act8945a-charger', 'active-semi,act8945a') : 50,	
-	('st,stw481x-vmmc', 'st,stw4810', 'st,stw4811') : 157,	
-	('fsl,imx23-lradc', 'fsl,imx28-lradc') : 180,	
-	('SUNW,niusl',) : 6996,	
-	('dlg,da9055-gpio', 'dlg,da9055-regulator', 'dlg,da9055-regulator', 'dlg,da9055-regulator', 'dlg,da9055-regulator', 'dlg,da9055-regulator', 'dlg,da9055-regulator', 'dlg,da9055-regulator', 'dlg,da9055-regulator', 'dlg,da9055-onkey', 'dlg,da9055-rtc', 'dlg,da9055-hwmon', 'dlg,da9055-watchdog') : 319,	
-	('ti,tps65090-charger', 'ti,tps65090') : 168,	
-	('ti,lp87565', 'ti,lp87524-q1', 'ti,lp87565-q1', 'ti,lp87561-q1') : 63,	
-	('ricoh,rn5t567', 'ricoh,rn5t618', 'ricoh,rc5t619') : 193,	
-	('richtek,rt5033-charger', 'richtek,rt5033-battery', 'richtek,rt5033-led', 'richtek,rt5033') : 85,	
-	('rohm,bd70528',) : 223,	
-	('fsl,imx25-tsadc',) : 127,	
-	('ti,twl4030-power', 'ti,twl4030-power-reset', 'ti,twl4030-power-idle', 'ti,twl4030-power-idle-osc-off', 'ti,twl4030-power-omap3-sdp', 'ti,twl4030-power-omap3-ldp', 'ti,twl4030-power-omap3-evm') : 640,	
-	('x-powers,ac100',) : 85,	
-	('azoteq,iqs620a-keys', 'azoteq,iqs620a-pwm', 'azoteq,iqs620a-keys', 'azoteq,iqs620a-pwm', 'azoteq,iqs621-keys', 'azoteq,iqs622-keys', 'azoteq,iqs624-keys', 'azoteq,iqs625-keys', 'azoteq,iqs620a', 'azoteq,iqs621', 'azoteq,iqs622', 'azoteq,iqs624', 'azoteq,iqs625') : 717,	
-	('ti,twl4030-audio',) : 176,	
-	('st,stmpe610', 'st,stmpe801', 'st,stmpe811', 'st,stmpe1601', 'st,stmpe2401', 'st,stmpe2403') : 94,	
-	('x-powers,axp152', 'x-powers,axp202', 'x-powers,axp209', 'x-powers,axp221', 'x-powers,axp223', 'x-powers,axp803', 'x-powers,axp806') : 68,	
-	('cirrus,cs47l15', 'cirrus,cs47l35', 'cirrus,cs47l85', 'cirrus,cs47l90', 'cirrus,cs47l91', 'cirrus,cs42l92', 'cirrus,cs47l92', 'cirrus,cs47l93', 'cirrus,wm1840') : 497,	
-	('maxim,max8907',) : 245,	
-	('dlg,da9052', 'dlg,da9053-aa', 'dlg,da9053-ba', 'dlg,da9053-bb', 'dlg,da9053-bc') : 135,	
-	('ti,tps65218-pwrbutton', 'ti,tps65218-gpio', 'ti,tps65218') : 226,	
-	('rohm,bd71837', 'rohm,bd71847', 'rohm,bd71850') : 166,	
-	('rohm,bd71828-leds', 'rohm,bd71828') : 258,	
-	('qcom,ssbi',) : 201,	
-	('maxim,max8997-pmic',) : 360,	
-	('stericsson,ab3100-regulators',) : 530,	
-	('ti,lp8733', 'ti,lp8732') : 54,	
-	('ti,tps65086',) : 90,	
-	('brcm,bcm2835-pm-wdt', 'brcm,bcm2835-pm') : 58,	
-	('brcm,bcm59056',) : 76,	
-	('ti,lp3943-pwm', 'ti,lp3943-gpio', 'ti,lp3943') : 84,	
-	('zii,rave-sp-niu', 'zii,rave-sp-mezz', 'zii,rave-sp-esb', 'zii,rave-sp-rdu1', 'zii,rave-sp-rdu2') : 443,	
-	('st,stm32-timers',) : 182,	
-	('nokia,retu', 'nokia,tahvo') : 208,	
-	('skyworks,sky81452-backlight', 'skyworks,sky81452') : 56,	
-	('ams,as3722',) : 308,	
-	('motorola,cpcap', 'st,6556002', 'motorola,mapphone-cpcap-adc', 'motorola,cpcap-battery', 'motorola,mapphone-cpcap-charger', 'motorola,mapphone-cpcap-regulator', 'motorola,cpcap-rtc', 'motorola,cpcap-pwrbutton', 'motorola,mapphone-cpcap-usb-phy', 'motorola,cpcap-led-red', 'motorola,cpcap-led-green', 'motorola,cpcap-led-blue', 'motorola,cpcap-led-adl', 'motorola,cpcap-led-cp') : 229,	
-	('x-powers,axp223', 'x-powers,axp803', 'x-powers,axp806', 'x-powers,axp809', 'x-powers,axp813') : 46,	
-	('arm,vexpress-sysreg,sys_led', 'arm,vexpress-sysreg,sys_mci', 'arm,vexpress-sysreg,sys_flash', 'arm,vexpress-sysreg') : 99,	
-	('smi,sm501',) : 1027,	
-	('maxim,max77693-charger', 'maxim,max77693-muic', 'maxim,max77693-haptic', 'maxim,max77693-led', 'maxim,max77693') : 263,	
-	('dlg,da9061-onkey', 'dlg,da9061', 'dlg,da9062') : 542,	
-	('snps,arc-uart',) : 339,	
-	('stericsson,abx500-clk', 'stericsson,ab8500-gpadc', 'stericsson,ab9540-gpio', 'stericsson,ab8500-debug', 'stericsson,ab8500-sysctrl', 'stericsson,ab8505-regulator', 'stericsson,ab8500-clk', 'stericsson,ab8500-gpadc', 'stericsson,ab8500-rtc', 'stericsson,ab8500-acc-det', 'stericsson,ab8500-poweron-key', 'stericsson,ab8500-pwm', 'stericsson,ab8505-gpio', 'stericsson,ab8500-usb', 'stericsson,ab8500-codec', 'stericsson,abx500-clk', 'stericsson,ab8500-gpadc', 'stericsson,ab8500-rtc', 'stericsson,ab8540-rtc') : 814,	
-	('litex,liteuart',) : 233,	
-	('nxp,lpc3220-hsuart',) : 473,	
-	('via,vt8500-uart', 'wm,wm8880-uart') : 464,	
-	('qca,ar9330-uart',) : 557,	
-	('ALTR,juart-1.0', 'altr,juart-1.0') : 325,	
-	('fsl,s32v234-linflexuart',) : 574,	
-	('brcm,bcm6345-uart',) : 525,	
-	('marvell,armada-3700-uart', 'marvell,armada-3700-uart-ext') : 623,	
-	('actions,s500-uart', 'actions,s900-uart') : 499,	
-	('PowerPC,8323', 'ucc_uart', 'fsl,t1040-ucc-uart') : 855,	
-	('cnxt,cx92755-usart',) : 350,	
-	('nvidia,tegra194-tcu',) : 192,	
-	('arm,mps2-uart',) : 381,	
-	('socionext,milbeaut-usio-uart',) : 429,	
-	('sab82532',) : 700,	
-	('maxim,max3107', 'maxim,max3108', 'maxim,max3109', 'maxim,max14830') : 955,	
-	('nvidia,tegra20-uart',) : 130,	
-	('energymicro,efm32-uart', 'efm32,uart') : 563,	
-	('nxp,sc16is740', 'nxp,sc16is741', 'nxp,sc16is750', 'nxp,sc16is752', 'nxp,sc16is760', 'nxp,sc16is762') : 945,	
-	('sprd,sc9836-uart',) : 844,	
-	('lantiq,asc', 'intel,lgm-asc') : 652,	
-	('cirrus,ep7209-uart',) : 364,	
-	('ingenic,jz4740-uart', 'ingenic,jz4760-uart', 'ingenic,jz4770-uart', 'ingenic,jz4775-uart', 'ingenic,jz4780-uart', 'ingenic,x1000-uart') : 226,	
-	('ns8250', 'ns16450', 'ns16550a', 'ns16550', 'ns16750', 'ns16850', 'nxp,lpc3220-uart', 'ralink,rt2880-uart', 'intel,xscale-uart', 'altr,16550-FIFO32', 'altr,16550-FIFO64', 'altr,16550-FIFO128', 'mediatek,mtk-btif', 'mrvl,mmp-uart', 'ti,da830-uart', 'nuvoton,npcm750-uart') : 231,	
-	('sifive,fu540-c000-uart0', 'sifive,uart0') : 507,	
-	('mrvl,pxa-uart', 'mrvl,mmp-uart') : 114,	
-	('st,stm32-uart', 'st,stm32f7-uart', 'st,stm32h7-uart') : 997,	
-	('stericsson,ab8500', 'stericsson,ab8505', 'stericsson,db8500-prcmu') : 1940,	
-	('rda,8810pl-uart',) : 537,	
-	('socionext,uniphier-uart',) : 181,	
-	('aspeed,ast2400-vuart', 'aspeed,ast2500-vuart') : 321,	
-	('renesas,em-uart',) : 111,	
-	('fsl,cpm1-smc-uart', 'fsl,cpm1-scc-uart', 'fsl,cpm2-smc-uart', 'fsl,cpm2-scc-uart') : 883,	
-	('brcm,bcm2835-aux-uart',) : 120,	
-	('nxp,lpc1850-uart',) : 142,	
-	('atmel,at91rm9200-usart-serial',) : 1732,	
-	('su', 'su') : 973,	
-	('snps,dw-apb-uart', 'cavium,octeon-3860-uart', 'marvell,armada-38x-uart', 'renesas,rzn1-uart') : 416,	
-	('mediatek,mt6577-uart',) : 450,	
-	('arm,sbsa-uart',) : 1659,	
-	('fsl,imx6q-uart', 'fsl,imx53-uart', 'fsl,imx1-uart', 'fsl,imx21-uart') : 1612,	
-	('fsl,vf610-lpuart', 'fsl,ls1021a-lpuart', 'fsl,ls1028a-lpuart', 'fsl,imx7ulp-lpuart', 'fsl,imx8qxp-lpuart') : 1795,	
-	('ALTR,uart-1.0', 'altr,uart-1.0') : 421,	
-	('qcn', 'SUNW,sun4v-console') : 393,	
-	('fsl,imx7d-gpc', 'fsl,imx8mq-gpc') : 434,	
-	('ti,keystone-irq',) : 145,	
-	('google,goldfish-tty',) : 306,	
-	('amlogic,meson-uart', 'amlogic,meson6-uart', 'amlogic,meson8-uart', 'amlogic,meson8b-uart', 'amlogic,meson-gx-uart') : 561,	
-	('microchip,pic32mzda-uart',) : 564,	
-	('xlnx,opb-uartlite-1.00.b', 'xlnx,xps-uartlite-1.00.a') : 480,	
-	('ibm,opal-console-raw', 'ibm,opal-console-hvsi') : 273,	
-	('ti,am654-uart', 'ti,omap2-uart', 'ti,omap3-uart', 'ti,omap4-uart', 'ti,am3352-uart', 'ti,am4372-uart', 'ti,dra742-uart') : 1009,	
-	('marvell,cp110-icu-nsr', 'marvell,cp110-icu-sei', 'marvell,cp110-icu') : 257,	
-	('nvidia,tegra210-agic',) : 100,	
-	('epapr,hv-byte-channel',) : 361,	
-	('xlnx,xuartps', 'cdns,uart-r1p8', 'cdns,uart-r1p12', 'xlnx,zynqmp-uart') : 947,	
-	('st,asc',) : 556,	
-	('arm,realview-eb11mp-revb-syscon', 'arm,realview-eb11mp-revc-syscon', 'arm,realview-eb-syscon', 'arm,realview-pb11mp-syscon') : 50,	
-	('nvidia,tegra210-ictlr', 'nvidia,tegra30-ictlr', 'nvidia,tegra20-ictlr') : 222,	
-	('ti,sci-intr',) : 175,	
-	('img,pdc-intc',) : 295,	
-	('ti,sci-inta',) : 400,	
-	('renesas,scif-r7s72100', 'renesas,scif-r7s9210', 'renesas,rcar-gen1-scif', 'renesas,rcar-gen2-scif', 'renesas,rcar-gen3-scif', 'renesas,scif', 'renesas,scifa', 'renesas,scifb', 'renesas,hscif', 'renesas,sci') : 2179,	
-	('qcom,geni-debug-uart', 'qcom,geni-uart') : 1075,	
-	('renesas,rza1-irqc',) : 189,	
-	('kontron,sl28cpld-intc',) : 67,	
-	('qcom,msm-uartdm-v1.1', 'qcom,msm-uartdm-v1.2', 'qcom,msm-uartdm-v1.3', 'qcom,msm-uartdm-v1.4', 'qcom,msm-uart', 'qcom,msm-uartdm') : 1259,	
-	('fsl,imx28-auart', 'fsl,imx23-auart', 'alphascale,asm9260-auart') : 1081,	
-	('ti,omap2-uart', 'ti,omap3-uart', 'ti,omap4-uart') : 1181,	
-	('atmel,at91rm9200', 'atmel,at91sam9g45', 'atmel,at91sam9n12', 'atmel,at91sam9rl', 'atmel,at91sam9x5', 'atmel,at91sam9260', 'atmel,at91sam9261', 'atmel,at91sam9263', 'atmel,at91sam9g20') : 170,	
-	('atmel,sama5d3', 'atmel,sama5d4', 'microchip,sam9x60') : 260,	
-	('fsl,mpc5200b-psc-uart', 'fsl,mpc5200-psc-uart', 'mpc5200-psc-uart', 'mpc5200-serial', 'fsl,mpc5121-psc-uart', 'fsl,mpc5125-psc-uart') : 1143,	
-	('fsl,imx-irqsteer',) : 198,	
-	('hisilicon,mbigen-v2',) : 221,	
-	('fsl,1s1021a-msi', 'fsl,1s1043a-msi', 'fsl,ls1012a-msi', 'fsl,ls1021a-msi', 'fsl,ls1043a-msi', 'fsl,ls1043a-v1.1-msi', 'fsl,ls1046a-msi') : 290,	
-	('renesas,irqc',) : 180,	
-	('socionext,uniphier-ld4-aidet', 'socionext,uniphier-pro4-aidet', 'socionext,uniphier-sld8-aidet', 'socionext,uniphier-pro5-aidet', 'socionext,uniphier-pxs2-aidet', 'socionext,uniphier-ld11-aidet', 'socionext,uniphier-ld20-aidet', 'socionext,uniphier-pxs3-aidet') : 172,	
-	('sirf,prima2-uart', 'sirf,atlas7-uart', 'sirf,prima2-usp-uart', 'sirf,atlas7-usp-uart') : 1192,	
-	('amlogic,meson8-gpio-intc', 'amlogic,meson8b-gpio-intc', 'amlogic,meson-gxbb-gpio-intc', 'amlogic,meson-gxl-gpio-intc', 'amlogic,meson-axg-gpio-intc', 'amlogic,meson-g12a-gpio-intc', 'amlogic,meson-sm1-gpio-intc', 'amlogic,meson-a1-gpio-intc') : 326,	
-	('st,stih415-irq-syscfg', 'st,stih416-irq-syscfg', 'st,stih407-irq-syscfg', 'st,stid127-irq-syscfg') : 132,	
-	('marvell,armada-8k-pic',) : 117,	
-	('ti,pruss-intc', 'ti,icssg-intc') : 367,	
-	('fsl,imx-intmux',) : 207,	
-	('samsung,s3c2410-uart', 'samsung,s3c2412-uart', 'samsung,s3c2440-uart', 'samsung,s3c6400-uart', 'samsung,s5pv210-uart', 'samsung,exynos4210-uart', 'samsung,exynos5433-uart') : 1748,	
-	('technologic,ts4800-irqc',) : 100,	
-	('marvell,ap806-gicp',) : 174,	
-	('samsung,exynos5250-trng',) : 0,	
-	('qcom,msm8996-gic-v3',) : 1339,	
-	('xiphera,xip8001b-trng',) : 90,	
-	('marvell,ap806-sei',) : 327,	
-	('fsl,imx21-rnga', 'fsl,imx31-rnga') : 125,	
-	('st,stm32mp1-exti',) : 643,	
-	('brcm,bcm2835-rng', 'brcm,bcm-nsp-rng', 'brcm,bcm5301x-rng', 'brcm,bcm6368-rng') : 126,	
-	('atmel,at91sam9g45-trng', 'microchip,sam9x60-trng') : 116,	
-	('fsl,imx25-rngb',) : 207,	
-	('renesas,intc-irqpin', 'renesas,intc-irqpin-r8a7778', 'renesas,intc-irqpin-r8a7779', 'renesas,intc-irqpin-r8a7740', 'renesas,intc-irqpin-sh73a0') : 371,	
-	('ingenic,x1830-dtrng',) : 0,	
-	('nuvoton,npcm750-rng',) : 121,	
-	('brcm,bcm2711-rng200', 'brcm,bcm7211-rng200', 'brcm,bcm7278-rng200', 'brcm,iproc-rng200') : 139,	
-	('ingenic,jz4780-rng', 'ingenic,x1000-rng') : 0,	
-	('hisilicon,hip04-rng', 'hisilicon,hip05-rng') : 72,	
-	('mediatek,mt7623-rng',) : 125,	
-	('nokia,n900-rom-rng',) : 112,	
-	('st,rng',) : 83,	
-	('amlogic,meson-rng',) : 61,	
-	('timeriomem_rng',) : 120,	
-	('silex-insight,ba431-rng',) : 146,	
-	('apm,xgene-rng',) : 254,	
-	('ibm,opal-ipmi',) : 198,	
-	('xillybus,xillybus-1.00.a', 'xlnx,xillybus-1.00.a') : 99,	
-	('ti,keystone-rng',) : 162,	
-	('st,stm32-rng',) : 141,	
-	('socionext,synquacer-tpm-mmio',) : 113,	
-	('arm,cryptocell-713-trng', 'arm,cryptocell-703-trng') : 389,	
-	('nuvoton,npcm750-kcs-bmc',) : 132,	
-	('ibm,opal-oppanel',) : 144,	
-	('ipmi-kcs', 'ipmi-smic', 'ipmi-bt') : 331,	
-	('atmel,at97sc3204t',) : 124,	
-	('microsoft,ftpm',) : 217,	
-	('aspeed,ast2400-kcs-bmc', 'aspeed,ast2500-kcs-bmc', 'aspeed,ast2400-kcs-bmc-v2', 'aspeed,ast2500-kcs-bmc-v2') : 285,	
-	('xlnx,opb-hwicap-1.00.b', 'xlnx,xps-hwicap-1.00.a') : 552,	
-	('aspeed,ast2400-ibt-bmc', 'aspeed,ast2500-ibt-bmc') : 312,	
-	('tcg,tpm-tis-mmio',) : 252,	
-	('st,st33htpm-spi', 'infineon,slb9670', 'tcg,tpm_tis-spi', 'google,cr50') : 179,	
-	('st,st33zp24-i2c',) : 164,	
-	('rockchip,rk3368-mailbox',) : 167,	
-	('st,st33zp24-spi',) : 245,	
-	('infineon,tpm_i2c_infineon', 'infineon,slb9635tt', 'infineon,slb9645tt') : 406,	
-	('qcom,ipq6018-apcs-apps-global', 'qcom,ipq8074-apcs-apps-global', 'qcom,msm8916-apcs-kpss-global', 'qcom,msm8994-apcs-kpss-global', 'qcom,msm8996-apcs-hmss-global', 'qcom,msm8998-apcs-hmss-global', 'qcom,qcs404-apcs-apps-global', 'qcom,sc7180-apss-shared', 'qcom,sdm660-apcs-hmss-global', 'qcom,sdm845-apss-shared', 'qcom,sm8150-apss-shared') : 120,	
-	('brcm,bcm2835-mbox',) : 119,	
-	('nuvoton,npct501', 'winbond,wpct301', 'nuvoton,npct601') : 438,	
-	('altr,mailbox-1.0',) : 218,	
-	('allwinner,sun6i-a31-msgbox',) : 194,	
-	('apm,xgene-slimpro-mbox',) : 151,	
-	('st,stm32mp1-ipcc',) : 246,	
-	('ti,k2g-message-manager', 'ti,am654-secure-proxy') : 467,	
-	('qcom,ipcc',) : 170,	
-	('sprd,sc9860-mailbox',) : 214,	
-	('hisilicon,hi6220-mbox',) : 231,	
-	('amlogic,meson-gxbb-mhu',) : 117,	
-	('fsl,imx7ulp-mu', 'fsl,imx6sx-mu', 'fsl,imx8-mu-scu') : 432,	
-	('st,stih407-mailbox',) : 302,	
-	('xlnx,zynqmp-ipi-mailbox',) : 423,	
-	('marvell,armada-3700-rwtm-mailbox',) : 131,	
-	('nvidia,tegra186-hsp', 'nvidia,tegra194-hsp') : 511,	
-	('hisilicon,hi3660-mbox',) : 176,	
-	('ti,am654-hbmc',) : 184,	
-	('mailbox-test',) : 292,	
-	('brcm,iproc-pdc-mbox', 'brcm,iproc-fa2-mbox') : 821,	
-	('hisilicon,fmc-spi-nor',) : 359,	
-	('ingenic,jz4780-bch',) : 180,	
-	('nxp,lpc1773-spifi',) : 331,	
-	('fsl,upm-nand',) : 189,	
-	('ingenic,jz4725b-bch',) : 184,	
-	('brcm,iproc-flexrm-mbox',) : 1085,	
-	('mediatek,mt8173-gce', 'mediatek,mt8183-gce', 'mediatek,mt6779-gce') : 417,	
-	('ingenic,jz4740-ecc',) : 124,	
-	('marvell,orion-nand',) : 167,	
-	('aspeed,ast2400-fmc', 'aspeed,ast2400-spi', 'aspeed,ast2500-fmc', 'aspeed,ast2500-spi') : 515,	
-	('ti,am3352-elm',) : 343,	
-	('ingenic,jz4740-nand', 'ingenic,jz4725b-nand', 'ingenic,jz4780-nand') : 376,	
-	('nxp,lpc3220-mlc',) : 538,	
-	('fsl,mpc5121-nfc',) : 512,	
-	('samsung,s3c2410-nand', 'samsung,s3c2412-nand', 'samsung,s3c2440-nand') : 709,	
-	('altr,socfpga-denali-nand', 'socionext,uniphier-denali-nand-v5a', 'socionext,uniphier-denali-nand-v5b') : 179,	
-	('hisilicon,504-nfc',) : 594,	
-	('oxsemi,ox820-nand',) : 130,	
-	('fsl,vf610-nfc',) : 559,	
-	('amlogic,meson-gxl-nfc', 'amlogic,meson-axg-nfc') : 993,	
-	('gpio-control-nand',) : 259,	
-	('xlnx,zynqmp-nand-controller', 'arasan,nfc-v3p10') : 837,	
-	('nvidia,tegra20-nand',) : 845,	
-	('ibm,ndfc',) : 168,	
-	('atmel,sama5d4-nand', 'atmel,sama5d2-nand', 'atmel,at91sam9g45-pmecc', 'atmel,sama5d4-pmecc', 'atmel,sama5d2-pmecc') : 629,	
-	('mxic,multi-itfc-v009-nand-controller',) : 419,	
-	('sigma,smp8758-nand',) : 466,	
-	('intel,nand-controller', 'intel,lgm-ebunand') : 501,	
-	('rockchip,px30-nfc', 'rockchip,rk2928-nfc', 'rockchip,rv1108-nfc') : 930,	
-	('brcm,brcmnand',) : 21,	
-	('gen_nand',) : 99,	
-	('brcm,nand-bcm6368',) : 84,	
-	('fsl,elbc-fcm-nand',) : 619,	
-	('brcm,nand-iproc',) : 97,	
-	('brcm,nand-bcm63138',) : 65,	
-	('st,spear600-fsmc-nand', 'stericsson,fsmc-nand') : 717,	
-	('renesas,shmobile-flctl-sh7372',) : 813,	
-	('lantiq,nand-xway',) : 159,	
-	('fsl,ifc-nand',) : 725,	
-	('mediatek,mt2701-nfc', 'mediatek,mt2712-nfc', 'mediatek,mt7622-nfc') : 1078,	
-	('jedec,spi-nor',) : 1858,	
-	('microchip,mchp23k256', 'microchip,mchp23lcv1024') : 149,	
-	('nxp,lpc3220-slc',) : 583,	
-	('ti,davinci-nand', 'ti,keystone-nand') : 538,	
-	('fsl,imx23-gpmi-nand', 'fsl,imx28-gpmi-nand', 'fsl,imx6q-gpmi-nand', 'fsl,imx6sx-gpmi-nand', 'fsl,imx7d-gpmi-nand') : 1377,	
-	('mediatek,mt2701-ecc', 'mediatek,mt2712-ecc', 'mediatek,mt7622-ecc') : 387,	
-	('ibm,opal-flash',) : 142,	
-	('atmel,at91sam9260-matrix', 'atmel,at91sam9261-matrix', 'atmel,at91sam9263-matrix', 'atmel,at91sam9rl-matrix', 'atmel,at91sam9g45-matrix', 'atmel,at91sam9n12-matrix', 'atmel,at91sam9x5-matrix', 'microchip,sam9x60-sfr', 'atmel,at91rm9200-nand-controller', 'atmel,at91sam9260-nand-controller', 'atmel,at91sam9261-nand-controller', 'atmel,at91sam9g45-nand-controller', 'atmel,sama5d3-nand-controller', 'microchip,sam9x60-nand-controller', 'atmel,at91rm9200-nand', 'atmel,sama5d4-nand', 'atmel,sama5d2-nand') : 1632,	
-	('fsl,imx21-nand', 'fsl,imx27-nand', 'fsl,imx25-nand', 'fsl,imx51-nand', 'fsl,imx53-nand') : 1155,	
-	('allwinner,sun4i-a10-nand', 'allwinner,sun8i-a23-nand-controller') : 1456,	
-	('ti,omap2-onenand',) : 411,	
-	('cdns,hp-nfc',) : 1890,	
-	('brcm,bcm963xx-imagetag',) : 148,	
-	('fixed-partitions',) : 150,	
-	('brcm,bcm947xx-cfe-partitions',) : 175,	
-	('brcm,trx',) : 82,	
-	('marvell,armada-8k-nand-controller', 'marvell,armada370-nand-controller', 'marvell,pxa3xx-nand-controller', 'marvell,armada-8k-nand', 'marvell,armada370-nand', 'marvell,pxa3xx-nand') : 1810,	
-	('arm,arm-firmware-suite',) : 253,	
-	('st,stm32mp15-fmc2', 'st,stm32mp1-fmc2-nfc') : 1308,	
-	('brcm,bcm963xx-cfe-nor-partitions',) : 112,	
-	('arm,integrator-ap-syscon', 'arm,integrator-cp-syscon', 'arm,core-module-versatile', 'arm,realview-eb-syscon', 'arm,realview-pb1176-syscon', 'arm,realview-pb11mp-syscon', 'arm,realview-pba8-syscon', 'arm,realview-pbx-syscon', 'arm,external-bus-interface') : 149,	
-	('atmel,at45', 'atmel,dataflash') : 537,	
-	('redboot-fis',) : 205,	
-	('lantiq,nor',) : 127,	
-	('st,spear600-smi',) : 624,	
-	('ti,da850-ahci',) : 144,	
-	('ti,omap2-nand',) : 1399,	
-	('spi-nand',) : 799,	
-	('ti,dm816-ahci',) : 110,	
-	('brcm,bcm7425-ahci', 'brcm,bcm7445-ahci', 'brcm,bcm63138-ahci', 'brcm,bcm-nsp-ahci', 'brcm,bcm7216-ahci') : 392,	
-	('nvidia,tegra124-ahci', 'nvidia,tegra210-ahci') : 387,	
-	('cortina,gemini-sata-bridge',) : 266,	
-	('cfi-flash', 'jedec-flash', 'mtd-ram', 'mtd-rom', 'direct-mapped') : 438,	
-	('ata-generic',) : 54,	
-	('qcom,ipq806x-nand', 'qcom,ipq4019-nand', 'qcom,ipq6018-nand', 'qcom,ipq8074-nand', 'qcom,sdx55-nand') : 1784,	
-	('mediatek,mtk-ahci',) : 122,	
-	('allwinner,sun4i-a10-ahci', 'allwinner,sun8i-r40-ahci') : 171,	
-	('fsl,imx27-pata',) : 182,	
-	('marvell,armada-380-ahci', 'marvell,armada-3700-ahci') : 137,	
-	('cavium,octeon-7130-sata-uctl',) : 59,	
-	('fsl,ls1021a-ahci', 'fsl,ls1028a-ahci', 'fsl,ls1043a-ahci', 'fsl,ls2080a-ahci', 'fsl,ls1046a-ahci', 'fsl,ls1088a-ahci', 'fsl,ls2088a-ahci', 'fsl,lx2160a-ahci') : 272,	
-	('generic-ahci', 'snps,spear-ahci', 'ibm,476gtr-ahci', 'snps,dwc-ahci', 'hisilicon,hisi-ahci', 'cavium,octeon-7130-ahci') : 79,	
-	('arasan,cf-spear1340',) : 621,	
-	('calxeda,hb-ahci',) : 420,	
-	('st,spi-fsm',) : 1287,	
-	('ceva,ahci-1v84',) : 212,	
-	('st,ahci',) : 163,	
-	('m-systems,diskonchip-g3',) : 1143,	
-	('renesas,rcar-sata', 'renesas,sata-r8a7779', 'renesas,sata-r8a7790', 'renesas,sata-r8a7790-es1', 'renesas,sata-r8a7791', 'renesas,sata-r8a7793', 'renesas,sata-r8a7795', 'renesas,rcar-gen2-sata', 'renesas,rcar-gen3-sata') : 650,	
-	('faraday,ftide010',) : 341,	
-	('nvidia,tegra30-ahb', 'nvidia,tegra20-ahb') : 206,	
-	('cavium,ebt3000-compact-flash',) : 645,	
-	('fsl,elbc-gpcm-uio', 'fsl,elbc-gpcm-uio') : 267,	
-	('fsl,imx53-ahci', 'fsl,imx6q-ahci', 'fsl,imx6qp-ahci', 'fsl,imx8qm-ahci') : 859,	
-	('fsl,imx21-owire',) : 103,	
-	('w1-gpio',) : 112,	
-	('allwinner,sun50i-a64-de2',) : 24,	
-	('fsl,pq-sata', 'fsl,pq-sata-v2') : 971,	
-	('fsl,mpc5200-ata', 'mpc5200-ata') : 569,	
-	('ti,da850-mstpri',) : 166,	
-	('apm,xgene-ahci', 'apm,xgene-ahci-v2') : 477,	
-	('brcm,brcmnand-v2.1', 'brcm,brcmnand-v2.2', 'brcm,brcmnand-v4.0', 'brcm,brcmnand-v5.0', 'brcm,brcmnand-v6.0', 'brcm,brcmnand-v6.1', 'brcm,brcmnand-v6.2', 'brcm,brcmnand-v7.0', 'brcm,brcmnand-v7.1', 'brcm,brcmnand-v7.2', 'brcm,brcmnand-v7.3') : 2083,	
-	('ti,omap4-l3-noc', 'ti,omap5-l3-noc', 'ti,dra7-l3-noc', 'ti,am4372-l3-noc') : 203,	
-	('baikal,bt1-apb',) : 244,	
-	('ti,omap3-l3-smx',) : 191,	
-	('ti,omap3-1w', 'ti,am4372-hdq') : 430,	
-	('technologic,ts-nbus',) : 185,	
-	('nvidia,tegra210-aconnect',) : 69,	
-	('baikal,bt1-axi',) : 180,	
-	('brcm,gisb-arb', 'brcm,bcm7445-gisb-arb', 'brcm,bcm7435-gisb-arb', 'brcm,bcm7400-gisb-arb', 'brcm,bcm7278-gisb-arb', 'brcm,bcm7038-gisb-arb') : 362,	
-	('amcc,sata-460ex',) : 828,	
-	('simple-pm-bus',) : 29,	
-	('hisilicon,hip06-lpc', 'hisilicon,hip07-lpc') : 387,	
-	('socionext,uniphier-system-bus',) : 170,	
-	('ti,omap-ocp2scp', 'ti,am437x-ocp2scp') : 64,	
-	('arm,integrator-ap-syscon', 'arm,integrator-ap-lm') : 76,	
-	('allwinner,sun8i-a23-rsb',) : 452,	
-	('qcom,msm8660-ebi2', 'qcom,apq8060-ebi2') : 226,	
-	('fsl,qoriq-mc',) : 674,	
-	('fsl,imx1-weim', 'fsl,imx27-weim', 'fsl,imx50-weim', 'fsl,imx6q-weim', 'fsl,imx51-weim') : 185,	
-	('nvidia,tegra20-gmi', 'nvidia,tegra30-gmi') : 179,	
-	('qcom,wcnss-bt',) : 134,	
-	('arm,cci-400', 'arm,cci-500', 'arm,cci-550', 'arm,cci-400-ctrl-if') : 254,	
-	('cznic,moxtet',) : 554,	
-	('fsl,imx8mq-noc', 'fsl,imx8mm-noc', 'fsl,imx8mn-noc', 'fsl,imx8m-noc', 'fsl,imx8m-nic') : 111,	
-	('rockchip,rk3399-dfi',) : 149,	
-	('samsung,exynos5420-nocp',) : 193,	
-	('ti,cc2560', 'ti,wl1271-st', 'ti,wl1273-st', 'ti,wl1281-st', 'ti,wl1283-st', 'ti,wl1285-st', 'ti,wl1801-st', 'ti,wl1805-st', 'ti,wl1807-st', 'ti,wl1831-st', 'ti,wl1835-st', 'ti,wl1837-st') : 486,	
-	('mrvl,88w8897',) : 280,	
-	('marvell,armada370-mbus', 'marvell,armada375-mbus', 'marvell,armada380-mbus', 'marvell,armadaxp-mbus', 'marvell,kirkwood-mbus', 'marvell,dove-mbus', 'marvell,orion5x-88f5281-mbus', 'marvell,orion5x-88f5182-mbus', 'marvell,orion5x-88f5181-mbus', 'marvell,orion5x-88f6183-mbus', 'marvell,mv78xx0-mbus') : 804,	
-	('samsung,exynos-bus',) : 327,	
-	('rockchip,rk3399-dmc',) : 356,	
-	('nokia,h4p-bluetooth',) : 536,	
-	('fsl,imx8m-ddrc',) : 284,	
-	('samsung,exynos-ppmu', 'samsung,exynos-ppmu-v2') : 486,	
-	('qcom,adreno', 'qcom,mdp4', 'qcom,mdss', 'qcom,sc7180-mdss', 'qcom,sc7180-mss-pil', 'qcom,sdm845-mdss', 'qcom,sdm845-mss-pil', 'qcom,msm8998-smmu-v2', 'qcom,sc7180-smmu-500', 'qcom,sdm630-smmu-v2', 'qcom,sdm845-smmu-500', 'qcom,sm8150-smmu-500', 'qcom,sm8250-smmu-500') : 182,	
-	('realtek,rtl8822cs-bt', 'realtek,rtl8723bs-bt') : 667,	
-	('mediatek,mt7622-bluetooth', 'mediatek,mt7663u-bluetooth', 'mediatek,mt7668u-bluetooth') : 722,	
-	('mediatek,mt2701-m4u',) : 461,	
-	('nvidia,tegra30-actmon', 'nvidia,tegra124-actmon') : 557,	
-	('lltc,lt3593',) : 79,	
-	('qcom,spmi-pmic-arb',) : 875,	
-	('mediatek,mt2712-m4u', 'mediatek,mt6779-m4u', 'mediatek,mt8167-m4u', 'mediatek,mt8173-m4u', 'mediatek,mt8183-m4u') : 587,	
-	('brcm,bcm20702a1', 'brcm,bcm4329-bt', 'brcm,bcm4345c5', 'brcm,bcm4330-bt', 'brcm,bcm43438-bt', 'brcm,bcm43540-bt', 'brcm,bcm4335a0') : 823,	
-	('cznic,turris-omnia-leds',) : 183,	
-	('qcom,msm-iommu-v1-ns', 'qcom,msm-iommu-v1-sec', 'qcom,msm-iommu-v1') : 568,	
-	('ti,lp8860',) : 360,	
-	('pwm-leds',) : 111,	
-	('ti,lp5562',) : 389,	
-	('marvell,sd8897-bt', 'marvell,sd8997-bt') : 1181,	
-	('renesas,ipmmu-vmsa', 'renesas,ipmmu-r8a774a1', 'renesas,ipmmu-r8a774b1', 'renesas,ipmmu-r8a774c0', 'renesas,ipmmu-r8a774e1', 'renesas,ipmmu-r8a7795', 'renesas,ipmmu-r8a7796', 'renesas,ipmmu-r8a77961', 'renesas,ipmmu-r8a77965', 'renesas,ipmmu-r8a77970', 'renesas,ipmmu-r8a77990', 'renesas,ipmmu-r8a77995') : 654,	
-	('ti,lp8501',) : 255,	
-	('rockchip,iommu',) : 765,	
-	('allwinner,sun50i-h6-iommu',) : 621,	
-	('kinetic,ktd2692',) : 251,	
-	('qcom,apq8064-iommu',) : 555,	
-	('ubnt,acb-spi-led',) : 84,	
-	('ti,lm3532',) : 505,	
-	('issi,is31fl3190', 'issi,is31fl3191', 'issi,is31fl3193', 'issi,is31fl3196', 'issi,is31fl3199', 'si-en,sn3199') : 287,	
-	('fsl,qoriq-device-config-1.0', 'fsl,qoriq-device-config-2.0', 'fsl,t4240-l3-cache-controller', 'fsl,b4860-l3-cache-controller', 'fsl,p4080-l3-cache-controller') : 685,	
-	('issi,is31fl3236', 'issi,is31fl3235', 'issi,is31fl3218', 'si-en,sn3218', 'issi,is31fl3216', 'si-en,sn3216') : 283,	
-	('national,lp5521',) : 400,	
-	('mediatek,mt6323-led',) : 301,	
-	('nvidia,tegra30-ahb',) : 698,	
-	('lacie,ns2-leds',) : 179,	
-	('maxim,max77693-led',) : 674,	
-	('qcom,qca6174-bt', 'qcom,qca6390-bt', 'qcom,qca9377-bt', 'qcom,wcn3990-bt', 'qcom,wcn3991-bt', 'qcom,wcn3998-bt') : 1405,	
-	('richtek,rt8515',) : 214,	
-	('skyworks,aat1290',) : 339,	
-	('ti,omap2-iommu', 'ti,omap4-iommu', 'ti,dra7-iommu', 'ti,dra7-dsp-iommu') : 1044,	
-	('marvell,armada-370-sata', 'marvell,orion-sata') : 2599,	
-	('gpio-leds',) : 210,	
-	('crane,cr0014114',) : 183,	
-	('qcom,pm8058-led', 'qcom,pm8058-keypad-led', 'qcom,pm8058-flash-led') : 129,	
-	('sgmicro,sgm3140',) : 193,	
-	('motorola,cpcap-led-red', 'motorola,cpcap-led-green', 'motorola,cpcap-led-blue', 'motorola,cpcap-led-adl', 'motorola,cpcap-led-cp') : 149,	
-	('ti,lm3697',) : 261,	
-	('simple-bus', 'ti,sysc-omap2', 'ti,sysc-omap2-timer', 'ti,sysc-omap4', 'ti,sysc-omap4-timer', 'ti,sysc-omap4-simple', 'ti,sysc-omap3430-sr', 'ti,sysc-omap3630-sr', 'ti,sysc-omap4-sr', 'ti,sysc-omap3-sham', 'ti,sysc-omap-aes', 'ti,sysc-mcasp', 'ti,sysc-dra7-mcasp', 'ti,sysc-usb-host-fs', 'ti,sysc-dra7-mcan', 'ti,sysc-pruss') : 1897,	
-	('panasonic,an30259a',) : 246,	
-	('maxim,max77650-led',) : 96,	
-	('ti,tlc59116', 'ti,tlc59108') : 159,	
-	('register-bit-led',) : 94,	
-	('sprd,sc2731-bltc',) : 244,	
-	('ti,lm36010', 'ti,lm36011') : 314,	
-	('arm,smmu-v1', 'arm,smmu-v2', 'arm,mmu-400', 'arm,mmu-401', 'arm,mmu-500', 'cavium,smmu-v2', 'nvidia,smmu-500', 'qcom,smmu-v2') : 1487,	
-	('crane,el15203000',) : 199,	
-	('national,lp5523', 'ti,lp55231') : 669,	
-	('nxp,pca9550', 'nxp,pca9551', 'nxp,pca9552', 'ibm,pca9552', 'nxp,pca9553') : 357,	
-	('brcm,bcm6358-leds',) : 0,	
-	('brcm,bcm6328-leds',) : 0,	
-	('ti,lm36274-backlight',) : 104,	
-	('ti,lm36922', 'ti,lm36923') : 373,	
-	('awinic,aw2013',) : 281,	
-	('nxp,pca9632', 'nxp,pca9633', 'nxp,pca9634', 'nxp,pca9635') : 269,	
-	('ti,lp5009', 'ti,lp5012', 'ti,lp5018', 'ti,lp5024', 'ti,lp5030', 'ti,lp5036') : 446,	
-	('lacie,netxbig-leds',) : 420,	
-	('nxp,pca9530', 'nxp,pca9531', 'nxp,pca9532', 'nxp,pca9533') : 392,	
-	('SUNW,bbc-i2c',) : 278,	
-	('cirrus,ep7209-fb',) : 269,	
-	('ams,as3645a',) : 483,	
-	('ti,omap2-dss', 'ti,omap3-dss', 'ti,omap4-dss', 'ti,omap5-dss', 'ti,dra7-dss') : 1045,	
-	('ti,tca6507',) : 496,	
-	('wm,wm8505-fb',) : 276,	
-	('omapdss,panel-dpi',) : 198,	
-	('arm,smmu-v3',) : 2184,	
-	('simple-framebuffer',) : 354,	
-	('via,vt8500-fb',) : 343,	
-	('omapdss,sharp,ls037v7dw01',) : 204,	
-	('i2cpcf,8584',) : 600,	
-	('ti,omap2-venc', 'ti,omap3-venc', 'ti,omap4-venc') : 662,	
-	('omapdss,ti,tpd12s015',) : 200,	
-	('omapdss,hdmi-connector',) : 187,	
-	('omapdss,svideo-connector', 'omapdss,composite-video-connector') : 183,	
-	('usb1286,204e', 'usbcf3,e300', 'usb4ca,301a') : 2909,	
-	('ti,omap5-hdmi', 'ti,dra7-hdmi') : 504,	
-	('omapdss,dvi-connector',) : 206,	
-	('ti,omap4-hdmi',) : 530,	
-	('omapdss,tpo,td028ttec1', 'omapdss,toppoly,td028ttec1') : 302,	
-	('omapdss,ti,opa362',) : 162,	
-	('omapdss,ti,tfp410',) : 177,	
-	('wm,prizm-ge-rops',) : 118,	
-	('omapdss,lgphilips,lb035q02',) : 225,	
-	('atmel,at91sam9261-lcdc', 'atmel,at91sam9263-lcdc', 'atmel,at91sam9g10-lcdc', 'atmel,at91sam9g45-lcdc', 'atmel,at91sam9g45es-lcdc', 'atmel,at91sam9rl-lcdc') : 817,	
-	('omapdss,nec,nl8048hl11',) : 253,	
-	('opencores,ocfb',) : 281,	
-	('google,goldfish-fb',) : 239,	
-	('omapdss,tpo,td043mtea1',) : 406,	
-	('omapdss,sony,acx565akm',) : 558,	
-	('platform-lcd',) : 93,	
-	('xlnx,xps-tft-1.00.a', 'xlnx,xps-tft-2.00.a', 'xlnx,xps-tft-2.01.a', 'xlnx,plb-tft-cntlr-ref-1.00.a', 'xlnx,plb-dvi-cntlr-ref-1.00.c') : 283,	
-	('solomon,ssd1305fb-i2c', 'solomon,ssd1306fb-i2c', 'solomon,ssd1307fb-i2c', 'solomon,ssd1309fb-i2c') : 531,	
-	('marvell,pxa300-gcu',) : 435,	
-	('gpio-backlight',) : 84,	
-	('omapdss,panel-dsi-cm',) : 876,	
-	('skyworks,sky81452-backlight',) : 235,	
-	('ti,tps65217-bl',) : 206,	
-	('kinetic,ktd253',) : 125,	
-	('zii,rave-sp-backlight',) : 51,	
-	('pwm-backlight',) : 397,	
-	('arc,arc2c0608',) : 265,	
-	('led-backlight',) : 164,	
-	('fsl,imx1-fb', 'fsl,imx21-fb') : 705,	
-	('fujitsu,MB86276', 'fujitsu,lime', 'fujitsu,MB86277', 'fujitsu,mint', 'fujitsu,MB86293', 'fujitsu,MB86294', 'fujitsu,coral') : 858,	
-	('ti,lp8550', 'ti,lp8551', 'ti,lp8552', 'ti,lp8553', 'ti,lp8555', 'ti,lp8556', 'ti,lp8557') : 360,	
-	('marvell,pxa270-lcdc', 'marvell,pxa300-lcdc', 'marvell,pxa2xx-lcdc') : 1528,	
-	('himax,hx8357', 'himax,hx8369') : 452,	
-	('ti,emif-am3352', 'ti,emif-am4372') : 208,	
-	('fsl,ifc',) : 181,	
-	('ti,lm3630a',) : 433,	
-	('ti,davinci-aemif', 'ti,da850-aemif') : 269,	
-	('atmel,at91sam9260-ebi', 'atmel,at91sam9261-ebi', 'atmel,at91sam9263-ebi0', 'atmel,at91sam9263-ebi1', 'atmel,at91sam9rl-ebi', 'atmel,at91sam9g45-ebi', 'atmel,at91sam9x5-ebi', 'atmel,sama5d3-ebi', 'microchip,sam9x60-ebi') : 427,	
-	('atmel,at91rm9200-sdramc', 'atmel,at91sam9260-sdramc', 'atmel,at91sam9g45-ddramc', 'atmel,sama5d3-ddramc') : 43,	
-	('marvell,mvebu-devbus', 'marvell,orion-devbus') : 237,	
-	('brcm,bcm7268-dpfe-cpu', 'brcm,bcm7271-dpfe-cpu', 'brcm,bcm7278-dpfe-cpu', 'brcm,bcm7211-dpfe-cpu', 'brcm,dpfe-cpu') : 566,	
-	('baikal,bt1-l2-ctl',) : 201,	
-	('ingenic,jz4740-nemc', 'ingenic,jz4780-nemc') : 241,	
-	('fsl,mpc5121-diu', 'fsl,diu') : 1307,	
-	('mediatek,mt8167-smi-larb', 'mediatek,mt8173-smi-larb', 'mediatek,mt2701-smi-larb', 'mediatek,mt2712-smi-larb', 'mediatek,mt6779-smi-larb', 'mediatek,mt8183-smi-larb', 'mediatek,mt8192-smi-larb', 'mediatek,mt8173-smi-common', 'mediatek,mt8167-smi-common', 'mediatek,mt2701-smi-common', 'mediatek,mt2712-smi-common', 'mediatek,mt6779-smi-common', 'mediatek,mt8183-smi-common', 'mediatek,mt8192-smi-common') : 376,	
-	('cfi-flash', 'arm,pl353-nand-r2p1') : 271,	
-	('renesas,rcar-gen3-rpc-if',) : 425,	
-	('nvidia,tegra186-emc', 'nvidia,tegra194-emc') : 169,	
-	('qcom,pm8941-wled', 'qcom,pmi8998-wled', 'qcom,pm660l-wled', 'qcom,pm8150l-wled') : 1159,	
-	('ti,da850-ddr-controller',) : 88,	
-	('fsl,corenet1-cf', 'fsl,corenet2-cf') : 179,	
-	('st,stm32mp1-fmc2-ebi',) : 782,	
-	('nvidia,tegra20-mc-gart', 'nvidia,tegra30-mc', 'nvidia,tegra114-mc', 'nvidia,tegra124-mc', 'nvidia,tegra132-mc', 'nvidia,tegra210-mc') : 568,	
-	('adi,adgs1408', 'adi,adgs1409') : 84,	
-	('gpio-mux',) : 66,	
-	('adi,adg792a', 'adi,adg792g') : 99,	
-	('mmio-mux', 'reg-mux') : 97,	
-	('samsung,exynos5422-dmc',) : 807,	
-	('nvidia,tegra20-emc',) : 734,	
-	('ti,emif-4d', 'ti,emif-4d5') : 1050,	
-	('brcm,ptp-dte',) : 203,	
-	('nvidia,tegra124-emc', 'nvidia,tegra132-emc') : 906,	
-	('ti,omap2-dispc', 'ti,omap3-dispc', 'ti,omap4-dispc', 'ti,omap5-dispc', 'ti,dra7-dispc') : 3318,	
-	('qcom,slim', 'qcom,apq8064-slim') : 508,	
-	('atmel,at91rm9200-cf',) : 240,	
-	('renesas,pci-r8a7790', 'renesas,pci-r8a7791', 'renesas,pci-r8a7794', 'renesas,pci-rcar-gen2') : 238,	
-	('nvidia,tegra186-mc', 'nvidia,tegra194-mc') : 1129,	
-	('fsl,etsec-ptp', 'fsl,fman-ptp-timer') : 407,	
-	('ines,ptp-ctrl',) : 575,	
-	('cavium,pci-host-thunder-pem',) : 286,	
-	('brcm,iproc-pcie', 'brcm,iproc-pcie-paxb-v2', 'brcm,iproc-pcie-paxc', 'brcm,iproc-pcie-paxc-v2') : 90,	
-	('arm,versatile-pci',) : 96,	
-	('pci-host-cam-generic', 'pci-host-ecam-generic', 'marvell,armada8k-pcie-ecam', 'socionext,synquacer-pcie-ecam', 'snps,dw-pcie-ecam') : 46,	
-	('apm,xgene1-msi',) : 287,	
-	('mbvl,gpex40-pcie',) : 32,	
-	('xlnx,nwl-pcie-2.11',) : 552,	
-	('nvidia,tegra30-emc',) : 1120,	
-	('idt,82p33810', 'idt,82p33813', 'idt,82p33814', 'idt,82p33831', 'idt,82p33910', 'idt,82p33913', 'idt,82p33914', 'idt,82p33931') : 695,	
-	('fsl,lx2160a-pcie',) : 162,	
-	('nvidia,tegra210-emc',) : 1558,	
-	('apm,xgene-pcie',) : 419,	
-	('xlnx,axi-pcie-host-1.00.a',) : 345,	
-	('cdns,cdns-pcie-host', 'cdns,cdns-pcie-ep') : 119,	
-	('xlnx,opb-sysace-1.00.b', 'xlnx,opb-sysace-1.00.c', 'xlnx,xps-sysace-1.00.a', 'xlnx,sysace') : 744,	
-	('renesas,pcie-r8a7779', 'renesas,pcie-r8a7790', 'renesas,pcie-r8a7791', 'renesas,pcie-rcar-gen2', 'renesas,pcie-r8a7795', 'renesas,pcie-rcar-gen3') : 630,	
-	('qcom,slim-ngd-v1.5.0', 'qcom,slim-ngd-v2.1.0') : 1164,	
-	('sigma,smp8759-pcie',) : 210,	
-	('renesas,r8a774c0-pcie-ep', 'renesas,rcar-gen3-pcie-ep') : 369,	
-	('qcom,soundwire-v1.3.0', 'qcom,soundwire-v1.5.1') : 648,	
-	('ti,omap2420-gpmc', 'ti,omap2430-gpmc', 'ti,omap3430-gpmc', 'ti,omap4430-gpmc', 'ti,am3352-gpmc') : 1612,	
-	('rockchip,rk3399-pcie',) : 695,	
-	('ti,j721e-pcie-host', 'ti,j721e-pcie-ep') : 320,	
-	('v3,v360epc-pci',) : 574,	
-	('altr,msi-1.0',) : 187,	
-	('cavium,pci-host-thunder-ecam',) : 261,	
-	('xlnx,versal-cpm-host-1.00',) : 381,	
-	('axis,artpec6-pcie', 'axis,artpec6-pcie-ep', 'axis,artpec7-pcie', 'axis,artpec7-pcie-ep') : 346,	
-	('marvell,armada8k-pcie',) : 217,	
-	('st,spear1340-pcie',) : 166,	
-	('ti,omap3-dsi', 'ti,omap4-dsi', 'ti,omap5-dsi') : 3580,	
-	('faraday,ftpci100', 'faraday,ftpci100-dual') : 386,	
-	('brcm,bcm2711-pcie', 'brcm,bcm7211-pcie', 'brcm,bcm7278-pcie', 'brcm,bcm7216-pcie', 'brcm,bcm7445-pcie') : 837,	
-	('marvell,armada-3700-pcie',) : 805,	
-	('intel,lgm-pcie',) : 283,	
-	('altr,pcie-root-port-1.0', 'altr,pcie-root-port-2.0') : 545,	
-	('idt,8a34000', 'idt,8a34001', 'idt,8a34002', 'idt,8a34003', 'idt,8a34004', 'idt,8a34005', 'idt,8a34006', 'idt,8a34007', 'idt,8a34008', 'idt,8a34009', 'idt,8a34010', 'idt,8a34011', 'idt,8a34012', 'idt,8a34013', 'idt,8a34014', 'idt,8a34015', 'idt,8a34016', 'idt,8a34017', 'idt,8a34018', 'idt,8a34019', 'idt,8a34040', 'idt,8a34041', 'idt,8a34042', 'idt,8a34043', 'idt,8a34044', 'idt,8a34045', 'idt,8a34046', 'idt,8a34047', 'idt,8a34048', 'idt,8a34049') : 1555,	
-	('snps,dw-pcie', 'snps,dw-pcie-ep') : 128,	
-	('socionext,uniphier-pcie',) : 271,	
-	('hisilicon,kirin960-pcie',) : 320,	
-	('fsl,ls1012a-pcie', 'fsl,ls1021a-pcie', 'fsl,ls1028a-pcie', 'fsl,ls1043a-pcie', 'fsl,ls1046a-pcie', 'fsl,ls2080a-pcie', 'fsl,ls2085a-pcie', 'fsl,ls2088a-pcie', 'fsl,ls1088a-pcie') : 174,	
-	('amlogic,axg-pcie', 'amlogic,g12a-pcie') : 309,	
-	('marvell,armada-xp-pcie', 'marvell,armada-370-pcie', 'marvell,dove-pcie', 'marvell,kirkwood-pcie') : 701,	
-	('hisilicon,hi3798cv200-pcie',) : 297,	
-	('fsl,ls1046a-pcie-ep', 'fsl,ls1088a-pcie-ep', 'fsl,ls2088a-pcie-ep') : 109,	
-	('socionext,uniphier-pro5-pcie-ep',) : 220,	
-	('ti,keystone-pcie', 'ti,am654-pcie-rc', 'ti,am654-pcie-ep') : 833,	
-	('loongson,ls2k-pci', 'loongson,ls7a-pci', 'loongson,rs780e-pci') : 141,	
-	('amazon,al-alpine-v2-pcie', 'amazon,al-alpine-v3-pcie') : 244,	
-	('samsung,exynos5433-pcie',) : 283,	
-	('arm,idle-state',) : 234,	
-	('arm,psci-1.0',) : 207,	
-	('arm,idle-state', 'arm,vexpress,v2p-ca15_a7', 'google,peach') : 109,	
-	('ti,dra7-pcie', 'ti,dra7-pcie-ep', 'ti,dra746-pcie-rc', 'ti,dra726-pcie-rc', 'ti,dra746-pcie-ep', 'ti,dra726-pcie-ep') : 612,	
-	('fsl,imx6q-pcie', 'fsl,imx6sx-pcie', 'fsl,imx6qp-pcie', 'fsl,imx7d-pcie', 'fsl,imx8mq-pcie') : 823,	
-	('rockchip,rk3399-pcie-ep',) : 443,	
-	('qcom,idle-state-spc', 'qcom,msm8974-saw2-v2.1-cpu', 'qcom,apq8084-saw2-v2.1-cpu', 'qcom,apq8064-saw2-v1.1-cpu') : 221,	
-	('virtio,mmio', 'virtio,mmio') : 458,	
-	('via,vt8500-pinctrl',) : 307,	
-	('wm,wm8850-pinctrl',) : 233,	
-	('wm,wm8650-pinctrl',) : 220,	
-	('wm,wm8505-pinctrl',) : 329,	
-	('wm,wm8750-pinctrl',) : 247,	
-	('mediatek,mt2701-pcie', 'mediatek,mt7623-pcie', 'mediatek,mt2712-pcie', 'mediatek,mt7622-pcie', 'mediatek,mt7629-pcie') : 771,	
-	('marvell,berlin2-soc-pinctrl', 'marvell,berlin2-system-pinctrl') : 204,	
-	('marvell,berlin2cd-soc-pinctrl', 'marvell,berlin2cd-system-pinctrl') : 154,	
-	('nvidia,tegra194-pcie', 'nvidia,tegra194-pcie-ep') : 1547,	
-	('lantiq,pinctrl-falcon',) : 373,	
-	('sirf,prima2-rsc', 'sirf,prima2-pinctrl', 'sirf,atlas6-pinctrl') : 581,	
-	('nvidia,tegra186-pcie', 'nvidia,tegra210-pcie', 'nvidia,tegra124-pcie', 'nvidia,tegra30-pcie', 'nvidia,tegra20-pcie') : 1791,	
-	('syna,as370-soc-pinctrl',) : 338,	
-	('microchip,mcp23008', 'microchip,mcp23017', 'microchip,mcp23018', 'mcp,mcp23008', 'mcp,mcp23017') : 74,	
-	('qcom,pcie-apq8084', 'qcom,pcie-ipq8064', 'qcom,pcie-ipq8064-v2', 'qcom,pcie-apq8064', 'qcom,pcie-msm8996', 'qcom,pcie-ipq8074', 'qcom,pcie-ipq4019', 'qcom,pcie-qcs404', 'qcom,pcie-sdm845', 'qcom,pcie-sm8250') : 1059,	
-	('marvell,berlin2q-soc-pinctrl', 'marvell,berlin2q-system-pinctrl') : 365,	
-	('marvell,berlin4ct-soc-pinctrl', 'marvell,berlin4ct-avio-pinctrl', 'marvell,berlin4ct-system-pinctrl') : 445,	
-	('microchip,sparx5-sgpio', 'mscc,luton-sgpio', 'mscc,ocelot-sgpio') : 596,	
-	('semtech,sx1501q', 'semtech,sx1502q', 'semtech,sx1503q', 'semtech,sx1504q', 'semtech,sx1505q', 'semtech,sx1506q', 'semtech,sx1507q', 'semtech,sx1508q', 'semtech,sx1509q') : 853,	
-	('atmel,sama5d2-pinctrl', 'microchip,sama7g5-pinctrl') : 827,	
-	('zte,zx296718-pmm',) : 949,	
-	('stericsson,pinctrl-u300',) : 877,	
-	('socionext,uniphier-sld8-pinctrl',) : 639,	
-	('bitmain,bm1880-pinctrl',) : 1176,	
-	('socionext,uniphier-ld11-pinctrl',) : 674,	
-	('oxsemi,ox810se-pinctrl', 'oxsemi,ox820-pinctrl', 'oxsemi,ox810se-gpio', 'oxsemi,ox820-gpio') : 959,	
-	('brcm,bcm4708-pinmux', 'brcm,bcm4709-pinmux', 'brcm,bcm53012-pinmux') : 248,	
-	('socionext,uniphier-pxs3-pinctrl',) : 961,	
-	('brcm,nsp-pinmux',) : 405,	
-	('socionext,uniphier-ld4-pinctrl',) : 713,	
-	('socionext,uniphier-pxs2-pinctrl',) : 952,	
-	('socionext,uniphier-pro4-pinctrl',) : 1219,	
-	('ti,omap3-padconf', 'ti,omap4-padconf', 'ti,omap5-padconf', 'ti,dra7-padconf', 'ti,am437-padconf', 'pinctrl-single', 'pinconf-single') : 1216,	
-	('socionext,uniphier-pro5-pinctrl',) : 988,	
-	('socionext,uniphier-ld20-pinctrl',) : 790,	
-	('brcm,nsp-gpio-a',) : 460,	
-	('brcm,bcm11351-pinctrl',) : 928,	
-	('socionext,uniphier-ld6b-pinctrl',) : 924,	
-	('samsung,s3c2410-wakeup-eint', 'samsung,s3c2412-wakeup-eint') : 429,	
-	('samsung,s3c64xx-wakeup-eint',) : 505,	
-	('ams,as3722-pinctrl',) : 439,	
-	('brcm,iproc-gpio', 'brcm,cygnus-ccm-gpio', 'brcm,cygnus-asiu-gpio', 'brcm,cygnus-crmu-gpio', 'brcm,iproc-nsp-gpio', 'brcm,iproc-stingray-gpio') : 574,	
-	('samsung,s5pv210-wakeup-eint', 'samsung,exynos4210-wakeup-eint', 'samsung,exynos7-wakeup-eint') : 506,	
-	('brcm,ns2-pinmux',) : 742,	
-	('brcm,bcm2835-gpio', 'brcm,bcm2711-gpio', 'brcm,bcm7211-gpio') : 873,	
-	('cortina,gemini-pinctrl',) : 1829,	
-	('brcm,cygnus-pinmux',) : 716,	
-	('marvell,ap806-pinctrl',) : 102,	
-	('samsung,exynos3250-pinctrl', 'samsung,exynos4210-pinctrl', 'samsung,exynos4x12-pinctrl', 'samsung,exynos5250-pinctrl', 'samsung,exynos5260-pinctrl', 'samsung,exynos5410-pinctrl', 'samsung,exynos5420-pinctrl', 'samsung,s5pv210-pinctrl', 'samsung,exynos5433-pinctrl', 'samsung,exynos7-pinctrl', 'samsung,s3c64xx-pinctrl', 'samsung,s3c2412-pinctrl', 'samsung,s3c2416-pinctrl', 'samsung,s3c2440-pinctrl', 'samsung,s3c2450-pinctrl') : 849,	
-	('ti,palmas-pinctrl', 'ti,tps65913-pinctrl', 'ti,tps80036-pinctrl') : 704,	
-	('axis,artpec6-pinctrl',) : 681,	
-	('marvell,mv88f6710-pinctrl',) : 375,	
-	('marvell,mv88f6920-pinctrl', 'marvell,mv88f6925-pinctrl', 'marvell,mv88f6928-pinctrl') : 377,	
-	('marvell,88f5181-pinctrl', 'marvell,88f5181l-pinctrl', 'marvell,88f5182-pinctrl', 'marvell,88f5281-pinctrl') : 177,	
-	('marvell,mv88f6720-pinctrl',) : 393,	
-	('marvell,mv88f6810-pinctrl', 'marvell,mv88f6820-pinctrl', 'marvell,mv88f6828-pinctrl') : 395,	
-	('amlogic,meson8b-cbus-pinctrl', 'amlogic,meson8b-aobus-pinctrl') : 699,	
-	('amlogic,meson-gxl-periphs-pinctrl', 'amlogic,meson-gxl-aobus-pinctrl') : 610,	
-	('allwinner,sun8i-a23-r-pinctrl',) : 101,	
-	('amlogic,meson-gxbb-periphs-pinctrl', 'amlogic,meson-gxbb-aobus-pinctrl') : 643,	
-	('amlogic,meson-a1-periphs-pinctrl',) : 616,	
-	('marvell,dove-pinctrl',) : 705,	
-	('amlogic,meson-axg-periphs-pinctrl', 'amlogic,meson-axg-aobus-pinctrl') : 746,	
-	('cnxt,cx92755-pinctrl',) : 221,	
-	('marvell,armada3710-sb-pinctrl', 'marvell,armada3710-nb-pinctrl') : 747,	
-	('mscc,luton-pinctrl', 'mscc,serval-pinctrl', 'mscc,ocelot-pinctrl', 'mscc,jaguar2-pinctrl', 'microchip,sparx5-pinctrl') : 1119,	
-	('marvell,mv78230-pinctrl', 'marvell,mv78260-pinctrl', 'marvell,mv78460-pinctrl', 'marvell,98dx3236-pinctrl', 'marvell,98dx4251-pinctrl') : 559,	
-	('allwinner,sun6i-a31-r-pinctrl',) : 113,	
-	('allwinner,sun8i-h3-r-pinctrl',) : 83,	
-	('allwinner,sun8i-h3-pinctrl',) : 483,	
-	('allwinner,sun8i-a83t-pinctrl',) : 563,	
-	('allwinner,sun50i-a64-r-pinctrl',) : 89,	
-	('allwinner,sun8i-a33-pinctrl',) : 476,	
-	('amlogic,meson8-cbus-pinctrl', 'amlogic,meson8-aobus-pinctrl', 'amlogic,meson8m2-cbus-pinctrl', 'amlogic,meson8m2-aobus-pinctrl') : 800,	
-	('marvell,88f6180-pinctrl', 'marvell,88f6190-pinctrl', 'marvell,88f6192-pinctrl', 'marvell,88f6281-pinctrl', 'marvell,88f6282-pinctrl', 'marvell,98dx4122-pinctrl', 'marvell,98dx1135-pinctrl') : 437,	
-	('allwinner,sun50i-a100-r-pinctrl',) : 83,	
-	('amlogic,meson-g12a-periphs-pinctrl', 'amlogic,meson-g12a-aobus-pinctrl') : 975,	
-	('allwinner,sun50i-h6-r-pinctrl',) : 100,	
-	('cirrus,lochnagar-pinctrl',) : 962,	
-	('allwinner,sun8i-a23-pinctrl',) : 550,	
-	('allwinner,sun8i-a83t-r-pinctrl',) : 89,	
-	('allwinner,sun50i-h6-pinctrl',) : 587,	
-	('allwinner,sun9i-a80-r-pinctrl',) : 147,	
-	('allwinner,sun6i-a31-pinctrl', 'allwinner,sun6i-a31s-pinctrl') : 954,	
-	('allwinner,sun50i-a64-pinctrl',) : 567,	
-	('actions,s700-pinctrl',) : 1306,	
-	('actions,s500-pinctrl',) : 1220,	
-	('allwinner,suniv-f1c100s-pinctrl',) : 373,	
-	('ti,da850-pupd',) : 128,	
-	('allwinner,sun8i-v3-pinctrl', 'allwinner,sun8i-v3s-pinctrl') : 536,	
-	('st,stih407-sbc-pinctrl', 'st,stih407-front-pinctrl', 'st,stih407-rear-pinctrl', 'st,stih407-flash-pinctrl') : 1077,	
-	('fsl,imx1-iomuxc',) : 243,	
-	('allwinner,sun50i-h5-pinctrl',) : 545,	
-	('toshiba,tmpv7708-pinctrl',) : 303,	
-	('allwinner,sun50i-a100-pinctrl',) : 679,	
-	('fsl,imx23-pinctrl',) : 261,	
-	('fsl,imx6sll-iomuxc-gpr', 'fsl,imx6sll-iomuxc') : 333,	
-	('fsl,imx8dxl-iomuxc',) : 175,	
-	('actions,s900-pinctrl',) : 1371,	
-	('allwinner,sun4i-a10-pinctrl', 'allwinner,sun7i-a20-pinctrl', 'allwinner,sun8i-r40-pinctrl') : 1271,	
-	('fsl,imx8mp-iomuxc-gpr', 'fsl,imx8mp-iomuxc') : 325,	
-	('ti,dra7-iodelay',) : 511,	
-	('allwinner,sun5i-a10s-pinctrl', 'allwinner,sun5i-a13-pinctrl', 'nextthing,gr8-pinctrl') : 709,	
-	('allwinner,sun9i-a80-pinctrl',) : 702,	
-	('fsl,imx8mn-iomuxc-gpr', 'fsl,imx8mn-iomuxc') : 328,	
-	('fsl,imx6q-iomuxc-gpr', 'fsl,imx6q-iomuxc') : 457,	
-	('fsl,imx7ulp-iomuxc1',) : 282,	
-	('fsl,imx8qxp-iomuxc',) : 213,	
-	('fsl,imx8mq-iomuxc-gpr', 'fsl,imx8mq-iomuxc') : 330,	
-	('fsl,imx28-pinctrl',) : 377,	
-	('fsl,imx8mm-iomuxc-gpr', 'fsl,imx8mm-iomuxc') : 328,	
-	('fsl,imx27-iomuxc',) : 369,	
-	('fsl,imx6ul-iomuxc-gpr', 'fsl,imx6ul-iomuxc', 'fsl,imx6ull-iomuxc-snvs') : 318,	
-	('fsl,imx51-iomuxc',) : 758,	
-	('fsl,imx53-iomuxc-gpr', 'fsl,imx53-iomuxc') : 445,	
-	('fsl,vf610-iomuxc',) : 314,	
-	('fsl,imx50-iomuxc-gpr', 'fsl,imx50-iomuxc') : 383,	
-	('fsl,imx6sx-iomuxc-gpr', 'fsl,imx6sx-iomuxc') : 367,	
-	('fsl,imx8qm-iomuxc',) : 307,	
-	('fsl,imx25-iomuxc',) : 302,	
-	('fsl,imx6sl-iomuxc-gpr', 'fsl,imx6sl-iomuxc') : 363,	
-	('microchip,pic32mzda-pinctrl', 'microchip,pic32mzda-gpio') : 2014,	
-	('nvidia,tegra194-pinmux',) : 112,	
-	('fsl,imx7d-iomuxc-gpr', 'fsl,imx7d-iomuxc', 'fsl,imx7d-iomuxc-lpsr') : 362,	
-	('ralink,rt2880-pinmux',) : 229,	
-	('fsl,imx6q-iomuxc-gpr', 'fsl,imx6dl-iomuxc') : 457,	
-	('microchip,mcp23s08', 'microchip,mcp23s17', 'microchip,mcp23s18', 'mcp,mcp23s08', 'mcp,mcp23s17') : 164,	
-	('fsl,imx35-iomuxc',) : 994,	
-	('stericsson,gpio-coh901',) : 528,	
-	('x-powers,axp209-gpio', 'x-powers,axp813-gpio') : 319,	
-	('st,stmfx-0300-pinctrl',) : 583,	
-	('mediatek,mt8167-pinctrl',) : 284,	
-	('nvidia,tegra124-xusb-padctl',) : 624,	
-	('mediatek,mt6797-pinctrl',) : 36,	
-	('mediatek,mt8173-pinctrl',) : 320,	
-	('mediatek,mt6397-pinctrl',) : 38,	
-	('mediatek,mt7629-pinctrl',) : 343,	
-	('intel,lgm-io',) : 676,	
-	('mediatek,mt8135-pinctrl',) : 272,	
-	('mediatek,mt8516-pinctrl',) : 284,	
-	('mediatek,mt2712-pinctrl',) : 491,	
-	('sirf,atlas7-ioc', 'sirf,atlas7-gpio') : 4497,	
-	('mediatek,mt2701-pinctrl', 'mediatek,mt7623-pinctrl') : 492,	
-	('marvell,pxa25x-pinctrl',) : 240,	
-	('mediatek,mt8127-pinctrl',) : 282,	
-	('nxp,lpc1850-scu',) : 1085,	
-	('nvidia,tegra20-gpio', 'nvidia,tegra20-pinmux') : 1877,	
-	('sprd,sc9860-pinctrl',) : 913,	
-	('ingenic,jz4740-gpio', 'ingenic,jz4725b-gpio', 'ingenic,jz4760-gpio', 'ingenic,jz4770-gpio', 'ingenic,jz4780-gpio', 'ingenic,x1000-gpio', 'ingenic,x1830-gpio', 'ingenic,jz4740-pinctrl', 'ingenic,jz4725b-pinctrl', 'ingenic,jz4760-pinctrl', 'ingenic,jz4760b-pinctrl', 'ingenic,jz4770-pinctrl', 'ingenic,jz4780-pinctrl', 'ingenic,x1000-pinctrl', 'ingenic,x1000e-pinctrl', 'ingenic,x1500-pinctrl', 'ingenic,x1830-pinctrl') : 0,	
-	('mediatek,mt7622-pinctrl',) : 722,	
-	('marvell,pxa27x-pinctrl',) : 532,	
-	('mediatek,mt8183-pinctrl',) : 523,	
-	('st,spear310-pinmux',) : 241,	
-	('nvidia,tegra124-gpio', 'nvidia,tegra124-pinmux') : 1558,	
-	('nvidia,tegra210-gpio', 'nvidia,tegra210-pinmux') : 1157,	
-	('nvidia,tegra30-gpio', 'nvidia,tegra30-pinmux') : 1870,	
-	('st,spear-plgpio',) : 453,	
-	('st,spear300-pinmux',) : 442,	
-	('nvidia,tegra114-gpio', 'nvidia,tegra114-pinmux') : 1384,	
-	('nuvoton,npcm750-pinctrl',) : 1703,	
-	('mediatek,mt6779-pinctrl',) : 722,	
-	('img,pistachio-system-pinctrl',) : 1065,	
-	('stericsson,ab8500-gpio', 'stericsson,ab8505-gpio') : 724,	
-	('mediatek,mt6765-pinctrl',) : 1041,	
-	('qcom,pm8005-gpio', 'qcom,pm8916-gpio', 'qcom,pm8941-gpio', 'qcom,pm8950-gpio', 'qcom,pmi8950-gpio', 'qcom,pm8994-gpio', 'qcom,pmi8994-gpio', 'qcom,pm8998-gpio', 'qcom,pmi8998-gpio', 'qcom,pma8084-gpio', 'qcom,pms405-gpio', 'qcom,pm660-gpio', 'qcom,pm660l-gpio', 'qcom,pm8150-gpio', 'qcom,pm8150b-gpio', 'qcom,pm8150l-gpio', 'qcom,pm6150-gpio', 'qcom,pm6150l-gpio', 'qcom,pmx55-gpio') : 819,	
-	('qcom,mdm9615-pinctrl',) : 387,	
-	('qcom,pm8841-mpp', 'qcom,pm8916-mpp', 'qcom,pm8941-mpp', 'qcom,pm8950-mpp', 'qcom,pmi8950-mpp', 'qcom,pm8994-mpp', 'qcom,pma8084-mpp', 'qcom,spmi-mpp') : 663,	
-	('st,spear1340-pinmux',) : 1275,	
-	('xlnx,pinctrl-zynq',) : 887,	
-	('qcom,sm8250-lpass-lpi-pinctrl',) : 509,	
-	('qcom,ipq6018-pinctrl',) : 688,	
-	('aspeed,ast2600-pinctrl',) : 2241,	
-	('qcom,msm8226-pinctrl',) : 536,	
-	('aspeed,ast2400-pinctrl', 'aspeed,g4-pinctrl') : 2263,	
-	('qcom,msm8916-pinctrl',) : 892,	
-	('mediatek,mt7623-moore-pinctrl',) : 1216,	
-	('qcom,msm8660-pinctrl',) : 801,	
-	('qcom,pm8018-mpp', 'qcom,pm8038-mpp', 'qcom,pm8058-mpp', 'qcom,pm8917-mpp', 'qcom,pm8821-mpp', 'qcom,pm8921-mpp', 'qcom,ssbi-mpp') : 624,	
-	('mediatek,mt8192-pinctrl',) : 1338,	
-	('stericsson,stn8815-pinctrl', 'stericsson,db8500-pinctrl', 'stericsson,db8540-pinctrl', 'st,nomadik-gpio') : 1213,	
-	('aspeed,ast2500-pinctrl', 'aspeed,g5-pinctrl') : 2392,	
-	('qcom,msm8974-pinctrl',) : 913,	
-	('qcom,ipq4019-pinctrl',) : 582,	
-	('qcom,ipq8064-pinctrl',) : 462,	
-	('rockchip,gpio-bank', 'rockchip,rk3188-gpio-bank0', 'rockchip,px30-pinctrl', 'rockchip,rv1108-pinctrl', 'rockchip,rk2928-pinctrl', 'rockchip,rk3036-pinctrl', 'rockchip,rk3066a-pinctrl', 'rockchip,rk3066b-pinctrl', 'rockchip,rk3128-pinctrl', 'rockchip,rk3188-pinctrl', 'rockchip,rk3228-pinctrl', 'rockchip,rk3288-pinctrl', 'rockchip,rk3308-pinctrl', 'rockchip,rk3328-pinctrl', 'rockchip,rk3368-pinctrl', 'rockchip,rk3399-pinctrl') : 2913,	
-	('qcom,msm8953-pinctrl',) : 1177,	
-	('qcom,msm8960-pinctrl',) : 896,	
-	('qcom,sdx55-pinctrl',) : 693,	
-	('st,spear1310-pinmux',) : 1845,	
-	('qcom,msm8976-pinctrl',) : 865,	
-	('st,spear320-pinmux',) : 2239,	
-	('qcom,pm8018-gpio', 'qcom,pm8038-gpio', 'qcom,pm8058-gpio', 'qcom,pm8917-gpio', 'qcom,pm8921-gpio') : 582,	
-	('qcom,apq8064-pinctrl',) : 519,	
-	('qcom,sc7180-pinctrl',) : 875,	
-	('qcom,ipq8074-pinctrl',) : 666,	
-	('qcom,msm8992-pinctrl', 'qcom,msm8994-pinctrl') : 1045,	
-	('qcom,msm8998-pinctrl',) : 1120,	
-	('snps,g210-tc-6.00-20bit', 'snps,g210-tc-6.00-40bit') : 57,	
-	('renesas,r7s9210-pinctrl',) : 310,	
-	('qcom,sm8150-pinctrl',) : 1062,	
-	('ti,j721e-ufs',) : 64,	
-	('ibm,p9-occ', 'ibm,p10-occ') : 431,	
-	('aspeed,ast2600-fsi-master',) : 407,	
-	('qcom,qcs404-pinctrl',) : 1043,	
-	('qcom,sc7280-pinctrl',) : 1114,	
-	('qcom,apq8084-pinctrl',) : 926,	
-	('cdns,ufshc', 'cdns,ufshc-m31-16nm') : 171,	
-	('abilis,tb10x-iomux',) : 605,	
-	('renesas,rzn1-pinctrl',) : 609,	
-	('fsi-master-gpio',) : 554,	
-	('hisilicon,hi3660-ufs', 'hisilicon,hi3670-ufs') : 336,	
-	('st,stm32f429-pinctrl',) : 1402,	
-	('qcom,sdm660-pinctrl', 'qcom,sdm630-pinctrl') : 1024,	
-	('renesas,pfc-emev2', 'renesas,pfc-r8a73a4', 'renesas,pfc-r8a7740', 'renesas,pfc-r8a7742', 'renesas,pfc-r8a7743', 'renesas,pfc-r8a7744', 'renesas,pfc-r8a7745', 'renesas,pfc-r8a77470', 'renesas,pfc-r8a774a1', 'renesas,pfc-r8a774b1', 'renesas,pfc-r8a774c0', 'renesas,pfc-r8a774e1', 'renesas,pfc-r8a7778', 'renesas,pfc-r8a7779', 'renesas,pfc-r8a7790', 'renesas,pfc-r8a7791', 'renesas,pfc-r8a7792', 'renesas,pfc-r8a7793', 'renesas,pfc-r8a7794', 'renesas,pfc-r8a7795', 'renesas,pfc-r8a7795', 'renesas,pfc-r8a7796', 'renesas,pfc-r8a77961', 'renesas,pfc-r8a77965', 'renesas,pfc-r8a77970', 'renesas,pfc-r8a77980', 'renesas,pfc-r8a77990', 'renesas,pfc-r8a77995', 'renesas,pfc-sh73a0') : 798,	
-	('st,stm32f469-pinctrl',) : 1398,	
-	('brcm,bus-axi',) : 165,	
-	('qcom,sdm845-pinctrl',) : 1024,	
-	('qcom,sm8250-pinctrl',) : 1051,	
-	('pps-gpio',) : 174,	
-	('qcom,msm8996-pinctrl',) : 1379,	
-	('st,stm32f769-pinctrl',) : 1638,	
-	('fsl,imx8mq', 'fsl,imx8mm', 'fsl,imx8mn', 'fsl,imx8mp') : 151,	
-	('st,stm32f746-pinctrl',) : 1497,	
-	('marvell,dove-pmu',) : 267,	
-	('aspeed,ast2400-cf-fsi-master', 'aspeed,ast2500-cf-fsi-master') : 904,	
-	('mediatek,mt8183-ufshci',) : 655,	
-	('litex,soc-controller',) : 70,	
-	('zte,zx296718-pcu',) : 120,	
-	('fsl,imx6q-gpc', 'fsl,imx6qp-gpc', 'fsl,imx6sl-gpc', 'fsl,imx6sx-gpc') : 352,	
-	('atmel,sama5d2-sfr', 'atmel,sama5d4-sfr') : 61,	
-	('st,stm32h743-pinctrl',) : 1795,	
-	('intel,ixp4xx-ahb-queue-manager',) : 321,	
-	('brcm,bcm6318-power-controller', 'brcm,bcm6328-power-controller', 'brcm,bcm6362-power-controller', 'brcm,bcm63268-power-controller') : 0,	
-	('kendryte,k210-sysctl',) : 167,	
-	('qcom,ufshc',) : 922,	
-	('atmel,at91rm9200', 'atmel,at91sam9', 'atmel,sama5', 'atmel,samv7') : 172,	
-	('samsung,exynos7-ufs',) : 881,	
-	('atmel,sama5d3-pinctrl', 'atmel,at91sam9x5-pinctrl', 'atmel,at91rm9200-pinctrl', 'microchip,sam9x60-pinctrl', 'atmel,at91sam9x5-gpio', 'atmel,at91rm9200-gpio', 'microchip,sam9x60-gpio') : 1223,	
-	('brcm,brcmstb', 'brcm,bcm7125-sun-top-ctrl', 'brcm,bcm7346-sun-top-ctrl', 'brcm,bcm7358-sun-top-ctrl', 'brcm,bcm7360-sun-top-ctrl', 'brcm,bcm7362-sun-top-ctrl', 'brcm,bcm7420-sun-top-ctrl', 'brcm,bcm7425-sun-top-ctrl', 'brcm,bcm7429-sun-top-ctrl', 'brcm,bcm7435-sun-top-ctrl', 'brcm,brcmstb-sun-top-ctrl') : 87,	
-	('raspberrypi,bcm2835-power',) : 137,	
-	('intel,ixp4xx-network-processing-engine',) : 493,	
-	('samsung,exynos4210-pd', 'samsung,exynos5433-pd') : 97,	
-	('samsung,exynos3250-pmu', 'samsung,exynos4210-pmu', 'samsung,exynos4412-pmu', 'samsung,exynos5250-pmu', 'samsung,exynos5410-pmu', 'samsung,exynos5420-pmu', 'samsung,exynos5433-pmu', 'samsung,exynos7-pmu') : 93,	
-	('brcm,brcmstb-aon-ctrl', 'brcm,brcmstb-ddr-phy', 'brcm,brcmstb-memc-arb', 'brcm,brcmstb-timers') : 268,	
-	('arm,realview-eb-soc', 'arm,realview-pb1176-soc', 'arm,realview-pb11mp-soc', 'arm,realview-pba8-soc', 'arm,realview-pbx-soc') : 84,	
-	('samsung,exynos4210-chipid',) : 120,	
-	('actions,s500-sps', 'actions,s700-sps', 'actions,s900-sps') : 211,	
-	('hisilicon,hip05-sas-v1',) : 1334,	
-	('mmio-sram', 'brcm,brcmstb-aon-ctrl', 'brcm,brcmstb-ddr-phy-v71.1', 'brcm,brcmstb-ddr-phy-v72.0', 'brcm,brcmstb-ddr-phy-v225.1', 'brcm,brcmstb-ddr-phy-v240.1', 'brcm,brcmstb-ddr-phy-v240.2', 'brcm,brcmstb-ddr-shimphy-v1.0', 'brcm,brcmstb-memc-ddr-rev-b.2.1', 'brcm,brcmstb-memc-ddr-rev-b.2.2', 'brcm,brcmstb-memc-ddr-rev-b.2.3', 'brcm,brcmstb-memc-ddr-rev-b.3.0', 'brcm,brcmstb-memc-ddr-rev-b.3.1', 'brcm,brcmstb-memc-ddr') : 485,	
-	('lantiq,pinctrl-xway', 'lantiq,pinctrl-xr9', 'lantiq,pinctrl-ase', 'lantiq,ase-pinctrl', 'lantiq,danube-pinctrl', 'lantiq,xrx100-pinctrl', 'lantiq,xrx200-pinctrl', 'lantiq,xrx300-pinctrl') : 1414,	
-	('allwinner,sun4i-a10-sram-controller', 'allwinner,sun4i-a10-system-control', 'allwinner,sun5i-a13-system-control', 'allwinner,sun8i-a23-system-control', 'allwinner,sun8i-h3-system-control', 'allwinner,sun50i-a64-sram-controller', 'allwinner,sun50i-a64-system-control', 'allwinner,sun50i-h5-system-control') : 249,	
-	('lantiq,xrx200-fpi',) : 50,	
-	('ti,am3356-pruss', 'ti,am4376-pruss0', 'ti,am4376-pruss1', 'ti,am5728-pruss', 'ti,k2g-pruss', 'ti,am654-icssg', 'ti,j721e-icssg') : 227,	
-	('ti,sci-pm-domain',) : 112,	
-	('ti,am654-chipid',) : 98,	
-	('nvidia,tegra20', 'nvidia,tegra30', 'nvidia,tegra114', 'nvidia,tegra124', 'nvidia,tegra132', 'nvidia,tegra210') : 18,	
-	('ti,am3352-wkup-m3-ipc', 'ti,am4372-wkup-m3-ipc') : 327,	
-	('nvidia,tegra20-apbmisc', 'nvidia,tegra186-misc', 'nvidia,tegra194-misc', 'nvidia,tegra234-misc') : 118,	
-	('nvidia,tegra210-flowctrl', 'nvidia,tegra124-flowctrl', 'nvidia,tegra114-flowctrl', 'nvidia,tegra30-flowctrl', 'nvidia,tegra20-flowctrl') : 129,	
-	('st,stm32mp157-pinctrl', 'st,stm32mp157-z-pinctrl') : 2157,	
-	('aspeed,ast2400-lpc-ctrl', 'aspeed,ast2500-lpc-ctrl', 'aspeed,ast2600-lpc-ctrl') : 198,	
-	('aspeed,ast2400-lpc-snoop', 'aspeed,ast2500-lpc-snoop', 'aspeed,ast2600-lpc-snoop') : 247,	
-	('nvidia,tegra20-car', 'nvidia,tegra30-car', 'nvidia,tegra114-car', 'nvidia,tegra124-car', 'nvidia,tegra132-car', 'nvidia,tegra210-car', 'nvidia,tegra234-efuse', 'nvidia,tegra194-efuse', 'nvidia,tegra186-efuse', 'nvidia,tegra210-efuse', 'nvidia,tegra132-efuse', 'nvidia,tegra124-efuse', 'nvidia,tegra114-efuse', 'nvidia,tegra30-efuse', 'nvidia,tegra20-efuse') : 353,	
-	('ti,omap3-smartreflex-core', 'ti,omap3-smartreflex-mpu-iva', 'ti,omap4-smartreflex-core', 'ti,omap4-smartreflex-mpu', 'ti,omap4-smartreflex-iva') : 576,	
-	('aspeed,ast2400-p2a-ctrl', 'aspeed,ast2500-p2a-ctrl') : 228,	
-	('rockchip,rk3036-grf', 'rockchip,rk3128-grf', 'rockchip,rk3228-grf', 'rockchip,rk3288-grf', 'rockchip,rk3328-grf', 'rockchip,rk3368-grf', 'rockchip,rk3399-grf') : 101,	
-	('mediatek,mt6779-devapc',) : 178,	
-	('mediatek,mt2701-mmsys', 'mediatek,mt2712-mmsys', 'mediatek,mt6779-mmsys', 'mediatek,mt6797-mmsys', 'mediatek,mt8173-mmsys', 'mediatek,mt8183-mmsys') : 288,	
-	('ti,keystone-navigator-dma',) : 531,	
-	('fsl,qoriq-rcpm-2.1+',) : 100,	
-	('ti,omap4-prm-inst', 'ti,omap5-prm-inst', 'ti,dra7-prm-inst', 'ti,am3-prm-inst', 'ti,am4-prm-inst') : 608,	
-	('fsl,qoriq-device-config-1.0', 'fsl,qoriq-device-config-2.0', 'fsl,p1010-guts', 'fsl,p1020-guts', 'fsl,p1021-guts', 'fsl,p1022-guts', 'fsl,p1023-guts', 'fsl,p2020-guts', 'fsl,bsc9131-guts', 'fsl,bsc9132-guts', 'fsl,mpc8536-guts', 'fsl,mpc8544-guts', 'fsl,mpc8548-guts', 'fsl,mpc8568-guts', 'fsl,mpc8569-guts', 'fsl,mpc8572-guts', 'fsl,ls1021a-dcfg', 'fsl,ls1043a-dcfg', 'fsl,ls2080a-dcfg', 'fsl,ls1088a-dcfg', 'fsl,ls1012a-dcfg', 'fsl,ls1046a-dcfg', 'fsl,lx2160a-dcfg', 'fsl,ls1028a-dcfg') : 162,	
-	('fsl,bman-portal',) : 134,	
-	('fsl,dpaa2-console',) : 214,	
-	('fsl,bman',) : 176,	
-	('rockchip,px30-io-voltage-domain', 'rockchip,px30-pmu-io-voltage-domain', 'rockchip,rk3188-io-voltage-domain', 'rockchip,rk3228-io-voltage-domain', 'rockchip,rk3288-io-voltage-domain', 'rockchip,rk3328-io-voltage-domain', 'rockchip,rk3368-io-voltage-domain', 'rockchip,rk3368-pmu-io-voltage-domain', 'rockchip,rk3399-io-voltage-domain', 'rockchip,rk3399-pmu-io-voltage-domain', 'rockchip,rv1108-io-voltage-domain', 'rockchip,rv1108-pmu-io-voltage-domain') : 333,	
-	('mediatek,mt8173-power-controller', 'mediatek,mt8183-power-controller', 'mediatek,mt8192-power-controller') : 404,	
-	('sifive,fu540-c000-ccache',) : 134,	
-	('fsl,qman-portal',) : 245,	
-	('ti,am654-navss-ringacc',) : 977,	
-	('fsl,qe',) : 372,	
-	('qcom,tcsr-ipq8064', 'qcom,tcsr-apq8064', 'qcom,tcsr-msm8960', 'qcom,tcsr-msm8660', 'qcom,gsbi-v1.0.0') : 150,	
-	('mediatek,mt2701-scpsys', 'mediatek,mt2712-scpsys', 'mediatek,mt6797-scpsys', 'mediatek,mt7622-scpsys', 'mediatek,mt7623a-scpsys', 'mediatek,mt8173-scpsys') : 813,	
-	('xlnx,zynqmp-power',) : 157,	
-	('ti,keystone-navigator-qmss', 'ti,66ak2g-navss-qm') : 1222,	
-	('hisilicon,hip06-sas-v2', 'hisilicon,hip07-sas-v2') : 2667,	
-	('qcom,sc7180-rpmhpd', 'qcom,sdm845-rpmhpd', 'qcom,sdx55-rpmhpd', 'qcom,sm8150-rpmhpd', 'qcom,sm8250-rpmhpd') : 308,	
-	('fsl,qman',) : 575,	
-	('xlnx,vcu', 'xlnx,vcu-logicoreip-1.0') : 414,	
-	('rockchip,px30-power-controller', 'rockchip,rk3036-power-controller', 'rockchip,rk3066-power-controller', 'rockchip,rk3128-power-controller', 'rockchip,rk3188-power-controller', 'rockchip,rk3228-power-controller', 'rockchip,rk3288-power-controller', 'rockchip,rk3328-power-controller', 'rockchip,rk3366-power-controller', 'rockchip,rk3368-power-controller', 'rockchip,rk3399-power-controller') : 714,	
-	('qcom,msm8974-ocmem',) : 278,	
-	('qcom,smp2p',) : 340,	
-	('qcom,rpm-apq8084', 'qcom,rpm-ipq6018', 'qcom,rpm-msm8916', 'qcom,rpm-msm8936', 'qcom,rpm-msm8974', 'qcom,rpm-msm8976', 'qcom,rpm-msm8994', 'qcom,rpm-msm8996', 'qcom,rpm-msm8998', 'qcom,rpm-sdm660', 'qcom,rpm-qcs404') : 164,	
-	('qcom,wcnss',) : 207,	
-	('qcom,sc7180-aoss-qmp', 'qcom,sdm845-aoss-qmp', 'qcom,sm8150-aoss-qmp', 'qcom,sm8250-aoss-qmp') : 367,	
-	('qcom,apr', 'qcom,apr-v2') : 337,	
-	('qcom,cmd-db',) : 186,	
-	('qcom,smsm',) : 318,	
-	('amlogic,meson-a1-pwrc',) : 137,	
-	('amlogic,meson8-canvas', 'amlogic,meson8b-canvas', 'amlogic,meson8m2-canvas', 'amlogic,canvas') : 137,	
-	('qcom,rpmh-rsc',) : 443,	
-	('amlogic,meson8-analog-top', 'amlogic,meson8b-analog-top') : 122,	
-	('qcom,rmtfs-mem',) : 226,	
-	('qcom,msm8916-rpmpd', 'qcom,msm8939-rpmpd', 'qcom,msm8976-rpmpd', 'qcom,msm8996-rpmpd', 'qcom,msm8998-rpmpd', 'qcom,qcs404-rpmpd', 'qcom,sdm660-rpmpd') : 349,	
-	('qcom,sc7180-llcc', 'qcom,sdm845-llcc', 'qcom,sm8150-llcc') : 364,	
-	('amlogic,meson-gx-pwrc-vpu', 'amlogic,meson-g12a-pwrc-vpu') : 244,	
-	('qcom,geni-se-qup',) : 492,	
-	('mediatek,mt6323', 'mediatek,mt6351', 'mediatek,mt6357', 'mediatek,mt6358', 'mediatek,mt6359', 'mediatek,mt6380-regulator', 'mediatek,mt6397', 'mediatek,mt2701-pwrap', 'mediatek,mt6765-pwrap', 'mediatek,mt6779-pwrap', 'mediatek,mt6797-pwrap', 'mediatek,mt7622-pwrap', 'mediatek,mt8135-pwrap', 'mediatek,mt8173-pwrap', 'mediatek,mt8183-pwrap', 'mediatek,mt8516-pwrap') : 1692,	
-	('renesas,r8a7742-rst', 'renesas,r8a7743-rst', 'renesas,r8a7744-rst', 'renesas,r8a7745-rst', 'renesas,r8a77470-rst', 'renesas,r8a774a1-rst', 'renesas,r8a774b1-rst', 'renesas,r8a774c0-rst', 'renesas,r8a774e1-rst', 'renesas,r8a7778-reset-wdt', 'renesas,r8a7779-reset-wdt', 'renesas,r8a7790-rst', 'renesas,r8a7791-rst', 'renesas,r8a7792-rst', 'renesas,r8a7793-rst', 'renesas,r8a7794-rst', 'renesas,r8a7795-rst', 'renesas,r8a7796-rst', 'renesas,r8a77961-rst', 'renesas,r8a77965-rst', 'renesas,r8a77970-rst', 'renesas,r8a77980-rst', 'renesas,r8a77990-rst', 'renesas,r8a77995-rst', 'renesas,r8a779a0-rst') : 84,	
-	('qcom,smem',) : 547,	
-	('arm,coresight-etm3x', 'renesas,dbsc-r8a73a4', 'renesas,dbsc3-r8a7740', 'renesas,sbsc-sh73a0') : 206,	
-	('renesas,r7s72100', 'renesas,r7s9210', 'renesas,r8a73a4', 'renesas,r8a7740', 'renesas,r8a7742', 'renesas,r8a7743', 'renesas,r8a7744', 'renesas,r8a7745', 'renesas,r8a77470', 'renesas,r8a774a1', 'renesas,r8a774b1', 'renesas,r8a774c0', 'renesas,r8a774e1', 'renesas,r8a7778', 'renesas,r8a7779', 'renesas,r8a7790', 'renesas,r8a7791', 'renesas,r8a7792', 'renesas,r8a7793', 'renesas,r8a7794', 'renesas,r8a7795', 'renesas,r8a7796', 'renesas,r8a77961', 'renesas,r8a77965', 'renesas,r8a77970', 'renesas,r8a77980', 'renesas,r8a77990', 'renesas,r8a77995', 'renesas,r8a779a0', 'renesas,sh73a0') : 281,	
-	('renesas,r8a7742-sysc', 'renesas,r8a7743-sysc', 'renesas,r8a7744-sysc', 'renesas,r8a7745-sysc', 'renesas,r8a77470-sysc', 'renesas,r8a774a1-sysc', 'renesas,r8a774b1-sysc', 'renesas,r8a774c0-sysc', 'renesas,r8a774e1-sysc', 'renesas,r8a7779-sysc', 'renesas,r8a7790-sysc', 'renesas,r8a7791-sysc', 'renesas,r8a7793-sysc', 'renesas,r8a7792-sysc', 'renesas,r8a7794-sysc', 'renesas,r8a7795-sysc', 'renesas,r8a7796-sysc', 'renesas,r8a77961-sysc', 'renesas,r8a77965-sysc', 'renesas,r8a77970-sysc', 'renesas,r8a77980-sysc', 'renesas,r8a77990-sysc', 'renesas,r8a77995-sysc') : 316,	
-	('renesas,r8a779a0-sysc',) : 283,	
-	('amlogic,meson8-pwrc', 'amlogic,meson8b-pwrc', 'amlogic,meson8m2-pwrc', 'amlogic,meson-axg-pwrc', 'amlogic,meson-gxbb-pwrc', 'amlogic,meson-g12a-pwrc', 'amlogic,meson-sm1-pwrc') : 415,	
-	('qcom,crypto-v5.1', 'qcom,crypto-v5.4') : 184,	
-	('amlogic,meson-gx-clk-measure', 'amlogic,meson8-clk-measure', 'amlogic,meson8b-clk-measure', 'amlogic,meson-axg-clk-measure', 'amlogic,meson-g12a-clk-measure', 'amlogic,meson-sm1-clk-measure') : 590,	
-	('nvidia,tegra234-pmc', 'nvidia,tegra194-pmc', 'nvidia,tegra186-pmc', 'nvidia,tegra210-pmc', 'nvidia,tegra132-pmc', 'nvidia,tegra124-pmc', 'nvidia,tegra114-pmc', 'nvidia,tegra30-pmc', 'nvidia,tegra20-pmc') : 2288,	
-	('qcom,prng', 'qcom,prng-ee') : 144,	
-	('qcom,qcs404-cpr',) : 1125,	
-	('allwinner,sun4i-a10-crypto', 'allwinner,sun8i-a33-crypto') : 378,	
-	('amd,ccp-seattle-v1a',) : 161,	
-	('atmel,atsha204a',) : 103,	
-	('hisilicon,hip06-sec', 'hisilicon,hip07-sec') : 852,	
-	('ppc4xx-rng', 'amcc,ppc460ex-rng', 'amcc,ppc440epx-rng') : 87,	
-	('fsl,imx23-dcp', 'fsl,imx28-dcp') : 739,	
-	('marvell,orion-crypto', 'marvell,kirkwood-crypto', 'marvell,dove-crypto', 'marvell,armada-370-crypto', 'marvell,armada-xp-crypto', 'marvell,armada-375-crypto', 'marvell,armada-38x-crypto') : 413,	
-	('allwinner,sun8i-a83t-crypto', 'allwinner,sun9i-a80-crypto') : 609,	
-	('allwinner,sun8i-h3-crypto', 'allwinner,sun8i-r40-crypto', 'allwinner,sun50i-a64-crypto', 'allwinner,sun50i-h5-crypto', 'allwinner,sun50i-h6-crypto') : 762,	
-	('fsl,sec-v4.0-job-ring', 'fsl,sec4.0-job-ring') : 337,	
-	('atmel,at91sam9g46-tdes',) : 853,	
-	('rockchip,rk3288-crypto',) : 302,	
-	('mediatek,eip97-crypto',) : 355,	
-	('fsl,imx53-sahara', 'fsl,imx27-sahara') : 1000,	
-	('samsung,exynos4-rng', 'samsung,exynos5250-prng') : 231,	
-	('img,hash-accelerator',) : 752,	
-	('fsl,sec-v4.0', 'fsl,sec4.0') : 487,	
-	('xlnx,zynqmp-aes',) : 320,	
-	('atmel,atecc508a',) : 248,	
-	('stericsson,ux500-cryp',) : 1010,	
-	('arm,cryptocell-703-ree', 'arm,cryptocell-713-ree', 'arm,cryptocell-712-ree', 'arm,cryptocell-710-ree', 'arm,cryptocell-630p-ree') : 431,	
-	('amlogic,gxl-crypto',) : 221,	
-	('calxeda,highbank', 'calxeda,ecx-2000') : 70,	
-	('allwinner,sun4i-a10', 'allwinner,sun5i-a10s', 'allwinner,sun5i-a13', 'allwinner,sun5i-r8', 'allwinner,sun6i-a31', 'allwinner,sun6i-a31s', 'allwinner,sun7i-a20', 'allwinner,sun8i-a23', 'allwinner,sun8i-a83t', 'allwinner,sun8i-h3', 'apm,xgene-shadowcat', 'arm,integrator-ap', 'arm,integrator-cp', 'hisilicon,hi3660', 'fsl,imx27', 'fsl,imx51', 'fsl,imx53', 'marvell,berlin', 'marvell,pxa250', 'marvell,pxa270', 'samsung,exynos3250', 'samsung,exynos4210', 'samsung,exynos5250', 'samsung,exynos5800', 'renesas,emev2', 'renesas,r7s72100', 'renesas,r8a73a4', 'renesas,r8a7740', 'renesas,r8a7742', 'renesas,r8a7743', 'renesas,r8a7744', 'renesas,r8a7745', 'renesas,r8a7778', 'renesas,r8a7779', 'renesas,r8a7790', 'renesas,r8a7791', 'renesas,r8a7792', 'renesas,r8a7793', 'renesas,r8a7794', 'renesas,sh73a0', 'rockchip,rk2928', 'rockchip,rk3036', 'rockchip,rk3066a', 'rockchip,rk3066b', 'rockchip,rk3188', 'rockchip,rk3228', 'rockchip,rk3288', 'rockchip,rk3328', 'rockchip,rk3366', 'rockchip,rk3368', 'rockchip,rk3399', 'st-ericsson,u8500', 'st-ericsson,u8540', 'st-ericsson,u9500', 'st-ericsson,u9540', 'ti,omap2', 'ti,omap4', 'ti,omap5', 'xlnx,zynq-7000', 'xlnx,zynqmp', 'allwinner,sun50i-h6', 'calxeda,highbank', 'calxeda,ecx-2000', 'fsl,imx7ulp', 'fsl,imx7d', 'fsl,imx8mq', 'fsl,imx8mm', 'fsl,imx8mn', 'fsl,imx8mp', 'marvell,armadaxp', 'mediatek,mt2701', 'mediatek,mt2712', 'mediatek,mt7622', 'mediatek,mt7623', 'mediatek,mt8167', 'mediatek,mt817x', 'mediatek,mt8173', 'mediatek,mt8176', 'mediatek,mt8183', 'mediatek,mt8516', 'nvidia,tegra20', 'nvidia,tegra30', 'nvidia,tegra124', 'nvidia,tegra210', 'qcom,apq8096', 'qcom,msm8996', 'qcom,qcs404', 'qcom,sc7180', 'qcom,sdm845', 'st,stih407', 'st,stih410', 'st,stih418', 'sigma,tango4', 'ti,am33xx', 'ti,am43', 'ti,dra7', 'ti,omap3', 'qcom,ipq8064', 'qcom,apq8064', 'qcom,msm8974', 'qcom,msm8960') : 139,	
-	('fsl,b4420-clockgen', 'fsl,b4860-clockgen', 'fsl,t2080-clockgen', 'fsl,t4240-clockgen') : 196,	
-	('nvidia,tegra186-ccplex-cluster',) : 179,	
-	('picochip,spacc-ipsec', 'picochip,spacc-l2') : 1211,	
-	('st,stm32f7-crc',) : 305,	
-	('linaro,optee-tz',) : 505,	
-	('inside-secure,safexcel-eip97ies', 'inside-secure,safexcel-eip197b', 'inside-secure,safexcel-eip197d', 'inside-secure,safexcel-eip97', 'inside-secure,safexcel-eip197') : 1232,	
-	('st,stih407', 'st,stih410') : 197,	
-	('atmel,at91sam9g46-sha',) : 1732,	
-	('atmel,at91sam9g46-aes',) : 1702,	
-	('stericsson,ux500-hash',) : 1108,	
-	('allwinner,sun50i-h6',) : 131,	
-	('qcom,cpufreq-hw', 'qcom,cpufreq-epss') : 326,	
-	('ti,am33xx', 'ti,am3517', 'ti,am43', 'ti,dra7', 'ti,omap34xx', 'ti,omap36xx', 'ti,omap3430', 'ti,omap3630') : 250,	
-	('sigma,tango4',) : 26,	
-	('marvell,ap806-cpu-clock',) : 123,	
-	('marvell,armada-3700-nb-pm',) : 280,	
-	('nvidia,tegra194-ccplex',) : 241,	
-	('qcom,apq8096', 'qcom,msm8996', 'qcom,qcs404', 'qcom,ipq8064', 'qcom,apq8064', 'qcom,msm8974', 'qcom,msm8960') : 345,	
-	('axis,artpec6-crypto', 'axis,artpec7-crypto') : 1961,	
-	('samsung,s5pv210-secss', 'samsung,exynos4210-secss', 'samsung,exynos5433-slim-sss') : 1320,	
-	('mediatek,mt2701', 'mediatek,mt2712', 'mediatek,mt7622', 'mediatek,mt7623', 'mediatek,mt8167', 'mediatek,mt817x', 'mediatek,mt8173', 'mediatek,mt8176', 'mediatek,mt8183', 'mediatek,mt8516') : 378,	
-	('st,stm32f456-hash', 'st,stm32f756-hash') : 1094,	
-	('intel,keembay-ocs-aes',) : 1020,	
-	('sony,cxd2880',) : 466,	
-	('samsung,s5pv210-g2d', 'samsung,exynos4212-g2d') : 560,	
-	('SUNW,n2-cwq', 'SUNW,vf-cwq', 'SUNW,kt-cwq', 'SUNW,n2-mau', 'SUNW,vf-mau', 'SUNW,kt-mau') : 1461,	
-	('fsl,imx6q-vdoa',) : 239,	
-	('mediatek,mt8173-mdp-rdma', 'mediatek,mt8173-mdp-rsz', 'mediatek,mt8173-mdp-wdma', 'mediatek,mt8173-mdp-wrot', 'mediatek,mt8173-mdp') : 194,	
-	('st,stm32f756-cryp', 'st,stm32mp1-cryp') : 1311,	
-	('atmel,sama5d2-isc',) : 218,	
-	('ti,j721e-sa2ul', 'ti,am654-sa2ul') : 1606,	
-	('mediatek,mt8173-vcodec-dec',) : 271,	
-	('st,stih407-c8sectpfe',) : 701,	
-	('mediatek,mt8173-vcodec-enc', 'mediatek,mt8183-vcodec-enc') : 339,	
-	('renesas,vsp1', 'renesas,vsp2') : 581,	
-	('ti,da850-vpif',) : 376,	
-	('fsl,imx6ull-pxp',) : 1172,	
-	('allwinner,sun4i-a10-csi1', 'allwinner,sun7i-a20-csi0') : 237,	
-	('st,st-hva',) : 978,	
-	('st,stih407-bdisp',) : 927,	
-	('mediatek,mt8173-vpu',) : 640,	
-	('brcm,spum-crypto', 'brcm,spum-nsp-crypto', 'brcm,spu2-crypto', 'brcm,spu2-v2-crypto') : 3005,	
-	('renesas,fcpf', 'renesas,fcpv') : 85,	
-	('allwinner,sun6i-a31-csi', 'allwinner,sun8i-a83t-csi', 'allwinner,sun8i-h3-csi', 'allwinner,sun8i-v3s-csi', 'allwinner,sun50i-a64-csi') : 688,	
-	('amlogic,axg-ge2d',) : 705,	
-	('atmel,at91sam9g45-isi',) : 900,	
-	('allwinner,sun8i-a83t-de2-rotate',) : 593,	
-	('renesas,jpu-r8a7790', 'renesas,jpu-r8a7791', 'renesas,jpu-r8a7792', 'renesas,jpu-r8a7793', 'renesas,rcar-gen2-jpu') : 1112,	
-	('allwinner,sun8i-h3-deinterlace',) : 670,	
-	('st,st-delta',) : 1203,	
-	('ti,dra72-cal', 'ti,dra72-pre-es2-cal', 'ti,dra76-cal', 'ti,am654-cal') : 530,	
-	('fsl,mpc5121-viu',) : 1073,	
-	('ti,am437x-vpfe',) : 1598,	
-	('samsung,s5pv210-csis', 'samsung,exynos4210-csis', 'samsung,exynos5250-csis') : 688,	
-	('samsung,exynos4212-fimc-is',) : 654,	
-	('rockchip,rk3399-cif-isp',) : 334,	
-	('mediatek,mt8173-jpgdec', 'mediatek,mt2701-jpgdec', 'mediatek,mtk-jpgenc') : 1088,	
-	('fsl,sec1.0', 'fsl,sec2.0') : 2538,	
-	('cdns,csi2rx',) : 312,	
-	('xlnx,v-tc-6.1',) : 237,	
-	('cdns,csi2tx', 'cdns,csi2tx-1.3', 'cdns,csi2tx-2.1') : 385,	
-	('samsung,s5pv210-fimc', 'samsung,exynos4210-fimc', 'samsung,exynos4212-fimc') : 820,	
-	('xlnx,video',) : 398,	
-	('rockchip,rk3288-rga', 'rockchip,rk3399-rga') : 671,	
-	('renesas,r7s72100-ceu', 'renesas,r8a7740-ceu') : 993,	
-	('renesas,rcar-gen3-drif',) : 864,	
-	('samsung,fimc',) : 993,	
-	('marvell,mmp2-ccic',) : 196,	
-	('ti,omap3-isp',) : 1389,	
-	('samsung,exynos4212-fimc-lite', 'samsung,exynos5250-fimc-lite') : 1134,	
-	('xlnx,v-tpg-5.0',) : 610,	
-	('xlnx,mipi-csi2-rx-subsystem-5.0',) : 647,	
-	('video-mux',) : 360,	
-	('amlogic,meson6-ir', 'amlogic,meson8b-ir', 'amlogic,meson-gxbb-ir') : 155,	
-	('img,ir-rev1',) : 117,	
-	('gpio-ir-tx',) : 123,	
-	('qcom,msm8916-venus', 'qcom,msm8996-venus', 'qcom,sdm845-venus', 'qcom,sdm845-venus-v2', 'qcom,sc7180-venus') : 475,	
-	('ti,dra7-vpe',) : 1650,	
-	('gpio-ir-receiver',) : 132,	
-	('st,comms-irb',) : 256,	
-	('hisilicon,hix5hd2-ir', 'hisilicon,hi3796cv300-ir') : 281,	
-	('ir-spi-led',) : 107,	
-	('samsung,exynos5250-gsc', 'samsung,exynos5420-gsc', 'samsung,exynos5433-gsc', 'samsung,exynos5-gsc') : 973,	
-	('pwm-ir-tx',) : 83,	
-	('zte,zx296718-irdec',) : 115,	
-	('fsl,imx27-vpu', 'fsl,imx51-vpu', 'fsl,imx53-vpu', 'fsl,imx6q-vpu', 'fsl,imx6dl-vpu') : 2287,	
-	('renesas,r8a774a1-csi2', 'renesas,r8a774b1-csi2', 'renesas,r8a774c0-csi2', 'renesas,r8a774e1-csi2', 'renesas,r8a7795-csi2', 'renesas,r8a7796-csi2', 'renesas,r8a77965-csi2', 'renesas,r8a77970-csi2', 'renesas,r8a77980-csi2', 'renesas,r8a77990-csi2') : 823,	
-	('samsung,s5pv210-jpeg', 'samsung,exynos3250-jpeg', 'samsung,exynos4210-jpeg', 'samsung,exynos4212-jpeg', 'samsung,exynos5420-jpeg', 'samsung,exynos5433-jpeg') : 2175,	
-	('sigma,smp8642-ir',) : 182,	
-	('allwinner,sun4i-a10-ir', 'allwinner,sun5i-a13-ir', 'allwinner,sun6i-a31-ir') : 233,	
-	('qcom,msm8916-camss', 'qcom,msm8996-camss', 'qcom,sdm660-camss') : 767,	
-	('nokia,n900-ir',) : 159,	
-	('venus-encoder',) : 893,	
-	('mediatek,mt7623-cir', 'mediatek,mt7622-cir') : 231,	
-	('samsung,mfc-v5', 'samsung,mfc-v6', 'samsung,mfc-v7', 'samsung,mfc-v8', 'samsung,exynos5433-mfc', 'samsung,mfc-v10') : 1189,	
-	('aspeed,ast2400-video-engine', 'aspeed,ast2500-video-engine', 'aspeed,ast2600-video-engine') : 1221,	
-	('renesas,vin-r8a774a1', 'renesas,vin-r8a774b1', 'renesas,vin-r8a774c0', 'renesas,vin-r8a774e1', 'renesas,vin-r8a7778', 'renesas,vin-r8a7779', 'renesas,rcar-gen2-vin', 'renesas,vin-r8a7795', 'renesas,vin-r8a7796', 'renesas,vin-r8a77965', 'renesas,vin-r8a77970', 'renesas,vin-r8a77980', 'renesas,vin-r8a77990', 'renesas,vin-r8a77995') : 941,	
-	('nvidia,tegra114-cec', 'nvidia,tegra124-cec', 'nvidia,tegra210-cec') : 319,	
-	('renesas,fdp1',) : 1482,	
-	('amlogic,meson-gx-ao-cec',) : 497,	
-	('venus-decoder',) : 1189,	
-	('st,stm32-cec',) : 233,	
-	('amlogic,meson-g12a-ao-cec', 'amlogic,meson-sm1-ao-cec') : 501,	
-	('dongwoon,dw9807-vcm',) : 185,	
-	('chrontel,ch7322',) : 395,	
-	('asahi-kasei,ak7375',) : 173,	
-	('ti,ths8200',) : 259,	
-	('socionext,mn884433', 'socionext,mn884434-0', 'socionext,mn884434-1') : 557,	
-	('samsung,s5k6a3',) : 248,	
-	('st,stm32-dcmi',) : 1374,	
-	('marvell,pxa270-qci',) : 1631,	
-	('composite-video-connector', 'svideo-connector', 'nokia,smia') : 771,	
-	('maxim,max9286',) : 749,	
-	('ovti,ov5647',) : 446,	
-	('ti,tvp7002',) : 668,	
-	('toshiba,et8ek8',) : 927,	
-	('sony,imx214',) : 779,	
-	('dongwoon,dw9714',) : 158,	
-	('st,st-mipid02',) : 734,	
-	('adi,adv7343',) : 331,	
-	('ovti,ov7725', 'ovti,ov7720') : 1047,	
-	('dongwoon,dw9768', 'giantec,gt9769') : 301,	
-	('panasonic,amg88xx', 'melexis,mlx90640') : 608,	
-	('adi,adv7481', 'adi,adv7482') : 493,	
-	('sony,imx290',) : 780,	
-	('aptina,mt9p031', 'aptina,mt9p031m') : 798,	
-	('onnn,mt9m001',) : 581,	
-	('ovti,ov9650', 'ovti,ov9652') : 1145,	
-	('adi,adv7180', 'adi,adv7180cp', 'adi,adv7180st', 'adi,adv7182', 'adi,adv7280', 'adi,adv7280-m', 'adi,adv7281', 'adi,adv7281-m', 'adi,adv7281-ma', 'adi,adv7282', 'adi,adv7282-m') : 1091,	
-	('samsung,s5k5baf',) : 1363,	
-	('adi,ad5820', 'adi,ad5821', 'adi,ad5823') : 213,	
-	('ovti,ov2685',) : 593,	
-	('ovti,ov7251',) : 1146,	
-	('ovti,ov02a10',) : 686,	
-	('samsung,s5c73m3',) : 1209,	
-	('sony,imx219',) : 1055,	
-	('toshiba,tc358743',) : 1440,	
-	('aptina,mt9v111',) : 800,	
-	('ti,tvp5146', 'ti,tvp5146m2', 'ti,tvp5147', 'ti,tvp5147m1') : 692,	
-	('ovti,ov2640',) : 987,	
-	('ovti,ov5645',) : 986,	
-	('ovti,ov5695',) : 1053,	
-	('altr,a10-pr-ip',) : 24,	
-	('lattice,ice40-fpga-mgr',) : 121,	
-	('ovti,ov2680',) : 748,	
-	('xlnx,fpga-slave-serial',) : 161,	
-	('sony,imx274',) : 1191,	
-	('ovti,ov8856',) : 1486,	
-	('xlnx,pr-decoupler-1.00', 'xlnx,pr-decoupler') : 100,	
-	('micron,mt9m111',) : 976,	
-	('fpga-region',) : 243,	
-	('ovti,ov7740',) : 875,	
-	('aptina,mt9v022', 'aptina,mt9v022m', 'aptina,mt9v024', 'aptina,mt9v024m', 'aptina,mt9v032', 'aptina,mt9v032m', 'aptina,mt9v034', 'aptina,mt9v034m') : 912,	
-	('altr,socfpga-fpga2sdram-bridge',) : 92,	
-	('silabs,si470x',) : 293,	
-	('altr,socfpga-a10-fpga-mgr',) : 326,	
-	('xlnx,zynqmp-pcap-fpga',) : 76,	
-	('mipi-ccs-1.1', 'mipi-ccs-1.0', 'mipi-ccs', 'nokia,smia') : 2324,	
-	('altr,socfpga-hps2fpga-bridge', 'altr,socfpga-lwhps2fpga-bridge', 'altr,socfpga-fpga2hps-bridge') : 137,	
-	('imi,rdacm20',) : 496,	
-	('nxp,tda19971', 'nxp,tda19973') : 1822,	
-	('lattice,machxo2-slave-spi',) : 290,	
-	('intel,stratix10-soc-fpga-mgr', 'intel,agilex-soc-fpga-mgr') : 303,	
-	('altr,socfpga-fpga-mgr',) : 351,	
-	('altr,fpga-passive-serial', 'altr,fpga-arria10-passive-serial') : 201,	
-	('maxim,max2175',) : 916,	
-	('xlnx,zynq-devcfg-1.0',) : 384,	
-	('altr,freeze-bridge-controller',) : 178,	
-	('lantiq,cputemp',) : 78,	
-	('kontron,sl28cpld-fan',) : 86,	
-	('ovti,ov5640',) : 2053,	
-	('ti,ads7828', 'ti,ads7830') : 138,	
-	('ti,omap-opp-supply', 'ti,omap5-opp-supply', 'ti,omap5-core-opp-supply') : 245,	
-	('silabs,si4713',) : 1042,	
-	('microchip,mcp3021', 'microchip,mcp3221') : 127,	
-	('arm,vexpress-volt', 'arm,vexpress-amp', 'arm,vexpress-temp', 'arm,vexpress-power', 'arm,vexpress-energy') : 168,	
-	('gw,gsc-adc',) : 307,	
-	('ovti,ov2659',) : 1213,	
-	('iio-hwmon',) : 125,	
-	('pwm-fan',) : 335,	
-	('adi,adv7611', 'adi,adv7612') : 2355,	
-	('cirrus,lochnagar2-hwmon',) : 268,	
-	('ibm,p8-occ-hwmon',) : 165,	
-	('national,lm95235', 'national,lm95245') : 457,	
-	('nuvoton,w83773g',) : 186,	
-	('ti,lm70', 'ti,tmp121', 'ti,tmp122', 'ti,lm71', 'ti,lm74') : 135,	
-	('moortec,mr75203',) : 465,	
-	('ovti,ov7670',) : 1303,	
-	('ti,tvp5150',) : 1399,	
-	('maxim,max1619',) : 200,	
-	('maxim,max6650', 'maxim,max6651') : 516,	
-	('syna,as370-hwmon',) : 94,	
-	('adi,axi-fan-control-1.00.a',) : 280,	
-	('ti,ina219', 'ti,ina220', 'ti,ina226', 'ti,ina230', 'ti,ina231') : 693,	
-	('arm,scpi-sensors', 'amlogic,meson-gxbb-scpi-sensors') : 203,	
-	('gpio-fan',) : 364,	
-	('ti,tmp102',) : 207,	
-	('ti,tmp512', 'ti,tmp513') : 532,	
-	('ti,tmp421', 'ti,tmp422', 'ti,tmp423', 'ti,tmp441', 'ti,tmp442') : 218,	
-	('gmt,g762', 'gmt,g763') : 627,	
-	('adi,adm1177',) : 188,	
-	('ti,lm73',) : 175,	
-	('SUNW,ebus-pic16f747-env',) : 225,	
-	('maxim,max31730',) : 315,	
-	('zyxel,nsa320-mcu',) : 114,	
-	('honeywell,hih6130',) : 117,	
-	('adi,ad7416', 'adi,ad7417', 'adi,ad7418') : 219,	
-	('ti,tmp103',) : 114,	
-	('st,pm6764tr',) : 47,	
-	('inspur,ipsps1',) : 166,	
-	('ad,ad7414',) : 140,	
-	('jedec,jc-42.4-temp',) : 412,	
-	('ti,lm87', 'adi,adm1024') : 669,	
-	('adi,adt75', 'dallas,ds1775', 'dallas,ds75', 'dallas,ds7505', 'gmt,g751', 'national,lm75', 'national,lm75a', 'national,lm75b', 'maxim,max6625', 'maxim,max6626', 'maxim,max31725', 'maxim,max31726', 'maxim,mcp980x', 'nxp,pct2075', 'st,stds75', 'st,stlm75', 'microchip,tcn75', 'ti,tmp100', 'ti,tmp101', 'ti,tmp105', 'ti,tmp112', 'ti,tmp175', 'ti,tmp275', 'ti,tmp75', 'ti,tmp75b', 'ti,tmp75c') : 622,	
-	('ti,tps53647', 'ti,tps53667', 'ti,tps53679', 'ti,tps53681', 'ti,tps53688') : 169,	
-	('adi,ltc2947',) : 868,	
-	('ti,cd9200', 'ti,cd9220', 'ti,cd9222', 'ti,cd9224', 'ti,cd9240', 'ti,cd9244', 'ti,cd9246', 'ti,cd9248') : 128,	
-	('infineon,xdpe12254', 'infineon,xdpe12284') : 122,	
-	('delta,q54sj108a2',) : 323,	
-	('maxim,max31785', 'maxim,max31785a') : 262,	
-	('ibm,cffps1', 'ibm,cffps2', 'ibm,cffps') : 454,	
-	('adi,adt7473', 'adi,adt7475', 'adi,adt7476', 'adi,adt7490') : 1340,	
-	('adi,adm1266',) : 339,	
-	('amd,sbtsi',) : 150,	
-	('maxim,max6581', 'maxim,max6602', 'maxim,max6622', 'maxim,max6636', 'maxim,max6689', 'maxim,max6693', 'maxim,max6694', 'maxim,max6697', 'maxim,max6698', 'maxim,max6699') : 584,	
-	('aspeed,ast2400-pwm-tacho', 'aspeed,ast2500-pwm-tacho') : 699,	
-	('baikal,bt1-pvt',) : 676,	
-	('lltc,ltc2972', 'lltc,ltc2974', 'lltc,ltc2975', 'lltc,ltc2977', 'lltc,ltc2978', 'lltc,ltc2979', 'lltc,ltc2980', 'lltc,ltc3880', 'lltc,ltc3882', 'lltc,ltc3883', 'lltc,ltc3884', 'lltc,ltc3886', 'lltc,ltc3887', 'lltc,ltc3889', 'lltc,ltc7880', 'lltc,ltm2987', 'lltc,ltm4664', 'lltc,ltm4675', 'lltc,ltm4676', 'lltc,ltm4677', 'lltc,ltm4678', 'lltc,ltm4680', 'lltc,ltm4686', 'lltc,ltm4700') : 694,	
-	('lltc,ltc4151',) : 120,	
-	('ti,ucd9000', 'ti,ucd90120', 'ti,ucd90124', 'ti,ucd90160', 'ti,ucd90320', 'ti,ucd9090', 'ti,ucd90910') : 427,	
-	('national,lm63', 'national,lm64', 'national,lm96163') : 793,	
-	('mps,mp2975',) : 506,	
-	('maxim,max20710', 'maxim,max20730', 'maxim,max20734', 'maxim,max20743') : 599,	
-	('maxim,max6621',) : 379,	
-	('ti,ina209',) : 389,	
-	('sensirion,shtc1', 'sensirion,shtw1', 'sensirion,shtc3') : 181,	
-	('microchip,sparx5-temp',) : 104,	
-	('nuvoton,npcm750-pwm-fan',) : 689,	
-	('apm,xgene-slimpro-hwmon',) : 474,	
-	('ti,tmp108',) : 324,	
-	('ti,adc128d818',) : 369,	
-	('stericsson,abx500-temp',) : 311,	
-	('stts751',) : 525,	
-	('sensirion,sht15',) : 598,	
-	('epcos,b57330v2103', 'epcos,b57891s0103', 'murata,ncp03wb473', 'murata,ncp03wf104', 'murata,ncp15wb473', 'murata,ncp15wl333', 'murata,ncp15xh103', 'murata,ncp18wb473', 'murata,ncp21wb473', 'ntc,ncp03wb473', 'ntc,ncp15wb473', 'ntc,ncp15wl333', 'ntc,ncp18wb473', 'ntc,ncp21wb473') : 537,	
-	('mediatek,mt7621-hsdma',) : 499,	
-	('xlnx,clocking-wizard',) : 219,	
-	('adi,ltc2992',) : 695,	
-	('google,arche-platform', 'google,arche-platform', 'usbffff,2') : 385,	
-	('ti,ina3221',) : 640,	
-	('usbffff,2',) : 272,	
-	('silabs,wfx-sdio', 'silabs,wf200') : 175,	
-	('hisilicon,hi6421-spmi',) : 212,	
-	('mediatek,mt7621-pci',) : 423,	
-	('hisilicon,kirin970-spmi-controller',) : 253,	
-	('silabs,wfx-spi', 'silabs,wf200') : 172,	
-	('fsl,imx-capture-subsystem',) : 88,	
-	('cavium,octeon-3860-pip',) : 634,	
-	('hisilicon,hi3670-usb-phy',) : 464,	
-	('adi,adm1027', 'adi,adt7463', 'adi,adt7468', 'national,lm85', 'national,lm85b', 'national,lm85c', 'ti,lm96000', 'smsc,emc6d100', 'smsc,emc6d101', 'smsc,emc6d102', 'smsc,emc6d103', 'smsc,emc6d103s') : 1158,	
-	('ralink,rt305x-gdma', 'ralink,rt3883-gdma') : 643,	
-	('toshiba,apb-dummy-codec',) : 753,	
-	('nvidia,tegra210-csi', 'nvidia,tegra210-vi') : 97,	
-	('adi,adm1032', 'adi,adt7461', 'adi,adt7461a', 'gmt,g781', 'national,lm90', 'national,lm86', 'national,lm89', 'national,lm99', 'dallas,max6646', 'dallas,max6647', 'dallas,max6649', 'dallas,max6654', 'dallas,max6657', 'dallas,max6658', 'dallas,max6659', 'dallas,max6680', 'dallas,max6681', 'dallas,max6695', 'dallas,max6696', 'onnn,nct1008', 'winbond,w83l771', 'nxp,sa56004', 'ti,tmp451') : 1233,	
-	('fsl,imx6-mipi-csi2',) : 443,	
-	('allwinner,sun4i-a10-video-engine', 'allwinner,sun5i-a13-video-engine', 'allwinner,sun7i-a20-video-engine', 'allwinner,sun8i-a33-video-engine', 'allwinner,sun8i-h3-video-engine', 'allwinner,sun8i-v3s-video-engine', 'allwinner,sun8i-r40-video-engine', 'allwinner,sun50i-a64-video-engine', 'allwinner,sun50i-h5-video-engine', 'allwinner,sun50i-h6-video-engine') : 411,	
-	('nvidia,nvec',) : 503,	
-	('arcx,anybus-controller',) : 242,	
-	('xlnx,axi-fifo-mm-s-4.1',) : 567,	
-	('rockchip,rk3399-vpu', 'rockchip,rk3328-vpu', 'rockchip,rk3288-vpu', 'nxp,imx8mq-vpu') : 617,	
-	('adi,adis16203',) : 186,	
-	('nvidia,tegra210-csi',) : 493,	
-	('adi,adt7316', 'adi,adt7317', 'adi,adt7318', 'adi,adt7516', 'adi,adt7517', 'adi,adt7519') : 85,	
-	('adi,adis16240',) : 264,	
-	('fsl,imx7-csi', 'fsl,imx6ul-csi') : 900,	
-	('adi,ad7816', 'adi,ad7817', 'adi,ad7818') : 302,	
-	('fsl,imx7-mipi-csi2',) : 844,	
-	('adi,ad2s1210',) : 524,	
-	('nvidia,tegra20-vde',) : 789,	
-	('amlogic,gxbb-vdec', 'amlogic,gxm-vdec', 'amlogic,gxl-vdec', 'amlogic,g12a-vdec', 'amlogic,sm1-vdec') : 792,	
-	('adi,ad7745', 'adi,ad7746', 'adi,ad7747') : 567,	
-	('rockchip,rk3399-vdec',) : 721,	
-	('qcom,bcm-voter',) : 203,	
-	('adi,ad9833', 'adi,ad9834', 'adi,ad9837', 'adi,ad9838') : 386,	
-	('adi,ad5933', 'adi,ad5934') : 561,	
-	('Smarthome-Wolf,pi433',) : 872,	
-	('qcom,qcs404-bimc', 'qcom,qcs404-pcnoc', 'qcom,qcs404-snoc') : 413,	
-	('qcom,sdm845-pdc-global',) : 80,	
-	('socionext,uniphier-pro4-usb3-reset', 'socionext,uniphier-pro5-usb3-reset', 'socionext,uniphier-pxs2-usb3-reset', 'socionext,uniphier-ld20-usb3-reset', 'socionext,uniphier-pxs3-usb3-reset', 'socionext,uniphier-pro4-ahci-reset', 'socionext,uniphier-pxs2-ahci-reset', 'socionext,uniphier-pxs3-ahci-reset') : 117,	
-	('qcom,sc7180-osm-l3', 'qcom,sdm845-osm-l3', 'qcom,sm8150-osm-l3', 'qcom,sm8250-epss-l3') : 224,	
-	('qcom,sc7180-aggre1-noc', 'qcom,sc7180-aggre2-noc', 'qcom,sc7180-camnoc-virt', 'qcom,sc7180-compute-noc', 'qcom,sc7180-config-noc', 'qcom,sc7180-dc-noc', 'qcom,sc7180-gem-noc', 'qcom,sc7180-ipa-virt', 'qcom,sc7180-mc-virt', 'qcom,sc7180-mmss-noc', 'qcom,sc7180-npu-noc', 'qcom,sc7180-qup-virt', 'qcom,sc7180-system-noc') : 525,	
-	('st,stih407-powerdown', 'st,stih407-softreset', 'st,stih407-picophyreset') : 110,	
-	('marvell,berlin2-reset',) : 59,	
-	('qcom,msm8916-bimc', 'qcom,msm8916-pcnoc', 'qcom,msm8916-snoc') : 444,	
-	('hisilicon,hi3660-reset',) : 74,	
-	('fsl,imx6q-mlb150', 'renesas,mlp', 'rcar,medialb-dim2', 'xlnx,axi4-os62420_3pin-1.00.a', 'xlnx,axi4-os62420_6pin-1.00.a') : 636,	
-	('nvidia,tegra210-vi',) : 1144,	
-	('allwinner,sun6i-a31-ahb1-reset',) : 47,	
-	('hisilicon,hi6220-sysctrl', 'hisilicon,hi6220-mediactrl', 'hisilicon,hi6220-aoctrl') : 136,	
-	('snps,axs10x-reset',) : 48,	
-	('qcom,sm8150-aggre1-noc', 'qcom,sm8150-aggre2-noc', 'qcom,sm8150-camnoc-virt', 'qcom,sm8150-compute-noc', 'qcom,sm8150-config-noc', 'qcom,sm8150-dc-noc', 'qcom,sm8150-gem-noc', 'qcom,sm8150-ipa-virt', 'qcom,sm8150-mc-virt', 'qcom,sm8150-mmss-noc', 'qcom,sm8150-system-noc') : 527,	
-	('brcm,bcm2835-vchiq', 'brcm,bcm2836-vchiq') : 1852,	
-	('raspberrypi,firmware-reset',) : 66,	
-	('qcom,sm8250-aggre1-noc', 'qcom,sm8250-aggre2-noc', 'qcom,sm8250-compute-noc', 'qcom,sm8250-config-noc', 'qcom,sm8250-dc-noc', 'qcom,sm8250-gem-noc', 'qcom,sm8250-ipa-virt', 'qcom,sm8250-mc-virt', 'qcom,sm8250-mmss-noc', 'qcom,sm8250-npu-noc', 'qcom,sm8250-system-noc') : 543,	
-	('img,pistachio-reset',) : 94,	
-	('altr,rst-mgr',) : 57,	
-	('socionext,uniphier-ld4-reset', 'socionext,uniphier-pro4-reset', 'socionext,uniphier-sld8-reset', 'socionext,uniphier-pro5-reset', 'socionext,uniphier-pxs2-reset', 'socionext,uniphier-ld11-reset', 'socionext,uniphier-ld20-reset', 'socionext,uniphier-pxs3-reset', 'socionext,uniphier-ld4-mio-reset', 'socionext,uniphier-pro4-mio-reset', 'socionext,uniphier-sld8-mio-reset', 'socionext,uniphier-pro5-sd-reset', 'socionext,uniphier-pxs2-sd-reset', 'socionext,uniphier-ld11-mio-reset', 'socionext,uniphier-ld11-sd-reset', 'socionext,uniphier-ld20-sd-reset', 'socionext,uniphier-pxs3-sd-reset', 'socionext,uniphier-ld4-peri-reset', 'socionext,uniphier-pro4-peri-reset', 'socionext,uniphier-sld8-peri-reset', 'socionext,uniphier-pro5-peri-reset', 'socionext,uniphier-pxs2-peri-reset', 'socionext,uniphier-ld11-peri-reset', 'socionext,uniphier-ld20-peri-reset', 'socionext,uniphier-pxs3-peri-reset', 'socionext,uniphier-ld11-adamv-reset', 'socionext,uniphier-ld20-adamv-reset') : 335,	
-	('qcom,msm8974-bimc', 'qcom,msm8974-cnoc', 'qcom,msm8974-mmssnoc', 'qcom,msm8974-ocmemnoc', 'qcom,msm8974-pnoc', 'qcom,msm8974-snoc') : 602,	
-	('ti,sci-reset',) : 116,	
-	('altr,a10sr-reset',) : 77,	
-	('altr,stratix10-rst-mgr', 'st,stm32-rcc', 'allwinner,sun6i-a31-clock-reset', 'zte,zx296718-reset', 'aspeed,ast2400-lpc-reset', 'aspeed,ast2500-lpc-reset', 'bitmain,bm1880-reset', 'snps,dw-high-reset', 'snps,dw-low-reset') : 125,	
-	('qca,ar7100-reset',) : 87,	
-	('qcom,sdm845-aggre1-noc', 'qcom,sdm845-aggre2-noc', 'qcom,sdm845-config-noc', 'qcom,sdm845-dc-noc', 'qcom,sdm845-gladiator-noc', 'qcom,sdm845-mem-noc', 'qcom,sdm845-mmss-noc', 'qcom,sdm845-system-noc') : 480,	
-	('nxp,lpc1850-rgu',) : 145,	
-	('xlnx,zynqmp-reset', 'xlnx,versal-reset') : 82,	
-	('amlogic,meson8b-reset', 'amlogic,meson-gxbb-reset', 'amlogic,meson-axg-reset', 'amlogic,meson-a1-reset') : 97,	
-	('snps,hsdk-reset',) : 89,	
-	('brcm,bcm7216-pcie-sata-rescal',) : 71,	
-	('amlogic,meson-axg-audio-arb', 'amlogic,meson-sm1-audio-arb') : 131,	
-	('brcm,bcm6345-reset',) : 0,	
-	('xlnx,zynq-reset',) : 83,	
-	('qcom,sdm845-aoss-cc',) : 84,	
-	('fsl,imx7d-src', 'fsl,imx8mq-src', 'fsl,imx8mp-src') : 297,	
-	('intel,rcu-lgm', 'intel,rcu-xrx200') : 165,	
-	('brcm,brcmstb-reset',) : 72,	
-	('nuvoton,npcm750-reset',) : 197,	
-	('st,stm32mp1-rcc',) : 1534,	
-	('ti,syscon-reset',) : 121,	
-	('oxsemi,ox810se-reset', 'oxsemi,ox820-reset') : 68,	
-	('allegro,al5e-1.1',) : 2212,	
-	('lantiq,danube-reset', 'lantiq,xrx200-reset') : 133,	
-	('cavium,octeon-5750-usbc',) : 1967,	
-	('st,stih415-sas-thermal', 'st,stih415-mpe-thermal', 'st,stih416-sas-thermal', 'st,stid127-thermal') : 108,	
-	('st,stih416-mpe-thermal', 'st,stih407-thermal') : 119,	
-	('zte,zx296718-thermal',) : 156,	
-	('stericsson,db8500-thermal',) : 153,	
-	('marvell,kirkwood-thermal',) : 71,	
-	('fsl,imx-sc-thermal',) : 101,	
-	('allwinner,sun8i-a83t-ths', 'allwinner,sun8i-h3-ths', 'allwinner,sun8i-r40-ths', 'allwinner,sun50i-a64-ths', 'allwinner,sun50i-a100-ths', 'allwinner,sun50i-h5-ths', 'allwinner,sun50i-h6-ths') : 393,	
-	('st,stm32-thermal',) : 351,	
-	('arm,dsu-pmu',) : 542,	
-	('amazon,al-thermal',) : 75,	
-	('fsl,imx8-ddr-pmu', 'fsl,imx8m-ddr-pmu', 'fsl,imx8mq-ddr-pmu', 'fsl,imx8mm-ddr-pmu', 'fsl,imx8mn-ddr-pmu', 'fsl,imx8mp-ddr-pmu') : 500,	
-	('amlogic,g12a-ddr-thermal', 'amlogic,g12a-cpu-thermal') : 202,	
-	('generic-adc-thermal',) : 114,	
-	('st,thermal-spear1340',) : 113,	
-	('hisilicon,tsensor', 'hisilicon,hi3660-tsensor') : 337,	
-	('renesas,r8a774a1-thermal', 'renesas,r8a774b1-thermal', 'renesas,r8a774e1-thermal', 'renesas,r8a7795-thermal', 'renesas,r8a7796-thermal', 'renesas,r8a77961-thermal', 'renesas,r8a77965-thermal', 'renesas,r8a77980-thermal', 'renesas,r8a779a0-thermal') : 248,	
-	('sprd,ums512-thermal',) : 339,	
-	('arm,statistical-profiling-extension-v1',) : 752,	
-	('mediatek,mt8173-thermal', 'mediatek,mt2701-thermal', 'mediatek,mt2712-thermal', 'mediatek,mt7622-thermal', 'mediatek,mt8183-thermal') : 651,	
-	('fsl,imx8mm-tmu', 'fsl,imx8mp-tmu') : 150,	
-	('socionext,uniphier-pxs2-thermal', 'socionext,uniphier-ld20-thermal', 'socionext,uniphier-pxs3-thermal') : 222,	
-	('ti,am654-vtm',) : 181,	
-	('brcm,sr-thermal',) : 69,	
-	('nvidia,tegra186-bpmp-thermal',) : 167,	
-	('brcm,ns-thermal',) : 61,	
-	('brcm,bcm2711-thermal',) : 76,	
-	('arm,cci-400-pmu', 'arm,cci-400-pmu,r0', 'arm,cci-400-pmu,r1', 'arm,cci-500-pmu,r0', 'arm,cci-550-pmu,r0') : 1052,	
-	('arm,cmn-600',) : 1100,	
-	('brcm,bcm2835-thermal', 'brcm,bcm2836-thermal', 'brcm,bcm2837-thermal') : 185,	
-	('fsl,imx6q-tempmon', 'fsl,imx6sx-tempmon', 'fsl,imx7d-tempmon') : 573,	
-	('sigma,smp8758-thermal',) : 72,	
-	('marvell,dove-thermal',) : 111,	
-	('brcm,avs-tmon-bcm7216', 'brcm,avs-tmon') : 235,	
-	('dlg,da9062-thermal',) : 182,	
-	('samsung,exynos3250-tmu', 'samsung,exynos4210-tmu', 'samsung,exynos4412-tmu', 'samsung,exynos5250-tmu', 'samsung,exynos5260-tmu', 'samsung,exynos5420-tmu', 'samsung,exynos5420-tmu-ext-triminfo', 'samsung,exynos5433-tmu', 'samsung,exynos7-tmu') : 778,	
-	('renesas,rcar-thermal', 'renesas,rcar-gen2-thermal', 'renesas,thermal-r8a774c0', 'renesas,thermal-r8a77970', 'renesas,thermal-r8a77990', 'renesas,thermal-r8a77995') : 386,	
-	('marvell,armadaxp-thermal', 'marvell,armada370-thermal', 'marvell,armada375-thermal', 'marvell,armada380-thermal', 'marvell,armada-ap806-thermal', 'marvell,armada-cp110-thermal') : 588,	
-	('rockchip,px30-tsadc', 'rockchip,rv1108-tsadc', 'rockchip,rk3228-tsadc', 'rockchip,rk3288-tsadc', 'rockchip,rk3328-tsadc', 'rockchip,rk3366-tsadc', 'rockchip,rk3368-tsadc', 'rockchip,rk3399-tsadc') : 951,	
-	('arm,ccn-502', 'arm,ccn-504', 'arm,ccn-512') : 1097,	
-	('qcom,spmi-temp-alarm',) : 278,	
-	('fsl,qoriq-tmu', 'fsl,imx8mq-tmu') : 237,	
-	('ti,omap34xx-bandgap', 'ti,omap36xx-bandgap', 'ti,omap4430-bandgap', 'ti,omap4460-bandgap', 'ti,omap4470-bandgap', 'ti,omap5430-bandgap', 'ti,dra752-bandgap') : 658,	
-	('google,cros-ec-rpmsg',) : 183,	
-	('loongson,rs780e-acpi',) : 88,	
-	('google,cros-ec-i2c',) : 242,	
-	('dlg,da9062-watchdog',) : 180,	
-	('ralink,rt2880-wdt',) : 117,	
-	('amlogic,meson-gxbb-wdt',) : 126,	
-	('google,cros-ec-spi',) : 450,	
-	('nxp,lpc1850-wwdt',) : 185,	
-	('sigma,smp8642-wdt', 'sigma,smp8759-wdt') : 124,	
-	('qcom,kpss-timer', 'qcom,scss-timer', 'qcom,kpss-wdt') : 213,	
-	('mipi-i3c-hci',) : 560,	
-	('ti,twl4030-wdt',) : 77,	
-	('fsl,imx-sc-wdt',) : 164,	
-	('nxp,pnx4008-wdt',) : 153,	
-	('renesas,r7s9210-wdt', 'renesas,rza-wdt') : 136,	
-	('stericsson,coh901327',) : 237,	
-	('qcom,msm8916-tsens', 'qcom,msm8939-tsens', 'qcom,msm8974-tsens', 'qcom,msm8976-tsens', 'qcom,msm8996-tsens', 'qcom,tsens-v1', 'qcom,tsens-v2') : 662,	
-	('renesas,rcar-gen2-wdt', 'renesas,rcar-gen3-wdt') : 197,	
-	('lantiq,wdt', 'lantiq,xrx100-wdt', 'lantiq,falcon-wdt') : 170,	
-	('sprd,sp9860-wdt',) : 249,	
-	('google,cros-ec-typec',) : 632,	
-	('ti,davinci-wdt',) : 163,	
-	('olpc,xo1.75-ec',) : 504,	
-	('google,android-pipe',) : 523,	
-	('snps,dw-i3c-master-1.00a',) : 872,	
-	('linux,wdt-gpio',) : 125,	
-	('ti,j7-rti-wdt',) : 199,	
-	('atmel,at91sam9260-wdt',) : 251,	
-	('nvidia,tegra124-soctherm', 'nvidia,tegra132-soctherm', 'nvidia,tegra210-soctherm') : 1371,	
-	('xlnx,xps-timebase-wdt-1.00.a', 'xlnx,xps-timebase-wdt-1.01.a') : 179,	
-	('toshiba,visconti-wdt',) : 125,	
-	('sirf,atlas7-tick',) : 132,	
-	('brcm,kona-wdt',) : 207,	
-	('samsung,s3c2410-wdt', 'samsung,s3c6410-wdt', 'samsung,exynos5250-wdt', 'samsung,exynos5420-wdt', 'samsung,exynos7-wdt') : 451,	
-	('cdns,i3c-master',) : 1213,	
-	('cdns,wdt-r1p2',) : 205,	
-	('sirf,prima2-tick',) : 127,	
-	('microchip,pic32mzda-wdt',) : 138,	
-	('arm,smc-wdt',) : 123,	
-	('st,stm32-iwdg', 'st,stm32mp1-iwdg') : 176,	
-	('ingenic,jz4740-watchdog', 'ingenic,jz4780-watchdog') : 133,	
-	('img,pdc-wdt',) : 186,	
-	('qca,ar7130-wdt',) : 206,	
-	('moxa,moxart-watchdog',) : 103,	
-	('kontron,sl28cpld-wdt',) : 137,	
-	('mediatek,mt2712-wdt', 'mediatek,mt6589-wdt', 'mediatek,mt8183-wdt') : 228,	
-	('mediatek,mt7621-wdt',) : 103,	
-	('amlogic,meson6-wdt', 'amlogic,meson8-wdt', 'amlogic,meson8b-wdt', 'amlogic,meson8m2-wdt') : 150,	
-	('brcm,bcm7038-wdt',) : 136,	
-	('faraday,ftwdt010', 'cortina,gemini-watchdog') : 141,	
-	('mpc83xx_wdt', 'fsl,mpc8610-wdt', 'fsl,mpc823-wdt') : 163,	
-	('zii,rave-wdt',) : 455,	
-	('st,stpmic1-wdt',) : 89,	
-	('zii,rave-sp-watchdog-legacy', 'zii,rave-sp-watchdog') : 177,	
-	('qcom,pm8916-wdt',) : 155,	
-	('atmel,at91rm9200-wdt',) : 194,	
-	('gef,fpga-wdt',) : 189,	
-	('aspeed,ast2400-wdt', 'aspeed,ast2500-wdt', 'aspeed,ast2600-wdt') : 217,	
-	('fsl,imx7ulp-wdt',) : 203,	
-	('nuvoton,npcm750-wdt',) : 157,	
-	('socionext,uniphier-wdt',) : 153,	
-	('atmel,sama5d4-wdt', 'microchip,sam9x60-wdt') : 227,	
-	('microchip,pic32mzda-dmt',) : 140,	
-	('st,stih407-lpc',) : 192,	
-	('technologic,ts4800-wdt',) : 111,	
-	('arm,sbsa-gwdt',) : 182,	
-	('zte,zx296718-wdt',) : 171,	
-	('fsl,imx21-wdt',) : 238,	
-	('marvell,armada-3700-wdt',) : 206,	
-	('ingenic,jz4740-tcu', 'ingenic,jz4725b-tcu', 'ingenic,jz4770-tcu', 'ingenic,x1000-tcu') : 307,	
-	('ingenic,x1000-ost',) : 0,	
-	('men,a021-wdt',) : 142,	
-	('nvidia,tegra30-timer',) : 154,	
-	('cnxt,cx92755-wdt',) : 98,	
-	('realtek,rtd1295-watchdog',) : 95,	
-	('allwinner,sun4i-a10-wdt', 'allwinner,sun6i-a31-wdt') : 188,	
-	('snps,dw-wdt',) : 408,	
-	('ti,omap3-wdt',) : 218,	
-	('ingenic,jz4725b-ost', 'ingenic,jz4770-ost') : 108,	
-	('alphascale,asm9260-wdt',) : 220,	
-	('marvell,orion-wdt', 'marvell,armada-370-wdt', 'marvell,armada-xp-wdt', 'marvell,armada-375-wdt', 'marvell,armada-380-wdt') : 418,	
-	('picochip,pc3x2-rtc',) : 119,	
-	('cdns,ttc',) : 303,	
-	('st,stm32-lptimer-timer',) : 134,	
-	('ti,omap-counter32k', 'ti,omap2420-timer', 'ti,omap3430-timer', 'ti,omap4430-timer', 'ti,omap5430-timer', 'ti,am335x-timer', 'ti,am335x-timer-1ms', 'ti,dm814-timer', 'ti,dm816-timer') : 453,	
-	('img,boston-lcd', 'mti,malta-lcd', 'mti,sead3-lcd') : 231,	
-	('renesas,mtu2',) : 351,	
-	('atmel,at91rm9200-tcb', 'atmel,at91sam9x5-tcb', 'atmel,sama5d2-tcb') : 303,	
-	('renesas,em-sti',) : 218,	
-	('ti,omap2420-timer', 'ti,omap3430-timer', 'ti,omap4430-timer', 'ti,omap5430-timer', 'ti,am335x-timer', 'ti,am335x-timer-1ms', 'ti,dm816-timer') : 554,	
-	('modtronix,lcd2s',) : 247,	
-	('arm,versatile-lcd',) : 216,	
-	('holtek,ht16k33',) : 363,	
-	('hit,hd44780',) : 214,	
-	('renesas,tmu',) : 408,	
-	('arm,scpi-power-domains',) : 88,	
-	('fsl,imx-scu',) : 229,	
-	('fsl,imx8qxp-scu-pd', 'fsl,scu-pd') : 234,	
-	('amlogic,meson-gxbb-sm',) : 175,	
-	('coreboot',) : 129,	
-	('arm,psci', 'arm,psci-0.2', 'arm,psci-1.0') : 336,	
-	('renesas,cmt-48', 'renesas,cmt-48-gen2', 'renesas,r8a7740-cmt1', 'renesas,sh73a0-cmt1', 'renesas,rcar-gen2-cmt0', 'renesas,rcar-gen2-cmt1', 'renesas,rcar-gen3-cmt0', 'renesas,rcar-gen3-cmt1') : 673,	
-	('raspberrypi,bcm2835-firmware',) : 167,	
-	('cznic,turris-mox-rwtm',) : 355,	
-	('qemu,fw-cfg-mmio',) : 547,	
-	('silabs,si514',) : 256,	
-	('arm,scpi-pre-1.0', 'arm,scpi', 'arm,scpi-pre-1.0') : 730,	
-	('st,flexgen-audio', 'st,flexgen-video') : 254,	
-	('fsl,scu-clk', 'fsl,imx8qxp-clk') : 125,	
-	('nxp,lpc1850-creg-clk',) : 137,	
-	('arm,scmi', 'arm,scmi-smc') : 534,	
-	('intel,cgu-lgm',) : 392,	
-	('nvidia,tegra186-bpmp', 'nvidia,tegra210-bpmp') : 569,	
-	('microchip,pic32mzda-clk',) : 184,	
-	('arm,sdei-1.0',) : 673,	
-	('intel,stratix10-svc', 'intel,agilex-svc') : 642,	
-	('allwinner,sun9i-a80-usb-clks',) : 99,	
-	('fsl,imx8qxp-lpcg-adma', 'fsl,imx8qxp-lpcg-conn', 'fsl,imx8qxp-lpcg-lsio', 'fsl,imx8qxp-lpcg') : 255,	
-	('xlnx,zynqmp-firmware', 'xlnx,versal-firmware') : 557,	
-	('allwinner,sun9i-a80-de-clks',) : 224,	
-	('allwinner,sun50i-a100-r-ccu',) : 145,	
-	('qcom,scm-apq8064', 'qcom,scm-apq8084', 'qcom,scm-ipq4019', 'qcom,scm-msm8660', 'qcom,scm-msm8960', 'qcom,scm-msm8916', 'qcom,scm-msm8974', 'qcom,scm-msm8994', 'qcom,scm-msm8996', 'qcom,scm') : 759,	
-	('fsl,imx8mn-ccm',) : 358,	
-	('allwinner,sun8i-a83t-de2-clk', 'allwinner,sun8i-h3-de2-clk', 'allwinner,sun8i-r40-de2-clk', 'allwinner,sun8i-v3s-de2-clk', 'allwinner,sun50i-a64-de2-clk', 'allwinner,sun50i-h5-de2-clk', 'allwinner,sun50i-h6-de3-clk') : 267,	
-	('fsl,ls1028a-plldig',) : 171,	
-	('maxim,max9485',) : 243,	
-	('snps,axs10x-i2s-pll-clock',) : 148,	
-	('snps,axs10x-pgu-pll-clock',) : 222,	
-	('fsl,imx8mp-ccm',) : 427,	
-	('fsl,imx8mm-ccm',) : 418,	
-	('fsl,imx8mq-ccm',) : 420,	
-	('adi,axi-clkgen-2.00.a',) : 391,	
-	('arm,scpi-dvfs-clocks', 'arm,scpi-variable-clocks', 'arm,scpi-clocks') : 199,	
-	('hisilicon,hi6220-stub-clk',) : 166,	
-	('hisilicon,hi3516cv300-crg', 'hisilicon,hi3516cv300-sysctrl') : 225,	
-	('ti,palmas-clk32kg', 'ti,palmas-clk32kgaudio') : 197,	
-	('cirrus,cs2000-cp',) : 342,	
-	('allwinner,sun8i-a83t-ccu',) : 755,	
-	('allwinner,sun50i-a64-ccu',) : 798,	
-	('hisilicon,hi3519-crg',) : 142,	
-	('hisilicon,hi3660-stub-clk',) : 104,	
-	('allwinner,sun50i-a100-ccu',) : 977,	
-	('idt,5p49v5923', 'idt,5p49v5925', 'idt,5p49v5933', 'idt,5p49v5935', 'idt,5p49v6901', 'idt,5p49v6965') : 786,	
-	('allwinner,sun9i-a80-ccu',) : 1010,	
-	('cirrus,lochnagar1-clk', 'cirrus,lochnagar2-clk') : 206,	
-	('hisilicon,hi3798cv200-crg', 'hisilicon,hi3798cv200-sysctrl') : 300,	
-	('axis,artpec6-clkctrl',) : 170,	
-	('allwinner,sun50i-h6-ccu',) : 984,	
-	('ti,k2g-sci', 'ti,am654-sci') : 1873,	
-	('cortina,gemini-syscon',) : 280,	
-	('brcm,brcm2711-dvp',) : 86,	
-	('socionext,uniphier-ld4-clock', 'socionext,uniphier-pro4-clock', 'socionext,uniphier-sld8-clock', 'socionext,uniphier-pro5-clock', 'socionext,uniphier-pxs2-clock', 'socionext,uniphier-ld11-clock', 'socionext,uniphier-ld20-clock', 'socionext,uniphier-pxs3-clock', 'socionext,uniphier-ld4-mio-clock', 'socionext,uniphier-pro4-mio-clock', 'socionext,uniphier-sld8-mio-clock', 'socionext,uniphier-pro5-sd-clock', 'socionext,uniphier-pxs2-sd-clock', 'socionext,uniphier-ld11-mio-clock', 'socionext,uniphier-ld20-sd-clock', 'socionext,uniphier-pxs3-sd-clock', 'socionext,uniphier-ld4-peri-clock', 'socionext,uniphier-pro4-peri-clock', 'socionext,uniphier-sld8-peri-clock', 'socionext,uniphier-pro5-peri-clock', 'socionext,uniphier-pxs2-peri-clock', 'socionext,uniphier-ld11-peri-clock', 'socionext,uniphier-ld20-peri-clock', 'socionext,uniphier-pxs3-peri-clock') : 124,	
-	('hisilicon,hi3660-crgctrl', 'hisilicon,hi3660-pctrl', 'hisilicon,hi3660-pmuctrl', 'hisilicon,hi3660-sctrl', 'hisilicon,hi3660-iomcu') : 537,	
-	('brcm,bcm2835-aux',) : 49,	
-	('bitmain,bm1880-clk',) : 718,	
-	('allwinner,sun8i-r40-ccu',) : 1123,	
-	('silabs,si5351a', 'silabs,si5351a-msop', 'silabs,si5351b', 'silabs,si5351c') : 1106,	
-	('samsung,exynos3250-pmu', 'samsung,exynos4210-pmu', 'samsung,exynos4412-pmu', 'samsung,exynos5250-pmu', 'samsung,exynos5410-pmu', 'samsung,exynos5420-pmu', 'samsung,exynos5433-pmu') : 154,	
-	('raspberrypi,firmware-clocks',) : 245,	
-	('zte,zx296718-topcrm', 'zte,zx296718-lsp0crm', 'zte,zx296718-lsp1crm', 'zte,zx296718-audiocrm') : 621,	
-	('samsung,exynos5250-clock', 'samsung,exynos5420-clock', 'samsung,exynos5800-clock') : 119,	
-	('brcm,sr-genpll0', 'brcm,sr-genpll2', 'brcm,sr-genpll4', 'brcm,sr-genpll5', 'brcm,sr-lcpll0', 'brcm,sr-lcpll1', 'brcm,sr-lcpll-pcie') : 310,	
-	('hisilicon,hi3670-crgctrl', 'hisilicon,hi3670-pctrl', 'hisilicon,hi3670-pmuctrl', 'hisilicon,hi3670-sctrl', 'hisilicon,hi3670-iomcu', 'hisilicon,hi3670-media1-crg', 'hisilicon,hi3670-media2-crg') : 860,	
-	('brcm,bcm3368-clocks', 'brcm,bcm6318-clocks', 'brcm,bcm6318-ubus-clocks', 'brcm,bcm6328-clocks', 'brcm,bcm6358-clocks', 'brcm,bcm6362-clocks', 'brcm,bcm6368-clocks', 'brcm,bcm63268-clocks') : 367,	
-	('samsung,s5pv210-audss-clock',) : 143,	
-	('samsung,exynos4412-isp-clock',) : 122,	
-	('amlogic,meson8-ddr-clkc', 'amlogic,meson8b-ddr-clkc') : 97,	
-	('st,stm32f42xx-rcc', 'st,stm32f469-rcc', 'st,stm32f746-rcc', 'st,stm32f769-rcc') : 1331,	
-	('marvell,armada-3700-xtal-clock',) : 53,	
-	('silabs,si5340', 'silabs,si5341', 'silabs,si5342', 'silabs,si5344', 'silabs,si5345') : 1065,	
-	('marvell,armada-3700-tbg-clock',) : 100,	
-	('ti,da850-psc0', 'ti,da850-psc1') : 351,	
-	('marvell,ap806-system-controller', 'marvell,ap806-clock', 'marvell,ap807-clock') : 211,	
-	('marvell,ap806-cpu-clock', 'marvell,ap807-cpu-clock') : 236,	
-	('ti,da830-tbclksync', 'ti,da830-div4p5ena', 'ti,da850-async1-clksrc', 'ti,da850-async3-clksrc', 'ti,da830-usb-phy-clocks') : 481,	
-	('ti,da850-pll1',) : 643,	
-	('arm,im-pd1-syscon',) : 95,	
-	('allwinner,sun6i-a31-ar100-clk',) : 62,	
-	('allwinner,sun8i-a23-apb0-clk',) : 65,	
-	('arm,vexpress-osc',) : 75,	
-	('stericsson,ab8500-clk',) : 78,	
-	('marvell,cp110-system-controller0', 'marvell,cp110-clock') : 292,	
-	('marvell,armada-3700-periph-clock-nb', 'marvell,armada-3700-periph-clock-sb') : 525,	
-	('marvell,mmp2-audio-clock',) : 334,	
-	('samsung,clock-xxti',) : 652,	
-	('silabs,si544a', 'silabs,si544b', 'silabs,si544c') : 322,	
-	('allwinner,sun6i-a31-apb0-gates-clk', 'allwinner,sun8i-a23-apb0-gates-clk') : 63,	
-	('allwinner,sun6i-a31-apb0-clk',) : 38,	
-	('xlnx,zynqmp-clk', 'xlnx,versal-clk') : 400,	
-	('samsung,exynos3250-cmu-isp',) : 808,	
-	('silabs,si570', 'silabs,si571', 'silabs,si598', 'silabs,si599') : 301,	
-	('fixed-mmio-clock',) : 56,	
-	('allwinner,sun4i-a10-mod0-clk',) : 219,	
-	('allwinner,sun9i-a80-mmc-config-clk',) : 138,	
-	('actions,s500-cmu',) : 505,	
-	('samsung,clock-xxti', 'samsung,clock-xusbxti') : 1114,	
-	('allwinner,sun4i-a10-pll3-2x-clk', 'fixed-factor-clock') : 148,	
-	('actions,s700-cmu',) : 543,	
-	('ti,clockdomain', 'ti,clockdomain') : 81,	
-	('brcm,bcm2835-cprman', 'brcm,bcm2711-cprman') : 1568,	
-	('ti,dra7-atl',) : 196,	
-	('pwm-clock',) : 93,	
-	('fsl,vf610-sai-clock',) : 63,	
-	('actions,s900-cmu',) : 662,	
-	('fsl,ls1028a-flexspi-clk', 'fsl,lx2160a-flexspi-clk') : 72,	
-	('samsung,exynos5420-oscclk',) : 1354,	
-	('atmel,sama5d2-pmc',) : 187,	
-	('snps,hsdk-gp-pll-clock', 'snps,hsdk-hdmi-pll-clock') : 275,	
-	('fixed-clock', 'fixed-factor-clock') : 282,	
-	('ti,am654-ehrpwm-tbclk',) : 111,	
-	('microchip,sparx5-dpll',) : 187,	
-	('amlogic,axg-clkc',) : 1619,	
-	('amlogic,axg-audio-clkc', 'amlogic,g12a-audio-clkc', 'amlogic,sm1-audio-clkc') : 1675,	
-	('lsi,axm5516-clks',) : 339,	
-	('stericsson,nomadik-src',) : 328,	
-	('ti,cdce706',) : 472,	
-	('ti,dm814-adpll-s-clock', 'ti,dm814-adpll-lj-clock') : 680,	
-	('ti,k2g-sci-clk',) : 394,	
-	('aspeed,ast2600-scu',) : 533,	
-	('mediatek,mt2712-bdpsys',) : 65,	
-	('aspeed,ast2400-scu', 'aspeed,ast2500-scu') : 486,	
-	('mediatek,mt8183-ipu_adl',) : 29,	
-	('nvidia,tegra124-dfll', 'nvidia,tegra210-dfll') : 490,	
-	('mediatek,mt7622-pciesys', 'mediatek,mt7622-ssusbsys') : 104,	
-	('mediatek,mt2712-vdecsys',) : 51,	
-	('mediatek,mt7629-pciesys', 'mediatek,mt7629-ssusbsys') : 99,	
-	('mediatek,mt6797-vencsys',) : 41,	
-	('intel,stratix10-clkmgr',) : 329,	
-	('intel,agilex-clkmgr',) : 342,	
-	('mediatek,mt6779-camsys',) : 41,	
-	('mediatek,mt8183-camsys',) : 38,	
-	('mediatek,mt6797-imgsys',) : 41,	
-	('mediatek,mt2712-jpgdecsys',) : 39,	
-	('mediatek,mt6765-vcodecsys',) : 41,	
-	('mediatek,mt6765-mmsys',) : 66,	
-	('mediatek,mt8183-imgsys',) : 38,	
-	('mediatek,mt7629-ethsys', 'mediatek,mt7629-sgmiisys') : 100,	
-	('mediatek,mt2701-vdecsys',) : 50,	
-	('mediatek,mt8183-vdecsys',) : 37,	
-	('mediatek,mt8183-vencsys',) : 34,	
-	('mediatek,mt6779-ipesys',) : 35,	
-	('mediatek,mt7629-apmixedsys', 'mediatek,mt7629-infracfg', 'mediatek,mt7629-topckgen', 'mediatek,mt7629-pericfg') : 401,	
-	('mediatek,mt2701-ethsys',) : 44,	
-	('mediatek,mt6779-audio',) : 86,	
-	('nvidia,tegra20-pmc',) : 876,	
-	('mediatek,mt6779-mfgcfg',) : 29,	
-	('amlogic,gxbb-clkc', 'amlogic,gxl-clkc') : 2675,	
-	('mediatek,mt2701-audsys',) : 137,	
-	('mediatek,mt2712-mfgcfg',) : 38,	
-	('mediatek,mt7622-ethsys', 'mediatek,mt7622-sgmiisys') : 92,	
-	('mediatek,mt6765-audsys',) : 65,	
-	('mediatek,mt6765-imgsys',) : 41,	
-	('mediatek,mt8183-mfgcfg',) : 31,	
-	('mediatek,mt6765-mipi0a',) : 39,	
-	('mediatek,mt8183-audiosys',) : 73,	
-	('nvidia,tegra114-pmc',) : 1033,	
-	('mediatek,mt6797-vdecsys',) : 52,	
-	('nvidia,tegra30-pmc',) : 1069,	
-	('mediatek,mt7622-audsys',) : 140,	
-	('mediatek,mt2701-bdpsys',) : 97,	
-	('mediatek,mt2701-g3dsys',) : 54,	
-	('mediatek,mt6779-imgsys',) : 33,	
-	('mediatek,mt6765-camsys',) : 45,	
-	('mediatek,mt2701-imgsys',) : 43,	
-	('mediatek,mt6779-vencsys',) : 32,	
-	('nvidia,tegra124-pmc',) : 1209,	
-	('mediatek,mt8183-ipu_conn',) : 86,	
-	('mediatek,mt2712-imgsys',) : 43,	
-	('mediatek,mt8183-ipu_core0',) : 31,	
-	('mediatek,mt8183-ipu_core1',) : 31,	
-	('mediatek,mt2701-hifsys',) : 42,	
-	('mediatek,mt6779-vdecsys',) : 37,	
-	('mediatek,mt2712-vencsys',) : 40,	
-	('mediatek,mt2712-apmixedsys', 'mediatek,mt2712-topckgen', 'mediatek,mt2712-infracfg', 'mediatek,mt2712-pericfg', 'mediatek,mt2712-mcucfg') : 818,	
-	('mediatek,mt6797-topckgen', 'mediatek,mt6797-infracfg', 'mediatek,mt6797-apmixedsys') : 415,	
-	('mediatek,mt6765-apmixedsys', 'mediatek,mt6765-topckgen', 'mediatek,mt6765-infracfg') : 603,	
-	('mediatek,mt2701-topckgen', 'mediatek,mt2701-infracfg', 'mediatek,mt2701-pericfg', 'mediatek,mt2701-apmixedsys') : 578,	
-	('qcom,qcs404-q6sstopcc',) : 147,	
-	('gpio-mux-clock', 'gpio-gate-clock') : 130,	
-	('mediatek,mt7622-apmixedsys', 'mediatek,mt7622-infracfg', 'mediatek,mt7622-topckgen', 'mediatek,mt7622-pericfg') : 462,	
-	('samsung,s2mps11-clk', 'samsung,s2mps13-clk', 'samsung,s2mps14-clk', 'samsung,s5m8767-clk') : 177,	
-	('qcom,sc7180-gpucc',) : 189,	
-	('sifive,fu540-c000-prci', 'sifive,fu740-c000-prci') : 233,	
-	('qcom,sdm845-lpasscc',) : 100,	
-	('qcom,msm8916-a53pll',) : 73,	
-	('mediatek,mt6779-apmixed', 'mediatek,mt6779-topckgen', 'mediatek,mt6779-infracfg_ao') : 714,	
-	('sprd,sc9863a-ap-clk', 'sprd,sc9863a-pmu-gate', 'sprd,sc9863a-pll', 'sprd,sc9863a-mpll', 'sprd,sc9863a-rpll', 'sprd,sc9863a-dpll', 'sprd,sc9863a-aon-clk', 'sprd,sc9863a-apahb-gate', 'sprd,sc9863a-aonapb-gate', 'sprd,sc9863a-mm-gate', 'sprd,sc9863a-mm-clk', 'sprd,sc9863a-apapb-gate') : 1562,	
-	('qcom,msm8998-gpucc',) : 237,	
-	('qcom,sc7180-rpmh-clk', 'qcom,sdm845-rpmh-clk', 'qcom,sdx55-rpmh-clk', 'qcom,sm8150-rpmh-clk', 'qcom,sm8250-rpmh-clk', 'qcom,sm8350-rpmh-clk') : 401,	
-	('qcom,sm8150-videocc',) : 189,	
-	('samsung,exynos5433-cmu-aud', 'samsung,exynos5433-cmu-cam0', 'samsung,exynos5433-cmu-cam1', 'samsung,exynos5433-cmu-disp', 'samsung,exynos5433-cmu-g2d', 'samsung,exynos5433-cmu-g3d', 'samsung,exynos5433-cmu-fsys', 'samsung,exynos5433-cmu-gscl', 'samsung,exynos5433-cmu-mfc', 'samsung,exynos5433-cmu-hevc', 'samsung,exynos5433-cmu-isp', 'samsung,exynos5433-cmu-mscl', 'samsung,exynos5433-cmu-imem') : 4636,	
-	('qcom,msm8996-apcc',) : 334,	
-	('socionext,milbeaut-m10v-ccu',) : 476,	
-	('ti,cdce913', 'ti,cdce925', 'ti,cdce937', 'ti,cdce949') : 581,	
-	('mediatek,mt8183-apmixedsys', 'mediatek,mt8183-topckgen', 'mediatek,mt8183-infracfg', 'mediatek,mt8183-pericfg', 'mediatek,mt8183-mcucfg') : 822,	
-	('qcom,sc7180-mss',) : 90,	
-	('amlogic,g12a-clkc', 'amlogic,g12b-clkc', 'amlogic,sm1-clkc') : 3985,	
-	('nvidia,tegra210-pmc',) : 2670,	
-	('sprd,sc9860-pmu-gate', 'sprd,sc9860-pll', 'sprd,sc9860-ap-clk', 'sprd,sc9860-aon-prediv', 'sprd,sc9860-apahb-gate', 'sprd,sc9860-aon-gate', 'sprd,sc9860-aonsecure-clk', 'sprd,sc9860-agcp-gate', 'sprd,sc9860-gpu-clk', 'sprd,sc9860-vsp-clk', 'sprd,sc9860-vsp-gate', 'sprd,sc9860-cam-clk', 'sprd,sc9860-cam-gate', 'sprd,sc9860-disp-clk', 'sprd,sc9860-disp-gate', 'sprd,sc9860-apapb-gate') : 1776,	
-	('qcom,lcc-mdm9615',) : 450,	
-	('qcom,krait-cc-v1', 'qcom,krait-cc-v2') : 263,	
-	('qcom,ipq6018-a53pll',) : 66,	
-	('qcom,sc7180-videocc',) : 173,	
-	('qcom,gcc-sdx55',) : 1239,	
-	('qcom,sdm845-dispcc',) : 605,	
-	('qcom,lcc-ipq8064',) : 336,	
-	('qcom,hfpll',) : 78,	
-	('qcom,sm8250-videocc',) : 258,	
-	('rockchip,rk3399-cru', 'rockchip,rk3399-pmucru') : 1235,	
-	('qcom,gcc-ipq4019',) : 1187,	
-	('qcom,sc7180-lpasshm', 'qcom,sc7180-lpasscorecc') : 356,	
-	('qcom,kpss-acc-v1', 'qcom,kpss-gcc') : 57,	
-	('qcom,gcc-msm8994',) : 1803,	
-	('qcom,gcc-qcs404',) : 2006,	
-	('qcom,gcc-sc7180',) : 1831,	
-	('qcom,gcc-msm8974', 'qcom,gcc-msm8974pro', 'qcom,gcc-msm8974pro-ac') : 1959,	
-	('qcom,sdm845-camcc',) : 1238,	
-	('qcom,rpmcc-msm8916', 'qcom,rpmcc-msm8936', 'qcom,rpmcc-msm8974', 'qcom,rpmcc-msm8976', 'qcom,rpmcc-msm8992', 'qcom,rpmcc-msm8994', 'qcom,rpmcc-msm8996', 'qcom,rpmcc-msm8998', 'qcom,rpmcc-qcs404', 'qcom,rpmcc-sdm660') : 947,	
-	('qcom,sm8250-gpucc',) : 241,	
-	('qcom,sdm845-videocc',) : 240,	
-	('qcom,spmi-clkdiv',) : 192,	
-	('qcom,sm8250-lpass-aoncc', 'qcom,sm8250-lpass-audiocc') : 206,	
-	('qcom,sc7180-dispcc',) : 530,	
-	('qcom,gcc-mdm9615',) : 1308,	
-	('qcom,sdm845-gpucc',) : 146,	
-	('qcom,sm8150-dispcc', 'qcom,sm8250-dispcc') : 810,	
-	('qcom,gcc-sdm630', 'qcom,gcc-sdm660') : 1746,	
-	('qcom,qcs404-turingcc',) : 112,	
-	('qcom,gcc-apq8084',) : 2548,	
-	('qcom,mmcc-msm8998',) : 2189,	
-	('qcom,sm8150-gpucc',) : 223,	
-	('qcom,rpmcc-msm8660', 'qcom,rpmcc-apq8060', 'qcom,rpmcc-apq8064', 'qcom,rpmcc-ipq806x') : 492,	
-	('qcom,mmcc-msm8996',) : 2496,	
-	('renesas,emev2-smu',) : 64,	
-	('qcom,lcc-msm8960', 'qcom,lcc-apq8064') : 451,	
-	('qcom,gcc-msm8998',) : 2271,	
-	('oxsemi,ox810se-stdclk', 'oxsemi,ox820-stdclk') : 178,	
-	('ingenic,jz4770-phy', 'ingenic,jz4780-phy', 'ingenic,x1000-phy', 'ingenic,x1830-phy') : 0,	
-	('qcom,gcc-sm8150',) : 2858,	
-	('renesas,rcar-gen3-usb2-clock-sel',) : 134,	
-	('ti,am335x-usb-ctrl-module',) : 132,	
-	('fixed-clock', 'fixed-factor-clock', 'stericsson,u300-syscon-clk', 'stericsson,u300-syscon-mclk') : 825,	
-	('nxp,isp1301',) : 98,	
-	('qcom,mmcc-apq8084',) : 2343,	
-	('ti,am335x-usb-phy',) : 80,	
-	('qcom,gcc-msm8660',) : 2103,	
-	('qcom,gcc-sm8250',) : 2722,	
-	('gpio-usb-b-connector',) : 210,	
-	('rockchip,rk3399-dwc3', 'xlnx,zynqmp-dwc3', 'cavium,octeon-7130-usb-uctl', 'sprd,sc9860-dwc3', 'allwinner,sun50i-h6-dwc3', 'hisilicon,hi3670-dwc3', 'intel,keembay-dwc3') : 118,	
-	('ti,keystone-usbphy',) : 69,	
-	('qcom,gcc-sdm845',) : 2596,	
-	('usb-nop-xceiv',) : 235,	
-	('ti,twl6030-usb',) : 294,	
-	('samsung,exynos5250-dwusb3', 'samsung,exynos5433-dwusb3', 'samsung,exynos7-dwusb3') : 165,	
-	('qcom,gcc-msm8996',) : 2741,	
-	('qcom,gcc-msm8960', 'qcom,gcc-apq8064') : 2868,	
-	('st,stih407-dwc3',) : 207,	
-	('fsl,imx6sx-usbphy', 'fsl,imx6sl-usbphy', 'fsl,imx6q-usbphy', 'fsl,imx23-usbphy', 'fsl,vf610-usbphy', 'fsl,imx6ul-usbphy', 'fsl,imx7ulp-usbphy') : 546,	
-	('renesas,r7s9210-cpg-mssr', 'renesas,r8a7742-cpg-mssr', 'renesas,r8a7743-cpg-mssr', 'renesas,r8a7744-cpg-mssr', 'renesas,r8a7745-cpg-mssr', 'renesas,r8a77470-cpg-mssr', 'renesas,r8a774a1-cpg-mssr', 'renesas,r8a774b1-cpg-mssr', 'renesas,r8a774c0-cpg-mssr', 'renesas,r8a774e1-cpg-mssr', 'renesas,r8a7790-cpg-mssr', 'renesas,r8a7791-cpg-mssr', 'renesas,r8a7793-cpg-mssr', 'renesas,r8a7792-cpg-mssr', 'renesas,r8a7794-cpg-mssr', 'renesas,r8a7795-cpg-mssr', 'renesas,r8a7796-cpg-mssr', 'renesas,r8a77961-cpg-mssr', 'renesas,r8a77965-cpg-mssr', 'renesas,r8a77970-cpg-mssr', 'renesas,r8a77980-cpg-mssr', 'renesas,r8a77990-cpg-mssr', 'renesas,r8a77995-cpg-mssr', 'renesas,r8a779a0-cpg-mssr') : 723,	
-	('renesas,r9a06g032-sysctrl',) : 685,	
-	('ti,keystone-dwc3', 'ti,am654-dwc3') : 144,	
-	('nvidia,tegra30-usb-phy', 'nvidia,tegra20-usb-phy') : 831,	
-	('qcom,gcc-msm8939',) : 2939,	
-	('qcom,sc7180-camcc',) : 1265,	
-	('nvidia,tegra20-udc', 'nvidia,tegra30-udc', 'nvidia,tegra114-udc', 'nvidia,tegra124-udc') : 81,	
-	('chipidea,usb2', 'xlnx,zynq-usb-2.20a', 'lsi,zevio-usb') : 83,	
-	('qcom,dwc3', 'qcom,msm8996-dwc3', 'qcom,msm8998-dwc3', 'qcom,sdm845-dwc3') : 583,	
-	('qcom,ci-hdrc',) : 216,	
-	('qcom,gcc-msm8916',) : 2370,	
-	('qcom,mmcc-msm8974',) : 1810,	
-	('aspeed,ast2400-usb-vhub', 'aspeed,ast2500-usb-vhub', 'aspeed,ast2600-usb-vhub') : 269,	
-	('qcom,mmcc-msm8960', 'qcom,mmcc-apq8064') : 2355,	
-	('amlogic,meson-gxl-usb-ctrl', 'amlogic,meson-gxm-usb-ctrl', 'amlogic,meson-axg-usb-ctrl', 'amlogic,meson-g12a-usb-ctrl', 'amlogic,meson-a1-usb-ctrl') : 632,	
-	('fsl,imx23-usb', 'fsl,imx28-usb', 'fsl,imx27-usb', 'fsl,imx6q-usb', 'fsl,imx6sl-usb', 'fsl,imx6sx-usb', 'fsl,imx6ul-usb', 'fsl,imx7d-usb', 'fsl,imx7ulp-usb') : 456,	
-	('brcm,ns2-udc', 'brcm,cygnus-udc', 'brcm,iproc-udc') : 210,	
-	('brcm,bdc-udc-v2', 'brcm,bdc') : 423,	
-	('ti,j721e-usb',) : 155,	
-	('nuvoton,npcm750-ehci',) : 122,	
-	('cdns,usb3', 'fsl,imx8qm-usb3') : 267,	
-	('ti,ehci-omap',) : 159,	
-	('marvell,pxau2o-ehci',) : 201,	
-	('qcom,gcc-ipq8064',) : 2383,	
-	('st,st-ohci-300x',) : 220,	
-	('st,spear600-ohci',) : 124,	
-	('cdns,usb3',) : 448,	
-	('generic-uhci', 'platform-uhci') : 108,	
-	('via,vt8500-ehci', 'wm,prizm-ehci', 'generic-ehci', 'cavium,octeon-6335-ehci') : 326,	
-	('fsl,mpc8323-qe-usb',) : 512,	
-	('nxp,ohci-nxp',) : 186,	
-	('st,st-ehci-300x',) : 236,	
-	('maxim,max3420-udc', 'maxim,max3421-udc') : 892,	
-	('qcom,gcc-ipq8074',) : 3279,	
-	('fsl,imx25-usbmisc', 'fsl,imx35-usbmisc', 'fsl,imx27-usbmisc', 'fsl,imx51-usbmisc', 'fsl,imx53-usbmisc', 'fsl,imx6q-usbmisc', 'fsl,vf610-usbmisc', 'fsl,imx6sx-usbmisc', 'fsl,imx6ul-usbmisc', 'fsl,imx7d-usbmisc', 'fsl,imx7ulp-usbmisc') : 758,	
-	('xlnx,xps-usb-host-1.00.a',) : 103,	
-	('hisilicon,hi3798cv200-xhci',) : 256,	
-	('atmel,at91sam9g45-ehci',) : 150,	
-	('atmel,at91rm9200-ohci',) : 388,	
-	('samsung,exynos4210-ohci',) : 209,	
-	('samsung,exynos4210-ehci',) : 236,	
-	('ohci-bigendian', 'ohci-be', 'ohci-littledian', 'ohci-le') : 129,	
-	('samsung,s3c2410-ohci',) : 246,	
-	('marvell,pxa-ohci',) : 389,	
-	('brcm,ehci-brcm-v2', 'brcm,bcm7445-ehci') : 166,	
-	('marvell,orion-ehci', 'marvell,armada-3700-ehci') : 206,	
-	('st,spear600-ehci',) : 112,	
-	('snps,dwc3', 'synopsys,dwc3') : 1206,	
-	('nvidia,tegra30-ehci', 'nvidia,tegra20-ehci') : 363,	
-	('usb-ehci',) : 137,	
-	('generic-xhci', 'xhci-platform', 'marvell,armada-375-xhci', 'marvell,armada-380-xhci', 'marvell,armada3700-xhci', 'renesas,xhci-r8a7790', 'renesas,xhci-r8a7791', 'renesas,xhci-r8a7793', 'renesas,xhci-r8a7795', 'renesas,xhci-r8a7796', 'renesas,rcar-gen2-xhci', 'renesas,rcar-gen3-xhci', 'brcm,xhci-brcm-v2', 'brcm,bcm7445-xhci') : 317,	
-	('xlnx,usb2-device-4.00.a',) : 1210,	
-	('fsl-usb2-mph', 'fsl-usb2-dr', 'fsl,mpc5121-usb2-dr') : 248,	
-	('atmel,at91rm9200-udc', 'atmel,at91sam9260-udc', 'atmel,at91sam9261-udc', 'atmel,at91sam9263-udc') : 1267,	
-	('generic-ohci', 'cavium,octeon-6335-ohci', 'ti,ohci-omap3') : 234,	
-	('marvell,pxa270-udc',) : 1248,	
-	('ti,da830-ohci',) : 354,	
-	('mediatek,mt8173-xhci', 'mediatek,mtk-xhci') : 435,	
-	('nvidia,tegra124-xusb', 'nvidia,tegra210-xusb', 'nvidia,tegra186-xusb', 'nvidia,tegra194-xusb') : 1410,	
-	('qcom,gcc-ipq6018',) : 3538,	
-	('maxim,max3421',) : 1257,	
-	('mediatek,mt6360-tcpc',) : 127,	
-	('mediatek,mt8173-mtu3', 'mediatek,mtu3') : 342,	
-	('qcom,pm8150b-usb-typec',) : 188,	
-	('richtek,rt1711h',) : 193,	
-	('renesas,r8a7795-usb3-peri', 'renesas,rcar-gen3-usb3-peri') : 1898,	
-	('atmel,at91sam9rl-udc', 'atmel,at91sam9g45-udc', 'atmel,sama5d3-udc', 'microchip,sam9x60-udc', 'atmel,at91sam9g45-pmc', 'atmel,at91sam9rl-pmc', 'atmel,at91sam9x5-pmc') : 1600,	
-	('maxim,max33359',) : 308,	
-	('renesas,usbhs-r8a774c0', 'renesas,usbhs-r8a7790', 'renesas,usbhs-r8a7791', 'renesas,usbhs-r8a7794', 'renesas,usbhs-r8a7795', 'renesas,usbhs-r8a7796', 'renesas,usbhs-r8a77990', 'renesas,usbhs-r8a77995', 'renesas,rcar-gen2-usbhs', 'renesas,rcar-gen3-usbhs', 'renesas,rza1-usbhs', 'renesas,rza2-usbhs') : 422,	
-	('nxp,lpc3220-udc',) : 1881,	
-	('ti,tps6598x',) : 492,	
-	('ti,hd3ss3220',) : 191,	
-	('smsc,usb4604',) : 97,	
-	('nxp,usb-isp1760', 'nxp,usb-isp1761') : 194,	
-	('smsc,usb3503', 'smsc,usb3503a') : 280,	
-	('brcm,bcm2835-usb', 'hisilicon,hi6220-usb', 'rockchip,rk3066-usb', 'lantiq,arx100-usb', 'lantiq,xrx200-usb', 'snps,dwc2', 'samsung,s3c6400-hsotg', 'amlogic,meson8-usb', 'amlogic,meson8b-usb', 'amlogic,meson-gxbb-usb', 'amlogic,meson-g12a-usb', 'amcc,dwc-otg', 'apm,apm82181-dwc-otg', 'st,stm32f4x9-fsotg', 'st,stm32f4x9-hsotg', 'st,stm32f7-hsotg', 'st,stm32mp15-fsotg', 'st,stm32mp15-hsotg') : 583,	
-	('brcm,usb-pinmap',) : 247,	
-	('marvell,nfc-spi',) : 127,	
-	('nxp,ptn5110',) : 541,	
-	('stericsson,db8500-musb',) : 241,	
-	('marvell,nfc-i2c',) : 173,	
-	('ingenic,jz4740-musb', 'ingenic,jz4770-musb') : 192,	
-	('st,stusb1600',) : 579,	
-	('ti,omap4-musb', 'ti,omap3-musb') : 328,	
-	('mediatek,mtk-musb',) : 412,	
-	('microchip,usb2422', 'microchip,usb2512b', 'microchip,usb2512bi', 'microchip,usb2513b', 'microchip,usb2513bi', 'microchip,usb2514b', 'microchip,usb2514bi', 'microchip,usb2517', 'microchip,usb2517i') : 540,	
-	('st,st21nfcb-i2c', 'st,st21nfcb_i2c', 'st,st21nfcc-i2c') : 177,	
-	('ti,da830-musb',) : 385,	
-	('samsung,s3fwrn82',) : 128,	
-	('allwinner,sun4i-a10-musb', 'allwinner,sun6i-a31-musb', 'allwinner,sun8i-a33-musb', 'allwinner,sun8i-h3-musb') : 569,	
-	('samsung,s3fwrn5-i2c',) : 160,	
-	('fcs,fusb302',) : 1302,	
-	('nvidia,tegra210-xudc', 'nvidia,tegra186-xudc', 'nvidia,tegra194-xudc') : 2703,	
-	('st,st21nfca-i2c', 'st,st21nfca_i2c') : 326,	
-	('nxp,pn532',) : 208,	
-	('nxp,pn532', 'nxp,pn533-i2c', 'nxp,pn532-i2c') : 173,	
-	('ti,musb-am33xx', 'ti,musb-dm816') : 674,	
-	('st,st21nfcb-spi',) : 187,	
-	('nxp,pn544-i2c',) : 627,	
-	('nxp,nxp-nci-i2c',) : 226,	
-	('st,st95hf',) : 794,	
-	('adi,adxl372',) : 35,	
-	('adi,ad2s90',) : 82,	
-	('bosch,bma400',) : 66,	
-	('adi,ad2s1200', 'adi,ad2s1205') : 131,	
-	('fsl,mma7660',) : 166,	
-	('bosch,bmc150_accel', 'bosch,bmi055_accel', 'bosch,bma255', 'bosch,bma250e', 'bosch,bma222', 'bosch,bma222e', 'bosch,bma280') : 85,	
-	('maxim,max30100',) : 329,	
-	('maxim,max30102', 'maxim,max30105') : 429,	
-	('kionix,kxsd9',) : 43,	
-	('ti,afe4404',) : 441,	
-	('fsl,mpc8323-qe-usb', 'fsl,mpc8360-qe-usb', 'fsl,mpc8272-cpm-usb') : 1777,	
-	('st,lis3lv02d', 'st,lis3lv02dl-accel', 'st,lsm303dlh-accel', 'st,lsm303dlhc-accel', 'st,lis3dh-accel', 'st,lsm330d-accel', 'st,lsm330dl-accel', 'st,lsm330dlc-accel', 'st,lis331dl-accel', 'st,lis331dlh-accel', 'st,lsm303dl-accel', 'st,lsm303dlm-accel', 'st,lsm330-accel', 'st,lsm303agr-accel', 'st,lis2dh12-accel', 'st,h3lis331dl-accel', 'st,lis3l02dq', 'st,lng2dm-accel', 'st,lis2dw12', 'st,lis3de', 'st,lis2de12', 'st,lis2hh12') : 122,	
-	('adi,adxl345', 'adi,adxl375') : 43,	
-	('domintech,dmard05', 'domintech,dmard06', 'domintech,dmard07') : 162,	
-	('st,lis302dl-spi', 'st,lis3lv02dl-accel', 'st,lis3dh-accel', 'st,lsm330d-accel', 'st,lsm330dl-accel', 'st,lsm330dlc-accel', 'st,lis331dlh-accel', 'st,lsm330-accel', 'st,lsm303agr-accel', 'st,lis2dh12-accel', 'st,lis3l02dq', 'st,lng2dm-accel', 'st,h3lis331dl-accel', 'st,lis331dl-accel', 'st,lis2dw12', 'st,lis3dhh', 'st,lis3de') : 99,	
-	('fsl,mma7455', 'fsl,mma7456') : 35,	
-	('ti,afe4403',) : 425,	
-	('aspeed,ast2400-adc', 'aspeed,ast2500-adc') : 231,	
-	('mps,mp2629_adc',) : 143,	
-	('st,spear600-adc',) : 248,	
-	('maxim,max11100',) : 97,	
-	('ti,trf7970a',) : 1527,	
-	('kionix,kxcjk1013', 'kionix,kxcj91008', 'kionix,kxtj21009', 'kionix,kxtf9') : 1121,	
-	('st,stm32h7-dfsdm', 'st,stm32mp1-dfsdm') : 281,	
-	('brcm,iproc-static-adc',) : 429,	
-	('ingenic,jz4725b-adc', 'ingenic,jz4740-adc', 'ingenic,jz4770-adc') : 590,	
-	('maxim,max1027', 'maxim,max1029', 'maxim,max1031', 'maxim,max1227', 'maxim,max1229', 'maxim,max1231') : 361,	
-	('mediatek,mt6360-adc',) : 252,	
-	('ti,adc141s626', 'ti,adc161s626') : 179,	
-	('adi,axi-adc-10.0.a',) : 302,	
-	('samsung,s3c2410-adc', 'samsung,s3c2416-adc', 'samsung,s3c2440-adc', 'samsung,s3c2443-adc', 'samsung,s3c6410-adc', 'samsung,s5pv210-adc', 'samsung,exynos4212-adc', 'samsung,exynos-adc-v1', 'samsung,exynos-adc-v2', 'samsung,exynos3250-adc', 'samsung,exynos7-adc') : 663,	
-	('bosch,bma023', 'bosch,bma150', 'bosch,bma180', 'bosch,bma250', 'bosch,bma254', 'bosch,smb380') : 871,	
-	('adi,ad7605-4', 'adi,ad7606-4', 'adi,ad7606-6', 'adi,ad7606-8') : 64,	
-	('maxim,max1117', 'maxim,max1118', 'maxim,max1119') : 191,	
-	('axentia,tse850-envelope-detector',) : 233,	
-	('adi,ad7605-4', 'adi,ad7606-4', 'adi,ad7606-6', 'adi,ad7606-8', 'adi,ad7606b', 'adi,ad7616') : 210,	
-	('ti,adc128s052', 'ti,adc122s021', 'ti,adc122s051', 'ti,adc122s101', 'ti,adc124s021', 'ti,adc124s051', 'ti,adc124s101') : 151,	
-	('cosmic,10001-adc',) : 288,	
-	('lltc,ltc2497',) : 64,	
-	('nxp,lpc1850-adc',) : 147,	
-	('fsl,mma8451', 'fsl,mma8452', 'fsl,mma8453', 'fsl,mma8652', 'fsl,mma8653', 'fsl,fxls8471') : 1253,	
-	('ti,twl4030-madc',) : 582,	
-	('adi,ad7124-4', 'adi,ad7124-8') : 586,	
-	('adi,ad7190', 'adi,ad7192', 'adi,ad7193', 'adi,ad7195') : 751,	
-	('adi,ad7949', 'adi,ad7682', 'adi,ad7689') : 204,	
-	('maxim,max1241',) : 140,	
-	('faraday,fotg210',) : 3307,	
-	('ti,tlc3541', 'ti,tlc4541') : 174,	
-	('ti,ads1015', 'ti,ads1115') : 779,	
-	('qcom,spmi-adc5', 'qcom,spmi-adc7', 'qcom,spmi-adc-rev2') : 668,	
-	('avia,hx711',) : 345,	
-	('rockchip,saradc', 'rockchip,rk3066-tsadc', 'rockchip,rk3399-saradc') : 314,	
-	('atmel,sama5d2-adc',) : 1202,	
-	('sd-modulator', 'ads1201') : 39,	
-	('maxim,max9611', 'maxim,max9612') : 318,	
-	('ti,adc108s102',) : 193,	
-	('nxp,lpc3220-adc',) : 145,	
-	('fsl,imx25-gcq',) : 283,	
-	('x-powers,axp209-adc', 'x-powers,axp221-adc', 'x-powers,axp813-adc') : 503,	
-	('ti,am3359-adc',) : 452,	
-	('mcp3422',) : 294,	
-	('adi,ad7091r5',) : 72,	
-	('st,stm32f4-adc-core', 'st,stm32h7-adc-core', 'st,stm32mp1-adc-core') : 496,	
-	('qcom,spmi-iadc',) : 377,	
-	('ti,ads124s06', 'ti,ads124s08') : 261,	
-	('xlnx,zynq-xadc-1.00.a', 'xlnx,axi-xadc-1.00.a') : 932,	
-	('motorola,cpcap-adc', 'motorola,mapphone-cpcap-adc') : 716,	
-	('ti,adc12130', 'ti,adc12132', 'ti,adc12138') : 374,	
-	('mcp3001', 'mcp3002', 'mcp3004', 'mcp3008', 'mcp3201', 'mcp3202', 'mcp3204', 'mcp3208', 'mcp3301', 'microchip,mcp3001', 'microchip,mcp3002', 'microchip,mcp3004', 'microchip,mcp3008', 'microchip,mcp3201', 'microchip,mcp3202', 'microchip,mcp3204', 'microchip,mcp3208', 'microchip,mcp3301', 'microchip,mcp3550-50', 'microchip,mcp3550-60', 'microchip,mcp3551', 'microchip,mcp3553') : 357,	
-	('adi,ad7768-1',) : 454,	
-	('ti,ads8684', 'ti,ads8688') : 349,	
-	('microchip,mcp3911',) : 243,	
-	('ti,adc084s021',) : 169,	
-	('ti,ads7950', 'ti,ads7951', 'ti,ads7952', 'ti,ads7953', 'ti,ads7954', 'ti,ads7955', 'ti,ads7956', 'ti,ads7957', 'ti,ads7958', 'ti,ads7959', 'ti,ads7960', 'ti,ads7961') : 471,	
-	('marvell,berlin2-adc',) : 259,	
-	('fsl,imx7d-adc',) : 362,	
-	('adi,ad9265', 'adi,ad9434', 'adi,ad9467') : 313,	
-	('st,stmpe-adc',) : 230,	
-	('adi,ad7904', 'adi,ad7914', 'adi,ad7923', 'adi,ad7924', 'adi,ad7908', 'adi,ad7918', 'adi,ad7928') : 279,	
-	('lltc,ltc2496',) : 60,	
-	('allwinner,sun8i-a33-ths',) : 419,	
-	('qcom,pm8018-adc', 'qcom,pm8038-adc', 'qcom,pm8058-adc', 'qcom,pm8921-adc') : 642,	
-	('ti,ads8344',) : 138,	
-	('ti,adc081c', 'ti,adc101c', 'ti,adc121c') : 159,	
-	('mediatek,mt2701-auxadc', 'mediatek,mt2712-auxadc', 'mediatek,mt7622-auxadc', 'mediatek,mt8173-auxadc', 'mediatek,mt6765-auxadc') : 229,	
-	('sprd,sc2731-adc',) : 377,	
-	('nuvoton,nau7802',) : 384,	
-	('adi,ad7292',) : 205,	
-	('holt,hi8435',) : 364,	
-	('ti,adc0831', 'ti,adc0832', 'ti,adc0834', 'ti,adc0838') : 247,	
-	('st,l3g4200d-gyro', 'st,lsm330d-gyro', 'st,lsm330dl-gyro', 'st,lsm330dlc-gyro', 'st,l3gd20-gyro', 'st,l3gd20h-gyro', 'st,l3g4is-gyro', 'st,lsm330-gyro', 'st,lsm9ds0-gyro') : 77,	
-	('nxp,fxas21002c',) : 40,	
-	('fsl,vf610-adc',) : 663,	
-	('adi,ad7291',) : 401,	
-	('ti,palmas-gpadc',) : 576,	
-	('nuvoton,npcm750-adc',) : 220,	
-	('amlogic,meson8-saradc', 'amlogic,meson8b-saradc', 'amlogic,meson8m2-saradc', 'amlogic,meson-gxbb-saradc', 'amlogic,meson-gxl-saradc', 'amlogic,meson-gxm-saradc', 'amlogic,meson-axg-saradc', 'amlogic,meson-g12a-saradc') : 913,	
-	('bosch,bmg160', 'bosch,bmi055_gyro') : 52,	
-	('invensense,mpu3050', 'invn,mpu3050') : 76,	
-	('qcom,spmi-vadc',) : 643,	
-	('ti,twl6030-gpadc', 'ti,twl6032-gpadc') : 640,	
-	('invensense,itg3200',) : 267,	
-	('adi,adxrs290',) : 479,	
-	('st,stm32-dfsdm-adc', 'st,stm32-dfsdm-dmic') : 1025,	
-	('capella,cm3218', 'capella,cm32181') : 307,	
-	('ti,lmp91000', 'ti,lmp91002') : 281,	
-	('capella,cm3605',) : 213,	
-	('dynaimage,al3320a',) : 161,	
-	('atmel,at91sam9260-adc', 'atmel,at91sam9rl-adc', 'atmel,at91sam9g45-adc', 'atmel,at91sam9x5-adc', 'atmel,sama5d3-adc') : 939,	
-	('ams,as73211',) : 509,	
-	('st,vl6180',) : 344,	
-	('rohm,bh1710', 'rohm,bh1715', 'rohm,bh1721', 'rohm,bh1750', 'rohm,bh1751') : 210,	
-	('sharp,gp2ap002a00f', 'sharp,gp2ap002s00f') : 410,	
-	('rohm,bh1780gli',) : 191,	
-	('vishay,veml6030',) : 600,	
-	('adi,adux1020',) : 610,	
-	('isil,isl29018', 'isil,isl29023', 'isil,isl29035') : 569,	
-	('st,uvis25',) : 39,	
-	('dynaimage,al3010',) : 141,	
-	('isl,isl29028', 'isil,isl29028', 'isil,isl29030') : 461,	
-	('amstaos,tsl2580', 'amstaos,tsl2581', 'amstaos,tsl2583') : 571,	
-	('maxim,max44009',) : 336,	
-	('amstaos,tsl2560', 'amstaos,tsl2561', 'amstaos,tsl2562', 'amstaos,tsl2563') : 597,	
-	('capella,cm3232',) : 255,	
-	('capella,cm36651',) : 521,	
-	('upisemi,usd5182',) : 647,	
-	('onnn,noa1305',) : 220,	
-	('maxim,max5432', 'maxim,max5433', 'maxim,max5434', 'maxim,max5435') : 81,	
-	('maxim,max5481', 'maxim,max5482', 'maxim,max5483', 'maxim,max5484') : 120,	
-	('maxim,ds1803-010', 'maxim,ds1803-050', 'maxim,ds1803-100') : 106,	
-	('st,stm32f4-adc', 'st,stm32h7-adc', 'st,stm32mp1-adc') : 1240,	
-	('ti,opt3001',) : 549,	
-	('st,lsm303dlh-magn', 'st,lsm303dlhc-magn', 'st,lsm303dlm-magn', 'st,lis3mdl-magn', 'st,lsm303agr-magn', 'st,lis2mdl', 'st,lsm9ds1-magn') : 72,	
-	('adi,ad5272-020', 'adi,ad5272-050', 'adi,ad5272-100', 'adi,ad5274-020', 'adi,ad5274-100') : 150,	
-	('io-channel-mux',) : 313,	
-	('st,lis3mdl-magn', 'st,lsm303agr-magn', 'st,lis2mdl', 'st,lsm9ds1-magn') : 62,	
-	('sensortek,stk3310', 'sensortek,stk3311', 'sensortek,stk3335') : 505,	
-	('vishay,vcnl4035',) : 469,	
-	('bosch,bmc150_magn', 'bosch,bmc156_magn', 'bosch,bmm150_magn', 'bosch,bmm150') : 49,	
-	('microchip,mcp41010', 'microchip,mcp41050', 'microchip,mcp41100', 'microchip,mcp42010', 'microchip,mcp42050', 'microchip,mcp42100') : 132,	
-	('pni,rm3100',) : 36,	
-	('vishay,vcnl4000', 'vishay,vcnl4010', 'vishay,vcnl4020', 'vishay,vcnl4040', 'vishay,vcnl4200') : 796,	
-	('honeywell,hmc5843', 'honeywell,hmc5883', 'honeywell,hmc5883l', 'honeywell,hmc5983') : 63,	
-	('sharp,gp2ap020a00f',) : 1197,	
-	('avago,apds9960',) : 784,	
-	('microchip,mcp4131-502', 'microchip,mcp4131-103', 'microchip,mcp4131-503', 'microchip,mcp4131-104', 'microchip,mcp4132-502', 'microchip,mcp4132-103', 'microchip,mcp4132-503', 'microchip,mcp4132-104', 'microchip,mcp4141-502', 'microchip,mcp4141-103', 'microchip,mcp4141-503', 'microchip,mcp4141-104', 'microchip,mcp4142-502', 'microchip,mcp4142-103', 'microchip,mcp4142-503', 'microchip,mcp4142-104', 'microchip,mcp4151-502', 'microchip,mcp4151-103', 'microchip,mcp4151-503', 'microchip,mcp4151-104', 'microchip,mcp4152-502', 'microchip,mcp4152-103', 'microchip,mcp4152-503', 'microchip,mcp4152-104', 'microchip,mcp4161-502', 'microchip,mcp4161-103', 'microchip,mcp4161-503', 'microchip,mcp4161-104', 'microchip,mcp4162-502', 'microchip,mcp4162-103', 'microchip,mcp4162-503', 'microchip,mcp4162-104', 'microchip,mcp4231-502', 'microchip,mcp4231-103', 'microchip,mcp4231-503', 'microchip,mcp4231-104', 'microchip,mcp4232-502', 'microchip,mcp4232-103', 'microchip,mcp4232-503', 'microchip,mcp4232-104', 'microchip,mcp4241-502', 'microchip,mcp4241-103', 'microchip,mcp4241-503', 'microchip,mcp4241-104', 'microchip,mcp4242-502', 'microchip,mcp4242-103', 'microchip,mcp4242-503', 'microchip,mcp4242-104', 'microchip,mcp4251-502', 'microchip,mcp4251-103', 'microchip,mcp4251-503', 'microchip,mcp4251-104', 'microchip,mcp4252-502', 'microchip,mcp4252-103', 'microchip,mcp4252-503', 'microchip,mcp4252-104', 'microchip,mcp4261-502', 'microchip,mcp4261-103', 'microchip,mcp4261-503', 'microchip,mcp4261-104', 'microchip,mcp4262-502', 'microchip,mcp4262-103', 'microchip,mcp4262-503', 'microchip,mcp4262-104') : 390,	
-	('murata,zpa2326',) : 49,	
-	('meas,ms5611', 'meas,ms5607') : 85,	
-	('bosch,bmp085', 'bosch,bmp180', 'bosch,bmp181', 'bosch,bmp280', 'bosch,bme280') : 78,	
-	('st,lps001wp-press', 'st,lps25h-press', 'st,lps331ap-press', 'st,lps22hb-press', 'st,lps33hw', 'st,lps35hw', 'st,lps22hh') : 77,	
-	('fsl,mag3110',) : 445,	
-	('memsic,mmc35240',) : 374,	
-	('asc,dlhl60d', 'asc,dlhl60g') : 247,	
-	('fsl,mpl3115',) : 236,	
-	('bosch,bme280', 'bosch,bmp280', 'bosch,bmp180', 'bosch,bmp085') : 50,	
-	('asahi-kasei,ak8975', 'ak8975', 'asahi-kasei,ak8963', 'ak8963', 'asahi-kasei,ak09911', 'ak09911', 'asahi-kasei,ak09912', 'ak09912') : 691,	
-	('st,stm32-lptimer-trigger',) : 61,	
-	('meas,ms5637', 'meas,ms5805', 'meas,ms5837', 'meas,ms8607-temppressure') : 130,	
-	('hoperf,hp03',) : 200,	
-	('bosch,bmi160',) : 37,	
-	('asahi-kasei,ak8974', 'alps,hscdtd008a') : 707,	
-	('nxp,fxos8700',) : 38,	
-	('amstaos,tsl2571', 'amstaos,tsl2671', 'amstaos,tmd2671', 'amstaos,tsl2771', 'amstaos,tmd2771', 'amstaos,tsl2572', 'amstaos,tsl2672', 'amstaos,tmd2672', 'amstaos,tsl2772', 'amstaos,tmd2772', 'avago,apds9930') : 1352,	
-	('invensense,icp10100',) : 463,	
-	('invensense,mpu6000', 'invensense,mpu6500', 'invensense,mpu6515', 'invensense,mpu9250', 'invensense,mpu9255', 'invensense,icm20608', 'invensense,icm20609', 'invensense,icm20689', 'invensense,icm20602', 'invensense,icm20690', 'invensense,iam20680') : 95,	
-	('st,lsm6ds3', 'st,lsm6ds3h', 'st,lsm6dsl', 'st,lsm6dsm', 'st,ism330dlc', 'st,lsm6dso', 'st,asm330lhh', 'st,lsm6dsox', 'st,lsm6dsr', 'st,lsm6ds3tr-c', 'st,ism330dhcx', 'st,lsm9ds1-imu', 'st,lsm6ds0', 'st,lsm6dsrx', 'st,lsm6dst', 'st,lsm6dsop') : 83,	
-	('invensense,mpu6050', 'invensense,mpu6500', 'invensense,mpu6515', 'invensense,mpu9150', 'invensense,mpu9250', 'invensense,mpu9255', 'invensense,icm20608', 'invensense,icm20609', 'invensense,icm20689', 'invensense,icm20602', 'invensense,icm20690', 'invensense,iam20680') : 166,	
-	('invensense,icm42600', 'invensense,icm42602', 'invensense,icm42605', 'invensense,icm42622') : 66,	
-	('adi,adis16460',) : 325,	
-	('adi,ad5593r',) : 78,	
-	('st,stm32-timer-trigger', 'st,stm32h7-timer-trigger') : 557,	
-	('current-sense-amplifier', 'current-sense-shunt', 'voltage-divider') : 243,	
-	('lltc,ltc1660', 'lltc,ltc1665') : 174,	
-	('fsl,vf610-dac',) : 182,	
-	('ti,dac5571', 'ti,dac6571', 'ti,dac7571', 'ti,dac5574', 'ti,dac6574', 'ti,dac7574', 'ti,dac5573', 'ti,dac6573', 'ti,dac7573') : 284,	
-	('adi,ad7303',) : 191,	
-	('adi,ad5592r',) : 93,	
-	('dpot-dac',) : 158,	
-	('ti,dac5311', 'ti,dac6311', 'ti,dac7311') : 209,	
-	('adi,adis16470', 'adi,adis16475-1', 'adi,adis16475-2', 'adi,adis16475-3', 'adi,adis16477-1', 'adi,adis16477-2', 'adi,adis16477-3', 'adi,adis16465-1', 'adi,adis16465-2', 'adi,adis16465-3', 'adi,adis16467-1', 'adi,adis16467-2', 'adi,adis16467-3', 'adi,adis16500', 'adi,adis16505-1', 'adi,adis16505-2', 'adi,adis16505-3', 'adi,adis16507-1', 'adi,adis16507-2', 'adi,adis16507-3') : 997,	
-	('maxim,max5821',) : 258,	
-	('nxp,lpc1850-dac',) : 131,	
-	('adi,ad5311r', 'adi,ad5338r', 'adi,ad5671r', 'adi,ad5675r', 'adi,ad5691r', 'adi,ad5692r', 'adi,ad5693', 'adi,ad5693r', 'adi,ad5694', 'adi,ad5694r', 'adi,ad5695r', 'adi,ad5696', 'adi,ad5696r') : 79,	
-	('lltc,ltc2632-l12', 'lltc,ltc2632-l10', 'lltc,ltc2632-l8', 'lltc,ltc2632-h12', 'lltc,ltc2632-h10', 'lltc,ltc2632-h8', 'lltc,ltc2634-l12', 'lltc,ltc2634-l10', 'lltc,ltc2634-l8', 'lltc,ltc2634-h12', 'lltc,ltc2634-h10', 'lltc,ltc2634-h8', 'lltc,ltc2636-l12', 'lltc,ltc2636-l10', 'lltc,ltc2636-l8', 'lltc,ltc2636-h12', 'lltc,ltc2636-h10', 'lltc,ltc2636-h8') : 332,	
-	('ti,dac082s085', 'ti,dac102s085', 'ti,dac122s085', 'ti,dac084s085', 'ti,dac104s085', 'ti,dac124s085') : 235,	
-	('st,stm32-dac',) : 258,	
-	('bosch,bme680',) : 103,	
-	('st,stm32f4-dac-core', 'st,stm32h7-dac-core') : 167,	
-	('microchip,mcp4725', 'microchip,mcp4726') : 352,	
-	('ti,dac7612', 'ti,dac7612u', 'ti,dac7612ub') : 112,	
-	('ti,dac7512',) : 418,	
-	('adi,ad5758',) : 568,	
-	('adi,adis16375', 'adi,adis16480', 'adi,adis16485', 'adi,adis16488', 'adi,adis16490', 'adi,adis16495-1', 'adi,adis16495-2', 'adi,adis16495-3', 'adi,adis16497-1', 'adi,adis16497-2', 'adi,adis16497-3') : 990,	
-	('ams,iaq-core',) : 121,	
-	('sensirion,scd30',) : 169,	
-	('maxim,ds4422', 'maxim,ds4424') : 217,	
-	('adi,ad5755', 'adi,ad5755-1', 'adi,ad5757', 'adi,ad5735', 'adi,ad5737') : 557,	
-	('adi,ad5770r',) : 469,	
-	('plantower,pms1003', 'plantower,pms3003', 'plantower,pms5003', 'plantower,pms6003', 'plantower,pms7003', 'plantower,pmsa003') : 234,	
-	('atlas,co2-ezo', 'atlas,o2-ezo', 'atlas,hum-ezo') : 161,	
-	('sensirion,sps30',) : 354,	
-	('sgx,vz89x', 'sgx,vz89te') : 273,	
-	('meas,tsys01',) : 150,	
-	('sensirion,sgp30', 'sensirion,sgpc3') : 388,	
-	('ams,ccs811',) : 388,	
-	('maxim,max6675', 'maxim,max31855', 'maxim,max31855k', 'maxim,max31855j', 'maxim,max31855n', 'maxim,max31855s', 'maxim,max31855t', 'maxim,max31855e', 'maxim,max31855r') : 218,	
-	('atlas,ph-sm', 'atlas,ec-sm', 'atlas,orp-sm', 'atlas,do-sm', 'atlas,rtd-sm') : 543,	
-	('maxbotix,mb1202', 'maxbotix,mb1212', 'maxbotix,mb1222', 'maxbotix,mb1232', 'maxbotix,mb1242', 'maxbotix,mb7040', 'maxbotix,mb7137') : 167,	
-	('melexis,mlx90614',) : 414,	
-	('devantech,srf04', 'maxbotix,mb1000', 'maxbotix,mb1010', 'maxbotix,mb1020', 'maxbotix,mb1030', 'maxbotix,mb1040') : 225,	
-	('vishay,vcnl3020',) : 153,	
-	('st,hts221',) : 44,	
-	('maxim,max31856',) : 319,	
-	('parallax,ping', 'parallax,laserping') : 187,	
-	('melexis,mlx90632',) : 694,	
-	('ti,tmp007',) : 401,	
-	('pulsedlight,lidar-lite-v2', 'grmn,lidar-lite-v3') : 234,	
-	('st,vl53l0x',) : 159,	
-	('silabs,si7020',) : 94,	
-	('devantech,srf02', 'devantech,srf08', 'devantech,srf10') : 329,	
-	('ams,as3935',) : 323,	
-	('meas,htu21', 'meas,ms8607-humidity') : 164,	
-	('ti,hdc2010', 'ti,hdc2080') : 231,	
-	('dht11',) : 213,	
-	('semtech,sx9500',) : 687,	
-	('ti,hdc1000', 'ti,hdc1008', 'ti,hdc1010', 'ti,hdc1050', 'ti,hdc1080') : 283,	
-	('adi,adf4371', 'adi,adf4372') : 430,	
-	('adi,hmc425a',) : 165,	
-	('adi,adf4350', 'adi,adf4351') : 450,	
-	('nokia,n900-modem', 'nokia,n950-modem', 'nokia,n9-modem') : 199,	
-	('adi,ltc2983',) : 1046,	
-	('renesas,isl29501',) : 701,	
-	('arm,coresight-static-funnel',) : 267,	
-	('ti,bq32000',) : 205,	
-	('arm,coresight-replicator', 'arm,coresight-static-replicator') : 270,	
-	('semtech,sx9310', 'semtech,sx9311') : 1104,	
-	('nxp,pcf85263', 'nxp,pcf85363') : 304,	
-	('cnxt,cx92755-rtc',) : 139,	
-	('amlogic,meson6-rtc', 'amlogic,meson8-rtc', 'amlogic,meson8b-rtc', 'amlogic,meson8m2-rtc') : 257,	
-	('emmicro,em3027',) : 99,	
-	('ti,omap3-ssi',) : 442,	
-	('nxp,lpc1788-rtc',) : 202,	
-	('maxim,ds1302',) : 141,	
-	('maxim,mcp795',) : 293,	
-	('nxp,pcf2123', 'microcrystal,rv2123', 'nxp,rtc-pcf2123') : 282,	
-	('mediatek,mt2712-rtc',) : 279,	
-	('microcrystal,rv8803', 'epson,rx8803', 'epson,rx8900') : 432,	
-	('apm,xgene-rtc',) : 170,	
-	('mrvl,sa1100-rtc', 'mrvl,mmp-rtc') : 202,	
-	('nxp,pcf8523', 'microcrystal,rv8523') : 259,	
-	('fsl,imx1-rtc', 'fsl,imx21-rtc') : 262,	
-	('fsl,sec-v4.0-mon-rtc-lp',) : 266,	
-	('sprd,sc2731-rtc',) : 423,	
-	('microcrystal,rv3032',) : 629,	
-	('dallas,ds1374',) : 363,	
-	('motorola,cpcap-rtc',) : 199,	
-	('cortina,gemini-rtc', 'faraday,ftrtc010') : 130,	
-	('nxp,pcf8563', 'epson,rtc8564', 'microcrystal,rv8564') : 392,	
-	('abracon,abeoz9',) : 314,	
-	('abracon,abx80x', 'abracon,ab0801', 'abracon,ab0803', 'abracon,ab0804', 'abracon,ab0805', 'abracon,ab1801', 'abracon,ab1803', 'abracon,ab1804', 'abracon,ab1805', 'microcrystal,rv1805') : 598,	
-	('ti,omap3-ssi-port',) : 990,	
-	('nvidia,tegra20-rtc',) : 238,	
-	('dlg,da9063-rtc', 'dlg,da9062-rtc') : 372,	
-	('sirf,prima2-sysrtc',) : 245,	
-	('isl,isl12022', 'isil,isl12022') : 169,	
-	('google,goldfish-rtc',) : 136,	
-	('amlogic,meson-vrtc',) : 91,	
-	('cdns,rtc-r109v3',) : 266,	
-	('epson,rtc7301sf', 'epson,rtc7301dg') : 281,	
-	('epson,rx6110',) : 299,	
-	('atmel,at91sam9260-rtt',) : 301,	
-	('qcom,pm8921-rtc', 'qcom,pm8018-rtc', 'qcom,pm8058-rtc', 'qcom,pm8941-rtc') : 342,	
-	('mediatek,mt7622-rtc', 'mediatek,soc-rtc') : 225,	
-	('isil,isl1208', 'isil,isl1209', 'isil,isl1218', 'isil,isl1219') : 588,	
-	('whwave,sd3078',) : 137,	
-	('maxim,ds1742',) : 149,	
-	('haoyu,hym8563',) : 375,	
-	('marvell,armada-380-rtc', 'marvell,armada-8k-rtc') : 334,	
-	('xlnx,zynqmp-rtc',) : 182,	
-	('renesas,sh-rtc',) : 426,	
-	('moxa,moxart-rtc',) : 225,	
-	('fsl,ls1012a-ftm-alarm', 'fsl,ls1021a-ftm-alarm', 'fsl,ls1028a-ftm-alarm', 'fsl,ls1043a-ftm-alarm', 'fsl,ls1046a-ftm-alarm', 'fsl,ls1088a-ftm-alarm', 'fsl,ls208xa-ftm-alarm', 'fsl,lx2160a-ftm-alarm') : 167,	
-	('domain-idle-state',) : 1735,	
-	('x-powers,ac100-rtc',) : 404,	
-	('allwinner,sun6i-a31-rtc', 'allwinner,sun8i-a23-rtc', 'allwinner,sun8i-h3-rtc', 'allwinner,sun8i-r40-rtc', 'allwinner,sun8i-v3-rtc', 'allwinner,sun50i-h5-rtc', 'allwinner,sun50i-h6-rtc') : 453,	
-	('dallas,ds1672',) : 90,	
-	('via,vt8500-rtc',) : 177,	
-	('st,m41t62', 'st,m41t65', 'st,m41t80', 'st,m41t81', 'st,m41t81s', 'st,m41t82', 'st,m41t83', 'st,m41t84', 'st,m41t85', 'st,m41t87', 'microcrystal,rv4162', 'st,rv4162', 'rv4162') : 623,	
-	('aspeed,ast2400-rtc', 'aspeed,ast2500-rtc', 'aspeed,ast2600-rtc') : 82,	
-	('fsl,imx53-rtc',) : 218,	
-	('dallas,ds3232',) : 473,	
-	('brcm,brcmstb-waketimer',) : 199,	
-	('epson,rx8010',) : 298,	
-	('ti,palmas-rtc',) : 241,	
-	('allwinner,sun4i-a10-rtc', 'allwinner,sun7i-a20-rtc') : 286,	
-	('samsung,s3c2410-rtc', 'samsung,s3c2416-rtc', 'samsung,s3c2443-rtc', 'samsung,s3c6410-rtc', 'samsung,exynos3250-rtc') : 378,	
-	('ingenic,jz4740-rtc', 'ingenic,jz4760-rtc', 'ingenic,jz4780-rtc') : 254,	
-	('st,spear600-rtc',) : 306,	
-	('fsl,imx8qxp-sc-rtc',) : 122,	
-	('nxp,lpc3220-rtc',) : 224,	
-	('epson,rx8571', 'epson,rx8581') : 212,	
-	('isil,isl12026',) : 339,	
-	('atmel,at91rm9200-rtc', 'atmel,at91sam9x5-rtc', 'atmel,sama5d4-rtc', 'atmel,sama5d2-rtc', 'microchip,sam9x60-rtc') : 392,	
-	('microcrystal,rv3029',) : 616,	
-	('alphascale,asm9260-rtc',) : 226,	
-	('ricoh,r2025sd', 'ricoh,r2221tl', 'ricoh,rs5c372a', 'ricoh,rs5c372b', 'ricoh,rv5c386', 'ricoh,rv5c387a') : 476,	
-	('mediatek,mt6323-rtc', 'mediatek,mt6358-rtc', 'mediatek,mt6397-rtc') : 248,	
-	('abracon,abb5zes3',) : 558,	
-	('stericsson,coh901331',) : 167,	
-	('nxp,pcf85063', 'nxp,pcf85063tp', 'nxp,pcf85063a', 'microcrystal,rv8263') : 409,	
-	('marvell,orion-rtc',) : 222,	
-	('fsl,imx25-rtc',) : 408,	
-	('microchip,pic32mzda-rtc',) : 254,	
-	('dallas,ds1390',) : 149,	
-	('dallas,ds1307', 'dallas,ds1308', 'dallas,ds1337', 'dallas,ds1338', 'dallas,ds1339', 'dallas,ds1388', 'dallas,ds1340', 'dallas,ds1341', 'maxim,ds3231', 'st,m41t0', 'st,m41t00', 'st,m41t11', 'microchip,mcp7940x', 'microchip,mcp7941x', 'pericom,pt7c4338', 'epson,rx8025', 'isil,isl12057', 'epson,rx8130') : 1343,	
-	('fsl,mpc5121-rtc', 'fsl,mpc5200-rtc') : 249,	
-	('nxp,pcf2127', 'nxp,pcf2129', 'nxp,pca2129') : 575,	
-	('fsl,stmp3xxx-rtc',) : 252,	
-	('realtek,rtd1295-rtc',) : 155,	
-	('marvell,pxa-rtc',) : 279,	
-	('xircom,x1205',) : 404,	
-	('ti,twl4030-rtc',) : 401,	
-	('qcom,wcn3620', 'qcom,wcn3660', 'qcom,wcn3680') : 110,	
-	('s35390a', 'sii,s35390a') : 322,	
-	('ti,am3352-wkup-m3', 'ti,am4372-wkup-m3') : 161,	
-	('microcrystal,rv3028',) : 630,	
-	('st,stm32-rtc', 'st,stm32h7-rtc', 'st,stm32mp1-rtc') : 583,	
-	('ti,da850-dsp',) : 225,	
-	('qcom,ipq8074-wcss-pil',) : 382,	
-	('st,st40-rproc', 'st,st231-rproc') : 311,	
-	('ingenic,jz4770-vpu-rproc',) : 147,	
-	('fsl,imx7d-cm4', 'fsl,imx6sx-cm4') : 263,	
-	('qcom,qcs404-cdsp-pil', 'qcom,sdm845-adsp-pil') : 364,	
-	('st,stm32mp1-m4',) : 579,	
-	('globaltop,pa6h',) : 96,	
-	('qcom,msm8974-adsp-pil', 'qcom,msm8996-adsp-pil', 'qcom,msm8996-slpi-pil', 'qcom,msm8998-adsp-pas', 'qcom,msm8998-slpi-pas', 'qcom,qcs404-adsp-pas', 'qcom,qcs404-cdsp-pas', 'qcom,qcs404-wcss-pas', 'qcom,sc7180-mpss-pas', 'qcom,sdm845-adsp-pas', 'qcom,sdm845-cdsp-pas', 'qcom,sm8150-adsp-pas', 'qcom,sm8150-cdsp-pas', 'qcom,sm8150-mpss-pas', 'qcom,sm8150-slpi-pas', 'qcom,sm8250-adsp-pas', 'qcom,sm8250-cdsp-pas', 'qcom,sm8250-slpi-pas') : 526,	
-	('u-blox,neo-6m', 'u-blox,neo-8', 'u-blox,neo-m8') : 98,	
-	('ti,am3356-pru', 'ti,am4376-pru', 'ti,am5728-pru', 'ti,k2g-pru', 'ti,am654-pru', 'ti,am654-rtu', 'ti,am654-tx-pru', 'ti,j721e-pru', 'ti,j721e-rtu', 'ti,j721e-tx-pru') : 499,	
-	('qcom,glink-rpm',) : 237,	
-	('ti,k2hk-dsp', 'ti,k2l-dsp', 'ti,k2e-dsp', 'ti,k2g-dsp') : 286,	
-	('ti,j721e-c66-dsp', 'ti,j721e-c71-dsp') : 472,	
-	('qcom,riva-pil', 'qcom,pronto-v1-pil', 'qcom,pronto-v2-pil') : 454,	
-	('brcm,bcm2835-dpi',) : 230,	
-	('brcm,bcm2835-txp',) : 335,	
-	('mediatek,mt8183-scp', 'mediatek,mt8192-scp') : 496,	
-	('brcm,bcm2835-v3d', 'brcm,cygnus-v3d', 'brcm,vc4-v3d') : 308,	
-	('fastrax,uc430', 'linx,r4', 'wi2wi,w2sg0004', 'wi2wi,w2sg0008i', 'wi2wi,w2sg0084i') : 379,	
-	('brcm,bcm2711-vc5', 'brcm,bcm2835-vc4', 'brcm,cygnus-vc4') : 263,	
-	('nxp,imx8mq-dcss',) : 83,	
-	('fsl,imx-display-subsystem',) : 187,	
-	('ti,am654-r5fss', 'ti,j721e-r5fss', 'ti,j7200-r5fss') : 864,	
-	('brcm,bcm2835-vec',) : 414,	
-	('fsl,imx6q-hdmi', 'fsl,imx6dl-hdmi') : 170,	
-	('fsl,imx-parallel-display',) : 257,	
-	('atmel,at91sam9n12-hlcdc', 'atmel,at91sam9x5-hlcdc', 'atmel,sama5d2-hlcdc', 'atmel,sama5d3-hlcdc', 'atmel,sama5d4-hlcdc', 'microchip,sam9x60-hlcdc', 'atmel,hlcdc-display-controller') : 674,	
-	('qcom,smd',) : 893,	
-	('brcm,bcm2711-hvs', 'brcm,bcm2835-hvs') : 441,	
-	('fsl,imx6q-ldb', 'fsl,imx6q-ldb', 'fsl,imx53-ldb') : 487,	
-	('ste,mcde',) : 298,	
-	('st,stih407-compositor',) : 185,	
-	('fsl,imx53-tve',) : 448,	
-	('st,sti-display-subsystem',) : 183,	
-	('brcm,bcm2835-pixelvalve0', 'brcm,bcm2835-pixelvalve1', 'brcm,bcm2835-pixelvalve2', 'brcm,bcm2711-pixelvalve0', 'brcm,bcm2711-pixelvalve1', 'brcm,bcm2711-pixelvalve2', 'brcm,bcm2711-pixelvalve3', 'brcm,bcm2711-pixelvalve4') : 678,	
-	('zte,zx296718-vou',) : 124,	
-	('qcom,q6v5-pil', 'qcom,msm8916-mss-pil', 'qcom,msm8974-mss-pil', 'qcom,msm8996-mss-pil', 'qcom,msm8998-mss-pil', 'qcom,sc7180-mss-pil', 'qcom,sdm845-mss-pil') : 1358,	
-	('st,vtg',) : 241,	
-	('brcm,bcm2835-dsi1',) : 1157,	
-	('ingenic,jz4725b-ipu', 'ingenic,jz4760-ipu') : 554,	
-	('st,stih416-hda', 'st,stih407-hda') : 518,	
-	('st,stih407-dvo',) : 374,	
-	('arm,mali-400', 'arm,mali-450') : 325,	
-	('st,stih407-tvout',) : 533,	
-	('zte,zx296718-tvenc',) : 270,	
-	('thine,thc63lvd1024',) : 162,	
-	('brcm,bcm2835-hdmi', 'brcm,bcm2711-hdmi0', 'brcm,bcm2711-hdmi1') : 1283,	
-	('hisilicon,hi6220-ade',) : 196,	
-	('zte,zx296718-vga',) : 307,	
-	('ingenic,jz4740-lcd', 'ingenic,jz4725b-lcd', 'ingenic,jz4770-lcd') : 850,	
-	('zte,zx296718-hdmi',) : 467,	
-	('ste,mcde-dsi',) : 745,	
-	('ti,tfp410',) : 282,	
-	('st,stih407-hdmi',) : 941,	
-	('intel,keembay-display',) : 395,	
-	('st,stih407-hqvdp',) : 930,	
-	('lvds-decoder', 'lvds-encoder', 'thine,thc63lvdm83d') : 104,	
-	('parade,ps8640',) : 253,	
-	('zte,zx296718-dpc',) : 615,	
-	('composite-video-connector', 'dvi-connector', 'hdmi-connector', 'svideo-connector', 'vga-connector') : 180,	
-	('parade,ps8622', 'parade,ps8625') : 334,	
-	('hisilicon,hi6220-dsi',) : 580,	
-	('toshiba,tc358762',) : 169,	
-	('toshiba,tc358764',) : 346,	
-	('ti,tpd12s015',) : 121,	
-	('nxp,ptn3460',) : 225,	
-	('dumb-vga-dac', 'adi,adv7123', 'ti,opa362', 'ti,ths8135', 'ti,ths8134') : 178,	
-	('toshiba,tc358775',) : 524,	
-	('toshiba,tc358768', 'toshiba,tc358778') : 672,	
-	('sil,sii9234',) : 640,	
-	('lontium,lt9611',) : 769,	
-	('lontium,lt9611uxc',) : 658,	
-	('jianda,jd-t18003-t01', 'okaya,rh128128t') : 202,	
-	('analogix,anx6345',) : 516,	
-	('multi-inno,mi0283qt',) : 192,	
-	('toshiba,tc358767',) : 1127,	
-	('adafruit,yx350hv15',) : 211,	
-	('adafruit,yx240qv29',) : 179,	
-	('chrontel,ch7033',) : 403,	
-	('megachips,stdp4028-ge-b850v3-fw', 'megachips,stdp2690-ge-b850v3-fw') : 261,	
-	('waveshare,rpi-lcd-35', 'ozzmaker,piscreen') : 190,	
-	('cdns,dsi',) : 927,	
-	('lego,ev3-lcd',) : 256,	
-	('vot,v220hf01a-t',) : 323,	
-	('fsl,imx8mq-nwl-dsi',) : 804,	
-	('composite-video-connector', 'svideo-connector', 'hdmi-connector', 'dvi-connector', 'amlogic,meson-gxbb-vpu', 'amlogic,meson-gxl-vpu', 'amlogic,meson-gxm-vpu', 'amlogic,meson-g12a-vpu') : 341,	
-	('analogix,anx7808', 'analogix,anx7812', 'analogix,anx7814', 'analogix,anx7818') : 907,	
-	('samsung,exynos5433-mic',) : 314,	
-	('adi,adv7511', 'adi,adv7511w', 'adi,adv7513', 'adi,adv7533', 'adi,adv7535') : 894,	
-	('samsung,exynos5-dp',) : 185,	
-	('sil,sii9022',) : 751,	
-	('ti,sn65dsi86',) : 814,	
-	('samsung,s5pv210-rotator', 'samsung,exynos4210-rotator', 'samsung,exynos4212-rotator', 'samsung,exynos5250-rotator') : 281,	
-	('pervasive,e1144cs021', 'pervasive,e1190cs021', 'pervasive,e2200cs021', 'pervasive,e2271cs021') : 771,	
-	('amlogic,meson-gxbb-dw-hdmi', 'amlogic,meson-gxl-dw-hdmi', 'amlogic,meson-gxm-dw-hdmi', 'amlogic,meson-g12a-dw-hdmi') : 704,	
-	('st,stm32-ltdc',) : 147,	
-	('arm,mali-d71', 'arm,mali-d32') : 119,	
-	('analogix,anx7625',) : 1191,	
-	('samsung,exynos5433-decon', 'samsung,exynos5433-decon-tv') : 571,	
-	('samsung,exynos5420-scaler', 'samsung,exynos5433-scaler') : 463,	
-	('st,stm32-dsi',) : 313,	
-	('ti,omap2-dss', 'ti,omap3-dss', 'ti,omap4-dss', 'ti,omap5-dss', 'ti,dra7-dss', 'panel-dsi-cm') : 124,	
-	('samsung,exynos7-decon',) : 519,	
-	('samsung,s3c6400-fimd', 'samsung,s5pv210-fimd', 'samsung,exynos3250-fimd', 'samsung,exynos4210-fimd', 'samsung,exynos5250-fimd', 'samsung,exynos5420-fimd') : 815,	
-	('nvidia,gk20a', 'nvidia,gm20b', 'nvidia,gp10b') : 45,	
-	('samsung,exynos5250-g2d', 'samsung,exynos4212-g2d') : 1016,	
-	('ti,k2g-dss', 'ti,am65x-dss', 'ti,j721e-dss') : 162,	
-	('snps,arcpgu',) : 147,	
-	('vivante,gc',) : 1184,	
-	('cdns,mhdp8546', 'ti,j721e-mhdp8546') : 1622,	
-	('samsung,exynos4210-fimc', 'samsung,exynos4212-fimc') : 950,	
-	('mantix,mlaf057we51-x',) : 218,	
-	('samsung,exynos3250-mipi-dsi', 'samsung,exynos4210-mipi-dsi', 'samsung,exynos5410-mipi-dsi', 'samsung,exynos5422-mipi-dsi', 'samsung,exynos5433-mipi-dsi') : 1317,	
-	('sharp,ls037v7dw01',) : 135,	
-	('ronbo,rb070d30',) : 144,	
-	('samsung,exynos4210-mixer', 'samsung,exynos4212-mixer', 'samsung,exynos5-mixer', 'samsung,exynos5250-mixer', 'samsung,exynos5420-mixer') : 874,	
-	('sii,43wvf1g',) : 209,	
-	('sil,sii8620',) : 1653,	
-	('samsung,ld9040',) : 259,	
-	('arm,core-module-integrator', 'arm,versatile-sysreg', 'arm,realview-eb-syscon', 'arm,realview-pb1176-syscon', 'arm,realview-pb11mp-syscon', 'arm,realview-pba8-syscon', 'arm,realview-pbx-syscon', 'arm,vexpress-muxfpga', 'arm,im-pd1-syscon') : 355,	
-	('arm,mali-dp500', 'arm,mali-dp550', 'arm,mali-dp650') : 668,	
-	('lgphilips,lb035q02',) : 149,	
-	('samsung,s6e63m0',) : 91,	
-	('truly,nt35597-2K-display',) : 443,	
-	('techstar,ts8550b',) : 264,	
-	('samsung,exynos5-gsc', 'samsung,exynos5250-gsc', 'samsung,exynos5420-gsc', 'samsung,exynos5433-gsc') : 1030,	
-	('ti,omap4-dmm', 'ti,omap5-dmm') : 705,	
-	('abt,y030xx067a',) : 253,	
-	('rocktech,jh057n00900', 'xingbangda,xbd599') : 440,	
-	('tpo,td028ttec1', 'toppoly,td028ttec1') : 240,	
-	('raydium,rm68200',) : 315,	
-	('samsung,exynos4210-hdmi', 'samsung,exynos4212-hdmi', 'samsung,exynos5420-hdmi', 'samsung,exynos5433-hdmi') : 1367,	
-	('kingdisplay,kd035g6-54nt',) : 245,	
-	('hydis,hva40wv1',) : 583,	
-	('arm,versatile-tft-panel',) : 198,	
-	('raspberrypi,7inch-touchscreen-panel',) : 309,	
-	('panasonic,vvx10f034n00',) : 161,	
-	('samsung,s6e63j0x03',) : 330,	
-	('sony,acx424akp',) : 316,	
-	('samsung,sofef00', 'samsung,s6e3fc2x01') : 230,	
-	('dlink,dir-685-panel', 'ilitek,ili9322') : 578,	
-	('leadtek,ltk500hd1829',) : 407,	
-	('leadtek,ltk050h3146w', 'leadtek,ltk050h3146w-a2') : 512,	
-	('feixin,k101-im2ba02',) : 380,	
-	('samsung,s6e8aa0',) : 732,	
-	('innolux,p079zca', 'innolux,p097pfg') : 369,	
-	('osddisplays,osd101t2587-53ts',) : 154,	
-	('orisetech,otm8009a',) : 333,	
-	('tdo,tl070wsh30',) : 157,	
-	('samsung,s6d16d0',) : 148,	
-	('kingdisplay,kd097d04',) : 316,	
-	('elida,kd35t133',) : 227,	
-	('xinpeng,xpp055c272',) : 269,	
-	('sharp,ls043t1le01-qhd',) : 212,	
-	('raydium,rm67191',) : 467,	
-	('jdi,lt070me05000',) : 314,	
-	('tpo,td043mtea1',) : 304,	
-	('lg,lg4573',) : 179,	
-	('samsung,s6e88a0-ams452ef01',) : 195,	
-	('sharp,lq101r1sx01',) : 255,	
-	('asus,z00t-tm5p5-n35596',) : 255,	
-	('nec,nl8048hl11',) : 158,	
-	('visionox,rm69299-1080p-display',) : 182,	
-	('sony,acx565akm',) : 408,	
-	('sitronix,st7789v',) : 299,	
-	('tpo,tpg110',) : 287,	
-	('olimex,lcd-olinuxino',) : 211,	
-	('panel-lvds',) : 170,	
-	('samsung,s6e3ha2', 'samsung,s6e3hf2') : 558,	
-	('boe,himax8279d8p', 'boe,himax8279d10p') : 805,	
-	('feiyang,fy07024di26a30d',) : 154,	
-	('tianma,fhd-video',) : 536,	
-	('nvidia,tegra124-vic', 'nvidia,tegra210-vic', 'nvidia,tegra186-vic', 'nvidia,tegra194-vic') : 352,	
-	('boe,tv101wum-nl6', 'auo,kd101n80-45na', 'boe,tv101wum-n53', 'auo,b101uan08.3', 'boe,tv105wum-nw0') : 720,	
-	('nvidia,tegra30-gr2d', 'nvidia,tegra20-gr2d') : 174,	
-	('bananapi,lhr050h41', 'feixin,k101-im2byl02') : 590,	
-	('nvidia,tegra114-gr3d', 'nvidia,tegra30-gr3d', 'nvidia,tegra20-gr3d') : 293,	
-	('qcom,mdss-dsi-ctrl',) : 159,	
-	('aspeed,ast2500-gfx',) : 197,	
-	('qcom,hdmi-phy-8660', 'qcom,hdmi-phy-8960', 'qcom,hdmi-phy-8974', 'qcom,hdmi-phy-8084', 'qcom,hdmi-phy-8996') : 137,	
-	('qcom,mdss-edp',) : 118,	
-	('nvidia,tegra194-dpaux', 'nvidia,tegra186-dpaux', 'nvidia,tegra210-dpaux', 'nvidia,tegra124-dpaux') : 499,	
-	('mediatek,mt2701-disp-color', 'mediatek,mt8167-disp-color', 'mediatek,mt8173-disp-color') : 108,	
-	('qcom,hdmi-tx-8996', 'qcom,hdmi-tx-8994', 'qcom,hdmi-tx-8084', 'qcom,hdmi-tx-8974', 'qcom,hdmi-tx-8960', 'qcom,hdmi-tx-8660') : 426,	
-	('mediatek,mt2701-disp-ovl', 'mediatek,mt8173-disp-ovl') : 302,	
-	('qcom,adreno', 'qcom,adreno-3xx', 'amd,imageon', 'qcom,kgsl-3d0') : 360,	
-	('mediatek,mt2701-disp-ovl', 'mediatek,mt8173-disp-ovl', 'mediatek,mt2701-disp-rdma', 'mediatek,mt8173-disp-rdma', 'mediatek,mt8173-disp-wdma', 'mediatek,mt2701-disp-color', 'mediatek,mt8173-disp-color', 'mediatek,mt8173-disp-aal', 'mediatek,mt8173-disp-gamma', 'mediatek,mt8173-disp-ufoe', 'mediatek,mt2701-dsi', 'mediatek,mt8173-dsi', 'mediatek,mt2701-dpi', 'mediatek,mt8173-dpi', 'mediatek,mt2701-disp-mutex', 'mediatek,mt2712-disp-mutex', 'mediatek,mt8173-disp-mutex', 'mediatek,mt2701-disp-pwm', 'mediatek,mt8173-disp-pwm', 'mediatek,mt8173-disp-od', 'mediatek,mt2701-mmsys', 'mediatek,mt7623-mmsys', 'mediatek,mt2712-mmsys', 'mediatek,mt8173-mmsys') : 433,	
-	('mediatek,mt2701-disp-mutex', 'mediatek,mt2712-disp-mutex', 'mediatek,mt8167-disp-mutex', 'mediatek,mt8173-disp-mutex') : 349,	
-	('nvidia,tegra194-display', 'nvidia,tegra186-display') : 635,	
-	('qcom,mdp5', 'qcom,mdss_mdp') : 643,	
-	('mediatek,mt2701-disp-rdma', 'mediatek,mt8173-disp-rdma') : 235,	
-	('mediatek,mt8173-cec',) : 174,	
-	('nvidia,tegra20-dc', 'nvidia,tegra20-hdmi', 'nvidia,tegra20-gr2d', 'nvidia,tegra20-gr3d', 'nvidia,tegra30-dc', 'nvidia,tegra30-hdmi', 'nvidia,tegra30-gr2d', 'nvidia,tegra30-gr3d', 'nvidia,tegra114-dsi', 'nvidia,tegra114-hdmi', 'nvidia,tegra114-gr3d', 'nvidia,tegra124-dc', 'nvidia,tegra124-sor', 'nvidia,tegra124-hdmi', 'nvidia,tegra124-dsi', 'nvidia,tegra124-vic', 'nvidia,tegra132-dsi', 'nvidia,tegra210-dc', 'nvidia,tegra210-dsi', 'nvidia,tegra210-sor', 'nvidia,tegra210-sor1', 'nvidia,tegra210-vic', 'nvidia,tegra186-display', 'nvidia,tegra186-dc', 'nvidia,tegra186-sor', 'nvidia,tegra186-sor1', 'nvidia,tegra186-vic', 'nvidia,tegra194-display', 'nvidia,tegra194-dc', 'nvidia,tegra194-sor', 'nvidia,tegra194-vic') : 893,	
-	('mediatek,mt2701-dpi', 'mediatek,mt8173-dpi', 'mediatek,mt8183-dpi') : 573,	
-	('qcom,sdm845-dpu', 'qcom,sc7180-dpu') : 755,	
-	('nvidia,tegra210-dsi', 'nvidia,tegra132-dsi', 'nvidia,tegra124-dsi', 'nvidia,tegra114-dsi') : 1074,	
-	('mediatek,mt8173-hdmi-ddc',) : 246,	
-	('qcom,dsi-phy-28nm-hpm', 'qcom,dsi-phy-28nm-hpm-fam-b', 'qcom,dsi-phy-28nm-lp', 'qcom,dsi-phy-20nm', 'qcom,dsi-phy-28nm-8960', 'qcom,dsi-phy-14nm', 'qcom,dsi-phy-14nm-660', 'qcom,dsi-phy-10nm', 'qcom,dsi-phy-10nm-8998', 'qcom,dsi-phy-7nm', 'qcom,dsi-phy-7nm-8150') : 600,	
-	('fsl,imx23-lcdif', 'fsl,imx28-lcdif', 'fsl,imx6sx-lcdif') : 250,	
-	('qcom,adreno', 'qcom,adreno-3xx', 'amd,imageon', 'qcom,kgsl-3d0', 'qcom,mdp4', 'qcom,mdss', 'qcom,sdm845-mdss', 'qcom,sc7180-mdss') : 821,	
-	('qcom,sc7180-dp',) : 942,	
-	('rockchip,rk3288-dp', 'rockchip,rk3399-edp') : 294,	
-	('mediatek,mt2701-dsi', 'mediatek,mt8173-dsi', 'mediatek,mt8183-dsi') : 801,	
-	('amlogic,meson-gxm-mali', 'amlogic,meson-g12a-mali', 'arm,mali-t604', 'arm,mali-t624', 'arm,mali-t628', 'arm,mali-t720', 'arm,mali-t760', 'arm,mali-t820', 'arm,mali-t830', 'arm,mali-t860', 'arm,mali-t880', 'arm,mali-bifrost') : 470,	
-	('nvidia,tegra124-hdmi', 'nvidia,tegra114-hdmi', 'nvidia,tegra30-hdmi', 'nvidia,tegra20-hdmi') : 1263,	
-	('allwinner,sun6i-a31-drc', 'allwinner,sun6i-a31s-drc', 'allwinner,sun8i-a23-drc', 'allwinner,sun8i-a33-drc', 'allwinner,sun9i-a80-drc') : 81,	
-	('rockchip,rk3228-dw-hdmi', 'rockchip,rk3288-dw-hdmi', 'rockchip,rk3328-dw-hdmi', 'rockchip,rk3399-dw-hdmi') : 398,	
-	('rockchip,display-subsystem',) : 314,	
-	('rockchip,rk3288-lvds', 'rockchip,px30-lvds') : 516,	
-	('brcm,7268-v3d', 'brcm,7278-v3d') : 219,	
-	('ti,tilcdc,panel',) : 255,	
-	('allwinner,sun8i-r40-tcon-top', 'allwinner,sun50i-h6-tcon-top') : 193,	
-	('rockchip,rk3066-hdmi',) : 547,	
-	('nvidia,tegra194-dc', 'nvidia,tegra186-dc', 'nvidia,tegra210-dc', 'nvidia,tegra124-dc', 'nvidia,tegra114-dc', 'nvidia,tegra30-dc', 'nvidia,tegra20-dc') : 1748,	
-	('ti,am33xx-tilcdc', 'ti,da850-tilcdc') : 396,	
-	('mediatek,mt2701-hdmi', 'mediatek,mt8173-hdmi') : 1290,	
-	('allwinner,sun8i-a83t-dw-hdmi', 'allwinner,sun50i-h6-dw-hdmi') : 202,	
-	('rockchip,rk3036-inno-hdmi',) : 555,	
-	('allwinner,sun4i-a10-display-engine', 'allwinner,sun5i-a10s-display-engine', 'allwinner,sun5i-a13-display-engine', 'allwinner,sun6i-a31-display-engine', 'allwinner,sun6i-a31s-display-engine', 'allwinner,sun7i-a20-display-engine', 'allwinner,sun8i-a23-display-engine', 'allwinner,sun8i-a33-display-engine', 'allwinner,sun8i-a83t-display-engine', 'allwinner,sun8i-h3-display-engine', 'allwinner,sun8i-r40-display-engine', 'allwinner,sun8i-v3s-display-engine', 'allwinner,sun9i-a80-display-engine', 'allwinner,sun50i-a64-display-engine', 'allwinner,sun50i-h6-display-engine') : 245,	
-	('allwinner,sun8i-a83t-hdmi-phy', 'allwinner,sun8i-h3-hdmi-phy', 'allwinner,sun8i-r40-hdmi-phy', 'allwinner,sun50i-a64-hdmi-phy', 'allwinner,sun50i-h6-hdmi-phy') : 523,	
-	('xlnx,zynqmp-dpsub-1.7',) : 166,	
-	('rockchip,px30-mipi-dsi', 'rockchip,rk3288-mipi-dsi', 'rockchip,rk3399-mipi-dsi') : 838,	
-	('rockchip,rk3399-cdn-dp',) : 802,	
-	('allwinner,sun8i-a83t-de2-mixer-0', 'allwinner,sun8i-a83t-de2-mixer-1', 'allwinner,sun8i-h3-de2-mixer-0', 'allwinner,sun8i-r40-de2-mixer-0', 'allwinner,sun8i-r40-de2-mixer-1', 'allwinner,sun8i-v3s-de2-mixer', 'allwinner,sun50i-a64-de2-mixer-0', 'allwinner,sun50i-a64-de2-mixer-1', 'allwinner,sun50i-h6-de3-mixer-0') : 388,	
-	('fsl,ls1021a-dcu', 'fsl,vf610-dcu') : 240,	
-	('allwinner,sun4i-a10-hdmi', 'allwinner,sun5i-a10s-hdmi', 'allwinner,sun6i-a31-hdmi') : 519,	
-	('allwinner,sun4i-a10-display-frontend', 'allwinner,sun7i-a20-display-frontend', 'allwinner,sun8i-a23-display-frontend', 'allwinner,sun8i-a33-display-frontend') : 484,	
-	('allwinner,sun4i-a10-tv-encoder',) : 446,	
-	('renesas,rcar-gen3-hdmi',) : 71,	
-	('renesas,rcar-gen3-cmm', 'renesas,rcar-gen2-cmm') : 89,	
-	('renesas,du-',) : 193,	
-	('ampire,am-1280800n3tzqw-t00h', 'ampire,am-480272h3tmqw-t01h', 'ampire,am800480r3tmqwa1h', 'arm,rtsm-display', 'armadeus,st0700-adapt', 'auo,b101aw03', 'auo,b101ean01', 'auo,b101xtn01', 'auo,b116xa01', 'auo,b116xw03', 'auo,b133htn01', 'auo,b133xtn01', 'auo,g070vvn01', 'auo,g101evn010', 'auo,g104sn02', 'auo,g121ean01', 'auo,g133han01', 'auo,g156xtn01', 'auo,g185han01', 'auo,g190ean01', 'auo,p320hvn03', 'auo,t215hvn01', 'avic,tm070ddh03', 'bananapi,s070wv20-ct16', 'boe,hv070wsa-100', 'boe,nv101wxmn51', 'boe,nv133fhm-n61', 'boe,nv133fhm-n62', 'boe,nv140fhmn49', 'cdtech,s043wq26h-ct7', 'cdtech,s070pws19hp-fc21', 'cdtech,s070swv29hg-dc44', 'cdtech,s070wv95-ct16', 'chefree,ch101olhlwh-002', 'chunghwa,claa070wp03xg', 'chunghwa,claa101wa01a', 'chunghwa,claa101wb01', 'dataimage,scf0700c48ggu18', 'dlc,dlc0700yzg-1', 'dlc,dlc1010gig', 'edt,et035012dm6', 'edt,etm043080dh6gp', 'edt,etm0430g0dh6', 'edt,et057090dhu', 'edt,et070080dh6', 'edt,etm0700g0dh6', 'edt,etm0700g0bdh6', 'edt,etm0700g0edh6', 'evervision,vgg804821', 'foxlink,fl500wvr00-a0t', 'frida,frd350h54004', 'friendlyarm,hd702e', 'giantplus,gpg482739qs5', 'giantplus,gpm940b0', 'hannstar,hsd070pww1', 'hannstar,hsd100pxn1', 'hit,tx23d38vm0caa', 'innolux,at043tn24', 'innolux,at070tn92', 'innolux,g070y2-l01', 'innolux,g101ice-l01', 'innolux,g121i1-l01', 'innolux,g121x1-l03', 'innolux,n116bge', 'innolux,n125hce-gn1', 'innolux,n156bge-l21', 'innolux,p120zdg-bf1', 'innolux,zj070na-01p', 'ivo,m133nwf4-r0', 'kingdisplay,kd116n21-30nv-a010', 'koe,tx14d24vm1bpa', 'koe,tx26d202vm0bwa', 'koe,tx31d200vm0baa', 'kyo,tcg121xglp', 'lemaker,bl035-rgb-002', 'lg,lb070wv8', 'lg,lp079qx1-sp0v', 'lg,lp097qx1-spa1', 'lg,lp120up1', 'lg,lp129qe', 'logicpd,type28', 'logictechno,lt161010-2nhc', 'logictechno,lt161010-2nhr', 'logictechno,lt170410-2whc', 'mitsubishi,aa070mc01-ca1', 'nec,nl12880bc20-05', 'nec,nl4827hc19-05b', 'netron-dy,e231732', 'neweast,wjfh116008a', 'newhaven,nhd-4.3-480272ef-atxl', 'nlt,nl192108ac18-02d', 'nvd,9128', 'okaya,rs800480t-7x0gp', 'olimex,lcd-olinuxino-43-ts', 'ontat,yx700wv03', 'ortustech,com37h3m05dtc', 'ortustech,com37h3m99dtc', 'ortustech,com43h4m85ulc', 'osddisplays,osd070t1718-19ts', 'pda,91-00156-a0', 'powertip,ph800480t013-idf02', 'qiaodian,qd43003c0-40', 'rocktech,rk070er9427', 'rocktech,rk101ii01d-ct', 'samsung,lsn122dl01-c01', 'samsung,ltn101nt05', 'samsung,ltn140at29-301', 'satoz,sat050at40h12r2', 'sharp,ld-d5116z01b', 'sharp,lq035q7db03', 'sharp,lq070y3dg3b', 'sharp,lq101k1ly04', 'sharp,lq123p1jx31', 'sharp,ls020b1dd01d', 'shelly,sca07010-bfn-lnn', 'starry,kr070pe2t', 'starry,kr122ea0sra', 'tfc,s9700rtwv43tr-01b', 'tianma,tm070jdhg30', 'tianma,tm070jvhg33', 'tianma,tm070rvhg71', 'ti,nspire-cx-lcd-panel', 'ti,nspire-classic-lcd-panel', 'toshiba,lt089ac29000', 'tpk,f07a-0102', 'tpk,f10a-0102', 'urt,umsh-8596md-t', 'urt,umsh-8596md-1t', 'urt,umsh-8596md-7t', 'urt,umsh-8596md-11t', 'urt,umsh-8596md-19t', 'urt,umsh-8596md-20t', 'vxt,vl050-8048nt-c01', 'winstar,wf35ltiacd', 'yes-optoelectronics,ytc700tlag-05-201c', 'panel-dpi', 'auo,b080uan01', 'boe,tv080wum-nl0', 'lg,ld070wx3-sl01', 'lg,lh500wx1-sd03', 'panasonic,vvx10f004b00', 'lg,acx467akm-7', 'osddisplays,osd101t2045-53ts') : 3489,	
-	('allwinner,sun4i-a10-display-backend', 'allwinner,sun5i-a13-display-backend', 'allwinner,sun6i-a31-display-backend', 'allwinner,sun7i-a20-display-backend', 'allwinner,sun8i-a23-display-backend', 'allwinner,sun8i-a33-display-backend', 'allwinner,sun9i-a80-display-backend') : 616,	
-	('renesas,du-r8a7742', 'renesas,du-r8a7743', 'renesas,du-r8a7744', 'renesas,du-r8a7745', 'renesas,du-r8a77470', 'renesas,du-r8a774a1', 'renesas,du-r8a774b1', 'renesas,du-r8a774c0', 'renesas,du-r8a774e1', 'renesas,du-r8a7779', 'renesas,du-r8a7790', 'renesas,du-r8a7791', 'renesas,du-r8a7792', 'renesas,du-r8a7793', 'renesas,du-r8a7794', 'renesas,du-r8a7795', 'renesas,du-r8a7796', 'renesas,du-r8a77961', 'renesas,du-r8a77965', 'renesas,du-r8a77970', 'renesas,du-r8a77980', 'renesas,du-r8a77990', 'renesas,du-r8a77995') : 403,	
-	('faraday,tve200',) : 171,	
-	('fsl,imx6qp-pre',) : 238,	
-	('allwinner,sun6i-a31-mipi-dsi', 'allwinner,sun50i-a64-mipi-dsi') : 801,	
-	('lm75', 'ds1775') : 120,	
-	('lm87cimt',) : 125,	
-	('renesas,r8a7742-lvds', 'renesas,r8a7743-lvds', 'renesas,r8a7744-lvds', 'renesas,r8a774a1-lvds', 'renesas,r8a774b1-lvds', 'renesas,r8a774c0-lvds', 'renesas,r8a774e1-lvds', 'renesas,r8a7790-lvds', 'renesas,r8a7791-lvds', 'renesas,r8a7793-lvds', 'renesas,r8a7795-lvds', 'renesas,r8a7796-lvds', 'renesas,r8a77965-lvds', 'renesas,r8a77970-lvds', 'renesas,r8a77980-lvds', 'renesas,r8a77990-lvds', 'renesas,r8a77995-lvds') : 564,	
-	('fsl,imx6qp-prg',) : 308,	
-	('ad7417',) : 215,	
-	('rockchip,rk3036-vop', 'rockchip,rk3126-vop', 'rockchip,px30-vop-big', 'rockchip,px30-vop-lit', 'rockchip,rk3066-vop', 'rockchip,rk3188-vop', 'rockchip,rk3288-vop', 'rockchip,rk3368-vop', 'rockchip,rk3366-vop', 'rockchip,rk3399-vop-big', 'rockchip,rk3399-vop-lit', 'rockchip,rk3228-vop', 'rockchip,rk3328-vop') : 859,	
-	('max6690',) : 84,	
-	('nvidia,tegra194-host1x', 'nvidia,tegra186-host1x', 'nvidia,tegra210-host1x', 'nvidia,tegra124-host1x', 'nvidia,tegra114-host1x', 'nvidia,tegra30-host1x', 'nvidia,tegra20-host1x') : 347,	
-	('nvidia,tegra114-mipi', 'nvidia,tegra124-mipi', 'nvidia,tegra132-mipi', 'nvidia,tegra210-mipi') : 364,	
-	('allwinner,sun4i-a10-tcon', 'allwinner,sun5i-a13-tcon', 'allwinner,sun6i-a31-tcon', 'allwinner,sun6i-a31s-tcon', 'allwinner,sun7i-a20-tcon', 'allwinner,sun7i-a20-tcon0', 'allwinner,sun7i-a20-tcon1', 'allwinner,sun8i-a23-tcon', 'allwinner,sun8i-a33-tcon', 'allwinner,sun8i-a83t-tcon-lcd', 'allwinner,sun8i-a83t-tcon-tv', 'allwinner,sun8i-r40-tcon-tv', 'allwinner,sun8i-v3s-tcon', 'allwinner,sun9i-a80-tcon-lcd', 'allwinner,sun9i-a80-tcon-tv') : 938,	
-	('intel,lgm-pwm',) : 147,	
-	('ingenic,jz4740-pwm', 'ingenic,jz4725b-pwm') : 150,	
-	('sprd,ums512-pwm',) : 168,	
-	('nvidia,tegra194-sor', 'nvidia,tegra186-sor', 'nvidia,tegra210-sor1', 'nvidia,tegra210-sor', 'nvidia,tegra132-sor', 'nvidia,tegra124-sor') : 2732,	
-	('smu-sat',) : 256,	
-	('st,spear320-pwm', 'st,spear1340-pwm') : 150,	
-	('fcu',) : 384,	
-	('brcm,iproc-pwm',) : 169,	
-	('amlogic,meson8b-pwm', 'amlogic,meson-gxbb-pwm', 'amlogic,meson-gxbb-ao-pwm', 'amlogic,meson-axg-ee-pwm', 'amlogic,meson-axg-ao-pwm', 'amlogic,meson-g12a-ee-pwm', 'amlogic,meson-g12a-ao-pwm-ab', 'amlogic,meson-g12a-ao-pwm-cd') : 352,	
-	('rockchip,rk2928-pwm', 'rockchip,rk3288-pwm', 'rockchip,vop-pwm', 'rockchip,rk3328-pwm') : 270,	
-	('st,sti-pwm',) : 416,	
-	('nxp,lpc3220-pwm',) : 111,	
-	('kontron,sl28cpld-pwm',) : 130,	
-	('samsung,s3c2410-pwm', 'samsung,s3c6400-pwm', 'samsung,s5p6440-pwm', 'samsung,s5pc100-pwm', 'samsung,exynos4210-pwm') : 374,	
-	('atmel,at91rm9200-tcb', 'atmel,at91sam9x5-tcb', 'atmel,sama5d2-tcb', 'atmel,tcb-pwm') : 363,	
-	('fsl,imx23-pwm',) : 127,	
-	('mediatek,mt2712-pwm', 'mediatek,mt7622-pwm', 'mediatek,mt7623-pwm', 'mediatek,mt7628-pwm', 'mediatek,mt7629-pwm', 'mediatek,mt8183-pwm', 'mediatek,mt8516-pwm') : 219,	
-	('nxp,pca9685-pwm',) : 350,	
-	('zte,zx296718-pwm',) : 180,	
-	('fsl,imx51-ipu', 'fsl,imx53-ipu', 'fsl,imx6q-ipu', 'fsl,imx6qp-ipu') : 1029,	
-	('ti,am3352-ehrpwm', 'ti,am33xx-ehrpwm') : 348,	
-	('st,stm32-pwm-lp',) : 176,	
-	('fsl,imx7ulp-pwm',) : 251,	
-	('ti,omap-dmtimer-pwm',) : 244,	
-	('nxp,tda998x',) : 1385,	
-	('mediatek,mt2701-disp-pwm', 'mediatek,mt6595-disp-pwm', 'mediatek,mt8173-disp-pwm', 'mediatek,mt8183-disp-pwm') : 198,	
-	('allwinner,sun4i-a10-pwm', 'allwinner,sun5i-a10s-pwm', 'allwinner,sun5i-a13-pwm', 'allwinner,sun7i-a20-pwm', 'allwinner,sun8i-h3-pwm', 'allwinner,sun50i-a64-pwm', 'allwinner,sun50i-h6-pwm') : 329,	
-	('img,pistachio-pwm',) : 279,	
-	('hisilicon,hi3516cv300-pwm', 'hisilicon,hi3519v100-pwm', 'hisilicon,hi3559v100-shub-pwm', 'hisilicon,hi3559v100-pwm') : 182,	
-	('marvell,berlin-pwm',) : 186,	
-	('renesas,pwm-rcar',) : 164,	
-	('sifive,pwm0',) : 209,	
-	('ti,lp3943-pwm',) : 185,	
-	('nvidia,tegra20-pwm', 'nvidia,tegra186-pwm', 'nvidia,tegra194-pwm') : 186,	
-	('brcm,bcm2835-pwm',) : 117,	
-	('fsl,imx1-pwm',) : 105,	
-	('renesas,tpu-r8a73a4', 'renesas,tpu-r8a7740', 'renesas,tpu-r8a7790', 'renesas,tpu') : 284,	
-	('nxp,lpc1850-sct-pwm',) : 288,	
-	('atmel,at91sam9rl-pwm', 'atmel,sama5d3-pwm', 'atmel,sama5d2-pwm', 'microchip,sam9x60-pwm') : 288,	
-	('fsl,imx27-pwm',) : 237,	
-	('st,stm32-pwm',) : 398,	
-	('cirrus,ep7209-pwm',) : 97,	
-	('atmel,at91sam9n12-hlcdc', 'atmel,at91sam9x5-hlcdc', 'atmel,sama5d2-hlcdc', 'atmel,sama5d3-hlcdc', 'atmel,sama5d4-hlcdc', 'microchip,sam9x60-hlcdc', 'atmel,hlcdc-pwm') : 201,	
-	('ti,twl4030-pwmled', 'ti,twl6030-pwmled') : 206,	
-	('intel,keembay-pwm',) : 140,	
-	('fsl,vf610-ftm-pwm', 'fsl,imx8qm-ftm-pwm') : 350,	
-	('via,vt8500-pwm',) : 177,	
-	('marvell,pxa250-pwm', 'marvell,pxa270-pwm', 'marvell,pxa168-pwm', 'marvell,pxa910-pwm') : 136,	
-	('brcm,bcm7038-pwm',) : 178,	
-	('ti,twl4030-pwm', 'ti,twl6030-pwm') : 220,	
-	('brcm,kona-pwm',) : 184,	
-	('fsl,imx6q-snvs-lpgpr', 'fsl,imx6ul-snvs-lpgpr', 'fsl,imx7d-snvs-lpgpr') : 108,	
-	('nxp,lpc1850-otp',) : 61,	
-	('google,cros-ec-pwm',) : 171,	
-	('fsl,imx8qxp-scu-ocotp', 'fsl,imx8qm-scu-ocotp') : 178,	
-	('qcom,spmi-sdam',) : 124,	
-	('socionext,uniphier-efuse',) : 50,	
-	('fsl,imx23-ocotp', 'fsl,imx28-ocotp') : 122,	
-	('brcm,ocotp', 'brcm,ocotp-v2') : 200,	
-	('mediatek,mt8173-efuse', 'mediatek,efuse') : 60,	
-	('rockchip,rockchip-efuse', 'rockchip,rk3066a-efuse', 'rockchip,rk3188-efuse', 'rockchip,rk3228-efuse', 'rockchip,rk3288-efuse', 'rockchip,rk3368-efuse', 'rockchip,rk3328-efuse', 'rockchip,rk3399-efuse') : 208,	
-	('zii,rave-sp-eeprom',) : 167,	
-	('nxp,lpc1857-eeprom',) : 166,	
-	('sprd,ums312-efuse',) : 250,	
-	('fsl,imx6q-ocotp', 'fsl,imx6sl-ocotp', 'fsl,imx6sx-ocotp', 'fsl,imx6ul-ocotp', 'fsl,imx6ull-ocotp', 'fsl,imx7d-ocotp', 'fsl,imx6sll-ocotp', 'fsl,imx7ulp-ocotp', 'fsl,imx8mq-ocotp', 'fsl,imx8mm-ocotp', 'fsl,imx8mn-ocotp', 'fsl,imx8mp-ocotp') : 352,	
-	('st,stm32f4-otp', 'st,stm32mp15-bsec') : 131,	
-	('fsl,vf610-ocotp',) : 173,	
-	('fsl,imx25-iim', 'fsl,imx27-iim', 'fsl,imx31-iim', 'fsl,imx35-iim', 'fsl,imx51-iim', 'fsl,imx53-iim') : 90,	
-	('ingenic,jz4780-efuse',) : 148,	
-	('xlnx,zynqmp-nvmem-fw',) : 50,	
-	('qcom,qfprom', 'qcom,sc7180-qfprom') : 223,	
-	('allwinner,sun4i-a10-sid', 'allwinner,sun7i-a20-sid', 'allwinner,sun8i-a83t-sid', 'allwinner,sun8i-h3-sid', 'allwinner,sun50i-a64-sid', 'allwinner,sun50i-h5-sid', 'allwinner,sun50i-h6-sid') : 143,	
-	('amlogic,meson-gxbb-efuse',) : 77,	
-	('sprd,sc2731-efuse', 'sprd,sc2730-efuse') : 172,	
-	('amlogic,meson6-efuse', 'amlogic,meson8-efuse', 'amlogic,meson8b-efuse') : 160,	
-	('rockchip,px30-otp', 'rockchip,rk3308-otp') : 180,	
-	('cavium,octeon-6130-mmc', 'cavium,octeon-7890-mmc') : 200,	
-	('microchip,pic32mzda-sdhci',) : 162,	
-	('st,spear300-sdhci',) : 124,	
-	('brcm,bcm2835-sdhci', 'brcm,bcm2711-emmc2', 'brcm,sdhci-iproc-cygnus', 'brcm,sdhci-iproc') : 249,	
-	('fujitsu,mb86s70-sdhci-3.0',) : 156,	
-	('marvell,dove-sdhci',) : 75,	
-	('atmel,sama5d2-sdhci', 'microchip,sam9x60-sdhci') : 299,	
-	('st,sdhci',) : 351,	
-	('mrvl,pxav2-mmc',) : 161,	
-	('fsl,imx23-mmc', 'fsl,imx28-mmc') : 503,	
-	('brcm,kona-sdhci', 'bcm,kona-sdhci') : 191,	
-	('amlogic,meson8-sdhc', 'amlogic,meson8b-sdhc', 'amlogic,meson8m2-sdhc') : 590,	
-	('samsung,s3c6410-sdhci', 'samsung,exynos4210-sdhci') : 479,	
-	('amlogic,meson-gx-mmc', 'amlogic,meson-gxbb-mmc', 'amlogic,meson-gxl-mmc', 'amlogic,meson-gxm-mmc', 'amlogic,meson-axg-mmc') : 827,	
-	('marvell,pxa-mmc',) : 507,	
-	('mrvl,pxav3-mmc', 'marvell,armada-380-sdhci') : 374,	
-	('zte,zx296718-dw-mshc',) : 153,	
-	('snps,dwcmshc-sdhci',) : 160,	
-	('marvell,armada-ap806-sdhci', 'marvell,armada-cp110-sdhci', 'marvell,armada-3700-sdhci') : 413,	
-	('aspeed,ast2400-sdhci', 'aspeed,ast2500-sdhci', 'aspeed,ast2600-sdhci', 'aspeed,ast2400-sd-controller', 'aspeed,ast2500-sd-controller', 'aspeed,ast2600-sd-controller') : 231,	
-	('mmc-spi-slot',) : 807,	
-	('brcm,bcm7425-sdhci', 'brcm,bcm7445-sdhci', 'brcm,bcm7216-sdhci') : 222,	
-	('ti,am654-sdhci-5.1', 'ti,j721e-sdhci-8bit', 'ti,j721e-sdhci-4bit') : 580,	
-	('actions,owl-mmc',) : 487,	
-	('mellanox,bluefield-dw-mshc',) : 43,	
-	('socionext,milbeaut-m10v-sdhci-3.0',) : 236,	
-	('sirf,prima2-sdhc',) : 153,	
-	('microchip,dw-sparx5-sdhci',) : 169,	
-	('snps,dw-mshc', 'altr,socfpga-dw-mshc', 'img,pistachio-dw-mshc') : 73,	
-	('hisilicon,hi3660-dw-mshc', 'hisilicon,hi4511-dw-mshc', 'hisilicon,hi6220-dw-mshc') : 323,	
-	('sprd,sdhci-r11',) : 502,	
-	('renesas,usdhi6rol0',) : 1213,	
-	('hisilicon,hi3798cv200-dw-mshc',) : 147,	
-	('wm,wm8505-sdhc',) : 648,	
-	('nintendo,hollywood-sdhci',) : 46,	
-	('ti,dm6441-mmc', 'ti,da830-mmc') : 908,	
-	('rockchip,rk2928-dw-mshc', 'rockchip,rk3288-dw-mshc') : 224,	
-	('allwinner,sun4i-a10-mmc', 'allwinner,sun5i-a13-mmc', 'allwinner,sun7i-a20-mmc', 'allwinner,sun8i-a83t-emmc', 'allwinner,sun9i-a80-mmc', 'allwinner,sun50i-a64-mmc', 'allwinner,sun50i-a64-emmc') : 988,	
-	('qcom,sdhci-msm-v4', 'qcom,sdhci-msm-v5', 'qcom,sdm845-sdhci', 'qcom,sc7180-sdhci') : 1599,	
-	('ti,dra7-sdhci', 'ti,k2g-sdhci', 'ti,am335-sdhci', 'ti,am437-sdhci') : 874,	
-	('socionext,uniphier-sd4hc', 'cdns,sd4hc') : 311,	
-	('atmel,hsmci',) : 1700,	
-	('moxa,moxart-mmc', 'faraday,ftsdc010') : 498,	
-	('fsl,imx21-mmc', 'fsl,imx31-mmc', 'fsl,mpc5121-sdhc') : 818,	
-	('mmc-pwrseq-emmc',) : 70,	
-	('renesas,sdhi-r7s9210', 'renesas,sdhi-mmc-r8a77470', 'renesas,sdhi-r8a7795', 'renesas,sdhi-r8a7796', 'renesas,rcar-gen3-sdhi') : 223,	
-	('rockchip,rk3399-sdhci-5.1', 'intel,lgm-sdhci-5.1-emmc', 'intel,lgm-sdhci-5.1-sdxc', 'intel,keembay-sdhci-5.1-emmc', 'intel,keembay-sdhci-5.1-sd', 'intel,keembay-sdhci-5.1-sdio', 'arasan,sdhci-8.9a', 'arasan,sdhci-5.1', 'arasan,sdhci-4.9a', 'xlnx,zynqmp-8.9a', 'xlnx,versal-8.9a') : 912,	
-	('amlogic,meson8-sdio', 'amlogic,meson8b-sdio') : 524,	
-	('mmc-pwrseq-sd8787',) : 60,	
-	('samsung,exynos4412-dw-mshc', 'samsung,exynos5250-dw-mshc', 'samsung,exynos5420-dw-mshc', 'samsung,exynos5420-dw-mshc-smu', 'samsung,exynos7-dw-mshc', 'samsung,exynos7-dw-mshc-smu') : 389,	
-	('mmc-pwrseq-simple',) : 100,	
-	('renesas,sdhi-sh73a0', 'renesas,sdhi-r8a73a4', 'renesas,sdhi-r8a7740', 'renesas,sdhi-r7s72100', 'renesas,sdhi-r8a7778', 'renesas,sdhi-r8a7779', 'renesas,sdhi-r8a7743', 'renesas,sdhi-r8a7745', 'renesas,sdhi-r8a7790', 'renesas,sdhi-r8a7791', 'renesas,sdhi-r8a7792', 'renesas,sdhi-r8a7793', 'renesas,sdhi-r8a7794', 'renesas,rcar-gen1-sdhi', 'renesas,rcar-gen2-sdhi', 'renesas,sdhi-shmobile') : 330,	
-	('socionext,uniphier-sd-v2.91', 'socionext,uniphier-sd-v3.1', 'socionext,uniphier-sd-v3.1.1') : 435,	
-	('ti,omap2420-mmc',) : 1032,	
-	('eckelmann,siox-gpio',) : 104,	
-	('brcm,bcm2835-sdhost',) : 960,	
-	('pmem-region', 'pmem-region-v2') : 72,	
-	('marvell,orion-sdio',) : 581,	
-	('ingenic,jz4740-mmc', 'ingenic,jz4725b-mmc', 'ingenic,jz4760-mmc', 'ingenic,jz4780-mmc', 'ingenic,x1000-mmc') : 755,	
-	('qcom,pm8941-coincell',) : 84,	
-	('mediatek,mt8135-mmc', 'mediatek,mt8173-mmc', 'mediatek,mt8183-mmc', 'mediatek,mt2701-mmc', 'mediatek,mt2712-mmc', 'mediatek,mt7622-mmc', 'mediatek,mt8516-mmc', 'mediatek,mt7620-mmc', 'mediatek,mt6779-mmc') : 2000,	
-	('qemu,pvpanic-mmio',) : 67,	
-	('renesas,sh-mmcif',) : 1087,	
-	('ti,omap2-hsmmc', 'ti,omap3-pre-es3-hsmmc', 'ti,omap3-hsmmc', 'ti,omap4-hsmmc', 'ti,am33xx-hsmmc') : 1338,	
-	('samsung,s3c2410-sdi', 'samsung,s3c2412-sdi', 'samsung,s3c2440-sdi') : 1080,	
-	('st,lis302dl-spi',) : 96,	
-	('atmel,at25',) : 272,	
-	('hisilicon,gpio_hubv1', 'hisilicon,kirin970_hikey_usbhub') : 176,	
-	('nvidia,tegra194-sdhci', 'nvidia,tegra186-sdhci', 'nvidia,tegra210-sdhci', 'nvidia,tegra124-sdhci', 'nvidia,tegra114-sdhci', 'nvidia,tegra30-sdhci', 'nvidia,tegra20-sdhci') : 1178,	
-	('atmel,at91rm9200-ssc', 'atmel,at91sam9rl-ssc', 'atmel,at91sam9g45-ssc') : 175,	
-	('dallas,ds1682',) : 145,	
-	('fsl,ls1021a-esdhc', 'fsl,ls1046a-esdhc', 'fsl,ls1012a-esdhc', 'fsl,p1010-esdhc', 'fsl,mpc8379-esdhc', 'fsl,mpc8536-esdhc', 'fsl,esdhc', 'fsl,t1040-scfg', 'fsl,ls1012a-scfg', 'fsl,ls1046a-scfg') : 914,	
-	('atmel,at91rm9200-tcb', 'atmel,at91sam9x5-tcb') : 119,	
-	('mmio-sram', 'atmel,sama5d2-securam') : 272,	
-	('taos,tsl2550',) : 260,	
-	('atmel,24c00', 'atmel,24c01', 'atmel,24cs01', 'atmel,24c02', 'atmel,24cs02', 'atmel,24mac402', 'atmel,24mac602', 'atmel,spd', 'atmel,24c04', 'atmel,24cs04', 'atmel,24c08', 'atmel,24cs08', 'atmel,24c16', 'atmel,24cs16', 'atmel,24c32', 'atmel,24cs32', 'atmel,24c64', 'atmel,24cs64', 'atmel,24c128', 'atmel,24c256', 'atmel,24c512', 'atmel,24c1024', 'atmel,24c2048') : 512,	
-	('ibm,coherent-platform-facility',) : 341,	
-	('st,lis3lv02d',) : 172,	
-	('cnxt,cx92755-i2c',) : 251,	
-	('energymicro,efm32-i2c',) : 326,	
-	('snps,designware-i2c', 'mscc,ocelot-i2c', 'baikal,bt1-sys-i2c') : 279,	
-	('eeprom-93xx46', 'atmel,at93c46d') : 351,	
-	('cavium,octeon-3860-twsi', 'cavium,octeon-7890-twsi') : 151,	
-	('altr,softip-i2c-v1.0',) : 319,	
-	('idt,89hpes8nt2', 'idt,89hpes12nt3', 'idt,89hpes24nt6ag2', 'idt,89hpes32nt8ag2', 'idt,89hpes32nt8bg2', 'idt,89hpes12nt12g2', 'idt,89hpes16nt16g2', 'idt,89hpes24nt24g2', 'idt,89hpes32nt24ag2', 'idt,89hpes32nt24bg2', 'idt,89hpes12n3', 'idt,89hpes12n3a', 'idt,89hpes24n3', 'idt,89hpes24n3a', 'idt,89hpes32h8', 'idt,89hpes32h8g2', 'idt,89hpes48h12', 'idt,89hpes48h12g2', 'idt,89hpes48h12ag2', 'idt,89hpes16h16', 'idt,89hpes22h16', 'idt,89hpes22h16g2', 'idt,89hpes34h16', 'idt,89hpes34h16g2', 'idt,89hpes64h16', 'idt,89hpes64h16g2', 'idt,89hpes64h16ag2', 'idt,89hpes12t3g2', 'idt,89hpes24t3g2', 'idt,89hpes16t4', 'idt,89hpes4t4g2', 'idt,89hpes10t4g2', 'idt,89hpes16t4g2', 'idt,89hpes16t4ag2', 'idt,89hpes5t5', 'idt,89hpes6t5', 'idt,89hpes8t5', 'idt,89hpes8t5a', 'idt,89hpes24t6', 'idt,89hpes6t6g2', 'idt,89hpes24t6g2', 'idt,89hpes16t7', 'idt,89hpes32t8', 'idt,89hpes32t8g2', 'idt,89hpes48t12', 'idt,89hpes48t12g2') : 770,	
-	('zte,zx296718-i2c',) : 404,	
-	('fsl,imx25-esdhc', 'fsl,imx35-esdhc', 'fsl,imx51-esdhc', 'fsl,imx53-esdhc', 'fsl,imx6sx-usdhc', 'fsl,imx6sl-usdhc', 'fsl,imx6sll-usdhc', 'fsl,imx6q-usdhc', 'fsl,imx6ull-usdhc', 'fsl,imx7d-usdhc', 'fsl,imx7ulp-usdhc', 'fsl,imx8qxp-usdhc', 'fsl,imx8mm-usdhc') : 1122,	
-	('hisilicon,hix5hd2-i2c',) : 349,	
-	('ingenic,jz4770-i2c', 'ingenic,jz4780-i2c', 'ingenic,x1000-i2c') : 0,	
-	('sirf,prima2-i2c',) : 312,	
-	('mediatek,mt7621-i2c',) : 228,	
-	('samsung,exynos5-hsi2c', 'samsung,exynos5250-hsi2c', 'samsung,exynos5260-hsi2c', 'samsung,exynos7-hsi2c') : 539,	
-	('xlnx,sd-fec-1.1',) : 974,	
-	('i2c-gpio',) : 314,	
-	('nxp,pca9564', 'nxp,pca9665') : 161,	
-	('xlnx,xps-iic-2.00.a',) : 532,	
-	('img,scb-i2c',) : 885,	
-	('atmel,at91rm9200-i2c', 'atmel,at91sam9260-i2c', 'atmel,at91sam9261-i2c', 'atmel,at91sam9g20-i2c', 'atmel,at91sam9g10-i2c', 'atmel,at91sam9x5-i2c', 'atmel,sama5d4-i2c', 'atmel,sama5d2-i2c', 'microchip,sam9x60-i2c') : 231,	
-	('qcom,fastrpc-compute-cb', 'qcom,fastrpc') : 1184,	
-	('fsl,imx23-i2c', 'fsl,imx28-i2c') : 490,	
-	('sprd,sc9860-i2c',) : 392,	
-	('fsl,cpm1-i2c', 'fsl,cpm2-i2c') : 453,	
-	('cdns,i2c-r1p10', 'cdns,i2c-r1p14') : 686,	
-	('intel,iop3xx-i2c', 'intel,ixp4xx-i2c') : 308,	
-	('arm,versatile-i2c',) : 83,	
-	('lsi,api2c',) : 530,	
-	('renesas,iic-emev2',) : 260,	
-	('aspeed,ast2400-i2c-bus', 'aspeed,ast2500-i2c-bus', 'aspeed,ast2600-i2c-bus') : 701,	
-	('i2c-cbus-gpio',) : 155,	
-	('fsl,imx1-i2c', 'fsl,imx21-i2c', 'fsl,vf610-i2c') : 954,	
-	('apm,xgene-slimpro-i2c',) : 415,	
-	('allwinner,sun6i-a31-p2wi',) : 208,	
-	('ibm,iic',) : 427,	
-	('fsl,imx7ulp-lpi2c',) : 447,	
-	('socionext,synquacer-i2c',) : 437,	
-	('nxp,lpc1788-i2c',) : 287,	
-	('brcm,brcmstb-i2c', 'brcm,brcmper-i2c', 'brcm,bcm2711-hdmi-i2c') : 474,	
-	('brcm,kona-i2c',) : 526,	
-	('mpc5200-i2c', 'fsl,mpc5200b-i2c', 'fsl,mpc5200-i2c', 'fsl,mpc5121-i2c', 'fsl,mpc8313-i2c', 'fsl,mpc8543-i2c', 'fsl,mpc8544-i2c', 'fsl-i2c') : 539,	
-	('brcm,bcm2711-i2c', 'brcm,bcm2835-i2c') : 322,	
-	('mrvl,pxa-i2c', 'mrvl,pwri2c', 'mrvl,mmp-twsi', 'marvell,armada-3700-i2c') : 905,	
-	('nxp,pnx-i2c',) : 442,	
-	('qcom,msm8916-cci', 'qcom,msm8996-cci', 'qcom,sdm845-cci') : 542,	
-	('netlogic,xlp980-i2c',) : 396,	
-	('renesas,iic-r8a73a4', 'renesas,iic-r8a7740', 'renesas,iic-r8a774c0', 'renesas,iic-r8a7790', 'renesas,iic-r8a7791', 'renesas,iic-r8a7792', 'renesas,iic-r8a7793', 'renesas,iic-r8a7794', 'renesas,iic-r8a7795', 'renesas,iic-r8a77990', 'renesas,iic-sh73a0', 'renesas,rcar-gen2-iic', 'renesas,rcar-gen3-iic', 'renesas,rmobile-iic') : 594,	
-	('google,cros-ec-i2c-tunnel',) : 176,	
-	('opencores,i2c-ocores', 'aeroflexgaisler,i2cmst', 'sifive,fu540-c000-i2c', 'sifive,i2c0') : 486,	
-	('st,ddci2c',) : 578,	
-	('qcom,i2c-qup-v1.1.1', 'qcom,i2c-qup-v2.1.1', 'qcom,i2c-qup-v2.2.1') : 1224,	
-	('wm,wm8505-i2c',) : 308,	
-	('socionext,uniphier-fi2c',) : 387,	
-	('nvidia,tegra194-i2c', 'nvidia,tegra186-i2c', 'nvidia,tegra210-i2c-vi', 'nvidia,tegra210-i2c', 'nvidia,tegra124-i2c', 'nvidia,tegra114-i2c', 'nvidia,tegra30-i2c', 'nvidia,tegra20-i2c', 'nvidia,tegra20-i2c-dvc') : 1201,	
-	('ibm,opal-i2c',) : 193,	
-	('ti,omap4-i2c', 'ti,omap3-i2c', 'ti,omap2430-i2c', 'ti,omap2420-i2c') : 968,	
-	('st,comms-ssc-i2c', 'st,comms-ssc4-i2c') : 519,	
-	('nvidia,tegra186-bpmp-i2c',) : 198,	
-	('rockchip,rv1108-i2c', 'rockchip,rk3066-i2c', 'rockchip,rk3188-i2c', 'rockchip,rk3228-i2c', 'rockchip,rk3288-i2c', 'rockchip,rk3399-i2c') : 708,	
-	('ti,davinci-i2c', 'ti,keystone-i2c') : 585,	
-	('socionext,uniphier-i2c',) : 268,	
-	('amlogic,meson6-i2c', 'amlogic,meson-gxbb-i2c', 'amlogic,meson-axg-i2c') : 312,	
-	('mediatek,mt2712-i2c', 'mediatek,mt6577-i2c', 'mediatek,mt6589-i2c', 'mediatek,mt7622-i2c', 'mediatek,mt8173-i2c', 'mediatek,mt8183-i2c', 'mediatek,mt8192-i2c') : 967,	
-	('renesas,riic-rz',) : 279,	
-	('i2c-mux',) : 101,	
-	('st,stm32f4-i2c',) : 445,	
-	('brcm,iproc-i2c', 'brcm,iproc-nic-i2c') : 756,	
-	('allwinner,sun4i-a10-i2c', 'allwinner,sun6i-a31-i2c', 'marvell,mv64xxx-i2c', 'marvell,mv78230-i2c', 'marvell,mv78230-a0-i2c') : 693,	
-	('i2c-mux-reg',) : 179,	
-	('lltc,ltc4305', 'lltc,ltc4306') : 195,	
-	('nuvoton,npcm750-i2c',) : 1427,	
-	('i2c-mux-gpio',) : 157,	
-	('actions,s500-i2c', 'actions,s700-i2c', 'actions,s900-i2c') : 328,	
-	('nxp,pca9541',) : 166,	
-	('nxp,pca9540', 'nxp,pca9542', 'nxp,pca9543', 'nxp,pca9544', 'nxp,pca9545', 'nxp,pca9546', 'nxp,pca9547', 'nxp,pca9548', 'nxp,pca9846', 'nxp,pca9847', 'nxp,pca9848', 'nxp,pca9849') : 358,	
-	('i2c-arb-gpio-challenge',) : 113,	
-	('i2c-mux-pinctrl',) : 129,	
-	('renesas,i2c-r8a7778', 'renesas,i2c-r8a7779', 'renesas,i2c-r8a7790', 'renesas,i2c-r8a7791', 'renesas,i2c-r8a7792', 'renesas,i2c-r8a7793', 'renesas,i2c-r8a7794', 'renesas,i2c-r8a7795', 'renesas,i2c-r8a7796', 'renesas,i2c-rcar', 'renesas,rcar-gen1-i2c', 'renesas,rcar-gen2-i2c', 'renesas,rcar-gen3-i2c') : 650,	
-	('samsung,s3c2410-i2c', 'samsung,s3c2440-i2c', 'samsung,s3c2440-hdmiphy-i2c', 'samsung,exynos5-sata-phy-i2c') : 670,	
-	('qcom,geni-i2c',) : 518,	
-	('mellanox,i2c-mlxbf1', 'mellanox,i2c-mlxbf2') : 1397,	
-	('i2c-demux-pinctrl',) : 204,	
-	('st,stm32f7-i2c', 'st,stm32mp15-i2c') : 1540,	
-	('socionext,uniphier-xdmac',) : 395,	
-	('nxp,lpc1850-dmamux',) : 115,	
-	('fsl,vf610-edma', 'fsl,ls1028a-edma', 'fsl,imx7ulp-edma') : 334,	
-	('adi,axi-dmac-1.00.a',) : 700,	
-	('moxa,moxart-dma',) : 427,	
-	('st,stm32-dma', 'st,stm32h7-dmamux') : 264,	
-	('snps,axi-dma-1.01a',) : 587,	
-	('fsl,imx23-dma-apbh', 'fsl,imx23-dma-apbx', 'fsl,imx28-dma-apbh', 'fsl,imx28-dma-apbx') : 518,	
-	('ti,dra7-dma-crossbar', 'ti,am335x-edma-crossbar', 'ti,edma3-tpcc', 'ti,omap4430-sdma', 'ti,edma3', 'ti,edma3-tpcc') : 295,	
-	('marvell,orion-xor', 'marvell,armada-380-xor', 'marvell,armada-3700-xor') : 892,	
-	('renesas,shdma-mux',) : 45,	
-	('ingenic,jz4740-dma', 'ingenic,jz4725b-dma', 'ingenic,jz4770-dma', 'ingenic,jz4780-dma', 'ingenic,x1000-dma', 'ingenic,x1830-dma') : 654,	
-	('allwinner,sun4i-a10-dma',) : 751,	
-	('renesas,nbpfaxi64dmac1b4', 'renesas,nbpfaxi64dmac1b8', 'renesas,nbpfaxi64dmac1b16', 'renesas,nbpfaxi64dmac4b4', 'renesas,nbpfaxi64dmac4b8', 'renesas,nbpfaxi64dmac4b16', 'renesas,nbpfaxi64dmac8b4', 'renesas,nbpfaxi64dmac8b8', 'renesas,nbpfaxi64dmac8b16') : 946,	
-	('fsl,mpc5200-sram', 'mpc5200-sram', 'fsl,mpc5200-bestcomm', 'mpc5200-bestcomm') : 292,	
-	('nvidia,tegra148-apbdma', 'nvidia,tegra114-apbdma', 'nvidia,tegra30-apbdma', 'nvidia,tegra20-apbdma') : 1068,	
-	('fsl,imx1-dma', 'fsl,imx21-dma', 'fsl,imx27-dma') : 859,	
-	('apm,xgene-storm-dma',) : 1041,	
-	('actions,s900-dma', 'actions,s700-dma') : 758,	
-	('stericsson,coh901318',) : 1965,	
-	('marvell,pdma-1.0',) : 736,	
-	('socionext,uniphier-mio-dmac',) : 316,	
-	('st,stm32h7-mdma',) : 1205,	
-	('st,stm32-dma',) : 972,	
-	('fsl,raideng-v1.0',) : 532,	
-	('img,pistachio-mdc-dma',) : 740,	
-	('ti,am3359-cppi41', 'ti,da830-cppi41') : 825,	
-	('brcm,bcm2835-dma',) : 622,	
-	('socionext,milbeaut-m10v-hdmac',) : 392,	
-	('atmel,at91sam9rl-dma', 'atmel,at91sam9g45-dma') : 1197,	
-	('renesas,usb-dmac',) : 522,	
-	('sprd,sc9860-dma',) : 868,	
-	('snps,dma-spear1340',) : 131,	
-	('socionext,milbeaut-m10v-xdmac',) : 264,	
-	('allwinner,sun6i-a31-dma', 'allwinner,sun8i-a23-dma', 'allwinner,sun8i-a83t-dma', 'allwinner,sun8i-h3-dma', 'allwinner,sun8i-v3s-dma', 'allwinner,sun50i-a64-dma', 'allwinner,sun50i-a100-dma', 'allwinner,sun50i-h6-dma') : 960,	
-	('mediatek,mt6577-uart-dma',) : 410,	
-	('marvell,xor-v2',) : 506,	
-	('renesas,rcar-dmac',) : 1079,	
-	('mediatek,mt7623-hsdma', 'mediatek,mt7622-hsdma') : 551,	
-	('mediatek,mt6765-cqdma',) : 520,	
-	('hisilicon,k3-dma-1.0', 'hisilicon,hisi-pcm-asp-dma-1.0') : 721,	
-	('brcm,iproc-sba', 'brcm,iproc-sba-v2') : 1203,	
-	('fsl,mpc5121-dma', 'fsl,mpc8308-dma') : 685,	
-	('zte,zx296702-dma',) : 669,	
-	('nvidia,tegra210-adma', 'nvidia,tegra186-adma') : 626,	
-	('ti,omap2420-sdma', 'ti,omap2430-sdma', 'ti,omap3430-sdma', 'ti,omap3630-sdma', 'ti,omap4430-sdma') : 1294,	
-	('qcom,hidma-mgmt-1.0',) : 299,	
-	('ti,edma3', 'ti,edma3-tpcc', 'ti,edma3-tptc') : 1650,	
-	('xlnx,zynqmp-dma-1.0',) : 641,	
-	('st,stih407-fdma-mpe31-11', 'st,stih407-fdma-mpe31-12', 'st,stih407-fdma-mpe31-13') : 578,	
-	('sifive,fu540-c000-pdma',) : 363,	
-	('xlnx,zynqmp-dpdma',) : 918,	
-	('fsl,elo3-dma', 'fsl,eloplus-dma', 'fsl,elo-dma') : 693,	
-	('marvell,adma-1.0', 'marvell,pxa910-squ') : 524,	
-	('qcom,hidma-1.0', 'qcom,hidma-1.1', 'qcom,hidma-1.2') : 612,	
-	('fsl,ls1021a-qdma',) : 875,	
-	('qcom,adm',) : 553,	
-	('sirf,prima2-dmac', 'sirf,atlas7-dmac', 'sirf,atlas7-dmac-v2') : 794,	
-	('atmel,sama5d4-dma', 'microchip,sama7g5-dma') : 1416,	
-	('qcom,bam-v1.3.0', 'qcom,bam-v1.4.0', 'qcom,bam-v1.7.0') : 877,	
-	('xlnx,axi-dma-1.00.a', 'xlnx,axi-cdma-1.00.a', 'xlnx,axi-vdma-1.00.a', 'xlnx,axi-mcdma-1.00.a') : 1776,	
-	('fsl,imx6q-sdma', 'fsl,imx53-sdma', 'fsl,imx51-sdma', 'fsl,imx35-sdma', 'fsl,imx31-sdma', 'fsl,imx25-sdma', 'fsl,imx7d-sdma', 'fsl,imx8mq-sdma') : 1411,	
-	('qcom,sdm845-gpi-dma',) : 1500,	
-	('stericsson,dma40',) : 2296,	
-	('ti,am654-navss-main-udmap', 'ti,am654-navss-mcu-udmap', 'ti,j721e-navss-main-udmap', 'ti,j721e-navss-mcu-udmap', 'ti,am64-dmss-bcdma', 'ti,am64-dmss-pktdma') : 3649
-
-}
\ No newline at end of file
@@ -1,19 +1,29 @@
 #!/usr/bin/env python3
 
 import os
+import time
 import pickle
+import math
 import statistics
+import Levenshtein
+import numpy as np
+from functools import lru_cache
+from multiprocessing import Pool, shared_memory
 from peewee import *
-from cmsis_svd.parser import SVDParser
 from pathlib import Path
-from strsimpy.normalized_levenshtein import NormalizedLevenshtein
+import svd_common
 
 #import logging
 #logger = logging.getLogger('peewee')
 #logger.addHandler(logging.StreamHandler())
 #logger.setLevel(logging.DEBUG)
 
-db = SqliteDatabase('svd.db')
+db = SqliteDatabase('svd.db', pragmas={
+    'journal_mode': 'wal',      # Readers (ex. present_results) don't block the writer
+    'synchronous': 'normal',    # No fsync per commit, WAL stays consistent
+    'cache_size': -64 * 1024})  # 64 MiB page cache
+
+ANALYZER_VERSION = 2 # Bump when analysis changes, an svd.db analyzed by another version is rebuilt from scratch
 
 class BaseModel(Model):
     class Meta:
@@ -57,6 +67,9 @@ class PeripheralSoC(BaseModel): # for many-many SoC-Peripheral
     soc = ForeignKeyField(SoC, backref='peripherals')
     occurances = IntegerField()
 
+    class Meta:
+        indexes = ((('soc', 'peripheral'), False),) # Peripherals of a SoC, without reading the rows
+
     def __str__(self):
         pnames = [x.name for x in self.peripheral.names.select()]
         return f"Relation between {pnames} and {self.soc}"
@@ -81,9 +94,235 @@ class RegName(BaseModel): # 1 Register may have many names (note duplicates are
     def __str__(self):
         return f"Register name: {self.name}"
 
+class SvdFile(BaseModel): # Manifest of analyzed SVD files, to re-analyze only new or changed files
+    path = TextField(unique=True) # <vendor>/<file name>, independent of where the corpus is checked out
+    sha256 = CharField()
+    mtime_ns = IntegerField() # With size, skips hashing files that weren't touched
+    size = IntegerField()
+    analyzer_version = IntegerField()
+    soc = ForeignKeyField(SoC, null=True) # None if cmsis-svd can't parse the file
+
+ANALYSIS_MODELS = [Vendor, SoC, Peripheral, PeripheralSoC, PeripheralName, Interrupt, Register, RegName, SvdFile]
+
+NAME_MATCH_DISTANCE = 0.25 # Max normalized Levenshtein distance between the names of duplicate peripherals
+
+@lru_cache(maxsize=1 << 16)
+def _name_distance(name_a, name_b):
+    # Callers order the pair, so (a, b) and (b, a) share a cache entry
+    if name_a == name_b:
+        return 0.0
+    return Levenshtein.distance(name_a, name_b) / max(len(name_a), len(name_b))
+
+def name_distances(name, candidates, bound=None):
+    """
+    Yields the normalized Levenshtein distance (edit distance / length of the longer name, as strsimpy's
+    NormalizedLevenshtein) from name to each candidate, in order, computed by python-Levenshtein and memoized per pair.
+    Missing (None) names compare as empty strings.
+    With bound, candidates whose length difference alone puts them further than bound aren't compared (math.inf)
+    """
+    name = name or ""
+    for candidate in candidates:
+        candidate = candidate or ""
+        if (bound is not None) and (abs(len(name) - len(candidate)) > (bound * max(len(name), len(candidate)))):
+            yield math.inf
+        else:
+            yield _name_distance(*((name, candidate) if (name <= candidate) else (candidate, name)))
+
+def names_match(new_name, existing_names):
+    """
+    Is new_name close enough (normalized Levenshtein distance <= 0.25) to at least one existing name?
+    Two missing names also match
+    """
+    return any((distance <= NAME_MATCH_DISTANCE)
+               for distance in name_distances(new_name, existing_names, NAME_MATCH_DISTANCE))
+
+def get_reg_offsets(peripheral):
+    # {offset: size} of an SvdPeripheral's registers, same as duplicate_peripherals compares
+    return {reg.address_offset: reg.size for reg in peripheral.registers}
+
+def get_interrupt_vals(peripheral):
+    return list(peripheral.interrupts)
+
+def get_fingerprint(reg_offsets, interrupt_c):
+    """
+    Structural fingerprint: register count, sorted (offset, size) tuple and interrupt count.
+    duplicate_peripherals can only match two peripherals with the same fingerprint
+    """
+    return (len(reg_offsets), tuple(sorted(reg_offsets.items())), interrupt_c)
+
+class CandidateIndex:
+    """
+    In-memory index of the peripherals in the DB, for finding duplicates of a new peripheral without querying
+    every existing one. Peripherals are bucketed by fingerprint (see get_fingerprint), only those in the new
+    peripheral's bucket get the interrupt and name checks, with names and interrupts cached here.
+    Finds the same matches, in the same (ID) order, as duplicate_peripherals over Peripheral.select()
+    """
+    def __init__(self):
+        self.buckets = {} # fingerprint -> [(Peripheral, [names], set(interrupt values))]
+        self.entries = {} # Peripheral ID -> (fingerprint, entry in its bucket)
+
+    @classmethod
+    def from_db(cls):
+        # A few bulk queries instead of several per peripheral
+        index = cls()
+        names, interrupts, reg_offsets = {}, {}, {}
+        for name, p_id in PeripheralName.select(PeripheralName.name, PeripheralName.peripheral) \
+                                        .order_by(PeripheralName.id).tuples():
+            names.setdefault(p_id, []).append(name)
+        for val, p_id in Interrupt.select(Interrupt.value, Interrupt.peripheral).order_by(Interrupt.id).tuples():
+            interrupts.setdefault(p_id, []).append(val)
+        for addr, size, p_id in Register.select(Register.addr, Register.size, Register.peripheral) \
+                                        .order_by(Register.id).tuples():
+            reg_offsets.setdefault(p_id, {})[addr] = size
+
+        for p in Peripheral.select().order_by(Peripheral.id):
+            index.add(p, names.get(p.id, []), interrupts.get(p.id, []), reg_offsets.get(p.id, {}))
+        return index
+
+    def add(self, p, names, interrupt_vals, reg_offsets):
+        entry = (p, list(names), set(interrupt_vals))
+        fingerprint = get_fingerprint(reg_offsets, len(interrupt_vals))
+        self.buckets.setdefault(fingerprint, []).append(entry)
+        self.entries[p.id] = (fingerprint, entry)
+
+    def remove(self, p_id):
+        fingerprint, entry = self.entries.pop(p_id)
+        self.buckets[fingerprint].remove(entry)
+
+    def add_name(self, p, name):
+        self.entries[p.id][1][1].append(name)
+
+    def get_names(self, p):
+        return self.entries[p.id][1][1]
+
+    def find_duplicates(self, peripheral):
+        # Existing Peripherals that duplicate_peripherals(peripheral, existing) would accept
+        interrupt_vals = get_interrupt_vals(peripheral)
+        bucket = self.buckets.get(get_fingerprint(get_reg_offsets(peripheral), len(interrupt_vals)), [])
+        return [p for p, names, old_interrupts in bucket
+                if all(val in old_interrupts for val in interrupt_vals) and names_match(peripheral.name, names)]
+
+class SvdDbWriter:
+    """
+    Buffers the rows created while analyzing an SVD file, flush() writes them with insert_many() in one transaction.
+    Row IDs are assigned here (next rowid per table, what SQLite would pick), so rows can reference unflushed rows.
+    All peripheral, name, interrupt, register and SoC relation rows must be created through this writer, it keeps
+    the CandidateIndex and the registers it has looked up in sync with the DB
+    """
+    BATCH_SIZE = 100 # Rows per INSERT, under SQLite's bound variable limit
+
+    def __init__(self):
+        self.candidate_index = CandidateIndex.from_db()
+        self.next_ids = {model: (model.select(fn.MAX(model.id)).scalar() or 0) + 1
+                         for model in [Peripheral, PeripheralName, PeripheralSoC, Interrupt, Register, RegName]}
+        self.rows = {model: [] for model in self.next_ids} # Creation order, same IDs as row-at-a-time create()
+        self.soc_rels = {} # (soc ID, peripheral ID) -> PeripheralSoC row, for unflushed SoCs
+        self.registers = {} # Peripheral ID -> [[register ID, addr, [names]]], see get_registers
+
+    def _add_row(self, model, **fields):
+        fields['id'] = self.next_ids[model]
+        self.next_ids[model] += 1
+        self.rows[model].append(fields)
+        return fields
+
+    def create_peripheral(self, peripheral, soc):
+        # New Peripheral with its name, SoC relation, interrupts and registers
+        sz = sum([x.size for x in peripheral.registers if x.size]) # May be none?
+        p = Peripheral(id=self._add_row(Peripheral, size=sz)['id'], size=sz)
+        self._add_row(PeripheralName, name=peripheral.name, peripheral=p.id)
+
+        # Add relation between Peripheral and SoCs
+        self.add_occurance(p, soc)
+
+        # Also create (new) interrupts
+        interrupt_vals = get_interrupt_vals(peripheral)
+        for val in interrupt_vals:
+            self._add_row(Interrupt, value=val, peripheral=p.id)
+
+        # Also create (new) registers
+        self.registers[p.id] = []
+        if peripheral.registers is not None:
+            for reg in peripheral.registers:
+                r_id = self._add_row(Register, addr=reg.address_offset, size=reg.size, peripheral=p.id)['id']
+                self._add_row(RegName, name=reg.name, register=r_id)
+                self.registers[p.id].append([r_id, reg.address_offset, [reg.name]])
+
+        self.candidate_index.add(p, [peripheral.name], interrupt_vals, get_reg_offsets(peripheral))
+        return p
+
+    def add_occurance(self, p, soc):
+        # Create (Peripheral, SoC) relation with occurances initialized to 1, or increment its occurances
+        rel = self.soc_rels.get((soc.id, p.id))
+        if rel is not None:
+            rel['occurances'] += 1
+        else:
+            self.soc_rels[(soc.id, p.id)] = self._add_row(PeripheralSoC, peripheral=p.id, soc=soc.id, occurances=1)
+
+    def add_peripheral_name(self, p, name):
+        # Add name to peripheral if it doesn't have it, returns True if added
+        if name in self.candidate_index.get_names(p):
+            return False
+        self._add_row(PeripheralName, name=name, peripheral=p.id)
+        self.candidate_index.add_name(p, name)
+        return True
+
+    def get_registers(self, p):
+        # [[register ID, addr, [names]]] of a peripheral in ID order, names lists are updated by add_reg_name
+        if p.id not in self.registers:
+            regs = [[r_id, addr, []] for r_id, addr in Register.select(Register.id, Register.addr) \
+                                        .where(Register.peripheral == p.id).order_by(Register.id).tuples()]
+            regs_by_id = {reg[0]: reg for reg in regs}
+            for name, r_id in RegName.select(RegName.name, RegName.register).join(Register) \
+                                     .where(Register.peripheral == p.id).order_by(RegName.id).tuples():
+                regs_by_id[r_id][2].append(name)
+            self.registers[p.id] = regs
+        return self.registers[p.id]
+
+    def add_reg_name(self, reg_id, reg_names, name):
+        self._add_row(RegName, name=name, register=reg_id)
+        reg_names.append(name)
+
+    def retract_soc(self, soc):
+        """
+        Delete a SoC and its PeripheralSoC relations (ex. its SVD file changed). Peripherals no other SoC has are
+        deleted with their names, interrupts, registers and register names. Names the SoC added to peripherals
+        other SoCs still have stay, rows don't record which SoC added them
+        """
+        assert(not any(self.rows.values())) # Between files
+        p_ids = [p_id for (p_id,) in PeripheralSoC.select(PeripheralSoC.peripheral) \
+                                                .where(PeripheralSoC.soc == soc).tuples()]
+        PeripheralSoC.delete().where(PeripheralSoC.soc == soc).execute()
+        SoC.delete_by_id(soc.id)
+
+        for batch in chunked(p_ids, self.BATCH_SIZE):
+            shared = {p_id for (p_id,) in PeripheralSoC.select(PeripheralSoC.peripheral) \
+                                                       .where(PeripheralSoC.peripheral.in_(batch)).tuples()}
+            orphans = [p_id for p_id in batch if p_id not in shared]
+            if not orphans:
+                continue
+
+            orphan_regs = Register.select(Register.id).where(Register.peripheral.in_(orphans))
+            RegName.delete().where(RegName.register.in_(orphan_regs)).execute()
+            for model in [Register, Interrupt, PeripheralName]:
+                model.delete().where(model.peripheral.in_(orphans)).execute()
+            Peripheral.delete().where(Peripheral.id.in_(orphans)).execute()
+
+            for p_id in orphans:
+                self.candidate_index.remove(p_id)
+                self.registers.pop(p_id, None)
+
+    def flush(self):
+        # Insert buffered rows, parent tables first
+        with db.atomic():
+            for model, rows in self.rows.items():
+                for batch in chunked(rows, self.BATCH_SIZE):
+                    model.insert_many(batch).execute()
+        self.rows = {model: [] for model in self.rows}
+        self.soc_rels.clear()
+
 def duplicate_peripherals(new, old):
     """
-    Determine if two peripherals could be the same by:
+    Determine if two peripherals (new is an svd_common.SvdPeripheral, old is in the DB) could be the same by:
         - Close enough names, AND
         - Interrupts are the same
         - Sizes are the same
@@ -93,33 +332,17 @@ def duplicate_peripherals(new, old):
 
     # First check to ensure new name is close enough to at least one existing name for this peripheral
     existing_names = [x.name for x in old.names.select()]
-    new_name = new.name
-    normalized_lev = NormalizedLevenshtein()
-    name_match = False
-    for existing_name in existing_names:
-        if new_name and existing_name: # Both not-none
-            if normalized_lev.distance(new_name, existing_name) <= 0.25:
-                name_match = True
-                break
-        elif not new_name and not existing_name: # Both none
-                name_match = True
-                break
-
-    if not name_match: # Names sufficiently different, bail
+    if not names_match(new.name, existing_names): # Names sufficiently different, bail
         return False
 
     # Check interrupts
     old_interrupt_c = old.interrupts.count()
-    if new.interrupts is None:
-        if old_interrupt_c != 0:
-            return False
-    else:
-        if len(new.interrupts) != old_interrupt_c:
-            return False
+    if len(new.interrupts) != old_interrupt_c:
+        return False
 
     if old_interrupt_c > 0:
         old_interrupts = [x.value for x in old.interrupts.select()]
-        for new_int in [x.value for x in new.interrupts]:
+        for new_int in new.interrupts:
             if new_int not in old_interrupts:
                 return False
 
@@ -164,46 +387,24 @@ def duplicate_peripherals(new, old):
 
     return True
 
-def analyze_peripheral(peripheral, soc):
+def analyze_peripheral(peripheral, soc, writer):
     # Determine if a new peripheral object should be created for this peripheral
-    # If so, create Registers and Peripheral
+    # If so, create Registers and Peripheral (buffered in writer, an SvdDbWriter, until its flush())
 
     # Key idea: if it's a duplicate of an existing peripheral, we just need to maybe add new
     #           RegNames and PeripheralNames. But if it's an entirely new Peripheral, we need
     #           to also create the Peripheral
 
     # Initially, this peripheral could be equivalent to anything in our DB - Filter down to valid matches
-    potential_peripherals = []
-    existing_peripherals = Peripheral.select()
-    for potential_duplicate in existing_peripherals:
-        if duplicate_peripherals(peripheral, potential_duplicate):
-            potential_peripherals.append(potential_duplicate)
+    potential_peripherals = writer.candidate_index.find_duplicates(peripheral)
 
     # No valid matches - it's a new peripheral
     if not len(potential_peripherals):
-        # Create Peripheral object
-        sz = sum([x.size for x in peripheral.registers if x.size]) # May be none?
-        p = Peripheral.create(SoC=soc, size=sz)
-        PeripheralName.create(name=peripheral.name, peripheral=p)
-
-        # Add relation between Peripheral and SoCs
-        PeripheralSoC.create(peripheral=p, soc=soc, occurances=1)
-
-        # Also create (new) interrupts
-        if peripheral.interrupts is not None:
-            for val in [x.value for x in peripheral.interrupts]:
-                i = Interrupt.create(value=val, peripheral=p)
-
-        # Also create (new) registers
-        if peripheral.registers is not None:
-            for reg in peripheral.registers:
-                r = Register.create(addr=reg.address_offset, size=reg.size, peripheral=p)
-                RegName.create(name=reg.name, register=r)
+        writer.create_peripheral(peripheral, soc)
 
     # Multiple valid matches - Need to select the best match
     elif len(potential_peripherals) > 1:
         # Find the peripheral name with the lowest normalized Leven. - Could also do per-register name?
-        normalized_lev = NormalizedLevenshtein()
         best_lev, best_p = (1, None)
 
         print("HAVE MULTIPLE POTENTIAL PERIPHS:")
@@ -211,15 +412,14 @@ def analyze_peripheral(peripheral, soc):
             print(p)
 
         for p in potential_peripherals: # For each existing potential, consider the closest name to what we have
-            existing_names = [x.name for x in p.names.select()]
-            for existing_name in existing_names:
-                this_delta = normalized_lev.distance(peripheral.name, existing_name)
+            # Names further than the best so far can't win, bound skips them
+            for this_delta in name_distances(peripheral.name, writer.candidate_index.get_names(p), best_lev):
                 if this_delta  < best_lev:
                     best_lev = this_delta
                     best_p = p
 
         assert(best_p is not None) # Must select the best
-        potential_peripherals = [p]
+        potential_peripherals = [best_p]
     
     if len(potential_peripherals): # Just have one- now make it happen
         assert(len(potential_peripherals) == 1) # Must have been filtered if there were many
@@ -228,62 +428,148 @@ def analyze_peripheral(peripheral, soc):
         p = potential_peripherals[0]
 
         # Update mapping to SoC - Either increment occurances or add new relation
-        periph_soc_mapping = PeripheralSoC.select().where(PeripheralSoC.soc == soc, PeripheralSoC.peripheral ==p)
-        if periph_soc_mapping.count() > 0:
-            # Exists already, update occurances
-            rel = periph_soc_mapping.get()
-            occ = rel.occurances
-            PeripheralSoC.update(occurances=(occ+1)).where(PeripheralSoC.peripheral==p & 
-                                        PeripheralSoC.soc == soc).execute()
-        else:
-            # New (Peripheral, SoC) pair. Create relationship with occurances initialized to 1
-            PeripheralSoC.create(peripheral=p, soc=soc, occurances=1)
+        writer.add_occurance(p, soc)
 
         # Add new name if necessary
-        (_, new_p) = PeripheralName.get_or_create(name=peripheral.name, peripheral=p)
-
-        if new_p: # If we see a new name, print the new name
+        if writer.add_peripheral_name(p, peripheral.name): # If we see a new name, print the new name
             print(f"New instance of ({p}): {peripheral.name}")
 
         # Also create new register names for each field in the peripheral, as necessary
-        for reg in p.registers.select():
-            existing_names = [x.name for x in reg.names.select()]
-            #print(existing_names, "at ", reg.addr)
+        for reg_id, reg_addr, existing_names in writer.get_registers(p):
             # Find name of new peripheral register at the offset
             for new_peripheral_reg in peripheral.registers:
-                if new_peripheral_reg.address_offset == reg.addr:
+                if new_peripheral_reg.address_offset == reg_addr:
                     if new_peripheral_reg.name not in existing_names: # New name at this address - Update RegName
-                        RegName.create(name=new_peripheral_reg.name, register=reg)
+                        writer.add_reg_name(reg_id, existing_names, new_peripheral_reg.name)
                     break # Only one peripheral at each address
 
-def analyze_files(svd_files):
+def get_soc(vendor_name, soc_name):
+    return SoC.select().join(Vendor).where(SoC.name==soc_name, Vendor.name==vendor_name).first()
+
+def get_unowned_soc(vendor_name, soc_name):
+    # SoC analyzed before the SvdFile manifest existed, None if none or analyzed from another file (ex. X.svd, X_SVD.svd)
+    soc = get_soc(vendor_name, soc_name)
+    if (soc is None) or SvdFile.select().where(SvdFile.soc == soc).exists():
+        return None
+    return soc
+
+def get_svd_file_key(f):
+    return "/".join(f.parts[-2:])
+
+def save_svd_file(svd_file, f, file_hash, stat, soc):
+    # Create or update f's manifest entry (soc None if unparsable or analyzed from another file)
+    if svd_file is None:
+        svd_file = SvdFile(path=get_svd_file_key(f))
+    svd_file.sha256 = file_hash
+    svd_file.mtime_ns = stat.st_mtime_ns
+    svd_file.size = stat.st_size
+    svd_file.analyzer_version = ANALYZER_VERSION
+    svd_file.soc = soc
+    svd_file.save()
+
+def reset_analysis():
+    # Drop and recreate every analysis table. Rows of another analyzer version can't be retracted file by file:
+    # names it added to shared peripherals stay, and re-analyzed files would match against its peripherals
+    with db.atomic():
+        db.drop_tables(ANALYSIS_MODELS)
+        db.create_tables(ANALYSIS_MODELS)
+
+def analyze_files(svd_files, max_workers=None):
+    # SVD files are parsed in parallel, or read from the parse cache shared with svd_periph_count.py (see
+    # svd_common.load_svd_files), this process is the single DB writer.
+    # Files are tracked in the SvdFile manifest: unchanged ones are skipped without parsing, changed ones have the old
+    # version's SoC retracted and are re-analyzed. Files removed from the corpus are left in the DB.
+    # A DB analyzed by another ANALYZER_VERSION is rebuilt from scratch, every file is re-analyzed
+    if SvdFile.select().where(SvdFile.analyzer_version != ANALYZER_VERSION).exists():
+        print(f"svd.db analyzed by another analyzer version, rebuilding it (version {ANALYZER_VERSION})")
+        reset_analysis()
+
+    writer = SvdDbWriter() # Index includes SoCs from previous runs
+
+    to_parse = []
+    manifest = {} # Path -> (SvdFile or None, hash, stat)
     for f in svd_files:
-        parser = SVDParser.for_xml_file(f)
-        device = parser.get_device()
-
-        # Get (and create if needed) vendor
-        vendor_name = f.parts[-2]
-        (vendor, is_new_vendor) = Vendor.get_or_create(name=vendor_name)
-
-        # Have we already analysed this SoC? if so skip it
-        soc_name = f.parts[-1].replace("_SVD.svd","").replace(".svd", "")
-        if is_new_vendor:
-            analyzed = False
+        svd_file = SvdFile.get_or_none(SvdFile.path == get_svd_file_key(f))
+        stat = f.stat()
+        if svd_file is not None: # Same analyzer version, see reset_analysis
+            if (svd_file.mtime_ns, svd_file.size) == (stat.st_mtime_ns, stat.st_size):
+                print("Already analyzed:", get_svd_file_key(f))
+                continue
+            file_hash = svd_common.get_file_hash(f)
+            if file_hash == svd_file.sha256: # Touched (ex. fresh checkout), not changed
+                svd_file.mtime_ns = stat.st_mtime_ns
+                svd_file.save()
+                print("Already analyzed:", get_svd_file_key(f))
+                continue
         else:
-            analyzed = SoC.select().where(SoC.name==soc_name, SoC.vendor==vendor).count() > 0
-        if analyzed:
-            print("Already analyzed:", soc_name)
+            file_hash = svd_common.get_file_hash(f)
+
+        if (svd_file is None) and get_soc(*svd_common.get_vendor_soc_name(f)) \
+                and (get_unowned_soc(*svd_common.get_vendor_soc_name(f)) is None):
+            print("Already analyzed:", svd_common.get_vendor_soc_name(f)[1]) # From another file with the same SoC name
+            save_svd_file(svd_file, f, file_hash, stat, None) # Not re-hashed next run
             continue
-        else:
-            print("Analyzing:", vendor_name, soc_name)
 
-        soc = SoC.create(name=soc_name, vendor=vendor)
-        for peripheral in device.peripherals:
-            analyze_peripheral(peripheral, soc)
+        manifest[f] = (svd_file, file_hash, stat)
+        to_parse.append(f)
+
+    file_hashes = [manifest[f][1] for f in to_parse]
+    for device in svd_common.load_svd_files(to_parse, max_workers, file_hashes):
+        svd_file, file_hash, stat = manifest[device.path]
+        with db.atomic(): # Retraction, SoC and all its rows, manifest entry, or nothing
+
+            # The previous version's SoC (or one from before the manifest)
+            if svd_file is not None:
+                old_soc = SoC.get_or_none(SoC.id == svd_file.soc_id) if svd_file.soc_id else None
+            else:
+                old_soc = get_unowned_soc(device.vendor, device.soc_name)
+
+            # Have we already analysed this SoC from another file (ex. X.svd and X_SVD.svd)? if so skip it, before
+            # retracting anything, but record the file so it isn't re-parsed every run
+            if device.peripherals is not None:
+                same_name_soc = get_soc(device.vendor, device.soc_name)
+                if (same_name_soc is not None) and (same_name_soc != old_soc):
+                    print("Already analyzed:", device.soc_name)
+                    save_svd_file(svd_file, device.path, file_hash, stat, None)
+                    continue
+
+            if old_soc is not None:
+                print("Retracting previous analysis:", device.vendor, old_soc.name)
+                writer.retract_soc(old_soc)
+
+            soc = None
+            if device.peripherals is None:
+                print(f"Error parsing SVD file {device.path} - skipping")
+            else:
+                # Get (and create if needed) vendor
+                vendor_name = device.vendor
+                (vendor, _) = Vendor.get_or_create(name=vendor_name)
+                soc_name = device.soc_name
+                print("Analyzing:", vendor_name, soc_name)
+
+                soc = SoC.create(name=soc_name, vendor=vendor)
+                for peripheral in device.peripherals:
+                    analyze_peripheral(peripheral, soc, writer)
+                writer.flush()
+
+            save_svd_file(svd_file, device.path, file_hash, stat, soc)
 
         #with open(cache_file, "wb") as f:
         #    pickle.dump(periph_count, f)
 
+def get_peripheral_vendors():
+    """
+    One aggregate query: (peripheral ID, comma-separated names of the vendors with a SoC that has it) per peripheral,
+    in ID order. Vendor names are None for a peripheral without SoCs
+    """
+    pairs = (PeripheralSoC.select(PeripheralSoC.peripheral.alias('p_id'), Vendor.name.alias('vendor_name'))
+                          .join(SoC).join(Vendor)
+                          .distinct())
+    return (Peripheral.select(Peripheral.id, fn.GROUP_CONCAT(pairs.c.vendor_name))
+                      .join(pairs, JOIN.LEFT_OUTER, on=(pairs.c.p_id == Peripheral.id))
+                      .group_by(Peripheral.id)
+                      .order_by(Peripheral.id))
+
 def present_results():
     # Use global DB to print results
     """
@@ -321,16 +607,14 @@ def present_results():
 
     # View by peripheral - Which are in multiple vendors?
     overlap_counts = {}
-    for p in Peripheral.select():
-        socs = p.SoCs.select()
-        vendors = set([ps.soc.vendor.name for ps in socs])
-        tv = tuple(vendors)
+    for p_id, vendor_names in get_peripheral_vendors().tuples():
+        tv = tuple(sorted(vendor_names.split(","))) if vendor_names else ()
         if tv not in overlap_counts.keys():
             overlap_counts[tv] = 0
         overlap_counts[tv] +=1
 
-        if len(vendors) > 2:
-            print(p.shortname(), "\t in ", " ".join(vendors))
+        if len(tv) > 2:
+            print(Peripheral.get_by_id(p_id).shortname(), "\t in ", " ".join(tv))
 
     for vendors in sorted(overlap_counts, key=lambda x: overlap_counts[x]):
         count = overlap_counts[vendors]
@@ -349,106 +633,214 @@ def present_results():
     221 peripherals in [Fujitsu Spansion]
     """
 
-def monte(vendor, reps=8, n=None):
+def load_incidence():
+    """
+    One-time export of the SoC -> peripheral incidence (PeripheralSoC rows) for the Monte Carlo simulations.
+    Returns (SoC vendor names, edge SoCs, edge peripherals) as NumPy arrays. SoCs are numbered 0..S-1 (ID order,
+    including SoCs without peripherals), each edge is one (SoC, peripheral ID) pair
+    """
+    soc_ids, soc_vendors = [], []
+    for soc_id, vendor_name in SoC.select(SoC.id, Vendor.name).join(Vendor).order_by(SoC.id).tuples():
+        soc_ids.append(soc_id)
+        soc_vendors.append(vendor_name)
+
+    edges = np.array(PeripheralSoC.select(PeripheralSoC.soc, PeripheralSoC.peripheral).tuples(), dtype=np.int64)
+    edges = edges.reshape(-1, 2)
+    edge_socs = np.searchsorted(np.array(soc_ids, dtype=np.int64), edges[:, 0])
+    return np.array(soc_vendors, dtype=object), edge_socs, edges[:, 1]
+
+def select_incidence(incidence, soc_mask):
+    """
+    Incidence of the SoCs in soc_mask (bool array), for simulate_unmodeled: (SoC count, edge SoCs, peripheral starts).
+    SoCs are renumbered 0..S-1, edges are sorted by peripheral, and peripheral_starts holds the index of each
+    peripheral's first edge
+    """
+    _, edge_socs, edge_periphs = incidence
+    soc_map = np.cumsum(soc_mask) - 1
+    keep = soc_mask[edge_socs]
+    edge_socs, edge_periphs = soc_map[edge_socs[keep]], edge_periphs[keep]
+
+    order = np.argsort(edge_periphs, kind='stable')
+    edge_socs, edge_periphs = edge_socs[order], edge_periphs[order]
+    periph_starts = np.flatnonzero(np.r_[True, (edge_periphs[1:] != edge_periphs[:-1])]) if len(edge_periphs) else \
+                    np.zeros(0, dtype=np.int64)
+    return int(soc_mask.sum()), edge_socs, periph_starts
+
+def count_unmodeled(soc_incidence, perms, rounds):
+    """
+    Kernel of simulate_unmodeled, for given rehost orders: perms holds a permutation of the SoCs (round -> SoC) per
+    rep, only the first `rounds` are rehosted. Returns a (reps, rounds) array of unmodeled peripheral counts
+    """
+    soc_cnt, edge_socs, periph_starts = soc_incidence
+    reps = len(perms)
+    if not len(periph_starts):
+        return np.zeros((reps, rounds), dtype=np.int64)
+
+    soc_rounds = np.empty_like(perms)
+    np.put_along_axis(soc_rounds, perms, np.arange(soc_cnt), axis=1) # SoC -> round
+    first_rounds = np.minimum.reduceat(soc_rounds[:, edge_socs], periph_starts, axis=1) # Peripheral -> round
+    modeled = (first_rounds < rounds) # Else its SoCs weren't selected
+    flat_idx = (np.arange(reps)[:, None] * rounds + first_rounds)[modeled]
+    return np.bincount(flat_idx, minlength=(reps * rounds)).reshape(reps, rounds)
+
+def simulate_unmodeled(soc_incidence, reps, n=None, seed=None, chunk_reps=64):
+    """
+    Monte Carlo simulation of modeling peripherals: each rep rehosts n of the SoCs (all if n==None) in random order and
+    counts the peripherals not modeled in an earlier round. Vectorized over reps: a peripheral is modeled in the
+    earliest round of any SoC that has it.
+    Returns a (reps, rounds) array of unmodeled peripheral counts, with numpy's seeded permutation sampling
+    """
+    soc_cnt = soc_incidence[0]
+    rounds = soc_cnt if (n is None) else min(n, soc_cnt)
+    rng = np.random.default_rng(seed)
+    counts = np.zeros((reps, rounds), dtype=np.int64)
+
+    for chunk_start in range(0, reps, chunk_reps): # Bounds the (reps, edges) intermediate
+        chunk = min(chunk_reps, (reps - chunk_start))
+        perms = rng.permuted(np.tile(np.arange(soc_cnt), (chunk, 1)), axis=1) # Round -> SoC
+        counts[chunk_start:(chunk_start + chunk)] = count_unmodeled(soc_incidence, perms, rounds)
+
+    return counts
+
+def write_monte_csv(file_name, counts):
+    # Need to write output file as follows: with idx at the start of each line, then the mean and stdev over reps
+    # 0, [mean[0]], [stdev[0]]
+    # 1, [mean[1]], [stdev[1]]
+    with open(file_name, "w") as f:
+        f.write("idx, mean, stdev\n")
+        for k, v in enumerate(counts.T):
+            mean = int(v.sum()) / len(v) # Same (exact) mean as statistics.mean
+            stdev = float(np.std(v, ddof=1)) if (len(v) > 1) else 0.0 # Undefined for a single rep
+            f.write(f"{k}, {round(mean)}, {round(stdev)}\n")
+
+def monte(vendor, reps=8, n=None, seed=None, incidence=None):
     # Run a monte carlo simulation of modeling peripherals from `vendor`
     # Select `n` SoCs (if n==None, select half), repeat `reps` times
+    # incidence (from load_incidence) avoids re-exporting it for every call
 
     # Populate data
-    v = Vendor.select().where(Vendor.name==vendor).get()
+    if incidence is None:
+        incidence = load_incidence()
+    soc_incidence = select_incidence(incidence, (incidence[0] == vendor))
+    assert(soc_incidence[0] > 0), f"No SoCs for vendor {vendor}"
     if n is None:
-        n = int(v.SoCs.select().count()/2)
-
-    sims = {} # round -> [list of P_u values we had at that round]
-    for rep_idx in range(reps): # This will run once for each time we repeat (rep)
-        socs = v.SoCs.select().order_by(fn.Random()).limit(n)
-        modeled = {} # PeriphName: RoundModeled
-        for round_idx, s in enumerate(socs): # This will run N times
-            if round_idx not in sims:
-                sims[round_idx] =[]
-            unmod_round_ctr = 0
-            already_mod_round_ctr = 0
-            for p_s in s.peripherals:
-                p = p_s.peripheral
-                if p not in modeled:
-                    modeled[p] = round_idx
-                    unmod_round_ctr+=1
-                else:
-                    already_mod_round_ctr+=1
-            sims[round_idx].append(unmod_round_ctr) # Store how many peripherals we just had to model
-
-            #print(f"\tAt end of round {round_idx}, have {len(modeled)} peripherals modeled.")
-            #print(f"\tThis round modeled {unmod_round_ctr} new peripherals and used {already_mod_round_ctr} already modeled")
-        #print(f"Iteration {rep_idx}: modeling peripherals for {n} systems requires building {len(modeled)} models")
-
-    # Need to write output file as follows: with idx at the start of each line, then the results from each simulation
-    # 0 [res1[0]] [res2[0]]...
-    # 1 [res1[1]] [res2[1] ...
-    #with open(f"svd_unimp_per_rehost_{vendor}.dat", "w") as f: # From monte_carlo_sim.py's write_dict_of_list_data_file
-    #    for k, v in sims.items():
-    #        f.write(str(k) + ' ' + ' '.join(str(e) for e in v) + "\n")
-
-    with open(f"svd_unimp_per_rehost_{vendor}.csv", "w") as f:
-        f.write("idx, mean, stdev\n")
-        for k, v in sims.items():
-            f.write(f"{k}, {round(statistics.mean(v))}, {round(statistics.stdev(v))}\n")
+        n = int(soc_incidence[0]/2)
+
+    sims = simulate_unmodeled(soc_incidence, reps, n, seed)
+    write_monte_csv(f"svd_unimp_per_rehost_{vendor}.csv", sims)
 
-def monte_all(reps=8, n=None):
+def monte_all(reps=8, n=None, seed=None, incidence=None):
     # Run a monte carlo simulation of modeling peripherals from all vendors
-    # Select `n` SoCs (if n==None, select half), repeat `reps` times
+    # Select `n` SoCs (if n==None, select all), repeat `reps` times
 
     # Populate data
-    sims = {} # round -> [list of P_u values we had at that round]
-    for rep_idx in range(reps): # This will run once for each time we repeat (rep)
-        socs = SoC.select().order_by(fn.Random()).limit(n)
-        modeled = {} # PeriphName: RoundModeled
-        for round_idx, s in enumerate(socs): # This will run N times
-            if round_idx not in sims:
-                sims[round_idx] =[]
-            unmod_round_ctr = 0
-            already_mod_round_ctr = 0
-            for p_s in s.peripherals:
-                p = p_s.peripheral
-                if p not in modeled:
-                    modeled[p] = round_idx
-                    unmod_round_ctr+=1
-                else:
-                    already_mod_round_ctr+=1
-            sims[round_idx].append(unmod_round_ctr) # Store how many peripherals we just had to model
-
-            #print(f"\tAt end of round {round_idx}, have {len(modeled)} peripherals modeled.")
-            #print(f"\tThis round modeled {unmod_round_ctr} new peripherals and used {already_mod_round_ctr} already modeled")
-        #print(f"Iteration {rep_idx}: modeling peripherals for {n} systems requires building {len(modeled)} models")
-
-    # Need to write output file as follows: with idx at the start of each line, then the results from each simulation
-    # 0 [res1[0]] [res2[0]]...
-    # 1 [res1[1]] [res2[1] ...
-    #with open(f"svd_unimp_per_rehost_{vendor}.dat", "w") as f: # From monte_carlo_sim.py's write_dict_of_list_data_file
-    #    for k, v in sims.items():
-    #        f.write(str(k) + ' ' + ' '.join(str(e) for e in v) + "\n")
-
-    with open(f"svd_unimp_per_rehost_all.csv", "w") as f:
-        f.write("idx, mean, stdev\n")
-        for k, v in sims.items():
-            f.write(f"{k}, {round(statistics.mean(v))}, {round(statistics.stdev(v))}\n")
+    if incidence is None:
+        incidence = load_incidence()
+    soc_incidence = select_incidence(incidence, np.ones(len(incidence[0]), dtype=bool))
+
+    sims = simulate_unmodeled(soc_incidence, reps, n, seed)
+    write_monte_csv(f"svd_unimp_per_rehost_all.csv", sims)
+
+# Per-vendor simulations in pool workers: incidence arrays shared (not copied) through shared memory
+_worker_shared = None # ([SharedMemory], edge SoCs, edge peripherals, SoC vendor codes)
+_worker_soc_incidence = {} # Vendor code -> select_incidence() result, per worker
+
+def init_monte_worker(shm_specs):
+    global _worker_shared
+    blocks = [shared_memory.SharedMemory(name=name) for name, _, _ in shm_specs]
+    arrays = [np.ndarray(shape, dtype=dtype, buffer=block.buf) for block, (_, shape, dtype) in zip(blocks, shm_specs)]
+    _worker_shared = (blocks, *arrays)
+
+def worker_monte_chunk(vendor_code, rep_start, reps, n, seed_seq):
+    # Returns (vendor code, rep_start, (reps, rounds) counts, CPU seconds)
+    start = time.process_time()
+    _, edge_socs, edge_periphs, soc_vendor_codes = _worker_shared
+    if vendor_code not in _worker_soc_incidence:
+        _worker_soc_incidence[vendor_code] = select_incidence((None, edge_socs, edge_periphs),
+                                                              (soc_vendor_codes == vendor_code))
+    counts = simulate_unmodeled(_worker_soc_incidence[vendor_code], reps, n, seed_seq)
+    return vendor_code, rep_start, counts, (time.process_time() - start)
+
+def monte_vendors(reps=1000, n=None, min_socs=10, seed=None, max_workers=None, chunk_reps=100, incidence=None):
+    # Run monte carlo simulations for every vendor with at least `min_socs` SoCs in one shot
+    # Select `n` SoCs per vendor (if n==None, select half), repeat `reps` times
+    # Vendors and rep chunks are spread over a process pool (max_workers == None for one per CPU). Writes a CSV per
+    # vendor (same as monte()) and svd_unimp_per_rehost_summary.csv, returns {vendor: CPU seconds}
+
+    # Populate data, once
+    if incidence is None:
+        incidence = load_incidence()
+    soc_vendors, edge_socs, edge_periphs = incidence
+    vendor_names, soc_vendor_codes = np.unique(soc_vendors.astype(str), return_inverse=True)
+    soc_cnts = np.bincount(soc_vendor_codes, minlength=len(vendor_names))
+    vendor_codes = [code for code in range(len(vendor_names)) if soc_cnts[code] >= min_socs]
+
+    # Each chunk gets its own seed, results don't depend on scheduling
+    tasks = []
+    for vendor_code, vendor_seed in zip(vendor_codes, np.random.SeedSequence(seed).spawn(len(vendor_codes))):
+        vendor_n = int(soc_cnts[vendor_code]/2) if (n is None) else n
+        chunk_starts = range(0, reps, chunk_reps)
+        for rep_start, chunk_seed in zip(chunk_starts, vendor_seed.spawn(len(chunk_starts))):
+            tasks.append((vendor_code, rep_start, min(chunk_reps, (reps - rep_start)), vendor_n, chunk_seed))
+
+    shared = [np.ascontiguousarray(x, dtype=np.int64) for x in (edge_socs, edge_periphs, soc_vendor_codes)]
+    blocks = [shared_memory.SharedMemory(create=True, size=max(1, x.nbytes)) for x in shared]
+    try:
+        for block, x in zip(blocks, shared):
+            np.ndarray(x.shape, dtype=x.dtype, buffer=block.buf)[:] = x
+        shm_specs = [(block.name, x.shape, x.dtype.str) for block, x in zip(blocks, shared)]
+
+        sims = {} # Vendor code -> [(rep_start, counts)]
+        cpu_times = {str(vendor_names[code]): 0.0 for code in vendor_codes}
+        with Pool(max_workers, initializer=init_monte_worker, initargs=(shm_specs,)) as pool:
+            for vendor_code, rep_start, counts, cpu_time in pool.starmap(worker_monte_chunk, tasks):
+                sims.setdefault(vendor_code, []).append((rep_start, counts))
+                cpu_times[str(vendor_names[vendor_code])] += cpu_time
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+    with open("svd_unimp_per_rehost_summary.csv", "w") as f:
+        f.write("vendor, nsoc, unique_p, rounds, mean_modeled, stdev_modeled, cpu_s\n")
+        for vendor_code in vendor_codes:
+            vendor = str(vendor_names[vendor_code])
+            counts = np.concatenate([counts for _, counts in sorted(sims[vendor_code], key=lambda x: x[0])])
+            write_monte_csv(f"svd_unimp_per_rehost_{vendor}.csv", counts)
+
+            unique_p = len(np.unique(edge_periphs[soc_vendor_codes[edge_socs] == vendor_code]))
+            modeled = counts.sum(axis=1) # Peripherals modeled after all rounds, per rep
+            f.write(f"{vendor}, {soc_cnts[vendor_code]}, {unique_p}, {counts.shape[1]}, {modeled.mean():.1f}, "
+                    f"{np.std(modeled, ddof=1) if (reps > 1) else 0.0:.1f}, {cpu_times[vendor]:.3f}\n")
+            print(f"{vendor}: {soc_cnts[vendor_code]} SoCs, {unique_p} unique peripherals, "
+                  f"{cpu_times[vendor]:.3f}s CPU for {reps} reps")
+
+    return cpu_times
 
 def count_unique_p():
-    periphs = set()
-    for vend in Vendor.select():
-        if vend.SoCs.select().count() <10:
+    # SoCs per vendor, then distinct peripherals of the vendors with n>=10, one aggregate query each
+    vendor_ids = []
+    soc_counts = (Vendor.select(Vendor, fn.COUNT(SoC.id).alias('nsoc'))
+                        .join(SoC, JOIN.LEFT_OUTER)
+                        .group_by(Vendor.id)
+                        .order_by(Vendor.id))
+    for vend in soc_counts:
+        if vend.nsoc <10:
             print(f"Skipping {vend}")
             continue
+        vendor_ids.append(vend.id)
 
-        for s in vend.SoCs.select():
-            for p_s in s.peripherals.select():
-                periphs.add(p_s.peripheral)
-    print(f"Across vendors with n>=10, have a total of {len(periphs)} distinct periphs")
+    n_periphs = (PeripheralSoC.select(fn.COUNT(PeripheralSoC.peripheral.distinct()))
+                              .join(SoC)
+                              .where(SoC.vendor.in_(vendor_ids))
+                              .scalar())
+    print(f"Across vendors with n>=10, have a total of {n_periphs} distinct periphs")
 
 
 if __name__ == "__main__":
     db.connect()
 
-    db.create_tables([PeripheralName, Peripheral, PeripheralSoC])
-    db.create_tables([Vendor, SoC,  RegName, Register, Interrupt])
+    db.create_tables(ANALYSIS_MODELS)
 
     debug = False
     if debug:
@@ -466,5 +858,6 @@ if __name__ == "__main__":
         monte("STMicro", 1000) # Has 1077 unique periphs
     if not debug:
         monte_all(1000, 100)
+        monte_vendors(1000) # Per-vendor curves, vendors with n>=10
 
     db.close()
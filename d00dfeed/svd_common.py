@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+
+import os
+import re
+import pickle
+import hashlib
+import tempfile
+from collections import namedtuple
+from multiprocessing import Pool
+from xml.etree import ElementTree as ET
+from cmsis_svd.parser import SVDParser
+
+SVD_CACHE_DIR = "svd_cache" # Parsed peripheral summaries, shared by the SVD analyses run from this directory
+READER_VERSION = 1 # Bump when the SvdDevice fields or their parsing change, invalidates the cache
+
+# Lightweight, picklable descriptors of the SVD fields the analyses use (same attribute names as cmsis_svd's model)
+SvdRegister = namedtuple("SvdRegister", ["address_offset", "size", "name"])
+SvdPeripheral = namedtuple("SvdPeripheral", ["name", "registers", "interrupts"]) # interrupts: tuple of values
+SvdDevice = namedtuple("SvdDevice", ["path", "vendor", "soc_name", "peripherals"]) # peripherals None if unparsable
+
+def get_vendor_soc_name(svd_file):
+    # (vendor, SoC name) from an SVD path in the cmsis-svd corpus (data/<vendor>/<SoC>.svd)
+    return svd_file.parts[-2], svd_file.parts[-1].replace("_SVD.svd","").replace(".svd", "")
+
+def get_file_hash(svd_file):
+    # SHA-256 hex digest of a file's contents
+    file_hash = hashlib.sha256()
+    with open(svd_file, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+def parse_svd_file(svd_file):
+    # Full cmsis_svd parse of one file, reduced to descriptors
+    device = SVDParser.for_xml_file(svd_file).get_device()
+    peripherals = []
+    for peripheral in device.peripherals:
+        registers = tuple(SvdRegister(reg.address_offset, reg.size, reg.name) for reg in peripheral.registers)
+        interrupts = () if peripheral.interrupts is None else tuple(x.value for x in peripheral.interrupts)
+        peripherals.append(SvdPeripheral(peripheral.name, registers, interrupts))
+
+    vendor, soc_name = get_vendor_soc_name(svd_file)
+    return SvdDevice(svd_file, vendor, soc_name, peripherals)
+
+# Streaming reader --------------------------------------------------------------------------------------------------------
+
+# Fields of one <peripheral>/<register> element, kept until derivedFrom can be resolved (may reference a later element)
+_RawPeripheral = namedtuple("_RawPeripheral", ["name", "derived_from", "size", "interrupts", "registers", "arrays"])
+_RawRegister = namedtuple("_RawRegister", ["name", "derived_from", "address_offset", "size", "dim_indices",
+                                           "dim_increment", "peripheral_idx"]) # peripheral_idx None for array elements
+
+def _get_text(node, tag):
+    child = node.find(tag)
+    return None if child is None else child.text
+
+def _get_int(node, tag):
+    # Same conversion as cmsis_svd: hex, binary ('#', 'x' bits as 0), true/false, decimal, None if invalid
+    text = _get_text(node, tag)
+    if text is None:
+        return None
+    text = text.strip().lower()
+    try:
+        if text.startswith('0x'):
+            return int(text[2:], 16)
+        elif text.startswith('#'):
+            text = text.replace('x', '0')[1:]
+            return int(text, 2) if all(x in '01' for x in text) else int(text)
+        elif text.startswith('true'):
+            return 1
+        elif text.startswith('false'):
+            return 0
+        else:
+            return int(text)
+    except ValueError:
+        return None
+
+def _check_int(value):
+    # cmsis_svd rejects files with these (interrupt values, device addressUnitBits/width) missing or invalid
+    if not isinstance(value, int):
+        raise TypeError(f"Value {value!r} is not an integer")
+    return value
+
+def _read_register(register_node, peripheral_idx):
+    dim = _get_int(register_node, 'dim')
+    dim_indices = None
+    if dim is not None:
+        dim_index_text = _get_text(register_node, 'dimIndex')
+        if dim_index_text is None:
+            dim_indices = range(0, dim) # some files omit dimIndex
+        elif ',' in dim_index_text:
+            dim_indices = dim_index_text.split(',')
+        elif '-' in dim_index_text: # <dimIndex>0-3</dimIndex>, inclusive range
+            m = re.search(r'([0-9]+)-([0-9]+)', dim_index_text)
+            dim_indices = range(int(m.group(1)), int(m.group(2)) + 1)
+        else:
+            raise ValueError("Unexpected dim_index_text: %r" % dim_index_text)
+        dim_indices = [dim_indices[i] for i in range(dim)]
+
+    return _RawRegister(_get_text(register_node, 'name'), _get_text(register_node, 'derivedFrom'),
+                        _get_int(register_node, 'addressOffset'), _get_int(register_node, 'size'), dim_indices,
+                        _get_int(register_node, 'dimIncrement'), peripheral_idx)
+
+def _read_peripheral(peripheral_node, peripheral_idx):
+    interrupts = [_check_int(_get_int(x, 'value')) for x in peripheral_node.findall('./interrupt')]
+    registers, arrays = None, None
+    if peripheral_node.find('registers') is not None:
+        registers, arrays = [], []
+        for register_node in peripheral_node.findall('./registers/register'):
+            reg = _read_register(register_node, peripheral_idx)
+            (registers if (reg.dim_indices is None) else arrays).append(reg)
+
+    return _RawPeripheral(_get_text(peripheral_node, 'name'), peripheral_node.get('derivedFrom'),
+                          _get_int(peripheral_node, 'size'), (interrupts or None), registers, arrays)
+
+def _resolve_peripherals(raw_peripherals, device_size):
+    """
+    Apply cmsis_svd's (0.4) lookup rules to the raw elements, yielding an SvdPeripheral each:
+    - A peripheral's derivedFrom is the first peripheral with that name. Without their own elements, it inherits the
+      registers (including expanded arrays), register arrays (expanded again) and interrupts of that peripheral
+    - A register's size is its own, else that of its derivedFrom register (KeyError if missing), else the size of the
+      peripheral it was defined in (or its derivedFrom peripheral), else the device's.
+      Register array elements only have their own size
+    """
+    idx_by_name = {}
+    for idx, raw in enumerate(raw_peripherals):
+        idx_by_name.setdefault(raw.name, idx)
+
+    def get_base(idx, seen):
+        derived_from = raw_peripherals[idx].derived_from
+        base_idx = None if (derived_from is None) else idx_by_name.get(derived_from)
+        if (base_idx is not None) and (base_idx in seen):
+            raise KeyError(f"derivedFrom cycle at peripheral {raw_peripherals[idx].name}")
+        return base_idx
+
+    def get_attr(idx, attr, seen=()): # Own value, else derivedFrom peripheral's
+        value = getattr(raw_peripherals[idx], attr)
+        base_idx = get_base(idx, seen)
+        if (value is None) and (base_idx is not None):
+            return get_attr(base_idx, attr, seen + (idx,))
+        return value
+
+    def expand_arrays(arrays):
+        return [_RawRegister((arr.name % dim_idx), arr.derived_from, (arr.address_offset + (arr.dim_increment * i)),
+                             arr.size, None, None, None) for arr in arrays for i, dim_idx in enumerate(arr.dim_indices)]
+
+    def get_registers(idx, seen=()):
+        registers = raw_peripherals[idx].registers
+        base_idx = get_base(idx, seen)
+        if registers is None:
+            registers = [] if (base_idx is None) else get_registers(base_idx, seen + (idx,))
+        return registers + expand_arrays(get_attr(idx, 'arrays') or [])
+
+    def get_reg_size(reg, seen=()):
+        if reg.derived_from is not None:
+            if reg.peripheral_idx is None:
+                raise KeyError(f"Unable to find derived_from: {reg.derived_from!r}") # No parent to search
+            derived = [x for x in get_registers(reg.peripheral_idx) if (x.name == reg.derived_from)]
+            if (not derived) or (reg in seen):
+                raise KeyError(f"Unable to find derived_from: {reg.derived_from!r}")
+        if reg.size is not None:
+            return reg.size
+        if reg.derived_from is not None:
+            return get_reg_size(derived[0], seen + (reg,))
+        if reg.peripheral_idx is None:
+            return None
+        size = get_attr(reg.peripheral_idx, 'size')
+        return device_size if (size is None) else size
+
+    for idx, raw in enumerate(raw_peripherals):
+        registers = tuple(SvdRegister(reg.address_offset, get_reg_size(reg), reg.name) for reg in get_registers(idx))
+        yield SvdPeripheral(raw.name, registers, tuple(get_attr(idx, 'interrupts') or ()))
+
+def read_svd_file(svd_file):
+    """
+    Streaming alternative to parse_svd_file, same SvdDevice. Reads only the fields the descriptors hold with
+    iterparse, each <peripheral> element is dropped from the tree once read, so memory stays bounded by the
+    largest peripheral rather than the file. derivedFrom is resolved after the whole file is read
+    """
+    raw_peripherals = []
+    stack = []
+    for event, elem in ET.iterparse(svd_file, events=("start", "end")):
+        if event == "start":
+            stack.append(elem)
+            continue
+
+        stack.pop()
+        if elem.tag == 'peripheral':
+            raw_peripherals.append(_read_peripheral(elem, len(raw_peripherals)))
+            if stack:
+                stack[-1].remove(elem)
+    root = elem
+
+    _check_int(_get_int(root, 'addressUnitBits'))
+    _check_int(_get_int(root, 'width'))
+    vendor, soc_name = get_vendor_soc_name(svd_file)
+    return SvdDevice(svd_file, vendor, soc_name, list(_resolve_peripherals(raw_peripherals, _get_int(root, 'size'))))
+
+# Parse stage -------------------------------------------------------------------------------------------------------------
+
+def worker_parse_svd_file(svd_file):
+    try:
+        return read_svd_file(svd_file)
+    except (TypeError, KeyError):
+        # cmsis-svd can't parse all the files in its corpus
+        return SvdDevice(svd_file, *get_vendor_soc_name(svd_file), None)
+
+def parse_svd_files(svd_files, max_workers=None):
+    """
+    Parse SVD files in a pool of worker processes (max_workers == None for one per CPU).
+    Yields an SvdDevice per file, in input order, so the caller (ex. the single DB writer) sees a deterministic
+    sequence while the CPU-heavy XML parsing of later files continues in the background
+    """
+    with Pool(max_workers) as pool:
+        yield from pool.imap(worker_parse_svd_file, svd_files)
+
+# Parse cache ------------------------------------------------------------------------------------------------------------
+
+def get_cache_path(file_hash, cache_dir=SVD_CACHE_DIR):
+    # Content-addressed: same contents, same entry, whatever the file's path
+    return os.path.join(cache_dir, f"v{READER_VERSION}", file_hash[:2], f"{file_hash}.pickle")
+
+def load_cached_peripherals(file_hash, cache_dir=SVD_CACHE_DIR):
+    # (hit, peripherals), peripherals None for a cached parse failure
+    try:
+        with open(get_cache_path(file_hash, cache_dir), "rb") as f:
+            return True, pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return False, None
+
+def get_new_file_mode():
+    # What open() would create under the current umask
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+def store_cached_peripherals(file_hash, peripherals, cache_dir=SVD_CACHE_DIR):
+    # Written to a temporary file and renamed, so concurrent readers never see a partial entry
+    cache_path = get_cache_path(file_hash, cache_dir)
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(peripherals, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.chmod(tmp_path, get_new_file_mode()) # mkstemp() creates 0600, cache is shared like the DB
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+def load_svd_files(svd_files, max_workers=None, file_hashes=None, cache_dir=SVD_CACHE_DIR):
+    """
+    parse_svd_files through the parse cache: yields an SvdDevice per file, in input order.
+    Files are looked up by content hash (file_hashes, same order as svd_files, if the caller already has them),
+    only the misses are parsed, in parallel, and added to the cache. Parse failures are cached too.
+    Cached entries are loaded as they're yielded, not all up front
+    """
+    svd_files = list(svd_files)
+    if file_hashes is None:
+        file_hashes = [get_file_hash(f) for f in svd_files]
+
+    is_cached = [os.path.isfile(get_cache_path(file_hash, cache_dir)) for file_hash in file_hashes]
+    misses = parse_svd_files([f for f, hit in zip(svd_files, is_cached) if not hit], max_workers) # Pool on first miss
+    try:
+        for svd_file, file_hash, was_cached in zip(svd_files, file_hashes, is_cached):
+            if was_cached:
+                hit, peripherals = load_cached_peripherals(file_hash, cache_dir)
+                if hit:
+                    yield SvdDevice(svd_file, *get_vendor_soc_name(svd_file), peripherals)
+                    continue
+                device = worker_parse_svd_file(svd_file) # Entry unreadable since the lookup, parse it here
+            else:
+                device = next(misses)
+
+            store_cached_peripherals(file_hash, device.peripherals, cache_dir)
+            yield device
+    finally:
+        misses.close()
@@ -1,38 +1,27 @@
 #!/usr/bin/env python3
 
-import os
-import pickle
 import statistics
-from cmsis_svd.parser import SVDParser
 from pathlib import Path
+import svd_common
 
 # For each SVD file, examine each peripheral
 # Determine if a peripheral was already seen
 
-cache_file = "periphc_by_family.pickle"
-if os.path.isfile(cache_file):
-    with open(cache_file, "rb") as f:
-        periph_count = pickle.load(f)
-else:
-    periph_count = {}
-    svd_files = Path("../cmsis-svd/data/").glob("**/*.svd")
-    for f in svd_files:
-        vendor = f.parts[-2]
-        parser = SVDParser.for_xml_file(f)
-        try:
-            device = parser.get_device()
-        except (TypeError, KeyError):
-            # cmsis-svd can't parse all the files in its corpus
-            print(f"Error parsing SVD file {f} - skipping")
-            continue
-
-        if vendor not in periph_count:
-            periph_count[vendor] = []
+# Parsed peripherals are cached per SVD file contents (see svd_common.load_svd_files), shared with svd_analysis.py:
+# only new or changed files are parsed, in parallel
+periph_count = {}
+svd_files = Path("../cmsis-svd/data/").glob("**/*.svd")
+for device in svd_common.load_svd_files(svd_files):
+    vendor = device.vendor
+    if device.peripherals is None:
+        # cmsis-svd can't parse all the files in its corpus
+        print(f"Error parsing SVD file {device.path} - skipping")
+        continue
 
-        periph_count[vendor].append(len(device.peripherals)) # TODO: only count distinct peripherals within that family
+    if vendor not in periph_count:
+        periph_count[vendor] = []
 
-    with open(cache_file, "wb") as f:
-        pickle.dump(periph_count, f)
+    periph_count[vendor].append(len(device.peripherals)) # TODO: only count distinct peripherals within that family
 
 total_p_count = sum([sum(x) for x in periph_count.values()]) # Across all families
 total_n_systems = sum([len(x) for x in periph_count.values()])
@@ -0,0 +1,74 @@
+#! /usr/bin/python3
+
+# External deps
+import os, sys, time, argparse, tracemalloc
+
+# Internal deps
+from test_common import *
+sys.path.append('../')
+import df
+
+########################################################################################################################
+# HELPERS
+########################################################################################################################
+
+def gen_removal_variants(variant_cnt, use_overlay):
+
+    '''
+    Seconds and peak traced bytes for variant_cnt single-device-removal variants of the test DTB, each serialized.
+    Overlays share one base Dtb, otherwise each variant is a fresh Dtb parse (previous approach).
+    '''
+
+    base_dtb = df.Dtb(to_dtb)
+    dev_paths = sorted(path for path in base_dtb.path_node_map if (path != "/"))
+
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    variants = []
+    for i in range(variant_cnt):
+        if use_overlay:
+            variant = df.DtbVariant(base_dtb)
+        else:
+            variant = df.Dtb(to_dtb)
+        variant.remove_dev(dev_paths[i % len(dev_paths)])
+        variant.get_dtb_chunks()
+        variants.append(variant) # Campaigns keep variants around (ex. to mutate further)
+
+    total_time = (time.perf_counter() - start)
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return total_time, peak_bytes
+
+########################################################################################################################
+# DRIVER
+########################################################################################################################
+
+if __name__ == "__main__":
+
+    arg_parser = argparse.ArgumentParser(description="Benchmark single-device-removal DTB variants, overlay vs. fresh parse")
+    arg_parser.add_argument(
+            '--variants',
+            type=int,
+            default=10000,
+            help="Variants to generate (Default == 10000)")
+    arg_parser.add_argument(
+            '--parse-variants',
+            type=int,
+            default=500,
+            help="Variants to generate by fresh parse, extrapolated to --variants (Default == 500)")
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.INFO) # Per-edit logging would dominate
+
+    overlay_time, overlay_bytes = gen_removal_variants(args.variants, True)
+    parse_time, parse_bytes = gen_removal_variants(args.parse_variants, False)
+    scale = (args.variants / args.parse_variants)
+
+    print("\n{} single-device-removal variants of {}:".format(args.variants, os.path.basename(to_dtb)))
+    print("overlay (DtbVariant): {:.3f}s total, {:.1f} us/variant, peak {:.1f} MiB".format(
+        overlay_time, (1e6 * overlay_time / args.variants), (overlay_bytes / (1 << 20))))
+    print("fresh parse (Dtb): ~{:.3f}s total, {:.1f} us/variant, peak ~{:.1f} MiB (from {} variants)".format(
+        (parse_time * scale), (1e6 * parse_time / args.parse_variants), (parse_bytes * scale / (1 << 20)), args.parse_variants))
+    print("speedup: {:.1f}x".format((parse_time * scale) / overlay_time))
@@ -0,0 +1,80 @@
+#! /usr/bin/python3
+
+# External deps
+import os, sys, re, time, argparse, subprocess
+
+# Internal deps
+from test_common import *
+
+########################################################################################################################
+# GLOBALS
+########################################################################################################################
+
+SRC_DIR = os.path.abspath("..")
+IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+# Cold-start scenarios: (name, argv after "python3 -X importtime", working dir)
+SCENARIOS = [
+    ("df.py --list-all", [os.path.join(SRC_DIR, "df.py"), "--list-all", os.path.abspath(to_dtb)], SRC_DIR),
+
+    # Same imports a spawned df_analyze.py worker process does before running its first task
+    ("df_analyze.py worker", ["-c", "import df_analyze"], SRC_DIR),
+]
+
+########################################################################################################################
+# HELPERS
+########################################################################################################################
+
+def run_importtime(argv, cwd):
+
+    '''
+    Run a fresh interpreter with "-X importtime".
+    Returns (wall seconds, total import us, {module: cumulative us}) for the first two levels of the import tree.
+    '''
+
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, "-X", "importtime"] + argv, cwd=cwd, capture_output=True, text=True)
+    wall_time = (time.perf_counter() - start)
+    assert (proc.returncode == 0), proc.stderr
+
+    total_us = 0
+    mod_cumulative = {}
+    for line in proc.stderr.splitlines():
+        match = IMPORTTIME_RE.match(line)
+        if match:
+            total_us += int(match.group(1))
+            if (len(match.group(3)) <= 3):
+                mod_cumulative[match.group(3)[1:] + match.group(4)] = int(match.group(2))
+
+    return wall_time, total_us, mod_cumulative
+
+########################################################################################################################
+# DRIVER
+########################################################################################################################
+
+if __name__ == "__main__":
+
+    arg_parser = argparse.ArgumentParser(description="Benchmark interpreter cold-start (import) time")
+    arg_parser.add_argument(
+            '--iter',
+            type=int,
+            default=10,
+            help="Runs per scenario, best is reported (Default == 10)")
+    arg_parser.add_argument(
+            '--top',
+            type=int,
+            default=8,
+            help="Slowest imports (first two levels) to list per scenario (Default == 8)")
+    args = arg_parser.parse_args()
+
+    for name, argv, cwd in SCENARIOS:
+
+        results = [run_importtime(argv, cwd) for _ in range(args.iter)]
+        best_wall = min(r[0] for r in results)
+        best_import = min(r[1] for r in results)
+        _, _, mod_cumulative = min(results, key=lambda r: r[1])
+
+        print("\n{}: best wall {:.1f} ms, best import {:.1f} ms ({} runs)".format(
+            name, (best_wall * 1000), (best_import / 1000), args.iter))
+        for mod, cumulative_us in sorted(mod_cumulative.items(), key=lambda i: i[1], reverse=True)[:args.top]:
+            print("\t{:>8.1f} ms  {}".format((cumulative_us / 1000), mod))
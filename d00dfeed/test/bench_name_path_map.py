@@ -0,0 +1,76 @@
+#! /usr/bin/python3
+
+# External deps
+import os, sys, time, argparse
+
+# Internal deps
+from test_common import *
+sys.path.append('../')
+import df
+from df_common import Containing_full_path_tuple
+
+########################################################################################################################
+# HELPERS
+########################################################################################################################
+
+def rebuild_name_path_map_walk(dtb):
+
+    '''
+    Previous full rebuild, for comparison: fdt walk() plus a get_node() lookup per path, after every edit
+    '''
+
+    name_path_map = dict()
+    for path, nodes, props in dtb.dtb_obj.walk():
+        name = dtb.dtb_obj.get_node(path).name
+        containing_path = path.replace("/" + name, '')
+        name_path_map[name] = Containing_full_path_tuple(containing_path, path)
+
+    return name_path_map
+
+def time_edits(cluster_cnt, edit_cnt, rebuild_func=None):
+
+    '''
+    Seconds for edit_cnt sequential edits on a DTB grown by cluster_cnt clusters, optionally calling rebuild_func after each
+    '''
+
+    dtb = df.Dtb(to_dtb)
+    add_clusters(dtb, cluster_cnt)
+
+    start = time.perf_counter()
+    if rebuild_func:
+        for i in range(edit_cnt):
+            do_sequential_edits(dtb, 1)
+            rebuild_func(dtb)
+    else:
+        do_sequential_edits(dtb, edit_cnt)
+
+    return (time.perf_counter() - start), len(dtb.path_node_map)
+
+########################################################################################################################
+# DRIVER
+########################################################################################################################
+
+if __name__ == "__main__":
+
+    arg_parser = argparse.ArgumentParser(description="Benchmark sequential DTB edits, incremental vs. full node index rebuild")
+    arg_parser.add_argument(
+            '--clusters',
+            type=int,
+            default=500,
+            help="Clusters (3 nodes each) added to the test DTB (Default == 500)")
+    arg_parser.add_argument(
+            '--edits',
+            type=int,
+            default=1000,
+            help="Sequential edits (Default == 1000)")
+    args = arg_parser.parse_args()
+
+    logging.disable(logging.INFO) # Per-edit logging would dominate
+
+    inc_time, node_cnt = time_edits(args.clusters, args.edits)
+    walk_time, _ = time_edits(args.clusters, args.edits, rebuild_name_path_map_walk)
+
+    print("\n{} sequential edits, {} nodes:".format(args.edits, node_cnt))
+    print("incremental index: {:.3f}s total, {:.1f} us/edit".format(inc_time, (1e6 * inc_time / args.edits)))
+    print("full rebuild (walk + get_node): {:.3f}s total, {:.1f} us/edit".format(walk_time, (1e6 * walk_time / args.edits)))
+    print("speedup: {:.1f}x".format(walk_time / inc_time))
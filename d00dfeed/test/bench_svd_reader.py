@@ -0,0 +1,119 @@
+#! /usr/bin/python3
+
+# External deps
+import os, sys, time, argparse, tracemalloc
+from pathlib import Path
+
+# Internal deps
+sys.path.append('../')
+import svd_common
+
+########################################################################################################################
+# HELPERS
+########################################################################################################################
+
+def timed_read(read_func, svd_file, trace_mem):
+
+    '''
+    (SvdDevice or exception name, seconds, peak traced bytes or None) for one read_func(svd_file) call
+    '''
+
+    if trace_mem:
+        tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = read_func(svd_file)
+    except Exception as e: # Compare failures too (cmsis_svd raises more than the TypeError/KeyError workers skip)
+        result = type(e).__name__
+    total_time = (time.perf_counter() - start)
+    peak_bytes = None
+    if trace_mem:
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return result, total_time, peak_bytes
+
+def diff_devices(ref, new):
+
+    '''
+    Human-readable differences between two read results (SvdDevice or exception name), empty if identical
+    '''
+
+    if isinstance(ref, str) or isinstance(new, str):
+        return [] if (ref == new) else ["result: {} vs. {}".format(
+            ref if isinstance(ref, str) else "parsed", new if isinstance(new, str) else "parsed")]
+
+    diffs = []
+    if len(ref.peripherals) != len(new.peripherals):
+        diffs.append("peripheral count: {} vs. {}".format(len(ref.peripherals), len(new.peripherals)))
+
+    for ref_p, new_p in zip(ref.peripherals, new.peripherals):
+        if ref_p == new_p:
+            continue
+        if ref_p.name != new_p.name:
+            diffs.append("peripheral name: {} vs. {}".format(ref_p.name, new_p.name))
+        if ref_p.interrupts != new_p.interrupts:
+            diffs.append("{} interrupts: {} vs. {}".format(ref_p.name, ref_p.interrupts, new_p.interrupts))
+        if len(ref_p.registers) != len(new_p.registers):
+            diffs.append("{} register count: {} vs. {}".format(ref_p.name, len(ref_p.registers), len(new_p.registers)))
+        for ref_r, new_r in zip(ref_p.registers, new_p.registers):
+            if ref_r != new_r:
+                diffs.append("{} register: {} vs. {}".format(ref_p.name, ref_r, new_r))
+                break # First per peripheral
+
+    return diffs
+
+########################################################################################################################
+# DRIVER
+########################################################################################################################
+
+if __name__ == "__main__":
+
+    arg_parser = argparse.ArgumentParser(description="Benchmark and diff the streaming SVD reader against cmsis_svd's SVDParser")
+    arg_parser.add_argument(
+            'svd_dir',
+            type=str,
+            nargs='?',
+            default=os.path.join("..", "cmsis-svd", "data"),
+            help="Directory searched for .svd files (Default == ../cmsis-svd/data)")
+    arg_parser.add_argument(
+            '--mem',
+            action='store_true',
+            help="Also report peak traced memory per reader (slower)")
+    arg_parser.add_argument(
+            '--max-diffs',
+            type=int,
+            default=5,
+            help="Differences printed per file (Default == 5)")
+    args = arg_parser.parse_args()
+
+    svd_files = sorted(Path(args.svd_dir).glob("**/*.svd"))
+    assert(len(svd_files) > 0)
+
+    ref_time, new_time = 0.0, 0.0
+    ref_peak, new_peak = 0, 0
+    diff_files = []
+    for svd_file in svd_files:
+        ref, ref_file_time, ref_file_peak = timed_read(svd_common.parse_svd_file, svd_file, args.mem)
+        new, new_file_time, new_file_peak = timed_read(svd_common.read_svd_file, svd_file, args.mem)
+        ref_time += ref_file_time
+        new_time += new_file_time
+        if args.mem:
+            ref_peak = max(ref_peak, ref_file_peak)
+            new_peak = max(new_peak, new_file_peak)
+
+        diffs = diff_devices(ref, new)
+        if diffs:
+            diff_files.append(svd_file)
+            print("DIFF {} ({} differences):".format(svd_file, len(diffs)))
+            for diff in diffs[:args.max_diffs]:
+                print("\t" + diff)
+
+    print("\n{} SVD files, {} with differences".format(len(svd_files), len(diff_files)))
+    print("SVDParser: {:.3f}s total, {:.1f} ms/file".format(ref_time, (1e3 * ref_time / len(svd_files))))
+    print("iterparse reader: {:.3f}s total, {:.1f} ms/file".format(new_time, (1e3 * new_time / len(svd_files))))
+    print("speedup: {:.1f}x".format(ref_time / new_time))
+    if args.mem:
+        print("peak traced memory (largest file): SVDParser {:.1f} MiB, iterparse reader {:.1f} MiB".format(
+            (ref_peak / (1 << 20)), (new_peak / (1 << 20))))
+    sys.exit(1 if diff_files else 0)
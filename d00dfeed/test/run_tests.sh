@@ -15,6 +15,9 @@ ANALYSES_DIR="../analyses"
 
 # Test files
 df="test_df"
+serializer="test_serializer"
+monte_carlo="test_monte_carlo"
+svd_analysis="test_svd_analysis"
 qemu="test_qemu"
 
 # Mypy config
@@ -59,4 +62,7 @@ done
 
 # Unit tests
 run_test $df
+run_test $serializer
+run_test $monte_carlo
+run_test $svd_analysis
 run_test $qemu
\ No newline at end of file
@@ -1,4 +1,4 @@
-import logging, os
+import logging, os, fdt
 
 # Test files
 dtb_dir = "dtbs"
@@ -25,3 +25,23 @@ def timing_wrapper(func, *args, **kwargs):
     def wrapped():
         return func(*args, **kwargs)
     return wrapped
+
+# Grow a DTB with duplicate node names: /clusters/cluster@N/cpu@{0,1}
+def add_clusters(dtb, cluster_cnt):
+    clusters = fdt.Node("clusters")
+    for i in range(cluster_cnt):
+        cluster = fdt.Node("cluster@{}".format(i))
+        for j in range(2):
+            cluster.append(fdt.Node("cpu@{}".format(j)))
+        clusters.append(cluster)
+    dtb.add_node(clusters)
+
+# Alternately replace and modify duplicate-named devices, by path
+def do_sequential_edits(dtb, edit_cnt):
+    for i in range(edit_cnt):
+        cpu_paths = dtb.name_paths_map["cpu@1"]
+        path = cpu_paths[i % len(cpu_paths)]
+        if (i % 2):
+            dtb.set_property(path, "status", "disabled")
+        else:
+            dtb.replace_dev(path, "cpu@1", {"reg": [i]})
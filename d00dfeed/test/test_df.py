@@ -1,11 +1,12 @@
 #! /usr/bin/python3
 
-import os, sys, unittest, logging, timeit, random, fdt
+import os, sys, unittest, logging, timeit, random, tempfile, json, fdt
 import test_common as tc
 
 sys.path.append('../')   # TODO: there's probably a pythonic way to relative import
 import df
 import df_common as dfc
+import df_analyze as dfa
 
 dtb_objs = dict()
 devs_used_by_tests =    [
@@ -114,8 +115,211 @@ class test_dtb(unittest.TestCase):
         self.assertEqual("arm", dfc.get_arch(dtb_objs[tc.to_dtb]))
         self.assertEqual("powerpc", dfc.get_arch(dtb_objs[tc.gc_dtb]))
 
+        # Signature votes, winner's share
+        arch, confidence = dfc.get_arch_and_confidence(dtb_objs[tc.to_dtb])
+        self.assertEqual("arm", arch)
+        self.assertTrue(0.0 < confidence <= 1.0)
+        self.assertEqual((None, 0.0), dfc.get_arch_from_cmp_strs(["not,a-real-device"]))
+
         logging.debug("TEST 4: DTB patching - arch ID OK!")
 
+    def test_arch_classifier(self):
+
+        '''
+        Can we ID architecture from strings shared between archs?
+        '''
+
+        # 2 arm DTBs (both w/ "arm,pl011", 1 w/ "ns16550a"), 2 mips DTBs (both w/ "ns16550a")
+        feature_cnts = {}
+        for arch_idx, cmp_strs in [(0, ["arm,pl011"]), (0, ["arm,pl011", "ns16550a"]), (1, ["ns16550a"]), (1, ["ns16550a"])]:
+            for feature in dfc.get_dtb_features(cmp_strs):
+                feature_cnts.setdefault(feature, [0, 0])[arch_idx] += 1
+
+        classifier = dfc.ArchClassifier(["arm", "mips"], [2, 2], feature_cnts)
+        self.assertEqual(["c:fsl,imx8mq-fec", "v:fsl", "t:imx8mq", "t:fec"], dfc.get_cmp_str_features("fsl,imx8mq-fec"))
+        self.assertEqual("mips", classifier.classify(["ns16550a"])[0])
+        self.assertEqual("arm", classifier.classify(["arm,pl011", "ns16550a"])[0])
+        self.assertEqual("arm", classifier.classify(["arm,unseen-device"])[0]) # Vendor prefix only
+        self.assertEqual((None, 0.0), classifier.classify(["unseen"]))
+
+        arch, confidence = classifier.classify(["ns16550a"])
+        self.assertTrue(0.5 < confidence < 1.0)
+
+        logging.debug("TEST 5: DTB arch classifier OK!")
+
+    def test_phys_mem_map(self):
+
+        '''
+        Can we translate device regs through bus ranges?
+        '''
+
+        test_dtb = df.Dtb(tc.to_dtb)
+        mem_map = test_dtb.get_phys_mem_map()
+        self.assertEqual(sorted(mem_map, key=lambda m: m.addr), mem_map)
+
+        # soc -> internal-regs -> serial, 2-cell MBus addresses on soc
+        self.assertIn((0xf1012000, 0x100, "serial@12000"), mem_map)
+        self.assertIn((0xfff00000, 0x200000, "bootrom"), mem_map)
+        self.assertEqual([(0xf1012000, 0x100)], test_dtb.get_dev_mem_maps(test_dtb.get_node_by_name("serial@12000")))
+
+        # Memoized bus translation is dropped on modification (move internal-regs to the bootrom's MBus window)
+        test_dtb.set_property("internal-regs", "ranges", [0x0, 0x011d0000, 0x0, 0x100000])
+        self.assertEqual([(0xfff12000, 0x100)], test_dtb.get_dev_mem_maps(test_dtb.get_node_by_name("serial@12000")))
+
+        logging.debug("TEST 6: DTB physical memory map OK!")
+
+    def test_mem_map_queries(self):
+
+        '''
+        Can we query a memory map for owners, overlaps and free gaps?
+        '''
+
+        test_dtb = df.Dtb(tc.to_dtb)
+        mem_map = test_dtb.get_memory_map()
+        self.assertEqual(len(test_dtb.get_phys_mem_map()), len(mem_map))
+
+        # Point and range queries
+        self.assertIn("serial@12000", [region.node_name for region in mem_map.find(0xf1012004)])
+        self.assertNotIn("serial@12000", [region.node_name for region in mem_map.find(0xf1012100)])
+        self.assertIn("serial@12100", [region.node_name for region in mem_map.find_range(0xf10120f0, 0x20)])
+
+        # Overlaps, the timer and watchdog share a register block
+        overlap_names = [(region_a.node_name, region_b.node_name) for region_a, region_b in mem_map.get_overlaps()]
+        self.assertIn(("timer@20300", "watchdog@20300"), overlap_names)
+
+        # Free gaps, place a virtio-mmio node in one
+        base_addr = mem_map.find_free(0x200)
+        self.assertEqual([], mem_map.find_range(base_addr, 0x200))
+        self.assertIn((0x40000000, 0xf1000000), mem_map.get_gaps())
+        test_dtb.add_virt_mmio_node(None, 0x200, [0, 16, 4], 1)
+        self.assertIn((base_addr, 0x200, "virt_mmio@{:08x}".format(base_addr)), test_dtb.get_phys_mem_map())
+
+        # JSON round trip
+        self.assertEqual(mem_map.regions, dfc.MemoryMap.from_json(mem_map.to_json()).regions)
+
+        logging.debug("TEST 7: DTB memory map queries OK!")
+
+    def test_mem_map_stats(self):
+
+        '''
+        Does a memory map survive the packed stats JSON entries (uint64 bounds, empty map)?
+        '''
+
+        u64_max = ((1 << 64) - 1)
+        self.assertEqual([0, 1, u64_max], dfc.unpack_u64s(dfc.pack_u64s([0, 1, u64_max])))
+        self.assertEqual([], dfc.unpack_u64s(dfc.pack_u64s([])))
+
+        mem_maps = [
+            dfc.Node_mem_map(0, u64_max, "all-but-last"),
+            dfc.Node_mem_map((u64_max - 0xfff), 0x1000, "top-page"),
+            dfc.Node_mem_map(u64_max, 1, "last-byte"),
+            dfc.Node_mem_map(u64_max, 2, "past-u64"), # Dropped, not representable
+        ]
+        for maps in [mem_maps, []]:
+            stats = json.loads(json.dumps(dfc.get_mem_map_stats(maps)))
+            mem_map = dfc.get_mem_map_from_stats(stats)
+            self.assertEqual([m for m in maps if (m.node_name != "past-u64")], mem_map.regions)
+
+        self.assertIsNone(dfc.get_mem_map_from_stats({}))
+
+        logging.debug("TEST 8: DTB memory map stats OK!")
+
+    def test_patch_spec(self):
+
+        '''
+        Can we apply a patch spec to a directory of DTBs, keeping the name map consistent?
+        '''
+
+        patch_spec = {
+            dfc.PATCH_DISABLE: ['spi@10600', 'not-in-this-dtb@0'],
+            dfc.PATCH_REPLACE_DEV: [{"dev": 'serial@12100', "new_dev": 'serial@99', "props": {"compatible": "ns16550a"}}],
+            dfc.PATCH_SET_PROPERTY: [{"dev": 'serial@12000', "prop": "status", "value": "disabled"}],
+            dfc.PATCH_ADD_VIRT_MMIO: [{"base_addr": None, "size": 0x200, "interrupts": [0, 16, 4], "interrupt_parent": 1}],
+        }
+
+        # Incrementally maintained name map matches a full rewalk
+        test_dtb = df.Dtb(tc.to_dtb)
+        self.assertEqual(4, test_dtb.apply_patch_spec(patch_spec))
+        name_path_map = dict(test_dtb.name_path_map)
+        test_dtb._update_name_path_map()
+        self.assertEqual(test_dtb.name_path_map, name_path_map)
+        self.assertNotIn('spi-nor@0', name_path_map) # Child of disabled device
+
+        # Batch, output files written by workers
+        with tempfile.TemporaryDirectory() as out_dir:
+            results = df.patch_dtb_files([tc.to_dtb, tc.gc_dtb], patch_spec, out_dir, max_workers=2)
+            self.assertEqual({tc.to_dtb: 4, tc.gc_dtb: 1}, results)
+            patched_dtb = df.Dtb(os.path.join(out_dir, os.path.basename(tc.to_dtb)))
+            self.assertIn('serial@99', patched_dtb.name_path_map)
+            self.assertNotIn('spi@10600', patched_dtb.name_path_map)
+            self.assertEqual(sorted(os.listdir(out_dir)), sorted(os.path.basename(f) for f in tc.dtb_test_files))
+
+        logging.debug("TEST 9: DTB batch patch spec OK!")
+
+    def test_name_index(self):
+
+        '''
+        Are duplicate node names indexed, and do incremental index updates match a full rebuild?
+        '''
+
+        test_dtb = df.Dtb(tc.to_dtb)
+        tc.add_clusters(test_dtb, 10)
+        cpu_paths = ["/clusters/cluster@{}/cpu@0".format(i) for i in range(10)]
+        self.assertEqual(sorted(cpu_paths + ["/cpus/cpu@0"]),
+            [test_dtb._get_node_path(node) for node in test_dtb.get_nodes_by_name("cpu@0")])
+
+        # Remove one duplicate by path, others stay
+        test_dtb.remove_dev(cpu_paths[3])
+        self.assertEqual(10, len(test_dtb.get_nodes_by_name("cpu@0")))
+        self.assertIsNone(test_dtb.get_node_by_name(cpu_paths[3]))
+
+        # Sequential edits, incremental index matches a full rebuild
+        edit_cnt = 1000
+        edit_time = timeit.timeit(tc.timing_wrapper(tc.do_sequential_edits, test_dtb, edit_cnt), number=1)
+        indexes = (dict(test_dtb.path_node_map), dict(test_dtb.name_paths_map), dict(test_dtb.name_path_map))
+        rebuild_time = timeit.timeit(tc.timing_wrapper(test_dtb._update_name_path_map), number=1)
+        self.assertEqual(indexes, (test_dtb.path_node_map, test_dtb.name_paths_map, test_dtb.name_path_map))
+        logging.debug("{} sequential edits: {:.3f}s, single full index rebuild: {:.3f}s".format(
+            edit_cnt, edit_time, rebuild_time))
+
+        logging.debug("TEST 10: DTB node name index OK!")
+
+    def test_c_sloc_cnt(self):
+
+        '''
+        Does the built-in C SLOC counter handle comment, literal and preprocessor edge cases (same counts as pygount)?
+        '''
+
+        src_and_sloc = [
+            # Line comment continued with a backslash
+            ("int a; // comment \\\nstill comment\nint b;\n", 2),
+            # Unterminated block comment, open until EOF
+            ("int a;\n/* open\nint b;\n", 1),
+            # Char literals, a lone quote is code
+            ("char c = '\"';\nchar d = '\\'';\nint e = x' + 1;\nint f;\n", 4),
+            # String with an escaped newline
+            ("const char *s = \"abc\\\ndef\";\nint x;\n", 2),
+            # Comment markers in a string
+            ("char *s = \"/* not a comment\";\nint a; /* c */\n// only comment\n", 2),
+            # Directive continued over lines, with a block comment
+            ("#define X(a) \\\n\t((a) + 1) /* c\n still */\nint y;\n", 3),
+            # Nested "#if 0", ends at the #else
+            ("#if 0\nint a;\n#if 1\nint b;\n#endif\nint c;\n#else\nint d;\n#endif\nint e;\n", 7),
+            # Generated file header
+            ("/*\n * This file is automatically generated, do not edit\n */\nint a;\nint b;\n", 0),
+            # Empty file
+            ("", 0),
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            src_path = os.path.join(tmp_dir, "test.c")
+            for src, sloc_cnt in src_and_sloc:
+                with open(src_path, "w") as f:
+                    f.write(src)
+                self.assertEqual(sloc_cnt, dfa.get_c_sloc_cnt(src_path), src)
+
+        logging.debug("TEST 11: C SLOC counter OK!")
+
 if __name__ == '__main__':
     tc.setup_logging("test_df")
     unittest.main()
@@ -0,0 +1,132 @@
+#! /usr/bin/python3
+
+import os, sys, unittest, logging, timeit, random, itertools, json, math, statistics, tempfile
+import test_common as tc
+
+sys.path.append('../')   # TODO: there's probably a pythonic way to relative import
+sys.path.append('../analyses')
+sys.path.append('../analyses/monte_carlo_sim')
+import df_common as dfc
+import monte_carlo_sim as mcs
+
+SIM_SOC_CNT = 20
+SIM_REHOST_CNT = 10
+SIM_ITER_CNT = 400
+SIM_MAX_STD_ERR = 4 # Tolerance, in standard errors of the simulated mean
+
+def get_rand_names(rand, cnt):
+    return ["".join(rand.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(10)) for _ in range(cnt)]
+
+def get_rand_socs(rand, soc_cnt, periphs, max_periph_cnt):
+    return [set(rand.sample(periphs, rand.randint(1, max_periph_cnt))) for _ in range(soc_cnt)]
+
+def get_soc_cnt_by_periph(socs):
+    soc_cnt_by_periph = {}
+    for soc in socs:
+        for periph in soc:
+            soc_cnt_by_periph[periph] = soc_cnt_by_periph.get(periph, 0) + 1
+    return soc_cnt_by_periph
+
+class test_monte_carlo(unittest.TestCase):
+
+    def test_exact_enumeration(self):
+
+        '''
+        Does the closed form match the mean over every rehost order? Do the std dev bounds hold?
+        '''
+
+        rand = random.Random(0)
+        for soc_cnt in range(1, 7):
+            socs = get_rand_socs(rand, soc_cnt, get_rand_names(rand, 8), 5)
+            unimp_exp, unimp_std, total_exp, total_std = mcs.get_exact_rehost_curve(
+                get_soc_cnt_by_periph(socs), soc_cnt, soc_cnt)
+
+            # Every order is equally likely
+            unimp_by_rehost = [[] for _ in range(soc_cnt)]
+            total_by_rehost = [[] for _ in range(soc_cnt)]
+            for order in itertools.permutations(socs):
+                implemented = set()
+                for k, soc in enumerate(order):
+                    unimp_by_rehost[k].append(len(soc - implemented))
+                    implemented |= soc
+                    total_by_rehost[k].append(len(implemented))
+
+            for k in range(soc_cnt):
+                self.assertAlmostEqual(statistics.mean(unimp_by_rehost[k]), unimp_exp[k])
+                self.assertAlmostEqual(statistics.mean(total_by_rehost[k]), total_exp[k])
+                self.assertLessEqual(statistics.pstdev(unimp_by_rehost[k]), unimp_std[k] + 1e-9)
+                self.assertLessEqual(statistics.pstdev(total_by_rehost[k]), total_std[k] + 1e-9)
+
+            # All SoCs rehosted: every peripheral implemented, no variance
+            self.assertAlmostEqual(len(get_soc_cnt_by_periph(socs)), total_exp[-1])
+            self.assertAlmostEqual(0.0, total_std[-1])
+
+        logging.debug("TEST 1: Exact curve matches enumeration OK!")
+
+    def test_exact_vs_simulation(self):
+
+        '''
+        Is the simulated mean (same stats JSONs) within sampling error of the closed form?
+        '''
+
+        rand = random.Random(1)
+        periphs = get_rand_names(rand, 30)
+        socs = get_rand_socs(rand, SIM_SOC_CNT, periphs, 8)
+        P_q = periphs[:5] # Some supported in QEMU, excluded from both
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            artifact_path_list = []
+            for i, soc in enumerate(socs):
+                artifact_path = os.path.join(tmp_dir, "soc_{}.json".format(i))
+                with open(artifact_path, "w") as f:
+                    json.dump({dfc.JSON_PRI_CMP_STR: sorted(soc)}, f)
+                artifact_path_list.append(artifact_path)
+
+            unsupported_by_artifact = [mcs.get_unsupported_peripherals(path, P_q) for path in artifact_path_list]
+            self.assertEqual([soc.difference(P_q) for soc in socs], unsupported_by_artifact)
+            unimp_exp, _, total_exp, _ = mcs.get_exact_rehost_curve(
+                get_soc_cnt_by_periph(unsupported_by_artifact), SIM_SOC_CNT, SIM_REHOST_CNT)
+
+            unimp_cnt_dict = {j: [] for j in range(SIM_REHOST_CNT)}
+            total_cnt_dict = {j: [] for j in range(SIM_REHOST_CNT)}
+            random.seed(0)
+            logging.disable(logging.INFO) # Per-rehost logging would dominate
+            try:
+                for _ in range(SIM_ITER_CNT):
+                    mcs.worker_run_simulation(SIM_REHOST_CNT, P_q, {'Empty': 0.0}, artifact_path_list,
+                        [], [], [], [], unimp_cnt_dict, total_cnt_dict)
+            finally:
+                logging.disable(logging.NOTSET)
+
+        for j in range(SIM_REHOST_CNT):
+            for exp, sim in [(unimp_exp[j], unimp_cnt_dict[j]), (total_exp[j], total_cnt_dict[j])]:
+                self.assertEqual(SIM_ITER_CNT, len(sim))
+                std_err = statistics.stdev(sim) / math.sqrt(len(sim))
+                self.assertLessEqual(abs(statistics.mean(sim) - exp), (SIM_MAX_STD_ERR * std_err) + 1e-9)
+
+        logging.debug("Final rehost: exact {:.3f} unimplemented, {:.3f} total; simulated {:.3f}, {:.3f}".format(
+            unimp_exp[-1], total_exp[-1],
+            statistics.mean(unimp_cnt_dict[SIM_REHOST_CNT - 1]), statistics.mean(total_cnt_dict[SIM_REHOST_CNT - 1])))
+        logging.debug("TEST 2: Exact curve matches simulation OK!")
+
+    def test_exact_time(self):
+
+        '''
+        Is the closed form fast at corpus scale (sub-second)?
+        '''
+
+        rand = random.Random(2)
+        soc_cnt = 2000
+        soc_cnt_by_periph = {"periph_{}".format(i): rand.randint(1, 200) for i in range(20000)}
+
+        exact_time = timeit.timeit(
+            tc.timing_wrapper(mcs.get_exact_rehost_curve, soc_cnt_by_periph, soc_cnt, 100), number=1)
+        logging.debug("Exact curve, {} peripherals, {} SoCs, 100 rehosts: {:.3f}s".format(
+            len(soc_cnt_by_periph), soc_cnt, exact_time))
+        self.assertLess(exact_time, 1.0)
+
+        logging.debug("TEST 3: Exact curve timing OK!")
+
+if __name__ == '__main__':
+    tc.setup_logging("test_monte_carlo")
+    unittest.main()
@@ -0,0 +1,234 @@
+#! /usr/bin/python3
+
+import os, sys, unittest, logging, timeit, random, tempfile, fdt
+import test_common as tc
+
+sys.path.append('../')   # TODO: there's probably a pythonic way to relative import
+import df
+import df_common as dfc
+
+EDIT_SEQ_LEN = 50
+EDIT_SEQ_SEEDS = range(10)
+
+class test_serializer(unittest.TestCase):
+
+    def assertSameAsToDtb(self, test_dtb):
+
+        '''
+        Incremental serializer output is byte-for-byte fdt's to_dtb() output
+        '''
+
+        self.assertEqual(test_dtb.dtb_obj.to_dtb(), test_dtb.to_dtb())
+
+    def do_random_edit(self, test_dtb, rand, variant=None):
+
+        '''
+        One random modification through the Dtb API, repeated on variant (DtbVariant of an equivalent Dtb) if given
+        '''
+
+        paths = sorted(test_dtb.path_node_map)
+        path = rand.choice(paths)
+        prop_names = sorted({prop.name for node in test_dtb.path_node_map.values() for prop in node.props})
+        op = rand.randrange(4)
+        targets = [test_dtb] + ([variant] if variant else [])
+
+        if (op == 0):
+            prop_name = rand.choice(prop_names + ["new-prop-{}".format(rand.randrange(5))])
+            prop_val = rand.choice(["okay", rand.randrange(1 << 32), [rand.randrange(1 << 32) for _ in range(3)]])
+            for target in targets:
+                target.set_property(path, prop_name, prop_val)
+        elif (op == 1) and (path != "/"):
+            for target in targets:
+                target.remove_dev(path)
+        elif (op == 2):
+            node_name = "new-node@{:x}".format(rand.randrange(1 << 16))
+            prop_name = rand.choice(prop_names)
+            if (node_name not in [subnode.name for subnode in test_dtb.path_node_map[path].nodes]):
+                for target in targets:
+                    node = fdt.Node(node_name)
+                    node.append(fdt.PropStrings(prop_name, "new"))
+                    node.append(fdt.Node("new-subnode"))
+                    target.add_node(node, path)
+        elif (path != "/"):
+            prop_name = rand.choice(prop_names)
+            for target in targets:
+                target.replace_dev(path, path.rsplit("/", 1)[1], {prop_name: "replaced"})
+
+    def test_unmodified(self):
+
+        '''
+        Is an unmodified DTB serialized to the original bytes, without falling back to to_dtb()?
+        '''
+
+        for input_file in tc.dtb_test_files:
+            test_dtb = df.Dtb(input_file)
+            with open(input_file, "rb") as f:
+                orig_dtb_data = f.read()
+
+            self.assertEqual(orig_dtb_data, test_dtb.to_dtb())
+            self.assertTrue(test_dtb._struct_idx)
+            self.assertSameAsToDtb(test_dtb)
+
+        logging.debug("TEST 1: Unmodified DTB serialization OK!")
+
+    def test_single_edits(self):
+
+        '''
+        Is each kind of modification serialized the same as to_dtb()?
+        '''
+
+        edits = [
+            lambda d: d.set_property("serial@12000", "status", "disabled"),
+            lambda d: d.set_property("/", "model", "Patched"),
+            lambda d: d.set_property("internal-regs", "new-prop", [1, 2, 3]),
+            lambda d: d.remove_dev("spi@10600"), # First user of some property names, string table shifts
+            lambda d: d.remove_dev("soc"),
+            lambda d: d.replace_dev("i2c@11000", "i2c@11000", {"compatible": "vendor,new-i2c"}),
+            lambda d: d.replace_dev("flash@d0000", "fakeDev@somewhere", {"reg": [0, 1], "foo": "hello"}),
+            lambda d: d.add_virt_mmio_node(None, 0x200, [0, 16, 4], 1),
+            lambda d: tc.add_clusters(d, 4),
+        ]
+
+        for edit in edits:
+            test_dtb = df.Dtb(tc.to_dtb)
+            edit(test_dtb)
+            self.assertSameAsToDtb(test_dtb)
+
+            # Repeat serialization, after another edit
+            test_dtb.set_property("/", "compatible", "vendor,patched")
+            self.assertSameAsToDtb(test_dtb)
+
+        logging.debug("TEST 2: Single edit serialization OK!")
+
+    def test_random_edit_seqs(self):
+
+        '''
+        Is a DTB serialized the same as to_dtb() after every edit in random sequences?
+        '''
+
+        for input_file in tc.dtb_test_files:
+            for seed in EDIT_SEQ_SEEDS:
+                rand = random.Random(seed)
+                test_dtb = df.Dtb(input_file)
+                for _ in range(EDIT_SEQ_LEN):
+                    self.do_random_edit(test_dtb, rand)
+                    self.assertSameAsToDtb(test_dtb)
+
+        logging.debug("TEST 3: Random edit sequence serialization OK!")
+
+    def test_fallback(self):
+
+        '''
+        Are blobs that to_dtb() wouldn't reproduce (ex. non-zero padding) serialized through to_dtb()?
+        '''
+
+        with open(tc.to_dtb, "rb") as f:
+            dtb_data = bytearray(f.read())
+        name_pos = (dtb_data.index(b"\0\0\0\x01serial@12000\0") + 4) # FDT_BEGIN_NODE
+        dtb_data[name_pos + 13] = 0xff # Padding after the node name, parser ignores it
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            padded_dtb_path = os.path.join(tmp_dir, "padded.dtb")
+            with open(padded_dtb_path, "wb") as f:
+                f.write(dtb_data)
+
+            test_dtb = df.Dtb(padded_dtb_path)
+            test_dtb.set_property("serial@12100", "status", "disabled")
+            self.assertSameAsToDtb(test_dtb)
+            self.assertFalse(test_dtb._struct_idx)
+
+        logging.debug("TEST 4: Serializer fallback OK!")
+
+    def test_write_dtb(self):
+
+        '''
+        Does write_dtb() (chunks, writev) produce the serialized bytes? Log serialization time vs. to_dtb()
+        '''
+
+        test_dtb = df.Dtb(tc.to_dtb)
+        test_dtb.set_property("serial@12000", "status", "disabled")
+        test_dtb.remove_dev("spi@10600")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            out_path = os.path.join(tmp_dir, "patched.dtb")
+            test_dtb.write_dtb(out_path)
+            with open(out_path, "rb") as f:
+                self.assertEqual(test_dtb.dtb_obj.to_dtb(), f.read())
+
+            # More chunks than a single writev() takes
+            chunks = [bytes([i % 256]) * (i % 7) for i in range(5000)]
+            dfc.write_file_atomic(out_path, chunks)
+            with open(out_path, "rb") as f:
+                self.assertEqual(b"".join(chunks), f.read())
+
+            # Same permissions as open(): umask for a new file, kept for an existing one
+            umask = os.umask(0o022)
+            try:
+                new_path = os.path.join(tmp_dir, "new.dtb")
+                test_dtb.write_dtb(new_path)
+                self.assertEqual(0o644, (os.stat(new_path).st_mode & 0o777))
+                os.chmod(new_path, 0o640)
+                test_dtb.write_dts(new_path)
+                self.assertEqual(0o640, (os.stat(new_path).st_mode & 0o777))
+            finally:
+                os.umask(umask)
+
+        incremental_time = timeit.timeit(tc.timing_wrapper(test_dtb.get_dtb_chunks), number=tc.TIMING_ITER)
+        to_dtb_time = timeit.timeit(tc.timing_wrapper(test_dtb.dtb_obj.to_dtb), number=tc.TIMING_ITER)
+        logging.debug("Serialize x{}: incremental {:.3f}s, to_dtb() {:.3f}s".format(
+            tc.TIMING_ITER, incremental_time, to_dtb_time))
+
+        logging.debug("TEST 5: Serializer file output OK!")
+
+    def test_variants(self):
+
+        '''
+        Is a DtbVariant serialized the same as the same edits on a fresh Dtb? Is the shared base left unmodified?
+        '''
+
+        base_dtb = df.Dtb(tc.to_dtb)
+        with open(tc.to_dtb, "rb") as f:
+            orig_dtb_data = f.read()
+
+        # Every single device removal
+        for path in sorted(base_dtb.path_node_map):
+            if (path == "/"):
+                continue
+            variant = df.DtbVariant(base_dtb)
+            variant.remove_dev(path)
+            test_dtb = df.Dtb(tc.to_dtb)
+            test_dtb.remove_dev(path)
+            self.assertEqual(test_dtb.dtb_obj.to_dtb(), variant.to_dtb())
+
+        # Node added under a base node, then the base node removed (or replaced) and re-added
+        for remove_parent in ["remove_dev", "replace_dev"]:
+            variant = df.DtbVariant(base_dtb)
+            test_dtb = df.Dtb(tc.to_dtb)
+            for target in [test_dtb, variant]:
+                target.add_node(fdt.Node("added@1"), "/soc/internal-regs")
+                if (remove_parent == "remove_dev"):
+                    target.remove_dev("/soc/internal-regs")
+                    self.assertIsNone(target.get_node_by_name("added@1"))
+                    target.add_node(fdt.Node("internal-regs"), "/soc")
+                else:
+                    target.replace_dev("/soc/internal-regs", "internal-regs", {"status": "okay"})
+                    self.assertIsNone(target.get_node_by_name("added@1"))
+                target.add_node(fdt.Node("added@1"), "/soc/internal-regs")
+                target.set_property("added@1", "status", "disabled")
+            self.assertEqual(test_dtb.dtb_obj.to_dtb(), variant.to_dtb())
+
+        # Random edit sequences, replayed on a fresh Dtb
+        for seed in EDIT_SEQ_SEEDS:
+            variant = df.DtbVariant(base_dtb)
+            test_dtb = df.Dtb(tc.to_dtb)
+            rand = random.Random(seed)
+            for _ in range(EDIT_SEQ_LEN):
+                self.do_random_edit(test_dtb, rand, variant)
+                self.assertEqual(test_dtb.dtb_obj.to_dtb(), variant.to_dtb())
+
+        self.assertEqual(orig_dtb_data, base_dtb.to_dtb())
+        logging.debug("TEST 6: Variant serialization OK!")
+
+if __name__ == '__main__':
+    tc.setup_logging("test_serializer")
+    unittest.main()
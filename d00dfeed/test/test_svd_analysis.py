@@ -0,0 +1,286 @@
+#! /usr/bin/python3
+
+import os, sys, unittest, logging, random, math, statistics, tempfile, io, contextlib
+import numpy as np
+from pathlib import Path
+from unittest import mock
+import test_common as tc
+
+sys.path.append('../')   # TODO: there's probably a pythonic way to relative import
+import svd_analysis as svda
+import svd_common
+
+MONTE_REPS = 2000
+MONTE_MAX_STD_ERR = 4 # Tolerance, in standard errors of the difference of means
+
+def get_rand_incidence(rand, soc_cnt, periph_cnt, vendors):
+
+    '''
+    Synthetic load_incidence() result: (SoC vendor names, edge SoCs, edge peripheral IDs), with sparse peripheral IDs,
+    one SoC without peripherals and one peripheral shared by every SoC
+    '''
+
+    periph_ids = rand.sample(range(1000), periph_cnt)
+    soc_periphs = [sorted(rand.sample(periph_ids[1:], rand.randint(1, 8)) + [periph_ids[0]]) for _ in range(soc_cnt)]
+    soc_periphs[rand.randrange(soc_cnt)] = []
+    edges = [(soc, periph) for soc, periphs in enumerate(soc_periphs) for periph in periphs]
+    rand.shuffle(edges) # Unordered, as from the DB
+
+    soc_vendors = np.array([rand.choice(vendors) for _ in range(soc_cnt)], dtype=object)
+    return soc_vendors, np.array([e[0] for e in edges], dtype=np.int64), np.array([e[1] for e in edges], dtype=np.int64)
+
+def get_soc_periphs(incidence, soc_mask):
+
+    '''
+    Peripherals of each SoC in soc_mask, numbered as select_incidence() does
+    '''
+
+    _, edge_socs, edge_periphs = incidence
+    soc_periphs = [[] for _ in range(int(soc_mask.sum()))]
+    soc_map = np.cumsum(soc_mask) - 1
+    for soc, periph in zip(edge_socs, edge_periphs):
+        if soc_mask[soc]:
+            soc_periphs[soc_map[soc]].append(int(periph))
+    return soc_periphs
+
+def count_unmodeled_loop(soc_periphs, order):
+
+    '''
+    Previous per-round loop (monte()/monte_all() over the DB): peripherals each SoC in order had to model
+    '''
+
+    modeled = {}
+    counts = []
+    for round_idx, soc in enumerate(order):
+        unmod_round_ctr = 0
+        for periph in soc_periphs[soc]:
+            if periph not in modeled:
+                modeled[periph] = round_idx
+                unmod_round_ctr += 1
+        counts.append(unmod_round_ctr)
+    return counts
+
+def write_monte_csv_loop(file_name, sims):
+
+    '''
+    Previous CSV output, from per-round lists of counts
+    '''
+
+    with open(file_name, "w") as f:
+        f.write("idx, mean, stdev\n")
+        for k, v in enumerate(sims):
+            f.write(f"{k}, {round(statistics.mean(v))}, {round(statistics.stdev(v))}\n")
+
+def write_svd_file(svd_path, peripherals, parsable=True):
+
+    '''
+    Minimal SVD file: peripherals is [(name, [(register name, offset)], [interrupt values])].
+    Without addressUnitBits (parsable=False) it's one cmsis-svd can't parse
+    '''
+
+    xml = ["<device><name>{}</name>".format(svd_path.stem)]
+    if parsable:
+        xml.append("<addressUnitBits>8</addressUnitBits>")
+    xml.append("<width>32</width><size>32</size><peripherals>")
+    for name, regs, interrupts in peripherals:
+        xml.append("<peripheral><name>{}</name>".format(name))
+        xml.extend("<interrupt><name>IRQ{0}</name><value>{0}</value></interrupt>".format(val) for val in interrupts)
+        xml.append("<registers>")
+        xml.extend("<register><name>{}</name><addressOffset>{:#x}</addressOffset></register>".format(reg, offset)
+                   for reg, offset in regs)
+        xml.append("</registers></peripheral>")
+    xml.append("</peripherals></device>")
+
+    svd_path.parent.mkdir(parents=True, exist_ok=True)
+    svd_path.write_text("".join(xml))
+
+def get_db_snapshot():
+
+    '''
+    svd.db contents without row IDs: every peripheral (names, size, interrupts, registers) with its SoC relations
+    '''
+
+    snapshot = []
+    for p in svda.Peripheral.select():
+        regs = sorted((reg.addr, reg.size, tuple(sorted(x.name for x in reg.names))) for reg in p.registers)
+        socs = sorted((rel.soc.vendor.name, rel.soc.name, rel.occurances) for rel in p.SoCs)
+        snapshot.append((tuple(sorted(x.name for x in p.names)), p.size, tuple(sorted(x.value for x in p.interrupts)),
+                         tuple(regs), tuple(socs)))
+    return sorted(snapshot), sorted((soc.vendor.name, soc.name) for soc in svda.SoC.select())
+
+class test_svd_analysis(unittest.TestCase):
+
+    def analyze(self, svd_files, db_path, cache_dir):
+
+        '''
+        analyze_files() on db_path, returns the files it parsed (or read from cache_dir)
+        '''
+
+        loaded = []
+        orig_load_svd_files = svd_common.load_svd_files
+        def load_svd_files(svd_files, max_workers=None, file_hashes=None):
+            loaded.extend(svd_files)
+            return orig_load_svd_files(svd_files, max_workers, file_hashes, cache_dir=cache_dir)
+
+        svda.db.init(db_path)
+        svda.db.create_tables(svda.ANALYSIS_MODELS)
+        with mock.patch.object(svd_common, "load_svd_files", load_svd_files), contextlib.redirect_stdout(io.StringIO()):
+            svda.analyze_files(sorted(svd_files), max_workers=1)
+        return loaded
+
+    def test_monte_fixed_orders(self):
+
+        '''
+        Does the vectorized kernel count the same per round as the previous loop, for the same rehost orders?
+        Are the CSVs the same?
+        '''
+
+        rand = random.Random(0)
+        incidence = get_rand_incidence(rand, 30, 40, ["VendorA", "VendorB"])
+
+        for soc_mask in [(incidence[0] == "VendorA"), np.ones(len(incidence[0]), dtype=bool)]:
+            soc_incidence = svda.select_incidence(incidence, soc_mask)
+            soc_periphs = get_soc_periphs(incidence, soc_mask)
+            soc_cnt = soc_incidence[0]
+
+            for rounds in [soc_cnt, (soc_cnt // 2), 1]:
+                orders = [rand.sample(range(soc_cnt), soc_cnt) for _ in range(50)]
+                counts = svda.count_unmodeled(soc_incidence, np.array(orders, dtype=np.int64), rounds)
+                loop_counts = [count_unmodeled_loop(soc_periphs, order[:rounds]) for order in orders]
+                self.assertEqual(loop_counts, counts.tolist())
+
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    csv_path = os.path.join(tmp_dir, "vectorized.csv")
+                    loop_csv_path = os.path.join(tmp_dir, "loop.csv")
+                    svda.write_monte_csv(csv_path, counts)
+                    write_monte_csv_loop(loop_csv_path, [list(x) for x in zip(*loop_counts)])
+                    with open(csv_path) as f, open(loop_csv_path) as loop_f:
+                        self.assertEqual(loop_f.read(), f.read())
+
+        logging.debug("TEST 1: Monte Carlo kernel matches per-round loop OK!")
+
+    def test_monte_seeded_means(self):
+
+        '''
+        Are seeded simulation means within sampling error of the previous loop's, with random orders?
+        '''
+
+        rand = random.Random(1)
+        incidence = get_rand_incidence(rand, 25, 30, ["VendorA"])
+        soc_mask = np.ones(len(incidence[0]), dtype=bool)
+        soc_incidence = svda.select_incidence(incidence, soc_mask)
+        soc_periphs = get_soc_periphs(incidence, soc_mask)
+        n = 12
+
+        counts = svda.simulate_unmodeled(soc_incidence, MONTE_REPS, n, seed=0)
+        self.assertEqual((MONTE_REPS, n), counts.shape)
+        self.assertTrue(np.array_equal(counts, svda.simulate_unmodeled(soc_incidence, MONTE_REPS, n, seed=0)))
+
+        loop_counts = np.array([count_unmodeled_loop(soc_periphs, rand.sample(range(len(soc_periphs)), n))
+                                for _ in range(MONTE_REPS)])
+        for k in range(n):
+            std_err = math.sqrt((counts[:, k].var(ddof=1) + loop_counts[:, k].var(ddof=1)) / MONTE_REPS)
+            self.assertLessEqual(abs(counts[:, k].mean() - loop_counts[:, k].mean()),
+                                 (MONTE_MAX_STD_ERR * std_err) + 1e-9)
+
+        logging.debug("TEST 2: Monte Carlo seeded means OK!")
+
+    def test_monte_degenerate(self):
+
+        '''
+        Do a vendor with one SoC and a single rep produce CSVs (stdev 0) instead of failing?
+        '''
+
+        rand = random.Random(2)
+        incidence = get_rand_incidence(rand, 12, 20, ["VendorA", "VendorB"])
+        soc_vendors = incidence[0].copy()
+        soc_vendors[0] = "Lone"
+        incidence = (soc_vendors, incidence[1], incidence[2])
+
+        orig_dir = os.getcwd()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            os.chdir(tmp_dir)
+            try:
+                svda.monte("Lone", reps=5, incidence=incidence) # Half of one SoC: no rounds
+                svda.monte("Lone", reps=1, n=1, incidence=incidence)
+                svda.monte("VendorA", reps=1, seed=0, incidence=incidence)
+                svda.monte_all(reps=1, seed=0, incidence=incidence)
+                svda.monte_vendors(reps=1, min_socs=1, seed=0, max_workers=1, incidence=incidence)
+
+                for vendor in ["Lone", "VendorA", "VendorB", "all"]:
+                    with open("svd_unimp_per_rehost_{}.csv".format(vendor)) as f:
+                        lines = f.read().splitlines()
+                    self.assertEqual("idx, mean, stdev", lines[0])
+                    self.assertTrue(all(line.endswith(", 0") for line in lines[1:]))
+                with open("svd_unimp_per_rehost_summary.csv") as f:
+                    self.assertEqual(4, len(f.read().splitlines())) # Header and 3 vendors
+            finally:
+                os.chdir(orig_dir)
+
+        logging.debug("TEST 3: Monte Carlo degenerate inputs OK!")
+
+    def test_analyze_manifest(self):
+
+        '''
+        Does re-running analyze_files() skip unchanged, duplicate SoC name and unparsable files, and leave the same DB
+        as a fresh run after a file changes or the analyzer version does?
+        '''
+
+        uart = ("UART0", [("DR", 0), ("SR", 4)], [5])
+        timer = ("TIM1", [("CNT", 0), ("ARR", 4), ("PSC", 8)], [9])
+        gpio = ("GPIOA", [("IDR", 0), ("ODR", 4)], [])
+        adc = ("ADC1", [("DATA", 0), ("CTRL", 8)], [12])
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            data_dir = Path(tmp_dir) / "data"
+            cache_dir = os.path.join(tmp_dir, "svd_cache")
+            db_path = os.path.join(tmp_dir, "svd.db")
+            soc_a, soc_b, dup_b, bad = (data_dir / "VendorA" / "SOCA.svd", data_dir / "VendorA" / "SOCB.svd",
+                                        data_dir / "VendorA" / "SOCB_SVD.svd", data_dir / "VendorB" / "BAD.svd")
+            svd_files = [soc_a, soc_b, dup_b, bad]
+
+            write_svd_file(soc_a, [uart, timer])
+            write_svd_file(soc_b, [uart, gpio])
+            write_svd_file(dup_b, [adc])
+            write_svd_file(bad, [uart], parsable=False)
+
+            try:
+                self.assertEqual(sorted(svd_files), self.analyze(svd_files, db_path, cache_dir))
+                self.assertEqual([("VendorA", "SOCA"), ("VendorA", "SOCB")], get_db_snapshot()[1])
+                for svd_path in [dup_b, bad]: # Recorded without a SoC
+                    svd_file = svda.SvdFile.get(svda.SvdFile.path == svda.get_svd_file_key(svd_path))
+                    self.assertIsNone(svd_file.soc)
+
+                # Unchanged, touched only, duplicate SoC name and unparsable files aren't parsed again
+                self.assertEqual([], self.analyze(svd_files, db_path, cache_dir))
+                os.utime(soc_a, ns=(soc_a.stat().st_atime_ns, (soc_a.stat().st_mtime_ns + 10**9)))
+                self.assertEqual([], self.analyze(svd_files, db_path, cache_dir))
+
+                # Changed file: previous SoC retracted (TIM1... peripherals only it had deleted), then re-analyzed
+                write_svd_file(soc_b, [uart, adc])
+                os.utime(soc_b, ns=(soc_b.stat().st_atime_ns, (soc_b.stat().st_mtime_ns + 10**9)))
+                self.assertEqual([soc_b], self.analyze(svd_files, db_path, cache_dir))
+                snapshot = get_db_snapshot()
+                svda.db.close()
+
+                fresh_db_path = os.path.join(tmp_dir, "fresh.db")
+                self.assertEqual(sorted(svd_files), self.analyze(svd_files, fresh_db_path, cache_dir))
+                self.assertEqual(snapshot, get_db_snapshot())
+                self.assertNotIn("GPIOA", str(snapshot))
+                svda.db.close()
+
+                # Another analyzer version: the DB is rebuilt and every file re-analyzed
+                svda.db.init(db_path)
+                svda.SvdFile.update(analyzer_version=(svda.ANALYZER_VERSION - 1)).execute()
+                self.assertEqual(sorted(svd_files), self.analyze(svd_files, db_path, cache_dir))
+                self.assertEqual(snapshot, get_db_snapshot())
+                self.assertEqual({svda.ANALYZER_VERSION}, {x.analyzer_version for x in svda.SvdFile.select()})
+            finally:
+                svda.db.close()
+                svda.db.init("svd.db")
+
+        logging.debug("TEST 4: SVD file manifest OK!")
+
+if __name__ == '__main__':
+    tc.setup_logging("test_svd_analysis")
+    unittest.main()